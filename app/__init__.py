@@ -12,11 +12,22 @@ from .logging_config import setup_logging
 from .security import add_security_headers, register_security_filters
 # Import activity tracking
 from .activity_tracker import track_page_view
+# Import SQL profiling
+from .query_profiler import init_query_profiler
+# Import Prometheus metrics
+from .metrics import init_metrics
+# Import batched mission/achievement progress
+from .services.progress_events import init_progress_events
 
 # Import utils if needed elsewhere, otherwise remove if only for leveling
 # from . import utils
 
 def create_app(config_class=Config):
+    if isinstance(config_class, str):
+        # Named configuration, e.g. flask --app "app:create_app('bootstrap')"
+        from config import config
+        config_class = config[config_class]
+
     app = Flask(__name__)
     app.config.from_object(config_class)
 
@@ -34,6 +45,15 @@ def create_app(config_class=Config):
     cache.init_app(app)
     csrf.init_app(app)
 
+    # Request latency, pool, cache and limiter metrics at /metrics
+    init_metrics(app)
+
+    # Per-request query counting / N+1 detection (registered first so it sees every query)
+    init_query_profiler(app)
+
+    # Mission and achievement progress, applied in one batch at the end of each request
+    init_progress_events(app)
+
     # Register blueprints here
     from app.auth import bp as auth_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
@@ -69,6 +89,9 @@ def create_app(config_class=Config):
     from app.routes.marketplace_routes import marketplace_bp
     app.register_blueprint(marketplace_bp)
 
+    from app.routes.chain_tx_routes import chain_tx_bp
+    app.register_blueprint(chain_tx_bp)
+
     from app.support import bp as support_bp
     app.register_blueprint(support_bp)
 
@@ -86,8 +109,10 @@ def create_app(config_class=Config):
         app.logger.info("API endpoints disabled (set API_ENABLED=true to enable)")
 
     # Initialize scheduler for automated election management
-    from app.scheduler import init_scheduler
-    init_scheduler(app)
+    # (under a preloading Gunicorn master each worker starts its own after the fork)
+    if app.config.get('SCHEDULER_ENABLED', True) and not app.config.get('PRELOAD_APP'):
+        from app.scheduler import init_scheduler
+        init_scheduler(app)
 
     # Register CLI commands
     from app.cli import register_cli_commands
@@ -246,5 +271,10 @@ def create_app(config_class=Config):
     def set_security_headers(response):
         return add_security_headers(response)
 
+    # Load shared state once before Gunicorn forks the workers
+    if app.config.get('PRELOAD_APP'):
+        from app.lifecycle import prepare_preloaded_master
+        prepare_preloaded_master(app)
+
     return app
 
@@ -7,6 +7,7 @@ to ensure only admins can access these routes. Consider using Flask-Login
 with an admin role check decorator.
 """
 
+import re
 from flask import render_template, redirect, url_for, flash, request, abort, current_app
 from flask_login import login_required, current_user
 from sqlalchemy import func, desc
@@ -18,6 +19,7 @@ from app.models import User, Country, Region, Resource, RegionalResource, Activi
 from app.cache_utils import (invalidate_country_cache, invalidate_resource_cache,
                              invalidate_all_caches, get_cache_stats, warm_cache)
 from app.activity_tracker import get_user_stats, get_online_users
+from app.services.reference_data import reference_data
 
 
 # --- Helper decorator for admin-only access ---
@@ -43,6 +45,30 @@ def admin_required(f):
     return decorated_function
 
 
+# --- Player search ---
+# Wallet fragments: 0x-prefixed, or long enough to be unlikely as a username
+_WALLET_FRAGMENT = re.compile(r'^(0x[0-9a-f]*|[0-9a-f]{8,})$')
+# IPv4 / IPv6 fragments: hex digits with at least one dot or colon
+_IP_FRAGMENT = re.compile(r'^[0-9a-f.:]*[.:][0-9a-f.:]*$')
+
+
+def _player_search_filter(search, ip_columns):
+    """
+    WHERE clause for the admin player searches, chosen by the input's shape.
+
+    Wallet and IP fragments match anywhere in those columns; anything else is
+    a username prefix, which can use the username_lower index (an OR with the
+    unindexed columns could not).
+    """
+    term = search.strip().lower()
+    if _WALLET_FRAGMENT.match(term):
+        return func.lower(User.wallet_address).contains(term, autoescape=True)
+    if _IP_FRAGMENT.match(term):
+        clauses = [func.lower(column).contains(term, autoescape=True) for column in ip_columns]
+        return clauses[0] if len(clauses) == 1 else db.or_(*clauses)
+    return User.username_lower.startswith(term, autoescape=True)
+
+
 # --- Dashboard Route ---
 @bp.route('/')
 @login_required
@@ -287,6 +313,8 @@ def restore_region(region_id):
     try:
         region.restore()
         db.session.commit()
+        from app.services.world_graph import world_graph
+        world_graph.bump_version()
         current_app.logger.info(f"Region {region.id} ({region.name}) restored by admin {current_user.id}")
         flash(f'Region {region.name} has been restored successfully.', 'success')
     except Exception as e:
@@ -386,6 +414,35 @@ def warm_cache_route():
     return redirect(url_for('admin.cache_management'))
 
 
+# --- SQL Profiling ---
+@bp.route('/sql-profile')
+@login_required
+@admin_required
+def sql_profile():
+    """Per-endpoint query counts and recent N+1 suspects for this worker process."""
+    from app.query_profiler import profile_report
+
+    return render_template('admin/sql_profile.html',
+                         title='SQL Profile',
+                         enabled=current_app.config.get('SQL_PROFILER_ENABLED', False),
+                         endpoints=profile_report.endpoints(),
+                         suspects=profile_report.recent_suspects(),
+                         since=profile_report.since,
+                         budgets=current_app.config.get('SQL_QUERY_BUDGETS', {}))
+
+
+@bp.route('/sql-profile/reset', methods=['POST'])
+@login_required
+@admin_required
+def reset_sql_profile():
+    """Clear the collected SQL profile."""
+    from app.query_profiler import profile_report
+
+    profile_report.reset()
+    flash('SQL profile has been reset.', 'success')
+    return redirect(url_for('admin.sql_profile'))
+
+
 # --- Activity Tracking ---
 @bp.route('/activity')
 @login_required
@@ -502,15 +559,9 @@ def players():
     # Build query
     query = db.select(User).filter_by(is_deleted=False)
 
-    # Apply search filter (username, wallet, or IP address)
+    # Apply search filter: wallet or IP fragment, otherwise username prefix
     if search:
-        search_term = f'%{search}%'
-        query = query.where(
-            (User.username.ilike(search_term)) |
-            (User.wallet_address.ilike(search_term)) |
-            (User.last_ip.ilike(search_term)) |
-            (User.registration_ip.ilike(search_term))
-        )
+        query = query.where(_player_search_filter(search, [User.last_ip, User.registration_ip]))
 
     # Apply additional filters
     if filter_type == 'admin':
@@ -1842,12 +1893,7 @@ def wealth_investigation():
         query = db.select(User).filter_by(is_deleted=False)
 
         if search:
-            search_term = f'%{search}%'
-            query = query.where(
-                (User.username.ilike(search_term)) |
-                (User.wallet_address.ilike(search_term)) |
-                (User.last_ip.ilike(search_term))
-            )
+            query = query.where(_player_search_filter(search, [User.last_ip]))
 
         # Sort by selected field
         if sort_by == 'gold':
@@ -2091,32 +2137,31 @@ def suspicious_activity():
         })
 
     # 2. Find accounts with rapid wealth accumulation (gained >10k gold in last 24h)
+    # Daily rollups cover whole days; only the partial edges are read from the raw log
+    from app.services.transaction_history_service import TransactionHistoryService
     yesterday = datetime.utcnow() - timedelta(hours=24)
-    wealth_gains = db.session.query(
-        FinancialTransaction.user_id,
-        func.sum(FinancialTransaction.amount).label('total_gained')
-    ).filter(
-        FinancialTransaction.timestamp >= yesterday,
-        FinancialTransaction.transaction_type.in_(['GOLD_GAIN', 'MARKET_SELL', 'CURRENCY_EXCHANGE']),
-        FinancialTransaction.currency_type == 'GOLD'
-    ).group_by(FinancialTransaction.user_id).having(func.sum(FinancialTransaction.amount) > 10000).all()
+    wealth_gains = TransactionHistoryService.gains_by_user(
+        yesterday, ['GOLD_GAIN', 'MARKET_SELL', 'CURRENCY_EXCHANGE'], 'GOLD'
+    )
 
-    for gain in wealth_gains:
-        user = db.session.get(User, gain.user_id)
+    for user_id, total_gained in wealth_gains.items():
+        if total_gained <= 10000:
+            continue
+        user = db.session.get(User, user_id)
         if user and not user.is_admin:
             # Get recent transactions for context
             recent_txs = db.session.query(FinancialTransaction).filter(
-                FinancialTransaction.user_id == gain.user_id,
+                FinancialTransaction.user_id == user_id,
                 FinancialTransaction.timestamp >= yesterday
             ).order_by(desc(FinancialTransaction.timestamp)).limit(10).all()
 
             alerts.append({
                 'type': 'rapid_wealth',
-                'severity': 'high' if float(gain.total_gained) > 50000 else 'medium',
+                'severity': 'high' if float(total_gained) > 50000 else 'medium',
                 'user': user,
-                'amount_gained': float(gain.total_gained),
+                'amount_gained': float(total_gained),
                 'recent_transactions': recent_txs,
-                'description': f'{user.username or user.wallet_address[:10]} gained {float(gain.total_gained):,.2f} gold in 24h'
+                'description': f'{user.username or user.wallet_address[:10]} gained {float(total_gained):,.2f} gold in 24h'
             })
 
     # 3. Find new accounts with high wealth (created in last 7 days with >5k gold)
@@ -2184,7 +2229,7 @@ def economy_dashboard():
     - Market prices and trends
     - Inflation indicators
     """
-    from app.models.currency import FinancialTransaction, UserCurrency
+    from app.models.currency import UserCurrency
     from app.models.company import Company
     from app.models.military_unit import MilitaryUnit
     from app.models.zen_market import ZenMarket
@@ -2227,22 +2272,12 @@ def economy_dashboard():
     # ZEN market data
     zen_markets = db.session.query(ZenMarket).all()
 
-    # Transaction volume (last 24h, 7d, 30d)
+    # Transaction volume (last 24h, 7d, 30d) from daily rollups plus recent raw rows
+    from app.services.transaction_history_service import TransactionHistoryService
     now = datetime.utcnow()
-    tx_24h = db.session.query(func.sum(FinancialTransaction.amount)).filter(
-        FinancialTransaction.timestamp >= now - timedelta(hours=24),
-        FinancialTransaction.currency_type == 'GOLD'
-    ).scalar() or 0
-
-    tx_7d = db.session.query(func.sum(FinancialTransaction.amount)).filter(
-        FinancialTransaction.timestamp >= now - timedelta(days=7),
-        FinancialTransaction.currency_type == 'GOLD'
-    ).scalar() or 0
-
-    tx_30d = db.session.query(func.sum(FinancialTransaction.amount)).filter(
-        FinancialTransaction.timestamp >= now - timedelta(days=30),
-        FinancialTransaction.currency_type == 'GOLD'
-    ).scalar() or 0
+    tx_24h = TransactionHistoryService.totals(now - timedelta(hours=24), now, currency_type='GOLD')
+    tx_7d = TransactionHistoryService.totals(now - timedelta(days=7), now, currency_type='GOLD')
+    tx_30d = TransactionHistoryService.totals(now - timedelta(days=30), now, currency_type='GOLD')
 
     # Top 10 richest players
     top_players = db.session.query(User).filter(
@@ -2401,6 +2436,7 @@ def create_event():
             created_by_id=current_user.id
         )
         db.session.commit()
+        reference_data.bump_version()
 
         flash(f'Event "{name}" created successfully!', 'success')
     except Exception as e:
@@ -2421,6 +2457,7 @@ def toggle_event(event_id):
     if event:
         event.is_active = not event.is_active
         db.session.commit()
+        reference_data.bump_version()
         status = 'activated' if event.is_active else 'deactivated'
         flash(f'Event "{event.name}" {status}.', 'success')
     else:
@@ -2441,6 +2478,7 @@ def delete_event(event_id):
         name = event.name
         db.session.delete(event)
         db.session.commit()
+        reference_data.bump_version()
         flash(f'Event "{name}" deleted.', 'success')
     else:
         flash('Event not found.', 'danger')
@@ -2568,6 +2606,11 @@ def transfer_region(country_id):
         country_regions.insert().values(country_id=target_country_id, region_id=region_id)
     )
 
+    from app.services.country_stats_service import CountryStatsService
+    from app.services.world_graph import world_graph
+    CountryStatsService.on_region_transfer(region_id, country_id, target_country_id)
+    world_graph.on_region_transfer(region_id, country_id, target_country_id)
+
     db.session.commit()
     flash(f'Region "{region.name}" transferred to {target_country.name}.', 'success')
 
@@ -2643,6 +2686,11 @@ def create_region():
         country_regions.insert().values(country_id=country_id, region_id=region.id)
     )
 
+    from app.services.country_stats_service import CountryStatsService
+    from app.services.world_graph import world_graph
+    CountryStatsService.on_region_transfer(region.id, None, country_id)
+    world_graph.on_region_transfer(region.id, None, country_id, name=region.name)
+
     db.session.commit()
     flash(f'Region "{name}" created and assigned to {country.name}.', 'success')
 
@@ -6,6 +6,7 @@ from app.models import Alert, User
 from app.models.messaging import AlertType, AlertPriority
 from datetime import datetime
 from flask import current_app
+from sqlalchemy import insert, literal, union_all, String
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,55 @@ def create_alert(user_id, alert_type, title, content, priority=AlertPriority.NOR
         return False
 
 
+# Columns filled by alert_select(), in order
+ALERT_SELECT_COLUMNS = ('user_id', 'alert_type', 'priority', 'title', 'content',
+                        'is_read', 'is_deleted', 'created_at')
+
+
+def alert_select(recipients, alert_type, title, content, priority=AlertPriority.NORMAL, created_at=None):
+    """
+    Turn a one-column SELECT of user IDs into a SELECT of alert rows.
+
+    Args:
+        recipients: select() of the recipients' user IDs
+        alert_type: AlertType enum value
+        title: Alert title
+        content: Alert message content, or a SQL string expression over the
+                 recipients query (e.g. 'Your company ' + Company.name)
+        priority: AlertPriority enum value (default: NORMAL)
+        created_at: Timestamp for every row (default: now)
+
+    Returns:
+        Select for create_alerts_from_select()
+    """
+    if isinstance(content, str):
+        content = literal(content, String)
+
+    return recipients.add_columns(
+        literal(alert_type.value, String),
+        literal(priority.value, String),
+        literal(title, String),
+        content,
+        literal(False),
+        literal(False),
+        literal(created_at or datetime.utcnow()),
+    )
+
+
+def create_alerts_from_select(*selects):
+    """
+    Create alerts for every row of one or more alert_select()s with a single
+    INSERT ... SELECT. Does not commit: the alerts are part of the caller's
+    transaction.
+
+    Returns:
+        int: Number of alerts created
+    """
+    query = selects[0] if len(selects) == 1 else union_all(*selects)
+    result = db.session.execute(insert(Alert).from_select(ALERT_SELECT_COLUMNS, query))
+    return result.rowcount
+
+
 def send_level_up_alert(user_id, new_level):
     """
     Send a level up alert to a user.
@@ -0,0 +1,149 @@
+"""
+Token Balance Cache
+Short-TTL, single-flight cache for ERC-20 balanceOf lookups.
+
+Wallet widgets poll balances on page load, so many requests ask for the
+same (token, address) within seconds. Within one process:
+- a balance fetched less than BALANCE_TTL seconds ago is reused;
+- concurrent requests for the same key wait for the one in-flight RPC call
+  instead of each making their own (single-flight);
+- transfers the game itself initiates or verifies call invalidate_balances()
+  so the players involved see the new balance immediately.
+
+Balances changed outside the game (wallet to wallet transfers) show up
+after at most BALANCE_TTL seconds. Pre-transfer checks that must be exact
+(e.g. treasury balance before paying out) call balanceOf directly.
+"""
+import threading
+import time
+
+from web3 import Web3
+
+BALANCE_TTL = 10  # Seconds
+
+# Minimal ERC-20 ABI for balanceOf
+ERC20_BALANCE_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function"
+    }
+]
+
+
+class _Flight:
+    """One in-progress fetch that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.invalidated = False  # Set when the balance changed mid-fetch; the result is not stored
+
+
+class BalanceCache:
+    """(token, address) -> (balance_wei, fetched_at), with single-flight fetches."""
+
+    def __init__(self, ttl=BALANCE_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values = {}
+        self._flights = {}
+        self._swept_at = clock()
+        self.stats = {'hits': 0, 'coalesced': 0, 'upstream': 0}
+
+    @staticmethod
+    def _key(token, address):
+        return token.lower(), address.lower()
+
+    def get(self, token, address, fetch):
+        """
+        Balance for (token, address), calling fetch() only if there is no
+        fresh value and no fetch already in flight for the key.
+        """
+        key = self._key(token, address)
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and self._clock() - cached[1] < self.ttl:
+                self.stats['hits'] += 1
+                return cached[0]
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.stats['coalesced'] += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.stats['upstream'] += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fetch()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                if flight.error is None and not flight.invalidated:
+                    self._store(key, flight.value)
+            flight.done.set()
+        return flight.value
+
+    def _store(self, key, value):
+        """Store a fetched balance; caller holds the lock."""
+        now = self._clock()
+        if now - self._swept_at >= self.ttl:
+            # Drop expired balances at most once per TTL, so addresses that
+            # stop being looked up do not stay in memory
+            self._values = {k: v for k, v in self._values.items() if now - v[1] < self.ttl}
+            self._swept_at = now
+        self._values[key] = (value, now)
+
+    def invalidate(self, token, *addresses):
+        """Forget cached balances (e.g. after a transfer the game made)."""
+        with self._lock:
+            for address in addresses:
+                if not address:
+                    continue
+                key = self._key(token, address)
+                self._values.pop(key, None)
+                flight = self._flights.get(key)
+                if flight is not None:
+                    flight.invalidated = True
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            for flight in self._flights.values():
+                flight.invalidated = True
+
+
+# Process-wide instance
+balance_cache = BalanceCache()
+
+
+def get_token_balance_wei(token_address, wallet_address, w3=None):
+    """balanceOf(wallet_address) on an ERC-20 token, through the balance cache."""
+    from .web3_config import get_web3
+
+    def fetch():
+        client = w3 or get_web3()
+        contract = client.eth.contract(address=Web3.to_checksum_address(token_address), abi=ERC20_BALANCE_ABI)
+        return contract.functions.balanceOf(Web3.to_checksum_address(wallet_address)).call()
+
+    return balance_cache.get(token_address, wallet_address, fetch)
+
+
+def invalidate_balances(token_address, *wallet_addresses):
+    """Call after the game sends or verifies a transfer of token_address."""
+    if token_address:
+        balance_cache.invalidate(token_address, *wallet_addresses)
@@ -8,6 +8,7 @@ from decimal import Decimal
 from typing import Optional, Tuple, Dict, List
 from web3 import Web3
 from web3.contract import Contract
+from .web3_config import get_web3, get_receipt_or_none
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,8 @@ TREASURY_ADDRESS = os.getenv('TREASURY_ADDRESS', None)
 ZEN_TOKEN_ADDRESS = os.getenv('ZEN_TOKEN_ADDRESS', None)
 NFT_CONTRACT_ADDRESS = os.getenv('NFT_CONTRACT_ADDRESS', '0x6A20E1a6730683C1aE932d17557Df81AbB9442c6')
 
-# Initialize Web3
-w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_URL))
+# Shared pooled Web3 client (see web3_config.get_web3)
+w3 = get_web3(BLOCKCHAIN_RPC_URL)
 
 # Marketplace Contract ABI
 MARKETPLACE_ABI = [
@@ -221,7 +222,8 @@ def verify_listing_transaction(
     tx_hash: str,
     expected_seller: str,
     expected_token_id: int,
-    expected_price: Decimal
+    expected_price: Decimal,
+    receipt=None
 ) -> bool:
     """
     Verify that a listing transaction succeeded
@@ -231,29 +233,16 @@ def verify_listing_transaction(
         expected_seller: Expected seller address
         expected_token_id: Expected token ID
         expected_price: Expected price in ZEN
+        receipt: Receipt already fetched by the confirmation watcher; fetched
+            once (without waiting) if omitted
 
     Returns:
         True if listing successful
     """
-    import time
-
     try:
         logger.info(f"[Listing Verification] Starting verification for tx: {tx_hash}")
 
-        # Wait for transaction to be mined
-        receipt = None
-        for attempt in range(15):
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                logger.info(f"[Listing Verification] Transaction found")
-                break
-            except Exception as e:
-                if attempt < 14:
-                    logger.info(f"[Listing Verification] Waiting... (attempt {attempt + 1}/15)")
-                    time.sleep(2)
-                else:
-                    raise
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt or receipt['status'] != 1:
             logger.error(f"[Listing Verification] FAILED: Transaction failed")
             return False
@@ -318,7 +307,8 @@ def verify_listing_transaction(
 def verify_purchase_transaction(
     tx_hash: str,
     expected_buyer: str,
-    expected_token_id: int
+    expected_token_id: int,
+    receipt=None
 ) -> Optional[Dict]:
     """
     Verify that a purchase transaction succeeded
@@ -327,29 +317,16 @@ def verify_purchase_transaction(
         tx_hash: Transaction hash
         expected_buyer: Expected buyer address
         expected_token_id: Expected token ID
+        receipt: Receipt already fetched by the confirmation watcher; fetched
+            once (without waiting) if omitted
 
     Returns:
         Dict with purchase details if successful, None otherwise
     """
-    import time
-
     try:
         logger.info(f"[Purchase Verification] Starting verification for tx: {tx_hash}")
 
-        # Wait for transaction to be mined
-        receipt = None
-        for attempt in range(15):
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                logger.info(f"[Purchase Verification] Transaction found")
-                break
-            except Exception as e:
-                if attempt < 14:
-                    logger.info(f"[Purchase Verification] Waiting... (attempt {attempt + 1}/15)")
-                    time.sleep(2)
-                else:
-                    raise
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt or receipt['status'] != 1:
             logger.error(f"[Purchase Verification] FAILED: Transaction failed")
             return None
@@ -398,7 +375,8 @@ def verify_purchase_transaction(
 def verify_cancel_transaction(
     tx_hash: str,
     expected_seller: str,
-    expected_token_id: int
+    expected_token_id: int,
+    receipt=None
 ) -> bool:
     """
     Verify that a cancel listing transaction succeeded
@@ -407,29 +385,16 @@ def verify_cancel_transaction(
         tx_hash: Transaction hash
         expected_seller: Expected seller address
         expected_token_id: Expected token ID
+        receipt: Receipt already fetched by the confirmation watcher; fetched
+            once (without waiting) if omitted
 
     Returns:
         True if cancellation successful
     """
-    import time
-
     try:
         logger.info(f"[Cancel Verification] Starting verification for tx: {tx_hash}")
 
-        # Wait for transaction to be mined
-        receipt = None
-        for attempt in range(15):
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                logger.info(f"[Cancel Verification] Transaction found")
-                break
-            except Exception as e:
-                if attempt < 14:
-                    logger.info(f"[Cancel Verification] Waiting... (attempt {attempt + 1}/15)")
-                    time.sleep(2)
-                else:
-                    raise
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt or receipt['status'] != 1:
             logger.error(f"[Cancel Verification] FAILED: Transaction failed")
             return False
@@ -467,6 +432,14 @@ def get_active_listings_onchain() -> List[int]:
     Returns:
         List of token IDs currently listed
     """
+    try:
+        from app.services.chain_indexer import ChainIndexService
+        token_ids = ChainIndexService.active_listing_token_ids()
+        if token_ids is not None:
+            return token_ids
+    except Exception as e:
+        logger.debug(f"Chain index lookup failed, reading listings from contract: {e}")
+
     marketplace_contract = get_marketplace_contract()
     if not marketplace_contract:
         return []
@@ -489,6 +462,14 @@ def get_listing_details_onchain(token_id: int) -> Optional[Dict]:
     Returns:
         Dict with listing details or None
     """
+    try:
+        from app.services.chain_indexer import ChainIndexService
+        listing = ChainIndexService.listing(token_id)
+        if listing is not None:
+            return listing.to_dict()
+    except Exception as e:
+        logger.debug(f"Chain index lookup failed for listing {token_id}: {e}")
+
     marketplace_contract = get_marketplace_contract()
     if not marketplace_contract:
         return None
@@ -483,11 +483,8 @@ def get_nft_bonus_format(category: str, bonus_value: int) -> str:
         return f"+{bonus_value}%"
 
 
-def get_nft_image_url(nft_type: str, category: str, tier: int) -> str:
-    """
-    Get the HTTP gateway URL for the NFT image.
-    Constructs Pinata gateway URL for easy display in browsers.
-    """
+def get_nft_image_cid(nft_type: str, category: str, tier: int) -> str:
+    """Get the IPFS CID of the NFT image ('' if unknown)."""
     # Image IPFS CIDs - uploaded 2024-12-03
     IMAGE_CIDS = {
         'player': {
@@ -580,8 +577,27 @@ def get_nft_image_url(nft_type: str, category: str, tier: int) -> str:
         },
     }
 
-    cid = IMAGE_CIDS.get(nft_type, {}).get(category, {}).get(tier, '')
+    return IMAGE_CIDS.get(nft_type, {}).get(category, {}).get(tier, '')
+
+
+def get_nft_image_url(nft_type: str, category: str, tier: int) -> str:
+    """
+    Get the HTTP gateway URL for the NFT image.
+    Constructs Pinata gateway URL for easy display in browsers.
+    """
+    cid = get_nft_image_cid(nft_type, category, tier)
     if cid:
         # Use NFT.Storage gateway (free, no rate limits)
         return f'https://nftstorage.link/ipfs/{cid}'
     return ''
+
+
+def get_nft_thumbnail_url(nft_type: str, category: str, tier: int, size: int = 256) -> str:
+    """
+    Get the URL of a locally cached thumbnail of the NFT image (see
+    app/services/nft_image_cache.py). Used by the inventory and marketplace grids.
+    """
+    cid = get_nft_image_cid(nft_type, category, tier)
+    if cid:
+        return f'/api/nft/image/{cid}/thumb/{size}'
+    return ''
@@ -11,6 +11,8 @@ from dotenv import load_dotenv
 from web3 import Web3
 from web3.contract import Contract
 from eth_account import Account
+from .web3_config import get_web3, get_receipt_or_none
+from .balance_cache import invalidate_balances
 
 # Ensure .env is loaded before accessing env vars (with override to handle system env vars)
 env_path = Path(__file__).parent.parent.parent / '.env'
@@ -25,8 +27,8 @@ TREASURY_PRIVATE_KEY = os.getenv('TREASURY_PRIVATE_KEY', None)
 TREASURY_ADDRESS = os.getenv('TREASURY_ADDRESS', None)
 ZEN_TOKEN_ADDRESS = os.getenv('ZEN_TOKEN_ADDRESS', None)
 
-# Initialize Web3
-w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_URL))
+# Shared pooled Web3 client (see web3_config.get_web3)
+w3 = get_web3(BLOCKCHAIN_RPC_URL)
 
 # GameNFT Contract ABI (simplified - add full ABI from compiled contract)
 GAME_NFT_ABI = [
@@ -197,7 +199,8 @@ def check_zen_balance(wallet_address: str) -> Decimal:
     return balance
 
 
-def verify_zen_payment(tx_hash: str, from_address: str, to_address: str, expected_amount: Decimal) -> bool:
+def verify_zen_payment(tx_hash: str, from_address: str, to_address: str, expected_amount: Decimal,
+                       receipt=None) -> bool:
     """
     Verify that a ZEN payment transaction is valid
 
@@ -206,32 +209,19 @@ def verify_zen_payment(tx_hash: str, from_address: str, to_address: str, expecte
         from_address: Expected sender address
         to_address: Expected recipient address (treasury)
         expected_amount: Expected ZEN amount transferred
+        receipt: Receipt already fetched by the confirmation watcher; fetched
+            once (without waiting) if omitted
 
     Returns:
         True if payment is valid, False otherwise
     """
-    import time
-
     try:
         logger.info(f"[Payment Verification] Starting verification for tx: {tx_hash}")
         logger.info(f"[Payment Verification] From: {from_address}, To: {to_address}, Amount: {expected_amount} ZEN")
 
-        # Wait for transaction to be mined (retry up to 30 seconds)
-        receipt = None
-        for attempt in range(15):  # 15 attempts * 2 seconds = 30 seconds max
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                logger.info(f"[Payment Verification] Transaction found after {attempt * 2} seconds")
-                break
-            except Exception as e:
-                if attempt < 14:  # Don't sleep on last attempt
-                    logger.info(f"[Payment Verification] Transaction not found yet, waiting... (attempt {attempt + 1}/15)")
-                    time.sleep(2)
-                else:
-                    raise  # Re-raise on last attempt
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt:
-            logger.info(f"[Payment Verification] FAILED: Transaction not found after 30 seconds")
+            logger.info(f"[Payment Verification] FAILED: Transaction not mined yet")
             return False
 
         logger.info(f"[Payment Verification] Receipt status: {receipt['status']}")
@@ -285,6 +275,7 @@ def verify_zen_payment(tx_hash: str, from_address: str, to_address: str, expecte
                     logger.info(f"[Payment Verification] Amount check: {amount_wei} vs {expected_wei} (tolerance: {tolerance})")
 
                     if abs(amount_wei - expected_wei) <= tolerance:
+                        invalidate_balances(ZEN_TOKEN_ADDRESS, from_address, to_address)
                         logger.info(f"[Payment Verification] SUCCESS: Payment verified!")
                         return True
                     else:
@@ -664,6 +655,16 @@ def verify_nft_ownership(wallet_address: str, token_id: int) -> bool:
     Returns:
         True if wallet owns the NFT
     """
+    # The Transfer-event mirror answers "yes" without an RPC when it is current
+    # and the owning transfer is final. It may be a few blocks behind, so "no"
+    # or "unknown" (including a recent or unconfirmed transfer) goes to the node.
+    try:
+        from app.services.chain_indexer import ChainIndexService
+        if ChainIndexService.owner_of(token_id) == wallet_address.lower():
+            return True
+    except Exception as e:
+        logger.debug(f"Chain index lookup failed for token {token_id}: {e}")
+
     nft_contract = get_nft_contract()
     if not nft_contract:
         return False
@@ -720,6 +721,7 @@ def sync_nfts_from_blockchain(user_id: int, wallet_address: str, existing_token_
     """
     from app import db
     from app.models.nft import NFTInventory
+    from app.services.chain_indexer import ChainIndexService
     import os
 
     nft_contract = get_nft_contract()
@@ -731,21 +733,23 @@ def sync_nfts_from_blockchain(user_id: int, wallet_address: str, existing_token_
     contract_address = os.environ.get('NFT_CONTRACT_ADDRESS', '')
 
     try:
-        # Get total supply to know the range of token IDs to check
-        # We'll check a reasonable range (up to 1000 tokens)
-        # In production, you might use events to track this more efficiently
-        max_token_to_check = 100  # Reasonable limit for a new game
-
-        for token_id in range(1, max_token_to_check + 1):
-            # Skip if already in database
-            if token_id in existing_token_ids:
-                continue
-
+        # Tokens the wallet owns come from the Transfer-event mirror (one
+        # indexed query). Only when the indexer is not running do we fall back
+        # to probing ownerOf over a fixed token range.
+        indexed_tokens = ChainIndexService.tokens_owned_by(wallet_address)
+        if indexed_tokens is not None:
+            candidates = sorted(indexed_tokens - set(existing_token_ids))
+        else:
+            max_token_to_check = 100  # Reasonable limit for a new game
+            candidates = [t for t in range(1, max_token_to_check + 1) if t not in existing_token_ids]
+
+        for token_id in candidates:
             try:
-                # Check if user owns this token
-                owner = nft_contract.functions.ownerOf(token_id).call()
-                if owner.lower() != wallet_address.lower():
-                    continue
+                if indexed_tokens is None:
+                    # Check if user owns this token
+                    owner = nft_contract.functions.ownerOf(token_id).call()
+                    if owner.lower() != wallet_address.lower():
+                        continue
 
                 # User owns this token but it's not in database - add it!
                 logger.info(f"[NFT Sync] Found missing NFT #{token_id} owned by {wallet_address}")
@@ -785,7 +789,7 @@ def sync_nfts_from_blockchain(user_id: int, wallet_address: str, existing_token_
         return 0
 
 
-def verify_nft_mint_transaction(tx_hash: str, expected_minter: str) -> Optional[Dict]:
+def verify_nft_mint_transaction(tx_hash: str, expected_minter: str, receipt=None) -> Optional[Dict]:
     """
     Verify that an NFT mint transaction succeeded and extract NFT details
 
@@ -794,32 +798,19 @@ def verify_nft_mint_transaction(tx_hash: str, expected_minter: str) -> Optional[
     Args:
         tx_hash: Transaction hash of the mintNFT() call
         expected_minter: Expected minter address (user wallet)
+        receipt: Receipt already fetched by the confirmation watcher; fetched
+            once (without waiting) if omitted
 
     Returns:
         Dict with NFT details if successful, None if failed
     """
-    import time
-
     try:
         logger.info(f"[NFT Mint Verification] Starting verification for tx: {tx_hash}")
         logger.info(f"[NFT Mint Verification] Expected minter: {expected_minter}")
 
-        # Wait for transaction to be mined (retry up to 30 seconds)
-        receipt = None
-        for attempt in range(15):  # 15 attempts * 2 seconds = 30 seconds max
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                logger.info(f"[NFT Mint Verification] Transaction found after {attempt * 2} seconds")
-                break
-            except Exception as e:
-                if attempt < 14:  # Don't sleep on last attempt
-                    logger.info(f"[NFT Mint Verification] Transaction not found yet, waiting... (attempt {attempt + 1}/15)")
-                    time.sleep(2)
-                else:
-                    raise  # Re-raise on last attempt
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt:
-            logger.error(f"[NFT Mint Verification] FAILED: Transaction not found after 30 seconds")
+            logger.error(f"[NFT Mint Verification] FAILED: Transaction not mined yet")
             return None
 
         logger.info(f"[NFT Mint Verification] Receipt status: {receipt['status']}")
@@ -1074,7 +1065,8 @@ def verify_all_equipped_nfts() -> Dict:
     return results
 
 
-def verify_nft_upgrade_transaction(tx_hash: str, expected_upgrader: str, expected_burn_token_ids: list) -> Optional[Dict]:
+def verify_nft_upgrade_transaction(tx_hash: str, expected_upgrader: str, expected_burn_token_ids: list,
+                                   receipt=None) -> Optional[Dict]:
     """
     Verify that an NFT upgrade transaction succeeded and extract new NFT details
 
@@ -1085,34 +1077,20 @@ def verify_nft_upgrade_transaction(tx_hash: str, expected_upgrader: str, expecte
         tx_hash: Transaction hash of the upgradeNFT() call
         expected_upgrader: Expected upgrader address (user wallet)
         expected_burn_token_ids: List of 3 token IDs that should have been burned
+        receipt: Receipt already fetched (and confirmed) by the confirmation
+            watcher; fetched once (without waiting) if omitted
 
     Returns:
         Dict with new NFT details if successful, None if failed
     """
-    import time
-
     try:
         logger.info(f"[NFT Upgrade Verification] Starting verification for tx: {tx_hash}")
         logger.info(f"[NFT Upgrade Verification] Expected upgrader: {expected_upgrader}")
         logger.info(f"[NFT Upgrade Verification] Expected burn token IDs: {expected_burn_token_ids}")
 
-        # Wait for transaction to be mined (retry up to 60 seconds for better reliability)
-        receipt = None
-        for attempt in range(30):  # 30 attempts * 2 seconds = 60 seconds max
-            try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                if receipt:
-                    logger.info(f"[NFT Upgrade Verification] Transaction found after {attempt * 2} seconds")
-                    break
-            except Exception as e:
-                logger.debug(f"[NFT Upgrade Verification] Receipt not available yet: {e}")
-
-            if attempt < 29:  # Don't sleep on last attempt
-                logger.info(f"[NFT Upgrade Verification] Transaction not found yet, waiting... (attempt {attempt + 1}/30)")
-                time.sleep(2)
-
+        receipt = receipt or get_receipt_or_none(w3, tx_hash)
         if not receipt:
-            logger.error(f"[NFT Upgrade Verification] FAILED: Transaction not found after 60 seconds")
+            logger.error(f"[NFT Upgrade Verification] FAILED: Transaction not mined yet")
             return None
 
         # CRITICAL: Explicitly check transaction status
@@ -1125,28 +1103,8 @@ def verify_nft_upgrade_transaction(tx_hash: str, expected_upgrader: str, expecte
             logger.error(f"[NFT Upgrade Verification] Block: {receipt.get('blockNumber')}, Gas used: {receipt.get('gasUsed')}")
             return None
 
-        # Additional safety: verify transaction has at least 1 confirmation
-        try:
-            current_block = w3.eth.block_number
-            tx_block = receipt.get('blockNumber')
-            confirmations = current_block - tx_block if tx_block else 0
-            logger.info(f"[NFT Upgrade Verification] Transaction has {confirmations} confirmations")
-
-            # Wait for at least 1 confirmation
-            if confirmations < 1:
-                logger.info(f"[NFT Upgrade Verification] Waiting for confirmation...")
-                time.sleep(3)  # Wait a bit more for confirmation
-        except Exception as conf_err:
-            logger.warning(f"[NFT Upgrade Verification] Could not check confirmations: {conf_err}")
-
-        # Re-check status after waiting (in case of reorg)
-        try:
-            receipt = w3.eth.get_transaction_receipt(tx_hash)
-            if receipt.get('status') != 1:
-                logger.error(f"[NFT Upgrade Verification] FAILED: Transaction status changed to failed after recheck")
-                return None
-        except Exception as recheck_err:
-            logger.warning(f"[NFT Upgrade Verification] Could not recheck status: {recheck_err}")
+        # Confirmations are counted by the watcher, which re-fetches the
+        # receipt every block until the transaction is deep enough
 
         # Get transaction details
         tx = w3.eth.get_transaction(tx_hash)
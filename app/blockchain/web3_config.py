@@ -1,8 +1,17 @@
 """
 Web3 Configuration for Horizen L3
+
+get_web3() is the one place the app builds Web3 clients. Every module
+(wallet routes, ZEN transfers, NFT and marketplace contracts, election
+publishing) shares one client per RPC URL per process, backed by a pooled
+requests.Session, so RPC calls reuse keep-alive connections instead of
+opening a new TCP/TLS connection each time.
 """
 import os
 import json
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from pathlib import Path
 from dotenv import load_dotenv
@@ -11,21 +20,72 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path, override=True)
 
+DEFAULT_RPC_URL = 'https://horizen.calderachain.xyz/http'
+RPC_TIMEOUT = 10        # Seconds per RPC call
+RPC_POOL_SIZE = 10      # Keep-alive connections per RPC host (per process)
+
 # Configuration - these will be loaded from environment at runtime
-_w3 = None
+_clients = {}           # rpc_url -> Web3
+_clients_lock = threading.Lock()
 _zen_contract = None
 _citizenship_nft_contract = None
 
-def get_web3():
-    """Get Web3 instance (singleton)"""
-    global _w3
-    if _w3 is None:
-        # Load RPC_URL from environment at runtime (after Flask has loaded .env)
-        RPC_URL = os.getenv('BLOCKCHAIN_RPC_URL', 'https://horizen.calderachain.xyz/http')
-        _w3 = Web3(Web3.HTTPProvider(RPC_URL))
-        if not _w3.is_connected():
-            raise Exception(f"Failed to connect to Horizen L3 RPC at {RPC_URL}")
-    return _w3
+
+def _pooled_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RPC_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_web3(rpc_url=None):
+    """
+    Get the shared Web3 client for an RPC URL (BLOCKCHAIN_RPC_URL by default).
+
+    No connectivity check is made here - that would cost a round-trip; a dead
+    RPC surfaces as an exception from the first real call.
+    """
+    # Load RPC_URL from environment at runtime (after Flask has loaded .env)
+    rpc_url = rpc_url or os.getenv('BLOCKCHAIN_RPC_URL', DEFAULT_RPC_URL)
+    w3 = _clients.get(rpc_url)
+    if w3 is None:
+        with _clients_lock:
+            w3 = _clients.get(rpc_url)
+            if w3 is None:
+                provider = Web3.HTTPProvider(
+                    rpc_url, request_kwargs={'timeout': RPC_TIMEOUT}, session=_pooled_session()
+                )
+                w3 = _clients[rpc_url] = Web3(provider)
+    return w3
+
+def reset_clients():
+    """
+    Forget this process's clients and contracts.
+
+    Called in a forked Gunicorn worker (app/lifecycle.py): pooled keep-alive
+    sockets opened by the parent must not be shared between processes.
+    """
+    global _clients_lock, _zen_contract, _citizenship_nft_contract
+    _clients.clear()
+    _clients_lock = threading.Lock()
+    _zen_contract = None
+    _citizenship_nft_contract = None
+
+def get_receipt_or_none(w3, tx_hash):
+    """
+    Receipt of a transaction, or None if it is not mined yet.
+
+    Never waits: confirmation of user transactions is tracked by the
+    background watcher (app/services/chain_tx_tracker.py), which passes the
+    receipt it fetched to the verify_* functions.
+    """
+    from web3.exceptions import TransactionNotFound
+
+    try:
+        return w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
 
 def load_contract_abi(contract_name):
     """Load contract ABI from JSON file"""
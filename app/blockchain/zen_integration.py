@@ -9,6 +9,7 @@ from typing import Tuple, Optional
 from web3 import Web3
 from eth_account import Account
 from .web3_config import get_web3, get_zen_contract, is_valid_address, to_checksum_address
+from .balance_cache import get_token_balance_wei, invalidate_balances
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,8 @@ TREASURY_ADDRESS = os.getenv('TREASURY_ADDRESS')
 
 def get_zen_balance(wallet_address):
     """
-    Get ZEN token balance for a wallet address
+    Get ZEN token balance for a wallet address (cached for a few seconds,
+    see balance_cache)
 
     Args:
         wallet_address (str): Ethereum wallet address
@@ -31,10 +33,7 @@ def get_zen_balance(wallet_address):
         return None
 
     try:
-        zen_contract = get_zen_contract()
-        checksum_address = to_checksum_address(wallet_address)
-        balance_wei = zen_contract.functions.balanceOf(checksum_address).call()
-        return balance_wei
+        return get_token_balance_wei(os.getenv('ZEN_TOKEN_ADDRESS'), wallet_address)
     except Exception as e:
         logger.error(f"Error fetching ZEN balance for {wallet_address}: {e}", exc_info=True)
         return None
@@ -215,6 +214,7 @@ def transfer_zen_from_treasury(to_address: str, amount: Decimal) -> Tuple[bool,
             logger.error(f"[ZEN Transfer] Transaction failed on blockchain")
             return False, tx_hash_hex, "Transaction failed on blockchain"
 
+        invalidate_balances(zen_contract.address, treasury_account.address, to_address)
         logger.info(f"[ZEN Transfer] SUCCESS! {amount} ZEN transferred to {to_address}")
         return True, tx_hash_hex, None
 
@@ -332,6 +332,7 @@ def verify_zen_transfer_to_treasury(tx_hash: str, from_address: str, expected_am
 
                     # Allow small tolerance for rounding
                     if abs(amount_zen - expected_amount) <= Decimal('0.001'):
+                        invalidate_balances(zen_contract.address, from_address, treasury_address)
                         logger.info(f"[ZEN Verify] SUCCESS! {amount_zen} ZEN transferred to treasury")
                         return True, None
                     else:
@@ -7,6 +7,7 @@ from decimal import Decimal
 from web3 import Web3
 from dotenv import load_dotenv
 from .web3_config import get_web3, get_zen_contract
+from .balance_cache import invalidate_balances
 
 load_dotenv()
 
@@ -147,6 +148,7 @@ def transfer_zen_from_treasury(to_address, amount_zen):
         tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
 
         if tx_receipt['status'] == 1:
+            invalidate_balances(zen_contract.address, TREASURY_ADDRESS, to_address)
             return {
                 'success': True,
                 'tx_hash': tx_hash.hex(),
@@ -216,6 +218,7 @@ def verify_zen_transfer(tx_hash, expected_from, expected_to, expected_amount_zen
                     expected_wei = w3.to_wei(float(expected_amount_zen), 'ether')
 
                     if amount == expected_wei:
+                        invalidate_balances(zen_contract.address, from_addr, to_addr)
                         return {
                             'valid': True,
                             'message': 'Transfer verified successfully',
@@ -0,0 +1,316 @@
+"""
+World Bootstrap - builds a new game world in a handful of statements.
+
+The seed_*.py scripts add rows one at a time, each after its own existence
+query (generate_price_history.py alone asks about every market item for
+every one of 30 days). This loader builds the same world from the
+declarative tables in app.bootstrap.world_data:
+
+- Rows listed in world_data (ranks, resources, countries, regions, region
+  ownership, neighbours) are compared with one SELECT of the existing keys
+  per table and the missing ones written with multi-row INSERTs.
+- Rows derived from other tables (gold markets, market items, the ZEN
+  market, price history) are written with one INSERT ... SELECT each,
+  whose NOT EXISTS anti-join skips the rows already there.
+
+Every step only adds what is missing, so running it again is a no-op and
+running it on a partly seeded database completes it. It never updates or
+deletes existing rows: a region conquered since the first run keeps its
+new owner.
+
+Run it with BootstrapConfig (scheduler and log pipeline off) so nothing
+else touches the half-built world; the command refuses to run otherwise:
+
+    flask --app "app:create_app('bootstrap')" bootstrap-world
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+
+from slugify import slugify
+from sqlalchemy import select, insert, exists, and_, or_, case, literal, true, union_all, Date
+
+from app.extensions import db
+from app.bootstrap import world_data
+
+logger = logging.getLogger(__name__)
+
+INSERT_CHUNK_ROWS = 500     # Rows per multi-row INSERT (keeps under SQLite/MySQL parameter limits)
+
+
+def _insert_rows(table, rows):
+    """Multi-row INSERT of a list of dicts; returns the number of rows."""
+    for start in range(0, len(rows), INSERT_CHUNK_ROWS):
+        db.session.execute(insert(table).values(rows[start:start + INSERT_CHUNK_ROWS]))
+    return len(rows)
+
+
+def _insert_select(table, columns, query):
+    """INSERT ... SELECT; returns the number of rows inserted."""
+    return db.session.execute(insert(table).from_select(columns, query)).rowcount
+
+
+# ----------------------------------------------------------------------
+# Declarative rows
+# ----------------------------------------------------------------------
+
+def seed_military_ranks():
+    from app.models import MilitaryRank
+
+    existing = set(db.session.scalars(select(MilitaryRank.id)))
+    return _insert_rows(MilitaryRank.__table__, [
+        {'id': rank_id, 'name': name, 'xp_required': xp_required, 'damage_bonus': damage_bonus}
+        for rank_id, name, xp_required, damage_bonus in world_data.MILITARY_RANKS
+        if rank_id not in existing
+    ])
+
+
+def seed_resources():
+    from app.models import Resource
+
+    existing = set(db.session.scalars(select(Resource.slug)))
+    return _insert_rows(Resource.__table__, [
+        {
+            'name': name, 'slug': slugify(name), 'category': category, 'icon_path': icon_path,
+            'market_volume_threshold': world_data.RESOURCE_VOLUME_PER_LEVEL,
+            'market_price_adjustment': world_data.RESOURCE_PRICE_ADJUSTMENTS[category],
+            'can_have_quality': can_have_quality,
+        }
+        for name, category, icon_path, can_have_quality in world_data.RESOURCES
+        if slugify(name) not in existing
+    ])
+
+
+def seed_countries():
+    from app.models import Country
+
+    existing = set(db.session.scalars(select(Country.slug)))
+    return _insert_rows(Country.__table__, [
+        {'name': name, 'slug': slugify(name), 'flag_code': flag_code,
+         'currency_code': currency_code, 'currency_name': currency_code}
+        for name, flag_code, currency_code, _ in world_data.COUNTRIES
+        if slugify(name) not in existing
+    ])
+
+
+def seed_regions():
+    """
+    Regions missing by slug, each owned by the first country that lists it.
+
+    Only regions created here are given to their original owner: existing
+    regions keep whatever owner the game has given them since.
+    """
+    from app.models import Country, Region, country_regions
+
+    country_ids = dict(db.session.execute(select(Country.slug, Country.id)).all())
+    existing = set(db.session.scalars(select(Region.slug)))
+
+    rows = {}
+    for country_name, _, _, region_names in world_data.COUNTRIES:
+        for region_name in region_names:
+            slug = slugify(region_name)
+            if slug not in existing and slug not in rows:
+                rows[slug] = {'name': region_name, 'slug': slug,
+                              'original_owner_id': country_ids[slugify(country_name)]}
+    if not rows:
+        return 0
+
+    _insert_rows(Region.__table__, list(rows.values()))
+    region_ids = db.session.execute(
+        select(Region.slug, Region.id).where(Region.slug.in_(list(rows)))
+    ).all()
+    _insert_rows(country_regions, [
+        {'country_id': rows[slug]['original_owner_id'], 'region_id': region_id}
+        for slug, region_id in region_ids
+    ])
+    return len(rows)
+
+
+def seed_region_neighbors():
+    """Neighbour links as listed in world_data (one direction per entry), skipping unknown regions."""
+    from app.models import Region, region_neighbors
+
+    region_ids = dict(db.session.execute(select(Region.slug, Region.id)).all())
+    existing = set(db.session.execute(select(region_neighbors.c.region_id, region_neighbors.c.neighbor_id)).all())
+
+    pairs = []
+    for region_name, neighbor_names in world_data.REGION_NEIGHBORS.items():
+        region_id = region_ids.get(slugify(region_name))
+        if region_id is None:
+            continue
+        for neighbor_name in neighbor_names:
+            neighbor_id = region_ids.get(slugify(neighbor_name))
+            if neighbor_id is None or (region_id, neighbor_id) in existing:
+                continue
+            existing.add((region_id, neighbor_id))
+            pairs.append({'region_id': region_id, 'neighbor_id': neighbor_id})
+    return _insert_rows(region_neighbors, pairs)
+
+
+# ----------------------------------------------------------------------
+# Derived rows
+# ----------------------------------------------------------------------
+
+def seed_gold_markets():
+    from app.models import Country, GoldMarket
+
+    params = world_data.GOLD_MARKET
+    query = (
+        select(Country.id, literal(params['initial_exchange_rate'], GoldMarket.initial_exchange_rate.type),
+               literal(params['volume_per_level']),
+               literal(params['price_adjustment_per_level'], GoldMarket.price_adjustment_per_level.type))
+        .where(~exists().where(GoldMarket.country_id == Country.id))
+    )
+    return _insert_select(GoldMarket.__table__, [
+        'country_id', 'initial_exchange_rate', 'volume_per_level', 'price_adjustment_per_level'
+    ], query)
+
+
+def seed_zen_market():
+    from app.models import ZenMarket
+
+    if db.session.scalar(select(ZenMarket.id).where(ZenMarket.id == world_data.ZEN_MARKET['id'])) is not None:
+        return 0
+    return _insert_rows(ZenMarket.__table__, [dict(world_data.ZEN_MARKET)])
+
+
+def seed_market_items():
+    """
+    One CountryMarketItem per country, resource and quality (Q1-Q5, or Q0
+    for resources without quality), priced base x 2^(quality - 1).
+    """
+    from app.models import Country, Resource, CountryMarketItem
+
+    price_type = CountryMarketItem.initial_price.type
+    qualities = union_all(
+        select(literal(0).label('quality'), literal(1).label('multiplier')),
+        *[select(literal(q), literal(2 ** (q - 1))) for q in world_data.QUALITY_LEVELS]
+    ).subquery('qualities')
+    base_price = case(
+        *[(Resource.name == name, literal(price, price_type))
+          for name, price in world_data.MARKET_ITEM_BASE_PRICE_BY_RESOURCE.items()],
+        else_=literal(world_data.MARKET_ITEM_BASE_PRICE, price_type)
+    )
+
+    query = (
+        select(Country.id, Resource.id, qualities.c.quality, base_price * qualities.c.multiplier)
+        .select_from(Country)
+        .join(Resource, true())
+        .join(qualities, or_(
+            and_(Resource.can_have_quality == True, qualities.c.quality > 0),
+            and_(Resource.can_have_quality == False, qualities.c.quality == 0),
+        ))
+        .where(Country.is_deleted == False, Resource.is_deleted == False)
+        .where(~exists().where(
+            CountryMarketItem.country_id == Country.id,
+            CountryMarketItem.resource_id == Resource.id,
+            CountryMarketItem.quality == qualities.c.quality,
+        ))
+    )
+    return _insert_select(CountryMarketItem.__table__, [
+        'country_id', 'resource_id', 'quality', 'initial_price'
+    ], query)
+
+
+def _history_days(days, today=None):
+    """The `days` dates before today, as a one-column derived table."""
+    today = today or date.today()
+    return union_all(*[
+        select(literal(today - timedelta(days=n), Date).label('recorded_date'))
+        for n in range(days, 0, -1)
+    ]).subquery('days')
+
+
+def seed_market_price_history(days=world_data.PRICE_HISTORY_DAYS, today=None):
+    """Flat daily OHLC at initial_price for every market item of a live country, for the past `days` days."""
+    from app.models import Country, CountryMarketItem
+    from app.models.resource import MarketPriceHistory
+
+    history = _history_days(days, today)
+    price = CountryMarketItem.initial_price
+    query = (
+        select(CountryMarketItem.country_id, CountryMarketItem.resource_id, CountryMarketItem.quality,
+               price, price, price, price, price, history.c.recorded_date)
+        .join(Country, Country.id == CountryMarketItem.country_id)
+        .join(history, true())
+        .where(Country.is_deleted == False)
+        .where(~exists().where(
+            MarketPriceHistory.country_id == CountryMarketItem.country_id,
+            MarketPriceHistory.resource_id == CountryMarketItem.resource_id,
+            MarketPriceHistory.quality == CountryMarketItem.quality,
+            MarketPriceHistory.recorded_date == history.c.recorded_date,
+        ))
+    )
+    return _insert_select(MarketPriceHistory.__table__, [
+        'country_id', 'resource_id', 'quality',
+        'price_open', 'price_high', 'price_low', 'price_close', 'price', 'recorded_date'
+    ], query)
+
+
+def seed_currency_price_history(days=world_data.PRICE_HISTORY_DAYS, today=None):
+    """Flat daily OHLC at initial_exchange_rate for every gold market of a live country, for the past `days` days."""
+    from app.models import Country, GoldMarket, CurrencyPriceHistory
+
+    history = _history_days(days, today)
+    rate = GoldMarket.initial_exchange_rate
+    query = (
+        select(GoldMarket.country_id, rate, rate, rate, rate, rate, history.c.recorded_date)
+        .join(Country, Country.id == GoldMarket.country_id)
+        .join(history, true())
+        .where(Country.is_deleted == False)
+        .where(~exists().where(
+            CurrencyPriceHistory.country_id == GoldMarket.country_id,
+            CurrencyPriceHistory.recorded_date == history.c.recorded_date,
+        ))
+    )
+    return _insert_select(CurrencyPriceHistory.__table__, [
+        'country_id', 'rate_open', 'rate_high', 'rate_low', 'rate_close', 'exchange_rate', 'recorded_date'
+    ], query)
+
+
+# ----------------------------------------------------------------------
+# Whole world
+# ----------------------------------------------------------------------
+
+STEPS = [
+    ('military_ranks', seed_military_ranks),
+    ('resources', seed_resources),
+    ('countries', seed_countries),
+    ('regions', seed_regions),
+    ('region_neighbors', seed_region_neighbors),
+    ('gold_markets', seed_gold_markets),
+    ('zen_market', seed_zen_market),
+    ('market_items', seed_market_items),
+    ('market_price_history', seed_market_price_history),
+    ('currency_price_history', seed_currency_price_history),
+]
+
+
+def bootstrap_world(history=True):
+    """
+    Add whatever is missing of the world in one transaction; returns {step: rows added}.
+
+    Must run inside an app context. history=False skips the price history.
+    """
+    from app.services.reference_data import reference_data
+    from app.services.world_graph import world_graph
+
+    started = datetime.utcnow()
+    added = {}
+    try:
+        for name, step in STEPS:
+            if not history and name.endswith('_history'):
+                continue
+            added[name] = step()
+            logger.info(f"Bootstrap {name}: {added[name]} rows added")
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    # Rows were written past the ORM, so no change hooks fired
+    if any(added.values()):
+        reference_data.bump_version()
+        world_graph.bump_version()
+    logger.info(f"World bootstrap finished in {(datetime.utcnow() - started).total_seconds():.2f} s")
+    return added
@@ -18,7 +18,9 @@ def invalidate_country_cache(country_id=None):
 
 def invalidate_resource_cache(resource_id=None):
     from app.main.market_utils import invalidate_resource_cache as inv_market_cache
+    from app.services.reference_data import reference_data
     inv_market_cache()
+    reference_data.bump_version()
 
     if resource_id:
         current_app.logger.info(f"Cache invalidated for resource {resource_id}")
@@ -31,7 +33,9 @@ def invalidate_user_cache(user_id):
 
 
 def invalidate_all_caches():
+    from app.services.reference_data import reference_data
     cache.clear()
+    reference_data.invalidate()
     current_app.logger.warning("ALL caches cleared!")
 
 
@@ -72,6 +76,10 @@ def warm_cache():
         list(country_query())
         current_app.logger.info("Country query cache warmed")
 
+        from app.services.reference_data import reference_data
+        reference_data.snapshot()
+        current_app.logger.info("Reference data warmed")
+
         current_app.logger.info("Cache warming completed successfully")
 
     except Exception as e:
@@ -484,3 +484,100 @@ def register_cli_commands(app):
             click.echo(f'Deleted {mt_count} merkle trees')
             click.echo(f'Deleted {zv_count} ZK votes')
             click.echo('Done! Users need to clear localStorage and re-register for anonymous voting.')
+
+    @app.cli.command('recompute-country-stats')
+    def recompute_country_stats_command():
+        """Rebuild materialized country statistics from scratch."""
+        from app.services.country_stats_service import CountryStatsService
+
+        with app.app_context():
+            count = CountryStatsService.recompute_all()
+            db.session.commit()
+            click.echo(f'Recomputed statistics for {count} countries')
+
+    @app.cli.command('recompute-moderation-counters')
+    def recompute_moderation_counters_command():
+        """Rebuild the support ticket and report counters from scratch."""
+        from app.services.moderation_stats_service import ModerationStatsService
+
+        with app.app_context():
+            counters = ModerationStatsService.recompute()
+            db.session.commit()
+            click.echo(f'Recomputed counters for {counters.tickets_total} tickets and {counters.reports_total} reports')
+
+    @app.cli.command('recompute-politics')
+    def recompute_politics_command():
+        """Rebuild party rosters, government compositions and open election summaries."""
+        from app.services.politics_read_model_service import PoliticsReadModelService
+
+        with app.app_context():
+            parties, countries, elections = PoliticsReadModelService.recompute_all()
+            db.session.commit()
+            click.echo(f'Recomputed {parties} party rosters, {countries} government compositions '
+                       f'and {elections} election summaries')
+
+    @app.cli.command('rollup-transactions')
+    @click.option('--day', '-d', default=None, help='Recompute a single day (YYYY-MM-DD); default: all pending days')
+    def rollup_transactions_command(day):
+        """Roll up financial transactions into the daily summary tables."""
+        from datetime import datetime
+        from app.services.transaction_history_service import TransactionHistoryService
+
+        with app.app_context():
+            created = TransactionHistoryService.ensure_partitions()
+            if created:
+                click.echo(f'Created partitions: {", ".join(created)}')
+
+            if day:
+                rows = TransactionHistoryService.rollup_day(datetime.strptime(day, '%Y-%m-%d').date())
+                db.session.commit()
+                click.echo(f'Rolled up {day}: {rows} per-user rows')
+            else:
+                days = TransactionHistoryService.rollup_pending()
+                db.session.commit()
+                click.echo(f'Rolled up {days} days')
+
+    @app.cli.command('archive-transactions')
+    @click.option('--keep-months', '-k', type=int, default=None, help='Recent months to keep (default: TRANSACTION_KEEP_MONTHS)')
+    @click.option('--out', '-o', default=None, help='Export directory (default: TRANSACTION_ARCHIVE_DIR)')
+    @click.option('--dry-run', is_flag=True, help='Only list the months that would be archived')
+    def archive_transactions_command(keep_months, out, dry_run):
+        """Export old months of financial transactions to .csv.gz files and drop them."""
+        from app.services.transaction_history_service import TransactionHistoryService
+
+        keep_months = keep_months if keep_months is not None else app.config['TRANSACTION_KEEP_MONTHS']
+        out = out or app.config['TRANSACTION_ARCHIVE_DIR']
+
+        with app.app_context():
+            months = TransactionHistoryService.archivable_months(keep_months)
+            if not months:
+                click.echo('Nothing to archive')
+                return
+            for month in months:
+                if dry_run:
+                    click.echo(f'Would archive {month:%Y-%m}')
+                    continue
+                result = TransactionHistoryService.archive_month(month, out)
+                click.echo(f"Archived {result['month']}: {result['rows']} rows -> {result['file']} ({result['removed']} removed)")
+
+    @app.cli.command('bootstrap-world')
+    @click.option('--no-history', is_flag=True, help='Skip the 30 days of market and currency price history')
+    def bootstrap_world_command(no_history):
+        """Create whatever is missing of the game world (ranks, resources, countries, markets)."""
+        import time
+        from app.bootstrap import bootstrap_world
+
+        # Nothing else may write while the world is half built. The scheduler
+        # (and its startup checks) would already be running by now, so the
+        # app has to be created with BootstrapConfig
+        if app.config.get('SCHEDULER_ENABLED') or app.config.get('LOG_PIPELINE_ENABLED'):
+            raise click.ClickException(
+                "Run with background work off: flask --app \"app:create_app('bootstrap')\" bootstrap-world"
+            )
+
+        with app.app_context():
+            started = time.perf_counter()
+            added = bootstrap_world(history=not no_history)
+            for step, rows in added.items():
+                click.echo(f'{step}: {rows} added')
+            click.echo(f'Done in {time.perf_counter() - started:.2f} s')
@@ -5,6 +5,7 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
 from flask_wtf.csrf import CSRFProtect
+from app.metrics import count_rate_limit_breach
 
 db = SQLAlchemy()
 migrate = Migrate()
@@ -35,6 +36,7 @@ limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
     storage_uri="memory://",
+    on_breach=count_rate_limit_breach,
 )
 
 cache = Cache()
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from flask import render_template, redirect, url_for, flash, request, current_app, abort, jsonify
 from flask_login import current_user, login_required
 from sqlalchemy import and_, or_
+from sqlalchemy.orm import selectinload
 
 from app.government import bp
 from app.extensions import db
@@ -16,6 +17,10 @@ from app.models import (
     MilitaryInventory, Resource, CountryMarketItem, Region,
     Battle, BattleStatus, RegionalConstruction
 )
+from app.services.politics_read_model_service import PoliticsReadModelService, government_election_type
+
+# zkVerify proof links listed on the election page (the total is shown too)
+ZK_PROOF_LINK_LIMIT = 10
 
 
 @bp.route('/elections')
@@ -46,6 +51,7 @@ def elections():
         db.select(CongressMember)
         .where(CongressMember.country_id == current_user.citizenship_id)
         .where(CongressMember.is_current == True)
+        .options(selectinload(CongressMember.user), selectinload(CongressMember.party))
         .order_by(CongressMember.final_rank)
     ).all()
 
@@ -94,6 +100,7 @@ def election_detail(election_id):
                     )
                 )
             )
+            .options(selectinload(ElectionCandidate.user), selectinload(ElectionCandidate.party))
             .order_by(ElectionCandidate.votes_received.desc())
         ).all()
     else:
@@ -102,6 +109,7 @@ def election_detail(election_id):
             db.select(ElectionCandidate)
             .where(ElectionCandidate.election_id == election_id)
             .where(ElectionCandidate.status == CandidateStatus.APPROVED)
+            .options(selectinload(ElectionCandidate.user), selectinload(ElectionCandidate.party))
             .order_by(ElectionCandidate.votes_received.desc())
         ).all()
 
@@ -151,52 +159,37 @@ def election_detail(election_id):
         if current_user.party:
             can_apply = election.is_nominations_open()
 
-    # Vote transparency data
+    # Vote transparency data, from the election summary and tally
     from app.models.zk_voting import ZKVote
     from app.services.zkverify_service import zkverify_service
 
-    zk_election_type = 'presidential' if election.election_type == ElectionType.PRESIDENTIAL else 'congressional'
-
-    # Count regular votes
-    regular_votes = election.votes.count()
-
-    # Count and get ZK votes
-    zk_vote_records = db.session.scalars(
-        db.select(ZKVote)
-        .where(ZKVote.election_type == zk_election_type)
-        .where(ZKVote.election_id == election_id)
-        .where(ZKVote.proof_verified == True)
-    ).all()
-
-    zk_votes = len(zk_vote_records)
-    total_votes = regular_votes + zk_votes
-
-    # Get zkVerify proof links
-    zk_proofs = [
-        zkverify_service.get_explorer_url(v.zkverify_tx_hash)
-        for v in zk_vote_records if v.zkverify_tx_hash
-    ]
-
-    # Build real-time ZK vote counts per candidate (1-based index -> count)
-    # This matches how voting.py assigns vote_choice (1-based index of approved candidates sorted by ID)
-    approved_candidates = sorted(
-        [c for c in candidates if c.status == CandidateStatus.APPROVED],
-        key=lambda c: c.id
-    )
-    zk_index_to_candidate_id = {idx: c.id for idx, c in enumerate(approved_candidates, start=1)}
-
-    # Count ZK votes per index
-    zk_vote_counts_by_index = {}
-    for record in zk_vote_records:
-        if record.vote_choice > 0:
-            zk_vote_counts_by_index[record.vote_choice] = zk_vote_counts_by_index.get(record.vote_choice, 0) + 1
-
-    # Map to candidate IDs for template
-    candidate_zk_votes = {}
-    for zk_index, count in zk_vote_counts_by_index.items():
-        if zk_index in zk_index_to_candidate_id:
-            candidate_id = zk_index_to_candidate_id[zk_index]
-            candidate_zk_votes[candidate_id] = count
+    zk_election_type = government_election_type(election)
+    summary = PoliticsReadModelService.get_election_summary(zk_election_type, election_id)
+    tally = PoliticsReadModelService.get_tally(zk_election_type, election_id)
+
+    regular_votes = summary.vote_count
+    zk_votes = summary.zk_vote_count
+    total_votes = summary.total_votes
+
+    # Latest zkVerify proof links
+    zk_proof_count = summary.zk_proof_count
+    zk_proofs = []
+    if zk_proof_count:
+        zk_proofs = [
+            zkverify_service.get_explorer_url(tx_hash)
+            for tx_hash in db.session.scalars(
+                db.select(ZKVote.zkverify_tx_hash)
+                .where(ZKVote.election_type == zk_election_type)
+                .where(ZKVote.election_id == election_id)
+                .where(ZKVote.proof_verified == True)
+                .where(ZKVote.zkverify_tx_hash.isnot(None))
+                .order_by(ZKVote.id.desc())
+                .limit(ZK_PROOF_LINK_LIMIT)
+            ).all()
+        ]
+
+    # Real-time ZK votes per candidate ID (ballot indexes already mapped in the tally)
+    candidate_zk_votes = {key: t.zk_votes for key, t in tally.items() if t.zk_votes}
 
     return render_template('government/election_detail.html',
                           title=f'{election.election_type.value.title()} Election',
@@ -211,6 +204,7 @@ def election_detail(election_id):
                           zk_votes=zk_votes,
                           total_votes=total_votes,
                           zk_proofs=zk_proofs,
+                          zk_proof_count=zk_proof_count,
                           candidate_zk_votes=candidate_zk_votes)
 
 
@@ -291,6 +285,8 @@ def nominate(election_id, user_id):
         candidate.approve(current_user.id)
 
         db.session.add(candidate)
+        db.session.flush()
+        PoliticsReadModelService.on_candidacy_change(government_election_type(election), election_id)
         db.session.commit()
 
         current_app.logger.info(
@@ -417,6 +413,8 @@ def approve_candidate(election_id, candidate_id):
 
     try:
         candidate.approve(current_user.id)
+        db.session.flush()
+        PoliticsReadModelService.on_candidacy_change(government_election_type(election), election_id)
         db.session.commit()
 
         current_app.logger.info(
@@ -592,6 +590,7 @@ def vote(election_id, candidate_id):
 
         # Increment candidate's vote count
         candidate.votes_received += 1
+        PoliticsReadModelService.on_vote(government_election_type(election), election_id, candidate.id)
 
         db.session.commit()
 
@@ -627,34 +626,34 @@ def president(country_id):
     if not country:
         abort(404)
 
-    # Get current president
-    current_president = db.session.scalar(
-        db.select(CountryPresident)
-        .where(CountryPresident.country_id == country_id)
-        .where(CountryPresident.is_current == True)
-    )
+    composition = PoliticsReadModelService.get_composition(country_id)
 
-    # Get cabinet ministers
-    ministers = db.session.scalars(
-        db.select(Minister)
-        .where(Minister.country_id == country_id)
-        .where(Minister.is_active == True)
-    ).all()
+    # Get current president
+    current_president = None
+    if composition.president_id:
+        current_president = db.session.scalar(
+            db.select(CountryPresident)
+            .where(CountryPresident.id == composition.president_id)
+            .options(selectinload(CountryPresident.user))
+        )
 
-    # Organize ministers by type
-    cabinet = {
-        'foreign_affairs': None,
-        'defence': None,
-        'finance': None
-    }
-    for minister in ministers:
-        cabinet[minister.ministry_type.value] = minister
+    # Get cabinet ministers, organized by type
+    cabinet = {ministry: None for ministry in composition.minister_ids()}
+    minister_ids = [m for m in composition.minister_ids().values() if m]
+    if minister_ids:
+        for minister in db.session.scalars(
+            db.select(Minister)
+            .where(Minister.id.in_(minister_ids))
+            .options(selectinload(Minister.user))
+        ).all():
+            cabinet[minister.ministry_type.value] = minister
 
     # Get recent laws (last 5 passed or voting)
     recent_laws = db.session.scalars(
         db.select(Law)
         .where(Law.country_id == country_id)
         .where(Law.status.in_([LawStatus.VOTING, LawStatus.PASSED]))
+        .options(selectinload(Law.proposed_by))
         .order_by(Law.created_at.desc())
         .limit(5)
     ).all()
@@ -669,6 +668,7 @@ def president(country_id):
             )
         )
         .where(War.status == WarStatus.ACTIVE)
+        .options(selectinload(War.attacker_country), selectinload(War.defender_country))
     ).all()
 
     # Get next presidential election
@@ -691,6 +691,7 @@ def president(country_id):
         db.select(CountryPresident)
         .where(CountryPresident.country_id == country_id)
         .where(CountryPresident.is_current == False)
+        .options(selectinload(CountryPresident.user))
         .order_by(CountryPresident.term_start.desc())
         .limit(5)
     ).all()
@@ -715,34 +716,31 @@ def congress(country_id):
     if not country:
         abort(404)
 
+    composition = PoliticsReadModelService.get_composition(country_id)
+
     # Get current congress members
     congress_members = db.session.scalars(
         db.select(CongressMember)
         .where(CongressMember.country_id == country_id)
         .where(CongressMember.is_current == True)
+        .options(selectinload(CongressMember.user), selectinload(CongressMember.party))
         .order_by(CongressMember.final_rank)
     ).all()
 
-    # Calculate party distribution
+    # Party distribution (sorted by seat count descending)
+    parties = {m.party_id: m.party for m in congress_members}
     party_distribution = {}
-    total_votes = 0
-    for member in congress_members:
-        party_name = member.party.name
-        if party_name not in party_distribution:
-            party_distribution[party_name] = {'count': 0, 'votes': 0, 'party': member.party}
-        party_distribution[party_name]['count'] += 1
-        party_distribution[party_name]['votes'] += member.votes_received
-        total_votes += member.votes_received
-
-    # Sort by seat count descending
-    party_distribution = dict(sorted(party_distribution.items(), key=lambda x: x[1]['count'], reverse=True))
+    for seats in composition.party_seats:
+        party = parties.get(seats['party_id'])
+        if party is not None:
+            party_distribution[party.name] = {'count': seats['seats'], 'votes': seats['votes'], 'party': party}
+    total_votes = composition.congress_votes
 
     # Check if user is congress member
     is_congress_member = current_user.is_congress_member_of(country_id) if current_user.is_authenticated else False
 
-    # Get term info from first member if exists
-    term_start = congress_members[0].term_start if congress_members else None
-    term_end = congress_members[0].term_end if congress_members else None
+    term_start = composition.congress_term_start
+    term_end = composition.congress_term_end
 
     return render_template('government/congress.html',
                           title=f'Congress of {country.name}',
@@ -883,6 +881,8 @@ def assign_minister():
         is_active=True
     )
     db.session.add(new_minister)
+    db.session.flush()
+    PoliticsReadModelService.on_government_change(country_id)
     db.session.commit()
 
     ministry_names = {
@@ -914,6 +914,7 @@ def resign_minister(minister_id):
 
     # Resign
     minister.resign()
+    PoliticsReadModelService.on_government_change(minister.country_id)
     db.session.commit()
 
     ministry_names = {
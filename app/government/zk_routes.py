@@ -20,6 +20,7 @@ from app.services.merkle_service import (
     merkle_service, get_or_create_tree, add_voter_to_tree, get_merkle_proof
 )
 from app.services.zkverify_service import zkverify_service, verify_vote_proof
+from app.services.groth16_verifier import verify_vote_proof_local
 
 
 zk_bp = Blueprint('zk_voting', __name__, url_prefix='/api/zk')
@@ -340,21 +341,34 @@ def cast_anonymous_vote():
     if candidate_id < 0 or candidate_id > actual_num_candidates:
         return jsonify({'error': 'Invalid candidate ID'}), 400
 
-    # Verify ZK proof on zkVerify blockchain
-    success, tx_hash, block_number, error = verify_vote_proof(
+    # Verify ZK proof in-process (cached verification key, no subprocess)
+    if not verify_vote_proof_local(
         proof=proof,
         merkle_root=merkle_root,
         election_id=election_id,
         candidate_id=candidate_id,
         num_candidates=actual_num_candidates,
         nullifier=nullifier
-    )
+    ):
+        return jsonify({'error': 'Proof verification failed: invalid proof'}), 400
+
+    # Optionally attest the proof on zkVerify blockchain
+    tx_hash, block_number = None, None
+    if current_app.config.get('ZK_VOTE_VERIFIER') == 'zkverify':
+        success, tx_hash, block_number, error = verify_vote_proof(
+            proof=proof,
+            merkle_root=merkle_root,
+            election_id=election_id,
+            candidate_id=candidate_id,
+            num_candidates=actual_num_candidates,
+            nullifier=nullifier
+        )
 
-    if not success:
-        return jsonify({
-            'error': f'Proof verification failed: {error}',
-            'zkverify_error': True
-        }), 400
+        if not success:
+            return jsonify({
+                'error': f'Proof verification failed: {error}',
+                'zkverify_error': True
+            }), 400
 
     # Store anonymous vote
     zk_vote = ZKVote(
@@ -369,11 +383,15 @@ def cast_anonymous_vote():
         proof_data=proof
     )
     db.session.add(zk_vote)
+
+    from app.services.politics_read_model_service import PoliticsReadModelService
+    PoliticsReadModelService.on_zk_vote(election_type, election_id, candidate_id, attested=tx_hash is not None)
+
     db.session.commit()
 
     return jsonify({
         'success': True,
-        'message': 'Vote cast anonymously and verified on zkVerify',
+        'message': 'Vote cast anonymously and verified on zkVerify' if tx_hash else 'Vote cast anonymously and verified',
         'zkverify_tx': tx_hash,
         'zkverify_block': block_number,
         'explorer_url': zkverify_service.get_explorer_url(tx_hash) if tx_hash else None
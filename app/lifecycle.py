@@ -0,0 +1,137 @@
+"""
+Process lifecycle under a preloading Gunicorn master.
+
+Without preload_app every worker - including each one Gunicorn recycles
+after max_requests - runs create_app() from scratch: blueprints (whose
+import of merkle_service computes the Poseidon empty-subtree hashes, one
+Node.js call per tree level), Jinja templates, reference tables, the 2.6 MB
+country GeoJSON and the startup catch-up checks. With preload_app
+(PRELOAD_APP, set by gunicorn.conf.py) the master does all of that once and
+forks workers that share the result copy-on-write.
+
+What may not be shared across fork() is rebuilt per worker:
+
+- Database connections: the master closes its own before forking; each
+  worker discards the inherited pool and opens fresh connections.
+- Web3 clients and their pooled HTTP sessions.
+- Threads: the log pipeline's writer thread, the metrics snapshot writer
+  and the scheduler. The master never starts the scheduler
+  (init_scheduler() refuses to); every worker starts its own after the
+  fork, without repeating the catch-up checks.
+- Metrics: each worker starts counting from zero.
+
+gunicorn.conf.py calls before_fork() in pre_fork and after_fork() in
+post_fork.
+"""
+
+import logging
+import os
+import sys
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+_master_pid = None      # Set in the preloading master; workers see a different pid
+
+
+def is_preloaded_master():
+    """True in a Gunicorn master that has preloaded the app (never in its workers)."""
+    return _master_pid == os.getpid()
+
+
+def _warm(name, load):
+    try:
+        load()
+    except Exception as e:
+        logger.warning(f"Preload: could not load {name}, workers will load it on first use: {e}")
+
+
+def _warm_templates(app):
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
+def _warm_vote_verifier():
+    from app.services.groth16_verifier import get_vote_verifier
+    get_vote_verifier()
+
+
+def _warm_country_geodata():
+    from app.services.country_geodata import country_geodata
+    country_geodata.load()
+
+
+def _warm_reference_data():
+    from app.services.reference_data import reference_data
+    reference_data.snapshot()
+
+
+def _warm_world_graph():
+    from app.services.world_graph import get_world_graph
+    get_world_graph()
+
+
+def prepare_preloaded_master(app):
+    """
+    Load shared state once in the master and leave nothing fork-unsafe behind.
+
+    Called at the end of create_app() when PRELOAD_APP is set.
+    """
+    global _master_pid
+    _master_pid = os.getpid()
+
+    _warm('templates', lambda: _warm_templates(app))
+    _warm('country geodata', _warm_country_geodata)
+    _warm('vote verifying key', _warm_vote_verifier)
+
+    with app.app_context():
+        _warm('reference data', _warm_reference_data)
+        _warm('world graph', _warm_world_graph)
+
+        from app.scheduler import run_startup_checks
+        run_startup_checks(app)
+
+        # Forked children must not inherit open connections
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+    logger.info(f"Preloaded app in master {_master_pid}")
+
+
+def before_fork():
+    """Runs in the master before each fork."""
+    from app.logging_config import get_log_pipeline
+
+    # Write out what the master has queued; a child would inherit the
+    # queue but not the thread that drains it
+    pipeline = get_log_pipeline()
+    if pipeline is not None:
+        pipeline.stop()
+
+
+def after_fork(app):
+    """Runs in each new worker: fresh connections, sessions and threads."""
+    with app.app_context():
+        # close=False: the pooled connections still belong to the master
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+    if 'app.blockchain.web3_config' in sys.modules:
+        from app.blockchain.web3_config import reset_clients
+        reset_clients()
+
+    from app.logging_config import get_log_pipeline
+    pipeline = get_log_pipeline()
+    if pipeline is not None:
+        pipeline.after_fork()
+
+    from app.metrics import after_fork as metrics_after_fork
+    metrics_after_fork(app)
+
+    if app.config.get('SCHEDULER_ENABLED', True):
+        from app.scheduler import init_scheduler
+        init_scheduler(app, catch_up=False)
+
+    logger.info(f"Worker {os.getpid()} ready")
@@ -0,0 +1,214 @@
+"""
+Log Pipeline - Non-blocking application, transaction and security logging.
+
+Log records used to be written by the thread that produced them: every
+log_transaction() in the money path appended to (and flushed)
+transactions.log, and every log_security_event() committed a security_logs
+row before the request could continue. With the pipeline enabled the
+loggers only put records on one bounded queue, and a background writer
+thread drains it in batches:
+
+- file handlers write a whole batch and flush once,
+- security events are inserted into security_logs with one executemany.
+
+When the queue is full records are dropped instead of blocking the request.
+Drops are counted per route and reported in app.log by the writer. The
+queue is drained when the process exits (atexit) or stop() is called.
+
+The writer thread does not survive fork(): a preloading Gunicorn master
+stops its pipeline before forking and each worker calls after_fork().
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from collections import Counter, defaultdict
+from logging.handlers import QueueHandler, RotatingFileHandler, TimedRotatingFileHandler
+
+_STOP = object()
+
+
+class BatchFlushMixin:
+    """Handler mixin: write a batch of records, then flush once."""
+
+    _batching = False
+
+    def handle_batch(self, records):
+        self._batching = True
+        try:
+            for record in records:
+                if record.levelno >= self.level:
+                    self.handle(record)
+        finally:
+            self._batching = False
+            self.flush()
+
+    def flush(self):
+        if not self._batching:
+            super().flush()
+
+
+class BatchRotatingFileHandler(BatchFlushMixin, RotatingFileHandler):
+    pass
+
+
+class BatchTimedRotatingFileHandler(BatchFlushMixin, TimedRotatingFileHandler):
+    pass
+
+
+class SecurityLogHandler(logging.Handler):
+    """Inserts security events (records carrying a `security_event` row) into security_logs."""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def emit(self, record):
+        self.handle_batch([record])
+
+    def handle_batch(self, records):
+        from app.extensions import db
+        from app.models.security_log import SecurityLog
+
+        rows = [record.security_event for record in records if hasattr(record, 'security_event')]
+        if not rows:
+            return
+        try:
+            with self.app.app_context():
+                with db.engine.begin() as conn:
+                    conn.execute(SecurityLog.__table__.insert(), rows)
+        except Exception as e:
+            self.app.logger.error(f"Failed to write {len(rows)} security events to database: {e}", exc_info=True)
+
+
+class PipelineQueueHandler(QueueHandler):
+    """QueueHandler that tags records with their route and never blocks."""
+
+    def __init__(self, pipeline, route):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+        self.route = route
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.pipeline_route = self.route
+        return record
+
+    def enqueue(self, record):
+        try:
+            # The pipeline's current queue: after_fork() replaces it
+            self.pipeline.queue.put_nowait(record)
+        except queue.Full:
+            self.pipeline.record_dropped(self.route)
+
+
+class LogPipeline:
+    """A bounded record queue and the writer thread that drains it."""
+
+    def __init__(self, queue_size=10000, batch_size=500):
+        self.queue = queue.Queue(queue_size)
+        self.batch_size = batch_size
+        self.routes = {}           # route -> handlers
+        self.written = 0
+        self.dropped = Counter()   # route -> records dropped
+        self._reported = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add_route(self, route, handlers):
+        """Register the handlers for `route`; returns the QueueHandler to attach to its logger."""
+        self.routes[route] = list(handlers)
+        return PipelineQueueHandler(self, route)
+
+    def record_dropped(self, route):
+        with self._lock:
+            self.dropped[route] += 1
+
+    def stats(self):
+        with self._lock:
+            dropped = dict(self.dropped)
+        return {'queued': self.queue.qsize(), 'written': self.written, 'dropped': dropped}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def after_fork(self):
+        """
+        Start a fresh queue and writer thread in a forked child.
+
+        Records still queued were the parent's to write, and the parent's
+        thread (and any lock it held) did not come along.
+        """
+        self.queue = queue.Queue(self.queue.maxsize)
+        self.written = 0
+        self.dropped = Counter()
+        self._reported = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self.start()
+
+    def stop(self, timeout=5):
+        """Write everything still queued, then stop the writer thread."""
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        self._report_drops()
+        for handlers in self.routes.values():
+            for handler in handlers:
+                handler.flush()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = _STOP in batch
+            records = [record for record in batch if record is not _STOP]
+            self._write(records)
+            self.written += len(records)
+            self._report_drops()
+            if stopping:
+                return
+
+    def _write(self, records):
+        by_route = defaultdict(list)
+        for record in records:
+            by_route[record.pipeline_route].append(record)
+
+        for route, route_records in by_route.items():
+            for handler in self.routes.get(route, ()):
+                try:
+                    if hasattr(handler, 'handle_batch'):
+                        handler.handle_batch(route_records)
+                    else:
+                        for record in route_records:
+                            if record.levelno >= handler.level:
+                                handler.handle(record)
+                except Exception:
+                    handler.handleError(route_records[0])
+
+    def _report_drops(self):
+        with self._lock:
+            total = sum(self.dropped.values())
+            if total == self._reported:
+                return
+            since_last, self._reported = total - self._reported, total
+            by_route = ', '.join(f'{route}={count}' for route, count in sorted(self.dropped.items()))
+
+        record = logging.LogRecord(
+            'app.log_pipeline', logging.WARNING, __file__, 0,
+            f"Log queue full: dropped {since_last} records (total by route: {by_route})", None, None
+        )
+        record.pipeline_route = 'app'
+        self._write([record])
@@ -2,9 +2,14 @@
 
 import os
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from datetime import datetime
 
+from app.log_pipeline import (
+    BatchRotatingFileHandler, BatchTimedRotatingFileHandler, LogPipeline, SecurityLogHandler
+)
+
+_pipeline = None
+
 
 class LogConfig:
     LOG_DIR = 'logs'
@@ -36,24 +41,28 @@ class LogConfig:
 
 
 def setup_logging(app):
+    global _pipeline
+
     env = app.config.get('ENV', 'development')
     log_level = LogConfig.get_log_level(env)
 
-    log_dir = os.path.join(app.root_path, '..', LogConfig.LOG_DIR)
+    log_dir = app.config.get('LOG_DIR') or os.path.join(app.root_path, '..', LogConfig.LOG_DIR)
     os.makedirs(log_dir, exist_ok=True)
 
     app.logger.handlers.clear()
     app.logger.setLevel(log_level)
 
+    app_handlers = []
+
     if env == 'development':
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.DEBUG)
         console_formatter = logging.Formatter(LogConfig.SIMPLE_FORMAT)
         console_handler.setFormatter(console_formatter)
-        app.logger.addHandler(console_handler)
+        app_handlers.append(console_handler)
 
     app_log_path = os.path.join(log_dir, LogConfig.APP_LOG_FILE)
-    app_handler = RotatingFileHandler(
+    app_handler = BatchRotatingFileHandler(
         app_log_path,
         maxBytes=LogConfig.MAX_BYTES,
         backupCount=LogConfig.BACKUP_COUNT
@@ -61,10 +70,10 @@ def setup_logging(app):
     app_handler.setLevel(log_level)
     app_formatter = logging.Formatter(LogConfig.DETAILED_FORMAT)
     app_handler.setFormatter(app_formatter)
-    app.logger.addHandler(app_handler)
+    app_handlers.append(app_handler)
 
     error_log_path = os.path.join(log_dir, LogConfig.ERROR_LOG_FILE)
-    error_handler = RotatingFileHandler(
+    error_handler = BatchRotatingFileHandler(
         error_log_path,
         maxBytes=LogConfig.MAX_BYTES,
         backupCount=LogConfig.BACKUP_COUNT
@@ -72,10 +81,10 @@ def setup_logging(app):
     error_handler.setLevel(logging.ERROR)
     error_formatter = logging.Formatter(LogConfig.DETAILED_FORMAT)
     error_handler.setFormatter(error_formatter)
-    app.logger.addHandler(error_handler)
+    app_handlers.append(error_handler)
 
     transaction_log_path = os.path.join(log_dir, LogConfig.TRANSACTION_LOG_FILE)
-    transaction_handler = TimedRotatingFileHandler(
+    transaction_handler = BatchTimedRotatingFileHandler(
         transaction_log_path,
         when='midnight',
         interval=1,
@@ -88,11 +97,10 @@ def setup_logging(app):
     transaction_logger = logging.getLogger('transactions')
     transaction_logger.setLevel(logging.INFO)
     transaction_logger.handlers.clear()
-    transaction_logger.addHandler(transaction_handler)
     transaction_logger.propagate = False
 
     security_log_path = os.path.join(log_dir, LogConfig.SECURITY_LOG_FILE)
-    security_handler = TimedRotatingFileHandler(
+    security_handler = BatchTimedRotatingFileHandler(
         security_log_path,
         when='midnight',
         interval=1,
@@ -105,17 +113,51 @@ def setup_logging(app):
     security_logger = logging.getLogger('security')
     security_logger.setLevel(logging.WARNING)
     security_logger.handlers.clear()
-    security_logger.addHandler(security_handler)
     security_logger.propagate = False
 
+    # Security events bound for the security_logs table (see log_security_event)
+    security_db_logger = get_security_db_logger()
+    security_db_logger.setLevel(logging.DEBUG)
+    security_db_logger.handlers.clear()
+    security_db_logger.propagate = False
+
+    # Only one pipeline per process: the loggers above are process-wide
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
+
+    if app.config.get('LOG_PIPELINE_ENABLED', False):
+        _pipeline = LogPipeline(
+            queue_size=app.config.get('LOG_QUEUE_SIZE', 10000),
+            batch_size=app.config.get('LOG_BATCH_SIZE', 500)
+        )
+        app.logger.addHandler(_pipeline.add_route('app', app_handlers))
+        transaction_logger.addHandler(_pipeline.add_route('transactions', [transaction_handler]))
+        security_logger.addHandler(_pipeline.add_route('security', [security_handler]))
+        security_db_logger.addHandler(_pipeline.add_route('security_db', [SecurityLogHandler(app)]))
+        _pipeline.start()
+        app.extensions['log_pipeline'] = _pipeline
+    else:
+        # Synchronous: log_security_event writes through the request's session
+        for handler in app_handlers:
+            app.logger.addHandler(handler)
+        transaction_logger.addHandler(transaction_handler)
+        security_logger.addHandler(security_handler)
+
     app.logger.info(f'=' * 80)
     app.logger.info(f'Tactizen Application Starting')
     app.logger.info(f'Environment: {env}')
     app.logger.info(f'Log Level: {logging.getLevelName(log_level)}')
     app.logger.info(f'Log Directory: {log_dir}')
+    app.logger.info(f'Log Pipeline: {"queued" if _pipeline is not None else "synchronous"}')
     app.logger.info(f'=' * 80)
 
 
+def get_log_pipeline():
+    """The running LogPipeline, or None when logging is synchronous."""
+    return _pipeline
+
+
 def get_transaction_logger():
     return logging.getLogger('transactions')
 
@@ -124,6 +166,10 @@ def get_security_logger():
     return logging.getLogger('security')
 
 
+def get_security_db_logger():
+    return logging.getLogger('security_db')
+
+
 def log_transaction(user_id, transaction_type, amount, currency, description='', **kwargs):
     logger = get_transaction_logger()
 
@@ -3,6 +3,7 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import login_required, current_user
 from sqlalchemy import select, func, or_, and_
+from sqlalchemy.orm import contains_eager
 from datetime import datetime, date, timedelta
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN, ROUND_UP
 
@@ -16,6 +17,7 @@ from app.models import (
 )
 from app.constants import GameConstants
 from app.security import InputSanitizer
+from app.pagination import keyset_paginate, InvalidCursor
 
 company_bp = Blueprint('company', __name__, url_prefix='/company')
 
@@ -394,6 +396,9 @@ def create_company():
         db.session.add(company)
         db.session.flush()  # Get company ID
 
+        from app.services.country_stats_service import CountryStatsService
+        CountryStatsService.on_company_opened(company.country_id)
+
         # Create export license for home country (included in creation cost)
         home_license = ExportLicense(
             company_id=company.id,
@@ -716,35 +721,15 @@ def work(company_id):
 
 # ==================== Job Market ====================
 
-@company_bp.route('/job-market')
-@login_required
-def job_market():
-    """Browse all available job offers."""
-    # Get player's current country from their region
-    player_country_id = None
-    player_country = None
-    if current_user.current_region:
-        player_country_id = current_user.current_region.original_owner_id
-        player_country = db.session.get(Country, player_country_id)
+JOB_MARKET_PAGE_SIZE = 25
 
-    # If player has no region set, they can't see any jobs
-    if not player_country_id or not player_country:
-        flash('You must be located in a region to view job offers.', 'warning')
-        # Default to citizenship country for navigation links
-        default_country = current_user.citizenship if current_user.citizenship else None
-        return render_template('company/job_market.html',
-                             job_offers=[],
-                             user_employments=set(),
-                             company_types=CompanyType,
-                             countries=[],
-                             country=default_country)
 
-    # Get filters
+def _job_market_query(player_country_id):
+    """Active job offers in the player's current country, with the request's filters applied."""
     company_type_filter = request.args.get('company_type')
     min_wage = request.args.get('min_wage', type=float)
     max_skill = request.args.get('max_skill', type=int)
     quality_filter = request.args.get('quality', type=int)
-    country_id = request.args.get('country_id', type=int)
 
     # Base query - MUST filter by player's current country
     query = select(JobOffer).join(Company).filter(
@@ -781,22 +766,84 @@ def job_market():
 
     # Country filter is now ignored since we only show jobs from player's country
 
-    job_offers = db.session.scalars(query).all()
+    return query
+
+
+def _job_market_page(player_country_id, cursor=None):
+    """One page of job offers, best paid first."""
+    query = _job_market_query(player_country_id).options(
+        contains_eager(JobOffer.company).joinedload(Company.country)
+    )
+    return keyset_paginate(query, JobOffer.wage_per_pp, JobOffer.id,
+                           cursor=cursor, limit=JOB_MARKET_PAGE_SIZE)
+
+
+@company_bp.route('/job-market')
+@login_required
+def job_market():
+    """Browse all available job offers."""
+    # Get player's current country from their region
+    player_country_id = None
+    player_country = None
+    if current_user.current_region:
+        player_country_id = current_user.current_region.original_owner_id
+        player_country = db.session.get(Country, player_country_id)
+
+    # If player has no region set, they can't see any jobs
+    if not player_country_id or not player_country:
+        flash('You must be located in a region to view job offers.', 'warning')
+        # Default to citizenship country for navigation links
+        default_country = current_user.citizenship if current_user.citizenship else None
+        return render_template('company/job_market.html',
+                             job_offers=[],
+                             total_offers=0,
+                             next_cursor=None,
+                             user_employments=set(),
+                             company_types=CompanyType,
+                             countries=[],
+                             country=default_country)
+
+    # First page; the rest load on scroll from job_market_page
+    page = _job_market_page(player_country_id)
+    total_offers = db.session.scalar(
+        select(func.count()).select_from(_job_market_query(player_country_id).subquery())
+    )
 
     # Get current user's employments
     user_employments = set(e.company_id for e in current_user.employments.all())
 
-    # Get countries for filter
-    countries = db.session.scalars(select(Country).order_by(Country.name)).all()
+    # Only the player's current country is searchable, so it is the only country offered
+    countries = [player_country]
 
     return render_template('company/job_market.html',
-                         job_offers=job_offers,
+                         job_offers=page.items,
+                         total_offers=total_offers,
+                         next_cursor=page.next_cursor,
                          user_employments=user_employments,
                          company_types=CompanyType,
                          countries=countries,
                          country=player_country)
 
 
+@company_bp.route('/job-market/page')
+@login_required
+def job_market_page():
+    """Next page of job offers after the given cursor, as rendered table rows."""
+    if not current_user.current_region:
+        return jsonify({'html': '', 'next_cursor': None})
+
+    try:
+        page = _job_market_page(current_user.current_region.original_owner_id, request.args.get('cursor'))
+    except InvalidCursor:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    user_employments = set(e.company_id for e in current_user.employments.all())
+    return jsonify({
+        'html': render_template('company/_job_rows.html', job_offers=page.items, user_employments=user_employments),
+        'next_cursor': page.next_cursor
+    })
+
+
 @company_bp.route('/<int:company_id>/post-job', methods=['POST'])
 @login_required
 @limiter.limit(lambda: current_app.config.get("RATELIMIT_COMPANY_ACTION", "50 per hour"))
@@ -1886,6 +1933,9 @@ def dissolve_company(id):
     company.is_deleted = True
     company.deleted_at = datetime.utcnow()
 
+    from app.services.country_stats_service import CountryStatsService
+    CountryStatsService.on_company_closed(company.country_id)
+
     db.session.commit()
 
     flash(f'Company "{company.name}" has been dissolved. You received {refund_amount} Gold as a refund. {employees_count} employees were fired, {job_offers_count} job offers were cancelled, {inventory_count} inventory items were lost, and {company_currency} {company.country.currency_name} was lost.', 'success')
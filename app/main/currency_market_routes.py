@@ -147,51 +147,25 @@ def currency_market_buy_gold(slug):
             # Convert to Decimal for precision
             gold_to_buy_decimal = Decimal(str(gold_to_buy))
 
-            # Calculate multi-level buy (can buy across multiple price levels)
-            total_local_currency_cost = Decimal('0')
-            remaining_to_buy = gold_to_buy
-            current_progress = int(gold_market_item.progress_within_level)
-            current_level = int(gold_market_item.price_level)
-            volume_per_level = int(gold_market_item.volume_per_level)
-
-            while remaining_to_buy > 0:
-                # Calculate buy price at this level
-                base_rate = Decimal(gold_market_item.initial_exchange_rate) + (Decimal(current_level) * Decimal(gold_market_item.price_adjustment_per_level))
-                base_rate = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT, base_rate)
-                spread_amount = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT / 10,
-                                   (base_rate * gold_market_item.MARKET_SPREAD_PERCENT)).quantize(
-                    gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT / 10, rounding=ROUND_UP
-                )
-                rate_at_level = (base_rate + spread_amount).quantize(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT, rounding=ROUND_HALF_UP)
-                rate_at_level = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT * 2, rate_at_level)
-
-                # How much can we buy at this level before it increases?
-                can_buy_at_level = volume_per_level - current_progress
-
-                if remaining_to_buy <= can_buy_at_level:
-                    # Can complete the purchase at this level
-                    total_local_currency_cost += rate_at_level * Decimal(str(remaining_to_buy))
-                    current_progress += remaining_to_buy
-                    remaining_to_buy = 0
-                else:
-                    # Buy what we can at this level and move to higher level
-                    total_local_currency_cost += rate_at_level * Decimal(str(can_buy_at_level))
-                    remaining_to_buy -= can_buy_at_level
-                    current_level += 1
-                    current_progress = 0
-
-            # Get user's currency balance for THIS country
-            user_local_currency = current_user.get_currency_amount(country.id)
-
-            if user_local_currency < total_local_currency_cost:
-                message = f"Insufficient {country.currency_code}. Need {format_currency(total_local_currency_cost)}, have {format_currency(user_local_currency)}."
+            # Lock the balance the purchase is paid from, then fill it against
+            # the locked market row (multi-level pricing)
+            from app.services.currency_service import CurrencyService
+            from app.services.market_fills import fill_trade, GoldBook, Trade, INSUFFICIENT_FUNDS
+            user_local_currency = CurrencyService.lock_amount(current_user, country.id)
+            trade = fill_trade(GoldBook(country.id), Trade(True, gold_to_buy, budget=user_local_currency))
+
+            if trade.rejected == INSUFFICIENT_FUNDS:
+                message = f"Insufficient {country.currency_code}. Need {format_currency(trade.fill.total)}, have {format_currency(user_local_currency)}."
+            elif trade.rejected:
+                message = "Market not found."
             else:
-                # Remove local currency (with row locking)
+                total_local_currency_cost = trade.fill.total
+
+                # Remove local currency (row already locked)
                 if not current_user.remove_currency(country.id, total_local_currency_cost):
                     message = f"Transaction failed: insufficient {country.currency_code}."
                 else:
                     # Add gold with row-level locking
-                    from app.services.currency_service import CurrencyService
                     success, gold_msg, _ = CurrencyService.add_gold(
                         current_user.id, gold_to_buy_decimal, 'Currency market gold purchase'
                     )
@@ -201,12 +175,8 @@ def currency_market_buy_gold(slug):
                         message = f"Transaction failed: {gold_msg}"
                         return redirect(url_for('main.currency_market', country_slug=slug, message=message))
 
-                    # Update market state
-                    gold_market_item.price_level = current_level
-                    gold_market_item.progress_within_level = current_progress
-
-                    # Calculate average rate for logging
-                    avg_rate = total_local_currency_cost / gold_to_buy_decimal
+                    # Average rate for logging
+                    avg_rate = trade.fill.rate
 
                     # Log transaction
                     log_transaction(
@@ -260,43 +230,20 @@ def currency_market_sell_gold(slug):
             if current_user.gold < gold_to_sell_decimal:
                 message = f"Insufficient Gold. You have {format_currency(current_user.gold)} Gold."
             else:
-                # Calculate multi-level sell (can sell across multiple price levels)
-                total_local_currency_received = Decimal('0')
-                remaining_to_sell = gold_to_sell
-                current_progress = int(gold_market_item.progress_within_level)
-                current_level = int(gold_market_item.price_level)
-                volume_per_level = int(gold_market_item.volume_per_level)
-
-                # Track weighted average rate for logging
-                while remaining_to_sell > 0:
-                    # Get current sell price at this level
-                    # Temporarily calculate rate based on current level
-                    base_rate = Decimal(gold_market_item.initial_exchange_rate) + (Decimal(current_level) * Decimal(gold_market_item.price_adjustment_per_level))
-                    base_rate = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT, base_rate)
-                    spread_amount = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT / 10,
-                                       (base_rate * gold_market_item.MARKET_SPREAD_PERCENT)).quantize(
-                        gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT / 10, rounding=ROUND_DOWN
-                    )
-                    rate_at_level = (base_rate - spread_amount).quantize(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT, rounding=ROUND_HALF_UP)
-                    rate_at_level = max(gold_market_item.MINIMUM_EXCHANGE_RATE_UNIT, rate_at_level)
-
-                    # How much can we sell at this level? (progress goes down when selling)
-                    can_sell_at_level = current_progress + 1  # +1 because we can sell down to 0 progress
-
-                    if remaining_to_sell <= can_sell_at_level:
-                        # Can complete the sale at this level
-                        total_local_currency_received += rate_at_level * Decimal(str(remaining_to_sell))
-                        current_progress -= remaining_to_sell
-                        remaining_to_sell = 0
-                    else:
-                        # Sell what we can at this level and move to lower level
-                        total_local_currency_received += rate_at_level * Decimal(str(can_sell_at_level))
-                        remaining_to_sell -= can_sell_at_level
-                        current_level -= 1
-                        current_progress = volume_per_level - 1  # Start at top of previous level
-
-                # Deduct gold with row-level locking
+                # Lock the gold being sold, then fill the sale against the
+                # locked market row (multi-level pricing)
                 from app.services.currency_service import CurrencyService
+                from app.services.market_fills import fill_trade, GoldBook, Trade
+                if CurrencyService.lock_gold(current_user.id) < gold_to_sell_decimal:
+                    message = f"Insufficient Gold. You have {format_currency(current_user.gold)} Gold."
+                    return redirect(url_for('main.currency_market', country_slug=slug, message=message))
+                trade = fill_trade(GoldBook(country.id), Trade(False, gold_to_sell))
+                if trade.rejected:
+                    message = "Market not found."
+                    return redirect(url_for('main.currency_market', country_slug=slug, message=message))
+                total_local_currency_received = trade.fill.total
+
+                # Deduct gold (row already locked)
                 success, gold_msg, _ = CurrencyService.deduct_gold(
                     current_user.id, gold_to_sell_decimal, 'Currency market gold sale'
                 )
@@ -307,12 +254,8 @@ def currency_market_sell_gold(slug):
                 # Add local currency
                 current_user.add_currency(country.id, total_local_currency_received)
 
-                # Update market state
-                gold_market_item.price_level = current_level
-                gold_market_item.progress_within_level = max(0, current_progress)
-
-                # Calculate average rate for logging
-                avg_rate = total_local_currency_received / gold_to_sell_decimal
+                # Average rate for logging
+                avg_rate = trade.fill.rate
 
                 # Log transaction
                 log_transaction(
@@ -15,6 +15,8 @@ from app.models import (
     GovernmentElectionStatus, CandidateStatus
 )
 from app.utils import get_level_from_xp # Import utility
+from app.services.country_stats_service import CountryStatsService
+from app.services.world_graph import get_world_graph
 
 # --- Country Page Route ---
 @bp.route('/country/<slug>')
@@ -22,63 +24,28 @@ def country(slug):
     country = db.session.scalar(db.select(Country).where(Country.slug == slug, Country.is_deleted == False))
     if country is None: abort(404)
 
+    # --- Country statistics (materialized in country_stats, one row lookup) ---
+    # Read first: materializing a missing row commits, which would expire
+    # everything loaded before it
+    stats = CountryStatsService.get_stats(country.id)
+
     # Use eager loading for regions if performance becomes an issue
     # current_regions = country.current_regions.options(joinedload(...)).order_by(Region.name).all()
     current_regions = country.current_regions.filter_by(is_deleted=False).order_by(Region.name).all()
 
-    # --- Fetch country statistics (expensive queries, cached at route level) ---
-    current_app.logger.debug(f"Cache MISS: Fetching country statistics for {slug}")
-
-    # Calculate total population by counting all residents in all regions owned by the country
-    region_ids = [region.id for region in current_regions]
-    population = 0
-    if region_ids:
-        population = db.session.scalar(
-            select(func.count(User.id)).where(
-                User.current_region_id.in_(region_ids),
-                User.is_deleted == False
-            )
-        ) or 0
-
     # Set the population on the country object for template access
-    country.population = population
-
-    # Count active citizens (those with citizenship set to this country)
-    active_citizens_count = db.session.scalar(
-        select(func.count(User.id)).where(User.citizenship_id == country.id, User.is_deleted == False)
-    ) or 0
-
-    # Count total world citizens (can filter by status later if needed)
-    world_citizens_count = db.session.scalar(
-        select(func.count(User.id)).where(User.is_deleted == False) # Add .where(User.activate == True) if needed
-    ) or 0
+    country.population = stats.population
 
-    # Count new citizens who joined today (registered today with this citizenship)
-    from datetime import timedelta
-    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    new_citizens_today = db.session.scalar(
-        select(func.count(User.id)).where(
-            User.citizenship_id == country.id,
-            User.is_deleted == False,
-            User.created_at >= today_start
-        )
-    ) or 0
+    active_citizens_count = stats.citizen_count
+    world_citizens_count = CountryStatsService.get_world_citizen_count()
+    new_citizens_today = stats.new_citizens_on(datetime.utcnow().date())
 
     # Calculate average citizen level
-    avg_xp_query = db.session.scalar(
-        select(func.avg(User.experience)).where(User.citizenship_id == country.id, User.is_deleted == False)
-    )
-    avg_level = get_level_from_xp(avg_xp_query) if avg_xp_query is not None else 1
-
-    # Count online citizens (active in last 5 minutes)
-    five_minutes_ago = datetime.utcnow() - timedelta(minutes=5)
-    online_now_count = db.session.scalar(
-        select(func.count(User.id)).where(
-            User.citizenship_id == country.id,
-            User.is_deleted == False,
-            User.last_seen >= five_minutes_ago
-        )
-    ) or 0
+    avg_xp = stats.average_experience
+    avg_level = get_level_from_xp(avg_xp) if avg_xp is not None else 1
+
+    # Count online citizens (active in last 5 minutes, briefly cached)
+    online_now_count = CountryStatsService.get_online_count(country.id)
 
     # Fetch current and upcoming government elections
     active_elections = db.session.scalars(
@@ -111,26 +78,18 @@ def country(slug):
         .where(CongressMember.is_current == True)
     ) or 0
 
-    # Get current ministers
+    # Get current ministers (one query for all three ministries)
     from app.models import Minister, MinistryType
-    minister_foreign_affairs = db.session.scalar(
-        db.select(Minister)
-        .where(Minister.country_id == country.id)
-        .where(Minister.ministry_type == MinistryType.FOREIGN_AFFAIRS)
-        .where(Minister.is_active == True)
-    )
-    minister_defence = db.session.scalar(
-        db.select(Minister)
-        .where(Minister.country_id == country.id)
-        .where(Minister.ministry_type == MinistryType.DEFENCE)
-        .where(Minister.is_active == True)
-    )
-    minister_finance = db.session.scalar(
-        db.select(Minister)
-        .where(Minister.country_id == country.id)
-        .where(Minister.ministry_type == MinistryType.FINANCE)
-        .where(Minister.is_active == True)
-    )
+    ministers = {
+        minister.ministry_type: minister for minister in db.session.scalars(
+            db.select(Minister)
+            .where(Minister.country_id == country.id)
+            .where(Minister.is_active == True)
+        ).all()
+    }
+    minister_foreign_affairs = ministers.get(MinistryType.FOREIGN_AFFAIRS)
+    minister_defence = ministers.get(MinistryType.DEFENCE)
+    minister_finance = ministers.get(MinistryType.FINANCE)
 
     # Get active wars (where this country is involved)
     from app.models import War, WarStatus
@@ -212,12 +171,11 @@ def region(slug):
         select(func.count(User.id)).where(User.current_region_id == region.id, User.is_deleted == False)
     ) or 0
 
-    # Get neighboring regions (both directions of the relationship)
-    neighbors_list = region.neighbors.filter_by(is_deleted=False).all()
-    neighbor_of_list = region.neighbor_of.filter_by(is_deleted=False).all()
-    # Combine and deduplicate, then sort by name
-    all_neighbors = {r.id: r for r in neighbors_list + neighbor_of_list}
-    neighbors = sorted(all_neighbors.values(), key=lambda r: r.name)
+    # Get neighboring regions (both directions, from the in-memory world graph)
+    neighbor_ids = get_world_graph().neighbors_of(region.id)
+    neighbors = db.session.scalars(
+        db.select(Region).where(Region.id.in_(neighbor_ids)).order_by(Region.name)
+    ).all() if neighbor_ids else []
 
     # Count visitors (users in region who are NOT citizens of the owning country)
     if owner_country:
@@ -325,10 +283,12 @@ def api_regions(country_id):
     if country.is_deleted:
         return jsonify({'error': 'Country not found'}), 404
     try:
-        # Select regions currently owned by the country
-        # The relationship `country.current_regions` handles the join via `country_regions` table
-        regions = country.current_regions.filter_by(is_deleted=False).order_by(Region.name).all()
-        region_list = [{'id': region.id, 'name': region.name} for region in regions]
+        # Regions currently owned by the country, from the in-memory world graph
+        graph = get_world_graph()
+        region_list = sorted(
+            ({'id': region_id, 'name': graph.names[region_id]} for region_id in graph.regions_of(country_id)),
+            key=lambda r: r['name']
+        )
         return jsonify({'regions': region_list})
     except Exception as e:
         # Log the error for debugging
@@ -9,6 +9,26 @@ from app.models import User, Message, Alert, BlockedUser
 from sqlalchemy import or_, and_, select, func
 from datetime import datetime
 from app.security import InputSanitizer
+from app.services.username_index import search_usernames
+from app.pagination import keyset_paginate, InvalidCursor
+
+ALERTS_PAGE_SIZE = 30
+THREAD_PAGE_SIZE = 50
+
+
+def _alerts_query():
+    """Current user's non-deleted alerts (paged newest first by created_at, id)."""
+    return select(Alert).where(Alert.user_id == current_user.id, Alert.is_deleted == False)
+
+
+def _thread_query(partner_id):
+    """Messages between the current user and partner_id that the current user has not deleted."""
+    return select(Message).where(
+        or_(
+            and_(Message.sender_id == current_user.id, Message.recipient_id == partner_id, Message.sender_deleted == False),
+            and_(Message.sender_id == partner_id, Message.recipient_id == current_user.id, Message.recipient_deleted == False)
+        )
+    )
 
 
 # --- Main Messages Page (with tabs) ---
@@ -19,17 +39,14 @@ def messages():
     tab = request.args.get('tab', 'messages')  # Default to messages tab
 
     if tab == 'alerts':
-        # Get all non-deleted alerts for user, ordered by most recent
-        alerts = db.session.scalars(
-            select(Alert)
-            .where(Alert.user_id == current_user.id, Alert.is_deleted == False)
-            .order_by(Alert.created_at.desc())
-        ).all()
+        # First page of non-deleted alerts, most recent first; the rest load on scroll
+        page = keyset_paginate(_alerts_query(), Alert.created_at, Alert.id, limit=ALERTS_PAGE_SIZE)
 
         return render_template('messages.html',
                              title='Alerts',
                              tab='alerts',
-                             alerts=alerts)
+                             alerts=page.items,
+                             next_cursor=page.next_cursor)
     else:
         # Get message threads (group by conversation partner)
         # Find all unique conversation partners
@@ -110,17 +127,9 @@ def message_thread(user_id):
         flash("User not found.", "danger")
         return redirect(url_for('main.messages'))
 
-    # Get all messages between these two users
-    messages_list = db.session.scalars(
-        select(Message)
-        .where(
-            or_(
-                and_(Message.sender_id == current_user.id, Message.recipient_id == user_id, Message.sender_deleted == False),
-                and_(Message.sender_id == user_id, Message.recipient_id == current_user.id, Message.recipient_deleted == False)
-            )
-        )
-        .order_by(Message.created_at.asc())
-    ).all()
+    # Latest page of the conversation, shown oldest first; older messages load on scroll
+    page = keyset_paginate(_thread_query(user_id), Message.created_at, Message.id, limit=THREAD_PAGE_SIZE)
+    messages_list = list(reversed(page.items))
 
     # Mark all messages from partner as read
     unread_messages = db.session.scalars(
@@ -144,7 +153,24 @@ def message_thread(user_id):
     return render_template('message_thread.html',
                          title=f'Messages with {partner.username}',
                          partner=partner,
-                         messages=messages_list)
+                         messages=messages_list,
+                         next_cursor=page.next_cursor)
+
+
+@bp.route('/messages/thread/<int:user_id>/older')
+@login_required
+def older_messages(user_id):
+    """Next page of older messages in a thread (infinite scroll)."""
+    try:
+        page = keyset_paginate(_thread_query(user_id), Message.created_at, Message.id,
+                               cursor=request.args.get('cursor'), limit=THREAD_PAGE_SIZE)
+    except InvalidCursor:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    return jsonify({
+        'html': render_template('_message_items.html', messages=list(reversed(page.items))),
+        'next_cursor': page.next_cursor
+    })
 
 
 # --- Send Message ---
@@ -356,6 +382,23 @@ def delete_message_thread(partner_id):
     return redirect(url_for('main.messages'))
 
 
+# --- Alerts Page (infinite scroll) ---
+@bp.route('/alerts/page')
+@login_required
+def alerts_page():
+    """Next page of alerts after the given cursor, as rendered cards."""
+    try:
+        page = keyset_paginate(_alerts_query(), Alert.created_at, Alert.id,
+                               cursor=request.args.get('cursor'), limit=ALERTS_PAGE_SIZE)
+    except InvalidCursor:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    return jsonify({
+        'html': render_template('_alert_cards.html', alerts=page.items),
+        'next_cursor': page.next_cursor
+    })
+
+
 # --- Mark Alert as Read ---
 @bp.route('/alerts/mark-read/<int:alert_id>', methods=['POST'])
 @login_required
@@ -540,16 +583,8 @@ def search_users():
     if not query or len(query) < 2:
         return jsonify([])
 
-    # Search for users whose username starts with the query (case-insensitive)
-    users = db.session.scalars(
-        select(User)
-        .where(
-            User.username.ilike(f'{query}%'),
-            User.is_deleted == False,
-            User.id != current_user.id  # Exclude current user
-        )
-        .limit(10)
-    ).all()
+    # Prefix match against the in-memory username index (excluding current user)
+    users = search_usernames(query, limit=10, exclude_id=current_user.id)
 
     # Return list of usernames
     results = [{'username': user.username, 'level': user.level} for user in users if user.username]
@@ -367,11 +367,8 @@ def travel():
                 if success:
                     try:
                         # Track mission progress for travel
-                        from app.services.mission_service import MissionService
-                        try:
-                            MissionService.track_progress(current_user, 'travel', 1)
-                        except Exception as mission_error:
-                            current_app.logger.error(f"Error tracking travel mission: {mission_error}")
+                        from app.services.progress_events import track_mission
+                        track_mission(current_user, 'travel', 1)
 
                         db.session.commit()
                         # Update current location string after successful travel
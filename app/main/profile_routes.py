@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 from app.utils import get_level_from_xp
 from app.constants import GameConstants
 from app.security import InputSanitizer
+from app.services.username_index import username_index
 
 # --- Helper function for avatar processing ---
 # (Moved here as it's only used by edit_profile)
@@ -86,6 +87,7 @@ def edit_profile():
         # Only allow username change if not already set (first time setup)
         if not username_locked:
             current_user.username = form.username.data
+            username_index.stage_change(current_user.id, current_user.username)
         current_user.description = InputSanitizer.sanitize_description(form.description.data)
         current_user.profile_background = form.profile_background.data
         try:
@@ -201,8 +203,13 @@ def choose_citizenship():
             # Optionally force country/region selects to reset or retain values
             # form.region.choices = [] # Clear regions to force re-fetch via JS
         else:
+            previous_region_id = current_user.current_region_id
             current_user.citizenship_id = selected_country.id
             current_user.current_region_id = selected_region.id # Set the validated region ID
+            # Update materialized country statistics
+            from app.services.country_stats_service import CountryStatsService
+            CountryStatsService.on_citizenship_change(current_user, None, selected_country.id)
+            CountryStatsService.on_location_change(previous_region_id, selected_region.id)
             # Grant initial local currency based on the country selected
             initial_currency = GameConstants.INITIAL_LOCAL_CURRENCY
             current_user.add_currency(selected_country.id, initial_currency)
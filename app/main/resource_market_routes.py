@@ -16,6 +16,7 @@ from app.utils import format_currency, update_market_price_ohlc
 from .forms import MarketBuyForm, MarketSellForm
 from .market_utils import get_grouped_resource_choices, get_resource_slug_map
 from .company_routes import calculate_purchase_breakdown, calculate_sell_breakdown
+from app.services.reference_data import reference_data
 
 
 @bp.route('/market/<country_slug>', defaults={'resource_slug': None}, methods=['GET'])
@@ -48,7 +49,7 @@ def marketplace(country_slug, resource_slug):
     resource_slugs = get_resource_slug_map()
 
     if resource_slug:
-        selected_resource = db.session.scalar(db.select(Resource).filter_by(slug=resource_slug, is_deleted=False))
+        selected_resource = reference_data.resource_by_slug(resource_slug)
         if selected_resource:
             show_quality_filter = selected_resource.can_have_quality
 
@@ -223,21 +224,6 @@ def market_buy(slug, resource_id):
             'current_price_level': int(market_item.price_level)
         })
 
-    # CONFIRMED PURCHASE - Check for race condition
-    current_price_level = int(market_item.price_level)
-    if expected_price_level is not None and current_price_level != expected_price_level:
-        flash('Price has changed since you requested the purchase. Please try again with the updated price.', 'error')
-        return redirect(get_redirect_url())
-
-    # Recalculate breakdown
-    breakdown_data = calculate_purchase_breakdown(market_item, quantity)
-    total_cost = Decimal(str(breakdown_data['total_cost']))
-    user_currency = current_user.get_currency_amount(country.id)
-
-    if user_currency < total_cost:
-        flash(f'Insufficient funds. Need {format_currency(total_cost)} {country.currency_code}.', 'error')
-        return redirect(get_redirect_url())
-
     try:
         # Check storage space before purchase
         available_space = current_user.get_available_storage_space()
@@ -247,12 +233,30 @@ def market_buy(slug, resource_id):
             flash(f'Your storage is full ({current_user.get_total_inventory_count()}/{current_user.USER_STORAGE_LIMIT}). Please sell or consume items before buying more.', 'warning')
             return redirect(get_redirect_url())
 
-        # Recalculate cost for actual quantity if partial
-        if actual_quantity < quantity:
-            breakdown_data = calculate_purchase_breakdown(market_item, actual_quantity)
-            total_cost = Decimal(str(breakdown_data['total_cost']))
+        # CONFIRMED PURCHASE - lock the balance it is paid from, then fill it
+        # against the locked market item (the price level commits with the
+        # purchase). The trade is refused if the price level moved since the preview.
+        from app.services.currency_service import CurrencyService
+        from app.services.market_fills import (
+            fill_trade, ResourceBook, Trade, PRICE_CHANGED, INSUFFICIENT_FUNDS
+        )
+        user_currency = CurrencyService.lock_amount(current_user, country.id)
+        trade = fill_trade(
+            ResourceBook(country.id, resource_id, market_item.quality),
+            Trade(True, actual_quantity, budget=user_currency, expected_level=expected_price_level)
+        )
+        if trade.rejected == PRICE_CHANGED:
+            flash('Price has changed since you requested the purchase. Please try again with the updated price.', 'error')
+            return redirect(get_redirect_url())
+        if trade.rejected == INSUFFICIENT_FUNDS:
+            flash(f'Insufficient funds. Need {format_currency(trade.fill.total)} {country.currency_code}.', 'error')
+            return redirect(get_redirect_url())
+        if trade.rejected:
+            flash('Market item not found', 'error')
+            return redirect(get_redirect_url())
+        total_cost = trade.fill.total
 
-        # Remove currency (with row locking)
+        # Remove currency (row already locked)
         if not current_user.remove_currency(country.id, total_cost):
             flash(f'Transaction failed: insufficient {country.currency_code}.', 'error')
             return redirect(get_redirect_url())
@@ -266,10 +270,6 @@ def market_buy(slug, resource_id):
             flash('Error adding item to inventory.', 'error')
             return redirect(get_redirect_url())
 
-        # Update market progress using breakdown data
-        market_item.price_level = breakdown_data['final_price_level']
-        market_item.progress_within_level = breakdown_data['final_progress']
-
         # Log transaction
         avg_price = total_cost / Decimal(str(quantity_added))
 
@@ -294,8 +294,8 @@ def market_buy(slug, resource_id):
         update_market_price_ohlc(country.id, resource_id, market_item.quality, avg_price)
 
         # Track mission progress for market_buy (count each item bought)
-        from app.services.mission_service import MissionService
-        MissionService.track_progress(current_user, 'market_buy', quantity_added)
+        from app.services.progress_events import track_mission
+        track_mission(current_user, 'market_buy', quantity_added)
 
         db.session.commit()
 
@@ -398,28 +398,31 @@ def market_sell(slug, resource_id):
             'current_price_level': int(market_item.price_level)
         })
 
-    # CONFIRMED SALE - Check for race condition
-    current_price_level = int(market_item.price_level)
-    if expected_price_level is not None and current_price_level != expected_price_level:
-        flash('Price has changed since you requested the sale. Please try again with the updated price.', 'error')
-        return redirect(get_redirect_url())
-
-    # Recalculate breakdown
-    breakdown_data = calculate_sell_breakdown(market_item, quantity)
-    total_proceeds = Decimal(str(breakdown_data['total_proceeds']))
-
     try:
         if not current_user.remove_from_inventory(resource_id=resource_id, quantity=quantity, quality=market_item.quality):
             flash(f'Error removing {resource.name} Q{market_item.quality} from inventory.', 'error')
             return redirect(get_redirect_url())
 
+        # CONFIRMED SALE - fill it against the locked market item (the price
+        # level commits with the sale). The trade is refused if the price level
+        # moved since the preview.
+        from app.services.market_fills import fill_trade, ResourceBook, Trade, PRICE_CHANGED
+        trade = fill_trade(
+            ResourceBook(country.id, resource_id, market_item.quality),
+            Trade(False, quantity, expected_level=expected_price_level)
+        )
+        if trade.rejected:
+            db.session.rollback()
+            if trade.rejected == PRICE_CHANGED:
+                flash('Price has changed since you requested the sale. Please try again with the updated price.', 'error')
+            else:
+                flash('Market item not found', 'error')
+            return redirect(get_redirect_url())
+        total_proceeds = trade.fill.total
+
         # Add currency to user's wallet
         current_user.add_currency(country.id, total_proceeds)
 
-        # Update market progress using breakdown data
-        market_item.price_level = breakdown_data['final_price_level']
-        market_item.progress_within_level = breakdown_data['final_progress']
-
         # Log transaction
         avg_price = total_proceeds / Decimal(str(quantity))
 
@@ -444,8 +447,8 @@ def market_sell(slug, resource_id):
         update_market_price_ohlc(country.id, resource_id, market_item.quality, avg_price)
 
         # Track mission progress for market_sell (count each item sold)
-        from app.services.mission_service import MissionService
-        MissionService.track_progress(current_user, 'market_sell', quantity)
+        from app.services.progress_events import track_mission
+        track_mission(current_user, 'market_sell', quantity)
 
         db.session.commit()
         flash(f'Sold {quantity} {resource_display_name} for {format_currency(total_proceeds)} {country.currency_code}.', 'success')
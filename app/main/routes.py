@@ -1,18 +1,18 @@
 # app/main/routes.py
 # Contains core routes like index and request handlers
 
-from flask import render_template, redirect, url_for, flash, request, jsonify, send_from_directory
+from flask import render_template, redirect, url_for, flash, request, jsonify, send_from_directory, Response
 from flask_login import current_user, login_required
 from app.main import bp
 from app.extensions import db
-from app.models import PartyElection, ElectionStatus, Referral, ReferralStatus, Country, Region, Article, NewspaperSubscription, ArticleVote, GovernmentElection, GovernmentElectionStatus, ElectionType, Resource
+from app.models import PartyElection, ElectionStatus, Referral, ReferralStatus, Country, Region, Article, NewspaperSubscription, ArticleVote, GovernmentElection, GovernmentElectionStatus, ElectionType
 from app.models.government import Law, LawStatus, War, WarStatus
 from app.models.battle import Battle, BattleStatus
 from app.services.mission_service import MissionService
+from app.services.country_geodata import country_geodata
+from app.services.reference_data import reference_data
 from datetime import datetime, timedelta
 from sqlalchemy import func
-import json
-import os
 # Note: Other imports moved to specific route files
 
 # --- Before Request Handler ---
@@ -386,7 +386,7 @@ def index():
     else:
         # Get stats for landing page
         country_count = db.session.query(func.count(Country.id)).scalar() or 0
-        resource_count = db.session.query(func.count(Resource.id)).scalar() or 0
+        resource_count = reference_data.resource_count()
         return render_template('index.html', title='Welcome',
                              country_count=country_count,
                              resource_count=resource_count)
@@ -474,12 +474,7 @@ def world_map():
 def get_countries():
     """Get all country border data from GeoJSON file."""
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'app', 'data')
-        geojson_path = os.path.join(data_dir, 'countries.geojson')
-
-        with open(geojson_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return jsonify(data)
+        return Response(country_geodata.all_json(), mimetype='application/json')
     except FileNotFoundError:
         return jsonify({"error": "Country data not found"}), 404
     except Exception as e:
@@ -491,18 +486,9 @@ def get_countries():
 def get_country(country_code):
     """Get specific country data by ISO code."""
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'app', 'data')
-        geojson_path = os.path.join(data_dir, 'countries.geojson')
-
-        with open(geojson_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Find the country with matching ISO code
-        for feature in data.get('features', []):
-            properties = feature.get('properties', {})
-            if (properties.get('ISO_A2') == country_code.upper() or
-                properties.get('ISO_A3') == country_code.upper()):
-                return jsonify(feature)
+        feature = country_geodata.country_json(country_code)
+        if feature is not None:
+            return Response(feature, mimetype='application/json')
 
         return jsonify({"error": f"Country {country_code} not found"}), 404
     except Exception as e:
@@ -514,17 +500,9 @@ def get_country(country_code):
 def get_country_by_name(country_name):
     """Get specific country data by name."""
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'app', 'data')
-        geojson_path = os.path.join(data_dir, 'countries.geojson')
-
-        with open(geojson_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Find the country with matching name
-        for feature in data.get('features', []):
-            properties = feature.get('properties', {})
-            if properties.get('NAME', '').lower() == country_name.lower():
-                return jsonify(feature)
+        feature = country_geodata.country_json_by_name(country_name)
+        if feature is not None:
+            return Response(feature, mimetype='application/json')
 
         return jsonify({"error": f"Country {country_name} not found"}), 404
     except Exception as e:
@@ -164,8 +164,10 @@ def api_zen_market_confirm_sell():
         )
         db.session.add(transaction)
 
-        # Update market price level
-        market.update_price_level(zen_amount, is_buy=False)
+        # Update the market price level under the ZEN market row lock
+        # (the Gold amount was quoted when the sale was prepared)
+        from app.services.market_fills import fill_trade, ZenBook, Trade
+        fill_trade(ZenBook(market.id), Trade(False, zen_amount))
 
         db.session.commit()
 
@@ -216,10 +218,6 @@ def api_zen_market_buy_zen():
     if not market:
         return jsonify({'success': False, 'error': 'Market not found'}), 404
 
-    # Calculate Gold cost
-    buy_price = market.buy_zen_price
-    gold_cost = (zen_amount * buy_price).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
-
     # Transfer ZEN from treasury to user (on blockchain) FIRST
     # We do blockchain transfer first because we can't reverse it if gold deduction fails
     transfer_result = transfer_zen_from_treasury(user_wallet, zen_amount)
@@ -230,11 +228,22 @@ def api_zen_market_buy_zen():
             'error': f'Blockchain transfer failed: {transfer_result.get("message", "Unknown error")}'
         }), 500
 
-    # Blockchain transfer successful! Deduct Gold from user with row-level locking
+    # Blockchain transfer successful! Lock the user's Gold, price the purchase
+    # against the locked ZEN market (this also moves the price level) and
+    # deduct the cost
     from app.services.currency_service import CurrencyService
-    success, message, _ = CurrencyService.deduct_gold(
-        current_user.id, gold_cost, 'ZEN blockchain purchase'
+    from app.services.market_fills import fill_trade, ZenBook, Trade
+    trade = fill_trade(
+        ZenBook(market.id), Trade(True, zen_amount, budget=CurrencyService.lock_gold(current_user.id))
     )
+    buy_price = trade.fill.rate if trade.fill else market.buy_zen_price
+    gold_cost = trade.fill.total if trade.fill else Decimal('0')
+    if trade.rejected:
+        success, message = False, f"Trade rejected ({trade.rejected})"
+    else:
+        success, message, _ = CurrencyService.deduct_gold(
+            current_user.id, gold_cost, 'ZEN blockchain purchase'
+        )
     if not success:
         # Note: ZEN was already transferred on blockchain, log this critical error
         current_app.logger.critical(
@@ -259,9 +268,6 @@ def api_zen_market_buy_zen():
     )
     db.session.add(transaction)
 
-    # Update market price level
-    market.update_price_level(zen_amount, is_buy=True)
-
     db.session.commit()
 
     return jsonify({
@@ -124,38 +124,40 @@ def zen_market_buy_zen():
         flash("ZEN amount must be greater than zero.", "warning")
         return redirect(url_for('main.zen_market'))
 
-    # Calculate total cost in Gold (at buy price)
-    buy_price = market.buy_zen_price  # Gold per 1 ZEN
-    total_gold_cost = (zen_amount * buy_price).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
-
     # Check treasury has enough ZEN before proceeding
     treasury_balance = get_treasury_balance()
     if treasury_balance < zen_amount:
         flash(f"Treasury has insufficient ZEN balance ({treasury_balance:.2f} ZEN). Please try a smaller amount.", "danger")
         return redirect(url_for('main.zen_market'))
 
-    # Deduct Gold from user with row-level locking
+    # Lock the user's Gold and price the purchase against the locked ZEN
+    # market (this also moves the price level)
     from app.services.currency_service import CurrencyService
+    from app.services.market_fills import fill_trade, ZenBook, Trade, INSUFFICIENT_FUNDS
+    gold_balance = CurrencyService.lock_gold(current_user.id)
+    trade = fill_trade(ZenBook(market.id), Trade(True, zen_amount, budget=gold_balance))
+    if trade.rejected == INSUFFICIENT_FUNDS:
+        db.session.rollback()
+        flash(f"Could not complete purchase: Insufficient gold. Have: {gold_balance}, Need: {trade.fill.total}", "warning")
+        return redirect(url_for('main.zen_market'))
+    if trade.rejected:
+        db.session.rollback()
+        flash("Market not found.", "danger")
+        return redirect(url_for('main.zen_market'))
+    buy_price = trade.fill.rate  # Gold per 1 ZEN
+    total_gold_cost = trade.fill.total
+
+    # Deduct Gold from user (row already locked)
     success, message, _ = CurrencyService.deduct_gold(
         current_user.id, total_gold_cost, 'ZEN market purchase'
     )
     if not success:
+        db.session.rollback()
         flash(f"Could not complete purchase: {message}", "warning")
         return redirect(url_for('main.zen_market'))
 
-    # Transfer real ZEN tokens from treasury to user's wallet
-    transfer_result = transfer_zen_from_treasury(current_user.base_wallet_address, zen_amount)
-
-    if not transfer_result.get('success'):
-        # Refund Gold if blockchain transfer failed
-        CurrencyService.add_gold(current_user.id, total_gold_cost, 'ZEN market refund - transfer failed')
-        error_msg = transfer_result.get('error', 'Unknown error')
-        flash(f"Blockchain transfer failed: {error_msg}. Your Gold has been refunded.", "danger")
-        return redirect(url_for('main.zen_market'))
-
-    tx_hash = transfer_result.get('tx_hash', '')
-
-    # Create transaction record
+    # Commit the price and the deduction before the transfer: the market and
+    # user rows must not stay locked while the transfer waits for its receipt
     transaction = ZenTransaction(
         market_id=market.id,
         user_id=current_user.id,
@@ -163,13 +165,28 @@ def zen_market_buy_zen():
         zen_amount=zen_amount,
         gold_amount=total_gold_cost,
         exchange_rate=buy_price,
-        blockchain_status='completed',
-        blockchain_tx_hash=tx_hash
+        blockchain_status='pending'
     )
     db.session.add(transaction)
+    wallet_address = current_user.base_wallet_address
+    db.session.commit()
+
+    # Transfer real ZEN tokens from treasury to user's wallet
+    transfer_result = transfer_zen_from_treasury(wallet_address, zen_amount)
+
+    if not transfer_result.get('success'):
+        # Refund Gold and take the purchase back out of the price level
+        CurrencyService.add_gold(current_user.id, total_gold_cost, 'ZEN market refund - transfer failed')
+        fill_trade(ZenBook(market.id), Trade(False, zen_amount))
+        transaction.blockchain_status = 'failed'
+        db.session.commit()
+        error_msg = transfer_result.get('error', 'Unknown error')
+        flash(f"Blockchain transfer failed: {error_msg}. Your Gold has been refunded.", "danger")
+        return redirect(url_for('main.zen_market'))
 
-    # Update market price level
-    market.update_price_level(zen_amount, is_buy=True)
+    tx_hash = transfer_result.get('tx_hash', '')
+    transaction.blockchain_status = 'completed'
+    transaction.blockchain_tx_hash = tx_hash
 
     # Update OHLC price history with the buy price
     update_zen_rate_ohlc(market.id, buy_price)
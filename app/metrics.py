@@ -0,0 +1,568 @@
+"""
+Process metrics in the Prometheus text format.
+
+A small in-process registry of counters, gauges and histograms, fed by:
+
+- the request hooks: latency histogram and status code counts per
+  blueprint/endpoint,
+- the database pool: connections checked out, overflow and pool size
+  (sampled when metrics are collected) and the time spent checking a
+  connection out, including waits on a full pool,
+- Flask-Caching: hits and misses per key prefix (memoized functions by name),
+- Flask-Limiter: rejected requests per endpoint,
+- APScheduler: how late each job run was submitted, and how it ended.
+
+GET /metrics renders them for admins, and for requests made on the host
+itself: Prometheus scraping Gunicorn's local bind directly. Requests that
+came through nginx carry X-Forwarded-For / X-Real-IP and are refused.
+
+Each Gunicorn worker has its own registry. With METRICS_MULTIPROC_DIR set,
+every worker writes a snapshot of it to that directory every
+METRICS_FLUSH_SECONDS and when it exits, and /metrics adds up all of them,
+so a scrape is at most one flush interval behind on the other workers. When
+a worker exits the master folds its counters and histograms into an archive
+file, so totals do not go backwards when workers are recycled; gauges of
+exited workers are dropped. gunicorn.conf.py wires the hooks.
+
+Recording is a dict lookup and a few additions under a lock: a few
+microseconds per request, a cache lookup or a checkout
+(scripts/benchmark_metrics.py measures it and fails over budget).
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from flask import Response, abort, request
+from flask_login import current_user
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+SCHEDULER_LAG_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+ARCHIVE_FILE = 'archive.json'
+WORKER_FILE = 'worker_{pid}.json'
+PROXY_HEADERS = ('X-Forwarded-For', 'X-Real-IP', 'Forwarded')
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1')
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.reset()
+
+    def reset(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _describe(self):
+        return {'type': self.kind, 'help': self.help, 'labels': list(self.labels)}
+
+    def snapshot(self):
+        with self._lock:
+            samples = [[list(key), value] for key, value in self._values.items()]
+        return dict(self._describe(), samples=samples)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(name, help, labels)
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def _describe(self):
+        return dict(super()._describe(), buckets=list(self.buckets))
+
+    def snapshot(self):
+        with self._lock:
+            samples = [[list(key), [list(counts), total]] for key, (counts, total) in self._values.items()]
+        return dict(self._describe(), samples=samples)
+
+
+class MetricsRegistry:
+    """The metrics of this process, plus callbacks that sample gauges on collection."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+
+    def _register(self, metric):
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, labels=()):
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name, help, labels=()):
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def add_collector(self, collect):
+        if collect not in self._collectors:
+            self._collectors.append(collect)
+
+    def snapshot(self):
+        """Every metric as plain data (the format of the multiprocess files)."""
+        for collect in self._collectors:
+            try:
+                collect()
+            except Exception as e:
+                logger.warning(f"Metrics collector {collect.__name__} failed: {e}")
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def reset(self):
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.histogram(
+    'tactizen_http_request_duration_seconds', 'Time spent handling a request.',
+    ('blueprint', 'endpoint'))
+REQUESTS = registry.counter(
+    'tactizen_http_requests_total', 'Requests handled, by status code.',
+    ('blueprint', 'endpoint', 'code'))
+RATE_LIMITED = registry.counter(
+    'tactizen_rate_limit_rejections_total', 'Requests rejected by the rate limiter.',
+    ('endpoint',))
+POOL_WAIT = registry.histogram(
+    'tactizen_db_pool_wait_seconds', 'Time to check a connection out of the pool (waits included).',
+    buckets=POOL_WAIT_BUCKETS)
+POOL_TIMEOUTS = registry.counter(
+    'tactizen_db_pool_timeouts_total', 'Checkouts that gave up waiting for a connection.')
+POOL_SIZE = registry.gauge('tactizen_db_pool_size', 'Connections the pool keeps open.')
+POOL_CHECKED_OUT = registry.gauge('tactizen_db_pool_checked_out', 'Connections currently in use.')
+POOL_OVERFLOW = registry.gauge('tactizen_db_pool_overflow', 'Connections open beyond the pool size.')
+CACHE_LOOKUPS = registry.counter(
+    'tactizen_cache_lookups_total', 'Cache lookups by key prefix and result (hit or miss).',
+    ('prefix', 'result'))
+SCHEDULER_LAG = registry.histogram(
+    'tactizen_scheduler_job_lag_seconds', 'Delay between a job run\'s scheduled time and its start.',
+    ('job',), SCHEDULER_LAG_BUCKETS)
+SCHEDULER_RUNS = registry.counter(
+    'tactizen_scheduler_job_runs_total', 'Job runs by outcome (success, error, missed).',
+    ('job', 'outcome'))
+
+
+# ----------------------------------------------------------------------
+# Text format
+# ----------------------------------------------------------------------
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def render(metrics):
+    """Metrics merged by merge_snapshots() in the Prometheus text exposition format."""
+    lines = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for key in sorted(metric['samples']):
+            value = metric['samples'][key]
+            pairs = list(zip(metric['labels'], key))
+            if metric['type'] != 'histogram':
+                lines.append(f'{name}{_labels(pairs)} {_number(value)}')
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip(metric['buckets'] + ['+Inf'], counts):
+                cumulative += count
+                le = bound if bound == '+Inf' else repr(float(bound))
+                lines.append(f'{name}_bucket{_labels(pairs + [("le", le)])} {cumulative}')
+            lines.append(f'{name}_sum{_labels(pairs)} {_number(total)}')
+            lines.append(f'{name}_count{_labels(pairs)} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+
+# ----------------------------------------------------------------------
+# Multiprocess aggregation
+# ----------------------------------------------------------------------
+
+def merge_snapshots(snapshots, gauges=True):
+    """
+    Add up snapshots (from registry.snapshot() or the multiprocess files).
+
+    Samples come back keyed by their label tuple. gauges=False drops gauges,
+    which only mean something for a live process.
+    """
+    merged = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            kind = metric['type']
+            if kind == 'gauge' and not gauges:
+                continue
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = {key: metric[key] for key in ('type', 'help', 'labels', 'buckets')
+                                         if key in metric}
+                target['samples'] = {}
+            elif kind == 'histogram' and metric['buckets'] != target['buckets']:
+                logger.warning(f"Skipping {name} samples recorded with other buckets")
+                continue
+            samples = target['samples']
+            for labels, value in metric['samples']:
+                key = tuple(labels)
+                if kind != 'histogram':
+                    samples[key] = samples.get(key, 0) + value
+                elif key in samples:
+                    counts, total = samples[key]
+                    samples[key] = [[a + b for a, b in zip(counts, value[0])], total + value[1]]
+                else:
+                    samples[key] = [list(value[0]), value[1]]
+    return merged
+
+
+def _as_snapshot(merged):
+    return {
+        name: dict({key: value for key, value in metric.items() if key != 'samples'},
+                   samples=[[list(key), value] for key, value in metric['samples'].items()])
+        for name, metric in merged.items()
+    }
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Gone since it was listed, or never written completely
+        return None
+
+
+def _write_json(path, data):
+    """Write atomically, so readers never see half a file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def clear_multiprocess_dir(directory):
+    """Start a server with no samples from its previous run (the Gunicorn master, on_starting)."""
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith('.json'):
+            os.unlink(os.path.join(directory, name))
+
+
+def write_snapshot(directory=None):
+    """Write this process's samples to its file in the multiprocess directory."""
+    directory = directory or _multiproc_dir
+    if directory:
+        _write_json(os.path.join(directory, WORKER_FILE.format(pid=os.getpid())), registry.snapshot())
+
+
+def mark_process_dead(pid, directory):
+    """
+    Fold an exited worker's counters and histograms into the archive.
+
+    Runs in the Gunicorn master (child_exit), the only writer of the archive.
+    """
+    path = os.path.join(directory, WORKER_FILE.format(pid=pid))
+    snapshot = _read_json(path)
+    if snapshot is not None:
+        archive_path = os.path.join(directory, ARCHIVE_FILE)
+        archive = _read_json(archive_path) or {}
+        _write_json(archive_path, _as_snapshot(merge_snapshots([archive, snapshot], gauges=False)))
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def collect(directory=None):
+    """This process's samples added to every other worker's and the archive's."""
+    snapshots = [registry.snapshot()]
+    workers = 1
+    if directory and os.path.isdir(directory):
+        own_file = WORKER_FILE.format(pid=os.getpid())
+        for name in os.listdir(directory):
+            if name == own_file or not name.endswith('.json') or name.startswith('.'):
+                continue
+            if name != ARCHIVE_FILE:
+                # Written by a process that died without the master noticing (not a Gunicorn worker)
+                pid = name[len('worker_'):-len('.json')]
+                if not pid.isdigit() or not _is_alive(int(pid)):
+                    continue
+                workers += 1
+            snapshot = _read_json(os.path.join(directory, name))
+            if snapshot:
+                snapshots.append(snapshot)
+    merged = merge_snapshots(snapshots)
+    merged['tactizen_metrics_processes'] = {
+        'type': 'gauge', 'help': 'Processes whose current samples are included.', 'labels': [],
+        'samples': {(): workers},
+    }
+    return merged
+
+
+_multiproc_dir = None
+_flusher = None
+
+
+def _start_flusher(interval):
+    global _flusher
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            try:
+                write_snapshot()
+            except Exception as e:
+                logger.warning(f"Could not write metrics snapshot: {e}")
+
+    thread = threading.Thread(target=run, name='metrics-flusher', daemon=True)
+    thread.start()
+    _flusher = (thread, stop)
+
+
+def after_fork(app):
+    """
+    Start clean in a forked worker: drop what the preloading master recorded
+    and start writing this worker's snapshots.
+    """
+    global _flusher
+    if not app.config.get('METRICS_ENABLED'):
+        return
+    registry.reset()
+    _flusher = None
+    if _multiproc_dir:
+        _start_flusher(app.config.get('METRICS_FLUSH_SECONDS', 5))
+
+
+# ----------------------------------------------------------------------
+# Sources
+# ----------------------------------------------------------------------
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout takes (dispose() keeps the class)."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - start)
+
+
+_pool_engine = None
+
+
+def _collect_pool():
+    pool = _pool_engine.pool if _pool_engine is not None else None
+    if isinstance(pool, QueuePool):
+        POOL_SIZE.set(pool.size())
+        POOL_CHECKED_OUT.set(pool.checkedout())
+        POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+
+def _instrument_pool(engine):
+    global _pool_engine
+    # QueuePool has no event before a checkout starts waiting
+    if type(engine.pool) is QueuePool:
+        engine.pool.__class__ = TimedQueuePool
+    _pool_engine = engine
+    registry.add_collector(_collect_pool)
+
+
+_KEY_PREFIX = re.compile(r'[a-z][a-z_.]*[a-z]')
+_MEMOIZE_VERSION_SUFFIX = '_memver'
+_cache_local = threading.local()
+
+
+def cache_key_prefix(key):
+    """The leading lower-case words of a cache key: 'country_online_12' -> 'country_online'."""
+    match = _KEY_PREFIX.match(key) if isinstance(key, str) else None
+    return match.group(0) if match else 'other'
+
+
+def _instrument_cache(backend):
+    get = backend.get
+
+    def counted_get(key):
+        value = get(key)
+        if isinstance(key, str) and key.endswith(_MEMOIZE_VERSION_SUFFIX):
+            # A memoized function looks up its version key, then its value
+            # under an opaque hash: count that lookup under the function's name
+            _cache_local.memoized = key[:-len(_MEMOIZE_VERSION_SUFFIX)].rsplit('.', 1)[-1]
+            return value
+        prefix = getattr(_cache_local, 'memoized', None)
+        if prefix is None:
+            prefix = cache_key_prefix(key)
+        else:
+            _cache_local.memoized = None
+        CACHE_LOOKUPS.inc(prefix, 'miss' if value is None else 'hit')
+        return value
+
+    backend.get = counted_get
+
+
+def count_rate_limit_breach(request_limit):
+    """Flask-Limiter on_breach callback; the default 429 response is kept."""
+    RATE_LIMITED.inc(request.endpoint or 'unmatched')
+    return None
+
+
+def instrument_scheduler(scheduler):
+    """Record job lag and outcomes of an APScheduler scheduler."""
+    from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+
+    outcomes = {EVENT_JOB_EXECUTED: 'success', EVENT_JOB_ERROR: 'error', EVENT_JOB_MISSED: 'missed'}
+
+    def on_job_event(event):
+        if event.code == EVENT_JOB_SUBMITTED:
+            now = datetime.now(timezone.utc)
+            for run_time in event.scheduled_run_times:
+                SCHEDULER_LAG.observe(max((now - run_time).total_seconds(), 0.0), event.job_id)
+        else:
+            SCHEDULER_RUNS.inc(event.job_id, outcomes[event.code])
+
+    scheduler.add_listener(on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
+
+
+# ----------------------------------------------------------------------
+# Flask integration
+# ----------------------------------------------------------------------
+
+def _may_read_metrics():
+    if request.remote_addr in LOOPBACK_ADDRESSES and not any(h in request.headers for h in PROXY_HEADERS):
+        return True
+    return current_user.is_authenticated and current_user.is_admin
+
+
+def metrics():
+    if not _may_read_metrics():
+        abort(404)
+    return Response(render(collect(_multiproc_dir)), content_type=CONTENT_TYPE)
+
+
+_START_KEY = 'tactizen.metrics_start'
+
+
+# The request proxy is resolved once per hook: each lookup through it costs
+# about as much as the recording itself
+def start_request_timer():
+    request.environ[_START_KEY] = time.perf_counter()
+
+
+def record_request(response):
+    req = request._get_current_object()
+    start = req.environ.pop(_START_KEY, None)
+    if start is not None:
+        elapsed = time.perf_counter() - start
+        rule = req.url_rule
+        if rule is None:
+            blueprint, endpoint = '', 'unmatched'
+        else:
+            endpoint = rule.endpoint
+            blueprint = endpoint.rpartition('.')[0]
+        REQUEST_LATENCY.observe(elapsed, blueprint, endpoint)
+        REQUESTS.inc(blueprint, endpoint, str(response.status_code))
+    return response
+
+
+def init_metrics(app):
+    """Register the request hooks, pool and cache instrumentation and /metrics when METRICS_ENABLED is set."""
+    global _multiproc_dir
+    if not app.config.get('METRICS_ENABLED'):
+        return
+
+    from app.extensions import cache, db, limiter
+
+    # First before_request and last after_request, so the time covers the other hooks
+    app.before_request_funcs.setdefault(None, []).insert(0, start_request_timer)
+    app.after_request_funcs.setdefault(None, []).insert(0, record_request)
+
+    with app.app_context():
+        _instrument_pool(db.engine)
+    _instrument_cache(app.extensions['cache'][cache])
+
+    app.add_url_rule('/metrics', 'metrics', limiter.exempt(metrics))
+
+    _multiproc_dir = app.config.get('METRICS_MULTIPROC_DIR')
+    if _multiproc_dir:
+        os.makedirs(_multiproc_dir, exist_ok=True)
+        # A preloading master only forks; each worker starts its own in after_fork()
+        if not app.config.get('PRELOAD_APP') and _flusher is None:
+            _start_flusher(app.config.get('METRICS_FLUSH_SECONDS', 5))
@@ -897,6 +897,59 @@ def distribute_item(unit_id):
     return redirect(url_for('military_unit.inventory', unit_id=unit_id))
 
 
+@bp.route('/<int:unit_id>/distribute/bulk', methods=['POST'])
+@login_required
+@limiter.limit("30 per hour")
+def distribute_bulk(unit_id):
+    """
+    Distribute one item to many members at once (commander only).
+
+    JSON body: resource_id, quality, mode ('equal', 'rank' or 'explicit') and
+    total / rank_quotas / member_quantities depending on the mode.
+    """
+    from app.services.unit_supply_service import UnitSupplyService, SupplyError
+
+    unit = db.session.get(MilitaryUnit, unit_id)
+
+    if not unit or not unit.is_active:
+        return jsonify({'error': 'Military unit not found'}), 404
+
+    if unit.commander_id != current_user.id:
+        return jsonify({'error': 'Only the commander can distribute items'}), 403
+
+    data = request.get_json(silent=True) or {}
+    try:
+        resource_id = int(data.get('resource_id'))
+        quality = int(data.get('quality', 0))
+        total = int(data['total']) if data.get('total') is not None else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid input'}), 400
+
+    try:
+        result = UnitSupplyService.distribute(
+            unit, current_user, resource_id, quality, data.get('mode'),
+            total=total,
+            rank_quotas=data.get('rank_quotas'),
+            member_quantities=data.get('member_quantities')
+        )
+        db.session.commit()
+    except SupplyError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error in bulk distribution: {e}", exc_info=True)
+        return jsonify({'error': 'An error occurred. Please try again.'}), 500
+
+    return jsonify({
+        'success': True,
+        'recipients': result['recipients'],
+        'distributed': result['distributed'],
+        'requested': result['requested'],
+        'shortfall': {str(user_id): qty for user_id, qty in result['shortfall'].items()}
+    })
+
+
 def calculate_purchase_breakdown(market_item, quantity):
     """Calculate the cost breakdown when purchasing across multiple price levels."""
     volume_per_level = int(market_item.volume_per_level)
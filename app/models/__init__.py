@@ -87,6 +87,20 @@ from .game_settings import GameSettings
 from .game_event import GameEvent, EventType
 # Import ZK voting models (anonymous elections)
 from .zk_voting import VoterCommitment, MerkleTree, ZKVote, ZKElectionConfig
+# Import materialized country statistics
+from .country_stats import CountryStats
+from .moderation_counters import ModerationCounters
+from .politics_read_model import PartyRoster, ElectionSummary, ElectionTally, GovernmentComposition
+# Import on-chain publication outbox
+from .chain_outbox import ChainOutbox, ChainOutboxStatus, ChainAccount
+# Import financial transaction rollups and archive records
+from .transaction_rollup import TransactionDailyUser, TransactionDailyType, TransactionArchive
+# Import user blockchain transactions awaiting confirmation
+from .pending_chain_tx import PendingChainTx, PendingChainTxStatus, ChainTxWatcherState
+# Import local mirror of on-chain NFT ownership and marketplace listings
+from .chain_index import ChainIndexCursor, ChainEvent, TokenOwner, OnchainListing
+# Import cross-process cache invalidation counters
+from .shared_version import SharedVersion
 
 # Define __all__ to specify what gets imported with 'from app.models import *'
 __all__ = [
@@ -244,4 +258,30 @@ __all__ = [
     'MerkleTree',              # Imported from zk_voting.py
     'ZKVote',                  # Imported from zk_voting.py
     'ZKElectionConfig',        # Imported from zk_voting.py
+    # Materialized statistics
+    'CountryStats',            # Imported from country_stats.py
+    'ModerationCounters',      # Imported from moderation_counters.py
+    'PartyRoster',             # Imported from politics_read_model.py
+    'ElectionSummary',         # Imported from politics_read_model.py
+    'ElectionTally',           # Imported from politics_read_model.py
+    'GovernmentComposition',   # Imported from politics_read_model.py
+    # On-chain publication outbox
+    'ChainOutbox',             # Imported from chain_outbox.py
+    'ChainOutboxStatus',       # Imported from chain_outbox.py
+    'ChainAccount',            # Imported from chain_outbox.py
+    # Financial transaction rollups
+    'TransactionDailyUser',    # Imported from transaction_rollup.py
+    'TransactionDailyType',    # Imported from transaction_rollup.py
+    'TransactionArchive',      # Imported from transaction_rollup.py
+    # User blockchain transactions awaiting confirmation
+    'PendingChainTx',          # Imported from pending_chain_tx.py
+    'PendingChainTxStatus',    # Imported from pending_chain_tx.py
+    'ChainTxWatcherState',     # Imported from pending_chain_tx.py
+    # On-chain NFT ownership and listing mirror
+    'ChainIndexCursor',        # Imported from chain_index.py
+    'ChainEvent',              # Imported from chain_index.py
+    'TokenOwner',              # Imported from chain_index.py
+    'OnchainListing',          # Imported from chain_index.py
+    # Cross-process cache invalidation counters
+    'SharedVersion',           # Imported from shared_version.py
 ]
\ No newline at end of file
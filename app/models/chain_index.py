@@ -0,0 +1,94 @@
+# app/models/chain_index.py
+"""
+Local mirror of on-chain NFT ownership and marketplace listings.
+
+ChainIndexer follows GameNFT Transfer events and NFTMarketplace listing
+events from a persisted block cursor (ChainIndexCursor), keeps every event
+it applied (ChainEvent) and maintains the current state derived from them:
+who owns each token (TokenOwner) and each token's marketplace listing
+(OnchainListing). Ownership checks and inventory sync read these tables
+instead of calling ownerOf per token.
+
+ChainEvent is what makes reorgs recoverable: when the cursor block's hash
+changes, events from the rewound blocks are deleted and the state of the
+tokens they touched is rebuilt from the events that remain.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class ChainIndexCursor(db.Model):
+    """How far the indexer has read, plus its lease (one indexer process at a time)."""
+    __tablename__ = 'chain_index_cursor'
+
+    name = db.Column(db.String(40), primary_key=True)
+    last_block = db.Column(db.BigInteger, nullable=True)          # Last block fully applied
+    last_block_hash = db.Column(db.String(66), nullable=True)     # Its hash, to detect reorgs
+    lease_owner = db.Column(db.String(100), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # Last successful run
+
+    def __repr__(self):
+        return f'<ChainIndexCursor {self.name} last_block={self.last_block}>'
+
+
+class ChainEvent(db.Model):
+    """One decoded Transfer / NFTListed / NFTSold / ListingCancelled log."""
+    __tablename__ = 'chain_event'
+
+    id = db.Column(db.Integer, primary_key=True)
+    block_number = db.Column(db.BigInteger, nullable=False, index=True)
+    block_hash = db.Column(db.String(66), nullable=False)
+    log_index = db.Column(db.Integer, nullable=False)
+    tx_hash = db.Column(db.String(66), nullable=False)
+    event = db.Column(db.String(20), nullable=False)       # 'Transfer', 'NFTListed', 'NFTSold', 'ListingCancelled'
+    token_id = db.Column(db.BigInteger, nullable=False, index=True)
+    from_address = db.Column(db.String(42), nullable=True)  # Transfer from / listing seller (lowercase)
+    to_address = db.Column(db.String(42), nullable=True)    # Transfer to / buyer (lowercase)
+    price_zen = db.Column(db.Numeric(36, 18), nullable=True)
+    event_timestamp = db.Column(db.BigInteger, nullable=True)  # Unix time emitted by marketplace events
+
+    __table_args__ = (
+        db.UniqueConstraint('block_number', 'log_index', name='uq_chain_event_position'),
+    )
+
+    def __repr__(self):
+        return f'<ChainEvent {self.event} token={self.token_id} block={self.block_number}:{self.log_index}>'
+
+
+class TokenOwner(db.Model):
+    """Current owner of a GameNFT token (burned tokens have no row)."""
+    __tablename__ = 'token_owner'
+
+    token_id = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    owner_address = db.Column(db.String(42), nullable=False, index=True)  # Lowercase
+    block_number = db.Column(db.BigInteger, nullable=False)               # Block of the last transfer
+
+    def __repr__(self):
+        return f'<TokenOwner {self.token_id} {self.owner_address}>'
+
+
+class OnchainListing(db.Model):
+    """Latest marketplace listing of a token, as the marketplace contract sees it."""
+    __tablename__ = 'onchain_listing'
+
+    token_id = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    seller_address = db.Column(db.String(42), nullable=False, index=True)  # Lowercase
+    price_zen = db.Column(db.Numeric(36, 18), nullable=False)
+    active = db.Column(db.Boolean, nullable=False, default=True, index=True)
+    listed_at = db.Column(db.BigInteger, nullable=True)       # Unix time from the NFTListed event
+    buyer_address = db.Column(db.String(42), nullable=True)   # Set once sold
+    block_number = db.Column(db.BigInteger, nullable=False)   # Block of the last event
+
+    def to_dict(self):
+        """Same shape as get_listing_details_onchain()."""
+        return {
+            'seller': self.seller_address,
+            'price': self.price_zen,
+            'active': self.active,
+            'listed_at': self.listed_at,
+        }
+
+    def __repr__(self):
+        return f'<OnchainListing {self.token_id} active={self.active}>'
@@ -0,0 +1,107 @@
+# app/models/chain_outbox.py
+"""
+Durable outbox for on-chain publications.
+
+Code that wants something written to a contract (election results today)
+inserts a ChainOutbox row in the same transaction as the game state it
+describes. A single publisher (ChainPublisher) later signs and submits the
+rows in order, using nonces it hands out from ChainAccount instead of asking
+the node for every transaction.
+"""
+
+import json
+from datetime import datetime
+from enum import Enum as PyEnum
+from app.extensions import db
+
+
+class ChainOutboxStatus(PyEnum):
+    """Lifecycle of an outbox entry."""
+    PENDING = "pending"        # Waiting for a nonce / first broadcast
+    SUBMITTED = "submitted"    # Signed with a nonce and broadcast, not yet mined
+    CONFIRMED = "confirmed"    # Mined successfully
+    FAILED = "failed"          # Reverted on chain, or could not be built/signed
+
+
+class ChainOutbox(db.Model):
+    """One contract call waiting to be (or already) published."""
+    __tablename__ = 'chain_outbox'
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Idempotency key, e.g. 'party_election:12'; enqueueing twice is a no-op
+    dedupe_key = db.Column(db.String(100), unique=True, nullable=False)
+    contract = db.Column(db.String(40), nullable=False)   # Logical contract name, e.g. 'election_results'
+    function = db.Column(db.String(60), nullable=False)   # Contract function, e.g. 'publishResult'
+    _args = db.Column('args', db.Text, nullable=False)    # JSON list; bytes stored as 0x-hex strings
+
+    status = db.Column(db.Enum(ChainOutboxStatus), default=ChainOutboxStatus.PENDING, nullable=False, index=True)
+    from_address = db.Column(db.String(42), nullable=True)
+    nonce = db.Column(db.Integer, nullable=True)
+    gas_price = db.Column(db.Numeric(30, 0), nullable=True)
+    tx_hash = db.Column(db.String(66), nullable=True, index=True)       # Latest broadcast
+    raw_tx = db.Column(db.Text, nullable=True)                          # Signed bytes of tx_hash, 0x-hex
+    _tx_hashes = db.Column('tx_hashes', db.Text, nullable=True)         # Every hash broadcast for this nonce
+
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    last_error = db.Column(db.Text, nullable=True)
+
+    # Receipt
+    block_number = db.Column(db.BigInteger, nullable=True)
+    gas_used = db.Column(db.BigInteger, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    submitted_at = db.Column(db.DateTime, nullable=True)
+    confirmed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('idx_chain_outbox_status_next', 'status', 'next_attempt_at'),
+        db.Index('idx_chain_outbox_from_nonce', 'from_address', 'nonce'),
+    )
+
+    @property
+    def args(self):
+        """Deserialize JSON to list"""
+        return json.loads(self._args) if self._args else []
+
+    @args.setter
+    def args(self, value):
+        """Serialize list to JSON"""
+        self._args = json.dumps(value)
+
+    @property
+    def tx_hashes(self):
+        return json.loads(self._tx_hashes) if self._tx_hashes else []
+
+    def record_broadcast(self, tx_hash, raw_tx):
+        """Remember a newly signed transaction for this entry's nonce."""
+        hashes = self.tx_hashes
+        if tx_hash not in hashes:
+            hashes.append(tx_hash)
+        self._tx_hashes = json.dumps(hashes)
+        self.tx_hash = tx_hash
+        self.raw_tx = raw_tx
+
+    def __repr__(self):
+        return f'<ChainOutbox {self.id} {self.dedupe_key} {self.status.value} nonce={self.nonce}>'
+
+
+class ChainAccount(db.Model):
+    """
+    Local nonce counter and publisher lease for a signing address.
+
+    next_nonce is the nonce the next outbox entry will get. The lease makes
+    sure only one process (of all Gunicorn workers running the scheduler)
+    publishes for an address at a time.
+    """
+    __tablename__ = 'chain_account'
+
+    address = db.Column(db.String(42), primary_key=True)
+    next_nonce = db.Column(db.Integer, default=0, nullable=False)
+    lease_owner = db.Column(db.String(100), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ChainAccount {self.address} next_nonce={self.next_nonce}>'
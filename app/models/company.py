@@ -305,6 +305,7 @@ class JobOffer(db.Model):
         CheckConstraint('wage_per_pp > 0', name='check_wage_pp_positive'),
         CheckConstraint('minimum_skill_level >= 0', name='check_min_skill_positive'),
         CheckConstraint('positions > 0', name='check_positions_positive'),
+        db.Index('idx_job_offer_active_wage', 'is_active', 'wage_per_pp', 'id'),  # Keyset-paged job market
     )
 
     @property
@@ -0,0 +1,52 @@
+# app/models/country_stats.py
+"""
+Materialized per-country statistics shown on the country page.
+
+Rows are kept current incrementally by CountryStatsService (citizenship
+changes, travel, company open/close, region transfers) and rebuilt from
+scratch nightly to correct any drift. Experience gains are only picked up
+by the nightly rebuild.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class CountryStats(db.Model):
+    """One row of precomputed statistics per country."""
+    __tablename__ = 'country_stats'
+
+    country_id = db.Column(db.Integer, db.ForeignKey('country.id'), primary_key=True)
+
+    # Users currently located in regions the country owns
+    population = db.Column(db.Integer, default=0, nullable=False)
+    # Users holding this country's citizenship
+    citizen_count = db.Column(db.Integer, default=0, nullable=False)
+    # Sum of citizens' experience as of the last recompute (average level = total_experience / citizen_count)
+    total_experience = db.Column(db.BigInteger, default=0, nullable=False)
+    # Citizens registered on new_citizens_date
+    new_citizens_today = db.Column(db.Integer, default=0, nullable=False)
+    new_citizens_date = db.Column(db.Date, nullable=True)
+    # Regions currently owned
+    region_count = db.Column(db.Integer, default=0, nullable=False)
+    # Active (not dissolved) companies registered in the country
+    company_count = db.Column(db.Integer, default=0, nullable=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    recomputed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    country = db.relationship('Country', backref=db.backref('stats', uselist=False))
+
+    def __repr__(self):
+        return f'<CountryStats country={self.country_id} pop={self.population} citizens={self.citizen_count}>'
+
+    @property
+    def average_experience(self):
+        """Average citizen experience, or None if the country has no citizens."""
+        if not self.citizen_count:
+            return None
+        return self.total_experience / self.citizen_count
+
+    def new_citizens_on(self, day):
+        """New citizens for the given day (0 once the stored day has rolled over)."""
+        return self.new_citizens_today if self.new_citizens_date == day else 0
@@ -39,7 +39,12 @@ class UserCurrency(db.Model):
 
 
 class FinancialTransaction(db.Model):
-    """Immutable audit log of all financial transactions."""
+    """
+    Immutable audit log of all financial transactions.
+
+    On MySQL the table is partitioned by month (see TransactionHistoryService):
+    its primary key there is (id, timestamp) and the foreign keys are not enforced.
+    """
     __tablename__ = 'financial_transaction'
 
     id = db.Column(db.Integer, primary_key=True)
@@ -83,7 +88,8 @@ def log_transaction(user, transaction_type, amount, currency_type, balance_after
 
     Logs to both:
     1. Database (FinancialTransaction table) for permanent audit trail
-    2. Log files (transactions.log) for easy monitoring and analysis
+    2. Log files (transactions.log) for easy monitoring and analysis -
+       queued for the log pipeline's writer thread when it is enabled
     """
     # Create database record
     transaction = FinancialTransaction(
@@ -190,14 +190,9 @@ class GameEvent(db.Model):
         Get the combined multiplier for a setting from all active events.
         Multipliers stack multiplicatively.
         """
-        active_events = cls.get_active_events()
-        combined_multiplier = 1.0
+        from app.services.reference_data import reference_data
 
-        for event in active_events:
-            if event.affects_setting == setting_key:
-                combined_multiplier *= event.multiplier
-
-        return combined_multiplier
+        return reference_data.event_multiplier(setting_key)
 
     @classmethod
     def get_effective_multiplier(cls, setting_key, base_value=1.0):
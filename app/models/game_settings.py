@@ -39,17 +39,17 @@ class GameSettings(db.Model):
 
     @classmethod
     def get_value(cls, key, default=None):
-        """Get a setting value by key."""
-        setting = db.session.scalar(
-            db.select(cls).where(cls.key == key)
-        )
-        if setting:
+        """Get a setting value by key (served from the reference data registry)."""
+        from app.services.reference_data import reference_data
+
+        value = reference_data.setting(key)
+        if value is not None:
             # Convert string to appropriate type
-            if setting.value.lower() in ('true', '1', 'yes'):
+            if value.lower() in ('true', '1', 'yes'):
                 return True
-            elif setting.value.lower() in ('false', '0', 'no'):
+            elif value.lower() in ('false', '0', 'no'):
                 return False
-            return setting.value
+            return value
         return default
 
     @classmethod
@@ -73,6 +73,9 @@ class GameSettings(db.Model):
             )
             db.session.add(setting)
         db.session.commit()
+
+        from app.services.reference_data import reference_data
+        reference_data.bump_version()
         return setting
 
     @classmethod
@@ -310,6 +310,8 @@ class CongressMember(db.Model):
 
     __table_args__ = (
         db.Index('idx_country_current_congress', 'country_id', 'is_current'),
+        # Party seat counts
+        db.Index('idx_congress_party_current', 'party_id', 'is_current'),
     )
 
     def __repr__(self):
@@ -531,6 +533,9 @@ class Law(db.Model):
         )
         db.session.add(new_president)
 
+        from app.services.politics_read_model_service import PoliticsReadModelService
+        PoliticsReadModelService.on_government_change(self.country_id)
+
 
 class LawVote(db.Model):
     """Vote on a law proposal by politics or congress member."""
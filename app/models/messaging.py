@@ -19,6 +19,8 @@ class AlertType(str, enum.Enum):
     BOUNTY_COMPLETED = 'bounty_completed'
     ITEMS_RECEIVED = 'items_received'
     MISSION_COMPLETE = 'mission_complete'
+    COMPANY = 'company'
+    GOVERNMENT = 'government'
 
 
 class AlertPriority(str, enum.Enum):
@@ -62,6 +64,10 @@ class Message(db.Model):
     recipient = db.relationship('User', foreign_keys=[recipient_id], backref='received_messages')
     parent = db.relationship('Message', remote_side=[id], backref='replies')
 
+    __table_args__ = (
+        db.Index('idx_message_thread', 'sender_id', 'recipient_id', 'created_at', 'id'),  # Keyset-paged threads
+    )
+
     def __repr__(self):
         return f'<Message {self.id} from {self.sender_id} to {self.recipient_id}>'
 
@@ -121,6 +127,10 @@ class Alert(db.Model):
     # Relationships
     user = db.relationship('User', backref='alerts')
 
+    __table_args__ = (
+        db.Index('idx_alert_user_feed', 'user_id', 'is_deleted', 'created_at', 'id'),  # Keyset-paged alert list
+    )
+
     def __repr__(self):
         return f'<Alert {self.id} {self.alert_type.value} for user {self.user_id}>'
 
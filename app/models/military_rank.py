@@ -21,15 +21,17 @@ class MilitaryRank(db.Model):
 
     @staticmethod
     def get_rank_by_id(rank_id):
-        """Get rank by ID"""
-        return db.session.get(MilitaryRank, rank_id)
+        """Get rank by ID (read-only RankRef from the reference data registry)"""
+        from app.services.reference_data import reference_data
+        return reference_data.rank(rank_id)
 
     @staticmethod
     def get_next_rank(current_rank_id):
-        """Get the next rank after current rank"""
+        """Get the next rank after current rank (read-only RankRef)"""
         if current_rank_id >= 60:
             return None  # Already at max rank
-        return db.session.get(MilitaryRank, current_rank_id + 1)
+        from app.services.reference_data import reference_data
+        return reference_data.rank(current_rank_id + 1)
 
     @staticmethod
     def get_all_ranks():
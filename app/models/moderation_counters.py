@@ -0,0 +1,79 @@
+# app/models/moderation_counters.py
+"""
+Denormalized support ticket and report counters for the staff statistics page.
+
+Rows are kept current by ModerationStatsService in the same transaction as
+each ticket or report state change, and rebuilt from scratch nightly to
+correct any drift.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+# Bucket of the row holding the current totals; day rows use 'YYYY-MM-DD'
+ALL_BUCKET = 'all'
+
+
+class ModerationCounters(db.Model):
+    """
+    One row of current totals (bucket 'all') plus one row per day.
+
+    The 'all' row counts live (not deleted) tickets and reports by status
+    and type. A day row only uses tickets_total / reports_total: the number
+    submitted that day.
+    """
+    __tablename__ = 'moderation_counters'
+
+    bucket = db.Column(db.String(10), primary_key=True)
+
+    # Tickets by status
+    tickets_total = db.Column(db.Integer, default=0, nullable=False)
+    tickets_open = db.Column(db.Integer, default=0, nullable=False)
+    tickets_in_progress = db.Column(db.Integer, default=0, nullable=False)
+    tickets_awaiting_response = db.Column(db.Integer, default=0, nullable=False)
+    tickets_resolved = db.Column(db.Integer, default=0, nullable=False)
+    tickets_closed = db.Column(db.Integer, default=0, nullable=False)
+    tickets_archived = db.Column(db.Integer, default=0, nullable=False)
+
+    # Tickets with resolved_at set, and the sum of their created -> resolved times
+    tickets_timed = db.Column(db.Integer, default=0, nullable=False)
+    resolution_seconds = db.Column(db.BigInteger, default=0, nullable=False)
+
+    # Ticket ratings (1-5 stars)
+    ratings_count = db.Column(db.Integer, default=0, nullable=False)
+    ratings_sum = db.Column(db.Integer, default=0, nullable=False)
+
+    # Reports by status
+    reports_total = db.Column(db.Integer, default=0, nullable=False)
+    reports_pending = db.Column(db.Integer, default=0, nullable=False)
+    reports_under_review = db.Column(db.Integer, default=0, nullable=False)
+    reports_resolved = db.Column(db.Integer, default=0, nullable=False)
+    reports_dismissed = db.Column(db.Integer, default=0, nullable=False)
+
+    # Reports by type
+    reports_message = db.Column(db.Integer, default=0, nullable=False)
+    reports_newspaper_article = db.Column(db.Integer, default=0, nullable=False)
+    reports_article_comment = db.Column(db.Integer, default=0, nullable=False)
+    reports_user_profile = db.Column(db.Integer, default=0, nullable=False)
+    reports_company = db.Column(db.Integer, default=0, nullable=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    recomputed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ModerationCounters {self.bucket} tickets={self.tickets_total} reports={self.reports_total}>'
+
+    @staticmethod
+    def ticket_status_column(status):
+        """Column name counting tickets in a TicketStatus."""
+        return f'tickets_{status.value}'
+
+    @staticmethod
+    def report_status_column(status):
+        """Column name counting reports in a ReportStatus."""
+        return f'reports_{status.value}'
+
+    @staticmethod
+    def report_type_column(report_type):
+        """Column name counting reports of a ReportType."""
+        return f'reports_{report_type.value}'
@@ -36,7 +36,9 @@ class NFTInventory(db.Model):
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
-        from app.blockchain.nft_config import get_nft_name, get_nft_description, get_nft_image_url, get_nft_bonus_format
+        from app.blockchain.nft_config import (
+            get_nft_name, get_nft_description, get_nft_image_url, get_nft_thumbnail_url, get_nft_bonus_format
+        )
 
         return {
             'id': self.id,
@@ -56,7 +58,9 @@ class NFTInventory(db.Model):
             'metadata_uri': self.metadata_uri,
             'name': get_nft_name(self.nft_type, self.category, self.tier),
             'description': get_nft_description(self.nft_type, self.category, self.tier),
-            'image_url': get_nft_image_url(self.nft_type, self.category, self.tier)
+            'image_url': get_nft_image_url(self.nft_type, self.category, self.tier),
+            'thumbnail_url': get_nft_thumbnail_url(self.nft_type, self.category, self.tier, 256),
+            'thumbnail_url_2x': get_nft_thumbnail_url(self.nft_type, self.category, self.tier, 512)
         }
 
 
@@ -265,6 +269,12 @@ class NFTMarketplace(db.Model):
     seller = db.relationship('User', foreign_keys=[seller_id], backref=db.backref('nft_sales', lazy='dynamic'))
     buyer = db.relationship('User', foreign_keys=[buyer_id], backref=db.backref('nft_purchases', lazy='dynamic'))
 
+    __table_args__ = (
+        # Keyset-paged marketplace listings
+        db.Index('idx_marketplace_active_listed', 'is_active', 'listed_at', 'id'),
+        db.Index('idx_marketplace_active_price', 'is_active', 'price_zen', 'id'),
+    )
+
     def __repr__(self):
         return f'<NFTMarketplace {self.id}: NFT#{self.nft_id} {self.price_zen} ZEN>'
 
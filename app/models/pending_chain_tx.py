@@ -0,0 +1,103 @@
+# app/models/pending_chain_tx.py
+"""
+User-submitted blockchain transactions waiting to be confirmed.
+
+When a player mints, upgrades, lists, buys or cancels through their wallet,
+the request handler only records the transaction hash with what the game
+expects it to do (a PendingChainTx row) and answers 202 with a status URL.
+A single background watcher (see ChainTxWatcher) polls receipts for all
+outstanding hashes once per new block and, once a transaction has enough
+confirmations, verifies it and applies the game-side effects in the same
+database transaction that marks the row confirmed.
+"""
+
+import json
+from datetime import datetime
+from enum import Enum as PyEnum
+from app.extensions import db
+
+
+class PendingChainTxStatus(PyEnum):
+    """Lifecycle of a tracked transaction."""
+    PENDING = "pending"        # Not mined yet, or waiting for confirmations
+    CONFIRMED = "confirmed"    # Mined, verified and applied to game state
+    FAILED = "failed"          # Reverted, or mined but not what the game expected
+    EXPIRED = "expired"        # No receipt within the timeout
+
+
+class PendingChainTx(db.Model):
+    """One user transaction tracked until its game-side effects are applied."""
+    __tablename__ = 'pending_chain_tx'
+
+    id = db.Column(db.Integer, primary_key=True)
+    tx_hash = db.Column(db.String(66), unique=True, nullable=False)
+    kind = db.Column(db.String(30), nullable=False)  # Handler name, e.g. 'nft_mint', 'market_buy'
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True)
+    _params = db.Column('params', db.Text, nullable=False)   # JSON: what the transaction must do
+    _result = db.Column('result', db.Text, nullable=True)    # JSON: handler output shown to the client
+
+    status = db.Column(db.Enum(PendingChainTxStatus), default=PendingChainTxStatus.PENDING, nullable=False, index=True)
+    error = db.Column(db.Text, nullable=True)
+
+    first_seen_block = db.Column(db.BigInteger, nullable=True)  # Chain head when the watcher first saw it
+    block_number = db.Column(db.BigInteger, nullable=True)      # Block the transaction was mined in
+    attempts = db.Column(db.Integer, default=0, nullable=False)  # Finalization attempts that raised
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    finalized_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def params(self):
+        """Deserialize JSON to dict"""
+        return json.loads(self._params) if self._params else {}
+
+    @params.setter
+    def params(self, value):
+        """Serialize dict to JSON"""
+        self._params = json.dumps(value)
+
+    @property
+    def result(self):
+        return json.loads(self._result) if self._result else None
+
+    @result.setter
+    def result(self, value):
+        self._result = json.dumps(value) if value is not None else None
+
+    def to_dict(self):
+        """Status payload for the client."""
+        data = {
+            'tx_hash': self.tx_hash,
+            'kind': self.kind,
+            'status': self.status.value,
+            'success': self.status == PendingChainTxStatus.CONFIRMED,
+            'block_number': self.block_number,
+        }
+        if self.error:
+            data['error'] = self.error
+        if self.result:
+            data.update(self.result)
+        return data
+
+    def __repr__(self):
+        return f'<PendingChainTx {self.id} {self.kind} {self.tx_hash} {self.status.value}>'
+
+
+class ChainTxWatcherState(db.Model):
+    """
+    Watcher lease and the last block it processed.
+
+    Every Gunicorn worker runs the scheduler; the lease makes sure only one
+    of them polls the node at a time, and last_block makes a pass a no-op
+    until a new block arrives.
+    """
+    __tablename__ = 'chain_tx_watcher'
+
+    name = db.Column(db.String(40), primary_key=True)
+    last_block = db.Column(db.BigInteger, nullable=True)
+    lease_owner = db.Column(db.String(100), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ChainTxWatcherState {self.name} last_block={self.last_block}>'
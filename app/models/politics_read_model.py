@@ -0,0 +1,137 @@
+# app/models/politics_read_model.py
+"""
+Precomputed politics data read by the party, election and government pages.
+
+- PartyRoster: member count, experience and level sums and congress seats
+  per party.
+- ElectionSummary / ElectionTally: candidate and vote counts per election,
+  and regular and ZK votes per candidate (ZK vote choices already mapped
+  from their 1-based ballot index to the candidate).
+- GovernmentComposition: the current president, cabinet and congress
+  party distribution per country.
+
+Rows are kept current by PoliticsReadModelService in the same transaction as
+each join, leave, candidacy, vote and appointment, and rebuilt from scratch
+nightly to correct any drift.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class PartyRoster(db.Model):
+    """One row of membership totals per party."""
+    __tablename__ = 'party_roster'
+
+    party_id = db.Column(db.Integer, db.ForeignKey('political_party.id'), primary_key=True)
+
+    member_count = db.Column(db.Integer, default=0, nullable=False)
+    # Sums over members (average level = level_sum / member_count)
+    total_experience = db.Column(db.BigInteger, default=0, nullable=False)
+    level_sum = db.Column(db.Integer, default=0, nullable=False)
+    # Current congress members elected for this party
+    congress_seats = db.Column(db.Integer, default=0, nullable=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    recomputed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    party = db.relationship('PoliticalParty', backref=db.backref('roster', uselist=False))
+
+    def __repr__(self):
+        return f'<PartyRoster party={self.party_id} members={self.member_count}>'
+
+    @property
+    def average_level(self):
+        """Average member level, or 0 if the party has no members."""
+        if not self.member_count:
+            return 0
+        return self.level_sum / self.member_count
+
+
+class ElectionSummary(db.Model):
+    """
+    Counts for one party or government election.
+
+    election_type uses the ZKVote values: 'party', 'presidential' or
+    'congressional'.
+    """
+    __tablename__ = 'election_summary'
+
+    election_type = db.Column(db.String(50), primary_key=True)
+    election_id = db.Column(db.Integer, primary_key=True)
+
+    # Party: all candidates; government: approved candidates
+    candidate_count = db.Column(db.Integer, default=0, nullable=False)
+    vote_count = db.Column(db.Integer, default=0, nullable=False)
+    zk_vote_count = db.Column(db.Integer, default=0, nullable=False)
+    # ZK votes attested on zkVerify (have an explorer link)
+    zk_proof_count = db.Column(db.Integer, default=0, nullable=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    recomputed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ElectionSummary {self.election_type}/{self.election_id} votes={self.total_votes}>'
+
+    @property
+    def total_votes(self):
+        return self.vote_count + self.zk_vote_count
+
+
+class ElectionTally(db.Model):
+    """
+    Votes for one candidate of an election.
+
+    candidate_key is PartyCandidate.user_id for party elections and
+    ElectionCandidate.id for government elections.
+    """
+    __tablename__ = 'election_tally'
+
+    election_type = db.Column(db.String(50), primary_key=True)
+    election_id = db.Column(db.Integer, primary_key=True)
+    candidate_key = db.Column(db.Integer, primary_key=True)
+
+    votes = db.Column(db.Integer, default=0, nullable=False)
+    zk_votes = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<ElectionTally {self.election_type}/{self.election_id} candidate={self.candidate_key}>'
+
+
+class GovernmentComposition(db.Model):
+    """Current holders of government positions in one country."""
+    __tablename__ = 'government_composition'
+
+    country_id = db.Column(db.Integer, db.ForeignKey('country.id'), primary_key=True)
+
+    president_id = db.Column(db.Integer, db.ForeignKey('country_presidents.id', ondelete='SET NULL'), nullable=True)
+
+    # Active Minister row per MinistryType
+    foreign_affairs_minister_id = db.Column(db.Integer, db.ForeignKey('ministers.id', ondelete='SET NULL'), nullable=True)
+    defence_minister_id = db.Column(db.Integer, db.ForeignKey('ministers.id', ondelete='SET NULL'), nullable=True)
+    finance_minister_id = db.Column(db.Integer, db.ForeignKey('ministers.id', ondelete='SET NULL'), nullable=True)
+
+    # Current congress
+    congress_size = db.Column(db.Integer, default=0, nullable=False)
+    congress_votes = db.Column(db.Integer, default=0, nullable=False)
+    congress_term_start = db.Column(db.DateTime, nullable=True)
+    congress_term_end = db.Column(db.DateTime, nullable=True)
+    # [{"party_id": 3, "seats": 7, "votes": 1234}, ...] by seats descending
+    party_seats = db.Column(db.JSON, nullable=False, default=list)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    recomputed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<GovernmentComposition country={self.country_id} congress={self.congress_size}>'
+
+    @staticmethod
+    def minister_column(ministry_type):
+        """Column name holding the minister of a MinistryType."""
+        return f'{ministry_type.value}_minister_id'
+
+    def minister_ids(self):
+        """Map ministry value ('foreign_affairs', ...) -> Minister id or None."""
+        from app.models.government import MinistryType
+
+        return {m.value: getattr(self, self.minister_column(m)) for m in MinistryType}
@@ -1,5 +1,6 @@
 """Security logging models for tracking security events."""
 
+import logging
 from datetime import datetime
 from app.extensions import db
 from enum import Enum
@@ -139,6 +140,10 @@ def log_security_event(
     """
     Log a security event to the database.
 
+    With the log pipeline running the row is handed to the background writer,
+    which bulk-inserts it in its own transaction; otherwise it is added and
+    committed through the current session.
+
     Args:
         event_type: SecurityEventType enum value
         message: Human-readable description of the event
@@ -153,22 +158,33 @@ def log_security_event(
         details: Additional structured data as dict (optional)
 
     Returns:
-        SecurityLog object
+        SecurityLog object, or None when queued (or on failure)
     """
+    from app.logging_config import get_log_pipeline, get_security_db_logger
+
+    row = {
+        'created_at': datetime.utcnow(),
+        'event_type': event_type,
+        'severity': severity,
+        'message': message,
+        'user_id': user_id,
+        'username': username,
+        'wallet_address': wallet_address,
+        'ip_address': ip_address,
+        'user_agent': user_agent,
+        'endpoint': endpoint,
+        'http_method': http_method,
+        'details': details,
+        'resolved': False,
+    }
+
+    if get_log_pipeline() is not None:
+        level = logging.getLevelName(severity.name) if isinstance(severity, SecurityLogSeverity) else logging.INFO
+        get_security_db_logger().log(level, message, extra={'security_event': row})
+        return None
+
     try:
-        log_entry = SecurityLog(
-            event_type=event_type,
-            severity=severity,
-            message=message,
-            user_id=user_id,
-            username=username,
-            wallet_address=wallet_address,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            endpoint=endpoint,
-            http_method=http_method,
-            details=details
-        )
+        log_entry = SecurityLog(**row)
 
         db.session.add(log_entry)
         db.session.commit()
@@ -0,0 +1,25 @@
+# app/models/shared_version.py
+"""
+Cross-process invalidation counters for per-process caches.
+
+Each row is one named counter (e.g. 'username_index'). Services that keep a
+copy of database state in process memory bump their counter in the same
+transaction as the change, and other processes reload when the counter they
+read differs from the one their copy was built at. See
+app/services/shared_versions.py.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class SharedVersion(db.Model):
+    """One named version counter."""
+    __tablename__ = 'shared_version'
+
+    name = db.Column(db.String(40), primary_key=True)
+    version = db.Column(db.BigInteger, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<SharedVersion {self.name}={self.version}>'
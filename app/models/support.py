@@ -133,6 +133,14 @@ class SupportTicket(db.Model):
     responses = db.relationship('TicketResponse', backref='ticket', lazy='dynamic', order_by='TicketResponse.created_at')
     audit_logs = db.relationship('TicketAuditLog', backref='ticket', lazy='dynamic', order_by='TicketAuditLog.created_at.desc()')
 
+    __table_args__ = (
+        # Staff queue: priority then newest first, optionally for one status
+        db.Index('idx_ticket_queue', 'is_deleted', 'priority', 'created_at'),
+        db.Index('idx_ticket_status_queue', 'status', 'is_deleted', 'priority', 'created_at'),
+        # Staff view of one user's tickets
+        db.Index('idx_ticket_user_history', 'user_id', 'is_deleted', 'created_at'),
+    )
+
     @staticmethod
     def generate_ticket_number():
         """Generate a unique ticket number like TKT-2025-00001."""
@@ -177,6 +185,11 @@ class TicketResponse(db.Model):
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        # Staff performance: tickets answered per staff member
+        db.Index('idx_ticket_response_staff', 'is_staff_response', 'user_id', 'ticket_id'),
+    )
+
     def __repr__(self):
         return f'<TicketResponse {self.id} on Ticket {self.ticket_id}>'
 
@@ -285,6 +298,16 @@ class Report(db.Model):
     reported_comment = db.relationship('ArticleComment', backref=db.backref('reports', lazy='dynamic'))
     reported_company = db.relationship('Company', backref=db.backref('reports', lazy='dynamic'))
 
+    __table_args__ = (
+        # Staff queue: newest first, optionally for one status or type
+        db.Index('idx_report_queue', 'is_deleted', 'created_at'),
+        db.Index('idx_report_status_queue', 'status', 'is_deleted', 'created_at'),
+        db.Index('idx_report_type_queue', 'report_type', 'is_deleted', 'created_at'),
+        # Staff view of one user's reports (most reported users, user history)
+        db.Index('idx_report_against_user', 'reported_user_id', 'is_deleted', 'created_at'),
+        db.Index('idx_report_by_reporter', 'reporter_id', 'is_deleted', 'created_at'),
+    )
+
     @staticmethod
     def generate_report_number():
         """Generate a unique report number like RPT-2025-00001."""
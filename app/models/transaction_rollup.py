@@ -0,0 +1,63 @@
+# app/models/transaction_rollup.py
+"""
+Daily rollups of the financial_transaction audit log, and the record of
+archived months.
+
+financial_transaction is range-partitioned by month on MySQL. Completed
+days are summarized into these tables by a nightly job (see
+TransactionHistoryService), so admin reports read the rollups plus the
+recent raw rows instead of scanning the whole history. Old monthly
+partitions are exported to compressed files and dropped; each export is
+recorded in transaction_archive.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import Numeric
+from app.extensions import db
+
+
+class TransactionDailyUser(db.Model):
+    """Per-user totals for one day, transaction type and currency."""
+    __tablename__ = 'transaction_daily_user'
+
+    day = db.Column(db.Date, primary_key=True)
+    user_id = db.Column(db.Integer, primary_key=True, index=True)
+    transaction_type = db.Column(db.String(30), primary_key=True)
+    currency_type = db.Column(db.String(10), primary_key=True)
+
+    tx_count = db.Column(db.Integer, default=0, nullable=False)
+    total_amount = db.Column(Numeric(24, 8), default=Decimal('0'), nullable=False)
+
+    def __repr__(self):
+        return f'<TransactionDailyUser {self.day} user={self.user_id} {self.transaction_type} {self.total_amount} {self.currency_type}>'
+
+
+class TransactionDailyType(db.Model):
+    """Economy-wide totals for one day, transaction type and currency."""
+    __tablename__ = 'transaction_daily_type'
+
+    day = db.Column(db.Date, primary_key=True)
+    transaction_type = db.Column(db.String(30), primary_key=True)
+    currency_type = db.Column(db.String(10), primary_key=True)
+
+    tx_count = db.Column(db.Integer, default=0, nullable=False)
+    user_count = db.Column(db.Integer, default=0, nullable=False)
+    total_amount = db.Column(Numeric(24, 8), default=Decimal('0'), nullable=False)
+
+    def __repr__(self):
+        return f'<TransactionDailyType {self.day} {self.transaction_type} {self.total_amount} {self.currency_type}>'
+
+
+class TransactionArchive(db.Model):
+    """One month of financial_transaction rows exported to a compressed file and removed."""
+    __tablename__ = 'transaction_archive'
+
+    month = db.Column(db.String(7), primary_key=True)  # 'YYYY-MM'
+    file_path = db.Column(db.String(500), nullable=False)
+    row_count = db.Column(db.Integer, nullable=False)
+    sha256 = db.Column(db.String(64), nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<TransactionArchive {self.month} rows={self.row_count}>'
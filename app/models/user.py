@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from flask_login import UserMixin
 from sqlalchemy import Numeric, CheckConstraint, Index, select, func
+from sqlalchemy.orm import validates
 
 # Assuming db is initialized in extensions and imported in models/__init__
 from . import db # Use relative import
@@ -46,6 +47,8 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     wallet_address = db.Column(db.String(42), unique=True, index=True, nullable=False)
     username = db.Column(db.String(30), index=True, unique=True, nullable=True)
+    # Lower-cased copy of username so prefix searches use a plain B-tree index (kept in sync by _sync_username_lower)
+    username_lower = db.Column(db.String(30), index=True, nullable=True)
     description = db.Column(db.Text, nullable=True)
     avatar = db.Column(db.Boolean, default=False)
     profile_background = db.Column(db.String(20), default='default', nullable=False)  # military, political, economic, default
@@ -176,6 +179,23 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
         Index('idx_last_studied', 'last_studied'),
     )
 
+    @validates('username')
+    def _sync_username_lower(self, key, value):
+        self.username_lower = value.lower() if value else None
+        return value
+
+    def soft_delete(self):
+        super().soft_delete()
+        from app.services.username_index import username_index
+        username_index.stage_change(self.id, self.username, deleted=True)
+        return self
+
+    def restore(self):
+        super().restore()
+        from app.services.username_index import username_index
+        username_index.stage_change(self.id, self.username, deleted=False)
+        return self
+
     # --- Properties ---
     # (Leveling properties remain the same)
     @property
@@ -499,6 +519,11 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
         # Add experience
         self.experience += amount
 
+        # Keep their party's roster current (the country's average level is
+        # refreshed by the nightly country stats recompute)
+        from app.services.politics_read_model_service import PoliticsReadModelService
+        PoliticsReadModelService.on_experience_gain(self, amount, old_level)
+
         # Check if user leveled up
         new_level = self.level
         leveled_up = new_level > old_level
@@ -676,7 +701,9 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
                 return False, "Invalid destination region."
 
             # Verify the region is associated with a country
-            if not destination_region.current_owner:
+            from app.services.world_graph import get_world_graph
+            destination_owner_id = get_world_graph().owner(destination_region_id)
+            if not destination_owner_id:
                 logger.error(f"Destination region {destination_region_id} has no current owner for user {self.id}")
                 return False, "Invalid destination region - no owning country."
 
@@ -700,10 +727,14 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
                 else:
                     logger.info(f"User {self.id} traveled free (Travel Discount NFT)")
 
+            previous_region_id = self.current_region_id
             self.current_region_id = destination_region_id
 
+            from app.services.country_stats_service import CountryStatsService
+            CountryStatsService.on_location_change(previous_region_id, destination_region_id)
+
             # Track visited country for Explorer achievement
-            destination_country = destination_region.current_owner
+            destination_country = db.session.get(Country, destination_owner_id)
             if destination_country:
                 # Check if already visited using efficient query
                 already_visited = self.visited_countries.filter_by(id=destination_country.id).first() is not None
@@ -1063,12 +1094,8 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
         leveled_up, new_level = self.add_experience(xp_gain)
 
         # Track training streak for achievements
-        from app.services.achievement_service import AchievementService
-        try:
-            AchievementService.track_training_streak(self)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Error tracking training achievement for user {self.id}: {e}")
+        from app.services.progress_events import track_streak
+        track_streak(self, 'training')
 
         message = f"Trained {skill_type} for {hours} hours. Gained {skill_gain:.2f} skill and {xp_gain} XP. Energy: -{energy_cost}"
 
@@ -1125,12 +1152,8 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
         leveled_up, new_level = self.add_experience(xp_gain)
 
         # Track study streak for achievements
-        from app.services.achievement_service import AchievementService
-        try:
-            AchievementService.track_study_streak(self)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Error tracking study achievement for user {self.id}: {e}")
+        from app.services.progress_events import track_streak
+        track_streak(self, 'study')
 
         message = f"Studied {skill_type.replace('_', ' ')} for {hours} hours. Gained {skill_gain:.2f} skill and {xp_gain} XP. Energy: -{energy_cost}"
 
@@ -1462,7 +1485,7 @@ class User(SoftDeleteMixin, UserMixin, db.Model):
         """
         from app.models.military_rank import MilitaryRank
 
-        current_rank = self.rank
+        current_rank = MilitaryRank.get_rank_by_id(self.military_rank_id)
         next_rank = MilitaryRank.get_next_rank(self.military_rank_id) if self.military_rank_id < 60 else None
 
         if not next_rank:
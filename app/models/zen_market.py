@@ -81,40 +81,51 @@ class ZenMarket(db.Model):
         except (TypeError, ValueError):
             return 0
 
-    def update_price_level(self, zen_amount, is_buy):
+    @classmethod
+    def price_level_after(cls, price_level, progress, zen_amount, is_buy, volume_per_level):
         """
-        Updates price level based on transaction volume.
+        Price level and progress after trading zen_amount, without walking level by level.
 
-        Args:
-            zen_amount (Decimal): Amount of ZEN traded
-            is_buy (bool): True if user is buying ZEN, False if selling
+        Buying past MAX_PRICE_LEVEL pins progress at the top of the last level;
+        selling past MIN_PRICE_LEVEL pins it at 0.
+
+        Returns:
+            tuple: (price_level, progress_within_level)
         """
         zen_amount_int = int(zen_amount)
 
         if is_buy:
             # Buying ZEN increases price
-            self.progress_within_level += zen_amount_int
-            while self.progress_within_level >= self.volume_per_level:
-                self.progress_within_level -= self.volume_per_level
-                # Prevent price level from exceeding maximum
-                if self.price_level < self.MAX_PRICE_LEVEL:
-                    self.price_level += 1
-                else:
-                    # At max level, cap progress to prevent further increases
-                    self.progress_within_level = self.volume_per_level - 1
-                    break
-        else:
-            # Selling ZEN decreases price
-            self.progress_within_level -= zen_amount_int
-            while self.progress_within_level < 0:
-                if self.price_level > self.MIN_PRICE_LEVEL:
-                    self.price_level -= 1
-                    self.progress_within_level += self.volume_per_level
-                else:
-                    # At min level, cap progress to prevent further decreases
-                    self.progress_within_level = 0
-                    break
+            progress += zen_amount_int
+            levels = progress // volume_per_level
+            if levels == 0:
+                return price_level, progress
+            if price_level + levels > cls.MAX_PRICE_LEVEL:
+                # At max level, cap progress to prevent further increases
+                return max(price_level, cls.MAX_PRICE_LEVEL), volume_per_level - 1
+            return price_level + levels, progress % volume_per_level
+
+        # Selling ZEN decreases price
+        progress -= zen_amount_int
+        if progress >= 0:
+            return price_level, progress
+        levels = (volume_per_level - 1 - progress) // volume_per_level
+        if price_level - levels < cls.MIN_PRICE_LEVEL:
+            # At min level, cap progress to prevent further decreases
+            return min(price_level, cls.MIN_PRICE_LEVEL), 0
+        return price_level - levels, progress + levels * volume_per_level
+
+    def update_price_level(self, zen_amount, is_buy):
+        """
+        Updates price level based on transaction volume.
 
+        Args:
+            zen_amount (Decimal): Amount of ZEN traded
+            is_buy (bool): True if user is buying ZEN, False if selling
+        """
+        self.price_level, self.progress_within_level = self.price_level_after(
+            int(self.price_level), int(self.progress_within_level), zen_amount, is_buy, int(self.volume_per_level)
+        )
         self.updated_at = datetime.utcnow()
 
     def __repr__(self):
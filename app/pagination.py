@@ -0,0 +1,166 @@
+"""
+Keyset (cursor) pagination.
+
+List endpoints page by the last row seen instead of OFFSET: each page is
+"the next `limit` rows after (sort value, id)" in a fixed order, so the
+database seeks straight to the position through an index on
+(..., sort column, id) and page 1,000 costs the same as page 1. The id is
+the tie-breaker that makes the order total, so rows sharing a sort value
+are neither skipped nor repeated.
+
+The position is handed to clients as an opaque cursor string (URL-safe
+base64 of a small JSON payload). Cursors are only ever decoded back into
+bound parameters; a malformed one raises InvalidCursor, which routes turn
+into a 400.
+
+Sort columns must be NOT NULL (NULLs do not compare).
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.extensions import db
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """A pagination cursor could not be decoded."""
+    pass
+
+
+class KeysetPage(NamedTuple):
+    """One page of rows and the cursor for the next one (None on the last page)."""
+    items: List[Any]
+    next_cursor: Optional[str]
+
+    @property
+    def has_more(self):
+        return self.next_cursor is not None
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'dec': str(value)}
+    return value
+
+
+def _decode_value(raw):
+    if isinstance(raw, dict) and len(raw) == 1:
+        (tag, text), = raw.items()
+        if not isinstance(text, str):
+            raise InvalidCursor("Malformed cursor value")
+        try:
+            if tag == 'dt':
+                return datetime.fromisoformat(text)
+            if tag == 'd':
+                return date.fromisoformat(text)
+            if tag == 'dec':
+                return Decimal(text)
+        except (ValueError, InvalidOperation):
+            raise InvalidCursor("Malformed cursor value")
+        raise InvalidCursor("Unknown cursor value type")
+    if raw is None or isinstance(raw, (bool, int, float, str)):
+        return raw
+    raise InvalidCursor("Malformed cursor value")
+
+
+def encode_cursor(sort_value, row_id):
+    """Encode a (sort value, id) position as an opaque cursor string."""
+    payload = json.dumps([_encode_value(sort_value), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor string back into (sort value, id). Raises InvalidCursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidCursor("Malformed cursor")
+    if not isinstance(payload, list) or len(payload) != 2:
+        raise InvalidCursor("Malformed cursor")
+    sort_raw, row_id = payload
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        raise InvalidCursor("Malformed cursor id")
+    return _decode_value(sort_raw), row_id
+
+
+def clamp_page_size(limit):
+    """Page size from a request argument, bounded to 1..MAX_PAGE_SIZE."""
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def keyset_paginate(query, sort_column, id_column, cursor=None, limit=DEFAULT_PAGE_SIZE,
+                    descending=True, row_key: Optional[Callable] = None):
+    """
+    Fetch one page of `query` ordered by (sort_column, id_column).
+
+    Args:
+        query: A select() or legacy Query with filters applied but no ORDER BY/LIMIT
+        sort_column: Column the list is sorted by (NOT NULL)
+        id_column: Unique tie-breaker column, usually the primary key
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Page size (clamped to MAX_PAGE_SIZE)
+        descending: Sort direction (applies to both columns)
+        row_key: Returns (sort value, id) for a result row; defaults to reading
+            the two column attributes from the row, so pass it when sorting
+            by a column of a joined table
+
+    Returns:
+        KeysetPage of rows and the next cursor
+
+    Raises:
+        InvalidCursor: if the cursor cannot be decoded
+    """
+    limit = clamp_page_size(limit)
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        # The leading inclusive bound is implied by the OR, but it is what lets
+        # the planner turn the condition into an index range seek
+        if descending:
+            after = and_(
+                sort_column <= sort_value,
+                or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id))
+            )
+        else:
+            after = and_(
+                sort_column >= sort_value,
+                or_(sort_column > sort_value, and_(sort_column == sort_value, id_column > row_id))
+            )
+        query = query.filter(after)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # One extra row tells us whether there is a next page
+    query = query.limit(limit + 1)
+    rows = query.all() if isinstance(query, Query) else db.session.scalars(query).all()
+
+    if len(rows) <= limit:
+        return KeysetPage(rows, None)
+
+    rows = rows[:limit]
+    last = rows[-1]
+    if row_key is None:
+        sort_value, row_id = getattr(last, sort_column.key), getattr(last, id_column.key)
+    else:
+        sort_value, row_id = row_key(last)
+    return KeysetPage(rows, encode_cursor(sort_value, row_id))
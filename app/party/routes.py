@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timezone
 from flask import render_template, redirect, url_for, flash, request, current_app, abort, jsonify
 from flask_login import current_user, login_required
+from sqlalchemy.orm import selectinload
 from werkzeug.utils import secure_filename
 from decimal import Decimal
 
@@ -11,9 +12,13 @@ from app.party import bp
 from app.extensions import db
 from app.models import PoliticalParty, PartyMembership, PartyElection, PartyCandidate, PartyVote, Country, User, ElectionStatus
 from app.models.government import GovernmentElection, GovernmentElectionStatus, ElectionCandidate, CandidateStatus
+from app.services.politics_read_model_service import PoliticsReadModelService, PARTY_ELECTION
 from app.party.forms import CreatePartyForm, EditPartyForm, AnnounceCandidacyForm, VoteForm
 from app.security import InputSanitizer
 
+# Members shown on the party page; the members page lists everyone
+DETAIL_MEMBER_LIMIT = 12
+
 
 @bp.route('/')
 @bp.route('/browse')
@@ -29,15 +34,19 @@ def browse():
         db.select(PoliticalParty)
         .where(PoliticalParty.country_id == current_user.citizenship_id)
         .where(PoliticalParty.is_deleted == False)
-        .order_by(PoliticalParty.id.desc())  # We'll sort by member count in Python
+        .options(selectinload(PoliticalParty.president))
+        .order_by(PoliticalParty.id.desc())
     ).all()
 
-    # Sort by member count (this could be optimized with a database query)
-    parties.sort(key=lambda p: p.member_count, reverse=True)
+    rosters = PoliticsReadModelService.get_rosters(p.id for p in parties)
+    member_counts = {p.id: rosters[p.id].member_count for p in parties}
+    parties.sort(key=lambda p: member_counts[p.id], reverse=True)
 
     return render_template('party/browse.html',
                           title='Political Parties',
-                          parties=parties)
+                          parties=parties,
+                          member_counts=member_counts,
+                          total_members=sum(member_counts.values()))
 
 
 @bp.route('/create', methods=['GET', 'POST'])
@@ -91,6 +100,7 @@ def create():
 
             # Update user's party_id to maintain consistency
             current_user.party_id = party.id
+            PoliticsReadModelService.on_member_joined(party.id, current_user)
 
             db.session.commit()
 
@@ -118,12 +128,16 @@ def detail(party_id):
         flash('Party not found.', 'danger')
         return redirect(url_for('party.browse'))
 
-    # Get all members (sort by experience since level is computed from it)
+    roster = PoliticsReadModelService.get_roster(party_id)
+
+    # Top members only (sort by experience since level is computed from it);
+    # counts and sums come from the roster
     members = db.session.scalars(
         db.select(User)
         .join(PartyMembership)
         .where(PartyMembership.party_id == party_id)
-        .order_by(User.experience.desc())
+        .order_by(User.experience.desc(), User.id.asc())
+        .limit(DETAIL_MEMBER_LIMIT)
     ).all()
 
     # Get current election (scheduled or active) if any
@@ -135,6 +149,7 @@ def detail(party_id):
         candidates = db.session.scalars(
             db.select(PartyCandidate)
             .where(PartyCandidate.election_id == current_election.id)
+            .options(selectinload(PartyCandidate.user))
         ).all()
 
         user_voted = False
@@ -163,14 +178,17 @@ def detail(party_id):
         db.select(PartyElection)
         .where(PartyElection.party_id == party_id)
         .where(PartyElection.status == ElectionStatus.COMPLETED)
+        .options(selectinload(PartyElection.winner))
         .order_by(PartyElection.end_time.desc())
         .limit(10)
     ).all()
 
     # Add helper properties to past elections
+    summaries = PoliticsReadModelService.get_election_summaries(PARTY_ELECTION, [e.id for e in past_elections])
     for election in past_elections:
-        election.vote_count = election.get_vote_count()
-        election.candidate_count = election.get_candidate_count()
+        summary = summaries[election.id]
+        election.vote_count = summary.vote_count
+        election.candidate_count = summary.candidate_count
         # For now, set congress_seats to 0 (will be implemented when congress elections are added)
         election.congress_seats = 0
 
@@ -178,7 +196,7 @@ def detail(party_id):
     active_country_elections = []
     if current_user.is_party_president and current_user.party and current_user.party.id == party_id:
         # Get elections in nominations/applications or voting status for the party's country
-        active_elections = db.session.scalars(
+        active_country_elections = db.session.scalars(
             db.select(GovernmentElection)
             .where(GovernmentElection.country_id == party.country_id)
             .where(GovernmentElection.status.in_([
@@ -189,21 +207,23 @@ def detail(party_id):
             .order_by(GovernmentElection.nominations_start.desc())
         ).all()
 
-        for election in active_elections:
-            # Count pending candidates from this party
-            pending_count = db.session.scalar(
-                db.select(db.func.count())
-                .select_from(ElectionCandidate)
-                .where(ElectionCandidate.election_id == election.id)
+        # Count pending candidates from this party, for all elections at once
+        pending_counts = {}
+        if active_country_elections:
+            pending_counts = dict(db.session.execute(
+                db.select(ElectionCandidate.election_id, db.func.count())
+                .where(ElectionCandidate.election_id.in_([e.id for e in active_country_elections]))
                 .where(ElectionCandidate.party_id == party_id)
                 .where(ElectionCandidate.status == CandidateStatus.PENDING)
-            )
-            election.pending_candidates = pending_count
-            active_country_elections.append(election)
+                .group_by(ElectionCandidate.election_id)
+            ).all())
+        for election in active_country_elections:
+            election.pending_candidates = pending_counts.get(election.id, 0)
 
     return render_template('party/detail.html',
                           title=party.name,
                           party=party,
+                          roster=roster,
                           members=members,
                           election_data=election_data,
                           can_join=can_join,
@@ -269,6 +289,7 @@ def join(party_id):
 
         # Update user's party_id to maintain consistency
         current_user.party_id = party_id
+        PoliticsReadModelService.on_member_joined(party_id, current_user)
 
         db.session.commit()
 
@@ -307,7 +328,7 @@ def leave(party_id):
 
     try:
         is_president = party.president_id == current_user.id
-        member_count = party.member_count
+        member_count = PoliticsReadModelService.get_roster(party_id).member_count
 
         # Remove membership
         membership = db.session.scalar(
@@ -318,6 +339,7 @@ def leave(party_id):
 
         if membership:
             db.session.delete(membership)
+            PoliticsReadModelService.on_member_left(party_id, current_user)
 
         # Update user's party_id to maintain consistency
         current_user.party_id = None
@@ -472,6 +494,8 @@ def announce_candidacy(party_id):
             user_id=current_user.id
         )
         db.session.add(candidate)
+        db.session.flush()
+        PoliticsReadModelService.on_candidacy_change(PARTY_ELECTION, election.id)
         db.session.commit()
 
         current_app.logger.info(f"User {current_user.id} announced candidacy for party {party_id} election {election.id}")
@@ -531,6 +555,8 @@ def withdraw_candidacy(party_id):
     try:
         # Remove candidacy
         db.session.delete(existing_candidacy)
+        db.session.flush()
+        PoliticsReadModelService.on_candidacy_change(PARTY_ELECTION, election.id)
         db.session.commit()
 
         current_app.logger.info(f"User {current_user.id} withdrew candidacy from party {party_id} election {election.id}")
@@ -652,6 +678,7 @@ def vote(party_id):
                 vote_signature=vote_signature
             )
             db.session.add(new_vote)
+            PoliticsReadModelService.on_vote(PARTY_ELECTION, election.id, candidate_id)
             db.session.commit()
 
             # Get candidate username
@@ -682,6 +709,7 @@ def vote(party_id):
                 candidate_id=form.candidate_id.data
             )
             db.session.add(new_vote)
+            PoliticsReadModelService.on_vote(PARTY_ELECTION, election.id, form.candidate_id.data)
             db.session.commit()
 
             current_app.logger.info(f"User {current_user.id} voted in election {election.id}")
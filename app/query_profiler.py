@@ -0,0 +1,286 @@
+"""
+Request-scoped SQL profiler and N+1 detector.
+
+Hooks SQLAlchemy's before/after_cursor_execute events and, for every request,
+records the number of queries, total DB time and how often each statement
+fingerprint (the SQL with literals and bound values stripped) was executed.
+A SELECT fingerprint repeated SQL_N_PLUS_ONE_THRESHOLD times or more in one
+request is flagged as a likely N+1 pattern.
+
+Results are exposed:
+- in X-SQL-* response headers (debug/testing, or for admins),
+- on the admin SQL profile page (per-endpoint aggregates for this process),
+- as per-endpoint query budgets (SQL_QUERY_BUDGETS) which raise
+  QueryBudgetExceeded when SQL_QUERY_BUDGET_ENFORCE is set (testing), so
+  query-count regressions fail the suite.
+
+query_budget() applies the same check to any block of code outside a request.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+from flask import g, request
+from flask_login import current_user
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+RECENT_SUSPECTS = 50  # Flagged requests kept for the admin page
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request or block issued more queries than its budget allows."""
+    pass
+
+
+# ----------------------------------------------------------------------
+# Statement fingerprints
+# ----------------------------------------------------------------------
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_BIND_PARAM = re.compile(r'%\(\w+\)s|%s|\?')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_POSTCOMPILE = re.compile(r'\(\s*__\[POSTCOMPILE_\w+\]\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(statement):
+    """Normalize a SQL statement so executions differing only in values compare equal."""
+    sql = _STRING_LITERAL.sub('?', statement)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _BIND_PARAM.sub('?', sql)
+    sql = _POSTCOMPILE.sub('(?)', sql)
+    sql = _IN_LIST.sub('IN (?)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+# ----------------------------------------------------------------------
+# Collection
+# ----------------------------------------------------------------------
+
+class QueryStats:
+    """Queries observed while a collector was active."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.fingerprints = Counter()
+        self.fingerprint_time = Counter()
+
+    def record(self, statement, duration):
+        fp = fingerprint(statement)
+        self.count += 1
+        self.total_time += duration
+        self.fingerprints[fp] += 1
+        self.fingerprint_time[fp] += duration
+
+    @property
+    def total_ms(self):
+        return self.total_time * 1000
+
+    def repeated(self, threshold=2):
+        """(fingerprint, count) pairs executed at least `threshold` times, most frequent first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+    def n_plus_one_suspects(self, threshold=DEFAULT_N_PLUS_ONE_THRESHOLD):
+        """Repeated SELECTs - the signature of loading related rows one at a time."""
+        return [(fp, n) for fp, n in self.repeated(threshold) if fp.upper().startswith('SELECT')]
+
+
+_local = threading.local()
+_listeners_installed = False
+_install_lock = threading.Lock()
+
+
+def _active_collectors():
+    collectors = getattr(_local, 'collectors', None)
+    if collectors is None:
+        collectors = _local.collectors = []
+    return collectors
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if getattr(_local, 'collectors', None):
+        conn.info.setdefault('_query_profiler_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = getattr(_local, 'collectors', None)
+    starts = conn.info.get('_query_profiler_start')
+    if not collectors or not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    for stats in collectors:
+        stats.record(statement, duration)
+
+
+def install_listeners():
+    """Attach the cursor execute hooks to every engine (idempotent)."""
+    global _listeners_installed
+    with _install_lock:
+        if _listeners_installed:
+            return
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        _listeners_installed = True
+
+
+def _start_collecting():
+    install_listeners()
+    stats = QueryStats()
+    _active_collectors().append(stats)
+    return stats
+
+
+def _stop_collecting(stats):
+    collectors = _active_collectors()
+    if stats in collectors:
+        collectors.remove(stats)
+
+
+@contextmanager
+def collect_queries():
+    """Count the queries issued by this thread inside the block."""
+    stats = _start_collecting()
+    try:
+        yield stats
+    finally:
+        _stop_collecting(stats)
+
+
+@contextmanager
+def query_budget(max_queries, label='block'):
+    """
+    Fail if the block issues more than max_queries queries.
+
+    Usage:
+        with query_budget(0):
+            ReferenceData.resources()
+    """
+    with collect_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(_budget_message(label, stats, max_queries))
+
+
+def _budget_message(label, stats, budget):
+    top = '; '.join(f'{n}x {fp[:120]}' for fp, n in stats.repeated(2)[:3])
+    return (f"{label} issued {stats.count} queries (budget {budget})"
+            + (f" - most repeated: {top}" if top else ''))
+
+
+# ----------------------------------------------------------------------
+# Per-process report (admin page)
+# ----------------------------------------------------------------------
+
+class ProfileReport:
+    """Per-endpoint aggregates and recently flagged N+1 requests for this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+            self._suspects = deque(maxlen=RECENT_SUSPECTS)
+            self.since = datetime.utcnow()
+
+    def record(self, endpoint, path, stats, suspects):
+        with self._lock:
+            entry = self._endpoints.get(endpoint)
+            if entry is None:
+                entry = self._endpoints[endpoint] = {
+                    'endpoint': endpoint, 'requests': 0, 'queries': 0,
+                    'max_queries': 0, 'db_ms': 0.0, 'max_db_ms': 0.0, 'n_plus_one': 0,
+                }
+            entry['requests'] += 1
+            entry['queries'] += stats.count
+            entry['max_queries'] = max(entry['max_queries'], stats.count)
+            entry['db_ms'] += stats.total_ms
+            entry['max_db_ms'] = max(entry['max_db_ms'], stats.total_ms)
+            if suspects:
+                entry['n_plus_one'] += 1
+                self._suspects.appendleft({
+                    'at': datetime.utcnow(), 'endpoint': endpoint, 'path': path,
+                    'queries': stats.count, 'suspects': suspects,
+                })
+
+    def endpoints(self):
+        """Endpoint aggregates, heaviest (average queries per request) first."""
+        with self._lock:
+            rows = [dict(e) for e in self._endpoints.values()]
+        for row in rows:
+            row['avg_queries'] = row['queries'] / row['requests']
+            row['avg_db_ms'] = row['db_ms'] / row['requests']
+        return sorted(rows, key=lambda r: r['avg_queries'], reverse=True)
+
+    def recent_suspects(self):
+        with self._lock:
+            return list(self._suspects)
+
+
+profile_report = ProfileReport()
+
+
+# ----------------------------------------------------------------------
+# Flask integration
+# ----------------------------------------------------------------------
+
+def init_query_profiler(app):
+    """Register the per-request hooks when SQL_PROFILER_ENABLED is set."""
+    if not app.config.get('SQL_PROFILER_ENABLED'):
+        return
+
+    install_listeners()
+    threshold = app.config.get('SQL_N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)
+
+    @app.before_request
+    def start_query_profile():
+        if request.endpoint == 'static':
+            return
+        g._query_stats = _start_collecting()
+
+    @app.after_request
+    def finish_query_profile(response):
+        stats = g.pop('_query_stats', None)
+        if stats is None:
+            return response
+        _stop_collecting(stats)
+
+        endpoint = request.endpoint or request.path
+        suspects = stats.n_plus_one_suspects(threshold)
+        profile_report.record(endpoint, request.path, stats, suspects)
+        if suspects:
+            fp, n = suspects[0]
+            logger.warning(f"Possible N+1 on {endpoint}: {n}x {fp[:200]} ({stats.count} queries total)")
+
+        if app.debug or app.testing or (current_user.is_authenticated and current_user.is_admin):
+            response.headers['X-SQL-Queries'] = str(stats.count)
+            response.headers['X-SQL-Time-Ms'] = f'{stats.total_ms:.1f}'
+            if suspects:
+                response.headers['X-SQL-N-Plus-One'] = str(len(suspects))
+
+        budget = app.config.get('SQL_QUERY_BUDGETS', {}).get(endpoint)
+        if budget is not None and stats.count > budget:
+            message = _budget_message(endpoint, stats, budget)
+            if app.config.get('SQL_QUERY_BUDGET_ENFORCE'):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
+
+    @app.teardown_request
+    def discard_query_profile(exc):
+        # after_request is skipped on unhandled errors; don't leak the collector
+        stats = g.pop('_query_stats', None)
+        if stats is not None:
+            _stop_collecting(stats)
@@ -0,0 +1,48 @@
+"""
+Chain Transaction Routes
+Status of user blockchain transactions awaiting confirmation
+"""
+from flask import Blueprint, jsonify, url_for
+from flask_login import login_required, current_user
+
+from app.models.pending_chain_tx import PendingChainTxStatus
+from app.services.chain_tx_tracker import ChainTxTracker
+
+chain_tx_bp = Blueprint('chain_tx', __name__, url_prefix='/api/chain-tx')
+
+
+def accepted_response(pending):
+    """
+    202 response for a tracked transaction.
+
+    The client polls status_url until status is no longer 'pending'; the
+    final payload has the same 'success'/'error' fields the synchronous
+    endpoints used to return. A hash that was already finalized (a retried
+    request) gets its final payload straight away.
+    """
+    status_url = url_for('chain_tx.get_status', tx_hash=pending.tx_hash)
+    data = pending.to_dict()
+    if pending.status != PendingChainTxStatus.PENDING:
+        return jsonify(data), 200 if data['success'] else 400
+
+    data.update({'pending': True, 'status_url': status_url, 'message': 'Waiting for blockchain confirmation...'})
+    response = jsonify(data)
+    response.status_code = 202
+    response.headers['Location'] = status_url
+    return response
+
+
+@chain_tx_bp.route('/<tx_hash>', methods=['GET'])
+@login_required
+def get_status(tx_hash):
+    """Status of one of the current user's tracked transactions"""
+    pending = ChainTxTracker.get_for_user(tx_hash, current_user.id)
+    if not pending:
+        return jsonify({
+            'success': False,
+            'error': 'Transaction not found'
+        }), 404
+
+    data = pending.to_dict()
+    data['pending'] = pending.status == PendingChainTxStatus.PENDING
+    return jsonify(data)
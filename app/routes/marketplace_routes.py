@@ -5,6 +5,9 @@ Handles P2P NFT trading marketplace
 from flask import Blueprint, render_template, request, jsonify, session
 from flask_login import login_required, current_user
 from app.services.nft_service import NFTService
+from app.services.chain_tx_tracker import ChainTxTracker
+from app.routes.chain_tx_routes import accepted_response
+from app.pagination import InvalidCursor
 from app.blockchain.marketplace_contract import get_marketplace_fee, calculate_marketplace_fee
 from decimal import Decimal
 import logging
@@ -36,6 +39,8 @@ def get_listings():
         - max_price: Maximum price in ZEN
         - sort_by: 'listed_at', 'price_zen', 'tier'
         - sort_order: 'asc' or 'desc'
+        - cursor: next_cursor from the previous page (omit for the first page)
+        - limit: Page size (max 100)
     """
     try:
         # Get filters from query params
@@ -48,8 +53,8 @@ def get_listings():
         sort_by = request.args.get('sort_by', 'listed_at')
         sort_order = request.args.get('sort_order', 'desc')
 
-        # Get listings
-        listings = NFTService.get_marketplace_listings(
+        # Get one page of listings
+        page = NFTService.get_marketplace_listings(
             nft_type=nft_type,
             category=category,
             min_tier=min_tier,
@@ -57,19 +62,28 @@ def get_listings():
             min_price=min_price,
             max_price=max_price,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', 24, type=int)
         )
 
         # Convert to dict
-        listings_data = [listing.to_dict() for listing in listings]
+        listings_data = [listing.to_dict() for listing in page.items]
 
         return jsonify({
             'success': True,
             'listings': listings_data,
             'count': len(listings_data),
+            'next_cursor': page.next_cursor,
             'current_user_id': current_user.id
         })
 
+    except InvalidCursor:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid cursor'
+        }), 400
+
     except Exception as e:
         logger.error(f"Error getting marketplace listings: {e}")
         return jsonify({
@@ -157,14 +171,12 @@ def list_nft():
                 'error': 'Please connect your wallet first'
             }), 400
 
-        # List NFT
-        listing, error = NFTService.list_nft_on_marketplace(
-            user_id=current_user.id,
-            wallet_address=current_user.wallet_address,
-            nft_id=nft_id,
-            price_zen=price_zen,
-            tx_hash=tx_hash
-        )
+        # Track the listing transaction; the listing is created once it is confirmed
+        pending, error = ChainTxTracker.track('market_list', tx_hash, current_user.id, {
+            'wallet_address': current_user.wallet_address,
+            'nft_id': nft_id,
+            'price_zen': str(price_zen_decimal)
+        })
 
         if error:
             return jsonify({
@@ -172,11 +184,7 @@ def list_nft():
                 'error': error
             }), 400
 
-        return jsonify({
-            'success': True,
-            'message': 'NFT listed successfully',
-            'listing': listing.to_dict()
-        })
+        return accepted_response(pending)
 
     except Exception as e:
         logger.error(f"Error listing NFT: {e}")
@@ -216,24 +224,19 @@ def buy_nft():
                 'error': 'Please connect your wallet first'
             }), 400
 
-        # Purchase NFT
-        success, error = NFTService.buy_nft_from_marketplace(
-            buyer_id=current_user.id,
-            buyer_wallet=current_user.wallet_address,
-            listing_id=listing_id,
-            tx_hash=tx_hash
-        )
+        # Track the purchase transaction; ownership moves once it is confirmed
+        pending, error = ChainTxTracker.track('market_buy', tx_hash, current_user.id, {
+            'wallet_address': current_user.wallet_address,
+            'listing_id': listing_id
+        })
 
-        if not success:
+        if error:
             return jsonify({
                 'success': False,
                 'error': error
             }), 400
 
-        return jsonify({
-            'success': True,
-            'message': 'NFT purchased successfully!'
-        })
+        return accepted_response(pending)
 
     except Exception as e:
         logger.error(f"Error purchasing NFT: {e}")
@@ -273,24 +276,19 @@ def cancel_listing():
                 'error': 'Please connect your wallet first'
             }), 400
 
-        # Cancel listing
-        success, error = NFTService.cancel_marketplace_listing(
-            user_id=current_user.id,
-            wallet_address=current_user.wallet_address,
-            listing_id=listing_id,
-            tx_hash=tx_hash
-        )
+        # Track the cancel transaction; the listing is closed once it is confirmed
+        pending, error = ChainTxTracker.track('market_cancel', tx_hash, current_user.id, {
+            'wallet_address': current_user.wallet_address,
+            'listing_id': listing_id
+        })
 
-        if not success:
+        if error:
             return jsonify({
                 'success': False,
                 'error': error
             }), 400
 
-        return jsonify({
-            'success': True,
-            'message': 'Listing cancelled successfully'
-        })
+        return accepted_response(pending)
 
     except Exception as e:
         logger.error(f"Error cancelling listing: {e}")
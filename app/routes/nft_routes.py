@@ -9,6 +9,8 @@ from flask_login import login_required, current_user
 from app import db
 from app.services.nft_service import NFTService
 from app.services.bonus_calculator import BonusCalculator
+from app.services.chain_tx_tracker import ChainTxTracker
+from app.routes.chain_tx_routes import accepted_response
 from app.models.nft import NFTInventory, PlayerNFTSlots, CompanyNFTSlots, NFTMarketplace
 
 nft_bp = Blueprint('nft', __name__, url_prefix='/api/nft')
@@ -110,10 +112,15 @@ def get_inventory():
                 db.session.commit()
             nfts = verified_nfts
 
-    # Get IDs of NFTs currently listed on marketplace
-    listed_nft_ids = set(
-        listing.nft_id for listing in NFTMarketplace.query.filter_by(is_active=True).all()
-    )
+    # Get IDs of this user's NFTs currently listed on marketplace
+    listed_nft_ids = set()
+    if nfts:
+        listed_nft_ids = set(db.session.scalars(
+            db.select(NFTMarketplace.nft_id).where(
+                NFTMarketplace.is_active == True,
+                NFTMarketplace.nft_id.in_([nft.id for nft in nfts])
+            )
+        ))
 
     # Add marketplace listing status to each NFT
     nft_list = []
@@ -198,15 +205,12 @@ def purchase_nft():
             'error': 'Missing transaction hash. Please complete payment first.'
         }), 400
 
-    # Purchase NFT using blockchain integration
-    nft, error = NFTService.purchase_nft_blockchain(
-        user_id=current_user.id,
-        wallet_address=current_user.wallet_address,
-        tier=1,  # Force Q1
-        nft_type=nft_type,
-        category=None,  # Force random category
-        tx_hash=tx_hash  # Verify payment transaction
-    )
+    # Track the mint transaction; the NFT is saved once it is confirmed
+    pending, error = ChainTxTracker.track('nft_mint', tx_hash, current_user.id, {
+        'wallet_address': current_user.wallet_address,
+        'tier': 1,  # Force Q1
+        'nft_type': nft_type
+    })
 
     if error:
         return jsonify({
@@ -214,12 +218,7 @@ def purchase_nft():
             'error': error
         }), 400
 
-    return jsonify({
-        'success': True,
-        'nft': nft.to_dict(),
-        'message': f'Successfully purchased {nft.nft_type} NFT!',
-        'token_id': nft.token_id
-    })
+    return accepted_response(pending)
 
 
 @nft_bp.route('/free-mints', methods=['GET'])
@@ -349,13 +348,11 @@ def upgrade_nft():
             'error': 'Missing transaction hash. Please complete upgrade on blockchain first.'
         }), 400
 
-    # Upgrade NFT using blockchain integration
-    new_nft, error = NFTService.upgrade_nft_blockchain(
-        user_id=current_user.id,
-        wallet_address=current_user.wallet_address,
-        nft_ids=nft_ids,
-        tx_hash=tx_hash
-    )
+    # Track the upgrade transaction; the inventory is updated once it is confirmed
+    pending, error = ChainTxTracker.track('nft_upgrade', tx_hash, current_user.id, {
+        'wallet_address': current_user.wallet_address,
+        'nft_ids': nft_ids
+    })
 
     if error:
         return jsonify({
@@ -363,12 +360,7 @@ def upgrade_nft():
             'error': error
         }), 400
 
-    return jsonify({
-        'success': True,
-        'nft': new_nft.to_dict(),
-        'message': f'Successfully upgraded to Q{new_nft.tier} NFT!',
-        'token_id': new_nft.token_id
-    })
+    return accepted_response(pending)
 
 
 @nft_bp.route('/equip/profile', methods=['POST'])
@@ -701,29 +693,52 @@ def get_nft_stats():
     })
 
 
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'  # Content never changes for a CID
+
+
+def _send_cached_image(path, mimetype, etag):
+    """Serve a cached image file (sendfile) with immutable caching headers."""
+    from flask import send_file
+
+    response = send_file(path, mimetype=mimetype, etag=etag, conditional=True, max_age=31536000)
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    return response
+
+
 @nft_bp.route('/image/<ipfs_cid>', methods=['GET'])
 def get_nft_image(ipfs_cid):
-    """Proxy endpoint to serve NFT images from IPFS through our domain"""
-    import requests
-    from flask import Response
+    """Serve NFT images from IPFS through our domain (cached on disk by CID)"""
+    from app.services.nft_image_cache import get_image_cache, ImageNotFound, GatewayError
 
     try:
-        # Fetch image from Pinata gateway
-        image_url = f'https://gateway.pinata.cloud/ipfs/{ipfs_cid}'
-        response = requests.get(image_url, timeout=10)
-
-        if response.status_code == 200:
-            # Return image with proper headers
-            return Response(
-                response.content,
-                mimetype=response.headers.get('Content-Type', 'image/png'),
-                headers={
-                    'Cache-Control': 'public, max-age=31536000',  # Cache for 1 year
-                    'Access-Control-Allow-Origin': '*'
-                }
-            )
-        else:
-            return jsonify({'error': 'Image not found'}), 404
+        path, mimetype = get_image_cache().get_original(ipfs_cid)
+    except ImageNotFound:
+        return jsonify({'error': 'Image not found'}), 404
+    except GatewayError as e:
+        current_app.logger.warning(f"NFT image {ipfs_cid} unavailable from gateway: {e}")
+        return jsonify({'error': 'Image temporarily unavailable'}), 502
 
+    return _send_cached_image(path, mimetype, ipfs_cid)
+
+
+@nft_bp.route('/image/<ipfs_cid>/thumb/<int:size>', methods=['GET'])
+def get_nft_thumbnail(ipfs_cid, size):
+    """Serve a WebP thumbnail of an NFT image for inventory/marketplace grids"""
+    from app.services.nft_image_cache import get_image_cache, ImageNotFound, GatewayError, THUMBNAIL_SIZES
+
+    if size not in THUMBNAIL_SIZES:
+        return jsonify({'error': f'Size must be one of {list(THUMBNAIL_SIZES)}'}), 404
+
+    try:
+        path = get_image_cache().get_thumbnail(ipfs_cid, size)
+    except ImageNotFound:
+        return jsonify({'error': 'Image not found'}), 404
+    except GatewayError as e:
+        current_app.logger.warning(f"NFT image {ipfs_cid} unavailable from gateway: {e}")
+        return jsonify({'error': 'Image temporarily unavailable'}), 502
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        current_app.logger.error(f"Error generating thumbnail for {ipfs_cid}: {e}", exc_info=True)
+        return jsonify({'error': 'Could not generate thumbnail'}), 500
+
+    return _send_cached_image(path, 'image/webp', f'{ipfs_cid}-{size}')
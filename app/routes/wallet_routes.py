@@ -11,30 +11,20 @@ import os
 
 from app import db
 from app.models.user import User
+from app.blockchain.web3_config import get_web3
+from app.blockchain.balance_cache import get_token_balance_wei
 
 wallet_bp = Blueprint('wallet', __name__, url_prefix='/api/wallet')
 
 # Web3 setup
-BLOCKCHAIN_RPC_URL = os.getenv('BLOCKCHAIN_RPC_URL', 'https://horizen.calderachain.xyz/http')
 ZEN_TOKEN_ADDRESS = os.getenv('ZEN_TOKEN_ADDRESS', None)
 
 try:
-    w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_URL))
+    w3 = get_web3()
 except Exception as e:
     print(f"Warning: Web3 initialization failed: {e}")
     w3 = None
 
-# ERC20 ABI for balanceOf
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function"
-    }
-]
-
 
 @wallet_bp.route('/connect-page', methods=['GET'])
 @login_required
@@ -52,8 +42,11 @@ def get_zen_balance():
     if not address:
         return jsonify({'success': False, 'error': 'Missing address'}), 400
 
-    # Reload env vars in case they weren't loaded at module init
-    rpc_url = os.getenv('BLOCKCHAIN_RPC_URL', 'https://horizen.calderachain.xyz/http')
+    # Validate address before spending an RPC call on it
+    if not Web3.is_address(address):
+        return jsonify({'success': False, 'error': 'Invalid address'}), 400
+
+    # Reload env var in case it wasn't loaded at module init
     zen_token_addr = os.getenv('ZEN_TOKEN_ADDRESS')
 
     if not zen_token_addr:
@@ -66,29 +59,8 @@ def get_zen_balance():
         })
 
     try:
-        # Create Web3 connection
-        web3 = Web3(Web3.HTTPProvider(rpc_url))
-
-        if not web3.is_connected():
-            return jsonify({
-                'success': False,
-                'error': 'Cannot connect to blockchain'
-            }), 500
-
-        # Validate address
-        if not Web3.is_address(address):
-            return jsonify({'success': False, 'error': 'Invalid address'}), 400
-
-        # Get ZEN token contract
-        zen_contract = web3.eth.contract(
-            address=Web3.to_checksum_address(zen_token_addr),
-            abi=ERC20_ABI
-        )
-
-        # Get balance
-        balance_wei = zen_contract.functions.balanceOf(
-            Web3.to_checksum_address(address)
-        ).call()
+        # Shared pooled client; repeated polls within a few seconds hit the balance cache
+        balance_wei = get_token_balance_wei(zen_token_addr, address)
 
         # Convert from wei (18 decimals) to tokens
         balance = Decimal(balance_wei) / Decimal(10**18)
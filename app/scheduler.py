@@ -11,13 +11,27 @@ logger = logging.getLogger(__name__)
 scheduler = None
 
 
-def init_scheduler(app):
+def init_scheduler(app, catch_up=True):
+    """
+    Start the background jobs in this process.
+
+    catch_up runs run_startup_checks() once the jobs are scheduled. A
+    preloaded Gunicorn master never starts the scheduler: it has already
+    run the checks in app.lifecycle.prepare_preloaded_master(), and its
+    threads would not survive the fork. Each worker starts its own in
+    post_fork with catch_up=False.
+    """
     global scheduler
 
     if scheduler is not None:
         logger.warning("Scheduler already initialized")
         return scheduler
 
+    from app.lifecycle import is_preloaded_master
+    if is_preloaded_master():
+        logger.warning("Not starting the scheduler in a preloaded master")
+        return None
+
     scheduler = BackgroundScheduler(daemon=True)
 
     scheduler.add_job(
@@ -179,9 +193,101 @@ def init_scheduler(app):
         replace_existing=True
     )
 
+    # Rebuild materialized country statistics nightly to correct drift
+    scheduler.add_job(
+        func=lambda: recompute_country_stats(app),
+        trigger="cron",
+        hour=3,
+        minute=30,
+        id='recompute_country_stats',
+        name='Recompute country statistics',
+        replace_existing=True
+    )
+
+    # Rebuild support ticket and report counters nightly to correct drift
+    scheduler.add_job(
+        func=lambda: recompute_moderation_counters(app),
+        trigger="cron",
+        hour=3,
+        minute=40,
+        id='recompute_moderation_counters',
+        name='Recompute moderation counters',
+        replace_existing=True
+    )
+
+    # Rebuild party rosters, election summaries and government compositions nightly
+    scheduler.add_job(
+        func=lambda: recompute_politics_read_model(app),
+        trigger="cron",
+        hour=3,
+        minute=50,
+        id='recompute_politics_read_model',
+        name='Recompute politics read model',
+        replace_existing=True
+    )
+
+    # Roll up yesterday's financial transactions and keep monthly partitions ahead
+    scheduler.add_job(
+        func=lambda: rollup_financial_transactions(app),
+        trigger="cron",
+        hour=0,
+        minute=20,
+        id='rollup_financial_transactions',
+        name='Roll up financial transactions',
+        replace_existing=True
+    )
+
+    # Submit queued on-chain publications (election results) and track receipts
+    scheduler.add_job(
+        func=lambda: publish_chain_outbox(app),
+        trigger="interval",
+        seconds=30,
+        id='publish_chain_outbox',
+        name='Publish queued blockchain transactions',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+
+    # Confirm user NFT/marketplace transactions (no-op until a new block arrives)
+    scheduler.add_job(
+        func=lambda: watch_chain_transactions(app),
+        trigger="interval",
+        seconds=app.config.get('CHAIN_TX_WATCH_SECONDS', 3),
+        id='watch_chain_transactions',
+        name='Confirm pending user blockchain transactions',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+
+    # Follow NFT Transfer and marketplace events into the local ownership mirror
+    scheduler.add_job(
+        func=lambda: index_chain_events(app),
+        trigger="interval",
+        seconds=app.config.get('CHAIN_INDEX_INTERVAL_SECONDS', 10),
+        id='index_chain_events',
+        name='Index NFT ownership and marketplace events',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+
+    if app.config.get('METRICS_ENABLED'):
+        from app.metrics import instrument_scheduler
+        instrument_scheduler(scheduler)
+
     scheduler.start()
     logger.info("Election scheduler started successfully")
 
+    if catch_up:
+        run_startup_checks(app)
+
+    return scheduler
+
+
+def run_startup_checks(app):
+    """Catch up on anything that should have happened while the server was down."""
     # Run law voting check immediately on startup to catch any expired laws
     # that may have ended while the server was down
     try:
@@ -237,8 +343,6 @@ def init_scheduler(app):
     except Exception as e:
         logger.error(f"Error during initial party election end check: {e}")
 
-    return scheduler
-
 
 def shutdown_scheduler():
     global scheduler
@@ -520,7 +624,7 @@ def check_and_end_elections(app):
                     from app.services.election_blockchain_service import ElectionBlockchainService
                     success, result = ElectionBlockchainService.publish_party_election_results(election)
                     if success:
-                        logger.info(f"Party election {election.id} results published to blockchain: {result}")
+                        logger.info(f"Party election {election.id} results queued for blockchain: {result}")
                     else:
                         logger.warning(f"Failed to publish party election {election.id} to blockchain: {result}")
                 except Exception as e:
@@ -868,18 +972,66 @@ def calculate_election_results(election):
             f"{len(winners)} members elected to congress of country {election.country_id}"
         )
 
+    from app.services.politics_read_model_service import PoliticsReadModelService
+    PoliticsReadModelService.on_government_change(election.country_id)
+
     # Publish results to blockchain
     try:
         from app.services.election_blockchain_service import ElectionBlockchainService
         success, result = ElectionBlockchainService.publish_government_election_results(election)
         if success:
-            logger.info(f"Election {election.id} results published to blockchain: {result}")
+            logger.info(f"Election {election.id} results queued for blockchain: {result}")
         else:
             logger.warning(f"Failed to publish election {election.id} to blockchain: {result}")
     except Exception as e:
         logger.error(f"Error publishing election {election.id} to blockchain: {e}", exc_info=True)
 
 
+def publish_chain_outbox(app):
+    """Run one chain publisher pass (only one process publishes at a time)."""
+    with app.app_context():
+        from app.extensions import db
+        from app.services.chain_outbox_service import ChainOutboxService
+
+        try:
+            stats = ChainOutboxService.publish_pending()
+            if stats and any(stats.values()):
+                logger.info(f"Chain outbox: {stats}")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error publishing chain outbox: {e}", exc_info=True)
+
+
+def watch_chain_transactions(app):
+    """Run one chain transaction watcher pass (only one process watches at a time)."""
+    with app.app_context():
+        from app.extensions import db
+        from app.services.chain_tx_tracker import ChainTxTracker
+
+        try:
+            stats = ChainTxTracker.watch_pending()
+            if stats and any(stats[key] for key in ('confirmed', 'failed', 'expired')):
+                logger.info(f"Chain transactions: {stats}")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error watching chain transactions: {e}", exc_info=True)
+
+
+def index_chain_events(app):
+    """Run one chain indexer pass (only one process indexes at a time)."""
+    with app.app_context():
+        from app.extensions import db
+        from app.services.chain_indexer import ChainIndexService
+
+        try:
+            stats = ChainIndexService.index_pending()
+            if stats and (stats['events'] or stats['rewound_blocks']):
+                logger.info(f"Chain index: {stats}")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error indexing chain events: {e}", exc_info=True)
+
+
 def record_daily_market_prices(app):
     """Record current market prices for all items at 9 AM CET daily."""
     from datetime import date
@@ -1759,3 +1911,73 @@ def verify_equipped_nft_ownership(app):
 
         except Exception as e:
             logger.error(f"Error verifying NFT ownership: {e}", exc_info=True)
+
+
+def recompute_country_stats(app):
+    """Recompute all materialized country statistics from scratch."""
+    with app.app_context():
+        from app.services.country_stats_service import CountryStatsService
+        from app.extensions import db
+
+        try:
+            count = CountryStatsService.recompute_all()
+            db.session.commit()
+            logger.info(f"Recomputed statistics for {count} countries")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error recomputing country statistics: {e}", exc_info=True)
+
+
+def recompute_moderation_counters(app):
+    """Recompute the support ticket and report counters from scratch."""
+    with app.app_context():
+        from app.services.moderation_stats_service import ModerationStatsService
+        from app.extensions import db
+
+        try:
+            counters = ModerationStatsService.recompute()
+            db.session.commit()
+            logger.info(f"Recomputed moderation counters: {counters.tickets_total} tickets, "
+                        f"{counters.reports_total} reports")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error recomputing moderation counters: {e}", exc_info=True)
+
+
+def recompute_politics_read_model(app):
+    """Recompute party rosters, government compositions and open election summaries."""
+    with app.app_context():
+        from app.services.politics_read_model_service import PoliticsReadModelService
+        from app.extensions import db
+
+        try:
+            parties, countries, elections = PoliticsReadModelService.recompute_all()
+            db.session.commit()
+            logger.info(f"Recomputed politics read model: {parties} parties, {countries} countries, "
+                        f"{elections} elections")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error recomputing politics read model: {e}", exc_info=True)
+
+
+def rollup_financial_transactions(app):
+    """Create upcoming transaction partitions and roll up completed days."""
+    with app.app_context():
+        from app.services.transaction_history_service import TransactionHistoryService
+        from app.extensions import db
+
+        try:
+            created = TransactionHistoryService.ensure_partitions()
+            if created:
+                logger.info(f"Created financial_transaction partitions: {', '.join(created)}")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error creating financial_transaction partitions: {e}", exc_info=True)
+
+        try:
+            days = TransactionHistoryService.rollup_pending()
+            db.session.commit()
+            logger.info(f"Rolled up financial transactions for {days} days")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error rolling up financial transactions: {e}", exc_info=True)
@@ -23,8 +23,11 @@ from app.models import (
     MilitaryRank, WarStatus, Alert, AlertType, AlertPriority
 )
 from app.models.battle import BattleStatus, RoundStatus, WallType
+from app.models.location import country_regions
 from app.services.nft_service import NFTService
 from app.services.inventory_service import InventoryService
+from app.services.reference_data import reference_data
+from app.services.world_graph import world_graph, get_world_graph
 
 
 # Weapon quality bonuses (percentage added to base damage)
@@ -103,8 +106,9 @@ class BattleService:
         Returns:
             Damage bonus percentage (e.g., 2 for +2%)
         """
-        if user.rank:
-            return user.rank.damage_bonus or 0
+        rank = reference_data.rank(user.military_rank_id)
+        if rank:
+            return rank.damage_bonus
         return 0
 
     @staticmethod
@@ -326,7 +330,7 @@ class BattleService:
             return None, None
 
         # Find the resource
-        weapon_resource = Resource.query.filter_by(slug=weapon_slug).first()
+        weapon_resource = reference_data.resource_by_slug(weapon_slug)
         if not weapon_resource:
             return None, None
 
@@ -364,7 +368,7 @@ class BattleService:
             return []
 
         # Find the resource
-        weapon_resource = Resource.query.filter_by(slug=weapon_slug).first()
+        weapon_resource = reference_data.resource_by_slug(weapon_slug)
         if not weapon_resource:
             return []
 
@@ -485,7 +489,7 @@ class BattleService:
                 # Use the preferred quality weapon if available
                 weapon_slug = WALL_WEAPON_SLUGS.get(wall_type)
                 if weapon_slug:
-                    weapon_resource = Resource.query.filter_by(slug=weapon_slug).first()
+                    weapon_resource = reference_data.resource_by_slug(weapon_slug)
                     if weapon_resource:
                         inventory_item = InventoryItem.query.filter_by(
                             user_id=user.id,
@@ -588,8 +592,8 @@ class BattleService:
         BattleService._update_bounty_damage(user, battle, final_damage, is_attacker)
 
         # Track mission progress for fighting
-        from app.services.mission_service import MissionService
-        MissionService.track_progress(user, 'fight', 1)
+        from app.services.progress_events import track_mission
+        track_mission(user, 'fight', 1)
 
         db.session.commit()
 
@@ -759,10 +763,16 @@ class BattleService:
         if not is_president and not is_defence_minister:
             return False, "Only the President or Minister of Defence can start battles."
 
-        # Check target region belongs to enemy
+        # Check target region belongs to enemy (read from the database: the
+        # region may have changed hands in another worker moments ago)
         defending_country_id = war.get_opponent_country_id(attacking_country_id)
-        region_owner = target_region.current_owner
-        if not region_owner or region_owner.id != defending_country_id:
+        owned_by_defender = db.session.scalar(
+            db.select(country_regions.c.region_id).where(
+                country_regions.c.region_id == target_region.id,
+                country_regions.c.country_id == defending_country_id,
+            )
+        )
+        if owned_by_defender is None:
             return False, "This region does not belong to the enemy."
 
         # Check if defending country has Starter Protection (only 1 region left)
@@ -775,22 +785,8 @@ class BattleService:
         if not attacking_country:
             return False, "Invalid attacking country."
 
-        # Get all regions owned by attacker
-        attacker_regions = attacking_country.current_regions.all()
-        attacker_region_ids = [r.id for r in attacker_regions]
-
         # Check if target region is neighbor to any attacker region
-        is_adjacent = False
-        for neighbor in target_region.neighbors.all():
-            if neighbor.id in attacker_region_ids:
-                is_adjacent = True
-                break
-        for neighbor in target_region.neighbor_of.all():
-            if neighbor.id in attacker_region_ids:
-                is_adjacent = True
-                break
-
-        if not is_adjacent:
+        if not get_world_graph().is_adjacent_to_country(target_region.id, attacking_country_id):
             return False, "You can only attack regions adjacent to your territory."
 
         # Check country has enough gold in treasury
@@ -1175,6 +1171,11 @@ class BattleService:
         if attacker_country not in region.current_owners.all():
             region.current_owners.append(attacker_country)
 
+        # Move region and its residents to the attacker's materialized stats
+        from app.services.country_stats_service import CountryStatsService
+        CountryStatsService.on_region_transfer(region.id, defender_country.id, attacker_country.id)
+        world_graph.on_region_transfer(region.id, defender_country.id, attacker_country.id)
+
         # Fire all workers living in this region
         # Workers who live in this region now live in attacker's territory
         # They can no longer work for defender's companies
@@ -1315,32 +1316,8 @@ class BattleService:
         if not defending_country_id:
             return []
 
-        defending_country = Country.query.get(defending_country_id)
-        if not defending_country:
-            return []
-
-        attacking_country = Country.query.get(attacking_country_id)
-        if not attacking_country:
+        # Adjacency is answered from the in-memory world graph; one query loads the result
+        region_ids = get_world_graph().attackable_regions(attacking_country_id, defending_country_id)
+        if not region_ids:
             return []
-
-        # Get all attacker regions
-        attacker_region_ids = [r.id for r in attacking_country.current_regions.all()]
-
-        # Get all defender regions
-        defender_regions = defending_country.current_regions.all()
-
-        # Filter to only adjacent regions
-        attackable = []
-        for region in defender_regions:
-            # Check if region is neighbor to any attacker region
-            for neighbor in region.neighbors.all():
-                if neighbor.id in attacker_region_ids:
-                    attackable.append(region)
-                    break
-            else:
-                for neighbor in region.neighbor_of.all():
-                    if neighbor.id in attacker_region_ids:
-                        attackable.append(region)
-                        break
-
-        return attackable
+        return Region.query.filter(Region.id.in_(region_ids)).order_by(Region.name).all()
@@ -0,0 +1,401 @@
+"""
+Chain Indexer
+
+Maintains a local mirror of GameNFT ownership and NFTMarketplace listings
+(see app/models/chain_index.py) by following contract events.
+
+Ownership used to be read from the node on demand: inventory sync called
+ownerOf for token IDs 1..100 (plus a metadata call per hit) inside the
+request, and listings were fetched with getActiveListings/getListing
+whenever needed. Now ChainIndexer, run by one process at a time:
+
+1. Checks that the block the cursor points at still has the hash recorded
+   when it was indexed. If not, the chain reorganized: events of the last
+   CHAIN_INDEX_REORG_DEPTH blocks are deleted, the tokens they touched are
+   rebuilt from the remaining events, and the cursor moves back.
+2. Fetches Transfer / NFTListed / NFTSold / ListingCancelled logs from the
+   cursor to the head in ranges of CHAIN_INDEX_BATCH_BLOCKS, stores them as
+   ChainEvent rows and applies them to token_owner and onchain_listing,
+   advancing the cursor in the same transaction.
+
+Readers use ChainIndexService. The mirror can be a few blocks behind, so
+callers that act on a negative answer (e.g. removing an NFT the user no
+longer owns) confirm it with the node. owner_of() only answers while the
+indexer is current and once the owning transfer is CHAIN_INDEX_REORG_DEPTH
+blocks below the cursor (deeper reorgs are not detected); otherwise it
+returns None and callers confirm with ownerOf.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set
+
+from flask import current_app
+from sqlalchemy import select, delete
+
+from app.extensions import db
+from app.services.chain_lease import RowLease, default_owner
+from app.models.chain_index import ChainIndexCursor, ChainEvent, TokenOwner, OnchainListing
+
+logger = logging.getLogger(__name__)
+
+ZERO_ADDRESS = '0x' + '0' * 40
+WEI_PER_ZEN = Decimal(10) ** 18
+
+EVENT_SIGNATURES = {
+    'Transfer': 'Transfer(address,address,uint256)',
+    'NFTListed': 'NFTListed(uint256,address,uint256,uint256)',
+    'NFTSold': 'NFTSold(uint256,address,address,uint256,uint256,uint256)',
+    'ListingCancelled': 'ListingCancelled(uint256,address,uint256)',
+}
+MARKETPLACE_EVENTS = ('NFTListed', 'NFTSold', 'ListingCancelled')
+
+
+# ----------------------------------------------------------------------
+# Chain client
+# ----------------------------------------------------------------------
+
+class Web3LogClient:
+    """
+    The node reads the indexer needs, over web3.py.
+
+    Tests substitute an in-process fake chain with the same methods:
+    block_number(), block_hash() and get_events().
+    """
+
+    def __init__(self, w3, nft_address, marketplace_address):
+        from web3 import Web3
+
+        self.w3 = w3
+        self.nft_address = Web3.to_checksum_address(nft_address)
+        self.marketplace_address = Web3.to_checksum_address(marketplace_address)
+        self.topics = {Web3.to_hex(Web3.keccak(text=sig)): name for name, sig in EVENT_SIGNATURES.items()}
+
+    @classmethod
+    def from_env(cls):
+        """Client for the configured contracts, or None if they are not configured."""
+        from app.blockchain.web3_config import get_web3
+
+        nft_address = os.getenv('NFT_CONTRACT_ADDRESS')
+        marketplace_address = os.getenv('MARKETPLACE_CONTRACT_ADDRESS')
+        if not nft_address or not marketplace_address:
+            return None
+        return cls(get_web3(), nft_address, marketplace_address)
+
+    def block_number(self):
+        return self.w3.eth.block_number
+
+    def block_hash(self, number):
+        from web3 import Web3
+
+        return Web3.to_hex(self.w3.eth.get_block(number)['hash'])
+
+    def get_events(self, from_block, to_block) -> List[Dict]:
+        """Decoded events of both contracts in [from_block, to_block]."""
+        logs = self.w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': [self.nft_address, self.marketplace_address],
+            'topics': [list(self.topics)],
+        })
+        return [event for event in (self._decode(log) for log in logs) if event]
+
+    def _decode(self, log):
+        from web3 import Web3
+
+        topics = [Web3.to_hex(t) for t in log['topics']]
+        name = self.topics.get(topics[0]) if topics else None
+        address = log['address'].lower()
+        if name is None:
+            return None
+        if name == 'Transfer' and (address != self.nft_address.lower() or len(topics) != 4):
+            return None  # Not an ERC-721 transfer of our collection
+        if name in MARKETPLACE_EVENTS and address != self.marketplace_address.lower():
+            return None
+
+        data = Web3.to_hex(log['data'])[2:]
+        words = [int(data[i:i + 64], 16) for i in range(0, len(data), 64)]
+
+        def topic_address(topic):
+            return '0x' + topic[-40:].lower()
+
+        event = {
+            'block_number': log['blockNumber'],
+            'block_hash': Web3.to_hex(log['blockHash']),
+            'log_index': log['logIndex'],
+            'tx_hash': Web3.to_hex(log['transactionHash']),
+            'event': name,
+            'from_address': None,
+            'to_address': None,
+            'price_zen': None,
+            'timestamp': None,
+        }
+        if name == 'Transfer':
+            event.update(from_address=topic_address(topics[1]), to_address=topic_address(topics[2]),
+                         token_id=int(topics[3], 16))
+        elif name == 'NFTListed':
+            event.update(token_id=int(topics[1], 16), from_address=topic_address(topics[2]),
+                         price_zen=Decimal(words[0]) / WEI_PER_ZEN, timestamp=words[1])
+        elif name == 'NFTSold':
+            event.update(token_id=int(topics[1], 16), from_address=topic_address(topics[2]),
+                         to_address=topic_address(topics[3]),
+                         price_zen=Decimal(words[0]) / WEI_PER_ZEN, timestamp=words[2])
+        else:  # ListingCancelled
+            event.update(token_id=int(topics[1], 16), from_address=topic_address(topics[2]), timestamp=words[0])
+        return event
+
+
+# ----------------------------------------------------------------------
+# Indexer
+# ----------------------------------------------------------------------
+
+class ChainIndexer:
+    """Follows contract events into token_owner / onchain_listing. See module docstring."""
+
+    NAME = 'nft'
+    LEASE_SECONDS = 120             # Indexer lease; renewed every run and every batch
+    REORG_DEPTH = 12                # Blocks rewound when the cursor block's hash changes
+    BATCH_BLOCKS = 2000             # Block range per eth_getLogs call
+    MAX_BLOCKS_PER_RUN = 50000      # Catch-up is spread over runs
+
+    def __init__(self, client, owner=None, reorg_depth=None, batch_blocks=None, start_block=0):
+        self.client = client
+        self.owner = owner or default_owner()
+        self.reorg_depth = self.REORG_DEPTH if reorg_depth is None else reorg_depth
+        self.batch_blocks = self.BATCH_BLOCKS if batch_blocks is None else batch_blocks
+        self.start_block = start_block
+        self.lease = RowLease(ChainIndexCursor, 'name', self.NAME, self.owner, self.LEASE_SECONDS)
+
+    # -- lease -------------------------------------------------------------
+
+    def acquire_lease(self, now):
+        return self.lease.acquire(now)
+
+    def renew_lease(self):
+        """Extend a held lease during a long catch-up; False if another process took it over."""
+        return self.lease.renew()
+
+    def release_lease(self):
+        self.lease.release()
+
+    # -- run ---------------------------------------------------------------
+
+    def run_once(self, now=None):
+        """
+        One indexing pass.
+
+        Returns:
+            Dict of counts, or None if another process holds the lease
+        """
+        now = now or datetime.utcnow()
+        if not self.acquire_lease(now):
+            return None
+
+        stats = {'blocks': 0, 'events': 0, 'rewound_blocks': 0}
+        try:
+            cursor = db.session.get(ChainIndexCursor, self.NAME)
+            if cursor.last_block is None:
+                cursor.last_block = self.start_block - 1
+            head = self.client.block_number()
+
+            if cursor.last_block > head or (
+                cursor.last_block_hash and self.client.block_hash(cursor.last_block) != cursor.last_block_hash
+            ):
+                stats['rewound_blocks'] = self._rewind(cursor, head)
+
+            target = min(head, cursor.last_block + self.MAX_BLOCKS_PER_RUN)
+            while cursor.last_block < target:
+                start = cursor.last_block + 1
+                end = min(target, start + self.batch_blocks - 1)
+                end_hash = self.client.block_hash(end)
+                events = self.client.get_events(start, end)
+                if self.client.block_hash(end) != end_hash:
+                    break  # Reorg while reading; the range is read again next run
+
+                for event in sorted(events, key=lambda e: (e['block_number'], e['log_index'])):
+                    self._record(event)
+                cursor.last_block = end
+                cursor.last_block_hash = end_hash
+                db.session.commit()
+                stats['blocks'] += end - start + 1
+                stats['events'] += len(events)
+                if not self.renew_lease():
+                    logger.warning(f"Chain index: lease lost at block {end}, stopping this run")
+                    break
+
+            cursor.updated_at = now
+            db.session.commit()
+            return stats
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            self.release_lease()
+
+    def _record(self, event):
+        db.session.add(ChainEvent(
+            block_number=event['block_number'],
+            block_hash=event['block_hash'],
+            log_index=event['log_index'],
+            tx_hash=event['tx_hash'],
+            event=event['event'],
+            token_id=event['token_id'],
+            from_address=event['from_address'],
+            to_address=event['to_address'],
+            price_zen=event['price_zen'],
+            event_timestamp=event['timestamp'],
+        ))
+        apply_event(event['event'], event['token_id'], event['block_number'], event['from_address'],
+                    event['to_address'], event['price_zen'], event['timestamp'])
+
+    def _rewind(self, cursor, head):
+        """Drop the last REORG_DEPTH blocks of events and rebuild the tokens they touched."""
+        rewind_to = max(self.start_block - 1, min(cursor.last_block, head) - self.reorg_depth)
+        touched = set(db.session.scalars(
+            select(ChainEvent.token_id).where(ChainEvent.block_number > rewind_to).distinct()
+        ))
+        db.session.execute(delete(ChainEvent).where(ChainEvent.block_number > rewind_to))
+        rebuild_tokens(touched)
+
+        rewound = cursor.last_block - rewind_to
+        logger.warning(f"Chain index: reorg detected at block {cursor.last_block}, "
+                       f"rewound {rewound} blocks ({len(touched)} tokens rebuilt)")
+        cursor.last_block = rewind_to
+        cursor.last_block_hash = None  # A reorg deeper than REORG_DEPTH is not detected
+        db.session.commit()
+        return rewound
+
+
+def apply_event(event, token_id, block_number, from_address, to_address, price_zen, timestamp):
+    """Apply one event to token_owner / onchain_listing (events must arrive in chain order)."""
+    if event == 'Transfer':
+        owner = db.session.get(TokenOwner, token_id)
+        if to_address == ZERO_ADDRESS:
+            if owner:
+                db.session.delete(owner)
+        elif owner:
+            owner.owner_address = to_address
+            owner.block_number = block_number
+        else:
+            db.session.add(TokenOwner(token_id=token_id, owner_address=to_address, block_number=block_number))
+    else:
+        listing = db.session.get(OnchainListing, token_id)
+        if listing is None:
+            listing = OnchainListing(token_id=token_id, seller_address=from_address, price_zen=price_zen or 0)
+            db.session.add(listing)
+        if event == 'NFTListed':
+            listing.seller_address = from_address
+            listing.price_zen = price_zen
+            listing.listed_at = timestamp
+            listing.buyer_address = None
+            listing.active = True
+        elif event == 'NFTSold':
+            listing.buyer_address = to_address
+            listing.active = False
+        else:  # ListingCancelled
+            listing.active = False
+        listing.block_number = block_number
+    db.session.flush()
+
+
+def rebuild_tokens(token_ids: Iterable[int]):
+    """Recompute the mirror rows of some tokens from the stored events."""
+    token_ids = list(token_ids)
+    for i in range(0, len(token_ids), 500):
+        chunk = token_ids[i:i + 500]
+        for model in (TokenOwner, OnchainListing):
+            for row in db.session.scalars(select(model).where(model.token_id.in_(chunk))):
+                db.session.delete(row)
+        db.session.flush()
+        events = db.session.scalars(
+            select(ChainEvent).where(ChainEvent.token_id.in_(chunk))
+            .order_by(ChainEvent.block_number, ChainEvent.log_index)
+        ).all()
+        for e in events:
+            apply_event(e.event, e.token_id, e.block_number, e.from_address, e.to_address,
+                        e.price_zen, e.event_timestamp)
+
+
+# ----------------------------------------------------------------------
+# Entry points
+# ----------------------------------------------------------------------
+
+class ChainIndexService:
+    """Reads of the mirror, and the scheduler entry point."""
+
+    @staticmethod
+    def _current_cursor() -> Optional[ChainIndexCursor]:
+        """The indexer cursor if the indexer has run recently enough for the mirror to be trusted."""
+        cursor = db.session.get(ChainIndexCursor, ChainIndexer.NAME)
+        if cursor is None or cursor.last_block is None or cursor.last_block_hash is None:
+            return None
+        max_age = timedelta(seconds=current_app.config.get('CHAIN_INDEX_MAX_AGE_SECONDS', 120))
+        if cursor.updated_at < datetime.utcnow() - max_age:
+            return None
+        return cursor
+
+    @staticmethod
+    def is_current() -> bool:
+        """Whether the indexer has run recently enough for the mirror to be trusted."""
+        return ChainIndexService._current_cursor() is not None
+
+    @staticmethod
+    def owner_of(token_id: int) -> Optional[str]:
+        """
+        Indexed owner (lowercase address) of a token.
+
+        Returns None if the token is unknown or burned, if the mirror is not
+        current, or if the transfer that gave the token its owner is within
+        CHAIN_INDEX_REORG_DEPTH blocks of the cursor and could still be
+        reorganized away. Confirm None with ownerOf before acting on it.
+        """
+        cursor = ChainIndexService._current_cursor()
+        if cursor is None:
+            return None
+        depth = current_app.config.get('CHAIN_INDEX_REORG_DEPTH', ChainIndexer.REORG_DEPTH)
+        return db.session.scalar(
+            select(TokenOwner.owner_address)
+            .where(TokenOwner.token_id == token_id)
+            .where(TokenOwner.block_number <= cursor.last_block - depth)
+        )
+
+    @staticmethod
+    def tokens_owned_by(address: str) -> Optional[Set[int]]:
+        """Token IDs a wallet owns, or None if the mirror is not current."""
+        if not ChainIndexService.is_current():
+            return None
+        return set(db.session.scalars(
+            select(TokenOwner.token_id).where(TokenOwner.owner_address == address.lower())
+        ))
+
+    @staticmethod
+    def active_listing_token_ids() -> Optional[List[int]]:
+        """Token IDs listed on the marketplace, or None if the mirror is not current."""
+        if not ChainIndexService.is_current():
+            return None
+        return list(db.session.scalars(
+            select(OnchainListing.token_id).where(OnchainListing.active == True).order_by(OnchainListing.token_id)
+        ))
+
+    @staticmethod
+    def listing(token_id: int) -> Optional[OnchainListing]:
+        """Indexed listing of a token, or None if the mirror is not current or has none."""
+        if not ChainIndexService.is_current():
+            return None
+        return db.session.get(OnchainListing, token_id)
+
+    @staticmethod
+    def index_pending(client=None) -> Optional[dict]:
+        """Run one indexer pass (scheduler entry point)."""
+        client = client or Web3LogClient.from_env()
+        if client is None:
+            return None
+        config = current_app.config
+        return ChainIndexer(
+            client,
+            reorg_depth=config.get('CHAIN_INDEX_REORG_DEPTH'),
+            batch_blocks=config.get('CHAIN_INDEX_BATCH_BLOCKS'),
+            start_block=config.get('CHAIN_INDEX_START_BLOCK', 0),
+        ).run_once()
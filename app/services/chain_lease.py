@@ -0,0 +1,93 @@
+"""
+Chain Lease - Single-runner lease on a database row.
+
+The chain background jobs (ChainPublisher, ChainTxWatcher, ChainIndexer) may
+be started by every worker and scheduler process, but only one process may
+run each of them at a time. Each job owns a state row with lease_owner and
+lease_expires_at columns; RowLease takes the lease with a conditional UPDATE
+(free, already ours, or expired), so no row locks are held while the job
+talks to the node. A process that dies while holding the lease blocks the job
+only until the lease expires.
+"""
+
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+
+
+def default_owner():
+    """Lease owner name for this process: host, PID and a random suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class RowLease:
+    """
+    Lease on one row of a model with lease_owner / lease_expires_at columns.
+
+    Args:
+        model: Model holding the lease columns
+        key_name: Name of the model's primary key attribute
+        key: Primary key of the row
+        owner: Name this process holds the lease under
+        seconds: Lease duration from acquire/renew
+        defaults: Extra attributes for the row when it has to be created
+    """
+
+    def __init__(self, model, key_name, key, owner, seconds, defaults=None):
+        self.model = model
+        self.key_name = key_name
+        self.key = key
+        self.owner = owner
+        self.seconds = seconds
+        self.defaults = defaults or {}
+
+    def _key_column(self):
+        return getattr(self.model, self.key_name)
+
+    def ensure_row(self):
+        if db.session.get(self.model, self.key) is None:
+            try:
+                db.session.add(self.model(**{self.key_name: self.key}, **self.defaults))
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()  # Another process created it first
+
+    def acquire(self, now):
+        """Take the lease if it is free, ours or expired; True on success."""
+        self.ensure_row()
+        result = db.session.execute(
+            update(self.model)
+            .where(self._key_column() == self.key)
+            .where(or_(
+                self.model.lease_owner.is_(None),
+                self.model.lease_owner == self.owner,
+                self.model.lease_expires_at < now,
+            ))
+            .values(lease_owner=self.owner, lease_expires_at=now + timedelta(seconds=self.seconds))
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    def renew(self):
+        """Extend a held lease during a long run; False if another process took it over."""
+        result = db.session.execute(
+            update(self.model)
+            .where(self._key_column() == self.key, self.model.lease_owner == self.owner)
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=self.seconds))
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    def release(self):
+        db.session.execute(
+            update(self.model)
+            .where(self._key_column() == self.key, self.model.lease_owner == self.owner)
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        db.session.commit()
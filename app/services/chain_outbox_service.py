@@ -0,0 +1,409 @@
+"""
+Chain Outbox Service
+
+Publishes queued contract calls (ChainOutbox rows) to the blockchain.
+
+Publishing used to happen inline in the scheduler: each call fetched the
+nonce and gas price from the node, signed and sent. Two publications in
+flight could pick the same nonce, and a slow RPC stalled the whole scheduler
+tick. Now callers only enqueue (in the same transaction as the game state),
+and ChainPublisher, run by one process at a time, does the chain work:
+
+1. Sync the local nonce counter (ChainAccount.next_nonce) with the node once
+   per run - this is also how a restarted publisher recovers.
+2. Check SUBMITTED entries for receipts. Entries that were not mined in time
+   are re-signed with a higher gas price (same nonce) and rebroadcast;
+   entries whose nonce was used by someone else go back to PENDING.
+3. Give PENDING entries the next local nonces in order, persist the signed
+   transaction, then broadcast it. Because the signed transaction is
+   committed before it is sent, a crash between the two is recovered by the
+   rebroadcast in step 2 rather than by signing a second transaction.
+
+Failed broadcasts are retried with exponential backoff.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from flask import current_app
+from sqlalchemy import select, func
+
+from app.extensions import db
+from app.services.chain_lease import RowLease, default_owner
+from app.models.chain_outbox import ChainOutbox, ChainOutboxStatus, ChainAccount
+
+logger = logging.getLogger(__name__)
+
+
+class NonceTooLowError(Exception):
+    """The node has already seen a transaction with this nonce from our address."""
+    pass
+
+
+# ----------------------------------------------------------------------
+# Chain client
+# ----------------------------------------------------------------------
+
+class Web3ChainClient:
+    """
+    The few node operations the publisher needs, over web3.py.
+
+    Tests substitute an in-process fake with the same methods:
+    address, transaction_count(), gas_price(), sign_call(),
+    send_raw_transaction() and get_receipt().
+    """
+
+    def __init__(self, w3, contracts, private_key):
+        self.w3 = w3
+        self.contracts = contracts  # Logical name -> web3 contract
+        self._private_key = private_key
+        self.address = w3.eth.account.from_key(private_key).address
+        self._chain_id = None
+
+    @classmethod
+    def from_app_config(cls):
+        """Client for the configured server wallet, or None if the chain is not configured."""
+        from app.services.election_blockchain_service import ElectionBlockchainService
+
+        w3, contract, private_key = ElectionBlockchainService.get_web3_and_contract()
+        if not w3 or not contract:
+            return None
+        return cls(w3, {'election_results': contract}, private_key)
+
+    def transaction_count(self, block_identifier='pending'):
+        return self.w3.eth.get_transaction_count(self.address, block_identifier)
+
+    def gas_price(self):
+        return int(self.w3.eth.gas_price)
+
+    def sign_call(self, contract, function, args, nonce, gas, gas_price):
+        """Build and sign a contract call. Returns (tx_hash, raw_tx) as 0x-hex strings."""
+        from web3 import Web3
+
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        call = getattr(self.contracts[contract].functions, function)(*args)
+        tx = call.build_transaction({
+            'from': self.address,
+            'nonce': nonce,
+            'gas': gas,
+            'gasPrice': gas_price,
+            'chainId': self._chain_id,
+        })
+        signed = self.w3.eth.account.sign_transaction(tx, self._private_key)
+        return Web3.to_hex(signed.hash), Web3.to_hex(signed.raw_transaction)
+
+    def send_raw_transaction(self, raw_tx):
+        from web3 import Web3
+
+        try:
+            self.w3.eth.send_raw_transaction(Web3.to_bytes(hexstr=raw_tx))
+        except Exception as e:
+            message = str(e).lower()
+            if 'already known' in message or 'known transaction' in message:
+                return  # Rebroadcast of a transaction the node already has
+            if 'nonce too low' in message:
+                raise NonceTooLowError(str(e)) from e
+            raise
+
+    def get_receipt(self, tx_hash):
+        """{'status', 'block_number', 'gas_used'} or None if not mined."""
+        from web3.exceptions import TransactionNotFound
+
+        try:
+            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        if receipt is None:
+            return None
+        return {
+            'status': receipt['status'],
+            'block_number': receipt['blockNumber'],
+            'gas_used': receipt['gasUsed'],
+        }
+
+
+# ----------------------------------------------------------------------
+# Publisher
+# ----------------------------------------------------------------------
+
+class ChainPublisher:
+    """Submits outbox entries for one signing address. See module docstring."""
+
+    GAS_LIMIT = 300000
+    BATCH_SIZE = 20                 # PENDING entries submitted per run
+    LEASE_SECONDS = 120             # Publisher lease; renewed every run
+    RESUBMIT_AFTER = 180            # Seconds to wait for a receipt before rebroadcasting
+    GAS_BUMP = Decimal('1.125')     # Replacement must beat the old price by >= 10% on most nodes
+    MAX_GAS_MULTIPLIER = 3          # Never bid more than 3x the node's current gas price
+    BACKOFF_BASE = 30               # Seconds; doubles per failed attempt
+    BACKOFF_MAX = 1800
+    MAX_BUILD_ATTEMPTS = 5          # Entries that cannot even be signed are failed after this
+
+    def __init__(self, client, owner=None):
+        self.client = client
+        self.address = client.address
+        self.owner = owner or default_owner()
+        self._gas_price = None
+        self.lease = RowLease(ChainAccount, 'address', self.address, self.owner, self.LEASE_SECONDS, defaults={'next_nonce': 0})
+
+    # -- lease -------------------------------------------------------------
+
+    def acquire_lease(self, now):
+        return self.lease.acquire(now)
+
+    def release_lease(self):
+        self.lease.release()
+
+    # -- run ---------------------------------------------------------------
+
+    def run_once(self, now=None):
+        """
+        One publishing pass.
+
+        Returns:
+            Dict of counts, or None if another process holds the lease
+        """
+        now = now or datetime.utcnow()
+        if not self.acquire_lease(now):
+            return None
+
+        self._gas_price = None
+        stats = {'submitted': 0, 'rebroadcast': 0, 'confirmed': 0, 'failed': 0, 'requeued': 0}
+        try:
+            self._sync_nonce()
+            self._check_submitted(now, stats)
+            self._submit_pending(now, stats)
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            self.release_lease()
+        return stats
+
+    def _current_gas_price(self):
+        if self._gas_price is None:
+            self._gas_price = self.client.gas_price()
+        return self._gas_price
+
+    def _backoff(self, attempts):
+        return timedelta(seconds=min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** max(0, attempts - 1)))
+
+    def _sync_nonce(self):
+        """Never hand out a nonce the node or our own outbox has already used."""
+        account = db.session.get(ChainAccount, self.address)
+        highest = db.session.scalar(
+            select(func.max(ChainOutbox.nonce)).where(ChainOutbox.from_address == self.address)
+        )
+        chain_pending = self.client.transaction_count('pending')
+        next_nonce = max(account.next_nonce, chain_pending, (highest + 1) if highest is not None else 0)
+        if next_nonce != account.next_nonce:
+            logger.info(f"Chain nonce for {self.address} moved {account.next_nonce} -> {next_nonce}")
+            account.next_nonce = next_nonce
+        db.session.commit()
+
+    def _check_submitted(self, now, stats):
+        entries = db.session.scalars(
+            select(ChainOutbox)
+            .where(ChainOutbox.status == ChainOutboxStatus.SUBMITTED, ChainOutbox.from_address == self.address)
+            .order_by(ChainOutbox.nonce)
+        ).all()
+        if not entries:
+            return
+
+        mined_nonce = self.client.transaction_count('latest')
+        for entry in entries:
+            receipt = None
+            for tx_hash in reversed(entry.tx_hashes):
+                receipt = self.client.get_receipt(tx_hash)
+                if receipt:
+                    entry.tx_hash = tx_hash
+                    break
+
+            if receipt:
+                entry.block_number = receipt['block_number']
+                entry.gas_used = receipt['gas_used']
+                entry.confirmed_at = now
+                entry.raw_tx = None
+                if receipt['status'] == 1:
+                    entry.status = ChainOutboxStatus.CONFIRMED
+                    stats['confirmed'] += 1
+                    logger.info(f"Chain outbox {entry.dedupe_key} confirmed in block {entry.block_number}")
+                else:
+                    entry.status = ChainOutboxStatus.FAILED
+                    entry.last_error = 'Transaction reverted'
+                    stats['failed'] += 1
+                    logger.error(f"Chain outbox {entry.dedupe_key} reverted: {entry.tx_hash}")
+            elif entry.nonce < mined_nonce:
+                # The nonce was mined, but not by any transaction of ours: sign again with a new nonce
+                logger.warning(f"Chain outbox {entry.dedupe_key}: nonce {entry.nonce} used by another transaction")
+                self._requeue(entry, now, f"Nonce {entry.nonce} used by another transaction")
+                stats['requeued'] += 1
+            elif entry.next_attempt_at <= now:
+                if not self._rebroadcast(entry, now):
+                    db.session.commit()
+                    break  # Node unreachable; try again next run
+                stats['rebroadcast'] += 1
+        db.session.commit()
+
+    def _requeue(self, entry, now, reason):
+        entry.status = ChainOutboxStatus.PENDING
+        entry.nonce = None
+        entry.tx_hash = None
+        entry.raw_tx = None
+        entry.submitted_at = None
+        entry.last_error = reason
+        entry.next_attempt_at = now
+
+    def _rebroadcast(self, entry, now):
+        """Resend a stuck or dropped transaction, outbidding the previous one if possible."""
+        entry.attempts += 1
+        current = self._current_gas_price()
+        bumped = int((Decimal(entry.gas_price or 0) * self.GAS_BUMP).to_integral_value())
+        gas_price = max(current, bumped)
+        if gas_price <= current * self.MAX_GAS_MULTIPLIER:
+            try:
+                tx_hash, raw_tx = self.client.sign_call(
+                    entry.contract, entry.function, decode_args(entry.args),
+                    entry.nonce, self.GAS_LIMIT, gas_price
+                )
+                entry.gas_price = gas_price
+                entry.record_broadcast(tx_hash, raw_tx)
+                db.session.commit()
+            except Exception as e:
+                logger.warning(f"Chain outbox {entry.dedupe_key}: could not re-sign, resending as is: {e}")
+
+        try:
+            self.client.send_raw_transaction(entry.raw_tx)
+        except NonceTooLowError:
+            # Mined meanwhile (receipt shows up next run) or taken by someone else (requeued next run)
+            entry.next_attempt_at = now + timedelta(seconds=self.RESUBMIT_AFTER)
+            return True
+        except Exception as e:
+            entry.last_error = str(e)
+            entry.next_attempt_at = now + self._backoff(entry.attempts)
+            logger.warning(f"Chain outbox {entry.dedupe_key}: rebroadcast failed: {e}")
+            return False
+        entry.next_attempt_at = now + max(timedelta(seconds=self.RESUBMIT_AFTER), self._backoff(entry.attempts))
+        logger.info(f"Chain outbox {entry.dedupe_key}: rebroadcast nonce {entry.nonce} as {entry.tx_hash}")
+        return True
+
+    def _submit_pending(self, now, stats):
+        entries = db.session.scalars(
+            select(ChainOutbox)
+            .where(ChainOutbox.status == ChainOutboxStatus.PENDING, ChainOutbox.next_attempt_at <= now)
+            .order_by(ChainOutbox.id)
+            .limit(self.BATCH_SIZE)
+        ).all()
+
+        for entry in entries:
+            account = db.session.get(ChainAccount, self.address)
+            nonce = account.next_nonce
+            gas_price = self._current_gas_price()
+            entry.attempts += 1
+
+            try:
+                tx_hash, raw_tx = self.client.sign_call(
+                    entry.contract, entry.function, decode_args(entry.args),
+                    nonce, self.GAS_LIMIT, gas_price
+                )
+            except Exception as e:
+                entry.last_error = str(e)
+                if entry.attempts >= self.MAX_BUILD_ATTEMPTS:
+                    entry.status = ChainOutboxStatus.FAILED
+                    stats['failed'] += 1
+                    logger.error(f"Chain outbox {entry.dedupe_key}: giving up, cannot build transaction: {e}")
+                else:
+                    entry.next_attempt_at = now + self._backoff(entry.attempts)
+                    logger.warning(f"Chain outbox {entry.dedupe_key}: cannot build transaction: {e}")
+                db.session.commit()
+                continue
+
+            # Persist the signed transaction and consume the nonce before broadcasting
+            entry.status = ChainOutboxStatus.SUBMITTED
+            entry.from_address = self.address
+            entry.nonce = nonce
+            entry.gas_price = gas_price
+            entry.record_broadcast(tx_hash, raw_tx)
+            entry.submitted_at = now
+            entry.next_attempt_at = now + timedelta(seconds=self.RESUBMIT_AFTER)
+            entry.last_error = None
+            account.next_nonce = nonce + 1
+            db.session.commit()
+
+            try:
+                self.client.send_raw_transaction(raw_tx)
+            except NonceTooLowError as e:
+                # Someone else used our key; resync and give this entry a fresh nonce
+                logger.warning(f"Chain outbox {entry.dedupe_key}: nonce {nonce} too low, resyncing: {e}")
+                self._requeue(entry, now, str(e))
+                account.next_nonce = max(nonce + 1, self.client.transaction_count('pending'))
+                db.session.commit()
+                stats['requeued'] += 1
+                continue
+            except Exception as e:
+                # Stays SUBMITTED with its nonce; the signed transaction is rebroadcast later
+                entry.last_error = str(e)
+                entry.next_attempt_at = now + self._backoff(entry.attempts)
+                db.session.commit()
+                logger.warning(f"Chain outbox {entry.dedupe_key}: broadcast failed, will retry: {e}")
+                break
+
+            stats['submitted'] += 1
+            logger.info(f"Chain outbox {entry.dedupe_key} submitted: nonce {nonce}, tx {tx_hash}")
+
+
+# ----------------------------------------------------------------------
+# Enqueueing
+# ----------------------------------------------------------------------
+
+def bytes_arg(hex_value):
+    """Mark a 0x-hex string as a bytes argument (e.g. bytes32) for the outbox."""
+    return {'bytes': hex_value}
+
+
+def decode_args(args):
+    """Outbox JSON arguments -> contract call arguments."""
+    return [bytes.fromhex(a['bytes'][2:]) if isinstance(a, dict) and 'bytes' in a else a for a in args]
+
+
+class ChainOutboxService:
+    """Entry points used by the rest of the app."""
+
+    @staticmethod
+    def enqueue(dedupe_key: str, contract: str, function: str, args: list) -> ChainOutbox:
+        """
+        Queue a contract call. Does not commit - the entry is written together
+        with the caller's transaction. Enqueueing an existing key returns the
+        existing entry.
+        """
+        existing = db.session.scalar(select(ChainOutbox).where(ChainOutbox.dedupe_key == dedupe_key))
+        if existing:
+            return existing
+
+        entry = ChainOutbox(dedupe_key=dedupe_key, contract=contract, function=function)
+        entry.args = args
+        db.session.add(entry)
+        db.session.flush()
+        return entry
+
+    @staticmethod
+    def has_work() -> bool:
+        return db.session.scalar(
+            select(ChainOutbox.id)
+            .where(ChainOutbox.status.in_([ChainOutboxStatus.PENDING, ChainOutboxStatus.SUBMITTED]))
+            .limit(1)
+        ) is not None
+
+    @staticmethod
+    def publish_pending(client=None) -> Optional[dict]:
+        """Run one publisher pass if there is anything to publish (scheduler entry point)."""
+        if not ChainOutboxService.has_work():
+            return None
+        client = client or Web3ChainClient.from_app_config()
+        if client is None:
+            current_app.logger.warning("Chain outbox has entries but blockchain is not configured")
+            return None
+        return ChainPublisher(client).run_once()
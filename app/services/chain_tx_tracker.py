@@ -0,0 +1,391 @@
+"""
+Chain Transaction Tracker
+
+Confirms user-submitted blockchain transactions (NFT mints and upgrades,
+marketplace listings, purchases and cancellations) in the background.
+
+Request handlers used to verify these inline: each verify_* function polled
+get_transaction_receipt in a loop with time.sleep(2), holding a worker for
+up to a minute per request. Now the handler records the hash and what the
+game expects the transaction to do (ChainTxTracker.track) and answers 202
+with a status URL, and ChainTxWatcher, run by one process at a time:
+
+1. Reads the chain head and does nothing until a new block arrives.
+2. Fetches the receipt of every outstanding hash once for that block.
+3. Fails reverted transactions, waits for confirmations on mined ones, and
+   expires hashes that never got a receipt within the timeout.
+4. Finalizes confirmed transactions with the handler for their kind. The
+   handler verifies the receipt and applies the game-side effects; the row
+   is marked confirmed in the same database transaction, so effects are
+   applied exactly once.
+"""
+
+import logging
+import re
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.services.chain_lease import RowLease, default_owner
+from app.models.pending_chain_tx import PendingChainTx, PendingChainTxStatus, ChainTxWatcherState
+
+logger = logging.getLogger(__name__)
+
+TX_HASH_RE = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+
+class ChainTxRejected(Exception):
+    """A confirmed transaction does not do what the game expected; it is failed, not retried."""
+    pass
+
+
+# ----------------------------------------------------------------------
+# Chain client
+# ----------------------------------------------------------------------
+
+class Web3TxClient:
+    """
+    The two node reads the watcher needs, over web3.py.
+
+    Tests substitute an in-process fake chain with the same methods:
+    block_number() and get_receipt().
+    """
+
+    def __init__(self, w3):
+        self.w3 = w3
+
+    @classmethod
+    def from_env(cls):
+        """Client for BLOCKCHAIN_RPC_URL (the chain the NFT contracts live on)."""
+        from app.blockchain.web3_config import get_web3
+
+        return cls(get_web3())
+
+    def block_number(self):
+        return self.w3.eth.block_number
+
+    def get_receipt(self, tx_hash):
+        """The full receipt (verify_* functions read its logs), or None if not mined."""
+        from app.blockchain.web3_config import get_receipt_or_none
+
+        return get_receipt_or_none(self.w3, tx_hash)
+
+
+# ----------------------------------------------------------------------
+# Finalization handlers
+# ----------------------------------------------------------------------
+# Each takes (pending, receipt) and returns the result dict shown to the
+# client, or raises ChainTxRejected. They run the NFTService operation with
+# the watcher's receipt, so verification never waits on the node.
+
+def _finalize_nft_mint(pending, receipt):
+    from app.services.nft_service import NFTService
+
+    params = pending.params
+    nft, error = NFTService.purchase_nft_blockchain(
+        user_id=pending.user_id,
+        wallet_address=params['wallet_address'],
+        tier=params['tier'],
+        nft_type=params.get('nft_type'),
+        category=None,
+        tx_hash=pending.tx_hash,
+        receipt=receipt
+    )
+    if error:
+        raise ChainTxRejected(error)
+    return {
+        'nft': nft.to_dict(),
+        'message': f'Successfully purchased {nft.nft_type} NFT!',
+        'token_id': nft.token_id
+    }
+
+
+def _finalize_nft_upgrade(pending, receipt):
+    from app.services.nft_service import NFTService
+
+    params = pending.params
+    new_nft, error = NFTService.upgrade_nft_blockchain(
+        user_id=pending.user_id,
+        wallet_address=params['wallet_address'],
+        nft_ids=params['nft_ids'],
+        tx_hash=pending.tx_hash,
+        receipt=receipt
+    )
+    if error:
+        raise ChainTxRejected(error)
+    return {
+        'nft': new_nft.to_dict(),
+        'message': f'Successfully upgraded to Q{new_nft.tier} NFT!',
+        'token_id': new_nft.token_id
+    }
+
+
+def _finalize_market_list(pending, receipt):
+    from app.services.nft_service import NFTService
+
+    params = pending.params
+    listing, error = NFTService.list_nft_on_marketplace(
+        user_id=pending.user_id,
+        wallet_address=params['wallet_address'],
+        nft_id=params['nft_id'],
+        price_zen=Decimal(params['price_zen']),
+        tx_hash=pending.tx_hash,
+        receipt=receipt
+    )
+    if error:
+        raise ChainTxRejected(error)
+    return {'message': 'NFT listed successfully', 'listing': listing.to_dict()}
+
+
+def _finalize_market_buy(pending, receipt):
+    from app.services.nft_service import NFTService
+
+    params = pending.params
+    success, error = NFTService.buy_nft_from_marketplace(
+        buyer_id=pending.user_id,
+        buyer_wallet=params['wallet_address'],
+        listing_id=params['listing_id'],
+        tx_hash=pending.tx_hash,
+        receipt=receipt
+    )
+    if not success:
+        raise ChainTxRejected(error)
+    return {'message': 'NFT purchased successfully!'}
+
+
+def _finalize_market_cancel(pending, receipt):
+    from app.services.nft_service import NFTService
+
+    params = pending.params
+    success, error = NFTService.cancel_marketplace_listing(
+        user_id=pending.user_id,
+        wallet_address=params['wallet_address'],
+        listing_id=params['listing_id'],
+        tx_hash=pending.tx_hash,
+        receipt=receipt
+    )
+    if not success:
+        raise ChainTxRejected(error)
+    return {'message': 'Listing cancelled successfully'}
+
+
+DEFAULT_HANDLERS: Dict[str, Callable] = {
+    'nft_mint': _finalize_nft_mint,
+    'nft_upgrade': _finalize_nft_upgrade,
+    'market_list': _finalize_market_list,
+    'market_buy': _finalize_market_buy,
+    'market_cancel': _finalize_market_cancel,
+}
+
+
+# ----------------------------------------------------------------------
+# Watcher
+# ----------------------------------------------------------------------
+
+class ChainTxWatcher:
+    """Polls receipts for pending transactions once per block. See module docstring."""
+
+    NAME = 'default'
+    LEASE_SECONDS = 60              # Watcher lease; renewed every run
+    BATCH_SIZE = 200                # Outstanding hashes polled per block
+    CONFIRMATIONS = 1               # Blocks on top of the transaction's block before finalizing
+    TIMEOUT_BLOCKS = 300            # Blocks without a receipt before a hash is expired
+    MAX_FINALIZE_ATTEMPTS = 5       # Handler errors (not rejections) before giving up
+
+    def __init__(self, client, handlers=None, owner=None, confirmations=None, timeout_blocks=None):
+        self.client = client
+        self.handlers = handlers if handlers is not None else DEFAULT_HANDLERS
+        self.owner = owner or default_owner()
+        self.confirmations = self.CONFIRMATIONS if confirmations is None else confirmations
+        self.timeout_blocks = self.TIMEOUT_BLOCKS if timeout_blocks is None else timeout_blocks
+        self.lease = RowLease(ChainTxWatcherState, 'name', self.NAME, self.owner, self.LEASE_SECONDS)
+
+    # -- lease -------------------------------------------------------------
+
+    def acquire_lease(self, now):
+        return self.lease.acquire(now)
+
+    def release_lease(self):
+        self.lease.release()
+
+    # -- run ---------------------------------------------------------------
+
+    def run_once(self, now=None):
+        """
+        One watcher pass.
+
+        Returns:
+            Dict of counts, or None if another process holds the lease or no
+            new block has arrived since the last pass
+        """
+        now = now or datetime.utcnow()
+        if not self.acquire_lease(now):
+            return None
+
+        try:
+            head = self.client.block_number()
+            state = db.session.get(ChainTxWatcherState, self.NAME)
+            if state.last_block is not None and head <= state.last_block:
+                return None
+
+            stats = {'polled': 0, 'confirmed': 0, 'failed': 0, 'expired': 0}
+            entries = db.session.scalars(
+                select(PendingChainTx)
+                .where(PendingChainTx.status == PendingChainTxStatus.PENDING)
+                .order_by(PendingChainTx.id)
+                .limit(self.BATCH_SIZE)
+            ).all()
+            for entry in entries:
+                self._check(entry, head, now, stats)
+
+            state = db.session.get(ChainTxWatcherState, self.NAME)
+            state.last_block = head
+            db.session.commit()
+            return stats
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            self.release_lease()
+
+    def _check(self, entry, head, now, stats):
+        if entry.first_seen_block is None:
+            entry.first_seen_block = head
+
+        receipt = self.client.get_receipt(entry.tx_hash)
+        stats['polled'] += 1
+
+        if receipt is None:
+            if head - entry.first_seen_block >= self.timeout_blocks:
+                self._finish(entry, PendingChainTxStatus.EXPIRED, now,
+                             f"Transaction was not mined within {self.timeout_blocks} blocks")
+                stats['expired'] += 1
+                logger.warning(f"Chain tx {entry.tx_hash} ({entry.kind}) expired without a receipt")
+            db.session.commit()
+            return
+
+        entry.block_number = receipt['blockNumber']
+        if receipt['status'] != 1:
+            self._finish(entry, PendingChainTxStatus.FAILED, now, "Transaction reverted on the blockchain")
+            db.session.commit()
+            stats['failed'] += 1
+            logger.info(f"Chain tx {entry.tx_hash} ({entry.kind}) reverted in block {entry.block_number}")
+            return
+
+        if head - entry.block_number < self.confirmations:
+            db.session.commit()
+            return
+
+        handler = self.handlers.get(entry.kind)
+        if handler is None:
+            self._finish(entry, PendingChainTxStatus.FAILED, now, f"Unknown transaction kind: {entry.kind}")
+            db.session.commit()
+            stats['failed'] += 1
+            return
+
+        db.session.commit()
+
+        # Marked before the handler runs so that the handler's own commit
+        # writes the game-side effects and the CONFIRMED status together
+        tx_hash, block_number = entry.tx_hash, entry.block_number
+        self._finish(entry, PendingChainTxStatus.CONFIRMED, now)
+        try:
+            result = handler(entry, receipt)
+        except ChainTxRejected as e:
+            db.session.rollback()
+            self._finish(entry, PendingChainTxStatus.FAILED, now, str(e))
+            db.session.commit()
+            stats['failed'] += 1
+            logger.info(f"Chain tx {tx_hash} ({entry.kind}) rejected: {e}")
+            return
+        except Exception as e:
+            db.session.rollback()
+            entry.attempts += 1
+            entry.error = str(e)
+            if entry.attempts >= self.MAX_FINALIZE_ATTEMPTS:
+                self._finish(entry, PendingChainTxStatus.FAILED, now, f"Could not apply transaction: {e}")
+                stats['failed'] += 1
+            db.session.commit()
+            logger.error(f"Chain tx {tx_hash} ({entry.kind}): finalization failed: {e}", exc_info=True)
+            return
+
+        entry.result = result
+        db.session.commit()
+        stats['confirmed'] += 1
+        logger.info(f"Chain tx {tx_hash} ({entry.kind}) confirmed in block {block_number}")
+
+    @staticmethod
+    def _finish(entry, status, now, error=None):
+        entry.status = status
+        entry.error = error
+        entry.finalized_at = now
+
+
+# ----------------------------------------------------------------------
+# Entry points
+# ----------------------------------------------------------------------
+
+class ChainTxTracker:
+    """Entry points used by routes and the scheduler."""
+
+    @staticmethod
+    def track(kind: str, tx_hash: str, user_id: int, params: dict) -> Tuple[Optional[PendingChainTx], Optional[str]]:
+        """
+        Start tracking a user's transaction. Submitting the same hash again
+        returns the existing row, so client retries are harmless.
+
+        Returns:
+            (PendingChainTx, error_message) - error_message is None on success
+        """
+        if kind not in DEFAULT_HANDLERS:
+            return None, f"Unknown transaction kind: {kind}"
+        if not tx_hash or not TX_HASH_RE.match(tx_hash):
+            return None, "Invalid transaction hash."
+        tx_hash = tx_hash.lower()
+
+        existing = db.session.scalar(select(PendingChainTx).where(PendingChainTx.tx_hash == tx_hash))
+        if existing is None:
+            pending = PendingChainTx(tx_hash=tx_hash, kind=kind, user_id=user_id)
+            pending.params = params
+            db.session.add(pending)
+            try:
+                db.session.commit()
+                return pending, None
+            except IntegrityError:
+                db.session.rollback()  # Same hash submitted concurrently
+                existing = db.session.scalar(select(PendingChainTx).where(PendingChainTx.tx_hash == tx_hash))
+                if existing is None:
+                    raise
+
+        if existing.user_id != user_id or existing.kind != kind:
+            return None, "This transaction has already been submitted."
+        return existing, None
+
+    @staticmethod
+    def get_for_user(tx_hash: str, user_id: int) -> Optional[PendingChainTx]:
+        return db.session.scalar(
+            select(PendingChainTx).where(PendingChainTx.tx_hash == tx_hash.lower(), PendingChainTx.user_id == user_id)
+        )
+
+    @staticmethod
+    def has_work() -> bool:
+        return db.session.scalar(
+            select(PendingChainTx.id).where(PendingChainTx.status == PendingChainTxStatus.PENDING).limit(1)
+        ) is not None
+
+    @staticmethod
+    def watch_pending(client=None) -> Optional[dict]:
+        """Run one watcher pass if anything is pending (scheduler entry point)."""
+        if not ChainTxTracker.has_work():
+            return None
+        client = client or Web3TxClient.from_env()
+        return ChainTxWatcher(
+            client,
+            confirmations=current_app.config.get('CHAIN_TX_CONFIRMATIONS'),
+            timeout_blocks=current_app.config.get('CHAIN_TX_TIMEOUT_BLOCKS'),
+        ).run_once()
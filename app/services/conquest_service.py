@@ -23,7 +23,7 @@ from decimal import Decimal
 from typing import Optional
 
 from app.extensions import db
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, literal
 
 logger = logging.getLogger(__name__)
 
@@ -42,15 +42,17 @@ class ConquestService:
         Returns:
             True if country has zero regions (fully conquered)
         """
-        from app.models.location import Country
+        from app.models.location import Country, country_regions
 
         country = db.session.get(Country, country_id)
         if not country:
             return False
 
-        # Check if country has any current regions
-        region_count = country.current_regions.count()
-        return region_count == 0
+        # Ownership decides conquest, so read it from the database rather than
+        # this process's world graph; one indexed lookup, no row count
+        return db.session.scalar(
+            select(country_regions.c.region_id).where(country_regions.c.country_id == country_id).limit(1)
+        ) is None
 
     @staticmethod
     def conquer_country(conquered_country_id: int, conquering_country_id: int, war) -> bool:
@@ -95,29 +97,30 @@ class ConquestService:
             # 2. Transfer treasury gold (not currency)
             ConquestService._transfer_treasury(conquered, conqueror)
 
-            # 3. Freeze all companies and fire workers
+            # 3. Alert workers, company owners, office holders and citizens
+            #    (selected before the steps below fire and unseat them)
+            ConquestService._send_conquest_alerts(conquered, conqueror)
+
+            # 4. Freeze all companies and fire workers
             ConquestService._freeze_companies(conquered_country_id)
 
-            # 4. Clear government positions
+            # 5. Clear government positions
             ConquestService._clear_government(conquered_country_id)
 
-            # 5. Reject all pending laws
+            # 6. Reject all pending laws
             ConquestService._reject_pending_laws(conquered_country_id)
 
-            # 6. Cancel ongoing elections
+            # 7. Cancel ongoing elections
             ConquestService._cancel_elections(conquered_country_id)
 
-            # 7. Kick from alliance
+            # 8. Kick from alliance
             ConquestService._kick_from_alliance(conquered_country_id)
 
-            # 8. End the war
+            # 9. End the war
             if war:
                 war.status = WarStatus.ENDED_EXPIRED
                 war.ended_at = datetime.utcnow()
 
-            # 9. Send alerts to all citizens
-            ConquestService._send_conquest_alerts(conquered, conqueror)
-
             db.session.commit()
             logger.info(f"[Conquest] {conquered.name} has been fully conquered by {conqueror.name}")
             return True
@@ -143,48 +146,53 @@ class ConquestService:
 
     @staticmethod
     def _freeze_companies(country_id: int):
-        """Freeze all companies in the country and fire all workers."""
+        """
+        Freeze all companies in the country, fire all workers and close their
+        job offers.
+
+        Runs as a fixed handful of set-based statements however many
+        companies and employees the country has.
+        """
         from app.models.company import Company, Employment, JobOffer
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
+        from app.models.time_allocation import WorkSession
 
-        # Get all companies in this country
-        companies = Company.query.filter_by(
-            country_id=country_id,
-            is_deleted=False
-        ).all()
+        now = datetime.utcnow()
+        company_ids = select(Company.id).where(
+            Company.country_id == country_id,
+            Company.is_deleted == False
+        )
+        employment_ids = select(Employment.id).where(Employment.company_id.in_(company_ids))
+
+        # Keep the fired workers' work history
+        db.session.execute(
+            update(WorkSession)
+            .where(WorkSession.employment_id.in_(employment_ids))
+            .values(employment_id=None)
+            .execution_options(synchronize_session=False)
+        )
 
-        fired_count = 0
-        frozen_count = 0
-
-        for company in companies:
-            # Fire all workers
-            for employment in company.employees.all():
-                # Send alert to worker
-                create_alert(
-                    user=employment.user,
-                    alert_type=AlertType.EMPLOYMENT,
-                    title="Employment Terminated - Country Conquered",
-                    content=f"Your employment at {company.name} has been terminated because {company.country.name} was conquered."
-                )
-                db.session.delete(employment)
-                fired_count += 1
-
-            # Deactivate all job offers
-            for job_offer in company.job_offers.filter_by(is_active=True).all():
-                job_offer.is_active = False
-
-            # Freeze the company
-            company.freeze()
-            frozen_count += 1
-
-            # Alert company owner
-            create_alert(
-                user=company.owner,
-                alert_type=AlertType.COMPANY,
-                title="Company Frozen - Country Conquered",
-                content=f"Your company {company.name} has been frozen because {company.country.name} was conquered. Operations will resume upon liberation."
-            )
+        # Fire all workers
+        fired_count = db.session.execute(
+            delete(Employment)
+            .where(Employment.company_id.in_(company_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        # Deactivate all job offers
+        db.session.execute(
+            update(JobOffer)
+            .where(JobOffer.company_id.in_(company_ids), JobOffer.is_active == True)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+
+        # Freeze the companies
+        frozen_count = db.session.execute(
+            update(Company)
+            .where(Company.country_id == country_id, Company.is_deleted == False)
+            .values(is_frozen=True, frozen_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
         logger.info(f"[Conquest] Frozen {frozen_count} companies, fired {fired_count} workers")
 
@@ -192,68 +200,40 @@ class ConquestService:
     def _clear_government(country_id: int):
         """Clear all government positions (president, congress, ministers)."""
         from app.models.government import CountryPresident, CongressMember, Minister
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
 
-        # Clear president
-        current_president = CountryPresident.query.filter_by(
-            country_id=country_id,
-            is_current=True
-        ).first()
+        now = datetime.utcnow()
 
-        if current_president:
-            current_president.is_current = False
-            current_president.left_office_early = True
-            current_president.left_office_at = datetime.utcnow()
-            current_president.left_office_reason = 'country_conquered'
-
-            create_alert(
-                user=current_president.user,
-                alert_type=AlertType.GOVERNMENT,
-                title="Presidency Lost - Country Conquered",
-                content=f"You have lost your position as President because your country was conquered."
-            )
-            logger.info(f"[Conquest] Removed president: {current_president.user.username}")
+        # Clear president
+        presidents = db.session.execute(
+            update(CountryPresident)
+            .where(CountryPresident.country_id == country_id, CountryPresident.is_current == True)
+            .values(is_current=False, left_office_early=True, left_office_at=now,
+                    left_office_reason='country_conquered')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        logger.info(f"[Conquest] Removed {presidents} president")
 
         # Clear congress
-        congress_members = CongressMember.query.filter_by(
-            country_id=country_id,
-            is_current=True
-        ).all()
-
-        for member in congress_members:
-            member.is_current = False
-            member.left_seat_early = True
-            member.left_seat_at = datetime.utcnow()
-            member.left_seat_reason = 'country_conquered'
-
-            create_alert(
-                user=member.user,
-                alert_type=AlertType.GOVERNMENT,
-                title="Congress Seat Lost - Country Conquered",
-                content=f"You have lost your Congress seat because your country was conquered."
-            )
-
-        logger.info(f"[Conquest] Removed {len(congress_members)} congress members")
+        congress_members = db.session.execute(
+            update(CongressMember)
+            .where(CongressMember.country_id == country_id, CongressMember.is_current == True)
+            .values(is_current=False, left_seat_early=True, left_seat_at=now,
+                    left_seat_reason='country_conquered')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        logger.info(f"[Conquest] Removed {congress_members} congress members")
 
         # Clear ministers
-        ministers = Minister.query.filter_by(
-            country_id=country_id,
-            is_active=True
-        ).all()
+        ministers = db.session.execute(
+            update(Minister)
+            .where(Minister.country_id == country_id, Minister.is_active == True)
+            .values(is_active=False, resigned_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        logger.info(f"[Conquest] Removed {ministers} ministers")
 
-        for minister in ministers:
-            minister.is_active = False
-            minister.resigned_at = datetime.utcnow()
-
-            create_alert(
-                user=minister.user,
-                alert_type=AlertType.GOVERNMENT,
-                title="Ministry Position Lost - Country Conquered",
-                content=f"You have lost your Minister position because your country was conquered."
-            )
-
-        logger.info(f"[Conquest] Removed {len(ministers)} ministers")
+        from app.services.politics_read_model_service import PoliticsReadModelService
+        PoliticsReadModelService.on_government_change(country_id)
 
     @staticmethod
     def _reject_pending_laws(country_id: int):
@@ -322,17 +302,77 @@ class ConquestService:
 
     @staticmethod
     def _send_conquest_alerts(conquered, conqueror):
-        """Send alerts to all citizens of conquered country."""
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
-
-        for citizen in conquered.citizens.all():
-            create_alert(
-                user=citizen,
-                alert_type=AlertType.GOVERNMENT,
-                title="Your Country Has Been Conquered",
-                content=f"{conquered.name} has been fully conquered by {conqueror.name}. Your political rights are suspended until liberation."
-            )
+        """
+        Alert the conquered country's workers, company owners, office holders
+        and citizens with one INSERT ... SELECT. Must run before the
+        employments and government positions are cleared.
+        """
+        from app.models.company import Company, Employment
+        from app.models.government import CountryPresident, CongressMember, Minister
+        from app.models.user import User
+        from app.alert_helpers import alert_select, create_alerts_from_select
+        from app.models.messaging import AlertType
+
+        country_id = conquered.id
+        now = datetime.utcnow()
+
+        created = create_alerts_from_select(
+            alert_select(
+                select(Employment.user_id).join(Employment.company).where(
+                    Company.country_id == country_id, Company.is_deleted == False
+                ),
+                AlertType.EMPLOYMENT,
+                "Employment Terminated - Country Conquered",
+                literal("Your employment at ") + Company.name
+                + f" has been terminated because {conquered.name} was conquered.",
+                created_at=now
+            ),
+            alert_select(
+                select(Company.owner_id).where(
+                    Company.country_id == country_id, Company.is_deleted == False
+                ),
+                AlertType.COMPANY,
+                "Company Frozen - Country Conquered",
+                literal("Your company ") + Company.name
+                + f" has been frozen because {conquered.name} was conquered. Operations will resume upon liberation.",
+                created_at=now
+            ),
+            alert_select(
+                select(CountryPresident.user_id).where(
+                    CountryPresident.country_id == country_id, CountryPresident.is_current == True
+                ),
+                AlertType.GOVERNMENT,
+                "Presidency Lost - Country Conquered",
+                "You have lost your position as President because your country was conquered.",
+                created_at=now
+            ),
+            alert_select(
+                select(CongressMember.user_id).where(
+                    CongressMember.country_id == country_id, CongressMember.is_current == True
+                ),
+                AlertType.GOVERNMENT,
+                "Congress Seat Lost - Country Conquered",
+                "You have lost your Congress seat because your country was conquered.",
+                created_at=now
+            ),
+            alert_select(
+                select(Minister.user_id).where(
+                    Minister.country_id == country_id, Minister.is_active == True
+                ),
+                AlertType.GOVERNMENT,
+                "Ministry Position Lost - Country Conquered",
+                "You have lost your Minister position because your country was conquered.",
+                created_at=now
+            ),
+            alert_select(
+                select(User.id).where(User.citizenship_id == country_id),
+                AlertType.GOVERNMENT,
+                "Your Country Has Been Conquered",
+                f"{conquered.name} has been fully conquered by {conqueror.name}. Your political rights are suspended until liberation.",
+                created_at=now
+            ),
+        )
+        logger.info(f"[Conquest] Sent {created} alerts")
 
     @staticmethod
     def liberate_country(country_id: int, liberator_user_id: Optional[int] = None) -> bool:
@@ -371,10 +411,13 @@ class ConquestService:
             country.conquered_by_id = None
             country.conquered_at = None
 
-            # 2. Unfreeze all companies
+            # 2. Alert company owners and citizens (before companies are unfrozen)
+            ConquestService._send_liberation_alerts(country)
+
+            # 3. Unfreeze all companies
             ConquestService._unfreeze_companies(country_id)
 
-            # 3. Handle president assignment
+            # 4. Handle president assignment
             if liberator_user_id:
                 liberator = db.session.get(User, liberator_user_id)
                 if liberator and liberator.citizenship_id == country_id:
@@ -386,9 +429,6 @@ class ConquestService:
             else:
                 logger.info(f"[Liberation] No liberator specified, government remains empty")
 
-            # 4. Send liberation alerts
-            ConquestService._send_liberation_alerts(country)
-
             db.session.commit()
             logger.info(f"[Liberation] {country.name} has been liberated!")
             return True
@@ -402,34 +442,21 @@ class ConquestService:
     def _unfreeze_companies(country_id: int):
         """Unfreeze all companies in the country."""
         from app.models.company import Company
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
 
-        companies = Company.query.filter_by(
-            country_id=country_id,
-            is_frozen=True,
-            is_deleted=False
-        ).all()
-
-        for company in companies:
-            company.unfreeze()
-
-            # Alert owner
-            create_alert(
-                user=company.owner,
-                alert_type=AlertType.COMPANY,
-                title="Company Operations Restored",
-                content=f"Your company {company.name} can now resume operations. Your country has been liberated!"
-            )
+        unfrozen = db.session.execute(
+            update(Company)
+            .where(Company.country_id == country_id, Company.is_frozen == True, Company.is_deleted == False)
+            .values(is_frozen=False, frozen_at=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
-        logger.info(f"[Liberation] Unfroze {len(companies)} companies")
+        logger.info(f"[Liberation] Unfroze {unfrozen} companies")
 
     @staticmethod
     def _assign_liberator_as_president(country_id: int, liberator):
         """Assign the liberator as president of the liberated country."""
         from app.models.government import CountryPresident
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
+        from app.models.messaging import Alert, AlertType
 
         # Create new president record
         new_president = CountryPresident(
@@ -443,27 +470,52 @@ class ConquestService:
         )
         db.session.add(new_president)
 
+        from app.services.politics_read_model_service import PoliticsReadModelService
+        db.session.flush()
+        PoliticsReadModelService.on_government_change(country_id)
+
         # Alert the liberator
-        create_alert(
-            user=liberator,
-            alert_type=AlertType.GOVERNMENT,
+        db.session.add(Alert(
+            user_id=liberator.id,
+            alert_type=AlertType.GOVERNMENT.value,
             title="You Are Now President!",
             content=f"As the liberator of your country, you have been appointed as President. Lead your people to recovery!"
-        )
+        ))
 
     @staticmethod
     def _send_liberation_alerts(country):
-        """Send alerts to all citizens of liberated country."""
-        from app.alert_helpers import create_alert
-        from app.models.activity import AlertType
-
-        for citizen in country.citizens.all():
-            create_alert(
-                user=citizen,
-                alert_type=AlertType.GOVERNMENT,
-                title="Your Country Has Been Liberated!",
-                content=f"{country.name} has been liberated! Your political rights have been restored."
-            )
+        """
+        Alert the owners of frozen companies and all citizens of the liberated
+        country with one INSERT ... SELECT. Must run before the companies are
+        unfrozen.
+        """
+        from app.models.company import Company
+        from app.models.user import User
+        from app.alert_helpers import alert_select, create_alerts_from_select
+        from app.models.messaging import AlertType
+
+        now = datetime.utcnow()
+
+        created = create_alerts_from_select(
+            alert_select(
+                select(Company.owner_id).where(
+                    Company.country_id == country.id, Company.is_frozen == True, Company.is_deleted == False
+                ),
+                AlertType.COMPANY,
+                "Company Operations Restored",
+                literal("Your company ") + Company.name
+                + " can now resume operations. Your country has been liberated!",
+                created_at=now
+            ),
+            alert_select(
+                select(User.id).where(User.citizenship_id == country.id),
+                AlertType.GOVERNMENT,
+                "Your Country Has Been Liberated!",
+                f"{country.name} has been liberated! Your political rights have been restored.",
+                created_at=now
+            ),
+        )
+        logger.info(f"[Liberation] Sent {created} alerts")
 
 
 # Import timedelta at module level for use in _assign_liberator_as_president
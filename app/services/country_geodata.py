@@ -0,0 +1,79 @@
+"""
+Country Geodata - per-process cache of the world map's country borders.
+
+app/data/countries.geojson (~2.6 MB) never changes while the app runs, yet
+/api/countries and /api/country/... used to read and parse it on every
+request and serialize it again for the response. It is now parsed once,
+indexed by ISO code and name, and served as ready-made JSON text.
+
+Under a preloaded Gunicorn master (app/lifecycle.py) the file is loaded
+before the workers fork, so they all share one copy.
+"""
+
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+GEOJSON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'countries.geojson')
+
+
+class CountryGeodata:
+    """Process-wide cache; use the module-level `country_geodata` instance."""
+
+    def __init__(self, path=GEOJSON_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._all = None        # Whole FeatureCollection as JSON text
+        self._by_code = {}      # ISO_A2 / ISO_A3 -> feature JSON text
+        self._by_name = {}      # Lower-cased NAME -> feature JSON text
+        self.loads = 0          # Number of file parses (for tests / diagnostics)
+
+    def load(self):
+        """Parse the file if this process has not yet; raises FileNotFoundError if it is missing."""
+        if self._all is not None:
+            return
+        with self._lock:
+            if self._all is not None:
+                return
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            by_code = {}
+            by_name = {}
+            # First match wins, as when the routes scanned the features in order
+            for feature in data.get('features', []):
+                properties = feature.get('properties', {})
+                text = json.dumps(feature)
+                # Unassigned codes are stored as the number -99, never a match
+                for key in ('ISO_A2', 'ISO_A3'):
+                    if isinstance(properties.get(key), str):
+                        by_code.setdefault(properties[key], text)
+                if isinstance(properties.get('NAME'), str):
+                    by_name.setdefault(properties['NAME'].lower(), text)
+
+            self._by_code = by_code
+            self._by_name = by_name
+            self._all = json.dumps(data)
+            self.loads += 1
+        logger.debug(f"Country geodata loaded: {len(data.get('features', []))} countries")
+
+    def all_json(self):
+        self.load()
+        return self._all
+
+    def country_json(self, country_code):
+        """Feature JSON for an ISO alpha-2 or alpha-3 code, or None."""
+        self.load()
+        return self._by_code.get(country_code.upper())
+
+    def country_json_by_name(self, country_name):
+        """Feature JSON for a country name (case-insensitive), or None."""
+        self.load()
+        return self._by_name.get(country_name.lower())
+
+
+# Process-wide instance
+country_geodata = CountryGeodata()
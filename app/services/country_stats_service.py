@@ -0,0 +1,333 @@
+"""
+Country Stats Service - Maintains the materialized CountryStats rows.
+
+The country page reads a single CountryStats row instead of running a COUNT/AVG
+query per statistic. Rows are updated incrementally with atomic
+`col = col + delta` UPDATEs from the code paths that change the underlying
+data, and fully recomputed by a nightly scheduler job to fix any drift
+(e.g. bulk admin edits that bypass the hooks).
+
+Experience gains are not hooked: every fight, work, training and study
+session would update (and lock until commit) its country's single row.
+total_experience, and with it the average level, moves with citizenship
+changes and otherwise follows the nightly recompute.
+
+A missing row is computed from scratch on first read.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, func, case
+from app.extensions import db, cache
+
+logger = logging.getLogger(__name__)
+
+# How long the live "online now" / world citizen counts are cached
+ONLINE_COUNT_CACHE_SECONDS = 60
+WORLD_CITIZENS_CACHE_SECONDS = 300
+
+
+def _today_start():
+    return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class CountryStatsService:
+    """Service for reading and maintaining per-country statistics."""
+
+    # ------------------------------------------------------------------
+    # From-scratch computation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute(country_id):
+        """
+        Compute all statistics for one country directly from the source tables.
+
+        Returns:
+            Dict of CountryStats column values
+        """
+        from app.models import User, Region, Company, country_regions
+
+        owned_regions = (
+            select(Region.id)
+            .join(country_regions, Region.id == country_regions.c.region_id)
+            .where(country_regions.c.country_id == country_id, Region.is_deleted == False)
+        )
+
+        population = db.session.scalar(
+            select(func.count(User.id)).where(
+                User.current_region_id.in_(owned_regions),
+                User.is_deleted == False
+            )
+        ) or 0
+
+        citizen_count, total_experience, new_citizens = db.session.execute(
+            select(
+                func.count(User.id),
+                func.coalesce(func.sum(User.experience), 0),
+                func.coalesce(func.sum(case((User.created_at >= _today_start(), 1), else_=0)), 0)
+            ).where(User.citizenship_id == country_id, User.is_deleted == False)
+        ).one()
+
+        region_count = db.session.scalar(
+            select(func.count()).select_from(owned_regions.subquery())
+        ) or 0
+
+        company_count = db.session.scalar(
+            select(func.count(Company.id)).where(
+                Company.country_id == country_id,
+                Company.is_deleted == False
+            )
+        ) or 0
+
+        return {
+            'population': population,
+            'citizen_count': citizen_count or 0,
+            'total_experience': int(total_experience or 0),
+            'new_citizens_today': int(new_citizens or 0),
+            'new_citizens_date': _today_start().date(),
+            'region_count': region_count,
+            'company_count': company_count,
+        }
+
+    @staticmethod
+    def recompute(country_id):
+        """Rebuild one country's row from scratch (does not commit)."""
+        from app.models.country_stats import CountryStats
+
+        values = CountryStatsService.compute(country_id)
+        stats = db.session.get(CountryStats, country_id)
+        if stats is None:
+            stats = CountryStats(country_id=country_id)
+            db.session.add(stats)
+        for key, value in values.items():
+            setattr(stats, key, value)
+        stats.recomputed_at = datetime.utcnow()
+        db.session.flush()
+        return stats
+
+    @staticmethod
+    def recompute_all():
+        """
+        Rebuild every country's row using grouped queries (does not commit).
+
+        Returns:
+            Number of countries recomputed
+        """
+        from app.models import User, Country, Region, Company, country_regions
+        from app.models.country_stats import CountryStats
+
+        today_start = _today_start()
+        country_ids = db.session.scalars(select(Country.id).where(Country.is_deleted == False)).all()
+
+        live_regions = (
+            select(country_regions.c.country_id, country_regions.c.region_id)
+            .join(Region, Region.id == country_regions.c.region_id)
+            .where(Region.is_deleted == False)
+            .subquery()
+        )
+
+        population = dict(db.session.execute(
+            select(live_regions.c.country_id, func.count(User.id))
+            .join(User, User.current_region_id == live_regions.c.region_id)
+            .where(User.is_deleted == False)
+            .group_by(live_regions.c.country_id)
+        ).all())
+
+        citizens = {
+            row[0]: row[1:] for row in db.session.execute(
+                select(
+                    User.citizenship_id,
+                    func.count(User.id),
+                    func.coalesce(func.sum(User.experience), 0),
+                    func.coalesce(func.sum(case((User.created_at >= today_start, 1), else_=0)), 0)
+                )
+                .where(User.citizenship_id.isnot(None), User.is_deleted == False)
+                .group_by(User.citizenship_id)
+            ).all()
+        }
+
+        regions = dict(db.session.execute(
+            select(live_regions.c.country_id, func.count()).group_by(live_regions.c.country_id)
+        ).all())
+
+        companies = dict(db.session.execute(
+            select(Company.country_id, func.count(Company.id))
+            .where(Company.is_deleted == False)
+            .group_by(Company.country_id)
+        ).all())
+
+        existing = {
+            s.country_id: s for s in db.session.scalars(select(CountryStats)).all()
+        }
+
+        now = datetime.utcnow()
+        for country_id in country_ids:
+            stats = existing.get(country_id)
+            if stats is None:
+                stats = CountryStats(country_id=country_id)
+                db.session.add(stats)
+
+            citizen_count, total_experience, new_citizens = citizens.get(country_id, (0, 0, 0))
+            stats.population = population.get(country_id, 0)
+            stats.citizen_count = citizen_count
+            stats.total_experience = int(total_experience)
+            stats.new_citizens_today = int(new_citizens)
+            stats.new_citizens_date = today_start.date()
+            stats.region_count = regions.get(country_id, 0)
+            stats.company_count = companies.get(country_id, 0)
+            stats.recomputed_at = now
+
+        db.session.flush()
+        return len(country_ids)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_stats(country_id):
+        """Single-row lookup; computes the row on first access."""
+        from app.models.country_stats import CountryStats
+
+        stats = db.session.get(CountryStats, country_id)
+        if stats is None:
+            stats = CountryStatsService.recompute(country_id)
+            db.session.commit()
+        return stats
+
+    @staticmethod
+    def get_online_count(country_id):
+        """Citizens active in the last 5 minutes (short-lived cache, inherently time-based)."""
+        from app.models import User
+
+        cache_key = f'country_online_{country_id}'
+        count = cache.get(cache_key)
+        if count is None:
+            five_minutes_ago = datetime.utcnow() - timedelta(minutes=5)
+            count = db.session.scalar(
+                select(func.count(User.id)).where(
+                    User.citizenship_id == country_id,
+                    User.is_deleted == False,
+                    User.last_seen >= five_minutes_ago
+                )
+            ) or 0
+            cache.set(cache_key, count, timeout=ONLINE_COUNT_CACHE_SECONDS)
+        return count
+
+    @staticmethod
+    def get_world_citizen_count():
+        """Total non-deleted users (cached)."""
+        from app.models import User
+
+        count = cache.get('world_citizens_count')
+        if count is None:
+            count = db.session.scalar(
+                select(func.count(User.id)).where(User.is_deleted == False)
+            ) or 0
+            cache.set('world_citizens_count', count, timeout=WORLD_CITIZENS_CACHE_SECONDS)
+        return count
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _increment(country_id, **deltas):
+        """Atomically add deltas to a country's row. No-op if the row doesn't exist yet."""
+        from app.models.country_stats import CountryStats
+
+        if country_id is None:
+            return
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not deltas:
+            return
+
+        values = {k: getattr(CountryStats, k) + v for k, v in deltas.items()}
+        db.session.execute(
+            update(CountryStats)
+            .where(CountryStats.country_id == country_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _region_owners(*region_ids):
+        """Map region_id -> current owner country_id for the given regions (one query)."""
+        from app.models import country_regions
+
+        region_ids = [r for r in region_ids if r is not None]
+        if not region_ids:
+            return {}
+        return dict(db.session.execute(
+            select(country_regions.c.region_id, country_regions.c.country_id)
+            .where(country_regions.c.region_id.in_(region_ids))
+        ).all())
+
+    @staticmethod
+    def on_citizenship_change(user, old_country_id, new_country_id):
+        """A user gained, lost or switched citizenship."""
+        from app.models.country_stats import CountryStats
+
+        if old_country_id == new_country_id:
+            return
+        experience = user.experience or 0
+
+        CountryStatsService._increment(old_country_id, citizen_count=-1, total_experience=-experience)
+        CountryStatsService._increment(new_country_id, citizen_count=1, total_experience=experience)
+
+        if new_country_id is not None and user.created_at and user.created_at >= _today_start():
+            today = _today_start().date()
+            db.session.execute(
+                update(CountryStats)
+                .where(CountryStats.country_id == new_country_id)
+                .values(
+                    new_citizens_today=case(
+                        (CountryStats.new_citizens_date == today, CountryStats.new_citizens_today + 1),
+                        else_=1
+                    ),
+                    new_citizens_date=today
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def on_location_change(old_region_id, new_region_id):
+        """A user moved between regions (travel, initial placement)."""
+        if old_region_id == new_region_id:
+            return
+        owners = CountryStatsService._region_owners(old_region_id, new_region_id)
+        old_owner = owners.get(old_region_id)
+        new_owner = owners.get(new_region_id)
+        if old_owner == new_owner:
+            return
+        CountryStatsService._increment(old_owner, population=-1)
+        CountryStatsService._increment(new_owner, population=1)
+
+    @staticmethod
+    def on_company_opened(country_id):
+        CountryStatsService._increment(country_id, company_count=1)
+
+    @staticmethod
+    def on_company_closed(country_id):
+        CountryStatsService._increment(country_id, company_count=-1)
+
+    @staticmethod
+    def on_region_transfer(region_id, old_owner_id, new_owner_id):
+        """
+        A region changed hands (conquest, admin transfer) or was created (old_owner_id=None).
+
+        Residents of the region move to the new owner's population.
+        """
+        from app.models import User
+
+        if old_owner_id == new_owner_id:
+            return
+        residents = db.session.scalar(
+            select(func.count(User.id)).where(
+                User.current_region_id == region_id,
+                User.is_deleted == False
+            )
+        ) or 0
+        CountryStatsService._increment(old_owner_id, population=-residents, region_count=-1)
+        CountryStatsService._increment(new_owner_id, population=residents, region_count=1)
@@ -146,6 +146,24 @@ class CurrencyService:
 
         return True
 
+    @staticmethod
+    def lock_amount(user, country_id):
+        """
+        Lock the user's currency row until the transaction ends and return its amount.
+
+        Used before pricing a market trade, so the balance the trade is priced
+        against cannot be spent by another request before it settles.
+        """
+        from app.models.currency import UserCurrency
+
+        currency = db.session.scalar(
+            select(UserCurrency).where(
+                UserCurrency.user_id == user.id,
+                UserCurrency.country_id == country_id
+            ).with_for_update()
+        )
+        return currency.amount if currency else Decimal('0')
+
     @staticmethod
     def has_sufficient(user, country_id, amount):
         """Check if user has enough of a specific currency."""
@@ -209,6 +227,16 @@ class CurrencyService:
 
     # ============== GOLD TRANSACTIONS (with row-level locking) ==============
 
+    @staticmethod
+    def lock_gold(user_id):
+        """Lock the user row until the transaction ends and return the user's gold."""
+        from app.models import User
+
+        user = db.session.scalar(
+            select(User).where(User.id == user_id).with_for_update()
+        )
+        return user.gold if user else Decimal('0')
+
     @staticmethod
     def deduct_gold(user_id, amount, description=''):
         """
@@ -17,6 +17,7 @@ from app.models import (
     PartyElection, PartyCandidate, PartyVote,
     User, Country, PoliticalParty
 )
+from app.services.chain_outbox_service import ChainOutboxService, bytes_arg
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -41,6 +42,7 @@ class ElectionBlockchainService:
     def get_web3_and_contract():
         """Get Web3 instance and ElectionResults contract."""
         from web3 import Web3
+        from app.blockchain.web3_config import get_web3
 
         rpc_url = current_app.config.get('WEB3_RPC_URL')
         contract_address = current_app.config.get('ELECTION_RESULTS_CONTRACT_ADDRESS')
@@ -49,7 +51,7 @@ class ElectionBlockchainService:
         if not all([rpc_url, contract_address, private_key]):
             return None, None, None
 
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = get_web3(rpc_url)
 
         # Load contract ABI
         import os
@@ -80,6 +82,15 @@ class ElectionBlockchainService:
 
         return w3, contract, private_key
 
+    @staticmethod
+    def is_blockchain_configured() -> bool:
+        """Whether results should be queued for on-chain publication."""
+        return all([
+            current_app.config.get('WEB3_RPC_URL'),
+            current_app.config.get('ELECTION_RESULTS_CONTRACT_ADDRESS'),
+            current_app.config.get('WEB3_PRIVATE_KEY'),
+        ])
+
     @staticmethod
     def generate_results_hash(results_data: dict) -> str:
         """Generate a keccak256 hash of the results data."""
@@ -234,10 +245,11 @@ class ElectionBlockchainService:
     @classmethod
     def publish_government_election_results(cls, election: GovernmentElection) -> Tuple[bool, str]:
         """
-        Publish government election results to blockchain.
+        Queue government election results for blockchain publication.
+        The transaction itself is sent by ChainPublisher.
 
         Returns:
-            (success, message/tx_hash)
+            (success, message)
         """
         try:
             # Prepare results data
@@ -251,10 +263,7 @@ class ElectionBlockchainService:
             if not ipfs_hash:
                 ipfs_hash = "pending"  # Fallback if IPFS upload fails
 
-            # Get web3 connection
-            w3, contract, private_key = cls.get_web3_and_contract()
-
-            if not w3 or not contract:
+            if not cls.is_blockchain_configured():
                 # Log results even if blockchain is not configured
                 current_app.logger.info(
                     f"Election {election.id} results prepared but blockchain not configured. "
@@ -276,34 +285,26 @@ class ElectionBlockchainService:
                 if winners:
                     winner_id = winners[0]['user_id']
 
-            account = w3.eth.account.from_key(private_key)
-
-            tx = contract.functions.publishResult(
-                election.id,
-                election_type,
-                election.country_id,
-                0,  # partyId (0 for government elections)
-                winner_id,
-                results_data['total_votes'],
-                results_data['total_candidates'],
-                ipfs_hash,
-                bytes.fromhex(results_hash[2:])  # Remove 0x prefix
-            ).build_transaction({
-                'from': account.address,
-                'nonce': w3.eth.get_transaction_count(account.address),
-                'gas': 300000,
-                'gasPrice': w3.eth.gas_price
-            })
-
-            # Sign and send transaction
-            signed_tx = w3.eth.account.sign_transaction(tx, private_key)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Queue for the chain publisher; committed together with the election results
+            entry = ChainOutboxService.enqueue(
+                f'government_election:{election.id}', 'election_results', 'publishResult', [
+                    election.id,
+                    election_type,
+                    election.country_id,
+                    0,  # partyId (0 for government elections)
+                    winner_id,
+                    results_data['total_votes'],
+                    results_data['total_candidates'],
+                    ipfs_hash,
+                    bytes_arg(results_hash)
+                ]
+            )
 
             current_app.logger.info(
-                f"Published election {election.id} results to blockchain. TX: {tx_hash.hex()}"
+                f"Queued election {election.id} results for blockchain publication (outbox {entry.id})"
             )
 
-            return True, tx_hash.hex()
+            return True, f"Queued for publication (outbox {entry.id}). Hash: {results_hash}"
 
         except Exception as e:
             current_app.logger.error(f"Error publishing election results: {e}", exc_info=True)
@@ -312,10 +313,11 @@ class ElectionBlockchainService:
     @classmethod
     def publish_party_election_results(cls, election: PartyElection) -> Tuple[bool, str]:
         """
-        Publish party election results to blockchain.
+        Queue party election results for blockchain publication.
+        The transaction itself is sent by ChainPublisher.
 
         Returns:
-            (success, message/tx_hash)
+            (success, message)
         """
         try:
             # Prepare results data
@@ -330,44 +332,33 @@ class ElectionBlockchainService:
             if not ipfs_hash:
                 ipfs_hash = "pending"
 
-            # Get web3 connection
-            w3, contract, private_key = cls.get_web3_and_contract()
-
-            if not w3 or not contract:
+            if not cls.is_blockchain_configured():
                 current_app.logger.info(
                     f"Party election {election.id} results prepared but blockchain not configured. "
                     f"Hash: {results_hash}, IPFS: {ipfs_hash}"
                 )
                 return True, f"Results prepared (blockchain not configured). Hash: {results_hash}"
 
-            account = w3.eth.account.from_key(private_key)
-
-            tx = contract.functions.publishResult(
-                election.id,
-                cls.ELECTION_TYPE_PARTY_PRESIDENT,
-                party.country_id if party else 0,
-                election.party_id,
-                election.winner_id or 0,
-                results_data['total_votes'],
-                results_data['total_candidates'],
-                ipfs_hash,
-                bytes.fromhex(results_hash[2:])
-            ).build_transaction({
-                'from': account.address,
-                'nonce': w3.eth.get_transaction_count(account.address),
-                'gas': 300000,
-                'gasPrice': w3.eth.gas_price
-            })
-
-            # Sign and send transaction
-            signed_tx = w3.eth.account.sign_transaction(tx, private_key)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Queue for the chain publisher; committed together with the election results
+            entry = ChainOutboxService.enqueue(
+                f'party_election:{election.id}', 'election_results', 'publishResult', [
+                    election.id,
+                    cls.ELECTION_TYPE_PARTY_PRESIDENT,
+                    party.country_id if party else 0,
+                    election.party_id,
+                    election.winner_id or 0,
+                    results_data['total_votes'],
+                    results_data['total_candidates'],
+                    ipfs_hash,
+                    bytes_arg(results_hash)
+                ]
+            )
 
             current_app.logger.info(
-                f"Published party election {election.id} results to blockchain. TX: {tx_hash.hex()}"
+                f"Queued party election {election.id} results for blockchain publication (outbox {entry.id})"
             )
 
-            return True, tx_hash.hex()
+            return True, f"Queued for publication (outbox {entry.id}). Hash: {results_hash}"
 
         except Exception as e:
             current_app.logger.error(f"Error publishing party election results: {e}", exc_info=True)
@@ -10,6 +10,7 @@ from decimal import Decimal
 from sqlalchemy import select
 from app.extensions import db
 from app.constants import GameConstants
+from app.services.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +110,6 @@ class EmploymentService:
         from app.models.company import Employment, Company, CompanyInventory, CompanyTransaction, CompanyTransactionType, CompanyProductionProgress, CompanyType
         from app.models.time_allocation import WorkSession
         from app.models.currency import log_transaction
-        from app.models.resource import Resource
 
         # Get employment
         employment = db.session.get(Employment, employment_id)
@@ -168,9 +168,7 @@ class EmploymentService:
         # Only check electricity if company has it enabled
         if company.use_electricity:
             # Get electricity resource
-            electricity_resource = db.session.scalar(
-                select(Resource).where(Resource.name == 'Electricity')
-            )
+            electricity_resource = reference_data.resource_by_name('Electricity')
 
             if electricity_resource:
                 # Check if company has enough electricity in inventory (lock row)
@@ -223,7 +221,7 @@ class EmploymentService:
             # for ALL products that would be produced by this work session
             from app.main.company_routes import get_input_requirements
 
-            production_resource = db.session.get(Resource, company.current_production_resource_id)
+            production_resource = reference_data.resource(company.current_production_resource_id)
             if not production_resource:
                 return False, "Invalid production resource", 0.0, Decimal('0'), 0, 0
 
@@ -245,9 +243,7 @@ class EmploymentService:
                 # Check if company has enough raw materials for ALL expected products
                 for material_name, quantity_per_unit in input_requirements.items():
                     # Get the resource by name
-                    material_resource = db.session.scalar(
-                        select(Resource).where(Resource.name == material_name)
-                    )
+                    material_resource = reference_data.resource_by_name(material_name)
 
                     if not material_resource:
                         return False, f"Material resource {material_name} not found in database", 0.0, Decimal('0'), 0, 0
@@ -348,15 +344,13 @@ class EmploymentService:
 
                 # Consume raw materials for this product
                 from app.main.company_routes import get_input_requirements
-                production_resource = db.session.get(Resource, company.current_production_resource_id)
+                production_resource = reference_data.resource(company.current_production_resource_id)
                 base_input_requirements = get_input_requirements(production_resource.name, company.quality_level)
                 input_requirements = BonusCalculator.get_company_material_cost(company.id, base_input_requirements)
 
                 # Deduct materials from inventory (lock rows to prevent race conditions)
                 for material_name, quantity_per_unit in input_requirements.items():
-                    material_resource = db.session.scalar(
-                        select(Resource).where(Resource.name == material_name)
-                    )
+                    material_resource = reference_data.resource_by_name(material_name)
 
                     # Lock inventory row for update
                     inventory_item = db.session.scalar(
@@ -485,21 +479,10 @@ class EmploymentService:
         )
         db.session.add(work_session)
 
-        # Track work streak for achievements
-        from app.services.achievement_service import AchievementService
-        try:
-            current_streak, achievement_unlocked = AchievementService.track_work_streak(user)
-            if achievement_unlocked:
-                logger.info(f"User {user.id} unlocked work-related achievement with {current_streak}-day streak")
-        except Exception as e:
-            logger.error(f"Error tracking work achievement for user {user.id}: {e}")
-
-        # Track mission progress for working
-        from app.services.mission_service import MissionService
-        try:
-            MissionService.track_progress(user, 'work', hours)
-        except Exception as e:
-            logger.error(f"Error tracking work mission for user {user.id}: {e}")
+        # Track work streak and mission progress (applied when the request ends)
+        from app.services.progress_events import track_mission, track_streak
+        track_streak(user, 'work')
+        track_mission(user, 'work', hours)
 
         # Award XP for working (1 XP per hour)
         # Apply work-specific multiplier first, then global XP multiplier is applied in add_experience
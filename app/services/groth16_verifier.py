@@ -0,0 +1,557 @@
+"""
+Groth16 Verifier (BN254, pure Python)
+
+In-process verification of snarkjs Groth16 proofs for the voting circuits,
+so the vote path does not need Node.js or any external tooling.
+
+The verification key is parsed once per process. For the fixed G2 points of
+the key (beta, gamma, delta) the Miller-loop line coefficients are
+precomputed, and e(alpha, beta) is computed once, so a verification costs
+one multi-Miller loop over three pairs plus one final exponentiation.
+
+Representation:
+- Fq2 elements are tuples (a, b) meaning a + b*u with u^2 = -1
+- Fq12 elements are lists of six Fq2 coefficients over w with w^6 = 9 + u
+- G2 points live on the D-type twist y^2 = x^3 + 3/(9 + u)
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# BN254 base field modulus and group order
+FIELD_MODULUS = 21888242871839275222246405745257275088696311157297823662689037894645226208583
+CURVE_ORDER = 21888242871839275222246405745257275088548364400416034343698204186575808495617
+
+P = FIELD_MODULUS
+R = CURVE_ORDER
+
+# Optimal ate loop parameter 6u + 2 for u = 4965661367192848881
+ATE_LOOP_COUNT = 29793968203157093288
+_ATE_BITS = [int(b) for b in bin(ATE_LOOP_COUNT)[3:]]
+
+G1_GENERATOR = (1, 2)
+G2_GENERATOR = (
+    (10857046999023057135944570762232829481370756359578518086990519993285655852781,
+     11559732032986387107991004021392285783925812861821192530917403151452391805634),
+    (8495653923123431417604973247489272438418190587263600148770280649306958101930,
+     4082367875863433681332203403145435568316851327593401208105741076214120093531),
+)
+
+
+class InvalidProofFormat(ValueError):
+    """Raised when a proof, key or public input cannot be parsed."""
+    pass
+
+
+# ============================================================
+# Fq2 arithmetic
+# ============================================================
+
+F2_ZERO = (0, 0)
+F2_ONE = (1, 0)
+
+
+def f2_add(x, y):
+    return ((x[0] + y[0]) % P, (x[1] + y[1]) % P)
+
+
+def f2_sub(x, y):
+    return ((x[0] - y[0]) % P, (x[1] - y[1]) % P)
+
+
+def f2_neg(x):
+    return (-x[0] % P, -x[1] % P)
+
+
+def f2_mul(x, y):
+    a, b = x
+    c, d = y
+    t0 = a * c
+    t1 = b * d
+    return ((t0 - t1) % P, ((a + b) * (c + d) - t0 - t1) % P)
+
+
+def f2_sqr(x):
+    a, b = x
+    return ((a + b) * (a - b) % P, 2 * a * b % P)
+
+
+def f2_scale(x, k):
+    return (x[0] * k % P, x[1] * k % P)
+
+
+def f2_conj(x):
+    return (x[0], -x[1] % P)
+
+
+def f2_inv(x):
+    a, b = x
+    t = pow(a * a + b * b, -1, P)
+    return (a * t % P, -b * t % P)
+
+
+def f2_mul_xi(x):
+    """Multiply by the non-residue xi = 9 + u."""
+    a, b = x
+    return ((9 * a - b) % P, (a + 9 * b) % P)
+
+
+def f2_pow(x, e):
+    result = F2_ONE
+    while e:
+        if e & 1:
+            result = f2_mul(result, x)
+        x = f2_sqr(x)
+        e >>= 1
+    return result
+
+
+# ============================================================
+# Fq12 arithmetic
+# ============================================================
+
+def f12_one():
+    return [F2_ONE, F2_ZERO, F2_ZERO, F2_ZERO, F2_ZERO, F2_ZERO]
+
+
+def f12_mul(x, y):
+    """Schoolbook product with lazy reduction (one mod per coefficient)."""
+    re = [0] * 11
+    im = [0] * 11
+    for i in range(6):
+        a, b = x[i]
+        if not (a or b):
+            continue
+        for j in range(6):
+            c, d = y[j]
+            t0 = a * c
+            t1 = b * d
+            re[i + j] += t0 - t1
+            im[i + j] += (a + b) * (c + d) - t0 - t1
+    for k in range(6, 11):
+        # w^6 = xi
+        r, s = re[k], im[k]
+        re[k - 6] += 9 * r - s
+        im[k - 6] += r + 9 * s
+    return [(re[k] % P, im[k] % P) for k in range(6)]
+
+
+def f12_mul_line(f, y_p, l1, l3):
+    """Multiply f by the sparse line value y_p + l1*w + l3*w^3."""
+    re = [0] * 9
+    im = [0] * 9
+    c1, d1 = l1
+    c3, d3 = l3
+    for i in range(6):
+        a, b = f[i]
+        re[i] += a * y_p
+        im[i] += b * y_p
+        t0 = a * c1
+        t1 = b * d1
+        re[i + 1] += t0 - t1
+        im[i + 1] += (a + b) * (c1 + d1) - t0 - t1
+        t0 = a * c3
+        t1 = b * d3
+        re[i + 3] += t0 - t1
+        im[i + 3] += (a + b) * (c3 + d3) - t0 - t1
+    for k in range(6, 9):
+        r, s = re[k], im[k]
+        re[k - 6] += 9 * r - s
+        im[k - 6] += r + 9 * s
+    return [(re[k] % P, im[k] % P) for k in range(6)]
+
+
+def f12_conj(x):
+    """Frobenius^6: w -> -w."""
+    return [x[0], f2_neg(x[1]), x[2], f2_neg(x[3]), x[4], f2_neg(x[5])]
+
+
+def f12_inv(x):
+    """Inverse via the norm to Fq6 = Fq2[v]/(v^3 - xi), v = w^2."""
+    n = f12_mul(x, f12_conj(x))
+    n0, n2, n4 = n[0], n[2], n[4]
+    c0 = f2_sub(f2_sqr(n0), f2_mul_xi(f2_mul(n2, n4)))
+    c1 = f2_sub(f2_mul_xi(f2_sqr(n4)), f2_mul(n0, n2))
+    c2 = f2_sub(f2_sqr(n2), f2_mul(n0, n4))
+    t = f2_add(f2_mul(n0, c0), f2_mul_xi(f2_add(f2_mul(n4, c1), f2_mul(n2, c2))))
+    t_inv = f2_inv(t)
+    n_inv = [f2_mul(c0, t_inv), F2_ZERO, f2_mul(c1, t_inv), F2_ZERO, f2_mul(c2, t_inv), F2_ZERO]
+    return f12_mul(f12_conj(x), n_inv)
+
+
+# Frobenius coefficients: w^(i*p^k) = xi^(i*(p^k - 1)/6) * w^i
+_FROB1 = [f2_pow((9, 1), i * (P - 1) // 6) for i in range(6)]
+_FROB2 = [f2_pow((9, 1), i * (P * P - 1) // 6) for i in range(6)]
+
+
+def f12_frobenius(x):
+    return [f2_mul(f2_conj(x[i]), _FROB1[i]) for i in range(6)]
+
+
+def f12_frobenius2(x):
+    return [f2_mul(x[i], _FROB2[i]) for i in range(6)]
+
+
+def f12_pow(x, e):
+    result = f12_one()
+    for bit in bin(e)[2:]:
+        result = f12_mul(result, result)
+        if bit == '1':
+            result = f12_mul(result, x)
+    return result
+
+
+_HARD_EXPONENT = (P ** 4 - P ** 2 + 1) // R
+
+
+def final_exponentiation(f):
+    """Raise a Miller-loop output to (p^12 - 1) / r."""
+    # Easy part: f^((p^6 - 1)(p^2 + 1))
+    f = f12_mul(f12_conj(f), f12_inv(f))
+    f = f12_mul(f12_frobenius2(f), f)
+    # Hard part: f^((p^4 - p^2 + 1) / r)
+    return f12_pow(f, _HARD_EXPONENT)
+
+
+# ============================================================
+# Curve arithmetic (affine; only used outside the hot pairing loop)
+# ============================================================
+
+_B2 = f2_mul((3, 0), f2_inv((9, 1)))
+
+
+def g1_is_on_curve(pt) -> bool:
+    x, y = pt
+    return (y * y - x * x * x - 3) % P == 0
+
+
+def g1_add(p1, p2):
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    x1, y1 = p1
+    x2, y2 = p2
+    if x1 == x2:
+        if (y1 + y2) % P == 0:
+            return None
+        lam = 3 * x1 * x1 * pow(2 * y1, -1, P) % P
+    else:
+        lam = (y2 - y1) * pow(x2 - x1, -1, P) % P
+    x3 = (lam * lam - x1 - x2) % P
+    return (x3, (lam * (x1 - x3) - y1) % P)
+
+
+def g1_neg(pt):
+    return None if pt is None else (pt[0], -pt[1] % P)
+
+
+def g1_mul(pt, k: int):
+    result = None
+    addend = pt
+    while k:
+        if k & 1:
+            result = g1_add(result, addend)
+        addend = g1_add(addend, addend)
+        k >>= 1
+    return result
+
+
+def g2_is_on_curve(pt) -> bool:
+    x, y = pt
+    return f2_sub(f2_sqr(y), f2_add(f2_mul(f2_sqr(x), x), _B2)) == F2_ZERO
+
+
+def g2_add(p1, p2):
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    x1, y1 = p1
+    x2, y2 = p2
+    if x1 == x2:
+        if f2_add(y1, y2) == F2_ZERO:
+            return None
+        lam = f2_mul(f2_scale(f2_sqr(x1), 3), f2_inv(f2_scale(y1, 2)))
+    else:
+        lam = f2_mul(f2_sub(y2, y1), f2_inv(f2_sub(x2, x1)))
+    x3 = f2_sub(f2_sub(f2_sqr(lam), x1), x2)
+    return (x3, f2_sub(f2_mul(lam, f2_sub(x1, x3)), y1))
+
+
+def g2_mul(pt, k: int):
+    result = None
+    addend = pt
+    while k:
+        if k & 1:
+            result = g2_add(result, addend)
+        addend = g2_add(addend, addend)
+        k >>= 1
+    return result
+
+
+def g2_is_in_subgroup(pt) -> bool:
+    return g2_is_on_curve(pt) and g2_mul(pt, R) is None
+
+
+def _g2_frobenius(pt):
+    x, y = pt
+    return (f2_mul(f2_conj(x), _FROB1[2]), f2_mul(f2_conj(y), _FROB1[3]))
+
+
+# ============================================================
+# Pairing
+# ============================================================
+
+def _line(t, lam):
+    """Line coefficients (lambda, lambda*x_T - y_T) through T with slope lambda."""
+    return (lam, f2_sub(f2_mul(lam, t[0]), t[1]))
+
+
+def g2_line_coefficients(q) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Precompute the Miller-loop lines for a fixed G2 point.
+
+    The coefficients depend only on Q; evaluating a line at a G1 point P
+    is then y_P - lambda*x_P*w + c*w^3.
+    """
+    coeffs = []
+    t = q
+
+    def add_step(t, other):
+        lam = f2_mul(f2_sub(other[1], t[1]), f2_inv(f2_sub(other[0], t[0])))
+        coeffs.append(_line(t, lam))
+        x3 = f2_sub(f2_sub(f2_sqr(lam), t[0]), other[0])
+        return (x3, f2_sub(f2_mul(lam, f2_sub(t[0], x3)), t[1]))
+
+    for bit in _ATE_BITS:
+        lam = f2_mul(f2_scale(f2_sqr(t[0]), 3), f2_inv(f2_scale(t[1], 2)))
+        coeffs.append(_line(t, lam))
+        x3 = f2_sub(f2_sqr(lam), f2_scale(t[0], 2))
+        t = (x3, f2_sub(f2_mul(lam, f2_sub(t[0], x3)), t[1]))
+        if bit:
+            t = add_step(t, q)
+
+    q1 = _g2_frobenius(q)
+    q2 = _g2_frobenius(q1)
+    t = add_step(t, q1)
+    add_step(t, (q2[0], f2_neg(q2[1])))
+    return coeffs
+
+
+def miller_loop(pairs: Sequence[Tuple[Tuple[int, int], list]]):
+    """
+    Shared Miller loop over (G1 point, precomputed G2 lines) pairs.
+
+    Returns the product of the individual Miller-loop values.
+    """
+    f = f12_one()
+    evaluated = [(p[1], p[0], coeffs) for p, coeffs in pairs]
+    idx = 0
+
+    for bit in _ATE_BITS:
+        f = f12_mul(f, f)
+        for y_p, x_p, coeffs in evaluated:
+            lam, c = coeffs[idx]
+            f = f12_mul_line(f, y_p, f2_scale(lam, -x_p), c)
+        idx += 1
+        if bit:
+            for y_p, x_p, coeffs in evaluated:
+                lam, c = coeffs[idx]
+                f = f12_mul_line(f, y_p, f2_scale(lam, -x_p), c)
+            idx += 1
+
+    for _ in range(2):
+        for y_p, x_p, coeffs in evaluated:
+            lam, c = coeffs[idx]
+            f = f12_mul_line(f, y_p, f2_scale(lam, -x_p), c)
+        idx += 1
+    return f
+
+
+def pairing(p, q):
+    """Optimal ate pairing e(P, Q) for P in G1, Q in G2."""
+    return final_exponentiation(miller_loop([(p, g2_line_coefficients(q))]))
+
+
+# ============================================================
+# snarkjs JSON parsing
+# ============================================================
+
+def _parse_int(value, modulus: int) -> int:
+    try:
+        if isinstance(value, int):
+            n = value
+        elif isinstance(value, str) and value.lower().startswith('0x'):
+            n = int(value, 16)
+        else:
+            n = int(value)
+    except (TypeError, ValueError):
+        raise InvalidProofFormat(f"Not an integer: {value!r}")
+    if not 0 <= n < modulus:
+        raise InvalidProofFormat(f"Value out of field range: {value!r}")
+    return n
+
+
+def parse_g1(value) -> Optional[Tuple[int, int]]:
+    """Parse a snarkjs G1 point [x, y, z] (z = 0 means infinity)."""
+    try:
+        x, y = _parse_int(value[0], P), _parse_int(value[1], P)
+        z = _parse_int(value[2], P) if len(value) > 2 else 1
+    except (IndexError, TypeError):
+        raise InvalidProofFormat(f"Malformed G1 point: {value!r}")
+    if z == 0:
+        return None
+    if z != 1:
+        raise InvalidProofFormat("G1 point must be affine")
+    if not g1_is_on_curve((x, y)):
+        raise InvalidProofFormat("G1 point not on curve")
+    return (x, y)
+
+
+def parse_g2(value):
+    """Parse a snarkjs G2 point [[x0, x1], [y0, y1], [z0, z1]]."""
+    try:
+        x = (_parse_int(value[0][0], P), _parse_int(value[0][1], P))
+        y = (_parse_int(value[1][0], P), _parse_int(value[1][1], P))
+        z = (_parse_int(value[2][0], P), _parse_int(value[2][1], P)) if len(value) > 2 else F2_ONE
+    except (IndexError, TypeError):
+        raise InvalidProofFormat(f"Malformed G2 point: {value!r}")
+    if z == F2_ZERO:
+        return None
+    if z != F2_ONE:
+        raise InvalidProofFormat("G2 point must be affine")
+    if not g2_is_on_curve((x, y)):
+        raise InvalidProofFormat("G2 point not on curve")
+    return (x, y)
+
+
+def parse_f12(value):
+    """Parse a snarkjs Fq12 value ([[c0, c1, c2], [c0, c1, c2]] over Fq2)."""
+    (a0, a1, a2), (b0, b1, b2) = [
+        [(_parse_int(c[0], P), _parse_int(c[1], P)) for c in half] for half in value
+    ]
+    # Tower (Fq6 + Fq6*w, v = w^2) to flat w-basis
+    return [a0, b0, a1, b1, a2, b2]
+
+
+# ============================================================
+# Verifier
+# ============================================================
+
+class Groth16Verifier:
+    """
+    Groth16 verifier with a prepared (precomputed) verification key.
+
+    Build once per process and reuse; verify() is thread-safe.
+    """
+
+    def __init__(self, verification_key: Dict[str, Any]):
+        if verification_key.get('protocol', 'groth16') != 'groth16':
+            raise InvalidProofFormat(f"Unsupported protocol: {verification_key.get('protocol')}")
+        if verification_key.get('curve', 'bn128') not in ('bn128', 'bn254'):
+            raise InvalidProofFormat(f"Unsupported curve: {verification_key.get('curve')}")
+
+        self.n_public = int(verification_key['nPublic'])
+        self.alpha = parse_g1(verification_key['vk_alpha_1'])
+        beta = parse_g2(verification_key['vk_beta_2'])
+        gamma = parse_g2(verification_key['vk_gamma_2'])
+        delta = parse_g2(verification_key['vk_delta_2'])
+        self.ic = [parse_g1(point) for point in verification_key['IC']]
+
+        if len(self.ic) != self.n_public + 1:
+            raise InvalidProofFormat(f"Expected {self.n_public + 1} IC points, got {len(self.ic)}")
+        if None in (self.alpha, beta, gamma, delta):
+            raise InvalidProofFormat("Verification key contains a point at infinity")
+
+        self.gamma_lines = g2_line_coefficients(gamma)
+        self.delta_lines = g2_line_coefficients(delta)
+        # e(alpha, beta)^-1: the pairing check becomes
+        # e(-A, B) * e(vk_x, gamma) * e(C, delta) == e(alpha, beta)^-1
+        self.alphabeta = final_exponentiation(miller_loop([(self.alpha, g2_line_coefficients(beta))]))
+        self._alphabeta_inv = f12_conj(self.alphabeta)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Groth16Verifier':
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def verify(self, proof: Dict[str, Any], public_signals: Sequence[Any]) -> bool:
+        """
+        Verify a snarkjs Groth16 proof.
+
+        Args:
+            proof: {'pi_a': [...], 'pi_b': [...], 'pi_c': [...]}
+            public_signals: Public inputs (decimal or 0x-hex strings / ints)
+
+        Returns:
+            True if the proof is valid, False otherwise (including malformed input)
+        """
+        try:
+            a = parse_g1(proof['pi_a'])
+            b = parse_g2(proof['pi_b'])
+            c = parse_g1(proof['pi_c'])
+            inputs = [_parse_int(s, R) for s in public_signals]
+        except (InvalidProofFormat, KeyError, TypeError):
+            return False
+
+        if len(inputs) != self.n_public or a is None or b is None or c is None:
+            return False
+        if not g2_is_in_subgroup(b):
+            return False
+
+        vk_x = self.ic[0]
+        for s, point in zip(inputs, self.ic[1:]):
+            if s:
+                vk_x = g1_add(vk_x, g1_mul(point, s))
+
+        pairs = [(g1_neg(a), g2_line_coefficients(b)), (c, self.delta_lines)]
+        if vk_x is not None:
+            pairs.append((vk_x, self.gamma_lines))
+
+        return final_exponentiation(miller_loop(pairs)) == self._alphabeta_inv
+
+
+# ============================================================
+# Voting circuit helpers
+# ============================================================
+
+VOTE_VERIFICATION_KEY_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'static', 'circuits', 'anonymous_vote_verification_key.json'
+)
+
+_vote_verifier = None
+
+
+def get_vote_verifier() -> Groth16Verifier:
+    """Prepared verifier for anonymous_vote, built once per process."""
+    global _vote_verifier
+    if _vote_verifier is None:
+        _vote_verifier = Groth16Verifier.from_file(VOTE_VERIFICATION_KEY_PATH)
+    return _vote_verifier
+
+
+def verify_vote_proof_local(
+    proof: Dict[str, Any],
+    merkle_root: str,
+    election_id: int,
+    candidate_id: int,
+    num_candidates: int,
+    nullifier: str
+) -> bool:
+    """
+    Verify an anonymous vote proof in-process.
+
+    Public signal order must match the circuit:
+    [merkleRoot, electionId, candidateId, numCandidates, nullifier]
+    """
+    public_signals = [
+        merkle_root if str(merkle_root).startswith('0x') else f'0x{merkle_root}',
+        election_id,
+        candidate_id,
+        num_candidates,
+        nullifier if str(nullifier).startswith('0x') else f'0x{nullifier}',
+    ]
+    return get_vote_verifier().verify(proof, public_signals)
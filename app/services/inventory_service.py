@@ -5,7 +5,7 @@ This service encapsulates inventory management logic that was previously in the
 """
 
 import logging
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_
 from app.extensions import db
 from app.models.resource import InventoryItem, Resource
 from app.constants import GameConstants
@@ -178,3 +178,118 @@ class InventoryService:
             logger.debug(f"User {user.id} inventory item {resource_id} Q{quality} removed (quantity reached 0)")
 
         return True
+
+    @staticmethod
+    def get_storage_headroom(user_ids, resource_id, quality=0):
+        """
+        How much of one resource each user can still receive, in one query.
+
+        Bulk counterpart of the checks add_item() makes per user: storage
+        limit (including Storage Increase NFT bonuses), inventory slots and
+        MAX_RESOURCE_QUANTITY for the item.
+
+        Returns:
+            dict: user_id -> (headroom: int, has_item: bool)
+        """
+        from app.models.nft import NFTInventory, PlayerNFTSlots
+        from app.models.user import User
+
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        used = (
+            select(
+                InventoryItem.user_id,
+                func.sum(InventoryItem.quantity).label('used'),
+                func.count().label('slots')
+            )
+            .where(InventoryItem.user_id.in_(user_ids))
+            .group_by(InventoryItem.user_id)
+            .subquery()
+        )
+        held = (
+            select(InventoryItem.user_id, InventoryItem.quantity.label('held'))
+            .where(
+                InventoryItem.user_id.in_(user_ids),
+                InventoryItem.resource_id == resource_id,
+                InventoryItem.quality == quality
+            )
+            .subquery()
+        )
+        bonus = (
+            select(PlayerNFTSlots.user_id, func.sum(NFTInventory.bonus_value).label('bonus'))
+            .join(NFTInventory, or_(
+                NFTInventory.id == PlayerNFTSlots.slot_1_nft_id,
+                NFTInventory.id == PlayerNFTSlots.slot_2_nft_id,
+                NFTInventory.id == PlayerNFTSlots.slot_3_nft_id
+            ))
+            .where(
+                PlayerNFTSlots.user_id.in_(user_ids),
+                NFTInventory.category == 'storage_increase'
+            )
+            .group_by(PlayerNFTSlots.user_id)
+            .subquery()
+        )
+        rows = db.session.execute(
+            select(
+                User.id,
+                func.coalesce(used.c.used, 0),
+                func.coalesce(used.c.slots, 0),
+                held.c.held,
+                func.coalesce(bonus.c.bonus, 0)
+            )
+            .outerjoin(used, used.c.user_id == User.id)
+            .outerjoin(held, held.c.user_id == User.id)
+            .outerjoin(bonus, bonus.c.user_id == User.id)
+            .where(User.id.in_(user_ids))
+        ).all()
+
+        headroom = {}
+        for user_id, used_qty, slots, held_qty, bonus_qty in rows:
+            space = InventoryService.BASE_STORAGE_LIMIT + int(bonus_qty) - int(used_qty)
+            if held_qty is None:
+                if slots >= GameConstants.MAX_INVENTORY_SLOTS:
+                    space = 0
+            else:
+                space = min(space, GameConstants.MAX_RESOURCE_QUANTITY - held_qty)
+            headroom[user_id] = (max(0, space), held_qty is not None)
+        return headroom
+
+    @staticmethod
+    def add_items_bulk(resource_id, quality, quantities):
+        """
+        Add one resource to many users' inventories with a single upsert.
+
+        Does no limit checks - callers size quantities with get_storage_headroom().
+
+        Args:
+            resource_id: ID of the resource to add
+            quality: Quality level
+            quantities: dict of user_id -> quantity (> 0)
+        """
+        rows = [
+            {'user_id': user_id, 'resource_id': resource_id, 'quality': quality, 'quantity': quantity}
+            for user_id, quantity in quantities.items() if quantity > 0
+        ]
+        if not rows:
+            return 0
+
+        table = InventoryItem.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert as upsert
+            stmt = upsert(table)
+            stmt = stmt.on_duplicate_key_update(quantity=table.c.quantity + stmt.inserted.quantity)
+        else:
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert as upsert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as upsert
+            stmt = upsert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.resource_id, table.c.quality],
+                set_={'quantity': table.c.quantity + stmt.excluded.quantity}
+            )
+        db.session.execute(stmt, rows)
+        return len(rows)
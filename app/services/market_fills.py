@@ -0,0 +1,210 @@
+"""
+Market Fills
+
+Every trade on a price-level market (the ZEN market, a country's gold
+market, a CountryMarketItem) is a read-modify-write of one row: price the
+quantity from price_level / progress_within_level, then store the new level
+and progress. Concurrent traders on a hot market used to race on an
+unlocked read.
+
+fill_trade() fills a trade in the trader's own transaction:
+
+1. Locks the market row (SELECT ... FOR UPDATE), so trades on one market
+   are priced one at a time, in the order they get the lock, across all
+   worker processes.
+2. Prices the trade against the locked row. A trade that would have been
+   refused (price moved since the preview, cost above the trader's balance)
+   is rejected without moving the market.
+3. Writes the new level and progress with one UPDATE.
+
+The row stays locked until the trader's request commits or rolls back, and
+the market change commits or rolls back with the balances and inventory the
+trade settles: a trade that never settles (storage full, an error, a failed
+commit) never moved the price. Callers must therefore commit before any
+slow external work (e.g. a treasury transfer) and compensate in a new
+transaction if it fails. Traders lock the balance they pay from before
+filling (CurrencyService.lock_amount / lock_gold) and pass it as the trade
+budget, so a filled trade can always be paid for.
+
+fill_trades() prices several trades in order under one lock, each seeing
+the level and progress left by the ones before it, for a caller that
+settles them all in one transaction.
+"""
+
+import logging
+from decimal import Decimal, ROUND_DOWN
+
+from sqlalchemy import select
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+PRICE_CHANGED = 'price_changed'
+INSUFFICIENT_FUNDS = 'insufficient_funds'
+MARKET_NOT_FOUND = 'market_not_found'
+
+
+class MarketFill:
+    """What one trade paid or received, and the market state it left behind."""
+
+    def __init__(self, total, rate, breakdown, final_level, final_progress):
+        self.total = total                  # Decimal paid (buy) or received (sell)
+        self.rate = rate                    # Unit price (ZEN) or average price (level markets)
+        self.breakdown = breakdown          # [[quantity, price], ...] per price level
+        self.final_level = final_level
+        self.final_progress = final_progress
+
+    def __repr__(self):
+        return f'<MarketFill total={self.total} level={self.final_level}:{self.final_progress}>'
+
+
+class Trade:
+    """One trader's order, filled (or rejected) against the locked market row."""
+
+    def __init__(self, is_buy, quantity, budget=None, expected_level=None):
+        self.is_buy = is_buy
+        self.quantity = quantity
+        self.budget = budget                    # Most the trader can pay (buys), None = unlimited
+        self.expected_level = expected_level    # Level the trader was quoted at, None = any
+        self.fill = None
+        self.rejected = None                    # PRICE_CHANGED, INSUFFICIENT_FUNDS or MARKET_NOT_FOUND
+
+    def __repr__(self):
+        side = 'buy' if self.is_buy else 'sell'
+        return f'<Trade {side} {self.quantity} rejected={self.rejected}>'
+
+
+# ----------------------------------------------------------------------
+# Markets
+# ----------------------------------------------------------------------
+
+def _locked(stmt):
+    # populate_existing: a market object the request already loaded is
+    # refreshed from the locked row instead of keeping its stale level
+    return stmt.with_for_update().execution_options(populate_existing=True)
+
+
+class ZenBook:
+    """ZenMarket: the whole trade at the current rate, then update_price_level()."""
+
+    def __init__(self, market_id=1):
+        self.market_id = market_id
+        self.key = ('zen', market_id)
+
+    def lock(self, session):
+        from app.models import ZenMarket
+
+        return session.scalar(_locked(select(ZenMarket).where(ZenMarket.id == self.market_id)))
+
+    def price(self, market, trade):
+        rate = market.buy_zen_price if trade.is_buy else market.sell_zen_price
+        total = (Decimal(str(trade.quantity)) * rate).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+        final_level, final_progress = market.price_level_after(
+            int(market.price_level), int(market.progress_within_level),
+            trade.quantity, trade.is_buy, int(market.volume_per_level)
+        )
+        return MarketFill(total, rate, [[trade.quantity, float(rate)]], final_level, final_progress)
+
+
+class GoldBook:
+    """A country's GoldMarket, priced level by level like the currency market preview."""
+
+    def __init__(self, country_id):
+        self.country_id = country_id
+        self.key = ('gold', country_id)
+
+    def lock(self, session):
+        from app.models import GoldMarket
+
+        return session.scalar(_locked(select(GoldMarket).where(GoldMarket.country_id == self.country_id)))
+
+    def price(self, market, trade):
+        from app.main.currency_market_routes import calculate_gold_buy_breakdown, calculate_gold_sell_breakdown
+
+        if trade.is_buy:
+            data = calculate_gold_buy_breakdown(market, trade.quantity)
+            total = Decimal(str(data['total_cost']))
+        else:
+            data = calculate_gold_sell_breakdown(market, trade.quantity)
+            total = Decimal(str(data['total_proceeds']))
+        return MarketFill(total, total / Decimal(str(trade.quantity)), data['breakdown'],
+                          data['final_level'], data['final_progress'])
+
+
+class ResourceBook:
+    """A CountryMarketItem, priced level by level like the resource market preview."""
+
+    def __init__(self, country_id, resource_id, quality=0):
+        self.country_id = country_id
+        self.resource_id = resource_id
+        self.quality = quality
+        self.key = ('resource', country_id, resource_id, quality)
+
+    def lock(self, session):
+        from app.models import CountryMarketItem
+
+        return session.scalar(_locked(
+            select(CountryMarketItem).where(
+                CountryMarketItem.country_id == self.country_id,
+                CountryMarketItem.resource_id == self.resource_id,
+                CountryMarketItem.quality == self.quality
+            )
+        ))
+
+    def price(self, market, trade):
+        from app.main.company_routes import calculate_purchase_breakdown, calculate_sell_breakdown
+
+        if trade.is_buy:
+            data = calculate_purchase_breakdown(market, trade.quantity)
+            total = Decimal(str(data['total_cost']))
+        else:
+            data = calculate_sell_breakdown(market, trade.quantity)
+            total = Decimal(str(data['total_proceeds']))
+        return MarketFill(total, total / Decimal(str(trade.quantity)), data['breakdown'],
+                          data['final_price_level'], data['final_progress'])
+
+
+# ----------------------------------------------------------------------
+# Filling
+# ----------------------------------------------------------------------
+
+def fill_trade(book, trade, session=None):
+    """
+    Fill a trade on the given market in the request's transaction.
+
+    Returns the trade; check trade.rejected, then read trade.fill. The
+    market row stays locked, and its new level uncommitted, until the
+    caller commits (with the trade's settlement) or rolls back.
+    """
+    fill_trades(book, [trade], session)
+    return trade
+
+
+def fill_trades(book, trades, session=None):
+    """Fill trades in order under one lock of the market row and store the result with one UPDATE."""
+    session = session or db.session
+    market = book.lock(session)
+    if market is None:
+        for trade in trades:
+            trade.rejected = MARKET_NOT_FOUND
+        return
+
+    filled = 0
+    for trade in trades:
+        if trade.expected_level is not None and int(market.price_level) != trade.expected_level:
+            trade.rejected = PRICE_CHANGED
+            continue
+        fill = book.price(market, trade)
+        if trade.is_buy and trade.budget is not None and fill.total > trade.budget:
+            trade.fill = fill            # Priced but not applied, for the error message
+            trade.rejected = INSUFFICIENT_FUNDS
+            continue
+        market.price_level = fill.final_level
+        market.progress_within_level = fill.final_progress
+        trade.fill = fill
+        filled += 1
+
+    session.flush()
+    if len(trades) > 1:
+        logger.debug(f"Market {book.key}: filled {filled}/{len(trades)} trades under one lock")
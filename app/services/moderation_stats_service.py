@@ -0,0 +1,359 @@
+"""
+Moderation Stats Service - Maintains the ModerationCounters rows.
+
+The staff statistics page used to run a COUNT query per ticket and report
+status, type and time window, and load every resolved and rated ticket to
+average them. It now reads the 'all' counters row and the last month's day
+rows in one query. Rows are updated with atomic `col = col + delta` UPDATEs
+from the routes that create tickets and reports or change their status or
+rating, in the same transaction as the change, and fully recomputed by a
+nightly scheduler job to fix any drift (e.g. bulk admin edits that bypass
+the hooks).
+
+A missing 'all' row is computed from scratch on first read.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, delete, insert, func
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+# Day rows read and kept: today and the 30 days before ("this month")
+DAY_BUCKETS = 31
+# Of which "this week": today and the 7 days before
+WEEK_DAY_BUCKETS = 8
+
+
+def _today_start():
+    return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _day_bucket(moment):
+    return moment.strftime('%Y-%m-%d')
+
+
+def _resolution_seconds(created_at, resolved_at):
+    return int((resolved_at - created_at).total_seconds())
+
+
+def _add(deltas, column, value):
+    deltas[column] = deltas.get(column, 0) + value
+
+
+class ModerationStatsService:
+    """Service for reading and maintaining support ticket and report counters."""
+
+    # ------------------------------------------------------------------
+    # From-scratch computation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def counter_columns():
+        """Names of the ModerationCounters count columns."""
+        from app.models.moderation_counters import ModerationCounters
+
+        return [c.name for c in ModerationCounters.__table__.columns
+                if c.name not in ('bucket', 'updated_at', 'recomputed_at')]
+
+    @staticmethod
+    def compute():
+        """
+        Compute the 'all' row directly from the source tables.
+
+        Returns:
+            Dict of ModerationCounters column values
+        """
+        from app.models.support import SupportTicket, Report
+        from app.models.moderation_counters import ModerationCounters
+
+        values = dict.fromkeys(ModerationStatsService.counter_columns(), 0)
+
+        for status, count in db.session.execute(
+            select(SupportTicket.status, func.count())
+            .where(SupportTicket.is_deleted == False)
+            .group_by(SupportTicket.status)
+        ).all():
+            values[ModerationCounters.ticket_status_column(status)] = count
+            values['tickets_total'] += count
+
+        resolved = db.session.execute(
+            select(SupportTicket.created_at, SupportTicket.resolved_at).where(
+                SupportTicket.resolved_at != None,
+                SupportTicket.is_deleted == False
+            )
+        ).all()
+        values['tickets_timed'] = len(resolved)
+        values['resolution_seconds'] = sum(_resolution_seconds(c, r) for c, r in resolved)
+
+        ratings_count, ratings_sum = db.session.execute(
+            select(func.count(SupportTicket.rating), func.coalesce(func.sum(SupportTicket.rating), 0)).where(
+                SupportTicket.rating != None,
+                SupportTicket.is_deleted == False
+            )
+        ).one()
+        values['ratings_count'] = ratings_count
+        values['ratings_sum'] = int(ratings_sum)
+
+        for status, count in db.session.execute(
+            select(Report.status, func.count())
+            .where(Report.is_deleted == False)
+            .group_by(Report.status)
+        ).all():
+            values[ModerationCounters.report_status_column(status)] = count
+            values['reports_total'] += count
+
+        for report_type, count in db.session.execute(
+            select(Report.report_type, func.count())
+            .where(Report.is_deleted == False)
+            .group_by(Report.report_type)
+        ).all():
+            values[ModerationCounters.report_type_column(report_type)] = count
+
+        return values
+
+    @staticmethod
+    def compute_days(since):
+        """
+        Tickets and reports submitted per day since `since` (deleted ones included).
+
+        Returns:
+            Dict of 'YYYY-MM-DD' -> {'tickets_total': n, 'reports_total': n}
+        """
+        from app.models.support import SupportTicket, Report
+
+        days = {}
+        for model, column in ((SupportTicket, 'tickets_total'), (Report, 'reports_total')):
+            day = func.date(model.created_at)
+            for value, count in db.session.execute(
+                select(day, func.count()).where(model.created_at >= since).group_by(day)
+            ).all():
+                # MySQL returns a date, SQLite an ISO string
+                counts = days.setdefault(str(value)[:10], {'tickets_total': 0, 'reports_total': 0})
+                counts[column] = count
+        return days
+
+    @staticmethod
+    def recompute():
+        """Rebuild the 'all' row and the day rows from scratch (does not commit)."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        now = datetime.utcnow()
+        values = ModerationStatsService.compute()
+        counters = db.session.get(ModerationCounters, ALL_BUCKET)
+        if counters is None:
+            counters = ModerationCounters(bucket=ALL_BUCKET)
+            db.session.add(counters)
+        for key, value in values.items():
+            setattr(counters, key, value)
+        counters.recomputed_at = now
+
+        since = _today_start() - timedelta(days=DAY_BUCKETS - 1)
+        days = ModerationStatsService.compute_days(since)
+        db.session.execute(delete(ModerationCounters).where(ModerationCounters.bucket != ALL_BUCKET))
+        for bucket, counts in days.items():
+            db.session.add(ModerationCounters(bucket=bucket, recomputed_at=now, **counts))
+
+        db.session.flush()
+        return counters
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def get_counters():
+        """The 'all' row; computes it on first access."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        counters = db.session.get(ModerationCounters, ALL_BUCKET, populate_existing=True)
+        if counters is None:
+            counters = ModerationStatsService.recompute()
+            db.session.commit()
+        return counters
+
+    @staticmethod
+    def get_summary():
+        """
+        Everything the statistics page shows except the top-N lists, from one query.
+
+        Returns:
+            Dict with 'tickets', 'reports' and 'report_by_type' dicts
+        """
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        today_start = _today_start()
+        days = [_day_bucket(today_start - timedelta(days=n)) for n in range(DAY_BUCKETS)]
+        query = (
+            select(ModerationCounters)
+            .where(ModerationCounters.bucket.in_([ALL_BUCKET] + days))
+            .execution_options(populate_existing=True)
+        )
+        rows = {row.bucket: row for row in db.session.scalars(query).all()}
+        if ALL_BUCKET not in rows:
+            ModerationStatsService.recompute()
+            db.session.commit()
+            rows = {row.bucket: row for row in db.session.scalars(query).all()}
+        counters = rows[ALL_BUCKET]
+
+        def submitted(column, day_count):
+            return sum(getattr(rows[day], column) for day in days[:day_count] if day in rows)
+
+        tickets = {
+            'total': counters.tickets_total,
+            'open': counters.tickets_open,
+            'in_progress': counters.tickets_in_progress,
+            'awaiting_response': counters.tickets_awaiting_response,
+            'resolved': counters.tickets_resolved,
+            'closed': counters.tickets_closed,
+            'today': submitted('tickets_total', 1),
+            'this_week': submitted('tickets_total', WEEK_DAY_BUCKETS),
+            'this_month': submitted('tickets_total', DAY_BUCKETS),
+            'avg_resolution_hours': round(counters.resolution_seconds / counters.tickets_timed / 3600, 1)
+                                    if counters.tickets_timed else 0,
+            'avg_rating': round(counters.ratings_sum / counters.ratings_count, 1) if counters.ratings_count else 0,
+            'total_ratings': counters.ratings_count,
+        }
+        reports = {
+            'total': counters.reports_total,
+            'pending': counters.reports_pending,
+            'under_review': counters.reports_under_review,
+            'resolved': counters.reports_resolved,
+            'dismissed': counters.reports_dismissed,
+            'today': submitted('reports_total', 1),
+            'this_week': submitted('reports_total', WEEK_DAY_BUCKETS),
+        }
+        report_by_type = {
+            'message': counters.reports_message,
+            'article': counters.reports_newspaper_article,
+            'comment': counters.reports_article_comment,
+            'user': counters.reports_user_profile,
+            'company': counters.reports_company,
+        }
+        return {'tickets': tickets, 'reports': reports, 'report_by_type': report_by_type}
+
+    @staticmethod
+    def ticket_count(status=None):
+        """Live tickets, optionally in one TicketStatus (for paginating the staff queue)."""
+        from app.models.moderation_counters import ModerationCounters
+
+        counters = ModerationStatsService.get_counters()
+        if status is None:
+            return counters.tickets_total
+        return getattr(counters, ModerationCounters.ticket_status_column(status))
+
+    @staticmethod
+    def report_count(status=None, report_type=None):
+        """Live reports in one ReportStatus or of one ReportType (not both), or all of them."""
+        from app.models.moderation_counters import ModerationCounters
+
+        counters = ModerationStatsService.get_counters()
+        if status is not None:
+            return getattr(counters, ModerationCounters.report_status_column(status))
+        if report_type is not None:
+            return getattr(counters, ModerationCounters.report_type_column(report_type))
+        return counters.reports_total
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _increment(bucket, **deltas):
+        """Atomically add deltas to a row. Returns False if the row doesn't exist yet."""
+        from app.models.moderation_counters import ModerationCounters
+
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not deltas:
+            return True
+
+        values = {k: getattr(ModerationCounters, k) + v for k, v in deltas.items()}
+        result = db.session.execute(
+            update(ModerationCounters)
+            .where(ModerationCounters.bucket == bucket)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    @staticmethod
+    def _count_submission(moment, **deltas):
+        """Add to the day row for `moment`, creating it on the day's first submission."""
+        from app.models.moderation_counters import ModerationCounters
+
+        bucket = _day_bucket(moment)
+        if ModerationStatsService._increment(bucket, **deltas):
+            return
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(ModerationCounters).values(bucket=bucket, **deltas))
+        except IntegrityError:
+            # Another transaction created the day's row first
+            ModerationStatsService._increment(bucket, **deltas)
+
+    @staticmethod
+    def on_ticket_created(ticket):
+        """A player submitted a ticket."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        ModerationStatsService._increment(
+            ALL_BUCKET, tickets_total=1, **{ModerationCounters.ticket_status_column(ticket.status): 1}
+        )
+        ModerationStatsService._count_submission(ticket.created_at or datetime.utcnow(), tickets_total=1)
+
+    @staticmethod
+    def on_ticket_status_change(ticket, old_status, old_resolved_at):
+        """A ticket's status (and possibly resolved_at) changed."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        deltas = {}
+        if old_status != ticket.status:
+            _add(deltas, ModerationCounters.ticket_status_column(old_status), -1)
+            _add(deltas, ModerationCounters.ticket_status_column(ticket.status), 1)
+        if old_resolved_at != ticket.resolved_at:
+            if old_resolved_at is not None:
+                _add(deltas, 'tickets_timed', -1)
+                _add(deltas, 'resolution_seconds', -_resolution_seconds(ticket.created_at, old_resolved_at))
+            if ticket.resolved_at is not None:
+                _add(deltas, 'tickets_timed', 1)
+                _add(deltas, 'resolution_seconds', _resolution_seconds(ticket.created_at, ticket.resolved_at))
+        ModerationStatsService._increment(ALL_BUCKET, **deltas)
+
+    @staticmethod
+    def on_ticket_rated(ticket, old_rating=None):
+        """The submitter rated (or re-rated) a ticket."""
+        from app.models.moderation_counters import ALL_BUCKET
+
+        deltas = {}
+        if old_rating is not None:
+            _add(deltas, 'ratings_count', -1)
+            _add(deltas, 'ratings_sum', -old_rating)
+        if ticket.rating is not None:
+            _add(deltas, 'ratings_count', 1)
+            _add(deltas, 'ratings_sum', ticket.rating)
+        ModerationStatsService._increment(ALL_BUCKET, **deltas)
+
+    @staticmethod
+    def on_report_created(report):
+        """A player submitted a report."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        ModerationStatsService._increment(ALL_BUCKET, reports_total=1, **{
+            ModerationCounters.report_status_column(report.status): 1,
+            ModerationCounters.report_type_column(report.report_type): 1,
+        })
+        ModerationStatsService._count_submission(report.created_at or datetime.utcnow(), reports_total=1)
+
+    @staticmethod
+    def on_report_status_change(report, old_status):
+        """Staff moved a report to another status."""
+        from app.models.moderation_counters import ModerationCounters, ALL_BUCKET
+
+        if old_status == report.status:
+            return
+        ModerationStatsService._increment(ALL_BUCKET, **{
+            ModerationCounters.report_status_column(old_status): -1,
+            ModerationCounters.report_status_column(report.status): 1,
+        })
@@ -0,0 +1,262 @@
+"""
+NFT Image Cache - Content-addressed disk cache and thumbnails for NFT images.
+
+NFT images are addressed by IPFS CID, so the bytes behind a CID never change.
+The first request for a CID fetches it from the gateway and stores it on
+disk; every later request (from any worker on the host) is served from the
+file with sendfile and immutable caching headers, without touching the
+gateway. Thumbnails at fixed sizes for the inventory and marketplace grids
+are generated from the cached original with Pillow and cached the same way.
+
+Layout under NFT_IMAGE_CACHE_DIR:
+    originals/<cid>
+    thumbs/<size>/<cid>.webp
+
+The cache is bounded by NFT_IMAGE_CACHE_MAX_MB. File mtimes record last use
+(touched at most once per TOUCH_INTERVAL), and when the total grows past the
+limit the least recently used files are deleted.
+"""
+
+import io
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Tuple
+
+import requests
+from flask import current_app
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZES = (256, 512)    # Longest side in pixels; grids use 256 (512 for 2x screens)
+THUMBNAIL_QUALITY = 85
+TOUCH_INTERVAL = 3600           # Seconds; don't rewrite mtimes on every hit
+EVICT_TO = 0.9                  # Evict down to 90% of the limit so we don't evict on every write
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+# CIDv0 (base58 'Qm...') or CIDv1 in base32 ('b...') - also keeps paths safe
+CID_PATTERN = re.compile(r'^(Qm[1-9A-HJ-NP-Za-km-z]{44}|b[a-z2-7]{58,})$')
+
+_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+class ImageNotFound(Exception):
+    """The gateway does not have this CID (or it is not a valid CID)."""
+    pass
+
+
+class GatewayError(Exception):
+    """The gateway could not be reached or returned an error."""
+    pass
+
+
+def is_valid_cid(cid):
+    return bool(cid) and CID_PATTERN.match(cid) is not None
+
+
+def sniff_mimetype(path):
+    """
+    Image type from the file's first bytes (the gateway's Content-Type is not
+    stored). Only raster formats are served as images; anything else (SVG
+    with scripts, HTML error pages) is sent as an opaque download type.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(512)
+    for signature, mimetype in _SIGNATURES:
+        if head.startswith(signature):
+            return mimetype
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'application/octet-stream'
+
+
+class NFTImageCache:
+    """Disk cache rooted at a directory; safe to share between processes."""
+
+    def __init__(self, root, max_bytes, gateway, timeout=10):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.gateway = gateway.rstrip('/') + '/'
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._cid_locks = {}
+        self._size_estimate = None  # Bytes on disk; rescanned on eviction
+        self.upstream_fetches = 0   # For tests / diagnostics
+
+    # -- paths -------------------------------------------------------------
+
+    def original_path(self, cid):
+        return os.path.join(self.root, 'originals', cid)
+
+    def thumbnail_path(self, cid, size):
+        return os.path.join(self.root, 'thumbs', str(size), f'{cid}.webp')
+
+    # -- public API --------------------------------------------------------
+
+    def get_original(self, cid) -> Tuple[str, str]:
+        """Local path and mimetype of the image, fetching it on first use."""
+        if not is_valid_cid(cid):
+            raise ImageNotFound(cid)
+        path = self.original_path(cid)
+        if not self._hit(path):
+            with self._cid_lock(cid):
+                if not os.path.exists(path):  # Another thread may have fetched it meanwhile
+                    self._store(path, self._fetch(cid))
+        return path, sniff_mimetype(path)
+
+    def get_thumbnail(self, cid, size) -> str:
+        """Local path of a WebP thumbnail (longest side = size), generating it on first use."""
+        if size not in THUMBNAIL_SIZES:
+            raise ValueError(f"Unsupported thumbnail size {size}")
+        path = self.thumbnail_path(cid, size)
+        if not self._hit(path):
+            original, _ = self.get_original(cid)
+            with self._cid_lock(cid):
+                if not os.path.exists(path):
+                    self._store(path, self._render_thumbnail(original, size))
+        return path
+
+    # -- internals ---------------------------------------------------------
+
+    def _cid_lock(self, cid):
+        with self._lock:
+            lock = self._cid_locks.get(cid)
+            if lock is None:
+                if len(self._cid_locks) > 1000:
+                    self._cid_locks.clear()
+                lock = self._cid_locks[cid] = threading.Lock()
+            return lock
+
+    def _hit(self, path):
+        """True if cached; refreshes the file's LRU timestamp now and then."""
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return False
+        now = time.time()
+        if now - mtime > TOUCH_INTERVAL:
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        return True
+
+    def _fetch(self, cid):
+        self.upstream_fetches += 1
+        try:
+            response = requests.get(self.gateway + cid, timeout=self.timeout, stream=True)
+        except requests.RequestException as e:
+            raise GatewayError(str(e)) from e
+
+        with response:
+            if response.status_code == 404:
+                raise ImageNotFound(cid)
+            if response.status_code != 200:
+                raise GatewayError(f"Gateway returned {response.status_code} for {cid}")
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(64 * 1024):
+                total += len(chunk)
+                if total > MAX_IMAGE_BYTES:
+                    raise GatewayError(f"Image {cid} exceeds {MAX_IMAGE_BYTES} bytes")
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    def _render_thumbnail(self, original_path, size):
+        with Image.open(original_path) as img:
+            img.seek(0)  # First frame of animated images
+            img = img.convert('RGBA') if img.mode in ('P', 'LA', 'RGBA') else img.convert('RGB')
+            img.thumbnail((size, size), Image.LANCZOS)
+            out = io.BytesIO()
+            img.save(out, 'WEBP', quality=THUMBNAIL_QUALITY, method=4)
+        return out.getvalue()
+
+    def _store(self, path, data):
+        """Write atomically (temp file + rename) so readers never see partial files."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            if self._size_estimate is None:
+                self._size_estimate = self._scan_size()
+            else:
+                self._size_estimate += len(data)
+            over = self._size_estimate > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.startswith('.tmp-'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Evicted by another process
+                yield path, st.st_size, st.st_mtime
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used files until the cache is below EVICT_TO of the limit."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO
+        removed = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                removed += 1
+            except FileNotFoundError:
+                total -= size
+        with self._lock:
+            self._size_estimate = total
+        if removed:
+            logger.info(f"NFT image cache evicted {removed} files, {total / 1024 / 1024:.1f} MB left")
+        return removed
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> NFTImageCache:
+    """The process-wide cache for the current app's configuration."""
+    global _cache
+    config = current_app.config
+    settings = (
+        config['NFT_IMAGE_CACHE_DIR'],
+        config['NFT_IMAGE_CACHE_MAX_MB'] * 1024 * 1024,
+        config['NFT_IMAGE_GATEWAY'],
+    )
+    with _cache_lock:
+        if _cache is None or (_cache.root, _cache.max_bytes, _cache.gateway) != (
+                settings[0], settings[1], settings[2].rstrip('/') + '/'):
+            _cache = NFTImageCache(*settings, timeout=config.get('NFT_IMAGE_FETCH_TIMEOUT', 10))
+        return _cache
@@ -9,7 +9,9 @@ from typing import Optional, List, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+from sqlalchemy.orm import contains_eager, joinedload
 from app import db
+from app.pagination import keyset_paginate, KeysetPage, DEFAULT_PAGE_SIZE
 from app.models.nft import (
     NFTInventory, PlayerNFTSlots, CompanyNFTSlots,
     NFTBurnHistory, NFTDropHistory, NFTMarketplace, NFTTradeHistory
@@ -158,7 +160,8 @@ class NFTService:
 
     @staticmethod
     def purchase_nft_blockchain(user_id: int, wallet_address: str, tier: int, nft_type: str,
-                                category: Optional[str] = None, tx_hash: str = None) -> Tuple[Optional[NFTInventory], Optional[str]]:
+                                category: Optional[str] = None, tx_hash: str = None,
+                                receipt=None) -> Tuple[Optional[NFTInventory], Optional[str]]:
         """
         Purchase an NFT with ZEN tokens via blockchain (V2 with on-chain payment verification)
 
@@ -166,9 +169,9 @@ class NFTService:
         1. Frontend approves ZEN spending via MetaMask
         2. Frontend calls mintNFT() on contract with payment
         3. Contract verifies payment and mints NFT atomically
-        4. Frontend sends mint tx_hash to this endpoint
-        5. Backend verifies mint transaction succeeded
-        6. Backend saves NFT to database
+        4. Frontend sends mint tx_hash, which is tracked as a PendingChainTx
+        5. Once it is confirmed, the ChainTxWatcher calls this to verify the
+           mint transaction and save the NFT to the database
 
         Args:
             user_id: ID of the user purchasing
@@ -177,6 +180,7 @@ class NFTService:
             nft_type: 'player' or 'company'
             category: Optional specific category, otherwise random
             tx_hash: Transaction hash of the mintNFT() call
+            receipt: Confirmed receipt passed in by the ChainTxWatcher
 
         Returns:
             (NFTInventory object, error_message) - error_message is None on success
@@ -207,7 +211,8 @@ class NFTService:
         try:
             mint_data = verify_nft_mint_transaction(
                 tx_hash=tx_hash,
-                expected_minter=wallet_address
+                expected_minter=wallet_address,
+                receipt=receipt
             )
 
             if not mint_data:
@@ -314,15 +319,16 @@ class NFTService:
         user_id: int,
         wallet_address: str,
         nft_ids: List[int],
-        tx_hash: str
+        tx_hash: str,
+        receipt=None
     ) -> Tuple[Optional[NFTInventory], Optional[str]]:
         """
         Upgrade 3 NFTs via blockchain transaction verification
 
         Flow:
         1. Frontend calls upgradeNFT() on smart contract (burns 3, mints 1 new NFT)
-        2. Frontend sends upgrade tx_hash to this endpoint
-        3. Backend verifies upgrade transaction succeeded
+        2. Frontend sends upgrade tx_hash, which is tracked as a PendingChainTx
+        3. Once it is confirmed, the ChainTxWatcher calls this to verify it
         4. Backend updates database (removes burned NFTs, adds new NFT)
 
         IDEMPOTENT: If tx_hash was already processed, returns the existing NFT.
@@ -333,6 +339,7 @@ class NFTService:
             wallet_address: User's wallet address
             nft_ids: List of 3 database NFT IDs to burn
             tx_hash: Transaction hash of the upgradeNFT() call
+            receipt: Confirmed receipt passed in by the ChainTxWatcher
 
         Returns:
             (New NFT object, error_message)
@@ -404,7 +411,8 @@ class NFTService:
         upgrade_data = verify_nft_upgrade_transaction(
             tx_hash=tx_hash,
             expected_upgrader=wallet_address,
-            expected_burn_token_ids=burn_token_ids
+            expected_burn_token_ids=burn_token_ids,
+            receipt=receipt
         )
 
         if not upgrade_data:
@@ -1083,7 +1091,8 @@ class NFTService:
         wallet_address: str,
         nft_id: int,
         price_zen: float,
-        tx_hash: str
+        tx_hash: str,
+        receipt=None
     ) -> Tuple[Optional[NFTMarketplace], Optional[str]]:
         """
         List an NFT on the marketplace (verifies blockchain transaction)
@@ -1094,6 +1103,7 @@ class NFTService:
             nft_id: Database NFT ID to list
             price_zen: Price in ZEN tokens
             tx_hash: Transaction hash of the listNFT() call
+            receipt: Confirmed receipt passed in by the ChainTxWatcher
 
         Returns:
             (NFTMarketplace object, error_message)
@@ -1124,7 +1134,8 @@ class NFTService:
             tx_hash=tx_hash,
             expected_seller=wallet_address,
             expected_token_id=nft.token_id,
-            expected_price=Decimal(str(price_zen))
+            expected_price=Decimal(str(price_zen)),
+            receipt=receipt
         )
 
         if not verified:
@@ -1149,7 +1160,8 @@ class NFTService:
         buyer_id: int,
         buyer_wallet: str,
         listing_id: int,
-        tx_hash: str
+        tx_hash: str,
+        receipt=None
     ) -> Tuple[bool, Optional[str]]:
         """
         Purchase an NFT from the marketplace (verifies blockchain transaction)
@@ -1159,6 +1171,7 @@ class NFTService:
             buyer_wallet: Buyer's wallet address
             listing_id: Database listing ID
             tx_hash: Transaction hash of the buyNFT() call
+            receipt: Confirmed receipt passed in by the ChainTxWatcher
 
         Returns:
             (success, error_message)
@@ -1186,7 +1199,8 @@ class NFTService:
         purchase_data = verify_purchase_transaction(
             tx_hash=tx_hash,
             expected_buyer=buyer_wallet,
-            expected_token_id=nft.token_id
+            expected_token_id=nft.token_id,
+            receipt=receipt
         )
 
         if not purchase_data:
@@ -1221,7 +1235,8 @@ class NFTService:
         user_id: int,
         wallet_address: str,
         listing_id: int,
-        tx_hash: str
+        tx_hash: str,
+        receipt=None
     ) -> Tuple[bool, Optional[str]]:
         """
         Cancel a marketplace listing (verifies blockchain transaction)
@@ -1231,6 +1246,7 @@ class NFTService:
             wallet_address: User's wallet address
             listing_id: Database listing ID
             tx_hash: Transaction hash of the cancelListing() call
+            receipt: Confirmed receipt passed in by the ChainTxWatcher
 
         Returns:
             (success, error_message)
@@ -1258,7 +1274,8 @@ class NFTService:
         verified = verify_cancel_transaction(
             tx_hash=tx_hash,
             expected_seller=wallet_address,
-            expected_token_id=nft.token_id
+            expected_token_id=nft.token_id,
+            receipt=receipt
         )
 
         if not verified:
@@ -1281,10 +1298,12 @@ class NFTService:
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
         sort_by: str = 'listed_at',
-        sort_order: str = 'desc'
-    ) -> List[NFTMarketplace]:
+        sort_order: str = 'desc',
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ) -> KeysetPage:
         """
-        Get marketplace listings with filters
+        Get one page of marketplace listings with filters
 
         Args:
             nft_type: Filter by NFT type ('player' or 'company')
@@ -1295,9 +1314,14 @@ class NFTService:
             max_price: Maximum price in ZEN
             sort_by: Sort field ('listed_at', 'price_zen', 'tier')
             sort_order: Sort order ('asc' or 'desc')
+            cursor: Cursor from the previous page (None for the first page)
+            limit: Page size
 
         Returns:
-            List of NFTMarketplace objects
+            KeysetPage of NFTMarketplace objects and the next cursor
+
+        Raises:
+            InvalidCursor: if the cursor is malformed
         """
         query = NFTMarketplace.query.filter_by(is_active=True)
 
@@ -1323,20 +1347,22 @@ class NFTService:
         if max_price:
             query = query.filter(NFTMarketplace.price_zen <= max_price)
 
-        # Apply sorting
+        # Sort and page by (sort column, listing id)
+        row_key = None
         if sort_by == 'price_zen':
             sort_col = NFTMarketplace.price_zen
         elif sort_by == 'tier':
             sort_col = NFTInventory.tier
+            row_key = lambda listing: (listing.nft.tier, listing.id)
         else:
             sort_col = NFTMarketplace.listed_at
 
-        if sort_order == 'asc':
-            query = query.order_by(sort_col.asc())
-        else:
-            query = query.order_by(sort_col.desc())
-
-        return query.all()
+        return keyset_paginate(
+            query.options(contains_eager(NFTMarketplace.nft), joinedload(NFTMarketplace.seller)),
+            sort_col, NFTMarketplace.id,
+            cursor=cursor, limit=limit,
+            descending=sort_order != 'asc', row_key=row_key
+        )
 
     @staticmethod
     def get_user_marketplace_listings(user_id: int, active_only: bool = True) -> List[NFTMarketplace]:
@@ -0,0 +1,281 @@
+"""
+Node.js Worker Pool
+
+Keeps a fixed number of long-lived Node.js processes running a worker script
+and talks to them over stdin/stdout with length-prefixed JSON frames
+(4-byte big-endian length + UTF-8 JSON body).
+
+Used by the zkVerify service so that snarkjs and the verification key are
+loaded once per worker instead of once per proof.
+
+Features:
+- Back-pressure: at most `size` requests run at once and at most `max_queue`
+  callers wait for a free worker; further callers get PoolBusyError.
+- Per-request timeouts: a worker that does not answer in time is killed and
+  replaced, the caller gets WorkerTimeoutError.
+- Automatic restart: crashed workers are respawned on next checkout.
+- Fork safety: a pool created before fork() is rebuilt in the child.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import struct
+import subprocess
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct('>I')
+_EOF = object()
+
+
+class WorkerPoolError(Exception):
+    """Base exception for worker pool failures."""
+    pass
+
+
+class PoolBusyError(WorkerPoolError):
+    """Raised when the request queue is full."""
+    pass
+
+
+class WorkerTimeoutError(WorkerPoolError):
+    """Raised when a worker does not answer within the request timeout."""
+    pass
+
+
+class WorkerCrashedError(WorkerPoolError):
+    """Raised when a worker exits while handling a request."""
+    pass
+
+
+class _NodeWorker:
+    """A single Node.js process plus the threads draining its pipes."""
+
+    def __init__(self, command: Sequence[str], cwd: Optional[str], startup_timeout: float):
+        self.process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+        )
+        self.responses = queue.Queue()
+        self.requests_served = 0
+
+        threading.Thread(target=self._read_frames, daemon=True).start()
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+        try:
+            ready = self._next_response(startup_timeout)
+        except WorkerPoolError:
+            self.kill()
+            raise
+        if not ready.get('ready'):
+            self.kill()
+            raise WorkerCrashedError(f"Worker failed to start: {ready.get('error', ready)}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_frames(self):
+        stdout = self.process.stdout
+        try:
+            while True:
+                header = stdout.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                (length,) = _HEADER.unpack(header)
+                body = stdout.read(length)
+                if len(body) < length:
+                    break
+                self.responses.put(json.loads(body.decode('utf-8')))
+        except Exception as e:
+            logger.warning(f"Node worker {self.process.pid} reader failed: {e}")
+        finally:
+            self.responses.put(_EOF)
+
+    def _drain_stderr(self):
+        for line in self.process.stderr:
+            logger.debug(f"[node worker {self.process.pid}] {line.decode('utf-8', 'replace').rstrip()}")
+
+    def _next_response(self, timeout: float) -> Dict[str, Any]:
+        try:
+            response = self.responses.get(timeout=timeout)
+        except queue.Empty:
+            raise WorkerTimeoutError(f"Worker {self.process.pid} did not respond within {timeout}s")
+        if response is _EOF:
+            raise WorkerCrashedError(f"Worker {self.process.pid} exited (code {self.process.poll()})")
+        return response
+
+    def call(self, request_id: int, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        body = json.dumps(dict(payload, id=request_id)).encode('utf-8')
+        try:
+            self.process.stdin.write(_HEADER.pack(len(body)) + body)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerCrashedError(f"Worker {self.process.pid} pipe closed: {e}")
+
+        # Skip stale answers (e.g. a late reply to an earlier timed-out request)
+        while True:
+            response = self._next_response(timeout)
+            if response.get('id') == request_id:
+                self.requests_served += 1
+                return response
+
+    def close(self, timeout: float = 5):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=timeout)
+        except Exception:
+            self.kill()
+
+    def kill(self):
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+
+
+class NodeWorkerPool:
+    """
+    Pool of long-lived Node.js workers speaking length-prefixed JSON.
+
+    Workers are spawned lazily on first use and replaced whenever they crash
+    or time out.
+    """
+
+    def __init__(
+        self,
+        script_path: str,
+        args: Sequence[str] = (),
+        size: int = 2,
+        max_queue: int = 32,
+        queue_timeout: float = 30,
+        startup_timeout: float = 30,
+        cwd: Optional[str] = None,
+        node_binary: str = 'node',
+    ):
+        self.command = [node_binary, script_path, *args]
+        self.size = size
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.startup_timeout = startup_timeout
+        self.cwd = cwd
+
+        self.restarts = 0
+        self._closed = False
+        self._reset_state()
+        atexit.register(self.close)
+
+    def _reset_state(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._slots = threading.BoundedSemaphore(self.size + self.max_queue)
+        self._idle = queue.LifoQueue()
+        for _ in range(self.size):
+            # None = slot without a running worker yet
+            self._idle.put(None)
+
+    def _ensure_process_local(self):
+        """Drop inherited workers after fork() - pipes belong to the parent."""
+        if self._pid != os.getpid():
+            self._reset_state()
+
+    def _spawn(self) -> _NodeWorker:
+        try:
+            worker = _NodeWorker(self.command, self.cwd, self.startup_timeout)
+        except OSError as e:
+            # e.g. node not installed; callers only handle WorkerPoolError
+            raise WorkerPoolError(f"Could not start node worker {' '.join(self.command[:2])}: {e}") from e
+        logger.info(f"Started node worker {worker.process.pid}: {' '.join(self.command[:2])}")
+        return worker
+
+    def request(self, payload: Dict[str, Any], timeout: float = 30) -> Dict[str, Any]:
+        """
+        Send one request to a free worker and wait for its response.
+
+        Args:
+            payload: JSON-serializable request (must include 'op')
+            timeout: Seconds to wait for the worker's answer
+
+        Returns:
+            Response dict from the worker
+
+        Raises:
+            PoolBusyError: Too many callers already waiting
+            WorkerTimeoutError: Worker did not answer in time (worker is replaced)
+            WorkerCrashedError: Worker died while handling the request
+            WorkerPoolError: Worker could not be started
+        """
+        if self._closed:
+            raise WorkerPoolError("Worker pool is closed")
+        self._ensure_process_local()
+
+        if not self._slots.acquire(blocking=False):
+            raise PoolBusyError(f"Worker pool queue full ({self.max_queue} waiting)")
+        try:
+            try:
+                worker = self._idle.get(timeout=self.queue_timeout)
+            except queue.Empty:
+                raise PoolBusyError(f"No worker available within {self.queue_timeout}s")
+
+            try:
+                if worker is None or not worker.alive:
+                    if worker is not None:
+                        self.restarts += 1
+                        logger.warning(f"Node worker {worker.process.pid} died, restarting")
+                        worker = None
+                    worker = self._spawn()
+
+                with self._lock:
+                    request_id = next(self._ids)
+                response = worker.call(request_id, payload, timeout)
+            except WorkerPoolError:
+                # Timed-out or crashed worker can't be trusted - replace it
+                if worker is not None:
+                    worker.kill()
+                    self.restarts += 1
+                worker = None
+                raise
+            finally:
+                self._idle.put(worker)
+        finally:
+            self._slots.release()
+
+        if response.get('error') and set(response) <= {'id', 'error'}:
+            raise WorkerPoolError(response['error'])
+        return response
+
+    def warm_up(self):
+        """Start all workers now instead of on first request."""
+        self._ensure_process_local()
+        workers = [self._idle.get() for _ in range(self.size)]
+        try:
+            for i, worker in enumerate(workers):
+                if worker is None or not worker.alive:
+                    workers[i] = self._spawn()
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def close(self):
+        """Stop all workers. Safe to call more than once."""
+        self._closed = True
+        if self._pid != os.getpid():
+            return
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.close()
@@ -0,0 +1,671 @@
+"""
+Politics Read Model Service - Maintains PartyRoster, ElectionSummary,
+ElectionTally and GovernmentComposition rows.
+
+The party page used to load every member to count and average them and ran
+two COUNT queries per past election; the election page loaded every ZK vote
+to rebuild the ballot-index -> candidate map and tally on each view; the
+government pages walked ministers and congress members with a lazy load per
+row. Those pages now read precomputed rows, so each costs a fixed number of
+queries however large the party, election or congress is.
+
+Rows are updated from the code paths that change the underlying data, in
+the same transaction as the change:
+
+- Party join / leave and XP gains: atomic `col = col + delta` roster UPDATEs.
+- Votes (regular and ZK): atomic summary and tally increments.
+- Candidacy changes: the election's summary and tally are rebuilt (the ZK
+  ballot order depends on the candidate set).
+- Appointments, resignations, election results, impeachment and conquest:
+  the country's composition is rebuilt.
+
+A nightly scheduler job recomputes everything to fix any drift. A missing
+row is computed from scratch on first read.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, delete, insert, func
+from app.extensions import db
+from app.utils import get_level_from_xp
+
+logger = logging.getLogger(__name__)
+
+PARTY_ELECTION = 'party'
+
+# Finished elections are still recomputed nightly for this long after voting ends
+RECENT_ELECTION_DAYS = 2
+
+
+def government_election_type(election):
+    """ElectionSummary / ZKVote election_type of a GovernmentElection."""
+    from app.models.government import ElectionType
+
+    return 'presidential' if election.election_type == ElectionType.PRESIDENTIAL else 'congressional'
+
+
+class PoliticsReadModelService:
+    """Service for reading and maintaining the politics read model."""
+
+    # ------------------------------------------------------------------
+    # Party rosters
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute_roster(party_id):
+        """
+        Compute one party's roster directly from the source tables.
+
+        Returns:
+            Dict of PartyRoster column values
+        """
+        from app.models import User, PartyMembership
+        from app.models.government import CongressMember
+
+        experiences = db.session.scalars(
+            select(User.experience)
+            .join(PartyMembership, PartyMembership.user_id == User.id)
+            .where(PartyMembership.party_id == party_id)
+        ).all()
+
+        congress_seats = db.session.scalar(
+            select(func.count(CongressMember.id)).where(
+                CongressMember.party_id == party_id,
+                CongressMember.is_current == True
+            )
+        ) or 0
+
+        return {
+            'member_count': len(experiences),
+            'total_experience': sum(xp or 0 for xp in experiences),
+            'level_sum': sum(get_level_from_xp(xp or 0) for xp in experiences),
+            'congress_seats': congress_seats,
+        }
+
+    @staticmethod
+    def recompute_roster(party_id):
+        """Rebuild one party's roster from scratch (does not commit)."""
+        from app.models.politics_read_model import PartyRoster
+
+        values = PoliticsReadModelService.compute_roster(party_id)
+        roster = db.session.get(PartyRoster, party_id)
+        if roster is None:
+            roster = PartyRoster(party_id=party_id)
+            db.session.add(roster)
+        for key, value in values.items():
+            setattr(roster, key, value)
+        roster.recomputed_at = datetime.utcnow()
+        db.session.flush()
+        return roster
+
+    @staticmethod
+    def recompute_rosters(party_ids=None):
+        """
+        Rebuild rosters with one pass over party memberships (does not commit).
+
+        Args:
+            party_ids: Parties to rebuild; defaults to every live party
+
+        Returns:
+            Dict of party_id -> PartyRoster
+        """
+        from app.models import User, PoliticalParty, PartyMembership
+        from app.models.government import CongressMember
+        from app.models.politics_read_model import PartyRoster
+
+        if party_ids is None:
+            party_ids = db.session.scalars(
+                select(PoliticalParty.id).where(PoliticalParty.is_deleted == False)
+            ).all()
+        party_ids = list(party_ids)
+        if not party_ids:
+            return {}
+
+        totals = {party_id: [0, 0, 0] for party_id in party_ids}
+        for party_id, experience in db.session.execute(
+            select(PartyMembership.party_id, User.experience)
+            .join(User, User.id == PartyMembership.user_id)
+            .where(PartyMembership.party_id.in_(party_ids))
+        ):
+            experience = experience or 0
+            row = totals[party_id]
+            row[0] += 1
+            row[1] += experience
+            row[2] += get_level_from_xp(experience)
+
+        seats = dict(db.session.execute(
+            select(CongressMember.party_id, func.count(CongressMember.id))
+            .where(CongressMember.party_id.in_(party_ids), CongressMember.is_current == True)
+            .group_by(CongressMember.party_id)
+        ).all())
+
+        existing = {
+            r.party_id: r for r in db.session.scalars(
+                select(PartyRoster).where(PartyRoster.party_id.in_(party_ids))
+            ).all()
+        }
+
+        now = datetime.utcnow()
+        for party_id in party_ids:
+            roster = existing.get(party_id)
+            if roster is None:
+                roster = PartyRoster(party_id=party_id)
+                db.session.add(roster)
+                existing[party_id] = roster
+            roster.member_count, roster.total_experience, roster.level_sum = totals[party_id]
+            roster.congress_seats = seats.get(party_id, 0)
+            roster.recomputed_at = now
+
+        db.session.flush()
+        return existing
+
+    @staticmethod
+    def get_roster(party_id):
+        """Single-row lookup; computes the row on first access."""
+        from app.models.politics_read_model import PartyRoster
+
+        roster = db.session.get(PartyRoster, party_id)
+        if roster is None:
+            roster = PoliticsReadModelService.recompute_roster(party_id)
+            db.session.commit()
+        return roster
+
+    @staticmethod
+    def get_rosters(party_ids):
+        """Rosters for several parties in one query; computes missing rows together."""
+        from app.models.politics_read_model import PartyRoster
+
+        party_ids = list(party_ids)
+        if not party_ids:
+            return {}
+        rosters = {
+            r.party_id: r for r in db.session.scalars(
+                select(PartyRoster).where(PartyRoster.party_id.in_(party_ids))
+            ).all()
+        }
+        missing = [party_id for party_id in party_ids if party_id not in rosters]
+        if missing:
+            rosters.update(PoliticsReadModelService.recompute_rosters(missing))
+            db.session.commit()
+        return rosters
+
+    @staticmethod
+    def _increment_roster(party_id, **deltas):
+        """Atomically add deltas to a party's roster. No-op if the row doesn't exist yet."""
+        from app.models.politics_read_model import PartyRoster
+
+        if party_id is None:
+            return
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not deltas:
+            return
+
+        values = {k: getattr(PartyRoster, k) + v for k, v in deltas.items()}
+        db.session.execute(
+            update(PartyRoster)
+            .where(PartyRoster.party_id == party_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def on_member_joined(party_id, user):
+        """A user joined (or founded) a party."""
+        experience = user.experience or 0
+        PoliticsReadModelService._increment_roster(
+            party_id, member_count=1, total_experience=experience, level_sum=user.level
+        )
+
+    @staticmethod
+    def on_member_left(party_id, user):
+        """A user left a party."""
+        experience = user.experience or 0
+        PoliticsReadModelService._increment_roster(
+            party_id, member_count=-1, total_experience=-experience, level_sum=-user.level
+        )
+
+    @staticmethod
+    def on_experience_gain(user, amount, old_level):
+        """A party member gained experience (and maybe levels)."""
+        if amount:
+            PoliticsReadModelService._increment_roster(
+                user.party_id, total_experience=int(amount), level_sum=user.level - old_level
+            )
+
+    # ------------------------------------------------------------------
+    # Election summaries and tallies
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def ballot_order(election_type, election_id):
+        """
+        Candidate keys in ZK ballot order (ZK vote_choice N is the Nth key).
+
+        Party ballots list candidates by announcement time; government
+        ballots list approved candidates by id.
+        """
+        from app.models import PartyCandidate
+        from app.models.government import ElectionCandidate, CandidateStatus
+
+        if election_type == PARTY_ELECTION:
+            return db.session.scalars(
+                select(PartyCandidate.user_id)
+                .where(PartyCandidate.election_id == election_id)
+                .order_by(PartyCandidate.announced_at)
+            ).all()
+        return db.session.scalars(
+            select(ElectionCandidate.id)
+            .where(ElectionCandidate.election_id == election_id)
+            .where(ElectionCandidate.status == CandidateStatus.APPROVED)
+            .order_by(ElectionCandidate.id)
+        ).all()
+
+    @staticmethod
+    def compute_election(election_type, election_id):
+        """
+        Compute one election's counts and per-candidate votes from the source tables.
+
+        Returns:
+            (dict of ElectionSummary column values, dict of candidate_key -> [votes, zk_votes])
+        """
+        from app.models import PartyVote
+        from app.models.government import ElectionVote
+        from app.models.zk_voting import ZKVote
+
+        keys = PoliticsReadModelService.ballot_order(election_type, election_id)
+        tally = {key: [0, 0] for key in keys}
+
+        if election_type == PARTY_ELECTION:
+            regular = db.session.execute(
+                select(PartyVote.candidate_id, func.count())
+                .where(PartyVote.election_id == election_id)
+                .group_by(PartyVote.candidate_id)
+            ).all()
+        else:
+            regular = db.session.execute(
+                select(ElectionVote.candidate_id, func.count(ElectionVote.id))
+                .where(ElectionVote.election_id == election_id)
+                .group_by(ElectionVote.candidate_id)
+            ).all()
+
+        vote_count = 0
+        for key, count in regular:
+            vote_count += count
+            if key in tally:
+                tally[key][0] = count
+
+        zk_vote_count = zk_proof_count = 0
+        for choice, count, attested in db.session.execute(
+            select(ZKVote.vote_choice, func.count(ZKVote.id), func.count(ZKVote.zkverify_tx_hash))
+            .where(ZKVote.election_type == election_type)
+            .where(ZKVote.election_id == election_id)
+            .where(ZKVote.proof_verified == True)
+            .group_by(ZKVote.vote_choice)
+        ):
+            zk_vote_count += count
+            zk_proof_count += attested
+            # 0 is an abstention
+            if 1 <= choice <= len(keys):
+                tally[keys[choice - 1]][1] += count
+
+        summary = {
+            'candidate_count': len(keys),
+            'vote_count': vote_count,
+            'zk_vote_count': zk_vote_count,
+            'zk_proof_count': zk_proof_count,
+        }
+        return summary, tally
+
+    @staticmethod
+    def recompute_election(election_type, election_id):
+        """Rebuild one election's summary and tally rows from scratch (does not commit)."""
+        from app.models.politics_read_model import ElectionSummary, ElectionTally
+
+        values, tally = PoliticsReadModelService.compute_election(election_type, election_id)
+
+        summary = db.session.get(ElectionSummary, (election_type, election_id))
+        if summary is None:
+            summary = ElectionSummary(election_type=election_type, election_id=election_id)
+            db.session.add(summary)
+        for key, value in values.items():
+            setattr(summary, key, value)
+        summary.recomputed_at = datetime.utcnow()
+
+        db.session.execute(
+            delete(ElectionTally)
+            .where(ElectionTally.election_type == election_type)
+            .where(ElectionTally.election_id == election_id)
+            .execution_options(synchronize_session=False)
+        )
+        if tally:
+            db.session.execute(insert(ElectionTally), [
+                {'election_type': election_type, 'election_id': election_id,
+                 'candidate_key': key, 'votes': votes, 'zk_votes': zk_votes}
+                for key, (votes, zk_votes) in tally.items()
+            ])
+        db.session.flush()
+        return summary
+
+    @staticmethod
+    def recompute_elections(since=None):
+        """
+        Rebuild the summaries of elections that are open or finished after `since`
+        (default: the last RECENT_ELECTION_DAYS days). Does not commit.
+
+        Returns:
+            Number of elections recomputed
+        """
+        from app.models import PartyElection, ElectionStatus
+        from app.models.government import GovernmentElection, GovernmentElectionStatus, ElectionType
+
+        if since is None:
+            since = datetime.utcnow() - timedelta(days=RECENT_ELECTION_DAYS)
+
+        party_ids = db.session.scalars(
+            select(PartyElection.id).where(
+                (PartyElection.status.in_([ElectionStatus.SCHEDULED, ElectionStatus.ACTIVE])) |
+                (PartyElection.end_time >= since)
+            )
+        ).all()
+        government = db.session.execute(
+            select(GovernmentElection.id, GovernmentElection.election_type).where(
+                (GovernmentElection.status.notin_([GovernmentElectionStatus.COMPLETED,
+                                                   GovernmentElectionStatus.CANCELLED])) |
+                (GovernmentElection.voting_end >= since)
+            )
+        ).all()
+
+        for election_id in party_ids:
+            PoliticsReadModelService.recompute_election(PARTY_ELECTION, election_id)
+        for election_id, election_type in government:
+            kind = 'presidential' if election_type == ElectionType.PRESIDENTIAL else 'congressional'
+            PoliticsReadModelService.recompute_election(kind, election_id)
+
+        return len(party_ids) + len(government)
+
+    @staticmethod
+    def get_election_summary(election_type, election_id):
+        """Single-row lookup; computes the summary and tally on first access."""
+        from app.models.politics_read_model import ElectionSummary
+
+        summary = db.session.get(ElectionSummary, (election_type, election_id))
+        if summary is None:
+            summary = PoliticsReadModelService.recompute_election(election_type, election_id)
+            db.session.commit()
+        return summary
+
+    @staticmethod
+    def get_election_summaries(election_type, election_ids):
+        """Summaries for several elections in one query; computes missing rows on first access."""
+        from app.models.politics_read_model import ElectionSummary
+
+        election_ids = list(election_ids)
+        if not election_ids:
+            return {}
+        summaries = {
+            s.election_id: s for s in db.session.scalars(
+                select(ElectionSummary)
+                .where(ElectionSummary.election_type == election_type)
+                .where(ElectionSummary.election_id.in_(election_ids))
+            ).all()
+        }
+        missing = [election_id for election_id in election_ids if election_id not in summaries]
+        for election_id in missing:
+            summaries[election_id] = PoliticsReadModelService.recompute_election(election_type, election_id)
+        if missing:
+            db.session.commit()
+        return summaries
+
+    @staticmethod
+    def get_tally(election_type, election_id):
+        """
+        Map candidate_key -> ElectionTally for an election.
+
+        Call get_election_summary() first: tally rows are created with it.
+        """
+        from app.models.politics_read_model import ElectionTally
+
+        return {
+            t.candidate_key: t for t in db.session.scalars(
+                select(ElectionTally)
+                .where(ElectionTally.election_type == election_type)
+                .where(ElectionTally.election_id == election_id)
+            ).all()
+        }
+
+    @staticmethod
+    def _increment_election(election_type, election_id, candidate_key=None, **deltas):
+        """
+        Atomically add deltas to an election's summary, and tally deltas
+        (tally_votes, tally_zk_votes) to one candidate's tally row.
+
+        Returns:
+            False if the election has no summary yet (nothing to update)
+        """
+        from app.models.politics_read_model import ElectionSummary, ElectionTally
+
+        tally_deltas = {
+            'votes': deltas.pop('tally_votes', 0),
+            'zk_votes': deltas.pop('tally_zk_votes', 0),
+        }
+        values = {k: getattr(ElectionSummary, k) + v for k, v in deltas.items() if v}
+        if values:
+            result = db.session.execute(
+                update(ElectionSummary)
+                .where(ElectionSummary.election_type == election_type)
+                .where(ElectionSummary.election_id == election_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                return False
+
+        values = {k: getattr(ElectionTally, k) + v for k, v in tally_deltas.items() if v}
+        if candidate_key is not None and values:
+            db.session.execute(
+                update(ElectionTally)
+                .where(ElectionTally.election_type == election_type)
+                .where(ElectionTally.election_id == election_id)
+                .where(ElectionTally.candidate_key == candidate_key)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        return True
+
+    @staticmethod
+    def on_candidacy_change(election_type, election_id):
+        """
+        A candidate announced, withdrew, was nominated, approved or rejected.
+
+        Rebuilt rather than incremented: ZK ballot indexes shift with the
+        candidate set. Only elections that already have a summary are rebuilt.
+        """
+        from app.models.politics_read_model import ElectionSummary
+
+        exists = db.session.scalar(
+            select(ElectionSummary.election_id)
+            .where(ElectionSummary.election_type == election_type)
+            .where(ElectionSummary.election_id == election_id)
+        )
+        if exists is not None:
+            PoliticsReadModelService.recompute_election(election_type, election_id)
+
+    @staticmethod
+    def on_vote(election_type, election_id, candidate_key):
+        """A regular (signed or form) vote was cast."""
+        PoliticsReadModelService._increment_election(
+            election_type, election_id, candidate_key, vote_count=1, tally_votes=1
+        )
+
+    @staticmethod
+    def on_zk_vote(election_type, election_id, vote_choice, attested=False):
+        """An anonymous ZK vote was verified and stored."""
+        updated = PoliticsReadModelService._increment_election(
+            election_type, election_id,
+            zk_vote_count=1, zk_proof_count=1 if attested else 0
+        )
+        if not updated or vote_choice <= 0:
+            return
+        keys = PoliticsReadModelService.ballot_order(election_type, election_id)
+        if vote_choice <= len(keys):
+            PoliticsReadModelService._increment_election(
+                election_type, election_id, keys[vote_choice - 1], tally_zk_votes=1
+            )
+
+    # ------------------------------------------------------------------
+    # Government composition
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute_composition(country_id):
+        """
+        Compute one country's government composition from the source tables.
+
+        Returns:
+            Dict of GovernmentComposition column values
+        """
+        from app.models.government import CountryPresident, CongressMember, Minister, MinistryType
+        from app.models.politics_read_model import GovernmentComposition
+
+        values = {
+            'president_id': db.session.scalar(
+                select(CountryPresident.id)
+                .where(CountryPresident.country_id == country_id)
+                .where(CountryPresident.is_current == True)
+                .order_by(CountryPresident.term_start.desc())
+                .limit(1)
+            ),
+        }
+
+        ministers = db.session.execute(
+            select(Minister.ministry_type, Minister.id)
+            .where(Minister.country_id == country_id)
+            .where(Minister.is_active == True)
+            .order_by(Minister.appointed_at)
+        ).all()
+        for ministry_type in MinistryType:
+            values[GovernmentComposition.minister_column(ministry_type)] = None
+        # Latest appointment wins if more than one is somehow active
+        for ministry_type, minister_id in ministers:
+            values[GovernmentComposition.minister_column(ministry_type)] = minister_id
+
+        party_seats = [
+            {'party_id': party_id, 'seats': seats, 'votes': int(votes or 0)}
+            for party_id, seats, votes in db.session.execute(
+                select(CongressMember.party_id, func.count(CongressMember.id), func.sum(CongressMember.votes_received))
+                .where(CongressMember.country_id == country_id)
+                .where(CongressMember.is_current == True)
+                .group_by(CongressMember.party_id)
+            ).all()
+        ]
+        party_seats.sort(key=lambda p: (-p['seats'], -p['votes'], p['party_id']))
+
+        term_start, term_end = db.session.execute(
+            select(func.min(CongressMember.term_start), func.max(CongressMember.term_end))
+            .where(CongressMember.country_id == country_id)
+            .where(CongressMember.is_current == True)
+        ).one()
+
+        values.update({
+            'congress_size': sum(p['seats'] for p in party_seats),
+            'congress_votes': sum(p['votes'] for p in party_seats),
+            'congress_term_start': term_start,
+            'congress_term_end': term_end,
+            'party_seats': party_seats,
+        })
+        return values
+
+    @staticmethod
+    def recompute_composition(country_id):
+        """Rebuild one country's composition from scratch (does not commit)."""
+        from app.models.politics_read_model import GovernmentComposition
+
+        values = PoliticsReadModelService.compute_composition(country_id)
+        composition = db.session.get(GovernmentComposition, country_id)
+        if composition is None:
+            composition = GovernmentComposition(country_id=country_id)
+            db.session.add(composition)
+        for key, value in values.items():
+            setattr(composition, key, value)
+        composition.recomputed_at = datetime.utcnow()
+        db.session.flush()
+        return composition
+
+    @staticmethod
+    def recompute_compositions():
+        """
+        Rebuild every country's composition (does not commit).
+
+        Returns:
+            Number of countries recomputed
+        """
+        from app.models import Country
+
+        country_ids = db.session.scalars(select(Country.id).where(Country.is_deleted == False)).all()
+        for country_id in country_ids:
+            PoliticsReadModelService.recompute_composition(country_id)
+        return len(country_ids)
+
+    @staticmethod
+    def get_composition(country_id):
+        """Single-row lookup; computes the row on first access."""
+        from app.models.politics_read_model import GovernmentComposition
+
+        composition = db.session.get(GovernmentComposition, country_id)
+        if composition is None:
+            composition = PoliticsReadModelService.recompute_composition(country_id)
+            db.session.commit()
+        return composition
+
+    @staticmethod
+    def on_government_change(country_id):
+        """
+        The president, a minister or the congress of a country changed.
+
+        Rebuilds the composition and the congress seats of every party whose
+        seat count changed.
+        """
+        from app.models import PoliticalParty
+        from app.models.politics_read_model import GovernmentComposition, PartyRoster
+
+        old = db.session.get(GovernmentComposition, country_id)
+        if old is None:
+            # Seats before the change are unknown: reset the country's parties
+            db.session.execute(
+                update(PartyRoster)
+                .where(PartyRoster.party_id.in_(
+                    select(PoliticalParty.id).where(PoliticalParty.country_id == country_id)
+                ))
+                .values(congress_seats=0)
+                .execution_options(synchronize_session=False)
+            )
+        old_seats = {p['party_id']: p['seats'] for p in (old.party_seats if old else [])}
+
+        composition = PoliticsReadModelService.recompute_composition(country_id)
+        new_seats = {p['party_id']: p['seats'] for p in composition.party_seats}
+
+        for party_id in set(old_seats) | set(new_seats):
+            if old_seats.get(party_id, 0) != new_seats.get(party_id, 0):
+                db.session.execute(
+                    update(PartyRoster)
+                    .where(PartyRoster.party_id == party_id)
+                    .values(congress_seats=new_seats.get(party_id, 0))
+                    .execution_options(synchronize_session=False)
+                )
+
+    # ------------------------------------------------------------------
+    # Nightly rebuild
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def recompute_all():
+        """
+        Rebuild rosters, compositions and open or recent election summaries (does not commit).
+
+        Returns:
+            (parties, countries, elections) recomputed
+        """
+        parties = len(PoliticsReadModelService.recompute_rosters())
+        countries = PoliticsReadModelService.recompute_compositions()
+        elections = PoliticsReadModelService.recompute_elections()
+        return parties, countries, elections
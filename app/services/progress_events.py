@@ -0,0 +1,311 @@
+"""
+Progress Events - Batched mission and achievement progress.
+
+Player actions (fighting, working, training, studying, trading, travelling)
+used to update mission and achievement progress as they happened: one
+SELECT of matching missions per action, plus a read and write of
+AchievementProgress (and unlock checks) per streak. Now the actions only
+record events in a per-request collector:
+
+    track_mission(user, 'fight', 1)
+    track_streak(user, 'work')
+
+Events are coalesced - (user, action) deltas are summed and a streak counts
+once per day anyway - and applied once when the request ends:
+
+- user_mission (the per-user mission progress counters) gets one
+  executemany UPDATE covering every (user, action) pair, capping progress
+  at the requirement and marking missions completed exactly as
+  UserMission.add_progress() does;
+- achievement_progress rows for all streaks are read in one query and
+  updated with the same rules as AchievementService.update_streak(), and
+  unlocks go through AchievementService.unlock_achievement() so rewards are
+  unchanged.
+
+Outside a request (scheduler jobs, CLI) events are applied immediately.
+In a request, events only count once the transaction of the action that
+recorded them commits: a rollback discards the events recorded since the
+last commit, as does ending the request without committing them, and a 5xx
+response discards them all - the action that produced them was rolled back,
+and so would the progress written alongside it have been before.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime
+
+from flask import g, has_request_context
+from sqlalchemy import bindparam, case, event, or_, select, update
+
+from app.extensions import db
+from app.time_helpers import get_allocation_date
+
+logger = logging.getLogger(__name__)
+
+# Streak name -> (AchievementProgress code the streak is stored under, achievement tiers)
+STREAKS = {
+    'work': ('hard_worker_7', ('hard_worker_7', 'hard_worker_30', 'hard_worker_100')),
+    'training': ('training_hard_7', ('training_hard_7', 'training_hard_30', 'training_hard_100')),
+    'study': ('quick_learner_7', ('quick_learner_7', 'quick_learner_30', 'quick_learner_100')),
+}
+
+
+class ProgressEvents:
+    """Coalesced progress events for one request (or one immediate apply)."""
+
+    def __init__(self):
+        self.missions = Counter()   # (user_id, action_type) -> count
+        self.streaks = {}           # (user_id, streak) -> activity date (first one recorded)
+        self.users = {}             # user_id -> User, for unlock rewards
+
+    def __bool__(self):
+        return bool(self.missions or self.streaks)
+
+    def merge(self, other):
+        """Add another collector's events (recorded after this one's)."""
+        self.missions.update(other.missions)
+        for key, activity_date in other.streaks.items():
+            self.streaks.setdefault(key, activity_date)
+        self.users.update(other.users)
+
+    def apply(self, now=None):
+        """Write all collected progress. Adds to the session; the caller commits."""
+        # Whole seconds, so the completed_at written below can be matched on MySQL DATETIME
+        now = (now or datetime.utcnow()).replace(microsecond=0)
+        db.session.flush()
+        if self.missions:
+            self._apply_missions(now)
+        if self.streaks:
+            self._apply_achievements()
+
+    # -- missions ------------------------------------------------------------
+
+    def _apply_missions(self, now):
+        from app.models.mission import Mission, UserMission
+
+        user_mission = UserMission.__table__
+        mission = Mission.__table__
+        requirement = (
+            select(mission.c.requirement_count)
+            .where(mission.c.id == user_mission.c.mission_id)
+            .scalar_subquery()
+        )
+        new_progress = user_mission.c.current_progress + bindparam('b_delta')
+        reached = new_progress >= requirement
+
+        # MySQL evaluates SET assignments left to right against already updated
+        # columns, so current_progress must be assigned last
+        stmt = (
+            update(user_mission)
+            .where(
+                user_mission.c.user_id == bindparam('b_user_id'),
+                user_mission.c.is_completed == False,
+                user_mission.c.is_claimed == False,
+                or_(user_mission.c.expires_at.is_(None), user_mission.c.expires_at > bindparam('b_now')),
+                user_mission.c.mission_id.in_(
+                    select(mission.c.id).where(mission.c.action_type == bindparam('b_action'))
+                )
+            )
+            .ordered_values(
+                (user_mission.c.completed_at, case((reached, bindparam('b_now')), else_=user_mission.c.completed_at)),
+                (user_mission.c.is_completed, reached),
+                (user_mission.c.current_progress, case((reached, requirement), else_=new_progress)),
+            )
+        )
+        db.session.execute(stmt, [
+            {'b_user_id': user_id, 'b_action': action, 'b_delta': count, 'b_now': now}
+            for (user_id, action), count in self.missions.items()
+        ])
+
+        # Loaded UserMission objects no longer match their rows
+        for obj in list(db.session.identity_map.values()):
+            if isinstance(obj, UserMission):
+                db.session.expire(obj)
+
+        user_ids = {user_id for user_id, _ in self.missions}
+        actions = {action for _, action in self.missions}
+        completed = db.session.execute(
+            select(UserMission.user_id, Mission.code)
+            .join(UserMission.mission)
+            .where(
+                UserMission.user_id.in_(user_ids),
+                UserMission.completed_at == now,
+                Mission.action_type.in_(actions)
+            )
+        ).all()
+        for user_id, code in completed:
+            logger.info(f"User {user_id} completed mission '{code}'")
+
+    # -- achievements --------------------------------------------------------
+
+    def _apply_achievements(self):
+        from app.models.achievement import Achievement, AchievementProgress, UserAchievement
+        from app.services.achievement_service import AchievementService
+
+        wanted = {(user_id, STREAKS[streak][0]) for user_id, streak in self.streaks}
+        user_ids = {user_id for user_id, _ in wanted}
+        codes = {code for _, code in wanted}
+
+        progress = {
+            (p.user_id, p.achievement_code): p
+            for p in db.session.scalars(
+                select(AchievementProgress).where(
+                    AchievementProgress.user_id.in_(user_ids),
+                    AchievementProgress.achievement_code.in_(codes)
+                )
+            )
+            if (p.user_id, p.achievement_code) in wanted
+        }
+        for key in wanted - set(progress):
+            progress[key] = AchievementProgress(
+                user_id=key[0], achievement_code=key[1],
+                current_value=0, current_streak=0, best_streak=0
+            )
+            db.session.add(progress[key])
+
+        # (user_id, achievement_code) -> value to check against the requirement
+        checks = {}
+        for (user_id, streak), activity_date in self.streaks.items():
+            code, tiers = STREAKS[streak]
+            current_streak = _advance_streak(progress[(user_id, code)], activity_date)
+            for tier in tiers:
+                checks[(user_id, tier)] = current_streak
+
+        check_codes = {code for _, code in checks}
+        owned = set(db.session.execute(
+            select(UserAchievement.user_id, Achievement.code)
+            .join(UserAchievement.achievement)
+            .where(UserAchievement.user_id.in_(user_ids), Achievement.code.in_(check_codes))
+        ).all())
+        active = {
+            a.code: a for a in db.session.scalars(
+                select(Achievement).where(Achievement.code.in_(check_codes), Achievement.is_active == True)
+            )
+        }
+
+        for (user_id, code), value in checks.items():
+            if (user_id, code) in owned:
+                continue
+            achievement = active.get(code)
+            if achievement is None:
+                logger.warning(f"Achievement {code} not found or inactive")
+                continue
+            if value >= achievement.requirement_value:
+                if AchievementService.unlock_achievement(self.users[user_id], achievement):
+                    owned.add((user_id, code))
+
+        db.session.flush()
+
+
+def _advance_streak(progress, activity_date):
+    """Same rules as AchievementService.update_streak(). Returns the current streak."""
+    if progress.last_activity_date:
+        days_diff = (activity_date - progress.last_activity_date).days
+        if days_diff == 0:
+            return progress.current_streak
+        elif days_diff == 1:
+            progress.current_streak += 1
+        else:
+            progress.current_streak = 1
+    else:
+        progress.current_streak = 1
+
+    progress.last_activity_date = activity_date
+    progress.current_value = progress.current_streak
+    if progress.current_streak > progress.best_streak:
+        progress.best_streak = progress.current_streak
+    return progress.current_streak
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+def _collector():
+    """This request's uncommitted events, or a fresh collector to apply immediately outside requests."""
+    if has_request_context():
+        events = g.get('_progress_pending')
+        if events is None:
+            events = g._progress_pending = ProgressEvents()
+        return events, False
+    return ProgressEvents(), True
+
+
+def track_mission(user, action_type, count=1):
+    """Record `count` actions of `action_type` towards the user's active missions."""
+    if count <= 0:
+        return
+    events, immediate = _collector()
+    events.missions[(user.id, action_type)] += count
+    events.users[user.id] = user
+    if immediate:
+        events.apply()
+
+
+def track_streak(user, streak, activity_date=None):
+    """Record today's daily activity ('work', 'training' or 'study') for streak achievements."""
+    if streak not in STREAKS:
+        raise ValueError(f"Unknown streak {streak!r}")
+    events, immediate = _collector()
+    events.streaks.setdefault((user.id, streak), activity_date or get_allocation_date())
+    events.users[user.id] = user
+    if immediate:
+        events.apply()
+
+
+# ----------------------------------------------------------------------
+# Flask integration
+# ----------------------------------------------------------------------
+
+def _is_request_session(session):
+    return has_request_context() and session is db.session()
+
+
+def _promote_pending(session):
+    """after_commit: the request's pending events are now part of committed work."""
+    if not _is_request_session(session):
+        return
+    pending = g.pop('_progress_pending', None)
+    if not pending:
+        return
+    committed = g.get('_progress_committed')
+    if committed is None:
+        g._progress_committed = pending
+    else:
+        committed.merge(pending)
+
+
+def _discard_pending(session, previous_transaction):
+    """after_soft_rollback: events recorded since the last commit were rolled back with their action."""
+    if previous_transaction.parent is None and _is_request_session(session):
+        g.pop('_progress_pending', None)
+
+
+def init_progress_events(app):
+    """Apply each request's committed progress events when the request ends."""
+    if not event.contains(db.session, 'after_commit', _promote_pending):
+        event.listen(db.session, 'after_commit', _promote_pending)
+        event.listen(db.session, 'after_soft_rollback', _discard_pending)
+
+    @app.after_request
+    def apply_progress_events(response):
+        # Events never committed belong to an action that did not happen
+        g.pop('_progress_pending', None)
+        events = g.pop('_progress_committed', None)
+        if not events or response.status_code >= 500:
+            return response
+        try:
+            # Drop anything the view left uncommitted rather than commit it below
+            db.session.rollback()
+            events.apply()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error applying progress events: {e}", exc_info=True)
+        return response
+
+    @app.teardown_request
+    def discard_progress_events(exc):
+        # after_request is skipped on unhandled errors; the action was rolled back
+        g.pop('_progress_pending', None)
+        g.pop('_progress_committed', None)
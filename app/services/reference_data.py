@@ -0,0 +1,228 @@
+"""
+Reference Data - Per-process registry of near-static game tables.
+
+Resources, military ranks, game settings and scheduled events change only
+through admin actions, yet hot paths (fighting, working, market pages, every
+template render) used to query them over and over. This registry loads all of
+them in one pass and serves lookups from dicts.
+
+Consistency across Gunicorn workers:
+- Every admin edit calls bump_version() once its change has committed, which
+  drops this process's snapshot and increments the 'reference_data' shared
+  version in the database.
+- Other processes compare the counter at most once per request (or once every
+  CHECK_INTERVAL seconds outside a request) and reload when it has moved.
+
+Lookups return frozen snapshots (ResourceRef, RankRef, ...) rather than ORM
+objects, so they are safe to share between threads and sessions. Code that
+needs to modify a row or use its relationships must still load it from the
+session.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from flask import current_app, g, has_request_context
+from sqlalchemy import select
+from app.extensions import db
+from app.services import shared_versions
+
+logger = logging.getLogger(__name__)
+
+VERSION_NAME = 'reference_data'  # shared_version counter
+CHECK_INTERVAL = 5  # Seconds between version checks outside a request (scheduler, CLI)
+
+
+@dataclass(frozen=True)
+class ResourceRef:
+    id: int
+    name: str
+    slug: str
+    category: object
+    icon_path: Optional[str]
+    can_have_quality: bool
+    market_volume_threshold: int
+    market_price_adjustment: Decimal
+    is_deleted: bool
+
+
+@dataclass(frozen=True)
+class RankRef:
+    id: int
+    name: str
+    xp_required: int
+    damage_bonus: int
+
+
+@dataclass(frozen=True)
+class EventRef:
+    id: int
+    affects_setting: Optional[str]
+    multiplier: float
+    start_time: datetime
+    end_time: datetime
+
+    def is_running_at(self, now):
+        return self.start_time <= now <= self.end_time
+
+
+class _Snapshot:
+    """One consistent load of all reference tables."""
+
+    def __init__(self, resources, ranks, settings, events):
+        self.resources_by_id = {r.id: r for r in resources}
+        # Live resources win over soft-deleted ones that share a slug/name
+        self.resources_by_slug = {}
+        self.resources_by_name = {}
+        for r in sorted(resources, key=lambda r: not r.is_deleted):
+            self.resources_by_slug.setdefault(r.slug, r)
+            self.resources_by_name.setdefault(r.name, r)
+        self.ranks_by_id = {r.id: r for r in ranks}
+        self.settings = settings
+        self.events = events
+
+
+class ReferenceData:
+    """Process-wide registry; use the module-level `reference_data` instance."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._app = None        # App the snapshot was loaded for (tests create several)
+        self._version = None
+        self._checked_at = 0.0
+        self.loads = 0  # Number of full loads (for tests / diagnostics)
+
+    # ------------------------------------------------------------------
+    # Loading and invalidation
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        from app.models import Resource, MilitaryRank, GameSettings, GameEvent
+
+        version = shared_versions.current(VERSION_NAME)
+
+        resources = [
+            ResourceRef(
+                id=r.id, name=r.name, slug=r.slug, category=r.category, icon_path=r.icon_path,
+                can_have_quality=r.can_have_quality,
+                market_volume_threshold=r.market_volume_threshold,
+                market_price_adjustment=r.market_price_adjustment,
+                is_deleted=r.is_deleted,
+            )
+            for r in db.session.scalars(select(Resource)).all()
+        ]
+        ranks = [
+            RankRef(id=rank_id, name=name, xp_required=xp_required, damage_bonus=damage_bonus or 0)
+            for rank_id, name, xp_required, damage_bonus in db.session.execute(
+                select(MilitaryRank.id, MilitaryRank.name, MilitaryRank.xp_required, MilitaryRank.damage_bonus)
+            ).all()
+        ]
+        settings = dict(db.session.execute(select(GameSettings.key, GameSettings.value)).all())
+        # Finished events can never apply again; keep active and upcoming ones and
+        # filter by time on each lookup so scheduled events switch on by themselves
+        events = [
+            EventRef(id=e_id, affects_setting=affects, multiplier=multiplier,
+                     start_time=start_time, end_time=end_time)
+            for e_id, affects, multiplier, start_time, end_time in db.session.execute(
+                select(GameEvent.id, GameEvent.affects_setting, GameEvent.multiplier,
+                       GameEvent.start_time, GameEvent.end_time)
+                .where(GameEvent.is_active == True, GameEvent.end_time >= datetime.utcnow())
+            ).all()
+        ]
+
+        snapshot = _Snapshot(resources, ranks, settings, events)
+        with self._lock:
+            self._snapshot = snapshot
+            self._app = current_app._get_current_object()
+            self._version = version
+            self.loads += 1
+        logger.debug(f"Reference data loaded: {len(resources)} resources, {len(ranks)} ranks, "
+                     f"{len(settings)} settings, {len(events)} events")
+        return snapshot
+
+    def _needs_version_check(self):
+        if has_request_context():
+            if g.get('_reference_data_checked'):
+                return False
+            g._reference_data_checked = True
+            return True
+        now = time.monotonic()
+        if now - self._checked_at < CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        return True
+
+    def snapshot(self):
+        """Current snapshot, loading or reloading it if needed."""
+        snapshot = self._snapshot
+        if snapshot is None or self._app is not current_app._get_current_object():
+            return self._load()
+        if self._needs_version_check() and shared_versions.current(VERSION_NAME) != self._version:
+            return self._load()
+        return snapshot
+
+    def invalidate(self):
+        """Drop this process's snapshot; the next lookup reloads."""
+        with self._lock:
+            self._snapshot = None
+
+    def bump_version(self):
+        """
+        Call after any admin change to resources, ranks, settings or events has
+        committed. Commits the version bump in its own short transaction.
+        """
+        self.invalidate()
+        try:
+            shared_versions.bump(VERSION_NAME)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Could not bump reference data version: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def resource(self, resource_id):
+        return self.snapshot().resources_by_id.get(resource_id)
+
+    def resource_by_slug(self, slug, include_deleted=False):
+        resource = self.snapshot().resources_by_slug.get(slug)
+        if resource and resource.is_deleted and not include_deleted:
+            return None
+        return resource
+
+    def resource_by_name(self, name, include_deleted=False):
+        resource = self.snapshot().resources_by_name.get(name)
+        if resource and resource.is_deleted and not include_deleted:
+            return None
+        return resource
+
+    def resource_count(self, include_deleted=False):
+        return sum(1 for r in self.snapshot().resources_by_id.values()
+                   if include_deleted or not r.is_deleted)
+
+    def rank(self, rank_id):
+        return self.snapshot().ranks_by_id.get(rank_id)
+
+    def setting(self, key):
+        """Raw string value of a GameSettings key, or None."""
+        return self.snapshot().settings.get(key)
+
+    def event_multiplier(self, setting_key, now=None):
+        """Combined multiplier of running events affecting setting_key (stacks multiplicatively)."""
+        now = now or datetime.utcnow()
+        combined = 1.0
+        for event in self.snapshot().events:
+            if event.affects_setting == setting_key and event.is_running_at(now):
+                combined *= event.multiplier
+        return combined
+
+
+# Process-wide instance
+reference_data = ReferenceData()
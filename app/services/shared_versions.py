@@ -0,0 +1,82 @@
+"""
+Shared Versions - Cross-process invalidation counters in the database.
+
+Several services keep a per-process copy of database state (the username
+index, reference data, the world graph) and need to learn when another
+Gunicorn worker or the scheduler has changed it. A counter kept in
+Flask-Caching only reaches other processes with a shared cache backend; with
+the default per-process SimpleCache a bump never left the process that made
+it. The counters live in the shared_version table instead, which every
+process sees:
+
+- bump(name) increments a counter in the caller's transaction, so other
+  processes see the new version exactly when the change commits, and never
+  if it is rolled back. The row stays locked until then, so bump as late as
+  possible (e.g. from a before_commit hook).
+- current(name) reads the counters with one query, at most once per request
+  (all counters at once; later calls in the request use that read).
+"""
+
+import logging
+from datetime import datetime
+
+from flask import g, has_request_context
+from sqlalchemy import select
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+REQUEST_KEY = '_shared_versions'  # g: this request's read of all counters
+
+
+def _read_all():
+    from app.models.shared_version import SharedVersion
+
+    return dict(db.session.execute(select(SharedVersion.name, SharedVersion.version)).all())
+
+
+def current(name):
+    """Current value of a counter (0 if it was never bumped)."""
+    if has_request_context():
+        versions = g.get(REQUEST_KEY)
+        if versions is None:
+            versions = g._shared_versions = _read_all()
+        return versions.get(name, 0)
+    return _read_all().get(name, 0)
+
+
+def bump(name, session=None):
+    """
+    Increment a counter in the session's current transaction (does not commit).
+
+    Returns:
+        The counter's new value, as it will be once the transaction commits
+    """
+    from app.models.shared_version import SharedVersion
+
+    session = session or db.session
+    table = SharedVersion.__table__
+    now = datetime.utcnow()
+    dialect = session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as upsert
+        stmt = upsert(table).values(name=name, version=1, updated_at=now)
+        stmt = stmt.on_duplicate_key_update(version=table.c.version + 1, updated_at=now)
+    else:
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        stmt = upsert(table).values(name=name, version=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={'version': table.c.version + 1, 'updated_at': now}
+        )
+    session.execute(stmt)
+
+    # The row is locked by the upsert, so this is our increment
+    version = session.scalar(select(table.c.version).where(table.c.name == name))
+    if has_request_context():
+        g.pop(REQUEST_KEY, None)
+    return version
@@ -225,21 +225,10 @@ class SkillService:
         xp_gain = int(base_xp * training_multiplier * global_xp_multiplier)
         leveled_up, new_level = user.add_experience(xp_before_global)
 
-        # Track training streak for achievements
-        from app.services.achievement_service import AchievementService
-        try:
-            current_streak, achievement_unlocked = AchievementService.track_training_streak(user)
-            if achievement_unlocked:
-                logger.info(f"User {user.id} unlocked training-related achievement with {current_streak}-day streak")
-        except Exception as e:
-            logger.error(f"Error tracking training achievement for user {user.id}: {e}")
-
-        # Track mission progress for training
-        from app.services.mission_service import MissionService
-        try:
-            MissionService.track_progress(user, 'train', 1)
-        except Exception as e:
-            logger.error(f"Error tracking train mission for user {user.id}: {e}")
+        # Track training streak and mission progress (applied when the request ends)
+        from app.services.progress_events import track_mission, track_streak
+        track_streak(user, 'training')
+        track_mission(user, 'train', 1)
 
         message = f"Trained {skill_type} for {hours} hours. Gained {skill_gain:.2f} skill and {xp_gain} XP. Energy: -{energy_cost}"
 
@@ -311,21 +300,10 @@ class SkillService:
         xp_gain = int(base_xp * work_multiplier * global_xp_multiplier)
         leveled_up, new_level = user.add_experience(xp_before_global)
 
-        # Track study streak for achievements
-        from app.services.achievement_service import AchievementService
-        try:
-            current_streak, achievement_unlocked = AchievementService.track_study_streak(user)
-            if achievement_unlocked:
-                logger.info(f"User {user.id} unlocked study-related achievement with {current_streak}-day streak")
-        except Exception as e:
-            logger.error(f"Error tracking study achievement for user {user.id}: {e}")
-
-        # Track mission progress for studying
-        from app.services.mission_service import MissionService
-        try:
-            MissionService.track_progress(user, 'study', 1)
-        except Exception as e:
-            logger.error(f"Error tracking study mission for user {user.id}: {e}")
+        # Track study streak and mission progress (applied when the request ends)
+        from app.services.progress_events import track_mission, track_streak
+        track_streak(user, 'study')
+        track_mission(user, 'study', 1)
 
         message = f"Studied {skill_type.replace('_', ' ')} for {hours} hours. Gained {skill_gain:.2f} skill and {xp_gain} XP. Energy: -{energy_cost}"
 
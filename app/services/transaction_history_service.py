@@ -0,0 +1,442 @@
+"""
+Transaction History Service - Partitions, daily rollups and archival for
+the financial_transaction audit log.
+
+Every trade, salary, purchase and transfer appends a row, so reports that
+SUM over the raw table slow down as history grows. Instead:
+
+- On MySQL the table is RANGE partitioned by month on TO_DAYS(timestamp):
+  one partition per month named pYYYYMM plus a catch-all pmax. The nightly
+  job keeps PARTITIONS_AHEAD future months split off pmax. On other
+  databases (SQLite in tests) it stays a plain table and the partition
+  helpers do nothing.
+- rollup_day() summarizes a completed day into transaction_daily_user and
+  transaction_daily_type. It is idempotent (the day is deleted and
+  re-inserted); the nightly job rolls up every day since the last one.
+- totals() and gains_by_user() answer admin report windows from the
+  rollups for fully rolled-up days and from raw rows for the rest (the
+  partial first day and anything since the last rollup), so they only
+  touch the most recent partitions.
+- archive_month() exports one past month to a gzipped CSV, records it in
+  transaction_archive and drops the month's partition (batched DELETE
+  where the table is not partitioned). Rollups are kept, so reports over
+  archived months stay correct.
+"""
+
+import csv
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import and_, delete, func, literal, or_, select, text
+
+from app.extensions import db
+from app.models.currency import FinancialTransaction
+from app.models.transaction_rollup import TransactionArchive, TransactionDailyType, TransactionDailyUser
+
+logger = logging.getLogger(__name__)
+
+# Future monthly partitions kept split off pmax
+PARTITIONS_AHEAD = 2
+# Rows per DELETE when a month cannot be dropped as a partition
+DELETE_BATCH_SIZE = 10000
+
+
+def _day_start(day):
+    return datetime.combine(day, time.min)
+
+
+def _month_range(month):
+    """(first day, first day of next month) for the month containing `month`."""
+    start = month.replace(day=1)
+    return start, start + relativedelta(months=1)
+
+
+def _partition_name(month):
+    return f'p{month:%Y%m}'
+
+
+class TransactionHistoryService:
+    """Service for financial_transaction partitions, rollups and archives."""
+
+    # ------------------------------------------------------------------
+    # Partitions (MySQL)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_mysql():
+        return db.session.get_bind().dialect.name == 'mysql'
+
+    @staticmethod
+    def list_partitions():
+        """
+        Partitions of financial_transaction, oldest first.
+
+        Returns:
+            list of dicts with 'name', 'month' (first day, None for pmax) and
+            'rows' (estimate); empty when the table is not partitioned.
+        """
+        if not TransactionHistoryService._is_mysql():
+            return []
+        rows = db.session.execute(text(
+            "SELECT PARTITION_NAME, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'financial_transaction' "
+            "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+        )).all()
+        partitions = []
+        for name, row_count in rows:
+            month = None
+            if name != 'pmax':
+                month = datetime.strptime(name[1:], '%Y%m').date()
+            partitions.append({'name': name, 'month': month, 'rows': row_count})
+        return partitions
+
+    @staticmethod
+    def ensure_partitions(today=None, ahead=PARTITIONS_AHEAD):
+        """
+        Split partitions for the current and next `ahead` months off pmax.
+
+        MySQL DDL commits implicitly, so call this outside other work.
+
+        Returns:
+            list of created partition names
+        """
+        partitions = TransactionHistoryService.list_partitions()
+        if not partitions:
+            return []
+        existing = [p['month'] for p in partitions if p['month']]
+        last = max(existing) if existing else None
+
+        today = today or datetime.utcnow().date()
+        current, _ = _month_range(today)
+        wanted = [current + relativedelta(months=i) for i in range(ahead + 1)]
+        new_months = [m for m in wanted if last is None or m > last]
+        if not new_months:
+            return []
+
+        definitions = ', '.join(
+            f"PARTITION {_partition_name(m)} VALUES LESS THAN (TO_DAYS('{_month_range(m)[1]:%Y-%m-%d}'))"
+            for m in new_months
+        )
+        db.session.execute(text(
+            f"ALTER TABLE financial_transaction REORGANIZE PARTITION pmax INTO "
+            f"({definitions}, PARTITION pmax VALUES LESS THAN MAXVALUE)"
+        ))
+        return [_partition_name(m) for m in new_months]
+
+    # ------------------------------------------------------------------
+    # Rollups
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def rollup_day(day):
+        """
+        (Re)compute the rollup rows for one day. Adds to the session; the caller commits.
+
+        Returns:
+            int: number of per-user rollup rows written
+        """
+        ft = FinancialTransaction.__table__
+        daily_user = TransactionDailyUser.__table__
+        daily_type = TransactionDailyType.__table__
+
+        db.session.execute(delete(daily_user).where(daily_user.c.day == day))
+        db.session.execute(delete(daily_type).where(daily_type.c.day == day))
+
+        per_user = (
+            select(
+                literal(day, db.Date),
+                ft.c.user_id,
+                ft.c.transaction_type,
+                ft.c.currency_type,
+                func.count(),
+                func.sum(ft.c.amount)
+            )
+            .where(ft.c.timestamp >= _day_start(day), ft.c.timestamp < _day_start(day + timedelta(days=1)))
+            .group_by(ft.c.user_id, ft.c.transaction_type, ft.c.currency_type)
+        )
+        result = db.session.execute(daily_user.insert().from_select(
+            ['day', 'user_id', 'transaction_type', 'currency_type', 'tx_count', 'total_amount'], per_user
+        ))
+
+        # Per-type totals come from the per-user rows just written, not another raw scan
+        per_type = (
+            select(
+                daily_user.c.day,
+                daily_user.c.transaction_type,
+                daily_user.c.currency_type,
+                func.sum(daily_user.c.tx_count),
+                func.count(),
+                func.sum(daily_user.c.total_amount)
+            )
+            .where(daily_user.c.day == day)
+            .group_by(daily_user.c.day, daily_user.c.transaction_type, daily_user.c.currency_type)
+        )
+        db.session.execute(daily_type.insert().from_select(
+            ['day', 'transaction_type', 'currency_type', 'tx_count', 'user_count', 'total_amount'], per_type
+        ))
+        return result.rowcount
+
+    @staticmethod
+    def rolled_up_through():
+        """Last day with rollup rows, or None."""
+        return db.session.scalar(select(func.max(TransactionDailyType.day)))
+
+    @staticmethod
+    def rollup_pending(today=None):
+        """
+        Roll up every completed day after the last rolled-up one (all history on first run).
+
+        Returns:
+            int: number of days rolled up
+        """
+        today = today or datetime.utcnow().date()
+        last = TransactionHistoryService.rolled_up_through()
+        if last is not None:
+            day = last + timedelta(days=1)
+        else:
+            first = db.session.scalar(select(func.min(FinancialTransaction.timestamp)))
+            if first is None:
+                return 0
+            day = first.date()
+
+        days = 0
+        while day < today:
+            TransactionHistoryService.rollup_day(day)
+            day += timedelta(days=1)
+            days += 1
+        return days
+
+    # ------------------------------------------------------------------
+    # Report queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _split_window(since, until):
+        """
+        Split [since, until) into rolled-up whole days and raw edges.
+
+        Returns:
+            (list of raw (start, end) datetime ranges, (first_day, last_day) or None)
+        """
+        through = TransactionHistoryService.rolled_up_through()
+        first_full = since.date() if since.time() == time.min else since.date() + timedelta(days=1)
+        last_full = until.date() - timedelta(days=1)
+        if through is not None:
+            last_full = min(last_full, through)
+
+        if through is None or first_full > last_full:
+            return [(since, until)], None
+
+        raw = []
+        if since < _day_start(first_full):
+            raw.append((since, _day_start(first_full)))
+        if _day_start(last_full + timedelta(days=1)) < until:
+            raw.append((_day_start(last_full + timedelta(days=1)), until))
+        return raw, (first_full, last_full)
+
+    @staticmethod
+    def _raw_filter(raw_ranges, transaction_types, currency_type):
+        ft = FinancialTransaction.__table__
+        conditions = [or_(*[and_(ft.c.timestamp >= start, ft.c.timestamp < end) for start, end in raw_ranges])]
+        if transaction_types is not None:
+            conditions.append(ft.c.transaction_type.in_(transaction_types))
+        if currency_type is not None:
+            conditions.append(ft.c.currency_type == currency_type)
+        return conditions
+
+    @staticmethod
+    def _rollup_filter(table, days, transaction_types, currency_type):
+        conditions = [table.c.day >= days[0], table.c.day <= days[1]]
+        if transaction_types is not None:
+            conditions.append(table.c.transaction_type.in_(transaction_types))
+        if currency_type is not None:
+            conditions.append(table.c.currency_type == currency_type)
+        return conditions
+
+    @staticmethod
+    def totals(since, until=None, currency_type=None, transaction_types=None):
+        """
+        Total transaction amount in [since, until).
+
+        Returns:
+            Decimal
+        """
+        until = until or datetime.utcnow()
+        raw, days = TransactionHistoryService._split_window(since, until)
+        total = Decimal('0')
+
+        if days:
+            daily_type = TransactionDailyType.__table__
+            total += db.session.scalar(
+                select(func.sum(daily_type.c.total_amount)).where(
+                    *TransactionHistoryService._rollup_filter(daily_type, days, transaction_types, currency_type)
+                )
+            ) or 0
+        if raw:
+            ft = FinancialTransaction.__table__
+            total += db.session.scalar(
+                select(func.sum(ft.c.amount)).where(
+                    *TransactionHistoryService._raw_filter(raw, transaction_types, currency_type)
+                )
+            ) or 0
+        return Decimal(total)
+
+    @staticmethod
+    def gains_by_user(since, transaction_types, currency_type, until=None):
+        """
+        Per-user total amount of the given transaction types in [since, until).
+
+        Returns:
+            dict: user_id -> Decimal
+        """
+        until = until or datetime.utcnow()
+        raw, days = TransactionHistoryService._split_window(since, until)
+        totals = {}
+
+        queries = []
+        if days:
+            daily_user = TransactionDailyUser.__table__
+            queries.append(
+                select(daily_user.c.user_id, func.sum(daily_user.c.total_amount))
+                .where(*TransactionHistoryService._rollup_filter(daily_user, days, transaction_types, currency_type))
+                .group_by(daily_user.c.user_id)
+            )
+        if raw:
+            ft = FinancialTransaction.__table__
+            queries.append(
+                select(ft.c.user_id, func.sum(ft.c.amount))
+                .where(*TransactionHistoryService._raw_filter(raw, transaction_types, currency_type))
+                .group_by(ft.c.user_id)
+            )
+        for query in queries:
+            for user_id, amount in db.session.execute(query):
+                totals[user_id] = totals.get(user_id, Decimal('0')) + Decimal(amount or 0)
+        return totals
+
+    # ------------------------------------------------------------------
+    # Archival
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def archivable_months(keep_months, today=None):
+        """Months with raw rows that are older than the newest `keep_months` months."""
+        today = today or datetime.utcnow().date()
+        cutoff, _ = _month_range(today - relativedelta(months=keep_months))
+        first = db.session.scalar(
+            select(func.min(FinancialTransaction.timestamp)).where(FinancialTransaction.timestamp < _day_start(cutoff))
+        )
+        months = []
+        if first is not None:
+            month, _ = _month_range(first.date())
+            while month < cutoff:
+                months.append(month)
+                month += relativedelta(months=1)
+        return months
+
+    @staticmethod
+    def archive_month(month, out_dir, today=None):
+        """
+        Export one month of financial_transaction rows to a gzipped CSV and remove them.
+
+        The month's rollups are recomputed first so reports keep covering it.
+        Safe to re-run: an already exported month is only removed.
+
+        Returns:
+            dict with 'month', 'file', 'rows' and 'removed'
+        """
+        today = today or datetime.utcnow().date()
+        start, end = _month_range(month)
+        if end > _month_range(today)[0]:
+            raise ValueError(f'Cannot archive {start:%Y-%m}: only months before the current one can be archived.')
+        key = f'{start:%Y-%m}'
+
+        archive = db.session.get(TransactionArchive, key)
+        if archive is None:
+            # Keep rollups contiguous up to yesterday, then refresh this month's days
+            TransactionHistoryService.rollup_pending(today)
+            day = start
+            while day < end:
+                TransactionHistoryService.rollup_day(day)
+                day += timedelta(days=1)
+
+            os.makedirs(out_dir, exist_ok=True)
+            path = os.path.join(out_dir, f'financial_transaction_{start:%Y%m}.csv.gz')
+            rows = TransactionHistoryService._export(start, end, path)
+            archive = TransactionArchive(
+                month=key, file_path=path, row_count=rows, sha256=TransactionHistoryService._sha256(path)
+            )
+            db.session.add(archive)
+            db.session.commit()
+            logger.info(f"Exported {rows} financial transactions for {key} to {path}")
+
+        removed = TransactionHistoryService._remove_month(start, end)
+        db.session.commit()
+        logger.info(f"Archived financial transactions for {key}: {removed} rows removed")
+        return {'month': key, 'file': archive.file_path, 'rows': archive.row_count, 'removed': removed}
+
+    @staticmethod
+    def _export(start, end, path):
+        ft = FinancialTransaction.__table__
+        columns = [c.name for c in ft.columns]
+        query = (
+            select(ft)
+            .where(ft.c.timestamp >= _day_start(start), ft.c.timestamp < _day_start(end))
+            .order_by(ft.c.id)
+            .execution_options(yield_per=5000)
+        )
+        rows = 0
+        tmp_path = path + '.tmp'
+        with gzip.open(tmp_path, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in db.session.execute(query):
+                writer.writerow([TransactionHistoryService._csv_value(row._mapping[c]) for c in columns])
+                rows += 1
+        os.replace(tmp_path, path)
+        return rows
+
+    @staticmethod
+    def _csv_value(value):
+        if value is None:
+            return ''
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return str(value)
+
+    @staticmethod
+    def _sha256(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _remove_month(start, end):
+        """Drop the month's partition, or DELETE its rows in batches. Returns rows removed."""
+        ft = FinancialTransaction.__table__
+        in_month = and_(ft.c.timestamp >= _day_start(start), ft.c.timestamp < _day_start(end))
+        count = db.session.scalar(select(func.count()).select_from(ft).where(in_month))
+
+        name = _partition_name(start)
+        if any(p['name'] == name for p in TransactionHistoryService.list_partitions()):
+            db.session.execute(text(f'ALTER TABLE financial_transaction DROP PARTITION {name}'))
+            return count
+
+        removed = 0
+        while True:
+            ids = db.session.scalars(select(ft.c.id).where(in_month).limit(DELETE_BATCH_SIZE)).all()
+            if not ids:
+                break
+            db.session.execute(delete(ft).where(ft.c.id.in_(ids)))
+            db.session.commit()
+            removed += len(ids)
+        return removed
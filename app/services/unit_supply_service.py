@@ -0,0 +1,212 @@
+"""
+Unit Supply Service - Bulk distribution of military unit inventory to members.
+
+distribute_item hands one item to one member per request. Supplying a whole
+unit before a battle goes through here instead, as one transaction with a
+fixed number of queries regardless of unit size:
+
+1. lock the unit's inventory row for the item,
+2. load the active members,
+3. check every recipient's storage headroom (one query),
+4. upsert all recipients' inventory rows (one executemany),
+5. bulk insert the transaction log and alerts.
+
+Allocation modes:
+- 'equal':    split a total evenly; the remainder stays in the unit inventory
+- 'rank':     a per-member quantity for each rank, e.g. {'officer': 10, 'soldier': 5}
+- 'explicit': a quantity per member, {user_id: quantity}
+
+Recipients short on storage get what fits; the rest stays with the unit.
+"""
+
+import logging
+from datetime import datetime
+
+from flask import url_for
+from sqlalchemy import insert, select
+
+from app.extensions import db
+from app.models.messaging import Alert, AlertType
+from app.models.military_unit import (
+    MilitaryUnitInventory, MilitaryUnitMember, MilitaryUnitRank, MilitaryUnitTransaction
+)
+from app.services.inventory_service import InventoryService
+
+logger = logging.getLogger(__name__)
+
+SUPPLY_MODES = ('equal', 'rank', 'explicit')
+
+
+class SupplyError(Exception):
+    """The distribution request is invalid or cannot be satisfied."""
+    pass
+
+
+class UnitSupplyService:
+    """Service for distributing unit inventory to many members at once."""
+
+    @staticmethod
+    def allocate(mode, members, total=None, rank_quotas=None, member_quantities=None):
+        """
+        Work out how much each member should get.
+
+        Args:
+            mode: 'equal', 'rank' or 'explicit'
+            members: dict of user_id -> MilitaryUnitRank for active members
+            total: total quantity to split ('equal')
+            rank_quotas: dict of rank value -> quantity per member ('rank')
+            member_quantities: dict of user_id -> quantity ('explicit')
+
+        Returns:
+            dict: user_id -> quantity (only positive quantities)
+        """
+        if mode == 'equal':
+            if not total or total <= 0:
+                raise SupplyError('Total quantity must be positive.')
+            if not members:
+                return {}
+            share = total // len(members)
+            if share <= 0:
+                raise SupplyError(f'Not enough to give each of {len(members)} members at least one.')
+            return {user_id: share for user_id in members}
+
+        if mode == 'rank':
+            if not rank_quotas:
+                raise SupplyError('No rank quotas given.')
+            quotas = {}
+            for rank, quantity in rank_quotas.items():
+                try:
+                    rank, quantity = MilitaryUnitRank(rank), int(quantity)
+                except (ValueError, TypeError):
+                    raise SupplyError(f'Invalid quota for rank {rank!r}.')
+                if quantity < 0:
+                    raise SupplyError('Quotas cannot be negative.')
+                quotas[rank] = quantity
+            return {user_id: quotas[rank] for user_id, rank in members.items() if quotas.get(rank, 0) > 0}
+
+        if mode == 'explicit':
+            if not member_quantities:
+                raise SupplyError('No members given.')
+            allocation = {}
+            for user_id, quantity in member_quantities.items():
+                try:
+                    user_id, quantity = int(user_id), int(quantity)
+                except (ValueError, TypeError):
+                    raise SupplyError('Invalid member quantity.')
+                if user_id not in members:
+                    raise SupplyError(f'User {user_id} is not an active member of this unit.')
+                if quantity < 0:
+                    raise SupplyError('Quantities cannot be negative.')
+                if quantity > 0:
+                    allocation[user_id] = quantity
+            return allocation
+
+        raise SupplyError(f'Unknown distribution mode {mode!r}.')
+
+    @staticmethod
+    def distribute(unit, performed_by, resource_id, quality, mode, **allocation_args):
+        """
+        Distribute one item from the unit inventory to many members.
+
+        Adds to the session and flushes; the caller commits (or rolls back on
+        SupplyError or any other exception).
+
+        Returns:
+            dict with 'recipients', 'distributed', 'requested' and 'shortfall'
+            ({user_id: quantity that did not fit in their storage}).
+        """
+        # 1. Lock the unit's stock of this item for the whole transaction
+        inv_item = db.session.scalar(
+            select(MilitaryUnitInventory)
+            .where(MilitaryUnitInventory.unit_id == unit.id)
+            .where(MilitaryUnitInventory.resource_id == resource_id)
+            .where(MilitaryUnitInventory.quality == quality)
+            .with_for_update()
+        )
+        if not inv_item or inv_item.quantity <= 0:
+            raise SupplyError('Item not in unit inventory.')
+
+        # 2. Active members and their ranks
+        member_rows = db.session.execute(
+            select(MilitaryUnitMember.user_id, MilitaryUnitMember.rank)
+            .where(MilitaryUnitMember.unit_id == unit.id)
+            .where(MilitaryUnitMember.is_active == True)
+        ).all()
+        members = {user_id: rank for user_id, rank in member_rows}
+
+        requested = UnitSupplyService.allocate(mode, members, **allocation_args)
+        requested_total = sum(requested.values())
+        if requested_total <= 0:
+            raise SupplyError('Nothing to distribute.')
+        if requested_total > inv_item.quantity:
+            raise SupplyError(f'Not enough items in inventory ({inv_item.quantity} available, {requested_total} requested).')
+
+        # 3. Storage headroom for every recipient at once
+        headroom = InventoryService.get_storage_headroom(requested.keys(), resource_id, quality)
+        granted = {}
+        shortfall = {}
+        for user_id, quantity in requested.items():
+            fits = min(quantity, headroom.get(user_id, (0, False))[0])
+            if fits > 0:
+                granted[user_id] = fits
+            if fits < quantity:
+                shortfall[user_id] = quantity - fits
+
+        distributed = sum(granted.values())
+        if distributed == 0:
+            raise SupplyError('No recipient has storage space for this item.')
+
+        # 4. Apply all inventory changes
+        inv_item.quantity -= distributed
+        InventoryService.add_items_bulk(resource_id, quality, granted)
+
+        # 5. Transaction log and alerts
+        resource_name = inv_item.resource.name
+        quality_str = f'Q{quality} ' if quality > 0 else ''
+        now = datetime.utcnow()
+        db.session.execute(insert(MilitaryUnitTransaction), [
+            {
+                'unit_id': unit.id,
+                'transaction_type': 'item_given_to_member',
+                'resource_id': resource_id,
+                'resource_quality': quality,
+                'resource_quantity': quantity,
+                'performed_by_id': performed_by.id,
+                'target_user_id': user_id,
+                'description': f'Distributed {quantity}x {quality_str}{resource_name} ({mode} supply)',
+                'created_at': now,
+            }
+            for user_id, quantity in granted.items()
+        ])
+        link_url = url_for('main.storage')
+        db.session.execute(insert(Alert), [
+            {
+                'user_id': user_id,
+                'alert_type': AlertType.ITEMS_RECEIVED.value,
+                'priority': 'normal',
+                'title': 'Items Received from Military Unit',
+                'content': f'You have received {quantity}x {quality_str}{resource_name} from your military unit commander.',
+                'alert_data': {
+                    'unit_id': unit.id,
+                    'unit_name': unit.name,
+                    'resource_name': resource_name,
+                    'quantity': quantity,
+                    'quality': quality,
+                    'commander_name': performed_by.username
+                },
+                'link_url': link_url,
+                'link_text': 'View Storage',
+                'created_at': now,
+            }
+            for user_id, quantity in granted.items()
+        ])
+        db.session.flush()
+
+        logger.info(f"Unit {unit.id} distributed {distributed}x Q{quality} resource {resource_id} "
+                    f"to {len(granted)} members ({mode}), shortfall {sum(shortfall.values())}")
+        return {
+            'recipients': len(granted),
+            'distributed': distributed,
+            'requested': requested_total,
+            'shortfall': shortfall,
+        }
@@ -0,0 +1,237 @@
+"""
+Username Prefix Index - In-memory autocomplete for usernames.
+
+Keeps a per-process sorted array of lower-cased usernames and answers prefix
+queries with a binary search (O(log n + k), no database round-trip for the
+match itself).
+
+Consistency across Gunicorn workers:
+- Setting a username, soft-deleting or restoring a user (stage_change(),
+  called by the profile route and User.soft_delete()/restore()) bumps the
+  'username_index' shared version in the same transaction and updates this
+  worker's index once it commits.
+- Other workers notice the version change on their next lookup and pull only
+  the users updated since their last refresh (delta refresh), at most once
+  every REFRESH_INTERVAL seconds. A user whose username changed is found by
+  ID and moved, so the old name stops matching.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.extensions import db
+from app.services import shared_versions
+
+logger = logging.getLogger(__name__)
+
+VERSION_NAME = 'username_index'  # shared_version counter
+REFRESH_INTERVAL = 10  # Seconds between delta refreshes triggered by other workers
+REFRESH_OVERLAP = timedelta(seconds=5)  # Re-read a little history to cover clock skew / in-flight commits
+PENDING_KEY = 'username_index_changes'  # Session.info: changes to publish on commit
+
+
+class UsernameIndex:
+    """Sorted prefix index over (username_lower, user_id)."""
+
+    def __init__(self):
+        self._keys = []            # Sorted lower-cased usernames
+        self._ids = array('q')     # User IDs, parallel to _keys (compact for large tables)
+        self._lock = threading.Lock()
+        self._built = False
+        self._version = None
+        self._refreshed_at = None   # DB time watermark of last build/refresh
+        self._checked_at = 0.0      # Monotonic time of last version check
+        self._session_hooks_installed = False
+
+    def __len__(self):
+        return len(self._keys)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def load(self, rows):
+        """Replace the index contents with (user_id, username) rows."""
+        pairs = sorted(
+            (username.lower(), user_id) for user_id, username in rows if username
+        )
+        with self._lock:
+            self._keys = [key for key, _ in pairs]
+            self._ids = array('q', (user_id for _, user_id in pairs))
+            self._built = True
+
+    def rebuild(self):
+        """Full rebuild from the database."""
+        from app.models import User
+
+        started = datetime.utcnow()
+        rows = db.session.execute(
+            select(User.id, User.username).where(
+                User.username.isnot(None),
+                User.is_deleted == False
+            )
+        ).all()
+        self.load(rows)
+        self._refreshed_at = started
+        self._version = shared_versions.current(VERSION_NAME)
+        logger.info(f"Username index built with {len(self._keys)} entries")
+
+    def _refresh_delta(self):
+        """Apply users changed since the last refresh."""
+        from app.models import User
+
+        started = datetime.utcnow()
+        rows = db.session.execute(
+            select(User.id, User.username, User.is_deleted).where(
+                User.updated_at >= self._refreshed_at - REFRESH_OVERLAP
+            )
+        ).all()
+        for user_id, username, is_deleted in rows:
+            if is_deleted:
+                self.remove(user_id, username)
+            elif username:
+                self.add(user_id, username)
+        self._refreshed_at = started
+
+    def ensure_current(self):
+        """Build on first use; pick up other workers' changes when the shared version moves."""
+        if not self._built:
+            self.rebuild()
+            self._checked_at = time.monotonic()
+            return
+
+        now = time.monotonic()
+        if now - self._checked_at < REFRESH_INTERVAL:
+            return
+        self._checked_at = now
+
+        version = shared_versions.current(VERSION_NAME)
+        if version != self._version:
+            self._refresh_delta()
+            self._version = version
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def _find_locked(self, user_id, key):
+        pos = bisect.bisect_left(self._keys, key)
+        while pos < len(self._keys) and self._keys[pos] == key:
+            if self._ids[pos] == user_id:
+                return pos
+            pos += 1
+        return None
+
+    def _locate_locked(self, user_id, key=None):
+        """Position of a user's entry: by key when known, else a scan of the ID array."""
+        if key is not None:
+            pos = self._find_locked(user_id, key)
+            if pos is not None:
+                return pos
+        try:
+            return self._ids.index(user_id)
+        except ValueError:
+            return None
+
+    def add(self, user_id, username, old_username=None):
+        """Insert a user, or move them to a new username (old_username speeds up the lookup)."""
+        key = username.lower()
+        with self._lock:
+            if self._find_locked(user_id, key) is not None:
+                return
+            pos = self._locate_locked(user_id, old_username.lower() if old_username else None)
+            if pos is not None:
+                del self._keys[pos]
+                del self._ids[pos]
+            pos = bisect.bisect_left(self._keys, key)
+            self._keys.insert(pos, key)
+            self._ids.insert(pos, user_id)
+
+    def remove(self, user_id, username=None):
+        with self._lock:
+            pos = self._locate_locked(user_id, username.lower() if username else None)
+            if pos is not None:
+                del self._keys[pos]
+                del self._ids[pos]
+
+    def _install_session_hooks(self):
+        if self._session_hooks_installed:
+            return
+
+        def before_commit(session):
+            if session.info.get(PENDING_KEY):
+                shared_versions.bump(VERSION_NAME, session)
+
+        def after_commit(session):
+            changes = session.info.pop(PENDING_KEY, None)
+            if not changes or not self._built:
+                return
+            for user_id, username, deleted in changes:
+                if deleted:
+                    self.remove(user_id, username)
+                elif username:
+                    self.add(user_id, username)
+
+        def after_soft_rollback(session, previous_transaction):
+            if previous_transaction.parent is None:
+                session.info.pop(PENDING_KEY, None)
+
+        event.listen(Session, 'before_commit', before_commit)
+        event.listen(Session, 'after_commit', after_commit)
+        event.listen(Session, 'after_soft_rollback', after_soft_rollback)
+        self._session_hooks_installed = True
+
+    def stage_change(self, user_id, username, deleted=False):
+        """Record a new username, rename, soft-delete or restore; applied and published when the transaction commits."""
+        self._install_session_hooks()
+        db.session().info.setdefault(PENDING_KEY, []).append((user_id, username, deleted))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def prefix_ids(self, prefix, limit=10, exclude_id=None):
+        """
+        User IDs whose username starts with prefix (case-insensitive), in username order.
+        """
+        key = prefix.lower()
+        results = []
+        with self._lock:
+            pos = bisect.bisect_left(self._keys, key)
+            keys, ids = self._keys, self._ids
+            while pos < len(keys) and len(results) < limit and keys[pos].startswith(key):
+                if ids[pos] != exclude_id:
+                    results.append(ids[pos])
+                pos += 1
+        return results
+
+
+# Process-wide instance
+username_index = UsernameIndex()
+
+
+def search_usernames(prefix, limit=10, exclude_id=None):
+    """
+    Autocomplete lookup: prefix match via the in-memory index, then one
+    primary-key query for the (at most `limit`) matching users.
+
+    Returns:
+        List of User objects in username order
+    """
+    from app.models import User
+
+    username_index.ensure_current()
+    user_ids = username_index.prefix_ids(prefix, limit=limit, exclude_id=exclude_id)
+    if not user_ids:
+        return []
+
+    users = db.session.scalars(
+        select(User).where(User.id.in_(user_ids), User.is_deleted == False)
+    ).all()
+    order = {user_id: i for i, user_id in enumerate(user_ids)}
+    return sorted(users, key=lambda u: order[u.id])
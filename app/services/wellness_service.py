@@ -8,6 +8,7 @@ import logging
 from datetime import datetime, timedelta
 from sqlalchemy import select
 from app.extensions import db
+from app.services.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,6 @@ class WellnessService:
         Returns:
             tuple: (success: bool, message: str, bread_eaten: int, wellness_restored: float)
         """
-        from app.models.resource import Resource
         from app.services.inventory_service import InventoryService
 
         # Quality-based restoration (quality * 2)
@@ -38,9 +38,7 @@ class WellnessService:
         DAILY_BREAD_ITEM_LIMIT = 10  # Max 10 breads per day (any quality)
 
         # Get bread resource
-        bread_resource = db.session.scalar(
-            db.select(Resource).where(Resource.slug == 'bread')
-        )
+        bread_resource = reference_data.resource_by_slug('bread')
 
         if not bread_resource:
             logger.error("Bread resource not found in database")
@@ -132,7 +130,6 @@ class WellnessService:
         Returns:
             tuple: (success: bool, message: str, beer_drunk: int, energy_restored: float)
         """
-        from app.models.resource import Resource
         from app.services.inventory_service import InventoryService
 
         # Quality-based restoration (quality * 2)
@@ -141,9 +138,7 @@ class WellnessService:
         DAILY_BEER_ITEM_LIMIT = 10  # Max 10 beers per day (any quality)
 
         # Get beer resource
-        beer_resource = db.session.scalar(
-            db.select(Resource).where(Resource.slug == 'beer')
-        )
+        beer_resource = reference_data.resource_by_slug('beer')
 
         if not beer_resource:
             logger.error("Beer resource not found in database")
@@ -235,7 +230,6 @@ class WellnessService:
         Returns:
             tuple: (success: bool, message: str, wine_drunk: int, wellness_restored: float, energy_restored: float)
         """
-        from app.models.resource import Resource
         from app.services.inventory_service import InventoryService
 
         # Quality-based restoration (quality * 1 for each stat)
@@ -246,9 +240,7 @@ class WellnessService:
         DAILY_WINE_ITEM_LIMIT = 10  # Max 10 wines per day (any quality)
 
         # Get wine resource
-        wine_resource = db.session.scalar(
-            db.select(Resource).where(Resource.slug == 'wine')
-        )
+        wine_resource = reference_data.resource_by_slug('wine')
 
         if not wine_resource:
             logger.error("Wine resource not found in database")
@@ -0,0 +1,295 @@
+"""
+World Graph - In-memory region adjacency and ownership.
+
+War, battle and travel logic all need the same topology: which regions
+border which, and who owns them. Deriving it from the database costs one
+query per neighbour relationship; this service builds an adjacency list with
+current owners once per process (two queries) and answers attackable-region,
+border, connected-territory and shortest-path questions in memory.
+
+Consistency:
+- Region transfers (battle capture, admin transfer/creation) call
+  on_region_transfer(), which updates this process's graph in place and
+  bumps the 'world_graph' shared version in the same transaction, so other
+  processes see the new version exactly when the transfer commits. If the
+  transaction is rolled back instead, the local graph is dropped and rebuilt.
+- Other processes compare the counter at most once per request (or every
+  CHECK_INTERVAL seconds outside a request) and rebuild when it has moved.
+  Decisions that must not act on a stale owner (conquest, starting a battle)
+  read country_regions directly.
+- Neighbour links change only through seeding/admin tools; call
+  world_graph.bump_version() after editing region_neighbors directly.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from flask import current_app, g, has_request_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.extensions import db
+from app.services import shared_versions
+
+logger = logging.getLogger(__name__)
+
+VERSION_NAME = 'world_graph'  # shared_version counter
+PENDING_KEY = 'world_graph_bump'  # Session.info: True until bumped, then the new version
+CHECK_INTERVAL = 5  # Seconds between version checks outside a request (scheduler)
+
+
+class WorldGraph:
+    """Adjacency list + ownership map over non-deleted regions."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._app = None
+        self._version = None
+        self._checked_at = 0.0
+        self._session_hooks_installed = False
+
+        self.neighbors = {}                 # region_id -> set(region_id)
+        self.owners = {}                    # region_id -> country_id (None if unowned)
+        self.territory = defaultdict(set)   # country_id -> set(region_id)
+        self.names = {}                     # region_id -> name
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def load(self, regions, edges, ownership):
+        """
+        Replace the graph contents.
+
+        Args:
+            regions: iterable of (region_id, name)
+            edges: iterable of (region_id, neighbor_id); stored symmetrically
+            ownership: iterable of (region_id, country_id)
+        """
+        names = dict(regions)
+        neighbors = {region_id: set() for region_id in names}
+        for a, b in edges:
+            if a in neighbors and b in neighbors and a != b:
+                neighbors[a].add(b)
+                neighbors[b].add(a)
+
+        owners = dict.fromkeys(names)
+        territory = defaultdict(set)
+        for region_id, country_id in ownership:
+            if region_id in owners:
+                owners[region_id] = country_id
+                territory[country_id].add(region_id)
+
+        with self._lock:
+            self.names = names
+            self.neighbors = neighbors
+            self.owners = owners
+            self.territory = territory
+            self._built = True
+
+    def rebuild(self):
+        """Full rebuild from the database."""
+        from app.models import Region, region_neighbors, country_regions
+
+        version = shared_versions.current(VERSION_NAME)
+        regions = db.session.execute(
+            select(Region.id, Region.name).where(Region.is_deleted == False)
+        ).all()
+        edges = db.session.execute(
+            select(region_neighbors.c.region_id, region_neighbors.c.neighbor_id)
+        ).all()
+        ownership = db.session.execute(
+            select(country_regions.c.region_id, country_regions.c.country_id)
+        ).all()
+        self.load(regions, edges, ownership)
+
+        with self._lock:
+            self._app = current_app._get_current_object()
+            self._version = version
+        logger.debug(f"World graph built: {len(self.names)} regions, "
+                     f"{sum(len(n) for n in self.neighbors.values()) // 2} borders")
+
+    def _needs_version_check(self):
+        if has_request_context():
+            if g.get('_world_graph_checked'):
+                return False
+            g._world_graph_checked = True
+            return True
+        now = time.monotonic()
+        if now - self._checked_at < CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        return True
+
+    def ensure_current(self):
+        """Build on first use; rebuild when another process has changed the world."""
+        if not self._built or self._app is not current_app._get_current_object():
+            self.rebuild()
+        elif self._needs_version_check() and shared_versions.current(VERSION_NAME) != self._version:
+            self.rebuild()
+        return self
+
+    def invalidate(self):
+        with self._lock:
+            self._built = False
+
+    def bump_version(self):
+        """
+        Drop this process's graph and tell other processes to rebuild theirs.
+        Call after the change has committed; commits the bump on its own.
+        """
+        self.invalidate()
+        try:
+            shared_versions.bump(VERSION_NAME)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Could not bump world graph version: {e}")
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def _install_session_hooks(self):
+        if self._session_hooks_installed:
+            return
+
+        def before_commit(session):
+            # Also fires on savepoint release; bump once per staged transfer
+            if session.info.get(PENDING_KEY) is True:
+                session.info[PENDING_KEY] = shared_versions.bump(VERSION_NAME, session)
+
+        def after_commit(session):
+            version = session.info.pop(PENDING_KEY, None)
+            if version is None or version is True:
+                return
+            # The in-place update already matches the committed state; adopt the
+            # new version unless another process bumped in between (then rebuild)
+            with self._lock:
+                if self._version is not None and self._version == version - 1:
+                    self._version = version
+
+        def after_soft_rollback(session, previous_transaction):
+            if PENDING_KEY not in session.info:
+                return
+            # A savepoint rollback may or may not have undone the transfer (or
+            # the bump): rebuild locally, and bump again if the outer
+            # transaction commits
+            self.invalidate()
+            if previous_transaction.parent is None:
+                session.info.pop(PENDING_KEY, None)
+            else:
+                session.info[PENDING_KEY] = True
+
+        event.listen(Session, 'before_commit', before_commit)
+        event.listen(Session, 'after_commit', after_commit)
+        event.listen(Session, 'after_soft_rollback', after_soft_rollback)
+        self._session_hooks_installed = True
+
+    def on_region_transfer(self, region_id, old_owner_id, new_owner_id, name=None):
+        """A region changed hands (or was created with old_owner_id=None)."""
+        self._install_session_hooks()
+        if self._built:
+            with self._lock:
+                if region_id not in self.names:
+                    self.names[region_id] = name or str(region_id)
+                    self.neighbors.setdefault(region_id, set())
+                if old_owner_id is not None:
+                    self.territory[old_owner_id].discard(region_id)
+                current = self.owners.get(region_id)
+                if current is not None and current != new_owner_id:
+                    self.territory[current].discard(region_id)
+                self.owners[region_id] = new_owner_id
+                if new_owner_id is not None:
+                    self.territory[new_owner_id].add(region_id)
+        db.session().info[PENDING_KEY] = True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def owner(self, region_id):
+        return self.owners.get(region_id)
+
+    def regions_of(self, country_id):
+        return self.territory.get(country_id, set())
+
+    def neighbors_of(self, region_id):
+        return self.neighbors.get(region_id, set())
+
+    def is_adjacent_to_country(self, region_id, country_id):
+        owners = self.owners
+        return any(owners.get(n) == country_id for n in self.neighbors.get(region_id, ()))
+
+    def attackable_regions(self, attacker_id, defender_id):
+        """Defender regions bordering any attacker region."""
+        owners = self.owners
+        return [
+            region_id for region_id in self.territory.get(defender_id, ())
+            if any(owners.get(n) == attacker_id for n in self.neighbors.get(region_id, ()))
+        ]
+
+    def border_regions(self, country_id):
+        """The country's regions that touch a region owned by someone else (or nobody)."""
+        owners = self.owners
+        return [
+            region_id for region_id in self.territory.get(country_id, ())
+            if any(owners.get(n) != country_id for n in self.neighbors.get(region_id, ()))
+        ]
+
+    def connected_territory(self, region_id):
+        """Regions reachable from region_id without leaving its owner's territory."""
+        country_id = self.owners.get(region_id)
+        if country_id is None:
+            return {region_id} if region_id in self.names else set()
+        owners, neighbors = self.owners, self.neighbors
+        seen = {region_id}
+        queue = deque([region_id])
+        while queue:
+            current = queue.popleft()
+            for n in neighbors.get(current, ()):
+                if n not in seen and owners.get(n) == country_id:
+                    seen.add(n)
+                    queue.append(n)
+        return seen
+
+    def shortest_path(self, start_id, goal_id, allowed=None):
+        """
+        Fewest-borders path between two regions (BFS).
+
+        Args:
+            allowed: optional set of region IDs the path may pass through
+
+        Returns:
+            List of region IDs from start to goal, or None if unreachable
+        """
+        if start_id not in self.names or goal_id not in self.names:
+            return None
+        if start_id == goal_id:
+            return [start_id]
+        neighbors = self.neighbors
+        previous = {start_id: None}
+        queue = deque([start_id])
+        while queue:
+            current = queue.popleft()
+            for n in neighbors.get(current, ()):
+                if n in previous or (allowed is not None and n not in allowed and n != goal_id):
+                    continue
+                previous[n] = current
+                if n == goal_id:
+                    path = [n]
+                    while previous[path[-1]] is not None:
+                        path.append(previous[path[-1]])
+                    return path[::-1]
+                queue.append(n)
+        return None
+
+
+# Process-wide instance
+world_graph = WorldGraph()
+
+
+def get_world_graph():
+    """The process-wide graph, built or refreshed as needed."""
+    return world_graph.ensure_current()
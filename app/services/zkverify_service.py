@@ -6,6 +6,10 @@ for verifying zero-knowledge proofs used in anonymous voting.
 
 zkVerify is a Substrate-based chain optimized for ZK proof verification,
 offering ~91% cost savings compared to Ethereum verification.
+
+Proofs are handled by a pool of long-lived Node.js workers
+(scripts/zk_verify_worker.js) that load snarkjs and the verification key
+once. Set ZK_WORKER_POOL=false to fall back to one Node process per proof.
 """
 
 import os
@@ -15,6 +19,8 @@ import tempfile
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from app.services.node_worker_pool import NodeWorkerPool, WorkerPoolError
+
 
 class ZKVerifyService:
     """
@@ -38,6 +44,45 @@ class ZKVerifyService:
             '..', 'static', 'circuits', 'anonymous_vote_verification_key.json'
         )
 
+        # Persistent Node worker pool (created lazily on first proof)
+        self.use_worker_pool = os.getenv('ZK_WORKER_POOL', 'true').lower() == 'true'
+        self.pool_size = int(os.getenv('ZK_WORKER_POOL_SIZE', '2'))
+        self.pool_max_queue = int(os.getenv('ZK_WORKER_POOL_QUEUE', '32'))
+        self.submit_timeout = int(os.getenv('ZK_WORKER_SUBMIT_TIMEOUT', '90'))
+        self.verify_timeout = int(os.getenv('ZK_WORKER_VERIFY_TIMEOUT', '30'))
+        self.worker_script = os.path.join(self.project_root, 'scripts', 'zk_verify_worker.js')
+        self._pool = None
+        self._default_vk = None
+
+    @property
+    def pool(self) -> NodeWorkerPool:
+        """Shared worker pool, spawned on first use."""
+        if self._pool is None:
+            self._pool = NodeWorkerPool(
+                self.worker_script,
+                args=[os.path.abspath(self.vk_path)],
+                size=self.pool_size,
+                max_queue=self.pool_max_queue,
+                cwd=self.project_root,
+            )
+        return self._pool
+
+    def _load_default_vk(self) -> Optional[Dict[str, Any]]:
+        """Load the voting circuit verification key once per process."""
+        if self._default_vk is None:
+            try:
+                with open(self.vk_path, 'r') as f:
+                    self._default_vk = json.load(f)
+            except FileNotFoundError:
+                return None
+        return self._default_vk
+
+    def _vk_override(self, verification_key: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Only ship a key to the workers if it differs from the one they preloaded."""
+        if verification_key is None or verification_key == self._load_default_vk():
+            return None
+        return verification_key
+
     def _create_verification_script(
         self,
         proof: Dict[str, Any],
@@ -138,12 +183,17 @@ verifyProof();
         Returns:
             Tuple of (success, tx_hash, block_number, error_message)
         """
+        if self.use_worker_pool:
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self.verify_proof_sync, proof, public_signals, verification_key
+            )
+
         # Load verification key if not provided
         if verification_key is None:
-            try:
-                with open(self.vk_path, 'r') as f:
-                    verification_key = json.load(f)
-            except FileNotFoundError:
+            verification_key = self._load_default_vk()
+            if verification_key is None:
                 return (False, None, None, 'Verification key not found. Compile circuits first.')
 
         if not self.seed_phrase:
@@ -245,10 +295,33 @@ verifyProof();
         verification_key: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Optional[str], Optional[int], Optional[str]]:
         """
-        Synchronous wrapper for verify_proof.
+        Verify a Groth16 proof on zkVerify blockchain (blocking).
 
-        Use this from Flask routes that don't support async.
+        Use this from Flask routes that don't support async. Goes through the
+        worker pool, which keeps the zkVerify session open between proofs.
         """
+        if self.use_worker_pool:
+            if self._load_default_vk() is None and verification_key is None:
+                return (False, None, None, 'Verification key not found. Compile circuits first.')
+            if not self.seed_phrase:
+                return (False, None, None, 'ZKVERIFY_SEED_PHRASE not configured')
+
+            try:
+                result = self.pool.request({
+                    'op': 'submit',
+                    'proof': proof,
+                    'publicSignals': public_signals,
+                    'vk': self._vk_override(verification_key),
+                    'seedPhrase': self.seed_phrase,
+                    'mainnet': self.use_mainnet,
+                }, timeout=self.submit_timeout)
+            except WorkerPoolError as e:
+                return (False, None, None, str(e))
+
+            if result.get('success'):
+                return (True, result.get('txHash'), result.get('blockNumber'), None)
+            return (False, None, None, result.get('error', 'Unknown error'))
+
         import asyncio
 
         # Get or create event loop
@@ -270,13 +343,40 @@ verifyProof();
         self,
         proof: Dict[str, Any],
         public_signals: list,
-        verification_key: Dict[str, Any]
+        verification_key: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Verify proof locally without blockchain submission.
 
         Useful for quick validation before submitting to zkVerify.
-        Uses snarkjs for local verification.
+        Uses snarkjs in the worker pool for local verification.
+        """
+        if not self.use_worker_pool:
+            return self._verify_proof_local_subprocess(
+                proof, public_signals, verification_key or self._load_default_vk()
+            )
+
+        try:
+            result = self.pool.request({
+                'op': 'verify',
+                'proof': proof,
+                'publicSignals': public_signals,
+                'vk': self._vk_override(verification_key),
+            }, timeout=self.verify_timeout)
+            return bool(result.get('valid', False))
+        except WorkerPoolError:
+            return False
+
+    def _verify_proof_local_subprocess(
+        self,
+        proof: Dict[str, Any],
+        public_signals: list,
+        verification_key: Dict[str, Any]
+    ) -> bool:
+        """
+        Verify proof locally by spawning a fresh Node.js process.
+
+        Cold-start path used when the worker pool is disabled.
         """
         # Add node_modules path for when script runs from temp directory
         node_modules_path = os.path.join(self.project_root, 'node_modules').replace('\\', '\\\\')
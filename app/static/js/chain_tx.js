@@ -0,0 +1,38 @@
+// tactizen/app/static/js/chain_tx.js
+
+// Blockchain transactions submitted to the server (NFT mints/upgrades,
+// marketplace trades) are confirmed in the background: the endpoint answers
+// 202 with a status_url. awaitChainTx() polls that URL until the transaction
+// is confirmed, failed or expired and resolves with the final JSON, which has
+// the same success/error fields the endpoints return directly.
+const CHAIN_TX_POLL_MS = 2000;
+const CHAIN_TX_MAX_WAIT_MS = 15 * 60 * 1000;
+
+async function awaitChainTx(response) {
+    let data = await response.json();
+    if (response.status !== 202 || !data.status_url) {
+        return data;
+    }
+
+    const statusUrl = data.status_url;
+    const deadline = Date.now() + CHAIN_TX_MAX_WAIT_MS;
+    while (data.pending && Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, CHAIN_TX_POLL_MS));
+        try {
+            const statusResponse = await fetch(statusUrl, { headers: { 'Accept': 'application/json' } });
+            if (statusResponse.ok) {
+                data = await statusResponse.json();
+            }
+        } catch (e) {
+            console.warn('Error checking transaction status, retrying:', e);
+        }
+    }
+
+    if (data.pending) {
+        return {
+            success: false,
+            error: 'Still waiting for blockchain confirmation. Refresh the page later to see the result.'
+        };
+    }
+    return data;
+}
@@ -7,6 +7,12 @@ let nftContract;
 let userAccount;
 let currentUserId = null;
 
+// Infinite scroll state for the listings grid
+let listingsQuery = '';
+let listingsCursor = null;
+let loadingMoreListings = false;
+let listingsObserver = null;
+
 const MARKETPLACE_CONTRACT_ADDRESS = '0x82F89212432Ae4675C8B84Cb2bE992E9B1dC0E3b';
 const NFT_CONTRACT_ADDRESS = '0x57e277b2d887C3C749757e36F0B6CFad32E00e8A';  // Tactizen Game NFT
 const ZEN_TOKEN_ADDRESS = '0x070040A826B586b58569750ED43cb5979b171e8d';
@@ -202,7 +208,11 @@ async function loadListings() {
         if (maxPrice) params.append('max_price', maxPrice);
         if (sortBy) params.append('sort_by', sortBy);
 
-        const response = await fetch(`/nft-marketplace/api/listings?${params}`);
+        listingsQuery = params.toString();
+        listingsCursor = null;
+        document.getElementById('listingsSentinel').style.display = 'none';
+
+        const response = await fetch(`/nft-marketplace/api/listings?${listingsQuery}`);
         const data = await response.json();
 
         document.getElementById('loadingSpinner').style.display = 'none';
@@ -210,6 +220,7 @@ async function loadListings() {
         if (data.success && data.listings.length > 0) {
             currentUserId = data.current_user_id;
             displayListings(data.listings);
+            setListingsCursor(data.next_cursor);
         } else {
             document.getElementById('noListings').style.display = 'block';
         }
@@ -220,10 +231,47 @@ async function loadListings() {
     }
 }
 
-// Display listings in the grid
-function displayListings(listings) {
+// Load the page after the current cursor and append it to the grid
+async function loadMoreListings() {
+    if (!listingsCursor || loadingMoreListings) return;
+    loadingMoreListings = true;
+    const query = listingsQuery;
+
+    try {
+        const params = new URLSearchParams(query);
+        params.append('cursor', listingsCursor);
+        const response = await fetch(`/nft-marketplace/api/listings?${params}`);
+        const data = await response.json();
+
+        // Filters changed while this page was loading
+        if (query !== listingsQuery) return;
+
+        if (data.success) {
+            displayListings(data.listings, true);
+            setListingsCursor(data.next_cursor);
+        }
+    } catch (error) {
+        console.error('Error loading more listings:', error);
+    } finally {
+        loadingMoreListings = false;
+    }
+}
+
+function setListingsCursor(cursor) {
+    listingsCursor = cursor;
+    const sentinel = document.getElementById('listingsSentinel');
+    sentinel.style.display = cursor ? 'block' : 'none';
+    if (cursor && listingsObserver) {
+        // Re-observe so a sentinel that is still in view after this page triggers the next one
+        listingsObserver.unobserve(sentinel);
+        listingsObserver.observe(sentinel);
+    }
+}
+
+// Display listings in the grid (append adds them after the ones already shown)
+function displayListings(listings, append = false) {
     const container = document.getElementById('listingsContainer');
-    container.innerHTML = '';
+    if (!append) container.innerHTML = '';
     container.style.display = 'flex';
 
     listings.forEach(listing => {
@@ -255,7 +303,9 @@ function createListingCard(listing, nft) {
                 <!-- NFT Image - Centered -->
                 ${nft.image_url ? `
                     <div style="text-align: center;">
-                        <img src="${nft.image_url}"
+                        <img src="${nft.thumbnail_url || nft.image_url}"
+                             ${nft.thumbnail_url_2x ? `srcset="${nft.thumbnail_url} 1x, ${nft.thumbnail_url_2x} 2x"` : ''}
+                             loading="lazy"
                              alt="${nft.name}"
                              class="nft-card-image"
                              style="width: 140px; height: 240px; object-fit: cover; border-radius: 12px;
@@ -396,7 +446,7 @@ async function buyNFT(listingId, tokenId, priceZen) {
                 gasPrice: L3_GAS_PRICE
             });
 
-        // Send transaction hash to backend for verification
+        // Send transaction hash to backend; it is confirmed in the background
         const response = await fetch('/nft-marketplace/api/buy', {
             method: 'POST',
             headers: {
@@ -409,7 +459,7 @@ async function buyNFT(listingId, tokenId, priceZen) {
             })
         });
 
-        const data = await response.json();
+        const data = await awaitChainTx(response);
 
         if (data.success) {
             showSuccess('NFT purchased successfully! Check your NFT inventory.');
@@ -497,7 +547,9 @@ function displayMyNFTs(nfts) {
                 <!-- Image Container -->
                 <div style="position: relative; width: 100%; padding-top: 140%; background: linear-gradient(180deg, rgba(15,20,25,0.3) 0%, rgba(15,20,25,0.8) 100%);">
                     ${nft.image_url ? `
-                        <img src="${nft.image_url}"
+                        <img src="${nft.thumbnail_url || nft.image_url}"
+                             ${nft.thumbnail_url_2x ? `srcset="${nft.thumbnail_url} 1x, ${nft.thumbnail_url_2x} 2x"` : ''}
+                             loading="lazy"
                              alt="${nft.name}"
                              style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover;"
                              onerror="this.parentElement.innerHTML='<div style=\\'position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);text-align:center;\\'><i class=\\'fas ${typeIcon}\\' style=\\'font-size:3rem;opacity:0.3;\\'></i></div>'">
@@ -729,7 +781,7 @@ document.getElementById('confirmListingBtn')?.addEventListener('click', async fu
                 gasPrice: L3_GAS_PRICE
             });
 
-        // Send transaction hash to backend for verification
+        // Send transaction hash to backend; it is confirmed in the background
         const response = await fetch('/nft-marketplace/api/list', {
             method: 'POST',
             headers: {
@@ -743,7 +795,7 @@ document.getElementById('confirmListingBtn')?.addEventListener('click', async fu
             })
         });
 
-        const data = await response.json();
+        const data = await awaitChainTx(response);
 
         if (data.success) {
             showSuccess('NFT listed successfully! It is now available for purchase.');
@@ -875,7 +927,7 @@ async function cancelListing(listingId, tokenId) {
                 gasPrice: L3_GAS_PRICE
             });
 
-        // Send transaction hash to backend for verification
+        // Send transaction hash to backend; it is confirmed in the background
         const response = await fetch('/nft-marketplace/api/cancel', {
             method: 'POST',
             headers: {
@@ -888,7 +940,7 @@ async function cancelListing(listingId, tokenId) {
             })
         });
 
-        const data = await response.json();
+        const data = await awaitChainTx(response);
 
         if (data.success) {
             showSuccess('Listing cancelled successfully! Your NFT has been returned.');
@@ -991,6 +1043,14 @@ document.getElementById('listNFTFromEmpty')?.addEventListener('click', function(
 document.addEventListener('DOMContentLoaded', function() {
     loadMarketplaceInfo();
     loadListings();
+
+    const sentinel = document.getElementById('listingsSentinel');
+    if (sentinel) {
+        listingsObserver = new IntersectionObserver(entries => {
+            if (entries[0].isIntersecting) loadMoreListings();
+        }, { root: document.querySelector('.marketplace-listings-scroll'), rootMargin: '300px' });
+        listingsObserver.observe(sentinel);
+    }
     initWeb3(); // Try to connect wallet on load
 
     // Global handler for ALL modal hidden events - ensures scroll is always restored
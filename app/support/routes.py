@@ -21,6 +21,7 @@ from app.models.support import (
     Report, UserMute, TicketCategory, TicketStatus, TicketPriority,
     ReportType, ReportReason, ReportStatus, ReportAction, AuditActionType
 )
+from app.services.moderation_stats_service import ModerationStatsService
 from app.support.forms import (
     CreateTicketForm, TicketResponseForm, StaffTicketResponseForm,
     TicketStatusForm, TicketPriorityForm, AssignTicketForm, TicketRatingForm,
@@ -29,6 +30,10 @@ from app.support.forms import (
 )
 
 
+# Newest entries per list on the staff user-history page
+USER_HISTORY_LIMIT = 50
+
+
 # ==================== HELPER FUNCTIONS ====================
 
 def allowed_file(filename):
@@ -78,6 +83,12 @@ def create_audit_log(ticket, user, action_type, old_value=None, new_value=None,
     return log
 
 
+def newest(query, limit=USER_HISTORY_LIMIT):
+    """First `limit` rows of an ordered query, and whether there are more."""
+    rows = query.limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+
 def is_staff(user):
     """Check if user is admin or moderator."""
     return user.is_admin or getattr(user, 'is_moderator', False)
@@ -172,6 +183,7 @@ def create_ticket():
         )
         db.session.add(ticket)
         db.session.flush()
+        ModerationStatsService.on_ticket_created(ticket)
 
         # Create audit log
         create_audit_log(ticket, current_user, AuditActionType.CREATED,
@@ -280,12 +292,14 @@ def respond_to_ticket(ticket_id):
 
         # If user responds, set to awaiting response (for staff)
         # If staff responds, keep current status or set to awaiting response (for user)
+        old_status = ticket.status
         if not is_staff(current_user):
             if ticket.status == TicketStatus.AWAITING_RESPONSE:
                 ticket.status = TicketStatus.OPEN
         else:
             if ticket.status == TicketStatus.OPEN:
                 ticket.status = TicketStatus.AWAITING_RESPONSE
+        ModerationStatsService.on_ticket_status_change(ticket, old_status, ticket.resolved_at)
 
         # Create audit log
         create_audit_log(ticket, current_user, AuditActionType.RESPONSE_ADDED if not is_internal else AuditActionType.INTERNAL_NOTE_ADDED)
@@ -328,6 +342,7 @@ def rate_ticket(ticket_id):
     if form.validate_on_submit():
         ticket.rating = int(form.rating.data)
         ticket.rating_comment = form.rating_comment.data
+        ModerationStatsService.on_ticket_rated(ticket)
 
         create_audit_log(ticket, current_user, AuditActionType.RATED,
                         new_value=form.rating.data)
@@ -378,6 +393,7 @@ def report_message(message_id):
         )
         report.create_content_snapshot()
         db.session.add(report)
+        ModerationStatsService.on_report_created(report)
         db.session.commit()
 
         flash('Report submitted successfully. Our team will review it.', 'success')
@@ -423,6 +439,7 @@ def report_article(article_id):
         )
         report.create_content_snapshot()
         db.session.add(report)
+        ModerationStatsService.on_report_created(report)
         db.session.commit()
 
         flash('Report submitted successfully. Our team will review it.', 'success')
@@ -473,6 +490,7 @@ def report_comment(comment_id):
         )
         report.create_content_snapshot()
         db.session.add(report)
+        ModerationStatsService.on_report_created(report)
         db.session.commit()
 
         flash('Report submitted successfully. Our team will review it.', 'success')
@@ -523,6 +541,7 @@ def report_user(user_id):
         )
         report.create_content_snapshot()
         db.session.add(report)
+        ModerationStatsService.on_report_created(report)
         db.session.commit()
 
         flash('Report submitted successfully. Our team will review it.', 'success')
@@ -569,6 +588,7 @@ def report_company(company_id):
         )
         report.create_content_snapshot()
         db.session.add(report)
+        ModerationStatsService.on_report_created(report)
         db.session.commit()
 
         flash('Report submitted successfully. Our team will review it.', 'success')
@@ -598,34 +618,43 @@ def admin_tickets():
     query = SupportTicket.query.filter_by(is_deleted=False)
 
     # Apply filters
+    status = None
+    counted = True  # Whole queue or one status: the total is in moderation_counters
     if status_filter:
         try:
-            query = query.filter_by(status=TicketStatus(status_filter))
+            status = TicketStatus(status_filter)
+            query = query.filter_by(status=status)
         except ValueError:
             pass
 
     if priority_filter:
         try:
             query = query.filter_by(priority=TicketPriority(priority_filter))
+            counted = False
         except ValueError:
             pass
 
     if category_filter:
         try:
             query = query.filter_by(category=TicketCategory(category_filter))
+            counted = False
         except ValueError:
             pass
 
     if assigned_filter == 'me':
         query = query.filter_by(assigned_to_id=current_user.id)
+        counted = False
     elif assigned_filter == 'unassigned':
         query = query.filter_by(assigned_to_id=None)
+        counted = False
 
     # Sort by priority (critical first) then by date
     tickets = query.order_by(
         SupportTicket.priority.desc(),
         SupportTicket.created_at.desc()
-    ).paginate(page=page, per_page=20, error_out=False)
+    ).paginate(page=page, per_page=20, error_out=False, count=not counted)
+    if counted:
+        tickets.total = ModerationStatsService.ticket_count(status)
 
     # Get staff members for assignment
     staff_members = User.query.filter(
@@ -657,6 +686,7 @@ def update_ticket_status(ticket_id):
 
     try:
         old_status = ticket.status
+        old_resolved_at = ticket.resolved_at
         ticket.status = TicketStatus(new_status)
         ticket.updated_at = datetime.utcnow()
 
@@ -665,6 +695,8 @@ def update_ticket_status(ticket_id):
         elif ticket.status == TicketStatus.CLOSED:
             ticket.closed_at = datetime.utcnow()
 
+        ModerationStatsService.on_ticket_status_change(ticket, old_status, old_resolved_at)
+
         create_audit_log(ticket, current_user, AuditActionType.STATUS_CHANGED,
                         old_value=old_status.value,
                         new_value=new_status)
@@ -761,21 +793,29 @@ def admin_reports():
 
     query = Report.query.filter_by(is_deleted=False)
 
+    status = None
+    report_type = None
     if status_filter:
         try:
-            query = query.filter_by(status=ReportStatus(status_filter))
+            status = ReportStatus(status_filter)
+            query = query.filter_by(status=status)
         except ValueError:
             pass
 
     if type_filter:
         try:
-            query = query.filter_by(report_type=ReportType(type_filter))
+            report_type = ReportType(type_filter)
+            query = query.filter_by(report_type=report_type)
         except ValueError:
             pass
 
+    # Unless both filters are set, the total is in moderation_counters
+    counted = status is None or report_type is None
     reports = query.order_by(Report.created_at.desc()).paginate(
-        page=page, per_page=20, error_out=False
+        page=page, per_page=20, error_out=False, count=not counted
     )
+    if counted:
+        reports.total = ModerationStatsService.report_count(status, report_type)
 
     return render_template('support/admin/reports.html',
                           title='Manage Reports',
@@ -836,7 +876,9 @@ def take_report_action(report_id):
         report.action_details = form.action_details.data
         report.handled_by_id = current_user.id
         report.handled_at = datetime.utcnow()
+        old_status = report.status
         report.status = ReportStatus.RESOLVED
+        ModerationStatsService.on_report_status_change(report, old_status)
 
         reported_user = report.reported_user
 
@@ -1030,91 +1072,38 @@ def admin_statistics():
     if not is_staff(current_user):
         abort(403)
 
-    now = datetime.utcnow()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = today_start - timedelta(days=7)
-    month_start = today_start - timedelta(days=30)
-
-    # Ticket statistics
-    ticket_stats = {
-        'total': SupportTicket.query.filter_by(is_deleted=False).count(),
-        'open': SupportTicket.query.filter_by(status=TicketStatus.OPEN, is_deleted=False).count(),
-        'in_progress': SupportTicket.query.filter_by(status=TicketStatus.IN_PROGRESS, is_deleted=False).count(),
-        'awaiting_response': SupportTicket.query.filter_by(status=TicketStatus.AWAITING_RESPONSE, is_deleted=False).count(),
-        'resolved': SupportTicket.query.filter_by(status=TicketStatus.RESOLVED, is_deleted=False).count(),
-        'closed': SupportTicket.query.filter_by(status=TicketStatus.CLOSED, is_deleted=False).count(),
-        'today': SupportTicket.query.filter(SupportTicket.created_at >= today_start).count(),
-        'this_week': SupportTicket.query.filter(SupportTicket.created_at >= week_start).count(),
-        'this_month': SupportTicket.query.filter(SupportTicket.created_at >= month_start).count(),
-    }
-
-    # Average resolution time (for resolved tickets)
-    resolved_tickets = SupportTicket.query.filter(
-        SupportTicket.resolved_at != None,
-        SupportTicket.is_deleted == False
-    ).all()
+    # Status, type and time-window counts, averages: one read of moderation_counters
+    summary = ModerationStatsService.get_summary()
+    ticket_stats = summary['tickets']
+    report_stats = summary['reports']
+    report_by_type = summary['report_by_type']
 
-    if resolved_tickets:
-        total_time = sum(
-            (t.resolved_at - t.created_at).total_seconds()
-            for t in resolved_tickets
-        )
-        avg_resolution_hours = (total_time / len(resolved_tickets)) / 3600
-        ticket_stats['avg_resolution_hours'] = round(avg_resolution_hours, 1)
-    else:
-        ticket_stats['avg_resolution_hours'] = 0
-
-    # Average rating
-    rated_tickets = SupportTicket.query.filter(
-        SupportTicket.rating != None,
-        SupportTicket.is_deleted == False
-    ).all()
-
-    if rated_tickets:
-        ticket_stats['avg_rating'] = round(sum(t.rating for t in rated_tickets) / len(rated_tickets), 1)
-        ticket_stats['total_ratings'] = len(rated_tickets)
-    else:
-        ticket_stats['avg_rating'] = 0
-        ticket_stats['total_ratings'] = 0
-
-    # Report statistics
-    report_stats = {
-        'total': Report.query.filter_by(is_deleted=False).count(),
-        'pending': Report.query.filter_by(status=ReportStatus.PENDING, is_deleted=False).count(),
-        'under_review': Report.query.filter_by(status=ReportStatus.UNDER_REVIEW, is_deleted=False).count(),
-        'resolved': Report.query.filter_by(status=ReportStatus.RESOLVED, is_deleted=False).count(),
-        'dismissed': Report.query.filter_by(status=ReportStatus.DISMISSED, is_deleted=False).count(),
-        'today': Report.query.filter(Report.created_at >= today_start).count(),
-        'this_week': Report.query.filter(Report.created_at >= week_start).count(),
-    }
-
-    # Reports by type
-    report_by_type = {
-        'message': Report.query.filter_by(report_type=ReportType.MESSAGE, is_deleted=False).count(),
-        'article': Report.query.filter_by(report_type=ReportType.NEWSPAPER_ARTICLE, is_deleted=False).count(),
-        'user': Report.query.filter_by(report_type=ReportType.USER_PROFILE, is_deleted=False).count(),
-        'company': Report.query.filter_by(report_type=ReportType.COMPANY, is_deleted=False).count(),
-    }
-
-    # Most reported users
-    most_reported = db.session.query(
-        User,
+    # Most reported users (top 10 grouped on the report index, then joined to users)
+    report_counts = db.session.query(
+        Report.reported_user_id.label('user_id'),
         func.count(Report.id).label('report_count')
-    ).join(Report, Report.reported_user_id == User.id).filter(
+    ).filter(
+        Report.reported_user_id != None,
         Report.is_deleted == False
-    ).group_by(User.id).order_by(
+    ).group_by(Report.reported_user_id).order_by(
         func.count(Report.id).desc()
-    ).limit(10).all()
-
-    # Staff performance
-    staff_stats = db.session.query(
-        User,
-        func.count(SupportTicket.id).label('tickets_handled')
-    ).join(TicketResponse, TicketResponse.user_id == User.id).filter(
+    ).limit(10).subquery()
+    most_reported = db.session.query(User, report_counts.c.report_count).join(
+        report_counts, report_counts.c.user_id == User.id
+    ).order_by(report_counts.c.report_count.desc()).all()
+
+    # Staff performance: distinct tickets each staff member has answered
+    handled_counts = db.session.query(
+        TicketResponse.user_id.label('user_id'),
+        func.count(func.distinct(TicketResponse.ticket_id)).label('tickets_handled')
+    ).filter(
         TicketResponse.is_staff_response == True
-    ).group_by(User.id).order_by(
-        func.count(SupportTicket.id).desc()
-    ).limit(10).all()
+    ).group_by(TicketResponse.user_id).order_by(
+        func.count(func.distinct(TicketResponse.ticket_id)).desc()
+    ).limit(10).subquery()
+    staff_stats = db.session.query(User, handled_counts.c.tickets_handled).join(
+        handled_counts, handled_counts.c.user_id == User.id
+    ).order_by(handled_counts.c.tickets_handled.desc()).all()
 
     return render_template('support/admin/statistics.html',
                           title='Support Statistics',
@@ -1137,27 +1126,27 @@ def user_ticket_history(user_id):
     user = User.query.get_or_404(user_id)
 
     # User's tickets
-    tickets = SupportTicket.query.filter_by(
+    tickets, more_tickets = newest(SupportTicket.query.filter_by(
         user_id=user_id,
         is_deleted=False
-    ).order_by(SupportTicket.created_at.desc()).all()
+    ).order_by(SupportTicket.created_at.desc()))
 
     # Reports against user
-    reports_against = Report.query.filter_by(
+    reports_against, more_reports_against = newest(Report.query.filter_by(
         reported_user_id=user_id,
         is_deleted=False
-    ).order_by(Report.created_at.desc()).all()
+    ).order_by(Report.created_at.desc()))
 
     # Reports submitted by user
-    reports_submitted = Report.query.filter_by(
+    reports_submitted, more_reports_submitted = newest(Report.query.filter_by(
         reporter_id=user_id,
         is_deleted=False
-    ).order_by(Report.created_at.desc()).all()
+    ).order_by(Report.created_at.desc()))
 
     # Mute history
-    mute_history = UserMute.query.filter_by(user_id=user_id).order_by(
+    mute_history, more_mutes = newest(UserMute.query.filter_by(user_id=user_id).order_by(
         UserMute.started_at.desc()
-    ).all()
+    ))
 
     return render_template('support/admin/user_history.html',
                           title=f'History: {user.username}',
@@ -1165,4 +1154,8 @@ def user_ticket_history(user_id):
                           tickets=tickets,
                           reports_against=reports_against,
                           reports_submitted=reports_submitted,
-                          mute_history=mute_history)
+                          mute_history=mute_history,
+                          more_tickets=more_tickets,
+                          more_reports_against=more_reports_against,
+                          more_reports_submitted=more_reports_submitted,
+                          more_mutes=more_mutes)
@@ -231,6 +231,49 @@ class Config:
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
     MAX_CONTENT_LENGTH = 5 * 1024 * 1024  # 5MB (images will be compressed on server)
 
+    # NFT images are immutable per IPFS CID: fetched once from the gateway,
+    # then served (and thumbnailed) from a size-bounded local disk cache
+    NFT_IMAGE_GATEWAY = os.environ.get('NFT_IMAGE_GATEWAY', 'https://gateway.pinata.cloud/ipfs/')
+    NFT_IMAGE_CACHE_DIR = os.environ.get('NFT_IMAGE_CACHE_DIR', os.path.join(basedir, 'cache', 'nft_images'))
+    NFT_IMAGE_CACHE_MAX_MB = int(os.environ.get('NFT_IMAGE_CACHE_MAX_MB', 512))
+    NFT_IMAGE_FETCH_TIMEOUT = 10  # Seconds
+
+    # SQL profiling: per-request query count, DB time and N+1 detection
+    # (X-SQL-* headers, admin SQL profile page). Budgets are per-endpoint
+    # query ceilings - logged when exceeded, or raised when enforced (tests).
+    SQL_PROFILER_ENABLED = os.environ.get('SQL_PROFILER_ENABLED', 'False').lower() == 'true'
+    SQL_N_PLUS_ONE_THRESHOLD = 5
+    SQL_QUERY_BUDGETS = {
+        'main.index': 40,
+        'main.messages': 30,
+        'main.leaderboards': 30,
+        'main.battle_status': 40,
+        'main.country': 30,
+        'military_unit.distribute_bulk': 15,
+    }
+    SQL_QUERY_BUDGET_ENFORCE = False
+
+    # Financial transaction history: months older than the newest
+    # TRANSACTION_KEEP_MONTHS are exported here by `flask archive-transactions`
+    TRANSACTION_ARCHIVE_DIR = os.environ.get('TRANSACTION_ARCHIVE_DIR', os.path.join(basedir, 'archive', 'transactions'))
+    TRANSACTION_KEEP_MONTHS = int(os.environ.get('TRANSACTION_KEEP_MONTHS', 6))
+
+    # Logging pipeline: app, transaction and security log records go through a
+    # bounded queue to a background writer thread (batched file writes, bulk
+    # security_logs inserts). Records are dropped and counted when it is full.
+    LOG_PIPELINE_ENABLED = os.environ.get('LOG_PIPELINE_ENABLED', 'True').lower() == 'true'
+    LOG_QUEUE_SIZE = 10000
+    LOG_BATCH_SIZE = 500
+
+    # Metrics: request latency, DB pool, cache, rate limiter and scheduler
+    # metrics in Prometheus text format at /metrics, for admins and for
+    # scrapes of Gunicorn's local bind (not through nginx). Under Gunicorn
+    # every worker writes its samples to METRICS_MULTIPROC_DIR every
+    # METRICS_FLUSH_SECONDS and /metrics adds them up (set by gunicorn.conf.py).
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+    METRICS_MULTIPROC_DIR = os.environ.get('METRICS_MULTIPROC_DIR')
+    METRICS_FLUSH_SECONDS = float(os.environ.get('METRICS_FLUSH_SECONDS', 5))
+
     # Error Handling Configuration
     # Control error detail exposure
     PROPAGATE_EXCEPTIONS = None  # Let Flask decide based on DEBUG
@@ -252,6 +295,38 @@ class Config:
     NFT_CONTRACT_ADDRESS = os.environ.get('NFT_CONTRACT_ADDRESS')
     ELECTION_RESULTS_CONTRACT_ADDRESS = os.environ.get('ELECTION_RESULTS_CONTRACT_ADDRESS')
 
+    # User transactions (NFT mints/upgrades, marketplace trades) are answered
+    # with 202 and confirmed by a background watcher that polls receipts once
+    # per block. A transaction is applied after CONFIRMATIONS blocks on top of
+    # its own and expired if it has no receipt after TIMEOUT_BLOCKS.
+    CHAIN_TX_CONFIRMATIONS = int(os.environ.get('CHAIN_TX_CONFIRMATIONS', 1))
+    CHAIN_TX_TIMEOUT_BLOCKS = int(os.environ.get('CHAIN_TX_TIMEOUT_BLOCKS', 300))
+    CHAIN_TX_WATCH_SECONDS = int(os.environ.get('CHAIN_TX_WATCH_SECONDS', 3))  # ~ block time
+
+    # NFT ownership / marketplace listing mirror, built from contract events.
+    # START_BLOCK is the contracts' deployment block; on a reorg the indexer
+    # rewinds REORG_DEPTH blocks. Readers fall back to RPC calls when the
+    # indexer has not run for MAX_AGE_SECONDS.
+    CHAIN_INDEX_START_BLOCK = int(os.environ.get('CHAIN_INDEX_START_BLOCK', 0))
+    CHAIN_INDEX_REORG_DEPTH = int(os.environ.get('CHAIN_INDEX_REORG_DEPTH', 12))
+    CHAIN_INDEX_BATCH_BLOCKS = int(os.environ.get('CHAIN_INDEX_BATCH_BLOCKS', 2000))
+    CHAIN_INDEX_INTERVAL_SECONDS = int(os.environ.get('CHAIN_INDEX_INTERVAL_SECONDS', 10))
+    CHAIN_INDEX_MAX_AGE_SECONDS = int(os.environ.get('CHAIN_INDEX_MAX_AGE_SECONDS', 120))
+
+    # Background jobs (elections, battles, chain watchers...). One-off
+    # processes (bootstrap-world, seed scripts) run with BootstrapConfig.
+    SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', 'True').lower() == 'true'
+
+    # Gunicorn preload_app: create_app runs once in the master, which warms
+    # templates and reference data and runs the startup checks, but never
+    # starts the scheduler; workers get theirs in post_fork (app/lifecycle.py).
+    # Set by gunicorn.conf.py, not meant to be set by hand.
+    PRELOAD_APP = os.environ.get('GUNICORN_PRELOAD', 'False').lower() == 'true'
+
+    # ZK vote verification: 'local' = in-process Groth16 check only,
+    # 'zkverify' = local check plus zkVerify submission for on-chain attestation
+    ZK_VOTE_VERIFIER = os.environ.get('ZK_VOTE_VERIFIER', 'local').lower()
+
 
 class DevelopmentConfig(Config):
     """Development environment configuration with relaxed security for debugging."""
@@ -272,6 +347,9 @@ class DevelopmentConfig(Config):
     PROPAGATE_EXCEPTIONS = False  # Use Flask's error handlers
     TRAP_BAD_REQUEST_ERRORS = True  # Show details for bad requests
 
+    # Development: Profile SQL on every request
+    SQL_PROFILER_ENABLED = True
+
 
 class ProductionConfig(Config):
     """Production environment configuration with maximum security."""
@@ -335,11 +413,31 @@ class TestingConfig(Config):
     SECURITY_HEADERS = {}
     CONTENT_SECURITY_POLICY = {}
 
+    # Testing: Query budget regressions fail the suite
+    SQL_PROFILER_ENABLED = True
+    SQL_QUERY_BUDGET_ENFORCE = True
+
+    # Testing: Write logs synchronously so tests can read them back
+    LOG_PIPELINE_ENABLED = False
+
+    # Testing: No background jobs writing to the shared in-memory database;
+    # tests that need the scheduler turn it on in their own config
+    SCHEDULER_ENABLED = False
+
+
+class BootstrapConfig(Config):
+    """One-off world building (flask bootstrap-world, seed scripts)."""
+    # Nothing else may write while the world is half built, and the process
+    # exits before a background log writer would flush
+    SCHEDULER_ENABLED = False
+    LOG_PIPELINE_ENABLED = False
+
 
 # Configuration dictionary for easy selection
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
     'testing': TestingConfig,
+    'bootstrap': BootstrapConfig,
     'default': DevelopmentConfig
 }
\ No newline at end of file
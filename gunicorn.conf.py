@@ -2,6 +2,7 @@
 # https://docs.gunicorn.org/en/stable/settings.html
 
 import multiprocessing
+import os
 
 # Server socket
 bind = "127.0.0.1:5000"  # Only listen locally (Nginx will proxy)
@@ -19,6 +20,17 @@ keepalive = 5
 max_requests = 1000  # Restart workers after this many requests (prevents memory leaks)
 max_requests_jitter = 50  # Add randomness to prevent all workers restarting at once
 
+# Load the app once in the master and fork workers from it: templates, reference
+# data and country geodata are shared copy-on-write, and a recycled worker starts
+# in milliseconds instead of re-running create_app (see app/lifecycle.py).
+# Note: HUP then only respawns workers from the loaded code; restart to deploy.
+preload_app = True
+os.environ.setdefault('GUNICORN_PRELOAD', 'true' if preload_app else 'false')
+
+# Workers write their metrics here; /metrics on any worker adds them all up
+# (app/metrics.py). Cleared when the master starts.
+metrics_dir = os.environ.setdefault('METRICS_MULTIPROC_DIR', '/run/tactizen/metrics')
+
 # Server mechanics
 daemon = False  # Let systemd manage the daemon
 pidfile = "/run/tactizen/gunicorn.pid"
@@ -47,12 +59,31 @@ limit_request_field_size = 8190
 # Hooks for graceful shutdown
 def on_starting(server):
     """Called just before the master process is initialized."""
-    pass
+    from app.metrics import clear_multiprocess_dir
+    clear_multiprocess_dir(metrics_dir)
 
 def on_exit(server):
     """Called just before exiting Gunicorn."""
     pass
 
 def worker_exit(server, worker):
-    """Called when a worker exits."""
-    pass
+    """Called in the worker as it exits: write out its last metrics."""
+    from app.metrics import write_snapshot
+    write_snapshot()
+
+def child_exit(server, worker):
+    """Called in the master after a worker exited: keep its metric totals."""
+    from app.metrics import mark_process_dead
+    mark_process_dead(worker.pid, metrics_dir)
+
+def pre_fork(server, worker):
+    """Called in the master just before a worker is forked."""
+    if server.cfg.preload_app:
+        from app.lifecycle import before_fork
+        before_fork()
+
+def post_fork(server, worker):
+    """Called in the new worker: reopen database, RPC and background threads."""
+    if server.cfg.preload_app:
+        from app.lifecycle import after_fork
+        after_fork(server.app.wsgi())
@@ -0,0 +1,85 @@
+"""Add chain event index tables: token_owner, onchain_listing, chain_event and chain_index_cursor
+
+Revision ID: chain_index_001
+Revises: pending_chain_tx_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'chain_index_001'
+down_revision = 'pending_chain_tx_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chain_index_cursor',
+        sa.Column('name', sa.String(length=40), nullable=False),
+        sa.Column('last_block', sa.BigInteger(), nullable=True),
+        sa.Column('last_block_hash', sa.String(length=66), nullable=True),
+        sa.Column('lease_owner', sa.String(length=100), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    op.create_table('chain_event',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('block_number', sa.BigInteger(), nullable=False),
+        sa.Column('block_hash', sa.String(length=66), nullable=False),
+        sa.Column('log_index', sa.Integer(), nullable=False),
+        sa.Column('tx_hash', sa.String(length=66), nullable=False),
+        sa.Column('event', sa.String(length=20), nullable=False),
+        sa.Column('token_id', sa.BigInteger(), nullable=False),
+        sa.Column('from_address', sa.String(length=42), nullable=True),
+        sa.Column('to_address', sa.String(length=42), nullable=True),
+        sa.Column('price_zen', sa.Numeric(precision=36, scale=18), nullable=True),
+        sa.Column('event_timestamp', sa.BigInteger(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('block_number', 'log_index', name='uq_chain_event_position')
+    )
+    with op.batch_alter_table('chain_event', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_chain_event_block_number'), ['block_number'], unique=False)
+        batch_op.create_index(batch_op.f('ix_chain_event_token_id'), ['token_id'], unique=False)
+
+    op.create_table('token_owner',
+        sa.Column('token_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('owner_address', sa.String(length=42), nullable=False),
+        sa.Column('block_number', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('token_id')
+    )
+    with op.batch_alter_table('token_owner', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_owner_owner_address'), ['owner_address'], unique=False)
+
+    op.create_table('onchain_listing',
+        sa.Column('token_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('seller_address', sa.String(length=42), nullable=False),
+        sa.Column('price_zen', sa.Numeric(precision=36, scale=18), nullable=False),
+        sa.Column('active', sa.Boolean(), nullable=False),
+        sa.Column('listed_at', sa.BigInteger(), nullable=True),
+        sa.Column('buyer_address', sa.String(length=42), nullable=True),
+        sa.Column('block_number', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('token_id')
+    )
+    with op.batch_alter_table('onchain_listing', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_onchain_listing_seller_address'), ['seller_address'], unique=False)
+        batch_op.create_index(batch_op.f('ix_onchain_listing_active'), ['active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('onchain_listing', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_onchain_listing_active'))
+        batch_op.drop_index(batch_op.f('ix_onchain_listing_seller_address'))
+    op.drop_table('onchain_listing')
+    with op.batch_alter_table('token_owner', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_owner_owner_address'))
+    op.drop_table('token_owner')
+    with op.batch_alter_table('chain_event', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_chain_event_token_id'))
+        batch_op.drop_index(batch_op.f('ix_chain_event_block_number'))
+    op.drop_table('chain_event')
+    op.drop_table('chain_index_cursor')
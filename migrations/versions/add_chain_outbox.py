@@ -0,0 +1,67 @@
+"""Add chain_outbox and chain_account tables for queued on-chain publications
+
+Revision ID: chain_outbox_001
+Revises: username_lower_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'chain_outbox_001'
+down_revision = 'username_lower_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chain_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('dedupe_key', sa.String(length=100), nullable=False),
+        sa.Column('contract', sa.String(length=40), nullable=False),
+        sa.Column('function', sa.String(length=60), nullable=False),
+        sa.Column('args', sa.Text(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'SUBMITTED', 'CONFIRMED', 'FAILED', name='chainoutboxstatus'), nullable=False),
+        sa.Column('from_address', sa.String(length=42), nullable=True),
+        sa.Column('nonce', sa.Integer(), nullable=True),
+        sa.Column('gas_price', sa.Numeric(precision=30, scale=0), nullable=True),
+        sa.Column('tx_hash', sa.String(length=66), nullable=True),
+        sa.Column('raw_tx', sa.Text(), nullable=True),
+        sa.Column('tx_hashes', sa.Text(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('block_number', sa.BigInteger(), nullable=True),
+        sa.Column('gas_used', sa.BigInteger(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('submitted_at', sa.DateTime(), nullable=True),
+        sa.Column('confirmed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('dedupe_key')
+    )
+    with op.batch_alter_table('chain_outbox', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_chain_outbox_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_chain_outbox_tx_hash'), ['tx_hash'], unique=False)
+        batch_op.create_index('idx_chain_outbox_status_next', ['status', 'next_attempt_at'], unique=False)
+        batch_op.create_index('idx_chain_outbox_from_nonce', ['from_address', 'nonce'], unique=False)
+
+    op.create_table('chain_account',
+        sa.Column('address', sa.String(length=42), nullable=False),
+        sa.Column('next_nonce', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('lease_owner', sa.String(length=100), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('address')
+    )
+
+
+def downgrade():
+    op.drop_table('chain_account')
+    with op.batch_alter_table('chain_outbox', schema=None) as batch_op:
+        batch_op.drop_index('idx_chain_outbox_from_nonce')
+        batch_op.drop_index('idx_chain_outbox_status_next')
+        batch_op.drop_index(batch_op.f('ix_chain_outbox_tx_hash'))
+        batch_op.drop_index(batch_op.f('ix_chain_outbox_status'))
+    op.drop_table('chain_outbox')
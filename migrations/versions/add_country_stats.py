@@ -0,0 +1,39 @@
+"""Add country_stats table for materialized country page statistics
+
+Revision ID: country_stats_001
+Revises: add_profile_bg001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'country_stats_001'
+down_revision = 'add_profile_bg001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('country_stats',
+        sa.Column('country_id', sa.Integer(), nullable=False),
+        sa.Column('population', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('citizen_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_experience', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('new_citizens_today', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('new_citizens_date', sa.Date(), nullable=True),
+        sa.Column('region_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('company_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('recomputed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['country_id'], ['country.id'], ),
+        sa.PrimaryKeyConstraint('country_id')
+    )
+    # Rows are built lazily on first page view and by the nightly
+    # recompute job (or `flask recompute-country-stats`).
+
+
+def downgrade():
+    op.drop_table('country_stats')
@@ -0,0 +1,40 @@
+"""Add composite indexes for keyset-paginated lists
+
+Revision ID: keyset_indexes_001
+Revises: transaction_rollups_001
+Create Date: 2026-10-18
+
+Alerts, message threads, marketplace listings and the job market are paged
+by (sort column, id) after the last row seen. Each index below covers the
+list's equality filters followed by the sort column and id, so every page
+is an index range seek regardless of how deep it is.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'keyset_indexes_001'
+down_revision = 'transaction_rollups_001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('alert', 'idx_alert_user_feed', ['user_id', 'is_deleted', 'created_at', 'id']),
+    ('message', 'idx_message_thread', ['sender_id', 'recipient_id', 'created_at', 'id']),
+    ('nft_marketplace', 'idx_marketplace_active_listed', ['is_active', 'listed_at', 'id']),
+    ('nft_marketplace', 'idx_marketplace_active_price', ['is_active', 'price_zen', 'id']),
+    ('job_offer', 'idx_job_offer_active_wage', ['is_active', 'wage_per_pp', 'id']),
+]
+
+
+def upgrade():
+    for table, name, columns in INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    for table, name, columns in reversed(INDEXES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(name)
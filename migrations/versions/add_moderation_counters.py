@@ -0,0 +1,73 @@
+"""Add moderation_counters table and support queue indexes
+
+Revision ID: moderation_counters_001
+Revises: chain_index_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'moderation_counters_001'
+down_revision = 'chain_index_001'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('support_ticket', 'idx_ticket_queue', ['is_deleted', 'priority', 'created_at']),
+    ('support_ticket', 'idx_ticket_status_queue', ['status', 'is_deleted', 'priority', 'created_at']),
+    ('support_ticket', 'idx_ticket_user_history', ['user_id', 'is_deleted', 'created_at']),
+    ('ticket_response', 'idx_ticket_response_staff', ['is_staff_response', 'user_id', 'ticket_id']),
+    ('report', 'idx_report_queue', ['is_deleted', 'created_at']),
+    ('report', 'idx_report_status_queue', ['status', 'is_deleted', 'created_at']),
+    ('report', 'idx_report_type_queue', ['report_type', 'is_deleted', 'created_at']),
+    ('report', 'idx_report_against_user', ['reported_user_id', 'is_deleted', 'created_at']),
+    ('report', 'idx_report_by_reporter', ['reporter_id', 'is_deleted', 'created_at']),
+]
+
+
+def upgrade():
+    op.create_table('moderation_counters',
+        sa.Column('bucket', sa.String(length=10), nullable=False),
+        sa.Column('tickets_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_open', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_in_progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_awaiting_response', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_resolved', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_closed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_archived', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tickets_timed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('resolution_seconds', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('ratings_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('ratings_sum', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_pending', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_under_review', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_resolved', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_dismissed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_message', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_newspaper_article', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_article_comment', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_user_profile', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reports_company', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('recomputed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('bucket')
+    )
+    # Rows are built on the first statistics page view and by the nightly
+    # recompute job (or `flask recompute-moderation-counters`).
+
+    for table, name, columns in INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    for table, name, columns in reversed(INDEXES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(name)
+
+    op.drop_table('moderation_counters')
@@ -0,0 +1,57 @@
+"""Add pending_chain_tx and chain_tx_watcher tables for background transaction confirmation
+
+Revision ID: pending_chain_tx_001
+Revises: keyset_indexes_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'pending_chain_tx_001'
+down_revision = 'keyset_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('pending_chain_tx',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tx_hash', sa.String(length=66), nullable=False),
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('params', sa.Text(), nullable=False),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'CONFIRMED', 'FAILED', 'EXPIRED', name='pendingchaintxstatus'), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('first_seen_block', sa.BigInteger(), nullable=True),
+        sa.Column('block_number', sa.BigInteger(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('finalized_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tx_hash')
+    )
+    with op.batch_alter_table('pending_chain_tx', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_pending_chain_tx_user_id'), ['user_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_pending_chain_tx_status'), ['status'], unique=False)
+
+    op.create_table('chain_tx_watcher',
+        sa.Column('name', sa.String(length=40), nullable=False),
+        sa.Column('last_block', sa.BigInteger(), nullable=True),
+        sa.Column('lease_owner', sa.String(length=100), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('chain_tx_watcher')
+    with op.batch_alter_table('pending_chain_tx', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_pending_chain_tx_status'))
+        batch_op.drop_index(batch_op.f('ix_pending_chain_tx_user_id'))
+    op.drop_table('pending_chain_tx')
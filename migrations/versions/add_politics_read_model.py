@@ -0,0 +1,87 @@
+"""Add politics read model tables (party rosters, election summaries, government composition)
+
+Revision ID: politics_read_model_001
+Revises: moderation_counters_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'politics_read_model_001'
+down_revision = 'moderation_counters_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('party_roster',
+        sa.Column('party_id', sa.Integer(), nullable=False),
+        sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_experience', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('level_sum', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('congress_seats', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('recomputed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['party_id'], ['political_party.id'], ),
+        sa.PrimaryKeyConstraint('party_id')
+    )
+
+    op.create_table('election_summary',
+        sa.Column('election_type', sa.String(length=50), nullable=False),
+        sa.Column('election_id', sa.Integer(), nullable=False),
+        sa.Column('candidate_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('vote_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('zk_vote_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('zk_proof_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('recomputed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('election_type', 'election_id')
+    )
+
+    op.create_table('election_tally',
+        sa.Column('election_type', sa.String(length=50), nullable=False),
+        sa.Column('election_id', sa.Integer(), nullable=False),
+        sa.Column('candidate_key', sa.Integer(), nullable=False),
+        sa.Column('votes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('zk_votes', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('election_type', 'election_id', 'candidate_key')
+    )
+
+    op.create_table('government_composition',
+        sa.Column('country_id', sa.Integer(), nullable=False),
+        sa.Column('president_id', sa.Integer(), nullable=True),
+        sa.Column('foreign_affairs_minister_id', sa.Integer(), nullable=True),
+        sa.Column('defence_minister_id', sa.Integer(), nullable=True),
+        sa.Column('finance_minister_id', sa.Integer(), nullable=True),
+        sa.Column('congress_size', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('congress_votes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('congress_term_start', sa.DateTime(), nullable=True),
+        sa.Column('congress_term_end', sa.DateTime(), nullable=True),
+        sa.Column('party_seats', sa.JSON(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('recomputed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['country_id'], ['country.id'], ),
+        sa.ForeignKeyConstraint(['president_id'], ['country_presidents.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['foreign_affairs_minister_id'], ['ministers.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['defence_minister_id'], ['ministers.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['finance_minister_id'], ['ministers.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('country_id')
+    )
+    # Rows are built on first page view and by the nightly recompute job
+    # (or `flask recompute-politics`).
+
+    with op.batch_alter_table('congress_members', schema=None) as batch_op:
+        batch_op.create_index('idx_congress_party_current', ['party_id', 'is_current'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('congress_members', schema=None) as batch_op:
+        batch_op.drop_index('idx_congress_party_current')
+
+    op.drop_table('government_composition')
+    op.drop_table('election_tally')
+    op.drop_table('election_summary')
+    op.drop_table('party_roster')
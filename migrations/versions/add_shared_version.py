@@ -0,0 +1,30 @@
+"""Add shared_version table for cross-process cache invalidation counters
+
+Revision ID: shared_version_001
+Revises: politics_read_model_001
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'shared_version_001'
+down_revision = 'politics_read_model_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('shared_version',
+        sa.Column('name', sa.String(length=40), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    # Counters are created by their first bump
+
+
+def downgrade():
+    op.drop_table('shared_version')
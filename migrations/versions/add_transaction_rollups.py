@@ -0,0 +1,115 @@
+"""Partition financial_transaction by month and add daily rollup and archive tables
+
+Revision ID: transaction_rollups_001
+Revises: chain_outbox_001
+Create Date: 2026-10-18
+
+On MySQL, financial_transaction becomes RANGE partitioned on
+TO_DAYS(timestamp), one partition per month (pYYYYMM) plus pmax. MySQL
+requires every unique key of a partitioned table to include the
+partitioning column and does not support foreign keys on partitioned
+tables, so the primary key becomes (id, timestamp) and the foreign keys
+are dropped; the indexes on the referencing columns are kept. Other
+databases keep a plain table.
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'transaction_rollups_001'
+down_revision = 'chain_outbox_001'
+branch_labels = None
+depends_on = None
+
+# Future months partitioned up front (the nightly job keeps extending this)
+PARTITIONS_AHEAD = 2
+
+FOREIGN_KEYS = [
+    ('fk_financial_transaction_user', 'user', ['user_id']),
+    ('fk_financial_transaction_country', 'country', ['country_id']),
+    ('fk_financial_transaction_resource', 'resource', ['resource_id']),
+    ('fk_financial_transaction_related_user', 'user', ['related_user_id']),
+]
+
+
+def _next_month(month):
+    return date(month.year + (month.month == 12), month.month % 12 + 1, 1)
+
+
+def upgrade():
+    op.create_table('transaction_daily_user',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('transaction_type', sa.String(length=30), nullable=False),
+        sa.Column('currency_type', sa.String(length=10), nullable=False),
+        sa.Column('tx_count', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=24, scale=8), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'user_id', 'transaction_type', 'currency_type')
+    )
+    with op.batch_alter_table('transaction_daily_user', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_transaction_daily_user_user_id'), ['user_id'], unique=False)
+
+    op.create_table('transaction_daily_type',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('transaction_type', sa.String(length=30), nullable=False),
+        sa.Column('currency_type', sa.String(length=10), nullable=False),
+        sa.Column('tx_count', sa.Integer(), nullable=False),
+        sa.Column('user_count', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=24, scale=8), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'transaction_type', 'currency_type')
+    )
+
+    op.create_table('transaction_archive',
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('month')
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+
+    for fk in sa.inspect(bind).get_foreign_keys('financial_transaction'):
+        op.drop_constraint(fk['name'], 'financial_transaction', type_='foreignkey')
+    op.execute('ALTER TABLE financial_transaction DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)')
+
+    first = bind.execute(sa.text('SELECT MIN(timestamp) FROM financial_transaction')).scalar()
+    today = date.today()
+    month = (first.date() if first else today).replace(day=1)
+    last = today.replace(day=1)
+    for _ in range(PARTITIONS_AHEAD):
+        last = _next_month(last)
+
+    partitions = []
+    while month <= last:
+        partitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{_next_month(month):%Y-%m-%d}'))"
+        )
+        month = _next_month(month)
+    partitions.append('PARTITION pmax VALUES LESS THAN MAXVALUE')
+    op.execute(
+        'ALTER TABLE financial_transaction PARTITION BY RANGE (TO_DAYS(timestamp)) '
+        f'({", ".join(partitions)})'
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute('ALTER TABLE financial_transaction REMOVE PARTITIONING')
+        op.execute('ALTER TABLE financial_transaction DROP PRIMARY KEY, ADD PRIMARY KEY (id)')
+        for name, referent, columns in FOREIGN_KEYS:
+            op.create_foreign_key(name, 'financial_transaction', referent, columns, ['id'])
+
+    op.drop_table('transaction_archive')
+    op.drop_table('transaction_daily_type')
+    with op.batch_alter_table('transaction_daily_user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_transaction_daily_user_user_id'))
+    op.drop_table('transaction_daily_user')
@@ -0,0 +1,32 @@
+"""Add indexed username_lower column for prefix username search
+
+Revision ID: username_lower_001
+Revises: country_stats_001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'username_lower_001'
+down_revision = 'country_stats_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('username_lower', sa.String(length=30), nullable=True))
+
+    op.execute("UPDATE user SET username_lower = LOWER(username) WHERE username IS NOT NULL")
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_username_lower'), ['username_lower'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_username_lower'))
+        batch_op.drop_column('username_lower')
@@ -0,0 +1,144 @@
+"""
+Measure master boot time and per-worker spawn time with and without preload.
+
+Usage:
+    python scripts/benchmark_app_startup.py [--workers 8]
+
+Mimics what Gunicorn does on start and on every max_requests recycle,
+against a file-backed SQLite database and a temporary log directory:
+
+- Before (no preload_app): the master only forks; each worker imports the
+  app, runs create_app() (scheduler and startup checks included) and then
+  pays on its first requests for templates, country geodata and reference
+  data.
+- After (preload_app): the master runs create_app() once with PRELOAD_APP,
+  then each forked worker only runs app.lifecycle.after_fork() before the
+  same first-use work, which is now already loaded.
+
+A worker counts as spawned when that first-use work is done. Workers are
+forked one after another, as when they are recycled.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# The app is imported only after the "before" run: its workers must import it
+# themselves, as they do when the master has not preloaded it.
+
+
+def _config(workdir, preload):
+    from config import TestingConfig
+
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+        LOG_DIR = os.path.join(workdir, 'logs')
+        LOG_PIPELINE_ENABLED = True
+        SQL_PROFILER_ENABLED = False
+        PRELOAD_APP = preload
+
+    return BenchmarkConfig
+
+
+def _first_use(app):
+    """What a worker's first requests load: templates, country borders, reference tables."""
+    from app.services.country_geodata import country_geodata
+    from app.services.reference_data import reference_data
+
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    country_geodata.load()
+    with app.app_context():
+        reference_data.snapshot()
+
+
+def _spawn(ready):
+    """Fork a worker running ready(); returns seconds from fork until it is done."""
+    read_fd, write_fd = os.pipe()
+    start = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        code = 0
+        try:
+            ready()
+            os.write(write_fd, f'{time.monotonic() - start}'.encode())
+        except BaseException as e:
+            os.write(write_fd, f'error {e!r}'.encode())
+            code = 1
+        finally:
+            os._exit(code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = pipe.read()
+    os.waitpid(pid, 0)
+    if result.startswith('error'):
+        raise RuntimeError(f"Worker failed: {result}")
+    return float(result)
+
+
+def _report(label, master_seconds, spawns):
+    print(f"\n{label}:")
+    print(f"  master boot:  {master_seconds * 1000:8.1f} ms")
+    print(f"  worker spawn: mean {statistics.mean(spawns) * 1000:8.1f} ms, "
+          f"max {max(spawns) * 1000:8.1f} ms ({len(spawns)} workers)")
+
+
+def _create_schema(workdir):
+    def create():
+        from app import create_app
+        from app.extensions import db
+
+        app = create_app(_config(workdir, preload=False))
+        with app.app_context():
+            db.create_all()
+    _spawn(create)
+
+
+def run_without_preload(workdir, workers):
+    def worker():
+        from app import create_app
+        _first_use(create_app(_config(workdir, preload=False)))
+
+    spawns = [_spawn(worker) for _ in range(workers)]
+    _report('before: no preload, every worker runs create_app()', 0.0, spawns)
+
+
+def run_with_preload(workdir, workers):
+    start = time.perf_counter()
+    from app import create_app
+    app = create_app(_config(workdir, preload=True))
+    master_seconds = time.perf_counter() - start
+
+    from app.lifecycle import before_fork, after_fork
+
+    def worker():
+        after_fork(app)
+        _first_use(app)
+
+    spawns = []
+    for _ in range(workers):
+        before_fork()
+        spawns.append(_spawn(worker))
+    _report('after: preload_app, workers fork from the loaded master', master_seconds, spawns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        _create_schema(workdir)
+        run_without_preload(workdir, args.workers)
+        run_with_preload(workdir, args.workers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Load-test ZEN balance lookups against a local fake JSON-RPC node: the old
+wallet_routes pattern (new Web3 per request + is_connected() + balanceOf)
+vs the pooled client with the balance cache.
+
+Usage:
+    python scripts/benchmark_balance_cache.py [--requests 1000] [--addresses 50]
+                                              [--threads 16] [--duration 60]
+
+Requests are spread over --duration seconds of simulated time (the cache's
+clock is simulated, so the run itself takes a few seconds), issued in waves
+of --threads concurrent requests for random addresses. Reports upstream
+RPC calls and TCP connections per 1,000 balance requests.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from web3 import Web3
+
+from app.blockchain.balance_cache import BalanceCache, ERC20_BALANCE_ABI
+from app.blockchain import balance_cache as balance_cache_module
+from app.blockchain.web3_config import get_web3
+
+TOKEN = '0x' + '5a' * 20
+RPC_LATENCY = 0.005  # Seconds; a nearby node
+
+
+class FakeNode:
+    """JSON-RPC server answering every balanceOf with a fixed amount; counts calls and connections."""
+
+    def __init__(self):
+        self.calls = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive
+
+            def setup(self):
+                super().setup()
+                with node._lock:
+                    node.connections += 1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with node._lock:
+                    node.calls += 1
+                time.sleep(RPC_LATENCY)
+                method = body.get('method')
+                if method == 'eth_call':
+                    result = '0x' + format(10 ** 18, '064x')
+                elif method == 'web3_clientVersion':
+                    result = 'FakeNode/v1'
+                else:
+                    result = '0x1'
+                payload = json.dumps({'jsonrpc': '2.0', 'id': body.get('id'), 'result': result}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reset(self):
+        self.calls = 0
+        self.connections = 0
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def old_pattern(url, address):
+    """What get_zen_balance used to do on every request."""
+    web3 = Web3(Web3.HTTPProvider(url))
+    if not web3.is_connected():
+        raise ConnectionError(url)
+    contract = web3.eth.contract(address=Web3.to_checksum_address(TOKEN), abi=ERC20_BALANCE_ABI)
+    return contract.functions.balanceOf(Web3.to_checksum_address(address)).call()
+
+
+def run(label, node, fn, args, addresses, clock):
+    rnd = random.Random(7)
+    node.reset()
+    waves = [
+        [rnd.choice(addresses) for _ in range(args.threads)]
+        for _ in range(args.requests // args.threads)
+    ]
+    total = sum(len(w) for w in waves)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        for i, wave in enumerate(waves):
+            clock[0] = i * args.duration / len(waves)
+            list(pool.map(fn, wave))
+    elapsed = time.perf_counter() - start
+    scale = 1000 / total
+    print(f"{label:<28} {total} requests in {elapsed:6.2f}s  "
+          f"{node.calls * scale:7.1f} RPC calls / 1k  {node.connections * scale:7.1f} connections / 1k")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--addresses', type=int, default=50)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=60.0, help='Simulated seconds the requests span')
+    args = parser.parse_args()
+
+    node = FakeNode()
+    addresses = ['0x' + format(i + 1, '040x') for i in range(args.addresses)]
+    clock = [0.0]
+
+    try:
+        run('per-request Web3', node, lambda a: old_pattern(node.url, a), args, addresses, clock)
+
+        client = get_web3(node.url)
+        balance_cache_module.balance_cache = cache = BalanceCache(clock=lambda: clock[0])
+        run('pooled + balance cache', node,
+            lambda a: balance_cache_module.get_token_balance_wei(TOKEN, a, w3=client),
+            args, addresses, clock)
+        print(f"cache: {cache.stats['hits']} hits, {cache.stats['coalesced']} coalesced, "
+              f"{cache.stats['upstream']} upstream (TTL {cache.ttl}s)")
+    finally:
+        node.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+Measure the cost of conquering a large country: the old per-row conquest
+(one alert commit per worker, owner and citizen, ORM deletes and updates per
+row) vs the set-based ConquestService.
+
+Usage:
+    python scripts/benchmark_conquest.py [--employees 10000] [--companies 500] [--skip-per-row]
+
+Each variant conquers the same synthetic country (--companies companies
+sharing --employees workers, one job offer and one work session per
+worker) in its own file-backed SQLite database. Reports statements,
+commits and wall time. The per-row variant commits once per alert and
+takes tens of minutes at 10,000 workers; --skip-per-row runs only the
+set-based one.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import event, insert, select
+
+from app import create_app
+from app.extensions import db
+from app.models import User, Country, Company, CompanyType, Employment, JobOffer, WorkSession
+from app.models.messaging import AlertType
+from app.alert_helpers import create_alert
+from app.services.conquest_service import ConquestService
+from config import TestingConfig
+
+
+def _make_app(workdir, label):
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, f'bench_{label}.db')
+        SQL_PROFILER_ENABLED = False
+        SCHEDULER_ENABLED = False
+
+    return create_app(BenchmarkConfig)
+
+
+def build_world(employees, companies):
+    """Conqueror plus a country with `companies` companies sharing `employees` workers."""
+    conqueror = Country(name='Conqueria', currency_code='CNQ')
+    country = Country(name='Largia', currency_code='LRG')
+    db.session.add_all([conqueror, country])
+    db.session.flush()
+
+    db.session.execute(insert(User), [
+        {'wallet_address': f'0x{i:040x}', 'username': f'citizen{i}', 'citizenship_id': country.id}
+        for i in range(companies + employees)
+    ])
+    user_ids = db.session.scalars(select(User.id).order_by(User.id)).all()
+    owner_ids, worker_ids = user_ids[:companies], user_ids[companies:]
+
+    db.session.execute(insert(Company), [
+        {'name': f'Works {i}', 'company_type': CompanyType.MINING, 'owner_id': owner_id, 'country_id': country.id}
+        for i, owner_id in enumerate(owner_ids)
+    ])
+    company_ids = db.session.scalars(select(Company.id).order_by(Company.id)).all()
+    db.session.execute(insert(JobOffer), [
+        {'company_id': company_id, 'wage_per_pp': Decimal('1.5')} for company_id in company_ids
+    ])
+    db.session.execute(insert(Employment), [
+        {'company_id': company_ids[i % companies], 'user_id': user_id, 'wage_per_pp': Decimal('1.5')}
+        for i, user_id in enumerate(worker_ids)
+    ])
+    db.session.execute(insert(WorkSession), [
+        {'user_id': user_id, 'company_id': company_id, 'employment_id': employment_id, 'hours_worked': 4,
+         'skill_level': 1.0, 'production_points': 4.0, 'wage_per_pp': Decimal('1.5'),
+         'total_payment': Decimal('6'), 'energy_spent': 10, 'wellness_spent': 10, 'work_date': date.today()}
+        for employment_id, company_id, user_id in db.session.execute(
+            select(Employment.id, Employment.company_id, Employment.user_id)
+        )
+    ])
+    db.session.commit()
+    return country.id, conqueror.id
+
+
+def old_conquest(country_id, conqueror_id):
+    """The size-dependent part of the old conquer_country: per-row firing, freezing and alerts."""
+    country = db.session.get(Country, country_id)
+    conqueror = db.session.get(Country, conqueror_id)
+    country.is_conquered = True
+    country.conquered_by_id = conqueror_id
+    country.conquered_at = datetime.utcnow()
+
+    for company in Company.query.filter_by(country_id=country_id, is_deleted=False).all():
+        for employment in company.employees.all():
+            create_alert(
+                user_id=employment.user_id,
+                alert_type=AlertType.EMPLOYMENT,
+                title="Employment Terminated - Country Conquered",
+                content=f"Your employment at {company.name} has been terminated because {company.country.name} was conquered."
+            )
+            db.session.delete(employment)
+        for job_offer in company.job_offers.filter_by(is_active=True).all():
+            job_offer.is_active = False
+        company.freeze()
+        create_alert(
+            user_id=company.owner_id,
+            alert_type=AlertType.COMPANY,
+            title="Company Frozen - Country Conquered",
+            content=f"Your company {company.name} has been frozen because {company.country.name} was conquered. Operations will resume upon liberation."
+        )
+
+    for citizen in country.citizens.all():
+        create_alert(
+            user_id=citizen.id,
+            alert_type=AlertType.GOVERNMENT,
+            title="Your Country Has Been Conquered",
+            content=f"{country.name} has been fully conquered by {conqueror.name}. Your political rights are suspended until liberation."
+        )
+    db.session.commit()
+
+
+def run(label, fn, args, workdir):
+    app = _make_app(workdir, label.split()[0])
+    with app.app_context():
+        db.create_all()
+        country_id, conqueror_id = build_world(args.employees, args.companies)
+        db.session.remove()
+
+        counts = {'statements': 0, 'commits': 0}
+
+        def on_statement(*_):
+            counts['statements'] += 1
+
+        def on_commit(*_):
+            counts['commits'] += 1
+
+        event.listen(db.engine, 'before_cursor_execute', on_statement)
+        event.listen(db.engine, 'commit', on_commit)
+        start = time.perf_counter()
+        try:
+            fn(country_id, conqueror_id)
+        finally:
+            elapsed = time.perf_counter() - start
+            event.remove(db.engine, 'before_cursor_execute', on_statement)
+            event.remove(db.engine, 'commit', on_commit)
+        db.session.remove()
+        db.engine.dispose()
+
+    print(f"{label:<12} {args.employees} workers / {args.companies} companies: "
+          f"{counts['statements']:7d} statements  {counts['commits']:6d} commits  {elapsed:8.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--employees', type=int, default=10000)
+    parser.add_argument('--companies', type=int, default=500)
+    parser.add_argument('--skip-per-row', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if not args.skip_per_row:
+            run('per-row', old_conquest, args, workdir)
+        run('set-based', lambda country_id, conqueror_id: ConquestService.conquer_country(
+            country_id, conqueror_id, None), args, workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Measure trade-path and security-event latency with the log pipeline on and off.
+
+Usage:
+    python scripts/benchmark_log_pipeline.py [--trades 2000] [--events 500]
+
+Each trade is what a market buy does for logging: two log_transaction()
+calls (buyer and seller: FinancialTransaction row + transactions.log line)
+and a commit. Each security event is one log_security_event() call, as on a
+failed API authentication. Both run against a file-backed SQLite database
+and a temporary log directory, first with synchronous logging, then with
+the queued pipeline. Reports per-operation latency and pipeline stats.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app
+from app.extensions import db
+from app.logging_config import get_log_pipeline
+from app.models import User, log_transaction, log_security_event, SecurityEventType, SecurityLogSeverity
+from config import TestingConfig
+
+
+def _make_app(workdir, pipeline):
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, f'bench_{int(pipeline)}.db')
+        LOG_DIR = os.path.join(workdir, f'logs_{int(pipeline)}')
+        LOG_PIPELINE_ENABLED = pipeline
+        SQL_PROFILER_ENABLED = False
+
+    return create_app(BenchmarkConfig)
+
+
+def _summary(samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    return f"mean {statistics.mean(samples) * 1000:.3f} ms, p50 {samples[len(samples) // 2] * 1000:.3f} ms, p95 {p95 * 1000:.3f} ms"
+
+
+def run(pipeline, trades, events, workdir):
+    app = _make_app(workdir, pipeline)
+    with app.test_request_context():
+        db.create_all()
+        buyer = User(wallet_address='0x' + '1' * 40, username='buyer')
+        seller = User(wallet_address='0x' + '2' * 40, username='seller')
+        db.session.add_all([buyer, seller])
+        db.session.commit()
+
+        trade_times = []
+        for i in range(trades):
+            start = time.perf_counter()
+            log_transaction(buyer, 'market_buy', -10, 'local', 1000 - i, country_id=1, resource_id=1,
+                            description=f'Bought 1 bread #{i}')
+            log_transaction(seller, 'market_sell', 10, 'local', 1000 + i, country_id=1, resource_id=1,
+                            description=f'Sold 1 bread #{i}')
+            db.session.commit()
+            trade_times.append(time.perf_counter() - start)
+
+        event_times = []
+        for i in range(events):
+            start = time.perf_counter()
+            log_security_event(
+                event_type=SecurityEventType.UNAUTHORIZED_ACCESS,
+                message=f"API authentication failed: invalid token #{i}",
+                severity=SecurityLogSeverity.WARNING,
+                ip_address='203.0.113.7',
+                endpoint='/api/v1/market',
+                http_method='GET'
+            )
+            event_times.append(time.perf_counter() - start)
+
+        log_pipeline = get_log_pipeline()
+        if log_pipeline is not None:
+            start = time.perf_counter()
+            log_pipeline.stop()
+            drain = time.perf_counter() - start
+            stats = log_pipeline.stats()
+        db.session.remove()
+
+    label = 'pipeline' if pipeline else 'synchronous'
+    print(f"\n{label}:")
+    print(f"  trade path ({trades} trades):        {_summary(trade_times)}")
+    print(f"  security event ({events} events):    {_summary(event_times)}")
+    if pipeline:
+        print(f"  drained remaining queue in {drain * 1000:.1f} ms; written {stats['written']}, dropped {stats['dropped'] or 0}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--trades', type=int, default=2000)
+    parser.add_argument('--events', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        run(False, args.trades, args.events, workdir)
+        run(True, args.trades, args.events, workdir)
+
+
+if __name__ == '__main__':
+    main()
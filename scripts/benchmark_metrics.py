@@ -0,0 +1,147 @@
+"""
+Measure what recording metrics adds to a request, a cache lookup and a
+connection checkout, and fail if the request hooks exceed a budget.
+
+Usage:
+    python scripts/benchmark_metrics.py [--iterations 100000] [--requests 2000] [--budget-us 5]
+
+Times the two request hooks (start_request_timer and record_request)
+inside a request context, the counted cache get against the backend's
+own, and a checkout from the timed pool against a plain QueuePool. Then
+serves --requests test-client requests to a static endpoint with metrics
+on and off for the end-to-end difference, which is dominated by noise at
+this scale. Exits with status 1 if the hooks cost more than --budget-us
+microseconds per request.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Response
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app import create_app
+from app import metrics as metrics_module
+from app.extensions import cache, db
+from config import TestingConfig
+
+
+def _make_app(workdir, enabled):
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'bench_metrics.db')
+        LOG_DIR = os.path.join(workdir, 'logs')
+        SQL_PROFILER_ENABLED = False
+        SCHEDULER_ENABLED = False
+        METRICS_ENABLED = enabled
+        METRICS_MULTIPROC_DIR = None
+
+    return create_app(BenchmarkConfig)
+
+
+def per_call_us(fn, iterations):
+    """Best of three runs of fn() `iterations` times, in microseconds per call."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / iterations * 1e6
+
+
+def bench_hooks(app, iterations):
+    response = Response('ok')
+    with app.test_request_context('/static/css/style.css'):
+        def hooks():
+            metrics_module.start_request_timer()
+            metrics_module.record_request(response)
+
+        return per_call_us(hooks, iterations), per_call_us(lambda: None, iterations)
+
+
+def bench_cache(app, iterations):
+    backend = app.extensions['cache'][cache]
+    with app.app_context():
+        cache.set('country_online_1', 5)
+    counted = per_call_us(lambda: backend.get('country_online_1'), iterations)
+    uncounted = per_call_us(lambda: type(backend).get(backend, 'country_online_1'), iterations)
+    return counted, uncounted
+
+
+def bench_pool(workdir, iterations):
+    results = []
+    for timed in (False, True):
+        engine = create_engine('sqlite:///' + os.path.join(workdir, 'bench_pool.db'), poolclass=QueuePool)
+        if timed:
+            # As init_metrics() does: the pool keeps QueuePool's logger
+            engine.pool.__class__ = metrics_module.TimedQueuePool
+
+        def checkout():
+            engine.pool.connect().close()
+
+        results.append(per_call_us(checkout, iterations))
+        engine.dispose()
+    return results
+
+
+def bench_requests(workdir, requests):
+    results = {}
+    for enabled in (False, True):
+        app = _make_app(workdir, enabled)
+        with app.app_context():
+            db.create_all()
+        client = app.test_client()
+        client.get('/static/css/style.css')
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(requests):
+                client.get('/static/css/style.css')
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[enabled] = best / requests * 1e6
+        with app.app_context():
+            db.engine.dispose()
+    return results[False], results[True]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--iterations', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--budget-us', type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = _make_app(workdir, True)
+        # The testing config logs every pool checkout at DEBUG
+        logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
+        hooks, empty = bench_hooks(app, args.iterations)
+        counted, uncounted = bench_cache(app, args.iterations)
+        with app.app_context():
+            db.engine.dispose()
+        plain_pool, timed_pool = bench_pool(workdir, args.iterations // 10)
+        off, on = bench_requests(workdir, args.requests)
+        metrics_module.registry.reset()
+
+    hooks_cost = hooks - empty
+    print(f"request hooks      {hooks_cost:8.2f} us per request (budget {args.budget_us:g} us)")
+    print(f"cache get          {counted:8.2f} us counted  {uncounted:8.2f} us uncounted  (+{counted - uncounted:.2f} us)")
+    print(f"pool checkout      {timed_pool:8.2f} us timed    {plain_pool:8.2f} us plain      (+{timed_pool - plain_pool:.2f} us)")
+    print(f"static request     {on:8.2f} us metrics on  {off:8.2f} us off  (+{on - off:.2f} us)")
+
+    if hooks_cost > args.budget_us:
+        print(f"FAIL: recording a request costs {hooks_cost:.2f} us, over the {args.budget_us:g} us budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark username autocomplete on synthetic usernames: ilike-style scan vs
+indexed username_lower range vs the in-memory prefix index.
+
+Usage:
+    python scripts/benchmark_username_index.py [--users 1000000] [--queries 2000]
+
+Runs against an in-memory SQLite copy of the data, so no game database is
+needed.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.username_index import UsernameIndex
+
+
+SYLLABLES = ['ka', 'ro', 'mi', 'zen', 'tac', 'vor', 'li', 'an', 'dre', 'sol', 'ix', 'mar', 'ul', 'be', 'no']
+
+
+def synthetic_usernames(count, seed=1):
+    rnd = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        name = ''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4)))
+        if rnd.random() < 0.5:
+            name += str(rnd.randrange(10000))
+        if rnd.random() < 0.3:
+            name = name.capitalize()
+        names.add(name[:30])
+    return list(names)
+
+
+def run(label, search, prefixes):
+    start = time.perf_counter()
+    hits = 0
+    for prefix in prefixes:
+        hits += len(search(prefix))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(prefixes)} queries in {elapsed:8.3f}s  "
+          f"{elapsed / len(prefixes) * 1e6:10.1f} us/query  ({hits} results)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--skip-scan', action='store_true', help="Skip the (slow) ilike full-scan baseline")
+    args = parser.parse_args()
+
+    print(f"Generating {args.users} usernames...")
+    usernames = synthetic_usernames(args.users)
+    rows = list(enumerate(usernames, start=1))
+
+    rnd = random.Random(2)
+    prefixes = []
+    for _ in range(args.queries):
+        name = rnd.choice(usernames)
+        prefixes.append(name[:rnd.randint(2, 5)] if rnd.random() < 0.9
+                        else ''.join(rnd.choice(string.ascii_lowercase) for _ in range(3)))
+
+    start = time.perf_counter()
+    index = UsernameIndex()
+    index.load(rows)
+    print(f"In-memory index built in {time.perf_counter() - start:.2f}s ({len(index)} entries)\n")
+
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE user (id INTEGER PRIMARY KEY, username TEXT, username_lower TEXT)")
+    conn.executemany("INSERT INTO user VALUES (?, ?, ?)", ((i, u, u.lower()) for i, u in rows))
+    conn.execute("CREATE INDEX ix_user_username_lower ON user (username_lower)")
+    conn.commit()
+
+    def ilike_scan(prefix):
+        return conn.execute(
+            "SELECT id FROM user WHERE lower(username) LIKE lower(?) || '%' ORDER BY username LIMIT 10",
+            (prefix,)
+        ).fetchall()
+
+    def indexed_range(prefix):
+        key = prefix.lower()
+        return conn.execute(
+            "SELECT id FROM user WHERE username_lower >= ? AND username_lower < ? "
+            "ORDER BY username_lower, id LIMIT 10",
+            (key, key + '\uffff')
+        ).fetchall()
+
+    def in_memory(prefix):
+        return index.prefix_ids(prefix, limit=10)
+
+    if not args.skip_scan:
+        run("ilike scan (before)", ilike_scan, prefixes[:max(1, len(prefixes) // 20)])
+    run("username_lower index", indexed_range, prefixes)
+    run("in-memory prefix index", in_memory, prefixes)
+
+    # Sanity check: both indexed paths return the same users
+    for prefix in prefixes[:200]:
+        assert [r[0] for r in indexed_range(prefix)] == in_memory(prefix), prefix
+
+
+if __name__ == '__main__':
+    main()
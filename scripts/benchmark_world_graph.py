@@ -0,0 +1,130 @@
+"""
+Benchmark region topology queries on a synthetic map: per-neighbour SQL (the
+old BattleService.get_attackable_regions pattern) vs the in-memory WorldGraph.
+
+Usage:
+    python scripts/benchmark_world_graph.py [--regions 5000] [--countries 100] [--queries 1000]
+
+Uses an in-memory SQLite copy of region / region_neighbors / country_regions,
+so no game database is needed.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.world_graph import WorldGraph
+
+
+def synthetic_map(n_regions, n_countries, seed=1):
+    """Grid map with some diagonal borders; countries own contiguous-ish blocks."""
+    rnd = random.Random(seed)
+    width = int(n_regions ** 0.5)
+    regions = [(i + 1, f'Region {i + 1}') for i in range(n_regions)]
+    edges = []
+    for i in range(n_regions):
+        x, y = i % width, i // width
+        if x + 1 < width and i + 1 < n_regions:
+            edges.append((i + 1, i + 2))
+        if i + width < n_regions:
+            edges.append((i + 1, i + width + 1))
+        if x + 1 < width and i + width + 1 < n_regions and rnd.random() < 0.2:
+            edges.append((i + 1, i + width + 2))
+
+    seeds = rnd.sample(range(n_regions), n_countries)
+    ownership = []
+    for i in range(n_regions):
+        x, y = i % width, i // width
+        nearest = min(range(n_countries),
+                      key=lambda c: (seeds[c] % width - x) ** 2 + (seeds[c] // width - y) ** 2)
+        ownership.append((i + 1, nearest + 1))
+    return regions, edges, ownership
+
+
+def run(label, fn, cases):
+    start = time.perf_counter()
+    total = 0
+    for case in cases:
+        total += len(fn(*case))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {len(cases)} queries in {elapsed:8.3f}s  "
+          f"{elapsed / len(cases) * 1e6:10.1f} us/query  ({total} results)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--regions', type=int, default=5000)
+    parser.add_argument('--countries', type=int, default=100)
+    parser.add_argument('--queries', type=int, default=1000)
+    args = parser.parse_args()
+
+    regions, edges, ownership = synthetic_map(args.regions, args.countries)
+
+    conn = sqlite3.connect(':memory:')
+    conn.executescript("""
+        CREATE TABLE region (id INTEGER PRIMARY KEY, name TEXT, is_deleted INTEGER DEFAULT 0);
+        CREATE TABLE region_neighbors (region_id INTEGER, neighbor_id INTEGER, PRIMARY KEY (region_id, neighbor_id));
+        CREATE TABLE country_regions (country_id INTEGER, region_id INTEGER, PRIMARY KEY (country_id, region_id));
+        CREATE INDEX ix_rn_neighbor ON region_neighbors (neighbor_id);
+        CREATE INDEX ix_cr_region ON country_regions (region_id);
+    """)
+    conn.executemany("INSERT INTO region (id, name) VALUES (?, ?)", regions)
+    conn.executemany("INSERT INTO region_neighbors VALUES (?, ?)", edges)
+    conn.executemany("INSERT INTO country_regions VALUES (?, ?)", ((c, r) for r, c in ownership))
+    conn.commit()
+
+    start = time.perf_counter()
+    graph = WorldGraph()
+    graph.load(
+        conn.execute("SELECT id, name FROM region WHERE is_deleted = 0").fetchall(),
+        conn.execute("SELECT region_id, neighbor_id FROM region_neighbors").fetchall(),
+        conn.execute("SELECT region_id, country_id FROM country_regions").fetchall(),
+    )
+    print(f"{len(regions)} regions, {len(edges)} borders, {args.countries} countries; "
+          f"graph built in {(time.perf_counter() - start) * 1000:.1f}ms\n")
+
+    # Pairs of neighbouring countries (the ones that can actually be at war)
+    owner = dict(ownership)
+    neighbouring = sorted({(owner[a], owner[b]) for a, b in edges if owner[a] != owner[b]})
+    rnd = random.Random(2)
+    war_cases = [rnd.choice(neighbouring) for _ in range(args.queries)]
+
+    def attackable_sql(attacker_id, defender_id):
+        """One query per defender region and direction, like the original loop."""
+        attacker = {r for (r,) in conn.execute(
+            "SELECT region_id FROM country_regions WHERE country_id = ?", (attacker_id,))}
+        result = []
+        for (region_id,) in conn.execute(
+                "SELECT region_id FROM country_regions WHERE country_id = ?", (defender_id,)).fetchall():
+            forward = conn.execute(
+                "SELECT neighbor_id FROM region_neighbors WHERE region_id = ?", (region_id,)).fetchall()
+            if any(n in attacker for (n,) in forward):
+                result.append(region_id)
+                continue
+            backward = conn.execute(
+                "SELECT region_id FROM region_neighbors WHERE neighbor_id = ?", (region_id,)).fetchall()
+            if any(n in attacker for (n,) in backward):
+                result.append(region_id)
+        return result
+
+    run("attackable regions (per-neighbour SQL)", attackable_sql, war_cases)
+    run("attackable regions (WorldGraph)", graph.attackable_regions, war_cases)
+
+    for a, d in war_cases[:50]:
+        assert sorted(attackable_sql(a, d)) == sorted(graph.attackable_regions(a, d))
+
+    region_cases = [(rnd.randint(1, args.regions),) for _ in range(args.queries)]
+    run("neighbours of region (WorldGraph)", lambda r: list(graph.neighbors_of(r)), region_cases)
+    run("border regions (WorldGraph)", graph.border_regions, [(a,) for a, _ in war_cases])
+    run("connected territory (WorldGraph)", graph.connected_territory, region_cases)
+    path_cases = [(rnd.randint(1, args.regions), rnd.randint(1, args.regions)) for _ in range(args.queries // 10)]
+    run("shortest path, any route (WorldGraph)", lambda a, b: graph.shortest_path(a, b) or [], path_cases)
+
+
+if __name__ == '__main__':
+    main()
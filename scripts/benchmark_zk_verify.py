@@ -0,0 +1,73 @@
+"""
+Benchmark local Groth16 verification: fresh Node process per proof vs the
+persistent worker pool.
+
+Usage:
+    python scripts/benchmark_zk_verify.py proof.json public.json [--proofs 50] [--concurrency 4]
+
+proof.json / public.json are the files snarkjs writes for an anonymous_vote
+proof (e.g. `snarkjs groth16 fullprove ...`).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.zkverify_service import ZKVerifyService
+
+
+def run(label, verify, proofs, concurrency):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: verify(), range(proofs)))
+    elapsed = time.perf_counter() - start
+
+    valid = sum(1 for r in results if r)
+    print(f"{label:<22} {proofs} proofs in {elapsed:7.2f}s  "
+          f"{proofs / elapsed:8.2f} proofs/s  ({valid}/{proofs} valid)")
+    return proofs / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('proof')
+    parser.add_argument('public')
+    parser.add_argument('--proofs', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    with open(args.proof) as f:
+        proof = json.load(f)
+    with open(args.public) as f:
+        public_signals = json.load(f)
+
+    service = ZKVerifyService()
+    service.pool_size = args.concurrency
+    vk = service._load_default_vk()
+    if vk is None:
+        sys.exit('Verification key not found. Compile circuits first.')
+
+    cold = run(
+        'subprocess per proof',
+        lambda: service._verify_proof_local_subprocess(proof, public_signals, vk),
+        args.proofs, args.concurrency,
+    )
+
+    service.pool.warm_up()
+    pooled = run(
+        f'worker pool (size {args.concurrency})',
+        lambda: service.verify_proof_local(proof, public_signals),
+        args.proofs, args.concurrency,
+    )
+
+    print(f"\nSpeedup: {pooled / cold:.1f}x (worker restarts: {service.pool.restarts})")
+    service.pool.close()
+
+
+if __name__ == '__main__':
+    main()
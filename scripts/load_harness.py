@@ -0,0 +1,726 @@
+"""
+Synthetic load test: seed a world of players and drive the real app with a
+weighted mix of what players do all day.
+
+Usage:
+    python scripts/load_harness.py [--players 500] [--countries 2] [--requests 5000] [--threads 8]
+                                [--duration SECONDS] [--weights work=20,fight=20,...] [--seed 1]
+                                [--database URI] [--url http://127.0.0.1:8000]
+                                [--output load_test_baseline.json] [--compare OLD.json] [--tolerance 0.25]
+    python scripts/load_harness.py --database URI --seed-only
+
+Seeds --players synthetic players spread over --countries countries, each
+with a company job, money on their local market, a party with an active
+election, a newspaper and, with two countries or more, an active war with a
+battle both sides can fight in. Seeding runs bootstrap_world() and bulk
+inserts, and is skipped when the database already holds the players.
+
+Every thread then plays its own share of the players. Each step picks a
+behaviour by weight and replays the requests a browser would send for it:
+
+    work       company list, then one hour of work
+    train      training page, then one hour of training
+    trade      marketplace, buy preview, confirmed buy
+    fight      battle page, then one fight
+    read_news  newspaper, then one of its articles
+    message    inbox, then a message to another player
+    vote       party page, then a vote in its election
+
+Requests go through the Flask test client by default, in this process and
+against --database (a fresh SQLite file unless given). With --url they go
+over HTTP to a running server, which must use the same database and
+SECRET_KEY so the forged session cookies are accepted. From the repository
+root, so gunicorn.conf.py (preload, workers) applies:
+
+    LOAD_TEST_DATABASE_URI=mysql+pymysql://... gunicorn --bind 127.0.0.1:8000 --pid /tmp/load_test.pid \
+        --error-logfile - --access-logfile /dev/null --chdir scripts 'load_harness:create_server_app()'
+
+Its workers run as www-data, which must be able to write a SQLite database.
+
+Reports p50/p95/p99 latency, SQL queries per request (the X-SQL-Queries
+header) and status counts per endpoint, plus overall throughput, and writes
+them to --output as JSON. --compare diffs the run against an older baseline
+and exits non-zero when an endpoint got slower than --tolerance allows, runs
+more queries, or started failing. Rate limiting is off and the scheduler does
+not run, so a baseline measures request handling only; compare runs with the
+same size, seed and database backend.
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import event, func, insert, select, update
+
+from app import create_app
+from app.extensions import db
+from config import TestingConfig
+
+
+PLAYER_PREFIX = 'loadtest'
+PLAYERS_PER_COMPANY = 20
+ARTICLES_PER_NEWSPAPER = 10
+CANDIDATES_PER_ELECTION = 3
+MARKET_RESOURCES = ('bread', 'wheat', 'iron', 'coal')
+USER_AGENT = 'tactizen-load-test/1.0'
+REMOTE_ADDR = '127.0.0.1'
+
+DEFAULT_WEIGHTS = {
+    'work': 20,
+    'train': 15,
+    'trade': 20,
+    'fight': 20,
+    'read_news': 15,
+    'message': 5,
+    'vote': 5,
+}
+
+
+# ==================== App ====================
+
+def make_config(database_uri, log_dir):
+    """Testing config against `database_uri`, shaped like production request handling."""
+    engine_options = dict(TestingConfig.SQLALCHEMY_ENGINE_OPTIONS)
+    if database_uri.startswith('sqlite'):
+        # Writers queue on the database lock instead of failing at once
+        engine_options['connect_args'] = {'timeout': 30}
+
+    class LoadTestConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = database_uri
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options
+        LOG_DIR = log_dir
+        # Debug mode skips the session fingerprint check; production does not
+        DEBUG = False
+        SCHEDULER_ENABLED = False
+        # Keep the X-SQL-Queries header, but report budget overruns instead of failing
+        SQL_QUERY_BUDGET_ENFORCE = False
+
+    return LoadTestConfig
+
+
+def create_load_test_app(database_uri, log_dir=None):
+    """App for seeding and driving the load test, with SQLite given MySQL's char_length()."""
+    app = create_app(make_config(database_uri, log_dir or tempfile.mkdtemp(prefix='load_test_logs_')))
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            @event.listens_for(db.engine, 'connect')
+            def _register_char_length(dbapi_connection, connection_record):
+                dbapi_connection.create_function('char_length', 1, lambda s: len(s) if s is not None else None)
+
+            # Connections opened by create_app() predate the listener
+            db.engine.dispose()
+    return app
+
+
+def create_server_app():
+    """Gunicorn entry point serving the load-test database (LOAD_TEST_DATABASE_URI)."""
+    return create_load_test_app(os.environ['LOAD_TEST_DATABASE_URI'], os.environ.get('LOAD_TEST_LOG_DIR'))
+
+
+# ==================== Seeding ====================
+
+def _player_filter():
+    from app.models import User
+    return User.username.like(f'{PLAYER_PREFIX}%')
+
+
+def seed_world(players, countries):
+    """
+    Seed the synthetic population, or leave an already seeded one alone.
+
+    Returns True when players were inserted.
+    """
+    from app.bootstrap import bootstrap_world
+    from app.models import (
+        User, Country, Resource, UserCurrency, Company, CompanyType, JobOffer, Employment,
+        PoliticalParty, PartyMembership, PartyElection, PartyCandidate, ElectionStatus,
+        Newspaper, Article, War, Battle, BattleRound, BattleStatus, RoundStatus,
+    )
+    from app.models.location import country_regions
+
+    db.create_all()
+    if db.session.scalar(select(func.count(User.id)).where(_player_filter())):
+        return False
+
+    bootstrap_world(history=False)
+    now = datetime.utcnow()
+
+    # The first countries that own a region, each with the region its players live in
+    owned = db.session.execute(
+        select(country_regions.c.country_id, func.min(country_regions.c.region_id))
+        .group_by(country_regions.c.country_id)
+        .order_by(country_regions.c.country_id)
+        .limit(countries)
+    ).all()
+    if len(owned) < countries:
+        raise SystemExit(f"Only {len(owned)} countries own a region; asked for {countries}")
+    region_of = dict(owned)
+    country_ids = [country_id for country_id, _ in owned]
+
+    # Players, in one contiguous block per country
+    db.session.execute(insert(User), [
+        {'wallet_address': f'0x{0xfeed << 128 | i:040x}', 'username': f'{PLAYER_PREFIX}{i}',
+         'username_lower': f'{PLAYER_PREFIX}{i}', 'citizenship_id': country_ids[i * countries // players],
+         'current_region_id': region_of[country_ids[i * countries // players]]}
+        for i in range(players)
+    ])
+    by_country = {country_id: [] for country_id in country_ids}
+    for user_id, country_id in db.session.execute(
+        select(User.id, User.citizenship_id).where(_player_filter()).order_by(User.id)
+    ):
+        by_country[country_id].append(user_id)
+
+    db.session.execute(insert(UserCurrency), [
+        {'user_id': user_id, 'country_id': country_id, 'amount': Decimal('1000000')}
+        for country_id, user_ids in by_country.items() for user_id in user_ids
+    ])
+
+    # One mining company per PLAYERS_PER_COMPANY players, owned by the first of them
+    coal_id = db.session.scalar(select(Resource.id).where(Resource.slug == 'coal'))
+    owners = {}
+    for country_id, user_ids in by_country.items():
+        for start in range(0, len(user_ids), PLAYERS_PER_COMPANY):
+            owners[user_ids[start]] = (country_id, user_ids[start + 1:start + PLAYERS_PER_COMPANY])
+    db.session.execute(insert(Company), [
+        {'name': f'Load Mine {owner_id}', 'company_type': CompanyType.MINING, 'owner_id': owner_id,
+         'country_id': country_id, 'current_production_resource_id': coal_id, 'use_electricity': False,
+         'currency_balance': Decimal('10000000')}
+        for owner_id, (country_id, _) in owners.items()
+    ])
+    company_of = dict(db.session.execute(
+        select(Company.owner_id, Company.id).where(Company.owner_id.in_(owners))
+    ).all())
+    db.session.execute(insert(JobOffer), [
+        {'company_id': company_id, 'wage_per_pp': Decimal('1')} for company_id in company_of.values()
+    ])
+    employments = [
+        {'company_id': company_of[owner_id], 'user_id': user_id, 'wage_per_pp': Decimal('1')}
+        for owner_id, (_, workers) in owners.items() for user_id in workers
+    ]
+    if employments:
+        db.session.execute(insert(Employment), employments)
+
+    # A party per country with every citizen as member and an election running
+    db.session.execute(insert(PoliticalParty), [
+        {'name': f'Load Party {country_id}', 'slug': f'load-party-{country_id}', 'country_id': country_id,
+         'president_id': by_country[country_id][0]}
+        for country_id in country_ids
+    ])
+    party_of = dict(db.session.execute(
+        select(PoliticalParty.country_id, PoliticalParty.id).where(PoliticalParty.slug.like('load-party-%'))
+    ).all())
+    db.session.execute(insert(PartyMembership), [
+        {'user_id': user_id, 'party_id': party_of[country_id]}
+        for country_id, user_ids in by_country.items() for user_id in user_ids
+    ])
+    for country_id, party_id in party_of.items():
+        db.session.execute(
+            update(User).where(User.id.in_(by_country[country_id])).values(party_id=party_id)
+            .execution_options(synchronize_session=False)
+        )
+    db.session.execute(insert(PartyElection), [
+        {'party_id': party_id, 'start_time': now - timedelta(hours=1), 'end_time': now + timedelta(hours=23),
+         'status': ElectionStatus.ACTIVE}
+        for party_id in party_of.values()
+    ])
+    election_of = dict(db.session.execute(
+        select(PartyElection.party_id, PartyElection.id).where(PartyElection.party_id.in_(party_of.values()))
+    ).all())
+    db.session.execute(insert(PartyCandidate), [
+        {'election_id': election_of[party_of[country_id]], 'user_id': user_id}
+        for country_id, user_ids in by_country.items() for user_id in user_ids[:CANDIDATES_PER_ELECTION]
+    ])
+
+    # A newspaper per country, owned and written by its first citizen
+    db.session.execute(insert(Newspaper), [
+        {'name': f'Load Gazette {country_id}', 'owner_id': by_country[country_id][0], 'country_id': country_id}
+        for country_id in country_ids
+    ])
+    newspapers = db.session.execute(
+        select(Newspaper.id, Newspaper.owner_id).where(Newspaper.name.like('Load Gazette %'))
+    ).all()
+    db.session.execute(insert(Article), [
+        {'title': f'Dispatch {n}', 'content': '<p>' + 'Nothing to report. ' * 40 + '</p>',
+         'newspaper_id': newspaper_id, 'author_id': owner_id}
+        for newspaper_id, owner_id in newspapers for n in range(ARTICLES_PER_NEWSPAPER)
+    ])
+
+    # The first country attacks the second; everyone else watches
+    if countries >= 2:
+        attacker_id, defender_id = country_ids[0], country_ids[1]
+        war = War(attacker_country_id=attacker_id, defender_country_id=defender_id,
+                  scheduled_end_at=now + timedelta(days=30))
+        db.session.add(war)
+        db.session.flush()
+        battle = Battle(war_id=war.id, region_id=region_of[defender_id], started_by_country_id=attacker_id,
+                        started_by_user_id=by_country[attacker_id][0], status=BattleStatus.ACTIVE,
+                        ends_at=now + timedelta(hours=24))
+        db.session.add(battle)
+        db.session.flush()
+        db.session.add(BattleRound(battle_id=battle.id, round_number=1, status=RoundStatus.ACTIVE,
+                                   started_at=now, ends_at=now + timedelta(hours=8)))
+
+    db.session.commit()
+    return True
+
+
+def load_world():
+    """Players, markets, parties, newspapers and the active battle, read back from the database."""
+    from app.models import (
+        User, Country, Resource, CountryMarketItem, Employment, PoliticalParty, PartyElection,
+        PartyCandidate, ElectionStatus, Newspaper, Article, Battle, BattleStatus,
+    )
+
+    players = [
+        {'id': user_id, 'country_id': country_id, 'company_id': company_id}
+        for user_id, country_id, company_id in db.session.execute(
+            select(User.id, User.citizenship_id, Employment.company_id)
+            .outerjoin(Employment, Employment.user_id == User.id)
+            .where(_player_filter())
+            .order_by(User.id)
+        )
+    ]
+    country_ids = sorted({player['country_id'] for player in players})
+
+    countries = {}
+    for country_id, slug in db.session.execute(select(Country.id, Country.slug).where(Country.id.in_(country_ids))):
+        countries[country_id] = {
+            'slug': slug,
+            'resources': db.session.execute(
+                select(Resource.id, Resource.slug)
+                .join(CountryMarketItem, CountryMarketItem.resource_id == Resource.id)
+                .where(CountryMarketItem.country_id == country_id, CountryMarketItem.quality == 0,
+                       Resource.slug.in_(MARKET_RESOURCES))
+                .order_by(Resource.id)
+            ).all(),
+            'party_id': None, 'candidate_ids': [], 'newspaper_id': None, 'article_ids': [],
+        }
+
+    for country_id, party_id, election_id in db.session.execute(
+        select(PoliticalParty.country_id, PoliticalParty.id, PartyElection.id)
+        .join(PartyElection, PartyElection.party_id == PoliticalParty.id)
+        .where(PoliticalParty.slug.like('load-party-%'), PartyElection.status == ElectionStatus.ACTIVE)
+    ):
+        countries[country_id]['party_id'] = party_id
+        countries[country_id]['candidate_ids'] = db.session.scalars(
+            select(PartyCandidate.user_id).where(PartyCandidate.election_id == election_id)
+        ).all()
+
+    for country_id, newspaper_id in db.session.execute(
+        select(Newspaper.country_id, Newspaper.id).where(Newspaper.name.like('Load Gazette %'))
+    ):
+        countries[country_id]['newspaper_id'] = newspaper_id
+        countries[country_id]['article_ids'] = db.session.scalars(
+            select(Article.id).where(Article.newspaper_id == newspaper_id)
+        ).all()
+
+    battle_id = db.session.scalar(
+        select(Battle.id).where(Battle.status == BattleStatus.ACTIVE, Battle.ends_at > datetime.utcnow())
+        .order_by(Battle.id)
+    )
+    return {'players': players, 'countries': countries, 'battle_id': battle_id}
+
+
+def reset_players():
+    """Full energy and wellness, so repeated runs on one database start alike."""
+    from app.models import User
+
+    db.session.execute(
+        update(User).where(_player_filter()).values(energy=100.0, wellness=100.0)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def session_cookie(app, user_id):
+    """Signed session cookie for a logged-in player, as the login flow would set it."""
+    from flask import session
+    from flask_login import login_user
+    from app.models import User
+    from app.session_security import init_session_security
+
+    with app.test_request_context(headers={'User-Agent': USER_AGENT}, environ_base={'REMOTE_ADDR': REMOTE_ADDR}):
+        login_user(db.session.get(User, user_id))
+        init_session_security()
+        return app.session_interface.get_signing_serializer(app).dumps(dict(session))
+
+
+# ==================== Transports ====================
+
+class TestClientTransport:
+    """Requests through the Flask test client, in this process."""
+
+    def __init__(self, app):
+        self.client = app.test_client(use_cookies=False)
+
+    def request(self, method, path, data, headers):
+        response = self.client.open(path, method=method, data=data, headers=headers,
+                                    environ_base={'REMOTE_ADDR': REMOTE_ADDR})
+        body = response.get_data()
+        return response.status_code, response.headers, response.headers.getlist('Set-Cookie'), body
+
+
+class HTTPTransport:
+    """Requests over HTTP to a running server, one keep-alive connection per thread."""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=60)
+
+    def request(self, method, path, data, headers):
+        body = None
+        if data is not None:
+            body = urlencode(data)
+            headers = dict(headers, **{'Content-Type': 'application/x-www-form-urlencoded'})
+        try:
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            # The server closed the keep-alive connection; retry once on a new one
+            self.connection.close()
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+        payload = response.read()
+        return response.status, response.headers, response.headers.get_all('Set-Cookie') or [], payload
+
+
+# ==================== Driving ====================
+
+class Stats:
+    """Per-endpoint samples shared by all threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def record(self, endpoint, seconds, status, queries):
+        with self._lock:
+            entry = self.samples.setdefault(endpoint, {'latencies': [], 'queries': [], 'statuses': {}})
+            entry['latencies'].append(seconds)
+            if queries is not None:
+                entry['queries'].append(queries)
+            status_class = f'{status // 100}xx'
+            entry['statuses'][status_class] = entry['statuses'].get(status_class, 0) + 1
+
+
+class Driver:
+    """One thread's player sessions: sends their requests and records every one."""
+
+    def __init__(self, app, transport, stats, players):
+        self.transport = transport
+        self.stats = stats
+        self.cookie_name = app.config['SESSION_COOKIE_NAME']
+        self.urls = app.url_map.bind('localhost')
+        self.cookies = {player['id']: session_cookie(app, player['id']) for player in players}
+        self.sent = 0
+
+    def endpoint(self, method, path):
+        try:
+            return self.urls.match(path, method=method)[0]
+        except Exception:
+            return f'{method} {path}'
+
+    def send(self, player, method, path, data=None, xhr=False):
+        headers = {'User-Agent': USER_AGENT, 'Cookie': f"{self.cookie_name}={self.cookies[player['id']]}"}
+        if xhr:
+            headers['X-Requested-With'] = 'XMLHttpRequest'
+
+        start = time.perf_counter()
+        status, response_headers, set_cookies, body = self.transport.request(method, path, data, headers)
+        elapsed = time.perf_counter() - start
+
+        for header in set_cookies:
+            morsel = SimpleCookie(header).get(self.cookie_name)
+            if morsel is not None and morsel.value:
+                self.cookies[player['id']] = morsel.value
+        queries = response_headers.get('X-SQL-Queries')
+        self.stats.record(self.endpoint(method, path), elapsed, status, int(queries) if queries else None)
+        self.sent += 1
+        return status, body
+
+    def get(self, player, path):
+        return self.send(player, 'GET', path)
+
+    def post(self, player, path, data, xhr=False):
+        return self.send(player, 'POST', path, data, xhr)
+
+
+def work(driver, player, world, rng):
+    driver.get(player, '/company/my-companies')
+    if player['company_id']:
+        driver.post(player, f"/company/{player['company_id']}/work", {'hours': 1})
+
+
+def train(driver, player, world, rng):
+    driver.get(player, '/training')
+    driver.post(player, '/training', {'skill_type': rng.choice(('infantry', 'armoured', 'aviation')), 'hours': 1})
+
+
+def trade(driver, player, world, rng):
+    country = world['countries'][player['country_id']]
+    if not country['resources']:
+        return
+    resource_id, resource_slug = rng.choice(country['resources'])
+    driver.get(player, f"/market/{country['slug']}/{resource_slug}")
+    buy_path = f"/market/{country['slug']}/buy/{resource_id}"
+    status, body = driver.post(player, buy_path, {'quantity': 1, 'quality': 0}, xhr=True)
+    if status == 200:
+        price_level = json.loads(body)['current_price_level']
+        driver.post(player, buy_path, {'quantity': 1, 'quality': 0, 'confirmed': 'true',
+                                       'expected_price_level': price_level})
+
+
+def fight(driver, player, world, rng):
+    if not world['battle_id']:
+        return
+    driver.get(player, f"/battle/{world['battle_id']}")
+    driver.post(player, f"/battle/{world['battle_id']}/fight",
+                {'wall_type': rng.choice(('infantry', 'armoured', 'aviation')), 'use_weapon': 'false'}, xhr=True)
+
+
+def read_news(driver, player, world, rng):
+    country = world['countries'][player['country_id']]
+    if not country['newspaper_id']:
+        return
+    driver.get(player, f"/community/newspaper/{country['newspaper_id']}")
+    driver.get(player, f"/community/newspaper/{country['newspaper_id']}/article/{rng.choice(country['article_ids'])}")
+
+
+def message(driver, player, world, rng):
+    recipient = rng.choice(world['players'])
+    if recipient['id'] == player['id']:
+        return
+    driver.get(player, '/messages')
+    driver.post(player, f"/messages/send/{recipient['id']}", {'content': f"Greetings from player {player['id']}."})
+
+
+def vote(driver, player, world, rng):
+    country = world['countries'][player['country_id']]
+    if not country['party_id']:
+        return
+    driver.get(player, f"/party/{country['party_id']}")
+    driver.post(player, f"/party/{country['party_id']}/vote", {'candidate_id': rng.choice(country['candidate_ids'])})
+
+
+BEHAVIOURS = {
+    'work': work,
+    'train': train,
+    'trade': trade,
+    'fight': fight,
+    'read_news': read_news,
+    'message': message,
+    'vote': vote,
+}
+
+
+def run_load(app, world, weights, requests, duration, threads, seed, url=None):
+    """
+    Drive `threads` threads, each playing its share of the players, until
+    `requests` requests are sent or `duration` seconds pass.
+
+    Returns (Stats, elapsed seconds, requests sent).
+    """
+    stats = Stats()
+    names = [name for name, weight in weights.items() if weight > 0]
+    cumulative = [weights[name] for name in names]
+    threads = max(1, min(threads, len(world['players'])))
+    deadline = time.perf_counter() + duration if duration else None
+
+    with app.app_context():
+        drivers = [
+            Driver(app, HTTPTransport(url) if url else TestClientTransport(app), stats,
+                   world['players'][index::threads])
+            for index in range(threads)
+        ]
+
+    def play(index):
+        driver = drivers[index]
+        rng = random.Random(seed * 1000 + index)
+        players = world['players'][index::threads]
+        quota = requests // threads + (index < requests % threads) if requests else None
+        while (quota is None or driver.sent < quota) and (deadline is None or time.perf_counter() < deadline):
+            behaviour = BEHAVIOURS[rng.choices(names, cumulative)[0]]
+            behaviour(driver, rng.choice(players), world, rng)
+
+    workers = [threading.Thread(target=play, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return stats, elapsed, sum(driver.sent for driver in drivers)
+
+
+# ==================== Reporting ====================
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(stats, elapsed, sent):
+    endpoints = {}
+    for endpoint, entry in sorted(stats.samples.items()):
+        latencies = sorted(entry['latencies'])
+        queries = entry['queries']
+        endpoints[endpoint] = {
+            'count': len(latencies),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+            'mean_queries': round(sum(queries) / len(queries), 2) if queries else None,
+            'max_queries': max(queries) if queries else None,
+            'statuses': dict(sorted(entry['statuses'].items())),
+        }
+    errors = sum(entry['statuses'].get('5xx', 0) for entry in endpoints.values())
+    return {
+        'requests': sent,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(sent / elapsed, 1) if elapsed else None,
+        'endpoints': endpoints,
+    }
+
+
+def print_report(summary):
+    print(f"{'endpoint':<34} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8}  statuses")
+    for endpoint, row in summary['endpoints'].items():
+        queries = f"{row['mean_queries']:.1f}" if row['mean_queries'] is not None else '-'
+        statuses = ' '.join(f'{status}={count}' for status, count in row['statuses'].items())
+        print(f"{endpoint:<34} {row['count']:6d} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} "
+              f"{row['p99_ms']:8.1f} {queries:>8}  {statuses}")
+    print(f"\n{summary['requests']} requests in {summary['elapsed_s']:.1f} s: "
+          f"{summary['throughput_rps']} req/s, {summary['errors']} server errors")
+
+
+def compare(baseline, current, tolerance, query_tolerance):
+    """Regressions of `current` against `baseline`, one line each."""
+    regressions = []
+    for endpoint, old in baseline['results']['endpoints'].items():
+        new = current['results']['endpoints'].get(endpoint)
+        if new is None:
+            continue
+        if new['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{endpoint}: p95 {old['p95_ms']} -> {new['p95_ms']} ms")
+        if old['mean_queries'] is not None and new['mean_queries'] is not None \
+                and new['mean_queries'] > old['mean_queries'] * (1 + query_tolerance):
+            regressions.append(f"{endpoint}: {old['mean_queries']} -> {new['mean_queries']} queries per request")
+        if new['statuses'].get('5xx', 0) > old['statuses'].get('5xx', 0):
+            regressions.append(f"{endpoint}: {old['statuses'].get('5xx', 0)} -> {new['statuses']['5xx']} server errors")
+    old_rps, new_rps = baseline['results']['throughput_rps'], current['results']['throughput_rps']
+    if old_rps and new_rps and new_rps < old_rps / (1 + tolerance):
+        regressions.append(f"throughput: {old_rps} -> {new_rps} req/s")
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_weights(text):
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in filter(None, text.split(',')):
+        name, _, weight = item.partition('=')
+        if name not in BEHAVIOURS:
+            raise argparse.ArgumentTypeError(f"unknown behaviour {name!r} (choose from {', '.join(BEHAVIOURS)})")
+        weights[name] = int(weight)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--players', type=int, default=500)
+    parser.add_argument('--countries', type=int, default=2)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--duration', type=float, default=None, help='stop after this many seconds instead')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--weights', type=parse_weights, default=dict(DEFAULT_WEIGHTS),
+                        help='behaviour weights, e.g. fight=50,trade=30 (others keep their default)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--database', help='database URI (default: a new SQLite file)')
+    parser.add_argument('--url', help='drive a running server at this URL instead of the test client')
+    parser.add_argument('--output', default='load_test_baseline.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='exit non-zero on regressions against this file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p95 and throughput change')
+    parser.add_argument('--query-tolerance', type=float, default=0.1, help='allowed queries per request change')
+    parser.add_argument('--seed-only', action='store_true', help='seed the database and exit')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='load_test_')
+    database_uri = args.database or 'sqlite:///' + os.path.join(workdir, 'load_test.db')
+    app = create_load_test_app(database_uri, os.path.join(workdir, 'logs'))
+
+    with app.app_context():
+        start = time.perf_counter()
+        seeded = seed_world(args.players, args.countries)
+        print(f"{'Seeded' if seeded else 'Reusing'} synthetic world in {time.perf_counter() - start:.1f} s "
+              f"({database_uri.split('://')[0]})")
+        if args.seed_only:
+            return
+        reset_players()
+        world = load_world()
+        db.session.remove()
+    print(f"{len(world['players'])} players, {len(world['countries'])} countries, "
+          f"battle {world['battle_id'] or 'none'}; driving {'http ' + args.url if args.url else 'test client'}\n")
+
+    stats, elapsed, sent = run_load(app, world, args.weights, None if args.duration else args.requests,
+                                    args.duration, args.threads, args.seed, args.url)
+    summary = summarize(stats, elapsed, sent)
+    print_report(summary)
+
+    result = {
+        'git_commit': _git_commit(),
+        'generated_at': datetime.utcnow().isoformat(timespec='seconds'),
+        'database': database_uri.split('://')[0],
+        'transport': 'http' if args.url else 'test_client',
+        'config': {
+            'players': len(world['players']),
+            'countries': len(world['countries']),
+            'threads': args.threads,
+            'requests': None if args.duration else args.requests,
+            'duration': args.duration,
+            'seed': args.seed,
+            'weights': args.weights,
+        },
+        'results': summary,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"Baseline written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.tolerance, args.query_tolerance)
+        print(f"\nCompared with {args.compare} ({baseline.get('git_commit') or 'unknown commit'}):")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("  no regressions")
+
+
+if __name__ == '__main__':
+    main()
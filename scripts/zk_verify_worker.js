@@ -0,0 +1,173 @@
+/**
+ * Long-lived Groth16 verification worker.
+ *
+ * Spawned by app/services/node_worker_pool.py. Loads snarkjs and the voting
+ * circuit verification key once, then serves requests over stdin/stdout.
+ *
+ * Framing (both directions): 4-byte big-endian length prefix followed by a
+ * UTF-8 encoded JSON object. Every request carries an `id` that is echoed in
+ * the response.
+ *
+ * Operations:
+ *   { op: 'ping' }                                  -> { ok: true }
+ *   { op: 'verify', proof, publicSignals, vk? }     -> { valid: bool }
+ *   { op: 'submit', proof, publicSignals, vk?,
+ *     seedPhrase, mainnet }                         -> { success, txHash, blockNumber, error }
+ *
+ * Usage: node zk_verify_worker.js <verification_key.json>
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+// Project's node_modules (this file lives in <root>/scripts)
+module.paths.unshift(path.join(__dirname, '..', 'node_modules'));
+
+// stdout carries framed responses only - send any library chatter to stderr
+const frameOut = process.stdout;
+const toStderr = (...args) => process.stderr.write(args.map(String).join(' ') + '\n');
+console.log = toStderr;
+console.info = toStderr;
+console.warn = toStderr;
+console.debug = toStderr;
+
+const snarkjs = require('snarkjs');
+
+const vkPath = process.argv[2];
+const defaultVerificationKey = vkPath ? JSON.parse(fs.readFileSync(vkPath, 'utf8')) : null;
+
+// zkVerify session is opened lazily and reused across submissions
+let zkSession = null;
+let zkSessionKey = null;
+
+async function getZkVerifySession(seedPhrase, mainnet) {
+    const key = `${mainnet ? 'mainnet' : 'testnet'}:${seedPhrase}`;
+    if (zkSession && zkSessionKey === key) {
+        return zkSession;
+    }
+    await closeZkVerifySession();
+
+    const { zkVerifySession } = require('zkverifyjs');
+    const builder = zkVerifySession.start();
+    zkSession = await (mainnet ? builder.zkVerify() : builder.Volta()).withAccount(seedPhrase);
+    zkSessionKey = key;
+    return zkSession;
+}
+
+async function closeZkVerifySession() {
+    if (zkSession) {
+        try {
+            await zkSession.close();
+        } catch (e) {
+            // Ignore close errors
+        }
+    }
+    zkSession = null;
+    zkSessionKey = null;
+}
+
+async function submitToZkVerify(req, vk) {
+    const { Library, CurveType } = require('zkverifyjs');
+    const session = await getZkVerifySession(req.seedPhrase, req.mainnet);
+
+    try {
+        const { transactionResult } = await session.verify()
+            .groth16({ library: Library.snarkjs, curve: CurveType.bn128 })
+            .execute({
+                proofData: {
+                    vk: vk,
+                    proof: req.proof,
+                    publicSignals: req.publicSignals
+                }
+            });
+
+        const result = await transactionResult;
+        return {
+            success: true,
+            txHash: result.txHash || result.blockHash,
+            blockNumber: result.blockNumber
+        };
+    } catch (error) {
+        // Session may be broken (dropped websocket etc.) - reconnect next time
+        await closeZkVerifySession();
+        return { success: false, error: error.message || String(error) };
+    }
+}
+
+async function handle(req) {
+    const vk = req.vk || defaultVerificationKey;
+
+    switch (req.op) {
+        case 'ping':
+            return { ok: true };
+
+        case 'verify':
+            if (!vk) {
+                throw new Error('Verification key not loaded');
+            }
+            return { valid: await snarkjs.groth16.verify(vk, req.publicSignals, req.proof) };
+
+        case 'submit':
+            if (!vk) {
+                throw new Error('Verification key not loaded');
+            }
+            return submitToZkVerify(req, vk);
+
+        default:
+            throw new Error(`Unknown op: ${req.op}`);
+    }
+}
+
+function send(message) {
+    const body = Buffer.from(JSON.stringify(message), 'utf8');
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(body.length, 0);
+    frameOut.write(Buffer.concat([header, body]));
+}
+
+// Requests are processed strictly in order; the pool only sends one at a time
+let pending = Buffer.alloc(0);
+let chain = Promise.resolve();
+
+process.stdin.on('data', (chunk) => {
+    pending = Buffer.concat([pending, chunk]);
+
+    while (pending.length >= 4) {
+        const length = pending.readUInt32BE(0);
+        if (pending.length < 4 + length) {
+            break;
+        }
+        const body = pending.subarray(4, 4 + length);
+        pending = pending.subarray(4 + length);
+
+        let req;
+        try {
+            req = JSON.parse(body.toString('utf8'));
+        } catch (e) {
+            send({ id: null, error: `Invalid JSON: ${e.message}` });
+            continue;
+        }
+
+        chain = chain
+            .then(() => handle(req))
+            .then(
+                (result) => send({ id: req.id, ...result }),
+                (error) => send({ id: req.id, error: error.message || String(error) })
+            );
+    }
+});
+
+async function shutdown() {
+    await chain;
+    await closeZkVerifySession();
+    // snarkjs keeps curve worker threads alive, so exit explicitly
+    process.exit(0);
+}
+
+process.stdin.on('end', shutdown);
+process.on('SIGTERM', shutdown);
+process.on('unhandledRejection', (reason) => {
+    toStderr(`Unhandled rejection: ${reason}`);
+});
+
+send({ id: 0, ready: true });
@@ -19,6 +19,10 @@ Or run specific seeders:
     python seed_all.py --only military_ranks
     python seed_all.py --only resources
     python seed_all.py --skip countries
+
+Everything except achievements and missions is also built, in a few
+set-based statements instead of row by row, by:
+    flask --app "app:create_app('bootstrap')" bootstrap-world
 """
 
 import sys
@@ -27,6 +31,7 @@ from decimal import Decimal
 from datetime import datetime
 
 from app import create_app
+from config import BootstrapConfig
 from app.extensions import db
 
 
@@ -38,68 +43,7 @@ def seed_military_ranks(app):
 
     from app.models.military_rank import MilitaryRank
 
-    MILITARY_RANKS = [
-        (1, 'Recruit', 0, 2),
-        (2, 'Apprentice', 100, 4),
-        (3, 'Private III', 212, 6),
-        (4, 'Private II', 337, 8),
-        (5, 'Private I', 477, 10),
-        (6, 'Specialist III', 634, 12),
-        (7, 'Specialist II', 810, 14),
-        (8, 'Specialist I', 1007, 16),
-        (9, 'Lance Corporal', 1228, 18),
-        (10, 'Corporal', 1475, 20),
-        (11, 'Senior Corporal', 1752, 22),
-        (12, 'Master Corporal', 2062, 24),
-        (13, 'Sergeant III', 2409, 26),
-        (14, 'Sergeant II', 2798, 28),
-        (15, 'Sergeant I', 3234, 30),
-        (16, 'Staff Sergeant III', 3722, 32),
-        (17, 'Staff Sergeant II', 4269, 34),
-        (18, 'Staff Sergeant I', 4882, 36),
-        (19, 'Technical Sergeant', 5568, 38),
-        (20, 'Senior Sergeant', 6336, 40),
-        (21, 'First Sergeant', 7197, 42),
-        (22, 'Master Sergeant III', 8161, 44),
-        (23, 'Master Sergeant II', 9241, 46),
-        (24, 'Master Sergeant I', 10451, 48),
-        (25, 'Sergeant Major', 11806, 50),
-        (26, 'Command Sergeant Major', 13323, 52),
-        (27, 'Sergeant Major of the Guard', 15023, 54),
-        (28, 'Warrant Officer III', 16927, 56),
-        (29, 'Warrant Officer II', 19059, 58),
-        (30, 'Warrant Officer I', 21447, 60),
-        (31, 'Chief Warrant Officer', 24121, 62),
-        (32, 'Master Warrant Officer', 27116, 64),
-        (33, '2nd Lieutenant', 30471, 66),
-        (34, '1st Lieutenant', 34229, 68),
-        (35, 'Captain III', 38438, 70),
-        (36, 'Captain II', 43152, 72),
-        (37, 'Captain I', 48431, 74),
-        (38, 'Major III', 54344, 76),
-        (39, 'Major II', 60967, 78),
-        (40, 'Major I', 68384, 80),
-        (41, 'Lieutenant Colonel III', 76692, 82),
-        (42, 'Lieutenant Colonel II', 85997, 84),
-        (43, 'Lieutenant Colonel I', 96418, 86),
-        (44, 'Colonel III', 108090, 88),
-        (45, 'Colonel II', 121162, 90),
-        (46, 'Colonel I', 135803, 92),
-        (47, 'Senior Colonel', 152201, 94),
-        (48, 'Brigadier General III', 170567, 96),
-        (49, 'Brigadier General II', 191137, 98),
-        (50, 'Brigadier General I', 214176, 100),
-        (51, 'Major General III', 239979, 102),
-        (52, 'Major General II', 268879, 104),
-        (53, 'Major General I', 301247, 106),
-        (54, 'Lieutenant General III', 337499, 108),
-        (55, 'Lieutenant General II', 378101, 110),
-        (56, 'Lieutenant General I', 423576, 112),
-        (57, 'General III', 474508, 114),
-        (58, 'General II', 531551, 116),
-        (59, 'General I', 595440, 118),
-        (60, 'Field Marshal', 666995, 120),
-    ]
+    from app.bootstrap.world_data import MILITARY_RANKS
 
     with app.app_context():
         existing = MilitaryRank.query.count()
@@ -130,51 +74,7 @@ def seed_resources(app):
     from app.models import Resource, ResourceCategory
     from slugify import slugify
 
-    # Resources: (name, category, icon_path, can_have_quality)
-    RESOURCES = [
-        # Raw materials - no quality
-        ('Coal', ResourceCategory.RAW_MATERIAL, 'images/resources/coal.webp', False),
-        ('Iron ore', ResourceCategory.RAW_MATERIAL, 'images/resources/iron-ore.webp', False),
-        ('Clay', ResourceCategory.RAW_MATERIAL, 'images/resources/clay.webp', False),
-        ('Wheat', ResourceCategory.RAW_MATERIAL, 'images/resources/wheat.webp', False),
-        ('Grape', ResourceCategory.RAW_MATERIAL, 'images/resources/grape.webp', False),
-        ('Sand', ResourceCategory.RAW_MATERIAL, 'images/resources/sand.webp', False),
-        ('Stone', ResourceCategory.RAW_MATERIAL, 'images/resources/stone.webp', False),
-        ('Oil', ResourceCategory.RAW_MATERIAL, 'images/resources/oil.webp', False),
-
-        # Manufactured goods - no quality (intermediate products)
-        ('Iron Bar', ResourceCategory.MANUFACTURED_GOOD, 'images/resources/iron-bar.webp', False),
-        ('Steel', ResourceCategory.MANUFACTURED_GOOD, 'images/resources/steel.webp', False),
-        ('Bricks', ResourceCategory.CONSTRUCTION, 'images/resources/bricks.webp', False),
-        ('Concrete', ResourceCategory.CONSTRUCTION, 'images/resources/concrete.webp', False),
-
-        # Energy - no quality
-        ('Electricity', ResourceCategory.ENERGY, 'images/resources/electricity.webp', False),
-
-        # Food - HAS quality (Q1-Q5)
-        ('Beer', ResourceCategory.FOOD, 'images/resources/beer.webp', True),
-        ('Bread', ResourceCategory.FOOD, 'images/resources/bread.webp', True),
-        ('Wine', ResourceCategory.FOOD, 'images/resources/wine.webp', True),
-
-        # Weapons - HAS quality (Q1-Q5)
-        ('Rifle', ResourceCategory.WEAPON, 'images/resources/rifle.webp', True),
-        ('Tank', ResourceCategory.WEAPON, 'images/resources/tank.webp', True),
-        ('Helicopter', ResourceCategory.WEAPON, 'images/resources/heli.webp', True),
-
-        # Construction buildings - HAS quality (Q1-Q5)
-        ('Fort', ResourceCategory.CONSTRUCTION, 'images/resources/fort.webp', True),
-        ('Hospital', ResourceCategory.CONSTRUCTION, 'images/resources/hospital.webp', True),
-        ('House', ResourceCategory.CONSTRUCTION, 'images/resources/house.webp', True),
-    ]
-
-    adjustments = {
-        ResourceCategory.RAW_MATERIAL: Decimal('0.1'),
-        ResourceCategory.MANUFACTURED_GOOD: Decimal('0.5'),
-        ResourceCategory.FOOD: Decimal('1.0'),
-        ResourceCategory.WEAPON: Decimal('1.0'),
-        ResourceCategory.CONSTRUCTION: Decimal('0.5'),
-        ResourceCategory.ENERGY: Decimal('0.5'),
-    }
+    from app.bootstrap.world_data import RESOURCES, RESOURCE_PRICE_ADJUSTMENTS as adjustments
 
     with app.app_context():
         added = 0
@@ -357,7 +257,7 @@ def main():
     print("   TACTIZEN MASTER SEED SCRIPT")
     print("="*60)
 
-    app = create_app()
+    app = create_app(BootstrapConfig)
 
     seeders = [
         ('military_ranks', seed_military_ranks),
@@ -0,0 +1,191 @@
+"""
+Test script for running the app under a preloading Gunicorn master.
+Creates the app with PRELOAD_APP as the master does, checks that shared
+state is loaded and that neither the scheduler nor a database connection
+is left running, then forks a worker and checks that after_fork() gives it
+its own scheduler, log writer thread and connection pool while reusing the
+master's loaded data. Also checks the cached country geodata lookups
+against a scan of the GeoJSON file. Timings:
+scripts/benchmark_app_startup.py.
+"""
+
+import json
+import os
+import tempfile
+
+from app import create_app
+from app.extensions import db
+from app import lifecycle, scheduler as scheduler_module
+from app.logging_config import get_log_pipeline
+from app.services.country_geodata import country_geodata, GEOJSON_PATH
+from config import TestingConfig
+
+
+def _config(workdir, preload):
+    class LifecycleConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'lifecycle.db')
+        LOG_DIR = os.path.join(workdir, 'logs')
+        LOG_PIPELINE_ENABLED = True
+        SCHEDULER_ENABLED = True
+        SQL_PROFILER_ENABLED = False
+        PRELOAD_APP = preload
+
+    return LifecycleConfig
+
+
+def _in_child(check):
+    """Fork, run check() in the child and return what it returned (a JSON-able value)."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        code = 0
+        try:
+            result = {'ok': check()}
+        except BaseException as e:
+            result = {'error': repr(e)}
+            code = 1
+        os.write(write_fd, json.dumps(result).encode())
+        os._exit(code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = json.loads(pipe.read())
+    os.waitpid(pid, 0)
+    assert 'error' not in result, f"Child failed: {result.get('error')}"
+    return result['ok']
+
+
+def test_preloaded_master_and_worker():
+    """Test that the master starts no threads or connections and each forked worker starts its own."""
+    print("\n" + "=" * 80)
+    print("TEST: Preloaded Master And Worker")
+    print("=" * 80)
+
+    workdir = tempfile.mkdtemp()
+
+    schema_app = create_app(_config(workdir, preload=False))
+    with schema_app.app_context():
+        db.create_all()
+    scheduler_module.shutdown_scheduler()
+
+    app = create_app(_config(workdir, preload=True))
+    assert lifecycle.is_preloaded_master(), "create_app should mark the preloading master"
+    assert scheduler_module.scheduler is None, "Scheduler must not start in a preloaded master"
+    assert scheduler_module.init_scheduler(app) is None, "init_scheduler should refuse in the master"
+    assert country_geodata.loads == 1, "Country geodata should be loaded in the master"
+    with app.app_context():
+        assert db.engine.pool.checkedout() == 0, "Master should hold no connections"
+    print("  - master: data preloaded, no scheduler, no connections checked out")
+
+    pipeline = get_log_pipeline()
+    lifecycle.before_fork()
+    with app.app_context():
+        master_pool = id(db.engine.pool)
+
+    def worker():
+        lifecycle.after_fork(app)
+        with app.app_context():
+            db.session.execute(db.text('SELECT 1'))
+            db.session.remove()
+            new_pool = id(db.engine.pool) != master_pool
+        app.logger.info("worker ready")
+        return {
+            'master': lifecycle.is_preloaded_master(),
+            'scheduler': scheduler_module.scheduler is not None and scheduler_module.scheduler.running,
+            'log_writer': pipeline._thread is not None and pipeline._thread.is_alive(),
+            'new_pool': new_pool,
+            'geodata_loads': country_geodata.loads,
+        }
+
+    state = _in_child(worker)
+    assert state['master'] is False, "A worker is not the master"
+    assert state['scheduler'], "Worker should start its own scheduler"
+    assert state['log_writer'], "Worker should start its own log writer thread"
+    assert state['new_pool'], "Worker should not reuse the master's connection pool"
+    assert state['geodata_loads'] == 1, "Worker should reuse the master's country geodata"
+    print("  - worker: own scheduler, log writer and connection pool; geodata shared")
+
+    assert scheduler_module.scheduler is None, "Forking a worker must not start the master's scheduler"
+
+    print("[PASS] Preloaded master and worker")
+    return True
+
+
+def test_country_geodata_lookups():
+    """Test that cached lookups return what scanning the GeoJSON file returns."""
+    print("\n" + "=" * 80)
+    print("TEST: Country Geodata Lookups")
+    print("=" * 80)
+
+    with open(GEOJSON_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    def scan(match):
+        for feature in data['features']:
+            if match(feature.get('properties', {})):
+                return feature
+        return None
+
+    checked = 0
+    for feature in data['features']:
+        properties = feature['properties']
+        for code in (properties.get('ISO_A2'), properties.get('ISO_A3')):
+            if isinstance(code, str):
+                expected = scan(lambda p: p.get('ISO_A2') == code.upper() or p.get('ISO_A3') == code.upper())
+                assert json.loads(country_geodata.country_json(code.lower())) == expected, f"Code {code} differs"
+                checked += 1
+        name = properties.get('NAME')
+        if isinstance(name, str):
+            expected = scan(lambda p: p.get('NAME', '').lower() == name.lower())
+            assert json.loads(country_geodata.country_json_by_name(name.upper())) == expected, f"{name} differs"
+            checked += 1
+
+    assert json.loads(country_geodata.all_json()) == data
+    assert country_geodata.country_json('ZZZ') is None
+    assert country_geodata.country_json('-99') is None, "Numeric -99 placeholders are not codes"
+    assert country_geodata.country_json_by_name('Atlantis') is None
+    print(f"  - {checked} code and name lookups match a scan of {len(data['features'])} features")
+
+    print("[PASS] Country geodata lookups")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 24 + "TACTIZEN APP LIFECYCLE TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_preloaded_master_and_worker,
+        test_country_geodata_lookups,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL APP LIFECYCLE TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
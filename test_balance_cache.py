@@ -0,0 +1,255 @@
+"""
+Test script for the ZEN balance cache.
+Checks the TTL, single-flight deduplication of concurrent lookups (on the
+cache itself and through get_token_balance_wei with a stub RPC client), and
+invalidation after game-initiated transfers (including a fetch that was
+already in flight when the transfer happened).
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from app.blockchain import balance_cache as balance_cache_module
+from app.blockchain.balance_cache import BalanceCache, get_token_balance_wei, invalidate_balances
+
+TOKEN = '0x' + '5a' * 20
+ALICE = '0x' + '0a' * 20
+BOB = '0x' + '0b' * 20
+
+
+def test_ttl():
+    """Test that a balance is reused within the TTL, refetched after it, then evicted."""
+    print("\n" + "=" * 80)
+    print("TEST: Balance TTL")
+    print("=" * 80)
+
+    now = [0.0]
+    cache = BalanceCache(ttl=10, clock=lambda: now[0])
+    calls = []
+
+    def fetch():
+        calls.append(now[0])
+        return 100 + len(calls)
+
+    assert cache.get(TOKEN, ALICE, fetch) == 101
+    now[0] = 9
+    assert cache.get(TOKEN.upper().replace('0X', '0x'), ALICE.upper().replace('0X', '0x'), fetch) == 101, \
+        "Keys should be case-insensitive"
+    assert len(calls) == 1, f"Expected 1 upstream call within TTL, got {len(calls)}"
+
+    now[0] = 10
+    assert cache.get(TOKEN, ALICE, fetch) == 102, "Expired balance should be refetched"
+    assert cache.get(TOKEN, BOB, fetch) == 103, "Addresses must not share entries"
+    print("  - reused within TTL, refetched after, keyed per (token, address)")
+
+    for i in range(100):
+        cache.get(TOKEN, '0x' + format(i + 1, '040x'), fetch)
+        cache.invalidate(TOKEN, '0x' + format(i + 1, '040x'))
+    cache.get(TOKEN, ALICE, fetch)
+    now[0] = 25
+    cache.get(TOKEN, BOB, fetch)
+    assert len(cache._values) == 1 and not cache._flights, \
+        f"Expired balances should be evicted: {len(cache._values)} left"
+    print("  - expired balances evicted, invalidations leave nothing behind")
+
+    print("[PASS] Balance TTL")
+    return True
+
+
+def test_single_flight():
+    """Test that concurrent lookups for one key share a single upstream call."""
+    print("\n" + "=" * 80)
+    print("TEST: Single-Flight Lookups")
+    print("=" * 80)
+
+    cache = BalanceCache(ttl=10)
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return 42
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(TOKEN, ALICE, slow_fetch)))
+               for _ in range(20)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert results == [42] * 20, f"Unexpected results: {results}"
+    assert len(calls) == 1, f"Expected 1 upstream call for 20 concurrent lookups, got {len(calls)}"
+    assert cache.stats['coalesced'] == 19
+    print("  - 20 concurrent lookups, 1 upstream call")
+
+    # A failing fetch is not cached and reaches every waiter
+    def failing_fetch():
+        raise ConnectionError("RPC down")
+
+    try:
+        cache.get(TOKEN, BOB, failing_fetch)
+        assert False, "Fetch error should propagate"
+    except ConnectionError:
+        pass
+    assert cache.get(TOKEN, BOB, lambda: 7) == 7, "Errors must not be cached"
+    print("  - fetch errors propagate and are not cached")
+
+    print("[PASS] Single-flight lookups")
+    return True
+
+
+class StubClient:
+    """Web3 stand-in whose balanceOf blocks until released; counts calls per address."""
+
+    def __init__(self, balances):
+        self.balances = balances
+        self.calls = {}
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+        self.eth = SimpleNamespace(contract=self._contract)
+
+    def _contract(self, address, abi):
+        assert address.lower() == TOKEN
+        return SimpleNamespace(functions=SimpleNamespace(balanceOf=self._balance_of))
+
+    def _balance_of(self, owner):
+        def call():
+            with self._lock:
+                self.calls[owner.lower()] = self.calls.get(owner.lower(), 0) + 1
+            self.release.wait(5)
+            return self.balances[owner.lower()]
+        return SimpleNamespace(call=call)
+
+
+def test_single_flight_rpc():
+    """Test that concurrent get_token_balance_wei callers share one balanceOf call per address."""
+    print("\n" + "=" * 80)
+    print("TEST: Single-Flight RPC Calls")
+    print("=" * 80)
+
+    original = balance_cache_module.balance_cache
+    balance_cache_module.balance_cache = cache = BalanceCache(ttl=10)
+    try:
+        client = StubClient({ALICE: 10 ** 18, BOB: 5})
+        results = []
+        lock = threading.Lock()
+
+        def lookup(address):
+            value = get_token_balance_wei(TOKEN, address, w3=client)
+            with lock:
+                results.append((address, value))
+
+        threads = [threading.Thread(target=lookup, args=(ALICE if i % 4 else BOB,)) for i in range(40)]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+        assert client.calls == {ALICE: 1, BOB: 1}, f"Calls while in flight: {client.calls}"
+        client.release.set()
+        for t in threads:
+            t.join()
+
+        assert sorted(results) == sorted([(ALICE, 10 ** 18)] * 30 + [(BOB, 5)] * 10), f"Results: {results}"
+        assert client.calls == {ALICE: 1, BOB: 1}, f"Upstream calls: {client.calls}"
+        assert cache.stats['upstream'] == 2 and cache.stats['coalesced'] == 38, cache.stats
+        print("  - 40 concurrent callers over 2 addresses, 1 balanceOf call each")
+
+        assert get_token_balance_wei(TOKEN, ALICE.upper().replace('0X', '0x'), w3=client) == 10 ** 18
+        assert client.calls[ALICE] == 1, "Fresh balance should be served from the cache"
+        client.balances[ALICE] = 7
+        invalidate_balances(TOKEN, ALICE)
+        assert get_token_balance_wei(TOKEN, ALICE, w3=client) == 7 and client.calls[ALICE] == 2
+        print("  - later callers hit the cache until invalidate_balances()")
+    finally:
+        balance_cache_module.balance_cache = original
+
+    print("[PASS] Single-flight RPC calls")
+    return True
+
+
+def test_invalidation():
+    """Test that invalidation drops cached balances and discards stale in-flight results."""
+    print("\n" + "=" * 80)
+    print("TEST: Invalidation")
+    print("=" * 80)
+
+    cache = BalanceCache(ttl=60)
+    balances = {ALICE: 100, BOB: 0}
+    cache.get(TOKEN, ALICE, lambda: balances[ALICE])
+    cache.get(TOKEN, BOB, lambda: balances[BOB])
+
+    # Game pays Bob from Alice's side
+    balances[ALICE], balances[BOB] = 60, 40
+    cache.invalidate(TOKEN, ALICE, BOB)
+    assert cache.get(TOKEN, ALICE, lambda: balances[ALICE]) == 60
+    assert cache.get(TOKEN, BOB, lambda: balances[BOB]) == 40
+    print("  - both sides of a transfer see the new balance immediately")
+
+    # A lookup that read the old balance before the transfer must not be cached
+    started, release = threading.Event(), threading.Event()
+
+    def racing_fetch():
+        value = balances[ALICE]
+        started.set()
+        release.wait(5)
+        return value
+
+    cache.invalidate(TOKEN, ALICE)
+    reader = threading.Thread(target=lambda: cache.get(TOKEN, ALICE, racing_fetch))
+    reader.start()
+    started.wait(5)
+    balances[ALICE] = 10
+    cache.invalidate(TOKEN, ALICE)
+    release.set()
+    reader.join()
+    assert cache.get(TOKEN, ALICE, lambda: balances[ALICE]) == 10, "Stale in-flight result was cached"
+    print("  - result of a lookup overtaken by a transfer is not cached")
+
+    print("[PASS] Invalidation")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 25 + "TACTIZEN BALANCE CACHE TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_ttl,
+        test_single_flight,
+        test_single_flight_rpc,
+        test_invalidation,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL BALANCE CACHE TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,338 @@
+"""
+Test script for the NFT Transfer / marketplace event indexer.
+Replays synthetic event streams from an in-process stand-in chain and checks
+that token_owner and onchain_listing match a straightforward replay of the
+canonical chain: while following the head in uneven steps, after a reorg
+that replaces the last blocks with a different fork, and after a reorg to a
+shorter chain.
+"""
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app import create_app
+from app.extensions import db
+from app.models import ChainEvent, ChainIndexCursor, TokenOwner, OnchainListing
+from app.services.chain_indexer import ChainIndexer, ChainIndexService, ZERO_ADDRESS
+from config import TestingConfig
+
+MARKETPLACE = '0x' + 'e' * 40
+WALLETS = ['0x' + f'{n:040x}' for n in range(1, 9)]
+
+
+class StandInChain:
+    """Blocks of decoded events; tests append blocks and fork the tail."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.blocks = []        # [(hash, [event, ...])]
+        self.owners = {}        # Generator state: token -> owner
+        self.listed = {}        # token -> seller
+        self.next_token = 1
+        self.fork = 0
+
+    # -- node interface ----------------------------------------------------
+
+    def block_number(self):
+        return len(self.blocks) - 1
+
+    def block_hash(self, number):
+        return self.blocks[number][0]
+
+    def get_events(self, from_block, to_block):
+        return [e for n in range(from_block, min(to_block, self.block_number()) + 1) for e in self.blocks[n][1]]
+
+    # -- stream generation -------------------------------------------------
+
+    def _event(self, number, index, name, token_id, from_address=None, to_address=None, price=None):
+        return {
+            'block_number': number, 'block_hash': self._hash(number), 'log_index': index,
+            'tx_hash': '0x' + f'{number:032x}{index:032x}', 'event': name, 'token_id': token_id,
+            'from_address': from_address, 'to_address': to_address,
+            'price_zen': price, 'timestamp': 1_700_000_000 + number * 2 if name != 'Transfer' else None,
+        }
+
+    def _hash(self, number):
+        return '0x' + f'{self.fork:08x}{number:056x}'
+
+    def _transfer(self, events, number, token, to):
+        events.append(self._event(number, len(events), 'Transfer', token, self.owners.get(token, ZERO_ADDRESS), to))
+        if to == ZERO_ADDRESS:
+            self.owners.pop(token, None)
+        else:
+            self.owners[token] = to
+
+    def add_block(self, actions=3):
+        number = len(self.blocks)
+        events = []
+        for _ in range(self.rng.randint(0, actions)):
+            free = [t for t in self.owners if t not in self.listed]
+            roll = self.rng.random()
+            if roll < 0.3 or not free:
+                self._transfer(events, number, self.next_token, self.rng.choice(WALLETS))
+                self.next_token += 1
+            elif roll < 0.45:
+                token = self.rng.choice(free)
+                self._transfer(events, number, token, self.rng.choice(WALLETS))
+            elif roll < 0.6:
+                token = self.rng.choice(free)
+                seller = self.owners[token]
+                self._transfer(events, number, token, MARKETPLACE)
+                price = Decimal(self.rng.randint(1, 500)) / 4
+                events.append(self._event(number, len(events), 'NFTListed', token, seller, None, price))
+                self.listed[token] = seller
+            elif roll < 0.75 and self.listed:
+                token = self.rng.choice(sorted(self.listed))
+                buyer = self.rng.choice(WALLETS)
+                events.append(self._event(number, len(events), 'NFTSold', token, self.listed.pop(token), buyer, Decimal(1)))
+                self._transfer(events, number, token, buyer)
+            elif roll < 0.85 and self.listed:
+                token = self.rng.choice(sorted(self.listed))
+                seller = self.listed.pop(token)
+                events.append(self._event(number, len(events), 'ListingCancelled', token, seller))
+                self._transfer(events, number, token, seller)
+            else:
+                self._transfer(events, number, self.rng.choice(free), ZERO_ADDRESS)  # Burn (upgrade)
+        self.blocks.append((self._hash(number), events))
+
+    def reorg(self, depth, new_blocks):
+        """Replace the last `depth` blocks with `new_blocks` different ones."""
+        self.blocks = self.blocks[:len(self.blocks) - depth]
+        self.fork += 1
+        self.owners, self.listed = expected_state(self)[0], {}
+        for token, listing in expected_state(self)[1].items():
+            if listing['active']:
+                self.listed[token] = listing['seller']
+        for _ in range(new_blocks):
+            self.add_block()
+
+
+def expected_state(chain):
+    """Owners and listings from replaying the canonical chain."""
+    owners, listings = {}, {}
+    for _, events in chain.blocks:
+        for e in events:
+            if e['event'] == 'Transfer':
+                if e['to_address'] == ZERO_ADDRESS:
+                    owners.pop(e['token_id'], None)
+                else:
+                    owners[e['token_id']] = e['to_address']
+            elif e['event'] == 'NFTListed':
+                listings[e['token_id']] = {'seller': e['from_address'], 'price': e['price_zen'], 'active': True}
+            else:
+                listings[e['token_id']]['active'] = False
+    return owners, listings
+
+
+def _assert_mirror_matches(chain):
+    db.session.expire_all()
+    owners, listings = expected_state(chain)
+    indexed = {t.token_id: t.owner_address for t in db.session.scalars(db.select(TokenOwner))}
+    assert indexed == owners, f"token_owner differs: {len(indexed)} indexed vs {len(owners)} expected"
+    indexed = {
+        l.token_id: {'seller': l.seller_address, 'price': Decimal(l.price_zen), 'active': l.active}
+        for l in db.session.scalars(db.select(OnchainListing))
+    }
+    assert indexed == listings, "onchain_listing differs"
+    return owners, listings
+
+
+def test_follows_event_stream():
+    """Test that the mirror matches the chain while following the head."""
+    print("\n" + "=" * 80)
+    print("TEST: Follows Event Stream")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = StandInChain(seed=7)
+        indexer = ChainIndexer(chain, reorg_depth=6, batch_blocks=37)
+
+        rng = random.Random(1)
+        for _ in range(300):
+            chain.add_block()
+        total = 0
+        while indexer.run_once() and chain.block_number() < 700:
+            for _ in range(rng.randint(0, 60)):
+                chain.add_block()
+            total += 1
+        stats = indexer.run_once()
+        assert stats['blocks'] == 0 and stats['rewound_blocks'] == 0
+        owners, listings = _assert_mirror_matches(chain)
+        events = db.session.scalar(db.select(db.func.count()).select_from(ChainEvent))
+        print(f"  - {chain.block_number() + 1} blocks, {events} events over {total + 1} runs: "
+              f"{len(owners)} owned tokens, {sum(l['active'] for l in listings.values())} active listings match")
+
+        wallet = WALLETS[2]
+        assert ChainIndexService.is_current()
+        assert ChainIndexService.tokens_owned_by(wallet.upper().replace('0X', '0x')) == \
+            {t for t, o in owners.items() if o == wallet}
+        depth = app.config['CHAIN_INDEX_REORG_DEPTH']
+        final = {t.token_id: t.block_number for t in db.session.scalars(db.select(TokenOwner))}
+        settled = next(t for t, block in final.items() if block <= chain.block_number() - depth)
+        recent = next(t for t, block in final.items() if block > chain.block_number() - depth)
+        assert ChainIndexService.owner_of(settled) == owners[settled]
+        assert ChainIndexService.owner_of(recent) is None, "A transfer within the reorg depth is not final"
+        assert ChainIndexService.active_listing_token_ids() == sorted(t for t, l in listings.items() if l['active'])
+        print("  - ownership and listing lookups answer from the mirror, recent transfers go to the node")
+
+        cursor = db.session.get(ChainIndexCursor, ChainIndexer.NAME)
+        cursor.updated_at = datetime.utcnow() - timedelta(hours=1)
+        db.session.commit()
+        assert ChainIndexService.owner_of(settled) is None, "A stale mirror should not answer"
+        print("  - a stale mirror answers nothing")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Follows event stream")
+    return True
+
+
+def test_reorg_rewinds():
+    """Test that a reorg within the rewind depth leaves the mirror matching the new fork."""
+    print("\n" + "=" * 80)
+    print("TEST: Reorg Rewinds")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = StandInChain(seed=11)
+        indexer = ChainIndexer(chain, reorg_depth=8, batch_blocks=50)
+        for _ in range(200):
+            chain.add_block(actions=5)
+        indexer.run_once()
+        _assert_mirror_matches(chain)
+
+        before = expected_state(chain)
+        chain.reorg(depth=5, new_blocks=7)
+        assert expected_state(chain) != before, "Fork should change the state"
+        stats = indexer.run_once()
+        assert stats['rewound_blocks'] == 8, f"Stats: {stats}"
+        _assert_mirror_matches(chain)
+        print(f"  - 5-block reorg: rewound 8 blocks, re-indexed {stats['blocks']}, mirror matches the new fork")
+
+        chain.reorg(depth=6, new_blocks=2)  # New chain is shorter than the indexed one
+        stats = indexer.run_once()
+        assert stats['rewound_blocks'] > 0
+        _assert_mirror_matches(chain)
+        print("  - reorg to a shorter chain: mirror matches")
+
+        for _ in range(30):
+            chain.add_block(actions=5)
+        indexer.run_once()
+        _assert_mirror_matches(chain)
+        stale = db.session.scalar(
+            db.select(db.func.count()).select_from(ChainEvent)
+            .where(ChainEvent.block_hash.notin_([h for h, _ in chain.blocks]))
+        )
+        assert stale == 0, f"{stale} events from abandoned forks remain"
+        print("  - no events from abandoned forks remain")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Reorg rewinds")
+    return True
+
+
+def test_lease_renewed_during_catch_up():
+    """Test that a long catch-up keeps its lease and stops if another process takes it."""
+    print("\n" + "=" * 80)
+    print("TEST: Lease Renewed During Catch-Up")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = StandInChain(seed=3)
+        for _ in range(100):
+            chain.add_block()
+
+        indexer = ChainIndexer(chain, batch_blocks=10, owner='indexer-a')
+        expiries = []
+        get_events = chain.get_events
+
+        def watch_lease(from_block, to_block):
+            cursor = db.session.get(ChainIndexCursor, ChainIndexer.NAME)
+            db.session.refresh(cursor)
+            expiries.append(cursor.lease_expires_at)
+            return get_events(from_block, to_block)
+
+        chain.get_events = watch_lease
+        start = datetime.utcnow() - timedelta(seconds=ChainIndexer.LEASE_SECONDS - 1)
+        stats = indexer.run_once(now=start)
+        assert stats['blocks'] == 100, f"Stats: {stats}"
+        assert all(e > start + timedelta(seconds=ChainIndexer.LEASE_SECONDS) for e in expiries[1:]), \
+            "The lease should be renewed after every batch"
+        print(f"  - lease renewed over {len(expiries)} batches")
+
+        for _ in range(50):
+            chain.add_block()
+
+        def steal_lease(from_block, to_block):
+            db.session.execute(
+                db.update(ChainIndexCursor).values(lease_owner='indexer-b',
+                                                   lease_expires_at=datetime.utcnow() + timedelta(minutes=2))
+            )
+            return get_events(from_block, to_block)
+
+        chain.get_events = steal_lease
+        stats = indexer.run_once()
+        assert stats['blocks'] == 10, f"Run should stop after the batch that lost the lease: {stats}"
+        cursor = db.session.get(ChainIndexCursor, ChainIndexer.NAME)
+        assert cursor.lease_owner == 'indexer-b', "The new owner's lease must survive"
+        print("  - a run that lost its lease stops after the current batch")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Lease renewed during catch-up")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 25 + "TACTIZEN CHAIN INDEXER TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_follows_event_stream,
+        test_reorg_rewinds,
+        test_lease_renewed_during_catch_up,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL CHAIN INDEXER TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,318 @@
+"""
+Test script for the on-chain publication outbox.
+Runs ChainPublisher against an in-process fake chain and checks in-order
+local nonce assignment, receipts, dropped and reordered transactions,
+foreign use of the signing key, and recovery after a publisher restart.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.extensions import db
+from app.models import ChainOutbox, ChainOutboxStatus, ChainAccount
+from app.services.chain_outbox_service import (
+    ChainOutboxService, ChainPublisher, NonceTooLowError, bytes_arg
+)
+from config import TestingConfig
+
+
+ADDRESS = '0x' + 'ab' * 20
+
+
+class FakeChain:
+    """
+    Minimal node: a mempool keyed by nonce, mined strictly in nonce order.
+    Transactions above a nonce gap wait in the mempool, like a real node.
+    """
+
+    def __init__(self):
+        self.address = ADDRESS
+        self.mined_nonce = 0          # Next nonce the chain will mine
+        self.mempool = {}             # nonce -> (tx_hash, gas_price)
+        self.receipts = {}            # tx_hash -> receipt
+        self.block = 100
+        self.current_gas_price = 1000
+        self.sent = []                # Broadcast nonces, in arrival order
+        self.calls = {'transaction_count': 0, 'gas_price': 0}
+        self.fail_sends = 0           # Next N broadcasts raise a connection error
+        self.crash_on_send = False
+
+    # -- client interface --
+
+    def transaction_count(self, block_identifier='pending'):
+        self.calls['transaction_count'] += 1
+        if block_identifier == 'latest':
+            return self.mined_nonce
+        nonce = self.mined_nonce
+        while nonce in self.mempool:
+            nonce += 1
+        return nonce
+
+    def gas_price(self):
+        self.calls['gas_price'] += 1
+        return self.current_gas_price
+
+    def sign_call(self, contract, function, args, nonce, gas, gas_price):
+        body = json.dumps([contract, function, [a.hex() if isinstance(a, bytes) else a for a in args],
+                           nonce, gas, gas_price])
+        return '0x' + hashlib.sha256(body.encode()).hexdigest(), '0x' + body.encode().hex()
+
+    def send_raw_transaction(self, raw_tx):
+        if self.crash_on_send:
+            raise KeyboardInterrupt("publisher killed")
+        if self.fail_sends:
+            self.fail_sends -= 1
+            raise ConnectionError("RPC unavailable")
+        _, _, _, nonce, _, gas_price = json.loads(bytes.fromhex(raw_tx[2:]))
+        tx_hash = '0x' + hashlib.sha256(bytes.fromhex(raw_tx[2:])).hexdigest()
+        if nonce < self.mined_nonce:
+            raise NonceTooLowError(f"nonce too low: {nonce} < {self.mined_nonce}")
+        existing = self.mempool.get(nonce)
+        if existing and existing[0] != tx_hash and gas_price < existing[1] * 1.1:
+            raise ValueError("replacement transaction underpriced")
+        self.mempool[nonce] = (tx_hash, gas_price)
+        self.sent.append(nonce)
+
+    def get_receipt(self, tx_hash):
+        return self.receipts.get(tx_hash)
+
+    # -- test controls --
+
+    def mine(self):
+        self.block += 1
+        while self.mined_nonce in self.mempool:
+            tx_hash, _ = self.mempool.pop(self.mined_nonce)
+            self.receipts[tx_hash] = {'status': 1, 'block_number': self.block, 'gas_used': 50000}
+            self.mined_nonce += 1
+
+    def drop(self, nonce):
+        self.mempool.pop(nonce, None)
+
+    def foreign_transaction(self):
+        """Someone else sends (and mines) a transaction with our key."""
+        self.mined_nonce = max(self.mined_nonce, self.transaction_count('pending')) + 1
+
+
+def _enqueue(count, start=1):
+    for i in range(start, start + count):
+        ChainOutboxService.enqueue(
+            f'party_election:{i}', 'election_results', 'publishResult',
+            [i, 0, 1, 1, 7, 10, 2, 'QmTest', bytes_arg('0x' + '11' * 32)]
+        )
+    db.session.commit()
+
+
+def _entries():
+    return db.session.scalars(db.select(ChainOutbox).order_by(ChainOutbox.id)).all()
+
+
+def test_publishes_in_order_with_local_nonces():
+    """Test that entries get consecutive local nonces and are confirmed from receipts."""
+    print("\n" + "=" * 80)
+    print("TEST: In-Order Publication")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        _enqueue(3)
+        _enqueue(1)  # Same key again: no duplicate
+        assert len(_entries()) == 3, "Enqueue should be idempotent per key"
+
+        stats = ChainPublisher(chain).run_once()
+        assert stats['submitted'] == 3, f"Expected 3 submitted, got {stats}"
+        assert [e.nonce for e in _entries()] == [0, 1, 2], "Nonces should follow enqueue order"
+        assert chain.calls['transaction_count'] == 1, "Node should be asked for the nonce once per run"
+        assert chain.calls['gas_price'] == 1, "Gas price should be fetched once per run"
+        assert db.session.get(ChainAccount, ADDRESS).next_nonce == 3
+
+        chain.mine()
+        stats = ChainPublisher(chain).run_once()
+        assert stats['confirmed'] == 3, f"Expected 3 confirmed, got {stats}"
+        for entry in _entries():
+            assert entry.status == ChainOutboxStatus.CONFIRMED and entry.block_number == 101
+        print("  - 3 entries published with nonces 0..2 and confirmed")
+
+        db.drop_all()
+
+    print("[PASS] In-order publication")
+    return True
+
+
+def test_dropped_and_reordered_transactions():
+    """Test that a dropped transaction is rebroadcast and unblocks the ones queued behind it."""
+    print("\n" + "=" * 80)
+    print("TEST: Dropped And Reordered Transactions")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        _enqueue(3)
+        now = datetime.utcnow()
+
+        ChainPublisher(chain).run_once(now)
+        chain.drop(0)   # Node lost nonce 0; 1 and 2 wait behind the gap
+        chain.mine()
+        assert chain.mined_nonce == 0, "Nothing should mine past the gap"
+
+        # Before RESUBMIT_AFTER nothing is resent
+        stats = ChainPublisher(chain).run_once(now + timedelta(seconds=10))
+        assert stats['rebroadcast'] == 0
+
+        later = now + timedelta(seconds=ChainPublisher.RESUBMIT_AFTER + 1)
+        stats = ChainPublisher(chain).run_once(later)
+        assert stats['rebroadcast'] >= 1, f"Dropped transaction not rebroadcast: {stats}"
+        assert chain.sent[:3] == [0, 1, 2] and 0 in chain.sent[3:], "Nonce 0 should arrive after 1 and 2"
+        chain.mine()
+
+        stats = ChainPublisher(chain).run_once(later + timedelta(seconds=1))
+        assert stats['confirmed'] == 3, f"Expected all 3 confirmed, got {stats}"
+        first = _entries()[0]
+        assert len(first.tx_hashes) == 2 and first.gas_price > 1000, "Rebroadcast should outbid the original"
+        print("  - dropped nonce 0 rebroadcast with higher gas; 1 and 2 mined after it")
+
+        db.drop_all()
+
+    print("[PASS] Dropped and reordered transactions")
+    return True
+
+
+def test_send_failures_back_off():
+    """Test that broadcast failures keep the nonce and retry with backoff."""
+    print("\n" + "=" * 80)
+    print("TEST: Broadcast Failure Backoff")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        _enqueue(2)
+        now = datetime.utcnow()
+
+        chain.fail_sends = 1
+        stats = ChainPublisher(chain).run_once(now)
+        first, second = _entries()
+        assert first.status == ChainOutboxStatus.SUBMITTED and first.nonce == 0
+        assert first.last_error and second.status == ChainOutboxStatus.PENDING, "Run should stop on RPC failure"
+
+        retry_at = first.next_attempt_at
+        assert retry_at <= now + timedelta(seconds=ChainPublisher.BACKOFF_BASE)
+        ChainPublisher(chain).run_once(retry_at)
+        chain.mine()
+        stats = ChainPublisher(chain).run_once(retry_at + timedelta(seconds=1))
+        assert stats['confirmed'] == 2, f"Expected both confirmed, got {stats}"
+        assert [e.nonce for e in _entries()] == [0, 1], "Nonce 0 must not be reassigned"
+        print("  - failed broadcast retried after backoff with the same nonce")
+
+        db.drop_all()
+
+    print("[PASS] Broadcast failure backoff")
+    return True
+
+
+def test_restart_recovery_and_foreign_nonces():
+    """Test recovery after a crash between signing and sending, and foreign key use."""
+    print("\n" + "=" * 80)
+    print("TEST: Restart Recovery")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        _enqueue(1)
+        now = datetime.utcnow()
+
+        # Publisher dies right after persisting the signed transaction
+        chain.crash_on_send = True
+        try:
+            ChainPublisher(chain, owner='worker-1').run_once(now)
+        except KeyboardInterrupt:
+            pass
+        db.session.rollback()
+        chain.crash_on_send = False
+        entry = _entries()[0]
+        assert entry.status == ChainOutboxStatus.SUBMITTED and entry.nonce == 0 and chain.sent == []
+
+        # Meanwhile the key is used elsewhere, and more results are queued
+        chain.foreign_transaction()
+        _enqueue(2, start=2)
+
+        later = now + timedelta(seconds=ChainPublisher.RESUBMIT_AFTER + 1)
+        stats = ChainPublisher(chain, owner='worker-2').run_once(later)
+        assert stats['requeued'] == 1, f"Entry whose nonce was taken should be requeued: {stats}"
+        nonces = sorted(e.nonce for e in _entries() if e.nonce is not None)
+        assert 0 not in nonces, f"Nonce 0 was used by another transaction: {nonces}"
+        chain.mine()
+
+        ChainPublisher(chain, owner='worker-2').run_once(later + timedelta(seconds=1))
+        ChainPublisher(chain, owner='worker-2').run_once(later + timedelta(seconds=2))
+        chain.mine()
+        ChainPublisher(chain, owner='worker-2').run_once(later + timedelta(seconds=3))
+        statuses = [e.status for e in _entries()]
+        assert statuses == [ChainOutboxStatus.CONFIRMED] * 3, f"Not all confirmed: {statuses}"
+        print("  - restarted publisher resumed without reusing nonces")
+
+        # Only one publisher at a time
+        holder = ChainPublisher(chain, owner='worker-3')
+        assert holder.acquire_lease(later)
+        assert ChainPublisher(chain, owner='worker-4').run_once(later) is None, "Lease not respected"
+        holder.release_lease()
+        print("  - lease keeps a second publisher out")
+
+        db.drop_all()
+
+    print("[PASS] Restart recovery")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 26 + "TACTIZEN CHAIN OUTBOX TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_publishes_in_order_with_local_nonces,
+        test_dropped_and_reordered_transactions,
+        test_send_failures_back_off,
+        test_restart_recovery_and_foreign_nonces,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL CHAIN OUTBOX TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
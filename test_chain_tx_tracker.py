@@ -0,0 +1,261 @@
+"""
+Test script for background confirmation of user blockchain transactions.
+Drives ChainTxWatcher against an in-process fake chain that advances one
+block at a time, checking that transactions are confirmed, reverted and
+expired as blocks arrive, that each outstanding hash is polled once per
+block, that game-side effects are applied exactly once (and retried after
+an error), and that routes answer 202 with a status URL.
+"""
+
+from datetime import datetime
+
+from app import create_app
+from app.extensions import db
+from app.models import PendingChainTx, PendingChainTxStatus
+from app.routes.chain_tx_routes import accepted_response
+from app.services.chain_tx_tracker import ChainTxTracker, ChainTxWatcher, ChainTxRejected
+from config import TestingConfig
+
+NOW = datetime(2026, 5, 1, 12, 0)
+
+
+def _hash(n):
+    return '0x' + f'{n:064x}'
+
+
+class FakeChain:
+    """A chain whose head only moves when the test says so."""
+
+    def __init__(self, head=100):
+        self.head = head
+        self.mined = {}         # tx_hash -> (block, status)
+        self.polls = {}         # tx_hash -> receipt requests
+
+    def advance(self, blocks=1):
+        self.head += blocks
+
+    def mine(self, tx_hash, status=1):
+        """Include a transaction in the next block."""
+        self.mined[tx_hash] = (self.head + 1, status)
+
+    def block_number(self):
+        return self.head
+
+    def get_receipt(self, tx_hash):
+        self.polls[tx_hash] = self.polls.get(tx_hash, 0) + 1
+        if tx_hash not in self.mined or self.mined[tx_hash][0] > self.head:
+            return None
+        block, status = self.mined[tx_hash]
+        return {'transactionHash': tx_hash, 'blockNumber': block, 'status': status, 'logs': []}
+
+
+class RecordingHandler:
+    """Stands in for an NFTService finalizer; fails the first `errors` calls."""
+
+    def __init__(self, errors=0, reject=False):
+        self.calls = []
+        self.errors = errors
+        self.reject = reject
+
+    def __call__(self, pending, receipt):
+        self.calls.append((pending.tx_hash, receipt['blockNumber']))
+        if self.reject:
+            raise ChainTxRejected("NFT not found or not owned by you.")
+        if self.errors:
+            self.errors -= 1
+            raise RuntimeError("database is locked")
+        return {'token_id': len(self.calls), 'message': 'done'}
+
+
+def _status(tx_hash):
+    db.session.expire_all()
+    return db.session.scalar(db.select(PendingChainTx).where(PendingChainTx.tx_hash == tx_hash)).status
+
+
+def test_confirm_revert_timeout():
+    """Test that the watcher confirms, reverts and expires transactions as blocks arrive."""
+    print("\n" + "=" * 80)
+    print("TEST: Confirm, Revert and Timeout")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        handler = RecordingHandler()
+        watcher = ChainTxWatcher(chain, handlers={'nft_mint': handler}, confirmations=2, timeout_blocks=5)
+
+        ok, reverted, lost = _hash(1), _hash(2), _hash(3)
+        for tx_hash in (ok, reverted, lost):
+            pending, error = ChainTxTracker.track('nft_mint', tx_hash, 1, {'wallet_address': '0xabc', 'tier': 1})
+            assert error is None and pending.status == PendingChainTxStatus.PENDING
+
+        stats = watcher.run_once(NOW)
+        assert stats['polled'] == 3 and not handler.calls
+        assert watcher.run_once(NOW) is None, "Same block must not be polled twice"
+        assert chain.polls == {ok: 1, reverted: 1, lost: 1}
+        print("  - one receipt poll per outstanding hash per block")
+
+        chain.mine(ok)
+        chain.mine(reverted, status=0)
+        chain.advance()                        # Both mined in block 101
+        watcher.run_once(NOW)
+        assert _status(reverted) == PendingChainTxStatus.FAILED
+        assert _status(ok) == PendingChainTxStatus.PENDING and not handler.calls
+        print("  - reverted transaction failed as soon as it was mined")
+
+        chain.advance()                        # One confirmation
+        watcher.run_once(NOW)
+        assert _status(ok) == PendingChainTxStatus.PENDING and not handler.calls
+        chain.advance()                        # Two confirmations
+        watcher.run_once(NOW)
+        assert _status(ok) == PendingChainTxStatus.CONFIRMED and handler.calls == [(ok, 101)]
+        confirmed = ChainTxTracker.get_for_user(ok, 1).to_dict()
+        assert confirmed['success'] and confirmed['token_id'] == 1 and confirmed['block_number'] == 101
+        print("  - mined transaction finalized after 2 confirmations")
+
+        assert _status(lost) == PendingChainTxStatus.PENDING
+        chain.advance(2)                       # 5 blocks since it was first seen
+        watcher.run_once(NOW)
+        assert _status(lost) == PendingChainTxStatus.EXPIRED
+        print("  - transaction without a receipt expired after 5 blocks")
+
+        polls = dict(chain.polls)
+        chain.advance()
+        assert ChainTxTracker.has_work() is False
+        assert watcher.run_once(NOW) == {'polled': 0, 'confirmed': 0, 'failed': 0, 'expired': 0}
+        assert chain.polls == polls and handler.calls == [(ok, 101)]
+        print("  - finalized transactions are not polled or applied again")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Confirm, revert and timeout")
+    return True
+
+
+def test_finalization_retries_and_rejections():
+    """Test that handler errors are retried, rejections fail, and tracking is idempotent."""
+    print("\n" + "=" * 80)
+    print("TEST: Finalization Retries and Rejections")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        chain = FakeChain()
+        flaky = RecordingHandler(errors=1)
+        rejecting = RecordingHandler(reject=True)
+        watcher = ChainTxWatcher(chain, handlers={'market_buy': flaky, 'market_list': rejecting}, confirmations=1)
+
+        buy, listing = _hash(10), _hash(11)
+        ChainTxTracker.track('market_buy', buy, 7, {'wallet_address': '0xabc', 'listing_id': 3})
+        ChainTxTracker.track('market_list', listing, 7, {'wallet_address': '0xabc', 'nft_id': 4, 'price_zen': '10'})
+
+        again, error = ChainTxTracker.track('market_buy', buy.upper().replace('0X', '0x'), 7, {})
+        assert error is None and again.tx_hash == buy
+        _, error = ChainTxTracker.track('market_buy', buy, 8, {})
+        assert error, "Another user must not claim a tracked hash"
+        _, error = ChainTxTracker.track('market_buy', '0x1234', 7, {})
+        assert error == "Invalid transaction hash."
+        assert db.session.scalar(db.select(db.func.count()).select_from(PendingChainTx)) == 2
+        print("  - re-submitting a hash returns the same row; malformed or foreign hashes are refused")
+
+        chain.mine(buy)
+        chain.mine(listing)
+        chain.advance(2)
+        watcher.run_once(NOW)
+        row = ChainTxTracker.get_for_user(buy, 7)
+        assert row.status == PendingChainTxStatus.PENDING and row.attempts == 1 and 'locked' in row.error
+        assert _status(listing) == PendingChainTxStatus.FAILED
+        assert ChainTxTracker.get_for_user(listing, 7).to_dict()['error'] == "NFT not found or not owned by you."
+        print("  - handler error left the transaction pending; rejection failed it")
+
+        chain.advance()
+        watcher.run_once(NOW)
+        assert _status(buy) == PendingChainTxStatus.CONFIRMED and len(flaky.calls) == 2
+        assert len(rejecting.calls) == 1
+        print("  - retried on the next block and applied once")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Finalization retries and rejections")
+    return True
+
+
+def test_accepted_response():
+    """Test the 202 response and the status payload clients poll."""
+    print("\n" + "=" * 80)
+    print("TEST: Accepted Response")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        pending, _ = ChainTxTracker.track('nft_upgrade', _hash(20), 5, {'wallet_address': '0xabc', 'nft_ids': [1, 2, 3]})
+
+        with app.test_request_context():
+            response = accepted_response(pending)
+            body = response.get_json()
+            assert response.status_code == 202
+            assert response.headers['Location'] == f'/api/chain-tx/{_hash(20)}' == body['status_url']
+            assert body['pending'] and body['status'] == 'pending' and not body['success']
+            print(f"  - 202 with Location {response.headers['Location'][:30]}...")
+
+            pending.status = PendingChainTxStatus.CONFIRMED
+            pending.result = {'message': 'Successfully upgraded to Q2 NFT!'}
+            db.session.commit()
+            body, status = accepted_response(pending)
+            assert status == 200 and body.get_json()['success'] and 'pending' not in body.get_json()
+            print("  - a retried request for a finalized hash gets the final result")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Accepted response")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 23 + "TACTIZEN CHAIN TX TRACKER TESTS" + " " * 24 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_confirm_revert_timeout,
+        test_finalization_retries_and_rejections,
+        test_accepted_response,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL CHAIN TX TRACKER TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
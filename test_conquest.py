@@ -0,0 +1,276 @@
+"""
+Test script for set-based conquest and liberation.
+Conquers a small and a large country (companies with employees, job offers,
+work history, a president and a minister) and checks that both cost the same
+number of statements, that every worker is fired with their work history
+kept, every job offer closed and company frozen, and that every worker,
+owner, office holder and citizen gets exactly one alert. Then liberates the
+large country and checks companies are unfrozen and the liberator becomes
+President.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import event, func, insert, select
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, Country, Company, CompanyType, Employment, JobOffer, WorkSession, Alert,
+    CountryPresident, Minister, MinistryType,
+)
+from app.services.conquest_service import ConquestService
+from config import TestingConfig
+
+
+class ConquestConfig(TestingConfig):
+    # Scheduler jobs would share (and roll back) the in-memory connection
+    SCHEDULER_ENABLED = False
+
+
+# Statement budget for conquering a country, whatever its size
+MAX_CONQUEST_STATEMENTS = 40
+
+
+def _build_country(name, code, companies, employees_per_company, first_user):
+    """Country whose citizens own `companies` companies with employees, offers and work history."""
+    country = Country(name=name, currency_code=code)
+    db.session.add(country)
+    db.session.flush()
+
+    user_count = companies * (employees_per_company + 1)
+    db.session.execute(insert(User), [
+        {'wallet_address': f'0x{first_user + i:040x}', 'username': f'{code.lower()}{i}',
+         'citizenship_id': country.id}
+        for i in range(user_count)
+    ])
+    user_ids = db.session.scalars(
+        select(User.id).where(User.citizenship_id == country.id).order_by(User.id)
+    ).all()
+    owner_ids, worker_ids = user_ids[:companies], user_ids[companies:]
+
+    db.session.execute(insert(Company), [
+        {'name': f'{name} Works {i}', 'company_type': CompanyType.MINING, 'owner_id': owner_id,
+         'country_id': country.id}
+        for i, owner_id in enumerate(owner_ids)
+    ])
+    company_ids = db.session.scalars(
+        select(Company.id).where(Company.country_id == country.id).order_by(Company.id)
+    ).all()
+
+    db.session.execute(insert(JobOffer), [
+        {'company_id': company_id, 'wage_per_pp': Decimal('1.5'), 'positions': 3}
+        for company_id in company_ids
+    ])
+    db.session.execute(insert(Employment), [
+        {'company_id': company_ids[i % companies], 'user_id': user_id, 'wage_per_pp': Decimal('1.5')}
+        for i, user_id in enumerate(worker_ids)
+    ])
+    employments = db.session.execute(
+        select(Employment.id, Employment.company_id, Employment.user_id)
+        .where(Employment.company_id.in_(company_ids))
+    ).all()
+    db.session.execute(insert(WorkSession), [
+        {'user_id': user_id, 'company_id': company_id, 'employment_id': employment_id,
+         'hours_worked': 4, 'skill_level': 1.0, 'production_points': 4.0, 'wage_per_pp': Decimal('1.5'),
+         'total_payment': Decimal('6'), 'energy_spent': 10, 'wellness_spent': 10, 'work_date': date.today()}
+        for employment_id, company_id, user_id in employments
+    ])
+
+    db.session.add(CountryPresident(country_id=country.id, user_id=owner_ids[0], term_start=datetime.utcnow(),
+                                    term_end=datetime.utcnow() + timedelta(days=30)))
+    db.session.add(Minister(country_id=country.id, user_id=worker_ids[0], ministry_type=MinistryType.DEFENCE,
+                            appointed_by_user_id=owner_ids[0]))
+    db.session.commit()
+    return country.id, company_ids, len(user_ids), len(worker_ids)
+
+
+def _conquer_counting_statements(app, country_id, conqueror_id):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    db.session.expire_all()
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        assert ConquestService.conquer_country(country_id, conqueror_id, None), "Conquest should succeed"
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return len(statements)
+
+
+def _alert_count(title=None):
+    query = select(func.count(Alert.id))
+    if title:
+        query = query.where(Alert.title == title)
+    return db.session.scalar(query)
+
+
+def test_conquest_is_set_based():
+    """Test that conquest fires, freezes and alerts with the same statements for any country size."""
+    print("\n" + "=" * 80)
+    print("TEST: Conquest Is Set-Based")
+    print("=" * 80)
+
+    app = create_app(ConquestConfig)
+
+    with app.app_context():
+        db.create_all()
+        conqueror = Country(name='Conqueria', currency_code='CNQ')
+        db.session.add(conqueror)
+        db.session.commit()
+        conqueror_id = conqueror.id
+
+        small_id, small_companies, small_citizens, small_workers = _build_country('Smallia', 'SML', 2, 3, 0)
+        large_id, large_companies, large_citizens, large_workers = _build_country('Largia', 'LRG', 50, 40, 10000)
+        bystander_id, bystander_companies, _, bystander_workers = _build_country('Bystandia', 'BYS', 3, 2, 50000)
+        total_sessions = db.session.scalar(select(func.count(WorkSession.id)))
+
+        small_count = _conquer_counting_statements(app, small_id, conqueror_id)
+        alerts_after_small = _alert_count()
+        large_count = _conquer_counting_statements(app, large_id, conqueror_id)
+        print(f"  - {small_workers} workers: {small_count} statements")
+        print(f"  - {large_workers} workers: {large_count} statements")
+        assert small_count == large_count, "Conquest statement count grows with the country size"
+        assert large_count <= MAX_CONQUEST_STATEMENTS, f"Conquest runs {large_count} statements"
+
+        # Workers fired, work history kept
+        assert db.session.scalar(
+            select(func.count(Employment.id)).where(Employment.company_id.in_(small_companies + large_companies))
+        ) == 0, "All workers of the conquered countries should be fired"
+        assert db.session.scalar(select(func.count(WorkSession.id))) == total_sessions, "Work history should be kept"
+        assert db.session.scalar(
+            select(func.count(WorkSession.id)).where(WorkSession.company_id.in_(large_companies),
+                                                     WorkSession.employment_id.isnot(None))
+        ) == 0, "Work sessions should no longer point at deleted employments"
+
+        # Offers closed, companies frozen
+        assert db.session.scalar(
+            select(func.count(JobOffer.id)).where(JobOffer.company_id.in_(large_companies), JobOffer.is_active == True)
+        ) == 0, "All job offers should be closed"
+        assert db.session.scalar(
+            select(func.count(Company.id)).where(Company.id.in_(large_companies), Company.is_frozen == False)
+        ) == 0, "All companies should be frozen"
+
+        # The bystander country is untouched
+        assert db.session.scalar(
+            select(func.count(Employment.id)).where(Employment.company_id.in_(bystander_companies))
+        ) == bystander_workers
+        assert db.session.scalar(
+            select(func.count(Company.id)).where(Company.id.in_(bystander_companies), Company.is_frozen == True)
+        ) == 0
+
+        # Government cleared
+        assert db.session.scalar(
+            select(func.count(CountryPresident.id)).where(CountryPresident.country_id == large_id,
+                                                          CountryPresident.is_current == True)
+        ) == 0, "The president should be removed"
+        president = db.session.scalar(select(CountryPresident).where(CountryPresident.country_id == large_id))
+        assert president.left_office_reason == 'country_conquered'
+        assert db.session.scalar(
+            select(func.count(Minister.id)).where(Minister.country_id == large_id, Minister.is_active == True)
+        ) == 0, "Ministers should be removed"
+
+        # One alert per worker, owner, office holder and citizen
+        expected_small = small_workers + len(small_companies) + 2 + small_citizens
+        expected_large = large_workers + len(large_companies) + 2 + large_citizens
+        assert alerts_after_small == expected_small, f"Expected {expected_small} alerts, got {alerts_after_small}"
+        assert _alert_count() == expected_small + expected_large
+        assert _alert_count(title="Employment Terminated - Country Conquered") == small_workers + large_workers
+        sample = db.session.scalar(
+            select(Alert).where(Alert.title == "Company Frozen - Country Conquered").order_by(Alert.id.desc())
+        )
+        assert sample.content.startswith("Your company Largia Works "), sample.content
+        assert "Largia was conquered" in sample.content
+        assert sample.alert_type == 'company' and sample.is_read is False and sample.is_deleted is False
+
+        # Conquering twice is refused
+        assert not ConquestService.conquer_country(large_id, conqueror_id, None)
+
+        db.drop_all()
+
+    print("[PASS] Conquest is set-based")
+    return True
+
+
+def test_liberation_restores_companies():
+    """Test that liberation unfreezes companies, alerts owners and citizens and seats the liberator."""
+    print("\n" + "=" * 80)
+    print("TEST: Liberation Restores Companies")
+    print("=" * 80)
+
+    app = create_app(ConquestConfig)
+
+    with app.app_context():
+        db.create_all()
+        conqueror = Country(name='Conqueria', currency_code='CNQ')
+        db.session.add(conqueror)
+        db.session.commit()
+
+        country_id, company_ids, citizens, _ = _build_country('Largia', 'LRG', 20, 10, 10000)
+        assert ConquestService.conquer_country(country_id, conqueror.id, None)
+        alerts_before = _alert_count()
+
+        liberator = db.session.scalar(select(User).where(User.citizenship_id == country_id).order_by(User.id.desc()))
+        assert ConquestService.liberate_country(country_id, liberator.id)
+
+        assert db.session.get(Country, country_id).is_conquered is False
+        assert db.session.scalar(
+            select(func.count(Company.id)).where(Company.id.in_(company_ids), Company.is_frozen == True)
+        ) == 0, "All companies should be unfrozen"
+        assert _alert_count() - alerts_before == len(company_ids) + citizens + 1, \
+            "Owners, citizens and the liberator should be alerted"
+        assert _alert_count(title="Company Operations Restored") == len(company_ids)
+        assert _alert_count(title="You Are Now President!") == 1
+        president = db.session.scalar(
+            select(CountryPresident).where(CountryPresident.country_id == country_id,
+                                           CountryPresident.is_current == True)
+        )
+        assert president.user_id == liberator.id and president.became_president_via == 'liberation'
+
+        db.drop_all()
+
+    print("[PASS] Liberation restores companies")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 30 + "TACTIZEN CONQUEST TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_conquest_is_set_based,
+        test_liberation_restores_companies,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL CONQUEST TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,228 @@
+"""
+Test script for the in-process Groth16 verifier.
+Verifies pairing correctness against the snarkjs verification keys and
+checks valid / known-bad proofs.
+"""
+
+import glob
+import json
+import os
+import random
+
+from app.services.groth16_verifier import (
+    Groth16Verifier, G1_GENERATOR, G2_GENERATOR, CURVE_ORDER,
+    g1_mul, g2_mul, pairing, parse_f12, f12_mul, f12_pow, f12_one
+)
+
+
+CIRCUITS_DIR = os.path.join('app', 'static', 'circuits')
+
+# snarkjs (ffjavascript) uses the Fuentes-Castaneda final exponentiation,
+# which yields our pairing raised to 2u(6u^2 + 3u + 1)
+BN_U = 4965661367192848881
+SNARKJS_EXPONENT = 2 * BN_U * (6 * BN_U * BN_U + 3 * BN_U + 1)
+
+
+def _g1_json(pt):
+    return [str(pt[0]), str(pt[1]), '1']
+
+
+def _g2_json(pt):
+    return [[str(pt[0][0]), str(pt[0][1])], [str(pt[1][0]), str(pt[1][1])], ['1', '0']]
+
+
+def _trapdoor_setup(n_public=5, seed=7):
+    """Build a verification key with known toxic waste and a matching proof."""
+    rnd = random.Random(seed)
+    alpha, beta, gamma, delta = [rnd.randrange(1, CURVE_ORDER) for _ in range(4)]
+    ic = [rnd.randrange(1, CURVE_ORDER) for _ in range(n_public + 1)]
+
+    vk = {
+        'protocol': 'groth16',
+        'curve': 'bn128',
+        'nPublic': n_public,
+        'vk_alpha_1': _g1_json(g1_mul(G1_GENERATOR, alpha)),
+        'vk_beta_2': _g2_json(g2_mul(G2_GENERATOR, beta)),
+        'vk_gamma_2': _g2_json(g2_mul(G2_GENERATOR, gamma)),
+        'vk_delta_2': _g2_json(g2_mul(G2_GENERATOR, delta)),
+        'IC': [_g1_json(g1_mul(G1_GENERATOR, k)) for k in ic],
+    }
+
+    signals = [rnd.randrange(CURVE_ORDER) for _ in range(n_public)]
+    x = (ic[0] + sum(s * k for s, k in zip(signals, ic[1:]))) % CURVE_ORDER
+    r_a, r_b = rnd.randrange(1, CURVE_ORDER), rnd.randrange(1, CURVE_ORDER)
+    # a*b = alpha*beta + x*gamma + c*delta
+    c = (r_a * r_b - alpha * beta - x * gamma) * pow(delta, -1, CURVE_ORDER) % CURVE_ORDER
+
+    proof = {
+        'pi_a': _g1_json(g1_mul(G1_GENERATOR, r_a)),
+        'pi_b': _g2_json(g2_mul(G2_GENERATOR, r_b)),
+        'pi_c': _g1_json(g1_mul(G1_GENERATOR, c)),
+        'protocol': 'groth16',
+        'curve': 'bn128',
+    }
+    return vk, proof, [str(s) for s in signals]
+
+
+def test_pairing_bilinearity():
+    """Test e(2P, Q) == e(P, 2Q) == e(P, Q)^2 and e has order r."""
+    print("\n" + "=" * 80)
+    print("TEST: Pairing Bilinearity")
+    print("=" * 80)
+
+    e = pairing(G1_GENERATOR, G2_GENERATOR)
+    assert e != f12_one(), "Pairing must be non-degenerate"
+    assert pairing(g1_mul(G1_GENERATOR, 2), G2_GENERATOR) == f12_mul(e, e), "e(2P, Q) != e(P, Q)^2"
+    assert pairing(G1_GENERATOR, g2_mul(G2_GENERATOR, 2)) == f12_mul(e, e), "e(P, 2Q) != e(P, Q)^2"
+    assert f12_pow(e, CURVE_ORDER) == f12_one(), "e(P, Q)^r != 1"
+
+    print("[PASS] Pairing is bilinear and non-degenerate")
+    return True
+
+
+def test_circuit_keys_match_snarkjs():
+    """Test e(alpha, beta) against vk_alphabeta_12 for every compiled circuit."""
+    print("\n" + "=" * 80)
+    print("TEST: Circuit Verification Keys")
+    print("=" * 80)
+
+    paths = sorted(glob.glob(os.path.join(CIRCUITS_DIR, '*_verification_key.json')))
+    assert paths, "No verification keys found"
+
+    for path in paths:
+        with open(path) as f:
+            vk = json.load(f)
+        verifier = Groth16Verifier(vk)
+        expected = parse_f12(vk['vk_alphabeta_12'])
+        assert f12_pow(verifier.alphabeta, SNARKJS_EXPONENT % CURVE_ORDER) == expected, \
+            f"e(alpha, beta) mismatch for {os.path.basename(path)}"
+        print(f"  - {os.path.basename(path)}: OK")
+
+    print("[PASS] Precomputed e(alpha, beta) matches snarkjs for all circuits")
+    return True
+
+
+def test_circuit_proof_fixtures():
+    """Test proofs exported by snarkjs next to the circuits (<name>_proof.json + <name>_public.json)."""
+    print("\n" + "=" * 80)
+    print("TEST: snarkjs Proof Fixtures")
+    print("=" * 80)
+
+    fixtures = sorted(glob.glob(os.path.join('circuits', '*_proof.json')))
+    if not fixtures:
+        print("  - No proof fixtures in circuits/ (generate with snarkjs groth16 fullprove)")
+
+    for proof_path in fixtures:
+        name = os.path.basename(proof_path)[:-len('_proof.json')]
+        with open(proof_path) as f:
+            proof = json.load(f)
+        with open(os.path.join('circuits', f'{name}_public.json')) as f:
+            public_signals = json.load(f)
+
+        verifier = Groth16Verifier.from_file(os.path.join(CIRCUITS_DIR, f'{name}_verification_key.json'))
+        assert verifier.verify(proof, public_signals), f"{name}: valid proof rejected"
+
+        tampered = list(public_signals)
+        tampered[-1] = str((int(tampered[-1]) + 1) % CURVE_ORDER)
+        assert not verifier.verify(proof, tampered), f"{name}: tampered signals accepted"
+        print(f"  - {name}: OK")
+
+    print("[PASS] snarkjs proof fixtures verified")
+    return True
+
+
+def test_valid_proof():
+    """Test that a correctly constructed proof verifies."""
+    print("\n" + "=" * 80)
+    print("TEST: Valid Proof")
+    print("=" * 80)
+
+    vk, proof, signals = _trapdoor_setup()
+    verifier = Groth16Verifier(vk)
+    assert verifier.verify(proof, signals), "Valid proof rejected"
+
+    # Hex-encoded inputs (as sent by the vote route) are accepted too
+    hex_signals = [hex(int(s)) for s in signals]
+    assert verifier.verify(proof, hex_signals), "Hex public signals rejected"
+
+    print("[PASS] Valid proof accepted")
+    return True
+
+
+def test_known_bad_proofs():
+    """Test that tampered and malformed proofs are rejected."""
+    print("\n" + "=" * 80)
+    print("TEST: Known-Bad Proofs")
+    print("=" * 80)
+
+    vk, proof, signals = _trapdoor_setup()
+    verifier = Groth16Verifier(vk)
+
+    tampered_signals = list(signals)
+    tampered_signals[2] = str((int(tampered_signals[2]) + 1) % CURVE_ORDER)
+
+    off_curve = dict(proof, pi_a=[proof['pi_a'][0], str(int(proof['pi_a'][1]) + 1), '1'])
+    swapped = dict(proof, pi_a=proof['pi_c'], pi_c=proof['pi_a'])
+    infinity_a = dict(proof, pi_a=['0', '1', '0'])
+    out_of_range = [str(int(signals[0]) + CURVE_ORDER)] + signals[1:]
+
+    cases = {
+        'tampered public signal': (proof, tampered_signals),
+        'A not on curve': (off_curve, signals),
+        'A and C swapped': (swapped, signals),
+        'A at infinity': (infinity_a, signals),
+        'signal >= r': (proof, out_of_range),
+        'too few signals': (proof, signals[:-1]),
+        'garbage signal': (proof, ['abc'] + signals[1:]),
+        'missing pi_b': ({'pi_a': proof['pi_a'], 'pi_c': proof['pi_c']}, signals),
+    }
+
+    for label, (bad_proof, bad_signals) in cases.items():
+        assert not verifier.verify(bad_proof, bad_signals), f"Accepted bad proof: {label}"
+        print(f"  - {label}: rejected")
+
+    print("[PASS] All known-bad proofs rejected")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 22 + "TACTIZEN GROTH16 VERIFIER TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_pairing_bilinearity,
+        test_circuit_keys_match_snarkjs,
+        test_circuit_proof_fixtures,
+        test_valid_proof,
+        test_known_bad_proofs,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL GROTH16 VERIFIER TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
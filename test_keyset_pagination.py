@@ -0,0 +1,222 @@
+"""
+Test script for keyset (cursor) pagination.
+Checks cursor encoding and rejection of malformed cursors, walks a paged
+marketplace listing to check every row is returned exactly once in order
+(including ties on the sort column), and loads 1M synthetic alerts to
+check that fetching page 1,000 takes about as long as page 1.
+"""
+
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app import create_app
+from app.extensions import db
+from app.models import Alert
+from app.models.nft import NFTInventory, NFTMarketplace
+from app.pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_paginate
+from app.services.nft_service import NFTService
+from config import TestingConfig
+
+BASE = datetime(2026, 1, 1)
+ALERT_ROWS = 1_000_000
+PAGE_SIZE = 20
+
+
+def _median_seconds(fn, repeats=25):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def test_cursor_roundtrip():
+    """Test that cursors round-trip every sort value type and reject garbage."""
+    print("\n" + "=" * 80)
+    print("TEST: Cursor Roundtrip")
+    print("=" * 80)
+
+    for value in (datetime(2026, 3, 4, 5, 6, 7, 890), Decimal('12.50000000'), 3, 'abc'):
+        cursor = encode_cursor(value, 42)
+        assert decode_cursor(cursor) == (value, 42), f"{value!r} did not round-trip"
+        assert '=' not in cursor and '/' not in cursor and '+' not in cursor
+    print("  - datetime, Decimal, int and str sort values round-trip")
+
+    for bad in ('not-a-cursor!', encode_cursor(1, 1)[:-3], 'W10', 'WzEsInNpeCJd', 'W3siZHQiOiJ4In0sMV0'):
+        try:
+            decode_cursor(bad)
+            assert False, f"{bad!r} should be rejected"
+        except InvalidCursor:
+            pass
+    print("  - malformed cursors raise InvalidCursor")
+
+    print("[PASS] Cursor roundtrip")
+    return True
+
+
+def test_marketplace_pages_cover_all_listings():
+    """Test that walking marketplace pages returns every listing once, in order."""
+    print("\n" + "=" * 80)
+    print("TEST: Marketplace Pages Cover All Listings")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        for i in range(1, 131):
+            nft = NFTInventory(
+                id=i, user_id=1 + i % 7, nft_type='player' if i % 2 else 'company', category='combat_boost',
+                tier=1 + i % 5, bonus_value=5, token_id=i, contract_address='0x' + '0' * 40, acquired_via='drop'
+            )
+            db.session.add(nft)
+            db.session.add(NFTMarketplace(
+                id=i, nft_id=i, seller_id=nft.user_id, price_zen=Decimal(10 + i % 9),
+                listed_at=BASE + timedelta(minutes=i // 4),  # Several listings share a timestamp
+                is_active=i % 10 != 0
+            ))
+        db.session.commit()
+        active = {i for i in range(1, 131) if i % 10 != 0}
+
+        for sort_by, sort_order, key in (
+            ('listed_at', 'desc', lambda l: (l.listed_at, l.id)),
+            ('price_zen', 'asc', lambda l: (l.price_zen, l.id)),
+            ('tier', 'desc', lambda l: (l.nft.tier, l.id)),
+        ):
+            seen, cursor, pages = [], None, 0
+            while True:
+                page = NFTService.get_marketplace_listings(sort_by=sort_by, sort_order=sort_order, cursor=cursor, limit=8)
+                seen.extend(page.items)
+                pages += 1
+                if not page.has_more:
+                    break
+                cursor = page.next_cursor
+
+            ids = [listing.id for listing in seen]
+            assert len(ids) == len(set(ids)) and set(ids) == active, f"{sort_by}: rows skipped or repeated"
+            keys = [key(listing) for listing in seen]
+            assert keys == sorted(keys, reverse=sort_order == 'desc'), f"{sort_by}: rows out of order"
+            print(f"  - sort_by={sort_by} {sort_order}: {len(ids)} listings over {pages} pages, in order")
+
+        page = NFTService.get_marketplace_listings(nft_type='player', min_tier=3, limit=100)
+        assert all(l.nft.nft_type == 'player' and l.nft.tier >= 3 for l in page.items) and not page.has_more
+        print("  - filters apply to paged results")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Marketplace pages cover all listings")
+    return True
+
+
+def test_deep_page_time_is_flat():
+    """Test that page 1,000 of 1M alerts costs about the same as page 1."""
+    print("\n" + "=" * 80)
+    print("TEST: Deep Page Time Is Flat")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+
+        start = time.perf_counter()
+        chunk = 50_000
+        for offset in range(0, ALERT_ROWS, chunk):
+            db.session.execute(db.insert(Alert), [
+                {
+                    'user_id': 1 + n % 4,  # One user in four owns a 250k-alert feed
+                    'alert_type': 'system',
+                    'priority': 'normal',
+                    'title': f'Alert {n}',
+                    'content': 'Synthetic alert',
+                    'is_read': False,
+                    'is_deleted': n % 50 == 0,
+                    'created_at': BASE + timedelta(seconds=n // 8),  # Runs of equal timestamps
+                }
+                for n in range(offset, offset + chunk)
+            ])
+        db.session.commit()
+        print(f"  - inserted {ALERT_ROWS:,} alerts in {time.perf_counter() - start:.1f}s")
+
+        feed = db.select(Alert).where(Alert.user_id == 1, Alert.is_deleted == False)
+
+        # Walk to page 1,000 following cursors, checking order and uniqueness on the way
+        cursors = [None]
+        last_key, seen = None, set()
+        for _ in range(1000):
+            page = keyset_paginate(feed, Alert.created_at, Alert.id, cursor=cursors[-1], limit=PAGE_SIZE)
+            assert len(page.items) == PAGE_SIZE and page.has_more
+            for alert in page.items:
+                key = (alert.created_at, alert.id)
+                assert last_key is None or key < last_key, "Feed not strictly newest first"
+                assert alert.id not in seen
+                last_key = key
+                seen.add(alert.id)
+            cursors.append(page.next_cursor)
+            db.session.expunge_all()
+        print(f"  - walked 1,000 pages: {len(seen):,} distinct alerts, strictly newest first")
+
+        def fetch(cursor):
+            keyset_paginate(feed, Alert.created_at, Alert.id, cursor=cursor, limit=PAGE_SIZE)
+            db.session.expunge_all()
+
+        first = _median_seconds(lambda: fetch(cursors[0]))
+        deep = _median_seconds(lambda: fetch(cursors[999]))
+        offset_deep = _median_seconds(lambda: db.session.scalars(
+            feed.order_by(Alert.created_at.desc(), Alert.id.desc()).offset(999 * PAGE_SIZE).limit(PAGE_SIZE)
+        ).all(), repeats=5)
+        print(f"  - page 1: {first * 1000:.2f}ms, page 1,000: {deep * 1000:.2f}ms "
+              f"(OFFSET page 1,000: {offset_deep * 1000:.2f}ms)")
+        assert deep < max(first * 3, first + 0.005), \
+            f"Page 1,000 took {deep * 1000:.2f}ms vs {first * 1000:.2f}ms for page 1"
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Deep page time is flat")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 22 + "TACTIZEN KEYSET PAGINATION TESTS" + " " * 24 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_cursor_roundtrip,
+        test_marketplace_pages_cover_all_listings,
+        test_deep_page_time_is_flat,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL KEYSET PAGINATION TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
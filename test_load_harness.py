@@ -0,0 +1,156 @@
+"""
+Test script for the synthetic load test (scripts/load_harness.py).
+Seeds a small world, checks that seeding is idempotent, drives every
+behaviour through the test client and checks that each one reaches its
+endpoints without server errors and with query counts recorded. Then checks
+that comparing against a baseline flags slower, chattier and failing
+endpoints.
+"""
+
+import copy
+import os
+import sys
+import tempfile
+
+from sqlalchemy import func, select
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+import load_harness
+from app.extensions import db
+from app.models import User, Employment, PartyMembership
+
+
+# Endpoints each behaviour should reach
+BEHAVIOUR_ENDPOINTS = {
+    'work': {'company.my_companies', 'company.work'},
+    'train': {'main.training'},
+    'trade': {'main.marketplace', 'main.market_buy'},
+    'fight': {'main.battle_screen', 'main.fight'},
+    'read_news': {'main.view_newspaper', 'main.view_article'},
+    'message': {'main.messages', 'main.send_message'},
+    'vote': {'party.detail', 'party.vote'},
+}
+
+
+def test_seed_and_drive_every_behaviour():
+    """Test that a seeded world serves every behaviour without server errors."""
+    print("\n" + "=" * 80)
+    print("TEST: Seed And Drive Every Behaviour")
+    print("=" * 80)
+
+    workdir = tempfile.mkdtemp(prefix='test_load_test_')
+    app = load_harness.create_load_test_app('sqlite:///' + os.path.join(workdir, 'load.db'),
+                                         os.path.join(workdir, 'logs'))
+
+    with app.app_context():
+        assert load_harness.seed_world(45, 2), "First run should seed"
+        assert not load_harness.seed_world(45, 2), "Second run should reuse the seeded world"
+        assert db.session.scalar(select(func.count(User.id)).where(User.username.like('loadtest%'))) == 45
+        # Every player but the company owners has a job; everyone is in a party
+        assert db.session.scalar(select(func.count(Employment.id))) == 45 - 4
+        assert db.session.scalar(select(func.count()).select_from(PartyMembership)) == 45
+
+        load_harness.reset_players()
+        world = load_harness.load_world()
+        db.session.remove()
+
+    assert len(world['players']) == 45 and len(world['countries']) == 2
+    assert world['battle_id'], "Two countries should be at war"
+    for country in world['countries'].values():
+        assert country['resources'] and country['party_id'] and country['article_ids']
+
+    for behaviour, endpoints in BEHAVIOUR_ENDPOINTS.items():
+        weights = {name: int(name == behaviour) for name in load_harness.BEHAVIOURS}
+        stats, _, sent = load_harness.run_load(app, world, weights, 12, None, 2, 1)
+        summary = load_harness.summarize(stats, 1.0, sent)
+        print(f"  - {behaviour}: {sent} requests to {', '.join(summary['endpoints'])}")
+        assert endpoints <= set(summary['endpoints']), f"{behaviour} reached {set(summary['endpoints'])}"
+        assert summary['errors'] == 0, f"{behaviour} caused server errors: {summary['endpoints']}"
+        for endpoint, row in summary['endpoints'].items():
+            assert row['mean_queries'] is not None, f"{endpoint} reported no query count"
+            assert row['p50_ms'] <= row['p95_ms'] <= row['p99_ms']
+
+    with app.app_context():
+        db.engine.dispose()
+
+    print("[PASS] Seed and drive every behaviour")
+    return True
+
+
+def test_compare_flags_regressions():
+    """Test that comparing with a baseline flags latency, query and error regressions only."""
+    print("\n" + "=" * 80)
+    print("TEST: Compare Flags Regressions")
+    print("=" * 80)
+
+    row = {'count': 100, 'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0,
+           'mean_queries': 12.0, 'max_queries': 14, 'statuses': {'2xx': 100}}
+    baseline = {'results': {'throughput_rps': 50.0, 'endpoints': {
+        'main.fight': dict(row), 'main.training': dict(row), 'main.messages': dict(row),
+    }}}
+
+    assert load_harness.compare(baseline, copy.deepcopy(baseline), 0.25, 0.1) == []
+
+    current = copy.deepcopy(baseline)
+    current['results']['endpoints']['main.fight']['p95_ms'] = 24.0  # within tolerance
+    current['results']['endpoints']['main.training']['p95_ms'] = 40.0
+    current['results']['endpoints']['main.messages']['mean_queries'] = 20.0
+    current['results']['endpoints']['main.messages']['statuses'] = {'2xx': 98, '5xx': 2}
+    current['results']['throughput_rps'] = 30.0
+    regressions = load_harness.compare(baseline, current, 0.25, 0.1)
+    for line in regressions:
+        print(f"  - {line}")
+
+    assert not any(line.startswith('main.fight') for line in regressions)
+    assert any(line.startswith('main.training: p95') for line in regressions)
+    assert any(line.startswith('main.messages: 12.0 -> 20.0 queries') for line in regressions)
+    assert any(line.startswith('main.messages: 0 -> 2 server errors') for line in regressions)
+    assert any(line.startswith('throughput') for line in regressions)
+    assert len(regressions) == 4
+
+    assert load_harness.percentile([1, 2, 3, 4], 50) == 2
+    assert load_harness.percentile([1, 2, 3, 4], 99) == 4
+
+    print("[PASS] Compare flags regressions")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 29 + "TACTIZEN LOAD TEST TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_seed_and_drive_every_behaviour,
+        test_compare_flags_regressions,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL LOAD TEST TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,204 @@
+"""
+Test script for the non-blocking log pipeline.
+Checks that queued records all reach their files with one flush per batch,
+that a full queue drops (and counts and reports) records instead of
+blocking, and that security events are bulk-inserted into security_logs by
+the writer thread.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+
+from app import create_app
+from app.extensions import db
+from app.log_pipeline import BatchRotatingFileHandler, LogPipeline
+from app.logging_config import get_log_pipeline
+from app.models import SecurityLog, SecurityEventType, SecurityLogSeverity, log_security_event
+from config import TestingConfig
+
+
+class CountingFileHandler(BatchRotatingFileHandler):
+    """Counts real flushes of the underlying file."""
+
+    def __init__(self, *args, **kwargs):
+        self.flushes = 0
+        super().__init__(*args, **kwargs)
+
+    def flush(self):
+        if not self._batching:
+            self.flushes += 1
+        super().flush()
+
+
+class BlockingHandler(logging.Handler):
+    """Holds the writer thread until released, so the queue fills up."""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.unblock.wait(5)
+        self.records.append(record)
+
+
+def _logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_batched_file_writes():
+    """Test that every record is written and flushed once per batch, not per record."""
+    print("\n" + "=" * 80)
+    print("TEST: Batched File Writes")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, 'transactions.log')
+        handler = CountingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=1)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        pipeline = LogPipeline(queue_size=5000, batch_size=500)
+        logger = _logger('test_pipeline.transactions', pipeline.add_route('transactions', [handler]))
+        pipeline.start()
+        for i in range(2000):
+            logger.info(f"USER:{i} | TYPE:market_buy | AMOUNT:10")
+        pipeline.stop()
+        handler.close()
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2000, f"Expected 2000 lines, got {len(lines)}"
+        assert lines[0] == "USER:0 | TYPE:market_buy | AMOUNT:10" and lines[-1].startswith("USER:1999 ")
+        assert pipeline.stats()['written'] == 2000 and not pipeline.stats()['dropped']
+        assert handler.flushes < 2000 // 4, f"Expected batched flushes, got {handler.flushes}"
+        print(f"  - 2000 records written in order with {handler.flushes} flushes")
+
+    print("[PASS] Batched file writes")
+    return True
+
+
+def test_full_queue_drops_and_reports():
+    """Test that a full queue drops records without blocking and reports the count."""
+    print("\n" + "=" * 80)
+    print("TEST: Full Queue Drops And Reports")
+    print("=" * 80)
+
+    blocking = BlockingHandler()
+    app_handler = BlockingHandler()
+    app_handler.unblock.set()
+
+    pipeline = LogPipeline(queue_size=10, batch_size=5)
+    logger = _logger('test_pipeline.security', pipeline.add_route('security', [blocking]))
+    pipeline.add_route('app', [app_handler])
+    pipeline.start()
+
+    for i in range(100):
+        logger.warning(f"EVENT:{i}")
+    dropped = pipeline.stats()['dropped'].get('security', 0)
+    assert dropped > 0, "A full queue should drop records"
+    print(f"  - 100 records logged while the writer was blocked, {dropped} dropped")
+
+    blocking.unblock.set()
+    pipeline.stop()
+
+    assert len(blocking.records) + dropped == 100, f"{len(blocking.records)} written + {dropped} dropped != 100"
+    reports = [r.getMessage() for r in app_handler.records]
+    assert reports and f"security={dropped}" in reports[-1], f"Drop count not reported: {reports}"
+    print(f"  - remaining {len(blocking.records)} written on stop; reported: {reports[-1]}")
+
+    print("[PASS] Full queue drops and reports")
+    return True
+
+
+def test_security_events_bulk_insert():
+    """Test that security events are queued and inserted by the writer thread."""
+    print("\n" + "=" * 80)
+    print("TEST: Security Events Bulk Insert")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        class PipelineConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'test.db')
+            LOG_DIR = os.path.join(workdir, 'logs')
+            LOG_PIPELINE_ENABLED = True
+
+        app = create_app(PipelineConfig)
+        with app.test_request_context():
+            db.create_all()
+            pipeline = get_log_pipeline()
+            assert pipeline is not None and app.extensions['log_pipeline'] is pipeline
+
+            for i in range(50):
+                result = log_security_event(
+                    event_type=SecurityEventType.UNAUTHORIZED_ACCESS,
+                    message=f"API authentication failed #{i}",
+                    severity=SecurityLogSeverity.WARNING,
+                    ip_address='203.0.113.7',
+                    endpoint='/api/v1/market',
+                    http_method='GET',
+                    details={'attempt': i}
+                )
+                assert result is None, "Queued events are not returned"
+            pipeline.stop()
+
+            rows = db.session.scalars(db.select(SecurityLog).order_by(SecurityLog.id)).all()
+            assert len(rows) == 50, f"Expected 50 security_logs rows, got {len(rows)}"
+            assert rows[0].event_type == SecurityEventType.UNAUTHORIZED_ACCESS
+            assert rows[0].severity == SecurityLogSeverity.WARNING
+            assert rows[-1].details == {'attempt': 49} and rows[-1].created_at is not None
+            print("  - 50 events inserted by the writer thread with all fields")
+
+            db.session.remove()
+            db.drop_all()
+
+    print("[PASS] Security events bulk insert")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 25 + "TACTIZEN LOG PIPELINE TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_batched_file_writes,
+        test_full_queue_drops_and_reports,
+        test_security_events_bulk_insert,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL LOG PIPELINE TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
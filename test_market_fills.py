@@ -0,0 +1,377 @@
+"""
+Test script for locked market fills.
+Fills random trade streams on the ZEN market, a gold market and a resource
+market both under one lock and one trade at a time on an identical twin
+row, checking that every trader gets the serial-execution price (rejections
+included) and that the rows end in the same state. Also checks that the
+market change commits and rolls back with the trader's transaction,
+including a purchase that fails after it was priced, and that a ZEN
+purchase commits before the treasury transfer and is refunded in a new
+transaction if the transfer fails.
+"""
+
+import random
+from decimal import Decimal
+
+from flask_login import login_user
+
+from app import create_app
+from app.extensions import db
+from app.main import zen_market_routes
+from app.main.resource_market_routes import market_buy
+from app.models import (
+    User, Country, ZenMarket, ZenTransaction, GoldMarket, CountryMarketItem, Resource, ResourceCategory
+)
+from app.models.currency import UserCurrency
+from app.services.market_fills import (
+    fill_trade, fill_trades, Trade, ZenBook, GoldBook, ResourceBook, PRICE_CHANGED, INSUFFICIENT_FUNDS
+)
+from config import TestingConfig
+
+
+class MarketFillsConfig(TestingConfig):
+    SCHEDULER_ENABLED = False
+    SQL_PROFILER_ENABLED = False
+
+
+def _loop_price_level(level, progress, amount, is_buy, volume):
+    """ZenMarket.update_price_level as it was: one level per loop iteration."""
+    if is_buy:
+        progress += amount
+        while progress >= volume:
+            progress -= volume
+            if level < ZenMarket.MAX_PRICE_LEVEL:
+                level += 1
+            else:
+                progress = volume - 1
+                break
+    else:
+        progress -= amount
+        while progress < 0:
+            if level > ZenMarket.MIN_PRICE_LEVEL:
+                level -= 1
+                progress += volume
+            else:
+                progress = 0
+                break
+    return level, progress
+
+
+def _random_trades(rng, count, volume, start_level=0):
+    trades = []
+    for _ in range(count):
+        is_buy = rng.random() < 0.55
+        quantity = rng.choice([rng.randint(1, volume // 2), rng.randint(1, volume * 4)])
+        budget = Decimal(rng.randint(1, 500) * 100) if is_buy and rng.random() < 0.3 else None
+        expected = start_level + rng.randint(-2, 6) if rng.random() < 0.2 else None
+        trades.append(Trade(is_buy, quantity, budget=budget, expected_level=expected))
+    return trades
+
+
+def _copy(trades):
+    return [Trade(t.is_buy, t.quantity, budget=t.budget, expected_level=t.expected_level) for t in trades]
+
+
+def _outcome(trade):
+    if trade.rejected:
+        return trade.rejected
+    return (trade.fill.total, trade.fill.final_level, trade.fill.final_progress)
+
+
+def _state(model, **key):
+    db.session.expire_all()
+    row = db.session.scalar(db.select(model).filter_by(**key))
+    return int(row.price_level), int(row.progress_within_level)
+
+
+def _setup_markets():
+    resource = Resource('Iron', ResourceCategory.RAW_MATERIAL, threshold=50, adjustment=Decimal('0.25'))
+    db.session.add(resource)
+    db.session.flush()
+    for n in (1, 2):
+        db.session.add(ZenMarket(id=n, volume_per_level=100))
+        db.session.add(GoldMarket(country_id=n, volume_per_level=80))
+        db.session.add(CountryMarketItem(country_id=n, resource_id=resource.id, quality=0,
+                                         initial_price=Decimal('20.00')))
+    db.session.commit()
+    return resource.id
+
+
+def test_closed_form_price_level():
+    """Test that ZenMarket.price_level_after matches the level-by-level loop, caps included."""
+    print("\n" + "=" * 80)
+    print("TEST: Closed-Form Price Level")
+    print("=" * 80)
+
+    rng = random.Random(3)
+    for _ in range(50000):
+        volume = rng.choice([1, 7, 100])
+        level = rng.choice([rng.randint(-103, -97), rng.randint(9997, 10003), rng.randint(-100, 10000)])
+        progress = rng.randint(0, volume - 1)
+        amount = rng.choice([rng.randint(0, 3 * volume), rng.randint(0, 40 * volume)])
+        is_buy = rng.random() < 0.5
+        assert ZenMarket.price_level_after(level, progress, amount, is_buy, volume) == \
+            _loop_price_level(level, progress, amount, is_buy, volume), (level, progress, amount, is_buy, volume)
+    print("  - 50000 random trades match, including at MIN/MAX_PRICE_LEVEL")
+
+    print("[PASS] Closed-form price level")
+    return True
+
+
+def test_batched_matches_serial():
+    """Test that trades filled under one lock get the prices they get when run one at a time."""
+    print("\n" + "=" * 80)
+    print("TEST: Batched Matches Serial")
+    print("=" * 80)
+
+    app = create_app(MarketFillsConfig)
+
+    with app.app_context():
+        db.create_all()
+        resource_id = _setup_markets()
+        rng = random.Random(17)
+
+        markets = [
+            ('ZEN', ZenBook(1), ZenBook(2), ZenMarket, 'id', 100),
+            ('gold', GoldBook(1), GoldBook(2), GoldMarket, 'country_id', 80),
+            ('resource', ResourceBook(1, resource_id), ResourceBook(2, resource_id), CountryMarketItem, 'country_id', 50),
+        ]
+        for name, batched_book, serial_book, model, key, volume in markets:
+            for _ in range(10):
+                start_level = _state(model, **{key: 1})[0]
+                batch = _random_trades(rng, rng.randint(1, 40), volume, start_level)
+                serial = _copy(batch)
+
+                fill_trades(batched_book, batch)
+                db.session.commit()
+                for trade in serial:
+                    fill_trade(serial_book, trade)
+                    db.session.commit()
+
+                assert [_outcome(t) for t in batch] == [_outcome(t) for t in serial], f"{name} fills differ"
+                assert _state(model, **{key: 1}) == _state(model, **{key: 2}), f"{name} market state differs"
+
+            level, progress = _state(model, **{key: 1})
+            print(f"  - {name}: 10 trade streams priced exactly as serial execution, market ends at {level}:{progress}")
+
+        rejected = [t for t in batch if t.rejected]
+        assert all(t.rejected in (PRICE_CHANGED, INSUFFICIENT_FUNDS) for t in rejected)
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Batched matches serial")
+    return True
+
+
+def test_market_change_follows_transaction():
+    """Test that a filled trade moves the market only if the trader's transaction commits."""
+    print("\n" + "=" * 80)
+    print("TEST: Market Change Follows Transaction")
+    print("=" * 80)
+
+    app = create_app(MarketFillsConfig)
+
+    with app.app_context():
+        db.create_all()
+        _setup_markets()
+        start = _state(ZenMarket, id=1)
+
+        trade = fill_trade(ZenBook(1), Trade(True, 250))
+        assert trade.fill and (trade.fill.final_level, trade.fill.final_progress) != start
+        db.session.rollback()
+        assert _state(ZenMarket, id=1) == start, "A rolled back trade must not move the market"
+
+        # A market object loaded before the lock is refreshed from the row
+        market = db.session.get(ZenMarket, 1)
+        db.session.execute(db.update(ZenMarket).where(ZenMarket.id == 1).values(price_level=7))
+        trade = fill_trade(ZenBook(1), Trade(True, 250))
+        assert market.price_level == trade.fill.final_level
+        db.session.commit()
+        assert _state(ZenMarket, id=1) == (trade.fill.final_level, trade.fill.final_progress)
+        print("  - rollback leaves the level untouched, commit stores it")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Market change follows transaction")
+    return True
+
+
+def test_failed_purchase_leaves_price():
+    """Test that a purchase failing after it was priced leaves the market price where it was."""
+    print("\n" + "=" * 80)
+    print("TEST: Failed Purchase Leaves Price")
+    print("=" * 80)
+
+    app = create_app(MarketFillsConfig)
+
+    with app.app_context():
+        db.create_all()
+        resource_id = _setup_markets()
+        country = Country(name='Marketland', currency_code='MKT')
+        country.id = 3  # Markets 1 and 2 are the twin rows above
+        buyer = User(wallet_address='0x' + 'c' * 40, username='marketbuyer')
+        db.session.add_all([country, buyer])
+        db.session.flush()
+        db.session.add(CountryMarketItem(country_id=country.id, resource_id=resource_id, quality=0,
+                                         initial_price=Decimal('20.00')))
+        db.session.add(UserCurrency(user_id=buyer.id, country_id=country.id, amount=Decimal('100000')))
+        db.session.commit()
+        country_id, slug, buyer_id = country.id, country.slug, buyer.id
+
+        def buy(quantity):
+            form = {'quantity': quantity, 'confirmed': 'true', 'quality': 0}
+            with app.test_request_context(f'/market/{slug}/buy/{resource_id}', method='POST', data=form):
+                login_user(db.session.get(User, buyer_id))
+                market_buy(slug, resource_id)
+            db.session.remove()
+            return _state(CountryMarketItem, country_id=country_id), \
+                db.session.get(UserCurrency, (buyer_id, country_id)).amount
+
+        start = _state(CountryMarketItem, country_id=country_id)
+
+        # Storage accepts nothing after the trade was priced: the route rolls back
+        add_to_inventory = User.add_to_inventory
+        User.add_to_inventory = lambda self, resource_id, quantity, quality=0: (0, quantity)
+        try:
+            state, balance = buy(120)
+        finally:
+            User.add_to_inventory = add_to_inventory
+        assert state == start, f"Market moved to {state} for a purchase that never happened"
+        assert balance == Decimal('100000')
+
+        # The settlement commit fails: the route's except branch rolls back
+        def failing_commit():
+            raise RuntimeError("commit failed")
+
+        commit = db.session.commit
+        db.session.commit = failing_commit
+        try:
+            state, balance = buy(120)
+        finally:
+            db.session.commit = commit
+        assert state == start, f"Market moved to {state} for a purchase whose commit failed"
+        assert balance == Decimal('100000')
+        print("  - inventory failure and commit failure leave the market untouched")
+
+        state, balance = buy(120)
+        assert state != start and balance < Decimal('100000'), "A completed purchase moves the market"
+        print(f"  - a completed purchase moves it from {start} to {state}")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Failed purchase leaves price")
+    return True
+
+
+def test_zen_purchase_commits_before_transfer():
+    """Test that a ZEN purchase holds no locks during the transfer and is refunded if it fails."""
+    print("\n" + "=" * 80)
+    print("TEST: ZEN Purchase Commits Before Transfer")
+    print("=" * 80)
+
+    app = create_app(MarketFillsConfig)
+
+    with app.app_context():
+        db.create_all()
+        _setup_markets()
+        buyer = User(wallet_address='0x' + 'e' * 40, username='zenbuyer', gold=Decimal('100000'))
+        buyer.base_wallet_address = buyer.wallet_address
+        db.session.add(buyer)
+        db.session.commit()
+        buyer_id = buyer.id
+        start = _state(ZenMarket, id=1)
+
+        seen = []
+
+        def transfer(succeed):
+            def fake_transfer(to_address, amount):
+                # Price, deduction and pending record are committed: no row locks held
+                seen.append((
+                    db.session().in_transaction(),
+                    db.session.get(User, buyer_id).gold,
+                    db.session.scalar(db.select(ZenTransaction.blockchain_status)),
+                ))
+                if succeed:
+                    return {'success': True, 'tx_hash': '0x' + 'ab' * 32}
+                return {'success': False, 'error': 'node unavailable'}
+            return fake_transfer
+
+        def buy(succeed):
+            originals = zen_market_routes.transfer_zen_from_treasury, zen_market_routes.get_treasury_balance
+            zen_market_routes.transfer_zen_from_treasury = transfer(succeed)
+            zen_market_routes.get_treasury_balance = lambda: Decimal('1000000')
+            try:
+                with app.test_request_context('/zen-market/buy-zen', method='POST', data={'quantity': '150'}):
+                    login_user(db.session.get(User, buyer_id))
+                    zen_market_routes.zen_market_buy_zen()
+            finally:
+                zen_market_routes.transfer_zen_from_treasury, zen_market_routes.get_treasury_balance = originals
+            db.session.remove()
+            status = db.session.scalar(
+                db.select(ZenTransaction.blockchain_status).order_by(ZenTransaction.id.desc())
+            )
+            return _state(ZenMarket, id=1), db.session.get(User, buyer_id).gold, status
+
+        state, gold, status = buy(succeed=False)
+        in_transaction, gold_during, status_during = seen[-1]
+        assert not in_transaction, "The transfer must run outside the purchase transaction"
+        assert gold_during < Decimal('100000') and status_during == 'pending'
+        assert state == start and gold == Decimal('100000') and status == 'failed', (state, gold, status)
+        print("  - failed transfer: Gold refunded, price restored, record marked failed")
+
+        state, gold, status = buy(succeed=True)
+        assert not seen[-1][0]
+        assert state != start and gold < Decimal('100000') and status == 'completed', (state, gold, status)
+        print(f"  - completed transfer: price moved from {start} to {state}")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] ZEN purchase commits before transfer")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 22 + "TACTIZEN MARKET FILLS TESTS" + " " * 29 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_closed_form_price_level,
+        test_batched_matches_serial,
+        test_market_change_follows_transaction,
+        test_failed_purchase_leaves_price,
+        test_zen_purchase_commits_before_transfer,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL MARKET FILLS TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
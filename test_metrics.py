@@ -0,0 +1,382 @@
+"""
+Test script for the /metrics endpoint (app/metrics.py).
+Checks that requests are timed per blueprint/endpoint and rendered in the
+Prometheus text format, that only local scrapes and admins can read
+/metrics, that cache lookups are counted per key prefix (memoized functions
+by name), that rate limiter rejections, scheduler job lag and outcomes and
+pool checkouts are recorded, and that the snapshots of several Gunicorn
+workers add up, including those of workers that exited. Overhead:
+scripts/benchmark_metrics.py.
+"""
+
+import os
+import re
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask_login import login_user
+from sqlalchemy import text
+
+from app import create_app
+from app import metrics as metrics_module
+from app.extensions import cache, db, limiter
+from app.metrics import registry, render, collect, merge_snapshots
+from app.models import User
+from config import TestingConfig
+
+
+def _config(workdir, **overrides):
+    class MetricsConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'metrics.db')
+        LOG_DIR = os.path.join(workdir, 'logs')
+        SQL_PROFILER_ENABLED = False
+        SCHEDULER_ENABLED = False
+        METRICS_ENABLED = True
+        METRICS_MULTIPROC_DIR = None
+
+    for name, value in overrides.items():
+        setattr(MetricsConfig, name, value)
+    return MetricsConfig
+
+
+def _sample(body, name, **labels):
+    """Value of one sample in a text-format body, or None."""
+    for line in body.splitlines():
+        if line.startswith('#'):
+            continue
+        match = re.match(r'^([a-z_]+)(?:\{(.*)\})? (\S+)$', line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'([a-z_]+)="((?:[^"\\]|\\.)*)"', match.group(2) or ''))
+        if found == {key: str(value) for key, value in labels.items()}:
+            return float(match.group(3))
+    return None
+
+
+def test_requests_are_timed_and_rendered():
+    """Test that each request lands in the latency histogram and status counter of its endpoint."""
+    print("\n" + "=" * 80)
+    print("TEST: Requests Are Timed And Rendered")
+    print("=" * 80)
+
+    app = create_app(_config(tempfile.mkdtemp()))
+    with app.app_context():
+        db.create_all()
+    registry.reset()
+
+    client = app.test_client()
+    for _ in range(3):
+        assert client.get('/').status_code == 200
+    assert client.get('/no-such-page').status_code == 404
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    body = response.get_data(as_text=True)
+
+    assert '# TYPE tactizen_http_request_duration_seconds histogram' in body
+    count = _sample(body, 'tactizen_http_request_duration_seconds_count', blueprint='main', endpoint='main.index')
+    assert count == 3, f"Expected 3 timed requests to main.index, got {count}"
+    inf = _sample(body, 'tactizen_http_request_duration_seconds_bucket',
+                  blueprint='main', endpoint='main.index', le='+Inf')
+    assert inf == 3, "The +Inf bucket should hold every request"
+    assert _sample(body, 'tactizen_http_request_duration_seconds_sum', blueprint='main', endpoint='main.index') > 0
+    assert _sample(body, 'tactizen_http_requests_total', blueprint='main', endpoint='main.index', code=200) == 3
+    assert _sample(body, 'tactizen_http_requests_total', blueprint='', endpoint='unmatched', code=404) == 1
+    assert _sample(body, 'tactizen_metrics_processes') == 1
+
+    # Cumulative buckets never decrease
+    buckets = [float(v) for v in re.findall(
+        r'^tactizen_http_request_duration_seconds_bucket\{blueprint="main",endpoint="main.index",le="[^"]+"\} (\S+)$',
+        body, re.M)]
+    assert buckets == sorted(buckets) and len(buckets) == len(metrics_module.LATENCY_BUCKETS) + 1
+    print(f"  - {len(body.splitlines())} lines rendered, main.index counted 3 times")
+
+    disabled = create_app(_config(tempfile.mkdtemp(), METRICS_ENABLED=False))
+    assert 'metrics' not in disabled.view_functions, "No /metrics when disabled"
+
+    with app.app_context():
+        db.engine.dispose()
+
+    print("[PASS] Requests are timed and rendered")
+    return True
+
+
+def test_metrics_access():
+    """Test that /metrics answers local scrapes and admins only."""
+    print("\n" + "=" * 80)
+    print("TEST: Metrics Access")
+    print("=" * 80)
+
+    app = create_app(_config(tempfile.mkdtemp()))
+    with app.app_context():
+        db.create_all()
+        admin = User(wallet_address='0x' + 'a' * 40, username='metricsadmin', is_admin=True)
+        player = User(wallet_address='0x' + 'b' * 40, username='metricsplayer')
+        db.session.add_all([admin, player])
+        db.session.commit()
+
+        client = app.test_client()
+        assert client.get('/metrics').status_code == 200, "Local scrape should be allowed"
+        assert client.get('/metrics', headers={'X-Forwarded-For': '203.0.113.9'}).status_code == 404, \
+            "Requests through nginx should be refused"
+        assert client.get('/metrics', headers={'X-Real-IP': '127.0.0.1'}).status_code == 404
+        assert client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.9'}).status_code == 404, \
+            "Remote anonymous requests should be refused"
+
+        # Call the view directly: the session security hooks are not under test
+        remote = {'REMOTE_ADDR': '203.0.113.9', 'HTTP_X_FORWARDED_FOR': '203.0.113.9'}
+        with app.test_request_context('/metrics', environ_base=remote):
+            login_user(admin)
+            assert metrics_module.metrics().status_code == 200, "Admins may read /metrics from anywhere"
+        with app.test_request_context('/metrics', environ_base=remote):
+            login_user(player)
+            try:
+                metrics_module.metrics()
+                assert False, "Players should get a 404"
+            except Exception as e:
+                assert getattr(e, 'code', None) == 404, f"Expected 404, got {e!r}"
+
+        db.engine.dispose()
+
+    print("[PASS] Metrics access")
+    return True
+
+
+def test_cache_lookups_by_prefix():
+    """Test that cache hits and misses are counted by key prefix, memoized functions by name."""
+    print("\n" + "=" * 80)
+    print("TEST: Cache Lookups By Prefix")
+    print("=" * 80)
+
+    assert metrics_module.cache_key_prefix('country_online_12') == 'country_online'
+    assert metrics_module.cache_key_prefix('view//market/3') == 'view'
+    assert metrics_module.cache_key_prefix('12abc') == 'other'
+
+    app = create_app(_config(tempfile.mkdtemp()))
+    registry.reset()
+
+    calls = []
+
+    @cache.memoize(timeout=60)
+    def leaderboard(country_id):
+        calls.append(country_id)
+        return [country_id]
+
+    with app.app_context():
+        cache.clear()
+        assert cache.get('country_online_12') is None
+        cache.set('country_online_12', 5)
+        assert cache.get('country_online_12') == 5
+        assert cache.get('country_online_12') == 5
+        assert leaderboard(1) == [1] and leaderboard(1) == [1] and leaderboard(2) == [2]
+        assert calls == [1, 2]
+
+    samples = merge_snapshots([registry.snapshot()])['tactizen_cache_lookups_total']['samples']
+    print(f"  - {dict(samples)}")
+    assert samples[('country_online', 'hit')] == 2
+    assert samples[('country_online', 'miss')] == 1
+    assert samples[('leaderboard', 'hit')] == 1, "Memoized lookups should be counted under the function name"
+    assert samples[('leaderboard', 'miss')] == 2
+    assert not any(prefix.endswith('memver') for prefix, _ in samples), "Version keys should not be counted"
+
+    print("[PASS] Cache lookups by prefix")
+    return True
+
+
+def test_rate_limit_rejections():
+    """Test that requests rejected by Flask-Limiter are counted and still get a 429."""
+    print("\n" + "=" * 80)
+    print("TEST: Rate Limit Rejections")
+    print("=" * 80)
+
+    app = create_app(_config(tempfile.mkdtemp(), RATELIMIT_ENABLED=True))
+    with app.app_context():
+        db.create_all()
+
+    @limiter.limit("1 per minute")
+    def limited_ping():
+        return 'pong'
+
+    app.add_url_rule('/metrics-test/ping', 'limited_ping', limited_ping)
+    registry.reset()
+
+    client = app.test_client()
+    codes = [client.get('/metrics-test/ping').status_code for _ in range(3)]
+    assert codes == [200, 429, 429], f"Unexpected status codes {codes}"
+
+    body = client.get('/metrics').get_data(as_text=True)
+    assert _sample(body, 'tactizen_rate_limit_rejections_total', endpoint='limited_ping') == 2
+    assert _sample(body, 'tactizen_http_requests_total', blueprint='', endpoint='limited_ping', code=429) == 2
+    print("  - 2 rejections counted")
+
+    with app.app_context():
+        db.engine.dispose()
+
+    print("[PASS] Rate limit rejections")
+    return True
+
+
+def test_scheduler_lag_and_outcomes():
+    """Test that job lag and run outcomes are recorded from APScheduler events."""
+    print("\n" + "=" * 80)
+    print("TEST: Scheduler Lag And Outcomes")
+    print("=" * 80)
+
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    registry.reset()
+    scheduler = BackgroundScheduler()
+    metrics_module.instrument_scheduler(scheduler)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    # A run time a little in the past: submitted at once, late by about a second
+    start = datetime.now() - timedelta(seconds=1)
+    scheduler.add_job(lambda: None, 'date', run_date=start, id='ok_job', misfire_grace_time=60)
+    scheduler.add_job(failing, 'date', run_date=start, id='failing_job', misfire_grace_time=60)
+    scheduler.start()
+    try:
+        deadline = time.time() + 5
+        while time.time() < deadline and scheduler.get_jobs():
+            time.sleep(0.05)
+        time.sleep(0.2)
+    finally:
+        scheduler.shutdown(wait=True)
+
+    merged = merge_snapshots([registry.snapshot()])
+    runs = merged['tactizen_scheduler_job_runs_total']['samples']
+    lag = merged['tactizen_scheduler_job_lag_seconds']['samples']
+    print(f"  - runs: {dict(runs)}")
+    assert runs[('ok_job', 'success')] == 1
+    assert runs[('failing_job', 'error')] == 1
+    counts, total = lag[('ok_job',)]
+    assert sum(counts) == 1 and 0.5 < total < 5, f"Expected about a second of lag, got {total}"
+
+    print("[PASS] Scheduler lag and outcomes")
+    return True
+
+
+def test_pool_checkouts():
+    """Test that pool checkout times and pool gauges are recorded for a QueuePool engine."""
+    print("\n" + "=" * 80)
+    print("TEST: Pool Checkouts")
+    print("=" * 80)
+
+    app = create_app(_config(tempfile.mkdtemp()))
+    with app.app_context():
+        assert isinstance(db.engine.pool, metrics_module.TimedQueuePool)
+        registry.reset()
+        with db.engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+            samples = merge_snapshots([registry.snapshot()])
+            assert samples['tactizen_db_pool_checked_out']['samples'][()] == 1
+        with db.engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        db.engine.dispose()
+        assert isinstance(db.engine.pool, metrics_module.TimedQueuePool), "dispose() should keep the timing"
+
+        merged = merge_snapshots([registry.snapshot()])
+        counts, total = merged['tactizen_db_pool_wait_seconds']['samples'][()]
+        assert sum(counts) == 2, f"Expected 2 checkouts, got {sum(counts)}"
+        assert merged['tactizen_db_pool_size']['samples'][()] == db.engine.pool.size()
+        assert merged['tactizen_db_pool_checked_out']['samples'][()] == 0
+        print(f"  - 2 checkouts in {total * 1000:.3f} ms")
+
+    print("[PASS] Pool checkouts")
+    return True
+
+
+def test_multiprocess_aggregation():
+    """Test that /metrics adds up live workers and the archive of exited ones."""
+    print("\n" + "=" * 80)
+    print("TEST: Multiprocess Aggregation")
+    print("=" * 80)
+
+    directory = tempfile.mkdtemp()
+    metrics_module.clear_multiprocess_dir(directory)
+    registry.reset()
+    # No engine to sample: the pool gauges are the ones set below
+    metrics_module._pool_engine = None
+
+    def worker_snapshot(requests, checked_out):
+        registry.reset()
+        for _ in range(requests):
+            metrics_module.REQUESTS.inc('main', 'main.index', '200')
+            metrics_module.REQUEST_LATENCY.observe(0.02, 'main', 'main.index')
+        metrics_module.POOL_CHECKED_OUT.set(checked_out)
+        return registry.snapshot()
+
+    # Another live worker (our parent stands in for it) and one that exited
+    live_pid, dead_pid = os.getppid(), 2 ** 22 + 17
+    metrics_module._write_json(os.path.join(directory, f'worker_{live_pid}.json'), worker_snapshot(2, 3))
+    metrics_module._write_json(os.path.join(directory, f'worker_{dead_pid}.json'), worker_snapshot(5, 7))
+    metrics_module.mark_process_dead(dead_pid, directory)
+    assert not os.path.exists(os.path.join(directory, f'worker_{dead_pid}.json'))
+    metrics_module.mark_process_dead(dead_pid, directory)  # a second call changes nothing
+
+    # A worker that died without the master noticing is skipped
+    metrics_module._write_json(os.path.join(directory, f'worker_{dead_pid + 1}.json'), worker_snapshot(100, 100))
+
+    # This process
+    worker_snapshot(1, 1)
+    metrics_module.write_snapshot(directory)  # our own file is not counted twice
+
+    body = render(collect(directory))
+    assert _sample(body, 'tactizen_http_requests_total', blueprint='main', endpoint='main.index', code=200) == 8
+    assert _sample(body, 'tactizen_http_request_duration_seconds_count', blueprint='main', endpoint='main.index') == 8
+    assert _sample(body, 'tactizen_db_pool_checked_out') == 4, "Gauges of exited workers should be dropped"
+    assert _sample(body, 'tactizen_metrics_processes') == 2
+    print("  - 1 + 2 live and 5 archived requests add up to 8")
+
+    registry.reset()
+
+    print("[PASS] Multiprocess aggregation")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 30 + "TACTIZEN METRICS TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_requests_are_timed_and_rendered,
+        test_metrics_access,
+        test_cache_lookups_by_prefix,
+        test_rate_limit_rejections,
+        test_scheduler_lag_and_outcomes,
+        test_pool_checkouts,
+        test_multiprocess_aggregation,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL METRICS TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,290 @@
+"""
+Test script for the moderation counters read model.
+Applies random ticket and report transitions (submission, staff status
+changes, replies, ratings, report actions) through the same hooks the
+support routes use and checks the stored counters against a from-scratch
+recomputation and against the per-status COUNT queries the statistics page
+used to run. Also renders the statistics page from the counters.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from flask_login import login_user
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, SupportTicket, Report, ModerationCounters, TicketCategory, TicketStatus, TicketPriority,
+    ReportType, ReportReason, ReportStatus,
+)
+from app.models.moderation_counters import ALL_BUCKET
+from app.services.moderation_stats_service import ModerationStatsService
+from app.support.routes import admin_statistics
+from config import TestingConfig
+
+
+class CountersConfig(TestingConfig):
+    # Scheduler jobs would share (and roll back) the in-memory connection
+    SCHEDULER_ENABLED = False
+
+
+def _seed_users():
+    users = [User(wallet_address=f'0x{i:040x}', username=f'player{i}') for i in range(12)]
+    db.session.add_all(users)
+    db.session.flush()
+    return users
+
+
+def _expected_summary(now):
+    """The statistics the page computed before, one COUNT at a time."""
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    live_tickets = SupportTicket.query.filter_by(is_deleted=False)
+    live_reports = Report.query.filter_by(is_deleted=False)
+
+    resolved = live_tickets.filter(SupportTicket.resolved_at != None).all()
+    rated = live_tickets.filter(SupportTicket.rating != None).all()
+    tickets = {
+        'total': live_tickets.count(),
+        'today': SupportTicket.query.filter(SupportTicket.created_at >= today_start).count(),
+        'this_week': SupportTicket.query.filter(SupportTicket.created_at >= today_start - timedelta(days=7)).count(),
+        'this_month': SupportTicket.query.filter(SupportTicket.created_at >= today_start - timedelta(days=30)).count(),
+        'avg_resolution_hours': round(
+            sum((t.resolved_at - t.created_at).total_seconds() for t in resolved) / len(resolved) / 3600, 1
+        ) if resolved else 0,
+        'avg_rating': round(sum(t.rating for t in rated) / len(rated), 1) if rated else 0,
+        'total_ratings': len(rated),
+    }
+    for status in TicketStatus:
+        if status != TicketStatus.ARCHIVED:
+            tickets[status.value] = live_tickets.filter_by(status=status).count()
+
+    reports = {
+        'total': live_reports.count(),
+        'today': Report.query.filter(Report.created_at >= today_start).count(),
+        'this_week': Report.query.filter(Report.created_at >= today_start - timedelta(days=7)).count(),
+    }
+    for status in ReportStatus:
+        reports[status.value] = live_reports.filter_by(status=status).count()
+
+    report_by_type = {
+        'message': live_reports.filter_by(report_type=ReportType.MESSAGE).count(),
+        'article': live_reports.filter_by(report_type=ReportType.NEWSPAPER_ARTICLE).count(),
+        'comment': live_reports.filter_by(report_type=ReportType.ARTICLE_COMMENT).count(),
+        'user': live_reports.filter_by(report_type=ReportType.USER_PROFILE).count(),
+        'company': live_reports.filter_by(report_type=ReportType.COMPANY).count(),
+    }
+    return {'tickets': tickets, 'reports': reports, 'report_by_type': report_by_type}
+
+
+def _assert_matches(label):
+    stored = db.session.get(ModerationCounters, ALL_BUCKET, populate_existing=True)
+    for key, value in ModerationStatsService.compute().items():
+        actual = getattr(stored, key)
+        assert actual == value, f"{label}: {key} stored {actual}, recomputed {value}"
+
+    summary = ModerationStatsService.get_summary()
+    expected = _expected_summary(datetime.utcnow())
+    for section, values in expected.items():
+        for key, value in values.items():
+            actual = summary[section][key]
+            assert actual == value, f"{label}: {section}.{key} summary {actual}, counted {value}"
+
+
+def _run_transitions(rnd, users, steps, prefix='T'):
+    """Random ticket/report life cycles, mirroring the support routes."""
+    now = datetime.utcnow()
+    tickets, reports = [], []
+
+    for step in range(steps):
+        action = rnd.choice(['ticket', 'ticket', 'status', 'reply', 'rate', 'report', 'report', 'report_action'])
+        user = rnd.choice(users)
+
+        if action == 'ticket':
+            ticket = SupportTicket(
+                ticket_number=f'TKT-{prefix}-{step:05d}', user_id=user.id,
+                category=rnd.choice(list(TicketCategory)), subject='Help', description='Something broke',
+                status=TicketStatus.OPEN, priority=TicketPriority.MEDIUM,
+                created_at=now - timedelta(days=rnd.randrange(0, 40), minutes=rnd.randrange(0, 1440)),
+            )
+            db.session.add(ticket)
+            db.session.flush()
+            ModerationStatsService.on_ticket_created(ticket)
+            tickets.append(ticket)
+
+        elif action == 'status' and tickets:
+            # update_ticket_status
+            ticket = rnd.choice(tickets)
+            old_status, old_resolved_at = ticket.status, ticket.resolved_at
+            ticket.status = rnd.choice(list(TicketStatus))
+            if ticket.status == TicketStatus.RESOLVED:
+                ticket.resolved_at = now - timedelta(minutes=rnd.randrange(0, 600))
+                if ticket.resolved_at < ticket.created_at:
+                    ticket.resolved_at = ticket.created_at + timedelta(minutes=rnd.randrange(1, 600))
+            elif ticket.status == TicketStatus.CLOSED:
+                ticket.closed_at = now
+            ModerationStatsService.on_ticket_status_change(ticket, old_status, old_resolved_at)
+
+        elif action == 'reply' and tickets:
+            # respond_to_ticket: staff reply OPEN -> AWAITING_RESPONSE, player reply back
+            ticket = rnd.choice(tickets)
+            old_status = ticket.status
+            if rnd.random() < 0.5:
+                if ticket.status == TicketStatus.AWAITING_RESPONSE:
+                    ticket.status = TicketStatus.OPEN
+            elif ticket.status == TicketStatus.OPEN:
+                ticket.status = TicketStatus.AWAITING_RESPONSE
+            ModerationStatsService.on_ticket_status_change(ticket, old_status, ticket.resolved_at)
+
+        elif action == 'rate' and tickets:
+            ticket = rnd.choice(tickets)
+            if ticket.status in (TicketStatus.RESOLVED, TicketStatus.CLOSED) and ticket.rating is None:
+                ticket.rating = rnd.randrange(1, 6)
+                ModerationStatsService.on_ticket_rated(ticket)
+
+        elif action == 'report':
+            report = Report(
+                report_number=f'RPT-{prefix}-{step:05d}', reporter_id=user.id,
+                reported_user_id=rnd.choice(users).id,
+                report_type=rnd.choice(list(ReportType)), reason=rnd.choice(list(ReportReason)),
+                status=ReportStatus.PENDING,
+                created_at=now - timedelta(days=rnd.randrange(0, 40), minutes=rnd.randrange(0, 1440)),
+            )
+            db.session.add(report)
+            ModerationStatsService.on_report_created(report)
+            reports.append(report)
+
+        elif action == 'report_action' and reports:
+            report = rnd.choice(reports)
+            old_status = report.status
+            report.status = rnd.choice(list(ReportStatus))
+            ModerationStatsService.on_report_status_change(report, old_status)
+
+        db.session.flush()
+
+    return tickets, reports
+
+
+def test_counters_match_recompute():
+    """Test that counters kept through random transitions equal a from-scratch recomputation."""
+    print("\n" + "=" * 80)
+    print("TEST: Moderation Counters vs Recompute")
+    print("=" * 80)
+
+    app = create_app(CountersConfig)
+
+    with app.app_context():
+        db.create_all()
+        users = _seed_users()
+        db.session.commit()
+
+        for seed in range(5):
+            rnd = random.Random(seed)
+            # Materialize the rows, then mutate through the hooks
+            ModerationStatsService.get_counters()
+            tickets, reports = _run_transitions(rnd, users, 250, prefix=f'S{seed}')
+            db.session.commit()
+            _assert_matches(f"seed {seed}")
+            print(f"  - seed {seed}: {len(tickets)} tickets, {len(reports)} reports match")
+
+        # Nightly job must converge to the same values
+        ModerationStatsService.recompute()
+        db.session.commit()
+        _assert_matches("after recompute")
+        assert ModerationCounters.query.count() <= 1 + 31, "Only the last month's day rows are kept"
+
+        # A rolled back transition leaves the counters untouched
+        before = ModerationStatsService.compute()
+        _run_transitions(random.Random(99), users, 50, prefix='R')
+        db.session.rollback()
+        _assert_matches("after rollback")
+        assert ModerationStatsService.compute() == before
+
+        db.drop_all()
+
+    print("[PASS] Moderation counters match full recomputation")
+    return True
+
+
+def test_statistics_page_reads_counters():
+    """Test that the statistics page renders from the counters without per-status COUNT queries."""
+    print("\n" + "=" * 80)
+    print("TEST: Statistics Page Reads Counters")
+    print("=" * 80)
+
+    app = create_app(CountersConfig)
+
+    with app.app_context():
+        db.create_all()
+        users = _seed_users()
+        users[0].is_admin = True
+        db.session.commit()
+        _run_transitions(random.Random(3), users, 200)
+        ModerationStatsService.recompute()
+        db.session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        # Call the view directly: the session security hooks are not under test
+        with app.test_request_context('/support/admin/statistics'):
+            login_user(users[0])
+            event.listen(db.engine, 'before_cursor_execute', record)
+            try:
+                html = admin_statistics()
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', record)
+
+        counts = [s for s in statements if 'count(' in s.lower()]
+        assert len(counts) == 2, f"Expected the two top-N queries to count, got {len(counts)}"
+        expected = _expected_summary(datetime.utcnow())
+        assert f">{expected['tickets']['total']}<" in html, "Ticket total should be shown"
+        print(f"  - page rendered with {len(statements)} statements ({len(counts)} counting)")
+
+        db.drop_all()
+
+    print("[PASS] Statistics page renders from moderation_counters")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 22 + "TACTIZEN MODERATION COUNTERS TESTS" + " " * 22 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_counters_match_recompute,
+        test_statistics_page_reads_counters,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL MODERATION COUNTERS TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
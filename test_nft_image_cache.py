@@ -0,0 +1,221 @@
+"""
+Test script for the NFT image disk cache and thumbnails.
+Uses a local stand-in IPFS gateway and checks that once the cache is warm,
+image and thumbnail requests make no upstream calls, that responses carry
+immutable caching headers, and that the cache evicts least recently used
+files when it outgrows its size limit.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image
+
+from app import create_app
+from app.services.nft_image_cache import NFTImageCache
+from config import TestingConfig
+
+
+def _cid(n):
+    return 'Qm' + 'T' * 43 + str(n)
+
+
+def _png(color, size=(600, 900)):
+    out = io.BytesIO()
+    Image.new('RGBA', size, color).save(out, 'PNG')
+    return out.getvalue()
+
+
+class StandInGateway:
+    """Serves /ipfs/<cid> from a dict and counts requests."""
+
+    def __init__(self, images):
+        self.images = images
+        self.requests = 0
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                gateway.requests += 1
+                body = gateway.images.get(self.path.rsplit('/', 1)[-1])
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/png')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/ipfs/'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _app(gateway, cache_dir):
+    app = create_app(TestingConfig)
+    app.config.update(NFT_IMAGE_GATEWAY=gateway.url, NFT_IMAGE_CACHE_DIR=cache_dir, NFT_IMAGE_CACHE_MAX_MB=50)
+    return app
+
+
+def test_original_served_from_cache():
+    """Test that only the first request for a CID reaches the gateway."""
+    print("\n" + "=" * 80)
+    print("TEST: Original Image Cache")
+    print("=" * 80)
+
+    image = _png((200, 40, 40, 255))
+    gateway = StandInGateway({_cid(1): image})
+    cache_dir = tempfile.mkdtemp()
+    try:
+        app = _app(gateway, cache_dir)
+        with app.test_client() as client:
+            first = client.get(f'/api/nft/image/{_cid(1)}')
+            assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+            assert first.get_data() == image, "Served bytes differ from the gateway's"
+            assert first.mimetype == 'image/png'
+            assert 'immutable' in first.headers['Cache-Control']
+            etag = first.headers.get('ETag')
+            assert etag, "Missing ETag"
+
+            for _ in range(5):
+                again = client.get(f'/api/nft/image/{_cid(1)}')
+                assert again.status_code == 200 and again.get_data() == image
+
+            not_modified = client.get(f'/api/nft/image/{_cid(1)}', headers={'If-None-Match': etag})
+            assert not_modified.status_code == 304, f"Expected 304, got {not_modified.status_code}"
+
+            assert gateway.requests == 1, f"Expected 1 upstream call, got {gateway.requests}"
+            print("  - 7 requests, 1 upstream call, 304 on matching ETag")
+
+            missing = client.get(f'/api/nft/image/{_cid(9)}')
+            assert missing.status_code == 404
+            invalid = client.get('/api/nft/image/not-a-cid')
+            assert invalid.status_code == 404
+            assert gateway.requests == 2, "Invalid CIDs must not reach the gateway"
+            print("  - unknown CID 404, invalid CID rejected locally")
+    finally:
+        gateway.close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("[PASS] Original images served from cache")
+    return True
+
+
+def test_thumbnails():
+    """Test fixed-size WebP thumbnails, generated once and reused across processes."""
+    print("\n" + "=" * 80)
+    print("TEST: Thumbnails")
+    print("=" * 80)
+
+    gateway = StandInGateway({_cid(2): _png((40, 200, 40, 255))})
+    cache_dir = tempfile.mkdtemp()
+    try:
+        app = _app(gateway, cache_dir)
+        with app.test_client() as client:
+            for size in (256, 512):
+                response = client.get(f'/api/nft/image/{_cid(2)}/thumb/{size}')
+                assert response.status_code == 200, f"Thumbnail {size} returned {response.status_code}"
+                assert response.mimetype == 'image/webp'
+                with Image.open(io.BytesIO(response.get_data())) as thumb:
+                    assert max(thumb.size) == size, f"Thumbnail {size} is {thumb.size}"
+                    assert abs(thumb.size[0] - size * 2 / 3) <= 1, f"Aspect ratio not kept: {thumb.size}"
+
+            assert client.get(f'/api/nft/image/{_cid(2)}/thumb/100').status_code == 404
+            assert gateway.requests == 1, "Both thumbnails should come from one upstream fetch"
+
+        # A fresh cache object (another worker, or after restart) finds everything on disk
+        cache = NFTImageCache(cache_dir, 50 * 1024 * 1024, gateway.url)
+        cache.get_thumbnail(_cid(2), 256)
+        cache.get_original(_cid(2))
+        assert cache.upstream_fetches == 0 and gateway.requests == 1, "Warm cache should not call upstream"
+        print("  - 256/512 thumbnails generated from one fetch; warm cache makes no upstream calls")
+    finally:
+        gateway.close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("[PASS] Thumbnails")
+    return True
+
+
+def test_lru_eviction():
+    """Test that the least recently used files are evicted past the size limit."""
+    print("\n" + "=" * 80)
+    print("TEST: LRU Eviction")
+    print("=" * 80)
+
+    body = b'\x89PNG\r\n\x1a\n' + b'x' * 1000
+    gateway = StandInGateway({_cid(i): body for i in (1, 2, 3)})
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = NFTImageCache(cache_dir, 2500, gateway.url)
+        path_a, _ = cache.get_original(_cid(1))
+        path_b, _ = cache.get_original(_cid(2))
+        now = time.time()
+        os.utime(path_a, (now - 100, now - 100))
+        os.utime(path_b, (now - 200, now - 200))  # B is least recently used
+
+        path_c, _ = cache.get_original(_cid(3))
+        assert not os.path.exists(path_b), "Least recently used file should be evicted"
+        assert os.path.exists(path_a) and os.path.exists(path_c)
+        print("  - oldest entry evicted when the cache outgrew its limit")
+    finally:
+        gateway.close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("[PASS] LRU eviction")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 24 + "TACTIZEN NFT IMAGE CACHE TESTS" + " " * 24 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_original_served_from_cache,
+        test_thumbnails,
+        test_lru_eviction,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL NFT IMAGE CACHE TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,216 @@
+"""
+Test script for the Node.js worker pool.
+Runs the pool against a stub worker script (echo / sleep / exit ops) and
+checks back-pressure, per-request timeouts, restarts after a crash, and
+that workers which never finish starting, or a missing node binary, fail
+with WorkerPoolError and leave no process behind.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from app.services.node_worker_pool import (
+    NodeWorkerPool, PoolBusyError, WorkerCrashedError, WorkerPoolError, WorkerTimeoutError
+)
+
+# Same framing as scripts/zk_verify_worker.js. argv[2] 'silent' never sends
+# the ready frame; argv[3] is a file the worker writes its pid to.
+STUB_WORKER = r"""
+const fs = require('fs');
+const mode = process.argv[2] || 'ready';
+if (process.argv[3]) fs.writeFileSync(process.argv[3], String(process.pid));
+
+function send(message) {
+    const body = Buffer.from(JSON.stringify(message), 'utf8');
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(body.length, 0);
+    process.stdout.write(Buffer.concat([header, body]));
+}
+
+let pending = Buffer.alloc(0);
+process.stdin.on('data', (chunk) => {
+    pending = Buffer.concat([pending, chunk]);
+    while (pending.length >= 4) {
+        const length = pending.readUInt32BE(0);
+        if (pending.length < 4 + length) break;
+        const request = JSON.parse(pending.slice(4, 4 + length).toString('utf8'));
+        pending = pending.slice(4 + length);
+        if (request.op === 'exit') process.exit(3);
+        const reply = () => send({ id: request.id, value: request.value, pid: process.pid });
+        if (request.op === 'sleep') setTimeout(reply, request.ms); else reply();
+    }
+});
+process.stdin.on('end', () => process.exit(0));
+
+if (mode === 'ready') send({ id: 0, ready: true });
+"""
+
+
+def _stub_script(workdir):
+    path = os.path.join(workdir, 'stub_worker.js')
+    with open(path, 'w') as f:
+        f.write(STUB_WORKER)
+    return path
+
+
+def _process_gone(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+
+def test_back_pressure():
+    """Test that at most size + max_queue callers are admitted."""
+    print("\n" + "=" * 80)
+    print("TEST: Back-Pressure")
+    print("=" * 80)
+
+    workdir = tempfile.mkdtemp(prefix='test_node_pool_')
+    pool = NodeWorkerPool(_stub_script(workdir), size=1, max_queue=1, queue_timeout=5, startup_timeout=10)
+    try:
+        assert pool.request({'op': 'echo', 'value': 1})['value'] == 1
+        print("  - echo round trip")
+
+        results = []
+        busy = threading.Thread(target=lambda: results.append(pool.request({'op': 'sleep', 'ms': 800, 'value': 'a'})))
+        waiting = threading.Thread(target=lambda: results.append(pool.request({'op': 'echo', 'value': 'b'})))
+        busy.start()
+        time.sleep(0.2)
+        waiting.start()
+        time.sleep(0.2)
+
+        try:
+            pool.request({'op': 'echo', 'value': 'c'})
+            assert False, "Third caller should be refused while one runs and one waits"
+        except PoolBusyError:
+            pass
+        busy.join()
+        waiting.join()
+        assert [r['value'] for r in results] == ['a', 'b'], f"Results: {results}"
+        print("  - one running, one queued, the third caller refused; queued caller served after")
+    finally:
+        pool.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("[PASS] Back-pressure")
+    return True
+
+
+def test_timeout_and_restart():
+    """Test that timed-out and crashed workers are replaced."""
+    print("\n" + "=" * 80)
+    print("TEST: Timeout And Restart")
+    print("=" * 80)
+
+    workdir = tempfile.mkdtemp(prefix='test_node_pool_')
+    pool = NodeWorkerPool(_stub_script(workdir), size=1, startup_timeout=10)
+    try:
+        first = pool.request({'op': 'echo'})['pid']
+        try:
+            pool.request({'op': 'sleep', 'ms': 2000}, timeout=0.3)
+            assert False, "Slow request should time out"
+        except WorkerTimeoutError:
+            pass
+        assert _process_gone(first), "Timed-out worker should be killed"
+        second = pool.request({'op': 'echo'})['pid']
+        assert second != first and pool.restarts == 1
+        print(f"  - timed-out worker {first} killed, replaced by {second}")
+
+        try:
+            pool.request({'op': 'exit'})
+            assert False, "Worker exit should surface as a crash"
+        except WorkerCrashedError:
+            pass
+        third = pool.request({'op': 'echo', 'value': 'ok'})
+        assert third['value'] == 'ok' and third['pid'] != second and pool.restarts == 2
+        print(f"  - crashed worker {second} replaced by {third['pid']}")
+    finally:
+        pool.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("[PASS] Timeout and restart")
+    return True
+
+
+def test_startup_failures():
+    """Test that failed starts raise WorkerPoolError and leave no process."""
+    print("\n" + "=" * 80)
+    print("TEST: Startup Failures")
+    print("=" * 80)
+
+    workdir = tempfile.mkdtemp(prefix='test_node_pool_')
+    pid_file = os.path.join(workdir, 'worker.pid')
+    pool = NodeWorkerPool(_stub_script(workdir), args=['silent', pid_file], size=1, startup_timeout=0.5)
+    try:
+        try:
+            pool.request({'op': 'echo'})
+            assert False, "A worker that never reports ready should fail to start"
+        except WorkerTimeoutError:
+            pass
+        with open(pid_file) as f:
+            pid = int(f.read())
+        assert _process_gone(pid), f"Worker {pid} should be killed after the failed handshake"
+        print(f"  - handshake timeout: worker {pid} killed")
+    finally:
+        pool.close()
+
+    pool = NodeWorkerPool(_stub_script(workdir), node_binary=os.path.join(workdir, 'no-such-node'))
+    try:
+        try:
+            pool.request({'op': 'echo'})
+            assert False, "A missing node binary should fail"
+        except WorkerPoolError as e:
+            assert isinstance(e.__cause__, OSError), f"Unexpected cause: {e.__cause__!r}"
+        print("  - missing node binary: WorkerPoolError")
+    finally:
+        pool.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("[PASS] Startup failures")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 24 + "TACTIZEN NODE WORKER POOL TESTS" + " " * 23 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_back_pressure,
+        test_timeout_and_restart,
+        test_startup_failures,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL NODE WORKER POOL TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,466 @@
+"""
+Test script for the politics read model.
+Applies random party joins and leaves, XP gains, candidacies, regular and ZK
+votes, minister appointments and congress changes through the same hooks the
+routes use and checks the stored rosters, election summaries and government
+compositions against a from-scratch recomputation. Then renders the party,
+election, president and congress pages for a small and a large party /
+election / congress and checks both cost the same, bounded number of queries.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from flask_login import login_user
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, Country, PoliticalParty, PartyMembership, PartyElection, PartyCandidate, PartyVote, ElectionStatus,
+    GovernmentElection, ElectionCandidate, ElectionVote, CountryPresident, CongressMember, Minister,
+    ElectionType, GovernmentElectionStatus, CandidateStatus, MinistryType, ZKVote,
+    PartyRoster, ElectionSummary, GovernmentComposition,
+)
+from app.services.politics_read_model_service import PoliticsReadModelService, PARTY_ELECTION
+from app.party.routes import detail as party_detail
+from app.government.routes import election_detail, president as president_page, congress as congress_page
+from config import TestingConfig
+
+
+class PoliticsConfig(TestingConfig):
+    # Scheduler jobs would share (and roll back) the in-memory connection
+    SCHEDULER_ENABLED = False
+
+
+# Statement budgets per page, whatever the party / election / congress size
+MAX_PAGE_STATEMENTS = 40
+
+
+def _setup_database():
+    db.create_all()
+    # The party name CHECK constraint uses a MySQL function
+    raw = db.engine.raw_connection()
+    raw.driver_connection.create_function('char_length', 1, lambda s: len(s) if s is not None else None)
+
+
+def _seed_world(user_count):
+    country = Country(name='Testland', currency_code='TST')
+    db.session.add(country)
+    db.session.flush()
+    users = [
+        User(wallet_address=f'0x{i:040x}', username=f'citizen{i}', citizenship_id=country.id,
+             experience=random.Random(i).randint(0, 5000))
+        for i in range(user_count)
+    ]
+    db.session.add_all(users)
+    db.session.flush()
+    return country, users
+
+
+def _create_party(name, country, founder):
+    party = PoliticalParty(name=name, country_id=country.id, president_id=founder.id)
+    db.session.add(party)
+    db.session.flush()
+    _join(party, founder)
+    return party
+
+
+def _join(party, user):
+    db.session.add(PartyMembership(user_id=user.id, party_id=party.id))
+    user.party_id = party.id
+    PoliticsReadModelService.on_member_joined(party.id, user)
+
+
+def _leave(party, user):
+    membership = db.session.get(PartyMembership, (user.id, party.id))
+    db.session.delete(membership)
+    user.party_id = None
+    PoliticsReadModelService.on_member_left(party.id, user)
+
+
+def _government_election(country, election_type, status=GovernmentElectionStatus.VOTING, **dates):
+    now = datetime.utcnow()
+    election = GovernmentElection(
+        country_id=country.id, election_type=election_type, status=status,
+        nominations_start=now - timedelta(days=3), nominations_end=now - timedelta(days=1),
+        voting_start=now - timedelta(hours=12), voting_end=dates.get('voting_end', now + timedelta(hours=12)),
+        term_start=now + timedelta(days=1), term_end=now + timedelta(days=31),
+    )
+    db.session.add(election)
+    db.session.flush()
+    return election
+
+
+def _party_election(party, status=ElectionStatus.ACTIVE, ended_days_ago=None):
+    now = datetime.utcnow()
+    end_time = now - timedelta(days=ended_days_ago) if ended_days_ago is not None else now + timedelta(hours=12)
+    election = PartyElection(party_id=party.id, status=status,
+                             start_time=end_time - timedelta(days=1), end_time=end_time)
+    db.session.add(election)
+    db.session.flush()
+    return election
+
+
+def _zk_vote(election_type, election_id, choice, attested, tag):
+    db.session.add(ZKVote(
+        election_type=election_type, election_id=election_id, nullifier=f'0x{tag:064x}',
+        vote_choice=choice, merkle_root='0x' + '0' * 64, proof_verified=True,
+        zkverify_tx_hash=f'0x{tag:x}' if attested else None,
+    ))
+    PoliticsReadModelService.on_zk_vote(election_type, election_id, choice, attested=attested)
+
+
+def _rows(model, key_columns):
+    rows = {}
+    for row in db.session.scalars(db.select(model)).all():
+        db.session.refresh(row)
+        key = tuple(getattr(row, k) for k in key_columns)
+        rows[key] = {c.name: getattr(row, c.name) for c in model.__table__.columns
+                     if c.name not in ('updated_at', 'recomputed_at')}
+    return rows
+
+
+def _assert_matches(label, party_ids, elections, country_ids):
+    for party_id in party_ids:
+        stored = db.session.get(PartyRoster, party_id)
+        db.session.refresh(stored)
+        expected = PoliticsReadModelService.compute_roster(party_id)
+        actual = {k: getattr(stored, k) for k in expected}
+        assert actual == expected, f"{label}: roster {party_id} {actual} != {expected}"
+
+    for election_type, election_id in elections:
+        stored = db.session.get(ElectionSummary, (election_type, election_id))
+        db.session.refresh(stored)
+        expected, expected_tally = PoliticsReadModelService.compute_election(election_type, election_id)
+        actual = {k: getattr(stored, k) for k in expected}
+        assert actual == expected, f"{label}: summary {election_type}/{election_id} {actual} != {expected}"
+        tally = PoliticsReadModelService.get_tally(election_type, election_id)
+        for t in tally.values():
+            db.session.refresh(t)
+        actual_tally = {key: [t.votes, t.zk_votes] for key, t in tally.items()}
+        assert actual_tally == expected_tally, \
+            f"{label}: tally {election_type}/{election_id} {actual_tally} != {expected_tally}"
+
+    for country_id in country_ids:
+        stored = db.session.get(GovernmentComposition, country_id)
+        db.session.refresh(stored)
+        expected = PoliticsReadModelService.compute_composition(country_id)
+        actual = {k: getattr(stored, k) for k in expected}
+        assert actual == expected, f"{label}: composition {country_id} {actual} != {expected}"
+
+
+def test_read_model_matches_recompute():
+    """Test that rows kept through random events equal a from-scratch recomputation."""
+    print("\n" + "=" * 80)
+    print("TEST: Politics Read Model vs Recompute")
+    print("=" * 80)
+
+    app = create_app(PoliticsConfig)
+
+    with app.app_context():
+        _setup_database()
+        country, users = _seed_world(40)
+        parties = [_create_party(f'Party {i}', country, users[i]) for i in range(3)]
+        party_election = _party_election(parties[0], status=ElectionStatus.SCHEDULED)
+        congress_election = _government_election(country, ElectionType.CONGRESSIONAL)
+        db.session.commit()
+
+        # Materialize the rows, then mutate through the hooks
+        PoliticsReadModelService.get_rosters(p.id for p in parties)
+        PoliticsReadModelService.get_election_summary(PARTY_ELECTION, party_election.id)
+        PoliticsReadModelService.get_election_summary('congressional', congress_election.id)
+        PoliticsReadModelService.get_composition(country.id)
+
+        rnd = random.Random(7)
+        tag = 0
+        for step in range(400):
+            action = rnd.random()
+            user = rnd.choice(users[3:])
+            if action < 0.3:
+                if user.party_id is None:
+                    _join(rnd.choice(parties), user)
+                elif rnd.random() < 0.3:
+                    _leave(db.session.get(PoliticalParty, user.party_id), user)
+            elif action < 0.5:
+                user.add_experience(rnd.randint(1, 800), apply_global_multiplier=False)
+            elif action < 0.6:
+                if party_election.status == ElectionStatus.SCHEDULED and user.party_id == parties[0].id:
+                    existing = db.session.get(PartyCandidate, (party_election.id, user.id))
+                    if existing:
+                        db.session.delete(existing)
+                    else:
+                        db.session.add(PartyCandidate(election_id=party_election.id, user_id=user.id,
+                                                      announced_at=datetime.utcnow() + timedelta(seconds=step)))
+                    db.session.flush()
+                    PoliticsReadModelService.on_candidacy_change(PARTY_ELECTION, party_election.id)
+                if user.party_id and not db.session.scalar(
+                        db.select(ElectionCandidate).filter_by(election_id=congress_election.id, user_id=user.id)):
+                    db.session.add(ElectionCandidate(election_id=congress_election.id, user_id=user.id,
+                                                     party_id=user.party_id, status=CandidateStatus.APPROVED))
+                    db.session.flush()
+                    PoliticsReadModelService.on_candidacy_change('congressional', congress_election.id)
+            elif action < 0.8:
+                if step > 200:
+                    party_election.status = ElectionStatus.ACTIVE
+                keys = PoliticsReadModelService.ballot_order(PARTY_ELECTION, party_election.id)
+                if keys and party_election.status == ElectionStatus.ACTIVE and \
+                        not db.session.get(PartyVote, (party_election.id, user.id)):
+                    candidate_id = rnd.choice(keys)
+                    db.session.add(PartyVote(election_id=party_election.id, voter_id=user.id,
+                                             candidate_id=candidate_id))
+                    PoliticsReadModelService.on_vote(PARTY_ELECTION, party_election.id, candidate_id)
+                candidates = PoliticsReadModelService.ballot_order('congressional', congress_election.id)
+                if candidates and not db.session.scalar(
+                        db.select(ElectionVote).filter_by(election_id=congress_election.id, voter_user_id=user.id)):
+                    candidate_id = rnd.choice(candidates)
+                    db.session.add(ElectionVote(election_id=congress_election.id, candidate_id=candidate_id,
+                                                voter_user_id=user.id))
+                    PoliticsReadModelService.on_vote('congressional', congress_election.id, candidate_id)
+            elif action < 0.9:
+                tag += 1
+                if rnd.random() < 0.5:
+                    count = len(PoliticsReadModelService.ballot_order(PARTY_ELECTION, party_election.id))
+                    _zk_vote(PARTY_ELECTION, party_election.id, rnd.randint(0, count), rnd.random() < 0.5, tag)
+                else:
+                    count = len(PoliticsReadModelService.ballot_order('congressional', congress_election.id))
+                    _zk_vote('congressional', congress_election.id, rnd.randint(0, count), rnd.random() < 0.5, tag)
+            else:
+                ministry = rnd.choice(list(MinistryType))
+                current = db.session.scalar(
+                    db.select(Minister).filter_by(country_id=country.id, ministry_type=ministry, is_active=True))
+                if current:
+                    current.resign()
+                if not current or rnd.random() < 0.7:
+                    db.session.add(Minister(country_id=country.id, user_id=user.id, ministry_type=ministry,
+                                            appointed_by_user_id=users[0].id, is_active=True))
+                    db.session.flush()
+                # Congress turns over now and then
+                if rnd.random() < 0.3:
+                    for member in CongressMember.query.filter_by(country_id=country.id, is_current=True):
+                        member.is_current = False
+                    for rank, member_user in enumerate(rnd.sample(users, 6), start=1):
+                        if member_user.party_id:
+                            db.session.add(CongressMember(
+                                country_id=country.id, user_id=member_user.id, election_id=congress_election.id,
+                                party_id=member_user.party_id, term_start=datetime.utcnow(),
+                                term_end=datetime.utcnow() + timedelta(days=30),
+                                votes_received=rnd.randint(0, 50), final_rank=rank))
+                    db.session.flush()
+                PoliticsReadModelService.on_government_change(country.id)
+
+            if step % 50 == 49:
+                db.session.commit()
+
+        db.session.commit()
+        party_ids = [p.id for p in parties]
+        elections = [(PARTY_ELECTION, party_election.id), ('congressional', congress_election.id)]
+        _assert_matches("after events", party_ids, elections, [country.id])
+        summary = db.session.get(ElectionSummary, (PARTY_ELECTION, party_election.id))
+        print(f"  - {sum(db.session.get(PartyRoster, p).member_count for p in party_ids)} members, "
+              f"{summary.vote_count} + {summary.zk_vote_count} ZK party votes match")
+
+        # Nightly job must converge to the same values
+        before = _rows(ElectionSummary, ('election_type', 'election_id'))
+        PoliticsReadModelService.recompute_all()
+        db.session.commit()
+        _assert_matches("after recompute", party_ids, elections, [country.id])
+        assert _rows(ElectionSummary, ('election_type', 'election_id')) == before
+
+        # A rolled back join leaves the roster untouched
+        before = PoliticsReadModelService.compute_roster(parties[1].id)
+        loner = next(u for u in users if u.party_id is None)
+        _join(parties[1], loner)
+        db.session.rollback()
+        _assert_matches("after rollback", party_ids, elections, [country.id])
+        assert PoliticsReadModelService.compute_roster(parties[1].id) == before
+
+        db.drop_all()
+
+    print("[PASS] Politics read model matches full recomputation")
+    return True
+
+
+def _build_party(country, users, name, size):
+    """A party of `size` members with completed past elections, candidates and votes."""
+    party = _create_party(name, country, users[0])
+    for user in users[1:size]:
+        _join(party, user)
+    for days_ago in range(1, 8):
+        election = _party_election(party, status=ElectionStatus.COMPLETED, ended_days_ago=days_ago)
+        election.winner_id = users[days_ago % size].id
+        for user in users[:min(size, 5)]:
+            db.session.add(PartyCandidate(election_id=election.id, user_id=user.id))
+        for voter in users[:size]:
+            db.session.add(PartyVote(election_id=election.id, voter_id=voter.id,
+                                     candidate_id=users[voter.id % min(size, 5)].id))
+    current = _party_election(party, status=ElectionStatus.ACTIVE)
+    for user in users[:min(size, 5)]:
+        db.session.add(PartyCandidate(election_id=current.id, user_id=user.id))
+    db.session.flush()
+    return party
+
+
+def _build_election(country, users, election_type, candidate_count, voters):
+    """A government election with `candidate_count` approved candidates and `voters` votes of each kind."""
+    election = _government_election(country, election_type)
+    candidates = []
+    for user in users[:candidate_count]:
+        candidate = ElectionCandidate(election_id=election.id, user_id=user.id, party_id=user.party_id,
+                                      status=CandidateStatus.APPROVED)
+        db.session.add(candidate)
+        candidates.append(candidate)
+    db.session.flush()
+    kind = 'presidential' if election_type == ElectionType.PRESIDENTIAL else 'congressional'
+    for i, voter in enumerate(users[:voters]):
+        candidate = candidates[i % len(candidates)]
+        db.session.add(ElectionVote(election_id=election.id, candidate_id=candidate.id, voter_user_id=voter.id))
+        candidate.votes_received += 1
+        db.session.add(ZKVote(election_type=kind, election_id=election.id, nullifier=f'0x{election.id:032x}{i:032x}',
+                              vote_choice=i % (len(candidates) + 1), merkle_root='0x' + '0' * 64,
+                              proof_verified=True, zkverify_tx_hash=f'0x{i:x}'))
+    db.session.flush()
+    return election
+
+
+def _build_government(country, users, seats):
+    db.session.add(CountryPresident(country_id=country.id, user_id=users[0].id, term_start=datetime.utcnow(),
+                                    term_end=datetime.utcnow() + timedelta(days=30)))
+    for i, ministry in enumerate(MinistryType, start=1):
+        db.session.add(Minister(country_id=country.id, user_id=users[i].id, ministry_type=ministry,
+                                appointed_by_user_id=users[0].id))
+    election = _government_election(country, ElectionType.CONGRESSIONAL, status=GovernmentElectionStatus.COMPLETED,
+                                    voting_end=datetime.utcnow() - timedelta(days=1))
+    for rank, user in enumerate(users[1:seats + 1], start=1):
+        db.session.add(CongressMember(country_id=country.id, user_id=user.id, election_id=election.id,
+                                      party_id=user.party_id, term_start=datetime.utcnow(),
+                                      term_end=datetime.utcnow() + timedelta(days=30),
+                                      votes_received=100 - rank, final_rank=rank))
+    db.session.flush()
+
+
+def _count_statements(app, path, user, view, **kwargs):
+    """Render a view twice (the first builds missing rows) and count the second render's statements."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Call the view directly: the session security hooks are not under test
+    for attempt in range(2):
+        db.session.expire_all()
+        with app.test_request_context(path):
+            login_user(user)
+            if attempt:
+                event.listen(db.engine, 'before_cursor_execute', record)
+            try:
+                html = view(**kwargs)
+            finally:
+                if attempt:
+                    event.remove(db.engine, 'before_cursor_execute', record)
+        db.session.rollback()
+    assert isinstance(html, str), f"{path} should render, got {html!r}"
+    return len(statements), html
+
+
+def test_pages_cost_bounded_queries():
+    """Test that party, election and government pages cost the same queries for small and large inputs."""
+    print("\n" + "=" * 80)
+    print("TEST: Politics Pages Cost Bounded Queries")
+    print("=" * 80)
+
+    app = create_app(PoliticsConfig)
+
+    with app.app_context():
+        _setup_database()
+        small_country, small_users = _seed_world(8)
+        large_country = Country(name='Bigland', currency_code='BIG')
+        db.session.add(large_country)
+        db.session.flush()
+        large_users = [
+            User(wallet_address=f'0x{1000 + i:040x}', username=f'big{i}', citizenship_id=large_country.id,
+                 experience=i * 37)
+            for i in range(120)
+        ]
+        db.session.add_all(large_users)
+        db.session.flush()
+
+        small_party = _build_party(small_country, small_users, 'Small Party', 4)
+        large_party = _build_party(large_country, large_users, 'Large Party', 120)
+        small_election = _build_election(small_country, small_users, ElectionType.PRESIDENTIAL, 3, 4)
+        large_election = _build_election(large_country, large_users, ElectionType.PRESIDENTIAL, 40, 120)
+        _build_government(small_country, small_users, 2)
+        _build_government(large_country, large_users, 20)
+        db.session.commit()
+
+        pages = [
+            ('party', party_detail, '/party/{}', 'party_id', small_party.id, large_party.id),
+            ('election', election_detail, '/government/election/{}', 'election_id',
+             small_election.id, large_election.id),
+            ('president', president_page, '/government/politics/{}', 'country_id',
+             small_country.id, large_country.id),
+            ('congress', congress_page, '/government/congress/{}', 'country_id',
+             small_country.id, large_country.id),
+        ]
+        for name, view, path, arg, small_id, large_id in pages:
+            small_count, _ = _count_statements(app, path.format(small_id), small_users[0], view, **{arg: small_id})
+            large_count, html = _count_statements(app, path.format(large_id), large_users[0], view, **{arg: large_id})
+            print(f"  - {name}: {small_count} statements (small), {large_count} statements (large)")
+            assert small_count == large_count, f"{name} page query count grows with size"
+            assert large_count <= MAX_PAGE_STATEMENTS, f"{name} page runs {large_count} statements"
+
+        # The pages show the read model's numbers
+        _, html = _count_statements(app, f'/party/{large_party.id}', large_users[0], party_detail,
+                                    party_id=large_party.id)
+        assert '120 members' in html, "Party page should show the roster member count"
+        _, html = _count_statements(app, f'/government/election/{large_election.id}', large_users[0],
+                                    election_detail, election_id=large_election.id)
+        assert '(120 on-chain)' in html, "Election page should show the ZK proof total"
+        _, html = _count_statements(app, f'/government/congress/{large_country.id}', large_users[0],
+                                    congress_page, country_id=large_country.id)
+        assert 'Large Party' in html
+
+        db.drop_all()
+
+    print("[PASS] Politics pages cost a bounded number of queries")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 23 + "TACTIZEN POLITICS READ MODEL TESTS" + " " * 21 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_read_model_matches_recompute,
+        test_pages_cost_bounded_queries,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL POLITICS READ MODEL TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
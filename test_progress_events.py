@@ -0,0 +1,310 @@
+"""
+Test script for batched mission and achievement progress.
+Replays the same random sequence of player actions through the old
+synchronous path (MissionService.track_progress / AchievementService
+streaks) and through progress_events, then checks that mission progress,
+completions, streaks, unlocked achievements and gold all end up identical.
+Also checks that applying a request's events takes a fixed number of queries,
+and that events of a rolled back action are never applied.
+"""
+
+import random
+from datetime import date, timedelta
+
+from flask import Response, g
+
+from app import create_app
+from app.extensions import db
+from app.models import User
+from app.models.achievement import Achievement, AchievementProgress, UserAchievement
+from app.models.mission import Mission, UserMission
+from app.query_profiler import collect_queries
+from app.services.achievement_service import AchievementService
+from app.services.mission_service import MissionService
+from app.services.progress_events import STREAKS, track_mission, track_streak
+from config import TestingConfig
+
+MISSIONS = [
+    # code, action_type, requirement_count
+    ('fight_3', 'fight', 3),
+    ('fight_25', 'fight', 25),
+    ('work_8', 'work', 8),
+    ('train_2', 'train', 2),
+    ('study_4', 'study', 4),
+    ('buy_50', 'market_buy', 50),
+    ('travel_1', 'travel', 1),
+]
+
+# Action -> (mission action_type, streak or None, max amount per action)
+ACTIONS = {
+    'fight': ('fight', None, 1),
+    'work': ('work', 'work', 6),
+    'train': ('train', 'training', 1),
+    'study': ('study', 'study', 1),
+    'market_buy': ('market_buy', None, 20),
+    'travel': ('travel', None, 1),
+}
+
+START = date(2026, 1, 1)
+
+
+def _seed(user_count):
+    """Users, one assignment of every mission each, and 2/3/5-day streak achievements."""
+    users = [User(wallet_address=f'0x{i:040x}', username=f'player{i}') for i in range(user_count)]
+    missions = [
+        Mission(code=code, name=code, description=code, mission_type='daily', category='combat',
+                action_type=action, requirement_count=required)
+        for code, action, required in MISSIONS
+    ]
+    db.session.add_all(users + missions)
+    for _, tiers in STREAKS.values():
+        for tier, days in zip(tiers, (2, 3, 5)):
+            db.session.add(Achievement(code=tier, name=tier, description=tier, category='economic',
+                                       requirement_value=days, gold_reward=days * 10))
+    db.session.flush()
+    db.session.add_all([
+        UserMission(user_id=user.id, mission_id=mission.id) for user in users for mission in missions
+    ])
+    db.session.commit()
+    return users
+
+
+def _schedule(user_count, days, seed=7):
+    """Random actions: days -> requests -> [(user index, action, amount)]."""
+    rng = random.Random(seed)
+    schedule = []
+    for _ in range(days):
+        requests = []
+        for user_index in range(user_count):
+            if rng.random() < 0.2:
+                continue  # skipped day, breaks streaks
+            for _ in range(rng.randint(1, 3)):
+                requests.append([
+                    (user_index, action, rng.randint(1, ACTIONS[action][2]))
+                    for action in rng.sample(sorted(ACTIONS), rng.randint(1, 3))
+                ])
+        schedule.append(requests)
+    return schedule
+
+
+def _run_old(users, schedule):
+    for day_index, requests in enumerate(schedule):
+        day = START + timedelta(days=day_index)
+        for request in requests:
+            for user_index, action, amount in request:
+                user = users[user_index]
+                mission_action, streak, _ = ACTIONS[action]
+                if streak:
+                    code, tiers = STREAKS[streak]
+                    current_streak, _ = AchievementService.update_streak(user, code, day)
+                    for tier in tiers:
+                        AchievementService._check_and_unlock(user, tier, current_streak)
+                MissionService.track_progress(user, mission_action, amount)
+            db.session.commit()
+
+
+def _run_new(app, users, schedule):
+    for day_index, requests in enumerate(schedule):
+        day = START + timedelta(days=day_index)
+        for request in requests:
+            with app.test_request_context():
+                for user_index, action, amount in request:
+                    user = users[user_index]
+                    mission_action, streak, _ = ACTIONS[action]
+                    if streak:
+                        track_streak(user, streak, day)
+                    track_mission(user, mission_action, amount)
+                g.pop('_progress_pending').apply()
+                db.session.commit()
+
+
+def _snapshot():
+    db.session.expire_all()
+    missions = db.session.execute(
+        db.select(UserMission.user_id, Mission.code, UserMission.current_progress, UserMission.is_completed)
+        .join(UserMission.mission)
+    ).all()
+    progress = db.session.execute(
+        db.select(AchievementProgress.user_id, AchievementProgress.achievement_code,
+                  AchievementProgress.current_value, AchievementProgress.current_streak,
+                  AchievementProgress.best_streak, AchievementProgress.last_activity_date)
+    ).all()
+    unlocked = db.session.execute(
+        db.select(UserAchievement.user_id, Achievement.code, UserAchievement.gold_awarded)
+        .join(UserAchievement.achievement)
+    ).all()
+    gold = db.session.execute(db.select(User.id, User.gold)).all()
+    return {
+        'missions': sorted(missions),
+        'progress': sorted(progress),
+        'unlocked': sorted(unlocked),
+        'gold': sorted(gold),
+    }
+
+
+def test_replay_matches_synchronous_path():
+    """Test that batched progress gives exactly the same results as the old path."""
+    print("\n" + "=" * 80)
+    print("TEST: Replay Matches Synchronous Path")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+    schedule = _schedule(user_count=12, days=8)
+    print(f"  - replaying {sum(len(r) for day in schedule for r in day)} actions "
+          f"in {sum(len(day) for day in schedule)} requests over {len(schedule)} days")
+
+    snapshots = {}
+    with app.app_context():
+        for name in ('old', 'new'):
+            db.create_all()
+            users = _seed(12)
+            if name == 'old':
+                _run_old(users, schedule)
+            else:
+                _run_new(app, users, schedule)
+            snapshots[name] = _snapshot()
+            db.session.remove()
+            db.drop_all()
+
+    old, new = snapshots['old'], snapshots['new']
+    for key in old:
+        assert old[key] == new[key], f"{key} differs:\n  old={old[key]}\n  new={new[key]}"
+        print(f"  - {key}: {len(old[key])} rows identical")
+
+    completed = sum(1 for row in old['missions'] if row[3])
+    assert completed and old['unlocked'], "Replay should complete missions and unlock achievements"
+    print(f"  - {completed} missions completed, {len(old['unlocked'])} achievements unlocked on both paths")
+
+    print("[PASS] Replay matches synchronous path")
+    return True
+
+
+def test_constant_query_count():
+    """Test that applying a request's events does not cost queries per action."""
+    print("\n" + "=" * 80)
+    print("TEST: Constant Query Count")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        users = _seed(40)
+
+        counts = {}
+        for user_count in (4, 40):
+            with app.test_request_context():
+                for user in users[:user_count]:
+                    for action, (mission_action, _, _) in ACTIONS.items():
+                        track_mission(user, mission_action, 1)
+                        track_mission(user, mission_action, 1)
+                events = g.pop('_progress_pending')
+                with collect_queries() as stats:
+                    events.apply()
+                    db.session.commit()
+            counts[user_count] = stats.count
+            print(f"  - {user_count * len(ACTIONS) * 2} mission actions: {stats.count} queries")
+
+        assert counts[40] == counts[4], f"Query count grew with actions: {counts}"
+        fight_3 = db.session.scalar(
+            db.select(UserMission).join(UserMission.mission)
+            .where(Mission.code == 'fight_3', UserMission.user_id == users[0].id)
+        )
+        assert fight_3.current_progress == 3 and fight_3.is_completed, "Progress should cap at requirement"
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Constant query count")
+    return True
+
+
+def test_rollback_discards_events():
+    """Test that only events recorded in a committed transaction are applied."""
+    print("\n" + "=" * 80)
+    print("TEST: Rollback Discards Events")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    def progress(user_id):
+        db.session.expire_all()
+        return db.session.scalar(
+            db.select(UserMission.current_progress).join(UserMission.mission)
+            .where(Mission.code == 'fight_25', UserMission.user_id == user_id)
+        )
+
+    with app.app_context():
+        db.create_all()
+        user = _seed(1)[0]
+        user_id, gold = user.id, user.gold
+
+        # A purchase whose commit fails: the view rolls back and redirects
+        with app.test_request_context():
+            user = db.session.get(User, user_id)
+            track_mission(user, 'fight', 2)
+            db.session.rollback()
+            app.process_response(Response(status=302))
+        assert progress(user_id) == 0, "Events of a rolled back action were applied"
+        print("  - rolled back action: no progress")
+
+        # One committed action, then one rolled back in the same request
+        with app.test_request_context():
+            user = db.session.get(User, user_id)
+            track_mission(user, 'fight', 1)
+            db.session.commit()
+            track_mission(user, 'fight', 5)
+            db.session.rollback()
+            track_mission(user, 'fight', 7)  # Never committed
+            user.gold += 1
+            app.process_response(Response(status=200))
+        assert progress(user_id) == 1, f"Only the committed action should count, got {progress(user_id)}"
+        assert db.session.get(User, user_id).gold == gold, "Uncommitted view changes must not be committed"
+        print("  - committed, rolled back and uncommitted actions in one request: only the committed one counts")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Rollback discards events")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 23 + "TACTIZEN PROGRESS EVENTS TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_replay_matches_synchronous_path,
+        test_constant_query_count,
+        test_rollback_discards_events,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL PROGRESS EVENTS TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,146 @@
+"""
+Test script for the request-scoped SQL profiler.
+Checks statement fingerprints, N+1 detection, response headers and
+per-endpoint query budget enforcement.
+"""
+
+from sqlalchemy import select
+
+from app import create_app
+from app.extensions import db
+from app.models import Country
+from app.query_profiler import (
+    fingerprint, collect_queries, query_budget, QueryBudgetExceeded, profile_report
+)
+from config import TestingConfig
+
+
+def test_fingerprint_normalization():
+    """Test that statements differing only in values share a fingerprint."""
+    print("\n" + "=" * 80)
+    print("TEST: Statement Fingerprints")
+    print("=" * 80)
+
+    a = fingerprint("SELECT * FROM user WHERE id = 5 AND name = 'bob'")
+    b = fingerprint("SELECT  *\n FROM user WHERE id = %(id_1)s AND name = 'o''neil'")
+    assert a == b, f"Fingerprints differ: {a!r} vs {b!r}"
+
+    c = fingerprint("SELECT * FROM region WHERE id IN (?, ?, ?)")
+    d = fingerprint("SELECT * FROM region WHERE id IN (?)")
+    assert c == d, "IN lists of different lengths should share a fingerprint"
+
+    print("[PASS] Fingerprints normalize literals and bound values")
+    return True
+
+
+def test_n_plus_one_detection():
+    """Test that a per-row lookup loop is flagged and breaks a query budget."""
+    print("\n" + "=" * 80)
+    print("TEST: N+1 Detection")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        countries = [Country(name=f'Budgetland {i}', currency_code=f'B{i:02d}') for i in range(6)]
+        db.session.add_all(countries)
+        db.session.commit()
+        ids = [c.id for c in countries]
+
+        with collect_queries() as stats:
+            for country_id in ids:
+                db.session.execute(select(Country).where(Country.id == country_id)).scalar_one()
+        suspects = stats.n_plus_one_suspects(threshold=5)
+        assert stats.count == 6, f"Expected 6 queries, counted {stats.count}"
+        assert len(suspects) == 1 and suspects[0][1] == 6, f"Loop not flagged: {suspects}"
+
+        with collect_queries() as stats:
+            db.session.scalars(select(Country).where(Country.id.in_(ids))).all()
+        assert stats.count == 1 and not stats.n_plus_one_suspects(), "Batched query should not be flagged"
+
+        try:
+            with query_budget(2, label='country loop'):
+                for country_id in ids:
+                    db.session.execute(select(Country).where(Country.id == country_id)).scalar_one()
+            raise AssertionError("query_budget did not raise")
+        except QueryBudgetExceeded as e:
+            assert 'country loop issued 6 queries' in str(e), str(e)
+
+        db.drop_all()
+
+    print("[PASS] Repeated SELECTs flagged; budgets enforced")
+    return True
+
+
+def test_request_headers_and_budget():
+    """Test the X-SQL-* headers, the admin report and endpoint budget enforcement."""
+    print("\n" + "=" * 80)
+    print("TEST: Request Profiling")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+    profile_report.reset()
+
+    with app.app_context():
+        db.create_all()
+
+        with app.test_client() as client:
+            response = client.get('/')
+            assert 'X-SQL-Queries' in response.headers, "Missing X-SQL-Queries header"
+            assert 'X-SQL-Time-Ms' in response.headers, "Missing X-SQL-Time-Ms header"
+            assert any(row['endpoint'] == 'main.index' for row in profile_report.endpoints()), \
+                "Request not recorded in profile report"
+
+            app.config['SQL_QUERY_BUDGETS'] = {'main.index': -1}
+            try:
+                client.get('/')
+                raise AssertionError("Budget overrun did not fail the request")
+            except QueryBudgetExceeded:
+                pass
+
+        db.drop_all()
+
+    print("[PASS] Headers set, report recorded, budget enforced in testing")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 25 + "TACTIZEN SQL PROFILER TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_fingerprint_normalization,
+        test_n_plus_one_detection,
+        test_request_headers_and_budget,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL SQL PROFILER TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,198 @@
+"""
+Test script for the in-process reference data registry.
+Checks that fight-path lookups and page renders issue no queries against the
+reference tables once the registry is warm, and that admin edits (version
+bumps) are picked up.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, Resource, ResourceCategory, InventoryItem, MilitaryRank, GameSettings, GameEvent, SharedVersion
+)
+from app.models.battle import WallType
+from app.query_profiler import collect_queries
+from app.services.battle_service import BattleService
+from app.services import shared_versions
+from app.services.reference_data import reference_data, VERSION_NAME
+from config import TestingConfig
+
+
+REFERENCE_TABLE = re.compile(
+    r'\b(FROM|JOIN)\s+"?(resource|military_ranks|game_settings|game_events)"?\b', re.IGNORECASE
+)
+
+
+def _reference_queries(stats):
+    return [fp for fp in stats.fingerprints if REFERENCE_TABLE.search(fp)]
+
+
+def _seed():
+    rifle = Resource('Rifle', ResourceCategory.WEAPON, can_have_quality=True)
+    db.session.add(rifle)
+    db.session.add_all([
+        MilitaryRank(id=1, name='Recruit', xp_required=0, damage_bonus=0),
+        MilitaryRank(id=2, name='Private', xp_required=5, damage_bonus=2),
+    ])
+    db.session.add(GameSettings(key=GameSettings.GAME_START_DATE,
+                                value=(datetime.utcnow() - timedelta(days=9)).strftime('%Y-%m-%d')))
+    now = datetime.utcnow()
+    db.session.add(GameEvent.create_event('double_xp', 'Double XP', now - timedelta(hours=1), now + timedelta(hours=1)))
+    db.session.flush()
+
+    user = User(wallet_address='0x' + '1' * 40, username='soldier', military_rank_id=1)
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(InventoryItem(user_id=user.id, resource_id=rifle.id, quality=3, quantity=5))
+    db.session.commit()
+    return user, rifle
+
+
+def test_fight_lookups_hit_no_reference_tables():
+    """Test that the fight path's reference lookups are served from memory."""
+    print("\n" + "=" * 80)
+    print("TEST: Fight Path On Warm Registry")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        user, rifle = _seed()
+        reference_data.invalidate()
+        reference_data.snapshot()
+
+        with collect_queries() as stats:
+            assert BattleService.get_best_weapon(user, WallType.INFANTRY) == (rifle.id, 3)
+            BattleService.get_rank_damage_bonus(user)
+            battle_multiplier = GameEvent.get_effective_multiplier('battle_xp_multiplier')
+            xp_multiplier = GameEvent.get_effective_multiplier('xp_multiplier')
+            user.add_rank_xp(10)
+            user.add_experience(2)
+            game_day = GameSettings.get_game_day()
+
+        offending = _reference_queries(stats)
+        assert not offending, f"Reference tables queried on warm cache: {offending}"
+        assert battle_multiplier == 1.0 and xp_multiplier == 2.0, "Event multipliers wrong"
+        assert user.military_rank_id == 2, "Rank-up should use cached rank thresholds"
+        assert game_day == 10, f"Expected game day 10, got {game_day}"
+        print(f"  - {stats.count} queries, none against reference tables")
+
+        db.drop_all()
+
+    print("[PASS] Fight lookups served from the registry")
+    return True
+
+
+def test_page_render_hits_no_reference_tables():
+    """Test that rendering a page (game_day in every template) does not query settings."""
+    print("\n" + "=" * 80)
+    print("TEST: Page Render On Warm Registry")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+        reference_data.invalidate()
+
+        with app.test_client() as client:
+            client.get('/')  # Warm
+            with collect_queries() as stats:
+                response = client.get('/')
+            assert response.status_code == 200, f"Index returned {response.status_code}"
+
+        offending = _reference_queries(stats)
+        assert not offending, f"Reference tables queried during render: {offending}"
+
+        db.drop_all()
+
+    print("[PASS] Page render served from the registry")
+    return True
+
+
+def test_admin_edit_bumps_version():
+    """Test that settings/events edits are visible after a version bump."""
+    print("\n" + "=" * 80)
+    print("TEST: Version Bump On Admin Edit")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+        reference_data.invalidate()
+        assert GameEvent.get_effective_multiplier('xp_multiplier') == 2.0
+        loads = reference_data.loads
+
+        GameSettings.set_value(GameSettings.XP_MULTIPLIER, '1.5')
+        assert GameEvent.get_effective_multiplier('xp_multiplier') == 3.0, "Setting change not picked up"
+
+        event = db.session.scalar(db.select(GameEvent))
+        event.is_active = False
+        db.session.commit()
+        reference_data.bump_version()
+        assert GameEvent.get_effective_multiplier('xp_multiplier') == 1.5, "Event toggle not picked up"
+        assert reference_data.loads == loads + 2, "Each bump should trigger exactly one reload"
+        assert db.session.get(SharedVersion, VERSION_NAME).version == 2, "Bumps should land in shared_version"
+        print("  - Setting change and event toggle reloaded once each")
+
+        # Another worker's edit: only the shared counter moves in this process's view
+        db.session.scalar(db.select(GameSettings).filter_by(key=GameSettings.XP_MULTIPLIER)).value = '1.0'
+        shared_versions.bump(VERSION_NAME)
+        db.session.commit()
+        with app.test_request_context('/'):
+            assert GameEvent.get_effective_multiplier('xp_multiplier') == 1.0, "Other worker's edit not picked up"
+        assert reference_data.loads == loads + 3
+        print("  - Version bumped elsewhere reloaded on the next request")
+
+        db.drop_all()
+
+    print("[PASS] Admin edits reload the registry")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 24 + "TACTIZEN REFERENCE DATA TESTS" + " " * 25 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_fight_lookups_hit_no_reference_tables,
+        test_page_render_hits_no_reference_tables,
+        test_admin_edit_bumps_version,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL REFERENCE DATA TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,221 @@
+"""
+Test script for financial transaction rollups and archival.
+Rolls up several days of random transactions and checks that report
+totals and per-user gains read from the rollups (plus raw edges) match a
+full scan of the raw table for arbitrary windows, then archives an old
+month and checks the export file, the removed rows and that reports over
+the archived month are unchanged.
+"""
+
+import csv
+import gzip
+import random
+import tempfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app import create_app
+from app.extensions import db
+from app.models import FinancialTransaction, TransactionArchive, TransactionDailyType
+from app.services.transaction_history_service import TransactionHistoryService
+from config import TestingConfig
+
+TODAY = date(2026, 3, 15)
+NOW = datetime(2026, 3, 15, 13, 30)
+TYPES = ['GOLD_GAIN', 'MARKET_SELL', 'MARKET_BUY', 'CURRENCY_EXCHANGE', 'work_payment']
+
+
+def _seed(start, end, per_day=60, seed=3):
+    """Random transactions for users 1-10 from `start` up to `end` (datetimes)."""
+    rng = random.Random(seed)
+    rows = []
+    moment = start
+    while moment < end:
+        for _ in range(per_day):
+            rows.append(FinancialTransaction(
+                user_id=rng.randint(1, 10),
+                transaction_type=rng.choice(TYPES),
+                amount=Decimal(rng.randint(1, 5000)) / 4,
+                currency_type=rng.choice(['GOLD', 'GOLD', 'TST']),
+                balance_after=Decimal('0'),
+                timestamp=moment + timedelta(seconds=rng.randint(0, 86399)),
+                description='seed'
+            ))
+        moment += timedelta(days=1)
+    rows = [r for r in rows if r.timestamp < end]
+    db.session.add_all(rows)
+    db.session.commit()
+    return len(rows)
+
+
+def _raw_total(since, until, currency_type=None, types=None):
+    query = db.select(db.func.sum(FinancialTransaction.amount)).where(
+        FinancialTransaction.timestamp >= since, FinancialTransaction.timestamp < until
+    )
+    if currency_type:
+        query = query.where(FinancialTransaction.currency_type == currency_type)
+    if types:
+        query = query.where(FinancialTransaction.transaction_type.in_(types))
+    return Decimal(db.session.scalar(query) or 0)
+
+
+def _raw_gains(since, until, types, currency_type):
+    rows = db.session.execute(
+        db.select(FinancialTransaction.user_id, db.func.sum(FinancialTransaction.amount))
+        .where(
+            FinancialTransaction.timestamp >= since, FinancialTransaction.timestamp < until,
+            FinancialTransaction.transaction_type.in_(types), FinancialTransaction.currency_type == currency_type
+        )
+        .group_by(FinancialTransaction.user_id)
+    ).all()
+    return {user_id: Decimal(amount) for user_id, amount in rows}
+
+
+def test_rollup_totals_match_raw():
+    """Test that rollup-backed report windows equal a full raw scan."""
+    print("\n" + "=" * 80)
+    print("TEST: Rollup Totals Match Raw")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        count = _seed(datetime(2026, 3, 1), NOW)
+        print(f"  - seeded {count} transactions from 2026-03-01 to {NOW}")
+
+        days = TransactionHistoryService.rollup_pending(TODAY)
+        db.session.commit()
+        assert days == 14, f"Expected 14 completed days rolled up, got {days}"
+        assert TransactionHistoryService.rolled_up_through() == TODAY - timedelta(days=1)
+        # Re-running is a no-op; recomputing a day is idempotent
+        assert TransactionHistoryService.rollup_pending(TODAY) == 0
+        TransactionHistoryService.rollup_day(date(2026, 3, 10))
+        db.session.commit()
+
+        windows = [
+            (NOW - timedelta(hours=24), NOW),
+            (NOW - timedelta(days=7), NOW),
+            (datetime(2026, 3, 1), NOW),
+            (datetime(2026, 3, 4, 6, 15), datetime(2026, 3, 9, 17, 0)),
+            (datetime(2026, 3, 15), NOW),
+        ]
+        for since, until in windows:
+            for currency_type, types in ((None, None), ('GOLD', None), ('GOLD', ['GOLD_GAIN', 'MARKET_SELL'])):
+                expected = _raw_total(since, until, currency_type, types)
+                actual = TransactionHistoryService.totals(since, until, currency_type=currency_type, transaction_types=types)
+                assert actual == expected, f"totals({since}, {until}, {currency_type}, {types}): {actual} != {expected}"
+            gain_types = ['GOLD_GAIN', 'MARKET_SELL', 'CURRENCY_EXCHANGE']
+            expected_gains = _raw_gains(since, until, gain_types, 'GOLD')
+            actual_gains = TransactionHistoryService.gains_by_user(since, gain_types, 'GOLD', until=until)
+            assert actual_gains == expected_gains, f"gains_by_user({since}, {until}) differs"
+        print(f"  - {len(windows)} windows: totals and per-user gains equal the raw scan")
+
+        # Days not rolled up yet (the job has not run) are read from the raw table
+        db.session.execute(db.delete(TransactionDailyType).where(TransactionDailyType.day >= date(2026, 3, 12)))
+        db.session.commit()
+        since = NOW - timedelta(days=7)
+        assert TransactionHistoryService.totals(since, NOW) == _raw_total(since, NOW)
+        print("  - days missing from the rollups fall back to raw rows")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Rollup totals match raw")
+    return True
+
+
+def test_archive_month():
+    """Test exporting and removing an old month while reports stay correct."""
+    print("\n" + "=" * 80)
+    print("TEST: Archive Month")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context(), tempfile.TemporaryDirectory() as out_dir:
+        db.create_all()
+        _seed(datetime(2026, 1, 1), NOW, per_day=20)
+
+        january = (datetime(2026, 1, 1), datetime(2026, 2, 1))
+        january_rows = db.session.scalar(
+            db.select(db.func.count()).select_from(FinancialTransaction)
+            .where(FinancialTransaction.timestamp >= january[0], FinancialTransaction.timestamp < january[1])
+        )
+        before = _raw_total(datetime(2026, 1, 10), NOW)
+
+        assert TransactionHistoryService.archivable_months(1, TODAY) == [date(2026, 1, 1)]
+        try:
+            TransactionHistoryService.archive_month(date(2026, 3, 1), out_dir, today=TODAY)
+            assert False, "The current month must not be archivable"
+        except ValueError:
+            pass
+
+        result = TransactionHistoryService.archive_month(date(2026, 1, 1), out_dir, today=TODAY)
+        assert result['rows'] == january_rows and result['removed'] == january_rows, f"Result: {result}"
+        remaining = db.session.scalar(
+            db.select(db.func.count()).select_from(FinancialTransaction)
+            .where(FinancialTransaction.timestamp < january[1])
+        )
+        assert remaining == 0, "Archived rows should be removed"
+
+        with gzip.open(result['file'], 'rt', newline='') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][:3] == ['id', 'timestamp', 'user_id'] and len(rows) == january_rows + 1
+        archive = db.session.get(TransactionArchive, '2026-01')
+        assert archive and archive.row_count == january_rows and len(archive.sha256) == 64
+        print(f"  - {january_rows} rows exported to {result['file'].split('/')[-1]} and removed")
+
+        after = TransactionHistoryService.totals(datetime(2026, 1, 10), NOW)
+        assert after == before, f"Reports over the archived month changed: {after} != {before}"
+        print("  - reports spanning the archived month are unchanged")
+
+        again = TransactionHistoryService.archive_month(date(2026, 1, 1), out_dir, today=TODAY)
+        assert again['removed'] == 0 and again['rows'] == january_rows
+        print("  - re-running the archive is a no-op")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Archive month")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 22 + "TACTIZEN TRANSACTION HISTORY TESTS" + " " * 22 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_rollup_totals_match_raw,
+        test_archive_month,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL TRANSACTION HISTORY TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,236 @@
+"""
+Test script for bulk military unit supply distribution.
+Distributes to units of 50 and 500 members and checks that the query count
+does not grow with the number of recipients, that storage limits (including
+Storage Increase NFTs) are respected, and that the rank and explicit
+allocation modes give each member the right amount.
+"""
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, Country, Resource, ResourceCategory, MilitaryUnit, MilitaryUnitMember,
+    MilitaryUnitInventory, MilitaryUnitRank, MilitaryUnitTransaction
+)
+from app.models.resource import InventoryItem
+from app.models.nft import NFTInventory, PlayerNFTSlots
+from app.models.messaging import Alert
+from app.query_profiler import collect_queries
+from app.services.unit_supply_service import UnitSupplyService, SupplyError
+from config import TestingConfig
+
+
+def _seed_unit(name, size, stock=1000000, start=0):
+    """Unit with `size` members (the first one is commander) and Q1 bread in stock."""
+    country = db.session.scalar(db.select(Country)) or Country(name='Testland', currency_code='TST')
+    resource = db.session.scalar(db.select(Resource).where(Resource.slug == 'bread')) or Resource(
+        'Bread', ResourceCategory.FOOD, can_have_quality=True
+    )
+    db.session.add_all([country, resource])
+    db.session.flush()
+
+    users = [User(wallet_address=f'0x{start + i:040x}', username=f'soldier{start + i}') for i in range(size)]
+    db.session.add_all(users)
+    db.session.flush()
+
+    unit = MilitaryUnit(name=name, country_id=country.id, commander_id=users[0].id)
+    db.session.add(unit)
+    db.session.flush()
+    ranks = [MilitaryUnitRank.COMMANDER] + [
+        MilitaryUnitRank.OFFICER if i % 10 == 0 else MilitaryUnitRank.SOLDIER for i in range(1, size)
+    ]
+    db.session.add_all([
+        MilitaryUnitMember(unit_id=unit.id, user_id=user.id, rank=rank) for user, rank in zip(users, ranks)
+    ])
+    db.session.add(MilitaryUnitInventory(unit_id=unit.id, resource_id=resource.id, quality=1, quantity=stock))
+    db.session.commit()
+    return unit, users, resource
+
+
+def _held(user, resource, quality=1):
+    item = db.session.get(InventoryItem, (user.id, resource.id, quality))
+    return item.quantity if item else 0
+
+
+def _stock(unit, resource, quality=1):
+    return db.session.get(MilitaryUnitInventory, (unit.id, resource.id, quality)).quantity
+
+
+def test_constant_query_count():
+    """Test that supplying 500 members takes as many queries as supplying 50."""
+    print("\n" + "=" * 80)
+    print("TEST: Constant Query Count")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.test_request_context():
+        db.create_all()
+        small, small_users, resource = _seed_unit('Small Unit', 50)
+        large, large_users, _ = _seed_unit('Large Unit', 500, start=1000)
+
+        counts = {}
+        for unit, users in ((small, small_users), (large, large_users)):
+            with collect_queries() as stats:
+                result = UnitSupplyService.distribute(unit, users[0], resource.id, 1, 'equal', total=len(users) * 5)
+                db.session.commit()
+            counts[len(users)] = stats.count
+            assert result['recipients'] == len(users) and result['distributed'] == len(users) * 5
+            print(f"  - {len(users)} recipients: {stats.count} queries")
+
+        assert counts[500] == counts[50], f"Query count grew with recipients: {counts}"
+        assert all(_held(u, resource) == 5 for u in large_users), "Every member should get 5"
+        assert _stock(large, resource) == 1000000 - 2500
+        logged = db.session.scalar(
+            db.select(db.func.count()).select_from(MilitaryUnitTransaction)
+            .where(MilitaryUnitTransaction.unit_id == large.id)
+        )
+        alerts = db.session.scalar(
+            db.select(db.func.count()).select_from(Alert).where(Alert.user_id.in_([u.id for u in large_users]))
+        )
+        assert logged == 500 and alerts == 500, f"Expected 500 log rows and alerts, got {logged}/{alerts}"
+
+        # Second round adds to the existing rows through the upsert
+        UnitSupplyService.distribute(large, large_users[0], resource.id, 1, 'equal', total=1000)
+        db.session.commit()
+        db.session.expire_all()
+        assert all(_held(u, resource) == 7 for u in large_users), "Existing rows should be incremented"
+        print("  - second round incremented existing inventory rows")
+
+        db.drop_all()
+
+    print("[PASS] Constant query count")
+    return True
+
+
+def test_storage_limits():
+    """Test that recipients only get what fits and the rest stays with the unit."""
+    print("\n" + "=" * 80)
+    print("TEST: Storage Limits")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.test_request_context():
+        db.create_all()
+        unit, users, resource = _seed_unit('Storage Unit', 4, stock=5000)
+        full, nearly_full, boosted = users[1], users[2], users[3]
+
+        db.session.add(InventoryItem(user_id=full.id, resource_id=resource.id, quality=2, quantity=1000))
+        db.session.add(InventoryItem(user_id=nearly_full.id, resource_id=resource.id, quality=2, quantity=900))
+        nft = NFTInventory(user_id=boosted.id, nft_type='player', category='storage_increase', tier=1,
+                           bonus_value=500, token_id=1, contract_address='0x' + '0' * 40, acquired_via='drop')
+        db.session.add(nft)
+        db.session.flush()
+        db.session.add(InventoryItem(user_id=boosted.id, resource_id=resource.id, quality=2, quantity=1000))
+        db.session.add(PlayerNFTSlots(user_id=boosted.id, slot_2_nft_id=nft.id))
+        db.session.commit()
+
+        result = UnitSupplyService.distribute(unit, users[0], resource.id, 1, 'equal', total=800)
+        db.session.commit()
+        db.session.expire_all()
+
+        assert _held(users[0], resource) == 200
+        assert _held(full, resource) == 0
+        assert _held(nearly_full, resource) == 100, "Should get only what fits (1000 - 900)"
+        assert _held(boosted, resource) == 200, "Storage NFT should add capacity"
+        assert result['shortfall'] == {full.id: 200, nearly_full.id: 100}, f"Shortfall: {result['shortfall']}"
+        assert _stock(unit, resource) == 5000 - 500, "Undelivered items must stay with the unit"
+        print("  - full storage skipped, partial delivery, NFT bonus respected")
+
+        db.drop_all()
+
+    print("[PASS] Storage limits")
+    return True
+
+
+def test_rank_and_explicit_modes():
+    """Test per-rank quotas, explicit quantities and invalid requests."""
+    print("\n" + "=" * 80)
+    print("TEST: Rank And Explicit Modes")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.test_request_context():
+        db.create_all()
+        unit, users, resource = _seed_unit('Rank Unit', 21, stock=1000)
+        commander, officer, soldier = users[0], users[10], users[1]
+
+        UnitSupplyService.distribute(unit, commander, resource.id, 1, 'rank',
+                                     rank_quotas={'officer': 20, 'soldier': 5})
+        db.session.commit()
+        assert _held(commander, resource) == 0, "Ranks without a quota get nothing"
+        assert _held(officer, resource) == 20 and _held(soldier, resource) == 5
+        assert _stock(unit, resource) == 1000 - 2 * 20 - 18 * 5
+        print("  - rank quotas applied")
+
+        UnitSupplyService.distribute(unit, commander, resource.id, 1, 'explicit',
+                                     member_quantities={str(officer.id): 3, str(soldier.id): 7})
+        db.session.commit()
+        db.session.expire_all()
+        assert _held(officer, resource) == 23 and _held(soldier, resource) == 12
+        print("  - explicit quantities applied")
+
+        outsider = User(wallet_address='0x' + 'f' * 40, username='outsider')
+        db.session.add(outsider)
+        db.session.commit()
+        for kwargs in (
+            {'mode': 'explicit', 'member_quantities': {outsider.id: 1}},
+            {'mode': 'equal', 'total': 100000},
+            {'mode': 'rank', 'rank_quotas': {'general': 1}},
+            {'mode': 'everyone', 'total': 10},
+        ):
+            try:
+                UnitSupplyService.distribute(unit, commander, resource.id, 1, **kwargs)
+                assert False, f"Expected SupplyError for {kwargs}"
+            except SupplyError:
+                db.session.rollback()
+        assert _held(outsider, resource) == 0
+        print("  - non-members, oversized totals and unknown ranks/modes rejected")
+
+        db.drop_all()
+
+    print("[PASS] Rank and explicit modes")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 26 + "TACTIZEN UNIT SUPPLY TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_constant_query_count,
+        test_storage_limits,
+        test_rank_and_explicit_modes,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL UNIT SUPPLY TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,222 @@
+"""
+Test script for the in-memory username prefix index.
+Checks prefix lookups after adds and renames, that another worker's delta
+refresh moves renamed users and drops deleted ones, that renames,
+soft-deletes and restores bump the shared_version row only once committed, and that the admin player searches
+match wallet and IP fragments anywhere and usernames by prefix.
+"""
+
+from flask_login import login_user
+
+from app import create_app
+from app.admin.routes import players, wealth_investigation
+from app.extensions import db
+from app.models import User, SharedVersion
+from app.services import shared_versions
+from app.services.username_index import UsernameIndex, VERSION_NAME, username_index
+from config import TestingConfig
+
+
+class UsernameIndexConfig(TestingConfig):
+    SCHEDULER_ENABLED = False
+    SQL_PROFILER_ENABLED = False
+
+
+def _seed():
+    users = [
+        User(wallet_address='0x' + f'{i:040x}', username=name)
+        for i, name in enumerate(['Alice', 'alina', 'Bob', 'Albert', 'carol'], start=1)
+    ]
+    db.session.add_all(users)
+    db.session.commit()
+    return {u.username: u for u in users}
+
+
+def _names(index, prefix):
+    users = {u.id: u.username for u in db.session.scalars(db.select(User))}
+    return [users[user_id] for user_id in index.prefix_ids(prefix, limit=20)]
+
+
+def _other_worker_refresh(index):
+    """What ensure_current() does once REFRESH_INTERVAL has passed."""
+    index._checked_at = 0.0
+    index.ensure_current()
+
+
+def test_add_and_rename():
+    """Test prefix lookups, adds and renames in one worker."""
+    print("\n" + "=" * 80)
+    print("TEST: Add And Rename")
+    print("=" * 80)
+
+    app = create_app(UsernameIndexConfig)
+
+    with app.app_context():
+        db.create_all()
+        users = _seed()
+        index = UsernameIndex()
+        index.rebuild()
+
+        assert _names(index, 'AL') == ['Albert', 'Alice', 'alina'], _names(index, 'AL')
+        assert index.prefix_ids('al', limit=2, exclude_id=users['Albert'].id) == [users['Alice'].id, users['alina'].id]
+        print("  - case-insensitive prefix lookup in username order")
+
+        dave = User(wallet_address='0x' + 'd' * 40, username='Dave')
+        db.session.add(dave)
+        db.session.commit()
+        index.add(dave.id, dave.username)
+        index.add(dave.id, dave.username)
+        assert _names(index, 'd') == ['Dave'] and len(index) == 6
+        print("  - add is idempotent")
+
+        users['Bob'].username = 'Alfred'
+        db.session.commit()
+        index.add(users['Bob'].id, 'Alfred')  # No old name given: found by ID
+        assert _names(index, 'b') == [] and _names(index, 'alf') == ['Alfred'] and len(index) == 6
+        print("  - rename without the old name moves the entry")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Add and rename")
+    return True
+
+
+def test_delta_refresh():
+    """Test that another worker picks up renames, deletes and restores."""
+    print("\n" + "=" * 80)
+    print("TEST: Delta Refresh")
+    print("=" * 80)
+
+    app = create_app(UsernameIndexConfig)
+
+    with app.app_context():
+        db.create_all()
+        users = _seed()
+        username_index.rebuild()
+        other = UsernameIndex()
+        other.rebuild()
+
+        users['Alice'].username = 'Zoe'
+        username_index.stage_change(users['Alice'].id, 'Zoe')
+        db.session.commit()
+        assert db.session.get(SharedVersion, VERSION_NAME).version == 1, "Rename should bump the shared_version row"
+        assert _names(username_index, 'zo') == ['Zoe'] and _names(username_index, 'alic') == []
+        _other_worker_refresh(other)
+        assert _names(other, 'alic') == [], "Renamed user still matches the old name"
+        assert _names(other, 'zo') == ['Zoe'] and len(other) == 5
+        print("  - rename: old key removed, new key added, version kept in the database")
+
+        version = shared_versions.current(VERSION_NAME)
+        users['carol'].soft_delete()
+        assert shared_versions.current(VERSION_NAME) == version, "Version bumped before the delete committed"
+        db.session.rollback()
+        assert shared_versions.current(VERSION_NAME) == version, "Rolled back delete bumped the version"
+        assert _names(username_index, 'car') == ['carol']
+
+        users['carol'].soft_delete()
+        db.session.commit()
+        assert shared_versions.current(VERSION_NAME) == version + 1, "Committed delete should bump the version"
+        assert _names(username_index, 'car') == [], "Deleting worker should drop the user at once"
+        _other_worker_refresh(other)
+        assert _names(other, 'car') == [] and len(other) == 4
+        print("  - soft-delete: published on commit only, dropped by both workers")
+
+        users['carol'].restore()
+        db.session.commit()
+        _other_worker_refresh(other)
+        assert _names(username_index, 'car') == ['carol'] and _names(other, 'car') == ['carol']
+        print("  - restore: back in both workers")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Delta refresh")
+    return True
+
+
+def test_admin_search():
+    """Test that the admin player searches match wallet/IP fragments and username prefixes."""
+    print("\n" + "=" * 80)
+    print("TEST: Admin Search")
+    print("=" * 80)
+
+    app = create_app(UsernameIndexConfig)
+
+    with app.app_context():
+        db.create_all()
+        admin = User(wallet_address='0x' + '2' * 40, username='Overseer', is_admin=True)
+        target = User(wallet_address='0xAbCdEf' + '0' * 26 + '9876FeDc', username='Moderator')
+        target.last_ip = '203.0.113.57'
+        other = User(wallet_address='0x' + '1' * 40, username='Bystander')
+        other.last_ip = '198.51.100.7'
+        db.session.add_all([admin, target, other])
+        db.session.commit()
+
+        searches = {
+            '0xabcdef': 'wallet prefix',
+            '0XABCDEF': 'wallet prefix, upper case',
+            '9876fedc': 'wallet fragment from the end',
+            '113.57': 'IP fragment',
+            'moder': 'username prefix',
+        }
+        for view, path in ((players, '/admin/players'), (wealth_investigation, '/admin/wealth-investigation')):
+            for search, shape in searches.items():
+                with app.test_request_context(f'{path}?search={search}'):
+                    login_user(admin)
+                    html = view()
+                assert 'Moderator' in html, f"{view.__name__}: {shape} {search!r} missed the player"
+                assert 'Bystander' not in html, f"{view.__name__}: {shape} {search!r} matched an unrelated player"
+
+            with app.test_request_context(f'{path}?search=rator'):
+                login_user(admin)
+                html = view()
+            assert 'Moderator' not in html, f"{view.__name__}: usernames should match by prefix only"
+        print("  - wallet and IP fragments match anywhere, usernames by prefix")
+
+        db.session.remove()
+        db.drop_all()
+
+    print("[PASS] Admin search")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 25 + "TACTIZEN USERNAME INDEX TESTS" + " " * 24 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_add_and_rename,
+        test_delta_refresh,
+        test_admin_search,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL USERNAME INDEX TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
@@ -0,0 +1,253 @@
+"""
+Test script for the set-based world bootstrap (flask bootstrap-world).
+Seeds a full world into a file-backed SQLite database with the scheduler
+and log pipeline off, checks every table against the declarative data in
+app/bootstrap/world_data.py, that a second run adds nothing and that a
+partly seeded database is completed, and that the bootstrap-world command
+only runs with background work off. Prints the time taken and the number of
+SQL statements issued.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from slugify import slugify
+from sqlalchemy import event, func, select
+
+from app import create_app
+from app.extensions import db
+from app import scheduler as scheduler_module
+from app.bootstrap import bootstrap_world, world_data
+from app.models import (
+    MilitaryRank, Resource, Country, Region, CountryMarketItem,
+    GoldMarket, CurrencyPriceHistory, ZenMarket, country_regions, region_neighbors,
+)
+from app.models.resource import MarketPriceHistory
+from config import TestingConfig
+
+
+def _create_app(workdir):
+    class BootstrapConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'world.db')
+        LOG_DIR = os.path.join(workdir, 'logs')
+        SQL_PROFILER_ENABLED = False
+        SCHEDULER_ENABLED = False
+        LOG_PIPELINE_ENABLED = False
+
+    app = create_app(BootstrapConfig)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+class _StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+
+
+def _count(model):
+    return db.session.scalar(select(func.count()).select_from(model))
+
+
+def _expected():
+    regions = {slugify(name) for _, _, _, names in world_data.COUNTRIES for name in names}
+    countries = len(world_data.COUNTRIES)
+    quality_items = sum(1 for r in world_data.RESOURCES if r[3]) * len(world_data.QUALITY_LEVELS)
+    plain_items = sum(1 for r in world_data.RESOURCES if not r[3])
+    market_items = countries * (quality_items + plain_items)
+    return {
+        'military_ranks': len(world_data.MILITARY_RANKS),
+        'resources': len(world_data.RESOURCES),
+        'countries': countries,
+        'regions': len(regions),
+        'gold_markets': countries,
+        'zen_market': 1,
+        'market_items': market_items,
+        'market_price_history': market_items * world_data.PRICE_HISTORY_DAYS,
+        'currency_price_history': countries * world_data.PRICE_HISTORY_DAYS,
+    }
+
+
+def test_full_world():
+    """Test that one run seeds the whole world in a few statements and a second run adds nothing."""
+    print("\n" + "=" * 80)
+    print("TEST: Full World")
+    print("=" * 80)
+
+    app = _create_app(tempfile.mkdtemp())
+    assert scheduler_module.scheduler is None, "SCHEDULER_ENABLED=False should not start the scheduler"
+    expected = _expected()
+
+    with app.app_context():
+        with _StatementCounter(db.engine) as statements:
+            started = time.perf_counter()
+            added = bootstrap_world()
+            elapsed = time.perf_counter() - started
+
+        for step, rows in expected.items():
+            assert added[step] == rows, f"{step}: added {added[step]}, expected {rows}"
+        assert added['region_neighbors'] > 0, "Region neighbours should be linked"
+
+        assert _count(MilitaryRank) == expected['military_ranks']
+        assert _count(Resource) == expected['resources']
+        assert _count(Country) == expected['countries']
+        assert _count(Region) == expected['regions']
+        assert _count(country_regions) == expected['regions'], "Every region needs exactly one owner"
+        assert _count(region_neighbors) == added['region_neighbors']
+        assert _count(GoldMarket) == expected['gold_markets']
+        assert _count(ZenMarket) == 1
+        assert _count(CountryMarketItem) == expected['market_items']
+        assert _count(MarketPriceHistory) == expected['market_price_history']
+        assert _count(CurrencyPriceHistory) == expected['currency_price_history']
+
+        total = sum(added.values())
+        print(f"  - {total} rows in {elapsed:.2f} s, {statements.count} SQL statements")
+        assert statements.count < 100, f"Expected a few set-based statements, got {statements.count}"
+
+        # Spot checks on derived rows
+        bread = db.session.scalar(select(Resource).where(Resource.slug == 'bread'))
+        fort = db.session.scalar(select(Resource).where(Resource.slug == 'fort'))
+        country = db.session.scalar(select(Country).order_by(Country.id))
+        item = db.session.scalar(select(CountryMarketItem).filter_by(country_id=country.id, resource_id=fort.id, quality=3))
+        assert item.initial_price == Decimal('400'), f"Q3 fort should be priced 100 x 4, got {item.initial_price}"
+        if bread is not None and not bread.can_have_quality:
+            assert db.session.scalar(select(CountryMarketItem).filter_by(resource_id=bread.id, quality=0)) is not None
+        history = db.session.scalars(
+            select(MarketPriceHistory.recorded_date).filter_by(country_id=country.id, resource_id=fort.id, quality=3)
+        ).all()
+        assert min(history) == date.today() - timedelta(days=world_data.PRICE_HISTORY_DAYS)
+        assert max(history) == date.today() - timedelta(days=1)
+
+        with _StatementCounter(db.engine) as statements:
+            again = bootstrap_world()
+        assert sum(again.values()) == 0, f"Second run should add nothing, added {again}"
+        print(f"  - second run: nothing added, {statements.count} SQL statements")
+
+    assert threading.active_count() == 1, f"No background threads expected, found {threading.enumerate()}"
+    print("  - no scheduler or background threads running")
+
+    print("[PASS] Full world")
+    return True
+
+
+def test_completes_partial_world():
+    """Test that a partly seeded world is completed without touching existing rows."""
+    print("\n" + "=" * 80)
+    print("TEST: Completes Partial World")
+    print("=" * 80)
+
+    app = _create_app(tempfile.mkdtemp())
+    expected = _expected()
+
+    with app.app_context():
+        bootstrap_world(history=False)
+        assert _count(MarketPriceHistory) == 0, "history=False should skip price history"
+
+        # Remove part of the world and re-price an item the game has since touched
+        item = db.session.scalar(select(CountryMarketItem).order_by(CountryMarketItem.country_id))
+        item.initial_price = Decimal('1.2345')
+        kept_key = (item.country_id, item.resource_id, item.quality)
+        dropped = db.session.scalar(select(Country).order_by(Country.id.desc()))
+        CountryMarketItem.query.filter_by(country_id=dropped.id).delete()
+        GoldMarket.query.filter_by(country_id=dropped.id).delete()
+        db.session.commit()
+
+        added = bootstrap_world()
+        assert added['countries'] == 0 and added['regions'] == 0
+        assert added['gold_markets'] == 1, f"Missing gold market should be added, got {added['gold_markets']}"
+        assert added['market_items'] == expected['market_items'] // expected['countries']
+        assert added['market_price_history'] == expected['market_price_history']
+        assert _count(CountryMarketItem) == expected['market_items']
+        assert db.session.get(CountryMarketItem, kept_key).initial_price == Decimal('1.2345'), \
+            "Existing rows must not be updated"
+        print(f"  - restored {added['market_items']} market items and 1 gold market, kept existing prices")
+
+    print("[PASS] Completes partial world")
+    return True
+
+
+def test_command_runs_without_background_work():
+    """Test that bootstrap-world refuses an app with the scheduler or log pipeline on."""
+    print("\n" + "=" * 80)
+    print("TEST: Command Runs Without Background Work")
+    print("=" * 80)
+
+    app = create_app('bootstrap')
+    assert not app.config['SCHEDULER_ENABLED'] and not app.config['LOG_PIPELINE_ENABLED']
+    assert scheduler_module.scheduler is None, "BootstrapConfig must not start the scheduler"
+    print("  - create_app('bootstrap') starts no scheduler")
+
+    app = _create_app(tempfile.mkdtemp())
+    runner = app.test_cli_runner()
+    for key in ('SCHEDULER_ENABLED', 'LOG_PIPELINE_ENABLED'):
+        app.config[key] = True
+        result = runner.invoke(args=['bootstrap-world', '--no-history'])
+        assert result.exit_code != 0 and "create_app('bootstrap')" in result.output, result.output
+        app.config[key] = False
+    with app.app_context():
+        assert _count(Country) == 0, "A refused run must not write"
+
+    result = runner.invoke(args=['bootstrap-world', '--no-history'])
+    assert result.exit_code == 0 and 'countries:' in result.output, result.output
+    with app.app_context():
+        assert _count(Country) == len(world_data.COUNTRIES)
+    print("  - refused with either on, runs with both off")
+
+    print("[PASS] Command runs without background work")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 24 + "TACTIZEN WORLD BOOTSTRAP TESTS" + " " * 24 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_full_world,
+        test_completes_partial_world,
+        test_command_runs_without_background_work,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL WORLD BOOTSTRAP TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()
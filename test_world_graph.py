@@ -0,0 +1,174 @@
+"""
+Test script for the in-memory world graph.
+Checks topology queries against a small map, that the graph built from the
+database matches it, that region transfers update (or, on rollback,
+invalidate) the graph, and that transfers made by another process reach it
+through the shared_version counter.
+"""
+
+from app import create_app
+from app.extensions import db
+from app.models import Country, Region
+from app.services import shared_versions
+from app.services.conquest_service import ConquestService
+from app.services.world_graph import WorldGraph, world_graph, get_world_graph, VERSION_NAME
+from config import TestingConfig
+
+
+# A B C
+# D E F      A, B, D owned by 1; C, E, F by 2; G unowned; H is an island owned by 1
+# G     H
+REGIONS = [(1, 'A'), (2, 'B'), (3, 'C'), (4, 'D'), (5, 'E'), (6, 'F'), (7, 'G'), (8, 'H')]
+EDGES = [(1, 2), (2, 3), (4, 5), (5, 6), (1, 4), (2, 5), (3, 6), (4, 7)]
+OWNERSHIP = [(1, 1), (2, 1), (4, 1), (8, 1), (3, 2), (5, 2), (6, 2)]
+
+
+def test_graph_queries():
+    """Test adjacency, border, connectivity and path queries."""
+    print("\n" + "=" * 80)
+    print("TEST: Graph Queries")
+    print("=" * 80)
+
+    graph = WorldGraph()
+    graph.load(REGIONS, EDGES, OWNERSHIP)
+
+    assert graph.neighbors_of(5) == {2, 4, 6}, "Edges should be stored both ways"
+    assert sorted(graph.attackable_regions(1, 2)) == [3, 5], "Country 1 borders C and E"
+    assert sorted(graph.attackable_regions(2, 1)) == [2, 4], "Country 2 borders B and D"
+    assert graph.is_adjacent_to_country(7, 1) and not graph.is_adjacent_to_country(7, 2)
+    assert sorted(graph.border_regions(1)) == [2, 4], "A is interior, H has no neighbours"
+    assert graph.connected_territory(1) == {1, 2, 4}, "H is not connected to the mainland"
+    assert graph.shortest_path(1, 6) in ([1, 2, 3, 6], [1, 2, 5, 6], [1, 4, 5, 6])
+    assert graph.shortest_path(1, 8) is None, "Islands are unreachable"
+    assert graph.shortest_path(1, 6, allowed={1, 4}) is None, "Path restricted to own territory"
+    print("  - attackable, border, connected and path queries correct")
+
+    print("[PASS] Graph queries")
+    return True
+
+
+def _seed_map():
+    countries = [Country('Alpha'), Country('Beta')]
+    db.session.add_all(countries)
+    db.session.flush()
+    regions = {}
+    for region_id, name in REGIONS:
+        region = Region(f'Region {name}', countries[0].id)
+        region.id = region_id
+        regions[region_id] = region
+        db.session.add(region)
+    db.session.flush()
+    for a, b in EDGES:
+        regions[a].neighbors.append(regions[b])
+    for region_id, owner in OWNERSHIP:
+        regions[region_id].current_owners.append(countries[owner - 1])
+    db.session.commit()
+    return countries, regions
+
+
+def test_rebuild_and_transfer():
+    """Test that the graph matches the database and follows region transfers."""
+    print("\n" + "=" * 80)
+    print("TEST: Rebuild And Transfer")
+    print("=" * 80)
+
+    app = create_app(TestingConfig)
+
+    with app.app_context():
+        db.create_all()
+        (alpha, beta), regions = _seed_map()
+
+        graph = get_world_graph()
+        assert graph.regions_of(alpha.id) == {1, 2, 4, 8}
+        assert sorted(graph.attackable_regions(alpha.id, beta.id)) == [3, 5]
+
+        # Committed transfer: E goes to Alpha
+        regions[5].current_owners.remove(beta)
+        regions[5].current_owners.append(alpha)
+        version = shared_versions.current(VERSION_NAME)
+        world_graph.on_region_transfer(5, beta.id, alpha.id)
+        db.session.commit()
+        assert shared_versions.current(VERSION_NAME) == version + 1, "Commit should bump the version"
+        assert world_graph._version == version + 1, "Own transfer should not force a rebuild"
+        graph = get_world_graph()
+        assert graph.owner(5) == alpha.id and 5 not in graph.regions_of(beta.id)
+        assert sorted(graph.attackable_regions(alpha.id, beta.id)) == [3, 6]
+        print("  - committed transfer applied in place, version bumped on commit")
+
+        # Rolled back transfer: the graph must not keep the change
+        regions[6].current_owners.remove(beta)
+        regions[6].current_owners.append(alpha)
+        version = shared_versions.current(VERSION_NAME)
+        world_graph.on_region_transfer(6, beta.id, alpha.id)
+        db.session.rollback()
+        graph = get_world_graph()
+        assert graph.owner(6) == beta.id, "Rolled back transfer leaked into the graph"
+        db.session.commit()
+        assert shared_versions.current(VERSION_NAME) == version, "Rolled back transfer should not bump the version"
+        print("  - rolled back transfer discarded, version untouched")
+
+        # Another worker captures H, Alpha's island: only the database and the
+        # shared counter change, this process's graph is stale until it checks
+        regions[8].current_owners.remove(alpha)
+        regions[8].current_owners.append(beta)
+        shared_versions.bump(VERSION_NAME)
+        db.session.commit()
+        assert 8 in world_graph.regions_of(alpha.id)
+        with app.test_request_context('/'):
+            assert get_world_graph().owner(8) == beta.id, "Transfer by another process not picked up"
+        print("  - transfer committed elsewhere picked up on the next request")
+
+        # Conquest reads ownership from the database, never from a stale graph
+        for region_id in (1, 2, 4, 5):
+            regions[region_id].current_owners.remove(alpha)
+            regions[region_id].current_owners.append(beta)
+        db.session.commit()
+        assert world_graph.regions_of(alpha.id), "Graph should still be stale here"
+        assert ConquestService.check_full_conquest(alpha.id), "Conquest check used stale ownership"
+        assert not ConquestService.check_full_conquest(beta.id)
+        print("  - full conquest detected from country_regions despite a stale graph")
+
+        db.drop_all()
+
+    print("[PASS] Graph follows the database")
+    return True
+
+
+if __name__ == '__main__':
+    print("\n" * 2)
+    print("+" + "=" * 78 + "+")
+    print("|" + " " * 26 + "TACTIZEN WORLD GRAPH TESTS" + " " * 26 + "|")
+    print("+" + "=" * 78 + "+")
+
+    tests = [
+        test_graph_queries,
+        test_rebuild_and_transfer,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test_func.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test_func.__name__}: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print("FINAL RESULT")
+    print("=" * 80)
+    print(f"Tests Passed: {passed}/{len(tests)}")
+    print(f"Tests Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n[PASS] ALL WORLD GRAPH TESTS PASSED!")
+    else:
+        print(f"\n[FAIL] {failed} test(s) failed")
+
+    print("=" * 80)
+    print()